@@ -1,50 +1,169 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
 import math
 
 import ephem
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
 import httpx
 import llm
+import numpy as np
 from pydantic import BaseModel
 from pydantic_extra_types.coordinate import Coordinate, Latitude, Longitude
 
+from llm_sky._geo import EARTH_RADIUS, bearing_to_compass_np, haversine_bearing_np
+from llm_sky._metar import metar, metar_fragment, metar_nearest
 from llm_sky.metar_data import STATIONS
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Station coordinates as parallel arrays, so distances to all stations can be
+# computed in one vectorized pass.
+_CODES = STATIONS.codes
+_LATS_RAD = STATIONS.lats_rad
+_LONS_RAD = STATIONS.lons_rad
+_SIN_LATS = STATIONS.sin_lats
+_COS_LATS = STATIONS.cos_lats
+
+
+@lru_cache(maxsize=1)
+def _tree():
+    """
+    A BallTree over all stations, or None without scikit-learn.
+
+    Built on first use, since importing sklearn is slow and llm imports this
+    plugin on every run.
+    """
+    try:
+        from sklearn.neighbors import BallTree
+    except ImportError:
+        return None
+
+    return BallTree(np.column_stack([_LATS_RAD, _LONS_RAD]), metric='haversine')
+
+
+@lru_cache(maxsize=1)
+def _geocoder():
+    """A shared, rate limited Nominatim geocoder."""
+
+    geolocator = Nominatim(user_agent="llm-sky", timeout=10)
+    # Let errors propagate, so a failed lookup is neither cached nor
+    # mistaken for "not found"
+    return RateLimiter(geolocator.geocode, min_delay_seconds=1, swallow_exceptions=False)
+
+
+@lru_cache(maxsize=512)
+def _nominatim(query: str):
+    return _geocoder()(query)
+
 
-@lru_cache()
 def nominatim(query: str):
-    return Nominatim(user_agent="llm-sky").geocode(query)
+    return _nominatim(" ".join(query.split()).lower())
 
 def owm_key():
     return llm.get_key(None, 'openweathermap', 'OPENWEATHERMAP_API_KEY')
 
 
+@lru_cache(maxsize=1)
+def _owm_client() -> httpx.Client:
+    """A pooled HTTP/2 client for OpenWeatherMap, carrying the API key."""
+
+    return httpx.Client(
+        http2=True, timeout=10, params=dict(appid=owm_key()),
+        limits=httpx.Limits(max_keepalive_connections=10)
+    )
+
+
 def weather(latitude: float, longitude: float, units: str = 'metric'):
     """Current weather information from OpenWeatherMap."""
-    with httpx.Client(params=dict(appid=owm_key())) as http:
-        return http.get(
-            'https://api.openweathermap.org/data/2.5/weather',
-            params=dict(lat=latitude, lon=longitude, units=units)
-        ).json()
+    return json_loads(_owm_client().get(
+        'https://api.openweathermap.org/data/2.5/weather',
+        params=dict(lat=latitude, lon=longitude, units=units)
+    ).content)
 
 
-def sun(latitude: Latitude, longitude: Longitude) -> dict:
+J2000 = datetime(2000, 1, 1, 12)
+# Sun's altitude at sunrise and sunset: its upper limb on the horizon, with
+# refraction as ephem computes it at its default 1010 mbar and 15 degrees C
+SUNRISE_ALTITUDE = math.radians(-0.88)
+
+
+def _solar_position(t: float) -> tuple[float, float]:
+    """Equation of time (in days) and sine of the declination, t days after J2000."""
+
+    centuries = t / 36525
+    mean_longitude = (280.46646 + 36000.76983 * centuries) % 360
+    anomaly = math.radians((357.52911 + 35999.05029 * centuries) % 360)
+    center = (
+        (1.914602 - 0.004817 * centuries) * math.sin(anomaly)
+        + 0.019993 * math.sin(2 * anomaly) + 0.000289 * math.sin(3 * anomaly)
+    )
+    # Correct for nutation and aberration
+    node = math.radians(125.04 - 1934.136 * centuries)
+    apparent_longitude = math.radians(mean_longitude + center - 0.00569 - 0.00478 * math.sin(node))
+    obliquity = math.radians(23.439291 - 0.0130042 * centuries + 0.00256 * math.cos(node))
+    right_ascension = math.degrees(math.atan2(
+        math.cos(obliquity) * math.sin(apparent_longitude), math.cos(apparent_longitude)
+    ))
+    equation_of_time = ((right_ascension - mean_longitude + 0.0057183 + 180) % 360 - 180) / 360
+    return equation_of_time, math.sin(obliquity) * math.sin(apparent_longitude)
+
+
+def _sunrise_sunset_meeus(latitude: float, longitude: float, day: date) -> tuple[datetime, datetime] | None:
     """
-    Return today's sunrise and sunset times in ISO-8601 (UTC).
+    Sunrise and sunset (UTC) from the algebraic sunrise equation (Meeus).
+
+    Agrees with ephem to within half a minute up to 65 degrees latitude.
+    Returns None if the sun does not rise or set on that day.
     """
+    # Mean solar noon, in days since J2000
+    noon = (day - J2000.date()).days - longitude / 360
+    phi = math.radians(latitude)
+    events = []
+    for sign in (-1, 1):
+        # Evaluate once at noon, then again at the estimated event time
+        t = noon
+        for _ in range(2):
+            equation_of_time, sin_declination = _solar_position(t)
+            cos_declination = math.sqrt(1 - sin_declination ** 2)
+            cos_hour_angle = (math.sin(SUNRISE_ALTITUDE) - math.sin(phi) * sin_declination) / (math.cos(phi) * cos_declination)
+            if abs(cos_hour_angle) > 1:
+                return None
+            t = noon + equation_of_time + sign * math.degrees(math.acos(cos_hour_angle)) / 360
+        events.append(J2000 + timedelta(days=t))
+
+    return events[0], events[1]
+
+
+def _sun_times_ephem(latitude: float, longitude: float, day: date) -> tuple[datetime, datetime]:
     observer = ephem.Observer()
     # ephem expects strings or Angle objects, so cast to str
     observer.lat = str(latitude)
     observer.lon = str(longitude)
+    # Start from local solar noon so rising and setting belong to the same day
+    observer.date = datetime.combine(day, datetime.min.time()) + timedelta(hours=12 - longitude / 15)
 
     sun = ephem.Sun()
-    sunrise = observer.next_rising(sun).datetime()
-    sunset = observer.next_setting(sun).datetime()
+    return observer.previous_rising(sun).datetime(), observer.next_setting(sun).datetime()
 
-    # If sunrise is later than sunset, we crossed into the next day:
-    if sunrise > sunset:
-        sunrise = observer.previous_rising(sun).datetime()
+
+@lru_cache(maxsize=256)
+def _sun_times(latitude: float, longitude: float, day: date) -> tuple[datetime, datetime]:
+    return _sunrise_sunset_meeus(latitude, longitude, day) or _sun_times_ephem(latitude, longitude, day)
+
+
+def sun(latitude: Latitude, longitude: Longitude) -> dict:
+    """
+    Return today's sunrise and sunset times in ISO-8601 (UTC).
+    """
+    # Round to about 100m so nearby queries share a cache entry
+    latitude, longitude = round(latitude, 3), round(longitude, 3)
+    # Key by the location's own (mean solar) date, not the UTC date
+    day = (datetime.now(timezone.utc) + timedelta(hours=longitude / 15)).date()
+    sunrise, sunset = _sun_times(latitude, longitude, day)
 
     offset = datetime.now().astimezone().utcoffset()
     sunrise += offset
@@ -61,10 +180,9 @@ def sun(latitude: Latitude, longitude: Longitude) -> dict:
 
 def uv_index(latitude: Latitude, longitude: Longitude) -> float:
     """Current UV index"""
-    with httpx.Client(params=dict(appid=owm_key())) as http:
-        return http.get("https://api.openweathermap.org/data/2.5/uvi",
-            params=dict(lat=latitude, lon=longitude)
-        ).json()['value']
+    return json_loads(_owm_client().get("https://api.openweathermap.org/data/2.5/uvi",
+        params=dict(lat=latitude, lon=longitude)
+    ).content)['value']
 
     
 @llm.hookimpl
@@ -139,120 +257,78 @@ class Local(llm.Toolbox):
         return sunrise_sunset(self.latitude, self.longitude)
 
 
-URL = 'https://tgftp.nws.noaa.gov/data/observations/metar/stations/{code}.TXT'
-
-
 SYNODIC_MONTH = 29.53058867
 
-def moon(latitude: Latitude, longitude: Longitude) -> str:
-    """A textual description of the current status of the moon."""
-
+@lru_cache(maxsize=256)
+def _moon_state(latitude: float, longitude: float, minute: datetime):
     observer = ephem.Observer()
-    observer.lat = latitude
-    observer.lon = longitude
+    observer.lat = str(latitude)
+    observer.lon = str(longitude)
+    observer.date = minute
     moon = ephem.Moon(observer)
     illumination = moon.moon_phase * 100
     age = observer.date - ephem.previous_new_moon(observer.date)
-    status = "Waxing" if age < SYNODIC_MONTH / 2 else "Waning"
     days_to_full = ephem.next_full_moon(observer.date) - observer.date
 
     rising = observer.next_rising(moon)
     setting = observer.next_setting(moon)
 
-    offset = datetime.now().astimezone().utcoffset()
-    if rising > setting:
-        next = ("moonset", setting.datetime() + offset)
-    else:
-        next = ("moonrise", rising.datetime() + offset)
-
-    return f"{status} moon, {round(illumination)}% illumination, {next[0]} at {next[1].time().isoformat(timespec='minutes')}, {round(days_to_full)} days until next full moon"
-
+    return illumination, age, days_to_full, rising.datetime(), setting.datetime()
 
-def metar_fragment(code: str) -> llm.Fragment:
-    """Fetch a METAR weather report."""
-    time, report = metar(code)
-    delta = time - datetime.now(timezone.utc)
-    return llm.Fragment(f'{code.upper()} {round(-delta.total_seconds() / 60)}m ago: {report}', source=URL.format(code=code.upper()))
 
+def moon(latitude: Latitude, longitude: Longitude) -> str:
+    """A textual description of the current status of the moon."""
 
-def metar(code: str) -> tuple[datetime, str]:
-    """Fetch a METAR weather report."""
+    illumination, age, days_to_full, rising, setting = _moon_state(
+        round(latitude, 3), round(longitude, 3),
+        datetime.now(timezone.utc).replace(second=0, microsecond=0, tzinfo=None)
+    )
+    status = "Waxing" if age < SYNODIC_MONTH / 2 else "Waning"
 
-    with httpx.Client() as client:
-        response = client.get(URL.format(code=code.upper()))
-        response.raise_for_status()
+    offset = datetime.now().astimezone().utcoffset()
+    if rising > setting:
+        next = ("moonset", setting + offset)
+    else:
+        next = ("moonrise", rising + offset)
 
-        time_str, report = response.text.split("\n")[0:2]
-        time = datetime.strptime(time_str, "%Y/%m/%d %H:%M").replace(tzinfo=timezone.utc)
-        return time, " ".join(report.split(" ")[2:])
+    return f"{status} moon, {round(illumination)}% illumination, {next[0]} at {next[1].time().isoformat(timespec='minutes')}, {round(days_to_full)} days until next full moon"
 
 
-def haversine(lat1, lon1, lat2, lon2):
-    """Calculate the great-circle distance between two points on the Earth."""
+def _nearby(latitude: float, longitude: float, max_distance: float):
+    """Indices, distances and bearings of stations within max_distance, nearest first."""
 
-    R = 6371  # Earth radius in kilometers
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    tree = _tree()
+    if tree is not None:
+        idx, dist = tree.query_radius(
+            np.radians([[latitude, longitude]]), r=max_distance / EARTH_RADIUS,
+            return_distance=True, sort_results=True
+        )
+        order = idx[0]
+        _, b = haversine_bearing_np(
+            latitude, longitude,
+            _LATS_RAD[order], _LONS_RAD[order], _SIN_LATS[order], _COS_LATS[order]
+        )
+        return order, dist[0] * EARTH_RADIUS, b
 
+    d, b = haversine_bearing_np(latitude, longitude, _LATS_RAD, _LONS_RAD, _SIN_LATS, _COS_LATS)
+    idx = np.where(d <= max_distance)[0]
+    order = idx[np.argsort(d[idx], kind='stable')]
+    return order, d[order], b[order]
 
-def metar_nearby(latitude: Latitude, longitude: Longitude, max_distance: float = 100.0, max_seconds_ago: int = 7200):
-    """Return a list of stations nearby ordered by distance."""
 
-    distances = []
+def metar_nearby(latitude: Latitude, longitude: Longitude, max_distance: float = 100.0, max_seconds_ago: int = 7200, limit: int = 5):
+    """Return up to limit stations nearby with recent reports, ordered by distance."""
 
-    for code, station in STATIONS.items():
-        distance = haversine(latitude, longitude, station.coordinate.latitude, station.coordinate.longitude)
-        if distance <= max_distance:
-            distances.append((code, station, distance))
+    order, distances, bearings = _nearby(latitude, longitude, max_distance)
 
-    # Sort by distance
-    distances.sort(key=lambda x: x[2])
+    codes = [str(code) for code in _CODES[order]]
+    now, found = metar_nearest(codes, limit, max_seconds_ago)
 
+    compasses = bearing_to_compass_np(bearings[[i for i, _ in found]])
     result = {}
-    for code, station, distance in distances:
-        try:
-            compass = bearing_to_compass(bearing(latitude, longitude, station.coordinate.latitude, station.coordinate.longitude))
-            time, report = metar(code)
-            delta = time - datetime.now(timezone.utc)
-            if delta.total_seconds() >= -max_seconds_ago:
-                result[f'{station.name}: {round(distance)}km {compass} {round(abs(delta).total_seconds() / 60)}m ago'] = report
-        except:
-            pass
+    for (i, (time, report)), compass in zip(found, compasses):
+        station = STATIONS[codes[i]]
+        delta = time - now
+        result[f'{station.name}: {round(distances[i])}km {compass} {round(abs(delta).total_seconds() / 60)}m ago'] = report
 
     return result
-
-
-def bearing(lat1, lon1, lat2, lon2):
-    """Calculate the bearing between two points."""
-
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-
-    d_lon = lon2 - lon1
-    x = math.sin(d_lon) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - (math.sin(lat1) * math.cos(lat2) * math.cos(d_lon))
-
-    initial_bearing = math.atan2(x, y)
-    initial_bearing = math.degrees(initial_bearing)
-    compass_bearing = (initial_bearing + 360) % 360
-
-    return compass_bearing
-
-
-def bearing_to_compass(bearing):
-    """Convert bearing to compass direction."""
-
-    compass_sectors = [
-        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-    ]
-
-    sector_size = 360 / len(compass_sectors)
-    sector_index = int((bearing + sector_size / 2) / sector_size) % len(compass_sectors)
-
-    return compass_sectors[sector_index]
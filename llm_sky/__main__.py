@@ -1,12 +1,16 @@
-import csv
 from dataclasses import dataclass
-from datetime import datetime, timezone
-import math
+from datetime import date
+from io import StringIO
 
 import httpx
 import llm
+import numpy as np
+import pandas as pd
 from pydantic_extra_types.coordinate import Coordinate
 
+from llm_sky._geo import bearing_to_compass, dms_to_decimal, haversine_bearing_np
+from llm_sky._metar import cache, metar, metar_fragment, metar_nearest
+
 
 @llm.hookimpl
 def register_fragment_loaders(register):
@@ -18,83 +22,34 @@ def register_tools(register):
     register(metar)
 
 
-URL = 'https://tgftp.nws.noaa.gov/data/observations/metar/stations/{code}.TXT'
-
-
-def metar_fragment(code: str) -> llm.Fragment:
-    """Fetch a METAR weather report."""
-
-    return llm.Fragment(metar(code), source=URL.format(code=code.upper()))
-
-
-def metar(code: str) -> str:
-    """Fetch a METAR weather report."""
-
-    with httpx.Client() as client:
-        response = client.get(URL.format(code=code.upper()))
-        response.raise_for_status()
-
-        time, report = response.text.split("\n")[0:2]
-        time = datetime.strptime(time, "%Y/%m/%d %H:%M").replace(tzinfo=timezone.utc)
-        delta = time - datetime.now(timezone.utc)
-        return delta, " ".join(report.split(" ")[2:])
-
+_HTTP = httpx.Client(http2=True, timeout=10, limits=httpx.Limits(max_keepalive_connections=10))
 
-def dms_to_decimal(dms: str) -> float:
-    """Convert degree-minutes-seconds format to decimal degrees."""
-    direction = dms[-1]
-    numbers = list(map(int, dms[:-1].split('-')))
-    while len(numbers) < 3: numbers.append(0)
-    degrees, minutes, seconds = numbers
-    decimal = degrees + minutes / 60 + seconds / 3600
-    if direction in 'SW': decimal = -decimal
 
-    return decimal
+def metar_nearby_station(latitude_dms: str | float, longitude_dms: str | float, max_distance: float = 100.0, max_seconds_ago: int = 7200, limit: int = 5):
+    """Return up to limit stations nearby with recent reports, ordered by distance."""
 
+    latitude = dms_to_decimal(latitude_dms) if isinstance(latitude_dms, str) else latitude_dms
+    longitude = dms_to_decimal(longitude_dms) if isinstance(longitude_dms, str) else longitude_dms
 
-def haversine(lat1, lon1, lat2, lon2):
-    """Calculate the great-circle distance between two points on the Earth."""
-
-    R = 6371  # Earth radius in kilometers
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    all_stations = stations()
+    codes = np.array(list(all_stations))
+    coordinates = np.radians([s.coordinate for s in all_stations.values()])
+    lats_rad, lons_rad = coordinates[:, 0], coordinates[:, 1]
 
+    d, b = haversine_bearing_np(latitude, longitude, lats_rad, lons_rad, np.sin(lats_rad), np.cos(lats_rad))
+    idx = np.where(d <= max_distance)[0]
+    order = idx[np.argsort(d[idx], kind='stable')]
 
-def metar_nearby_station(latitude_dms: str | float, longitude_dms: str | float, max_distance: float = 100.0, max_seconds_ago: int = 7200):
-    """Return a list of stations nearby ordered by distance."""
-
-    latitude = dms_to_decimal(latitude_dms) if isinstance(latitude_dms, str) else latitude_dms
-    longitude = dms_to_decimal(longitude_dms) if isinstance(longitude_dms, str) else longitude_dms
-    
-    distances = []
-
-    for code, station in stations().items():
-        try:
-            if station['latitude'] and station['longitude']:
-                station_lat = dms_to_decimal(station['latitude'])
-                station_lon = dms_to_decimal(station['longitude'])
-                distance = haversine(latitude, longitude, station_lat, station_lon)
-                if distance <= max_distance:
-                    distances.append((station, distance))
-        except ValueError:
-            # Skip stations with invalid lat/lon
-            continue
-    
-    # Sort by distance
-    distances.sort(key=lambda x: x[1])
+    nearby = [str(code) for code in codes[order]]
+    now, found = metar_nearest(nearby, limit, max_seconds_ago)
 
     result = {}
-    for station, distance in distances:
-        try:
-            compass = bearing_to_compass(bearing(latitude, longitude, dms_to_decimal(station['latitude']), dms_to_decimal(station['longitude'])))
-            delta, report = metar(station['code'])
-            if delta.total_seconds() >= -max_seconds_ago:
-                result[f'{station["name"]}: {round(distance)}km {compass} {round(abs(delta).total_seconds() / 60)}m ago'] = report
-        except:
-            pass
+    for i, (time, report) in found:
+        station = all_stations[nearby[i]]
+        distance = float(d[order[i]])
+        compass = bearing_to_compass(b[order[i]])
+        delta = time - now
+        result[f'{station.name}: {round(distance)}km {compass} {round(abs(delta).total_seconds() / 60)}m ago'] = report
 
     return result
 
@@ -107,75 +62,75 @@ class station:
     country: str | None = None
 
 def stations():
-    with httpx.Client() as client:
-        response = client.get('https://tgftp.nws.noaa.gov/data/nsd_cccc.txt')
-        response.raise_for_status()
-
-        lines = response.text.split('\n')
-        FIELDNAMES = ('code', None, None, 'name', None, 'country', None, 'latitude', 'longitude', None, None, 'altitude')
-        result = {}
-        def proc(k, v):
-            if isinstance(v, str): v = v.strip()
-            if k == 'altitude':
-                return int(v)
-            return v
-
-        for d in csv.DictReader(lines, FIELDNAMES, delimiter=';'):
-            if 'latitude' in d and 'longitude' in d and d['latitude'] and d['longitude']:
-                d['coordinate'] = (round(dms_to_decimal(d['latitude']), 5), round(dms_to_decimal(d['longitude']), 5))
-                del d['latitude']
-                del d['longitude']
-                result[d['code']] = station(**{
-                    k: proc(k, v) for k, v in d.items() if k and k != 'code' and v
-                })
-
-        return result
-
-
-def bearing(lat1, lon1, lat2, lon2):
-    """Calculate the bearing between two points."""
-
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-
-    d_lon = lon2 - lon1
-    x = math.sin(d_lon) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - (math.sin(lat1) * math.cos(lat2) * math.cos(d_lon))
-
-    initial_bearing = math.atan2(x, y)
-    initial_bearing = math.degrees(initial_bearing)
-    compass_bearing = (initial_bearing + 360) % 360
-
-    return compass_bearing
-
-
-def bearing_to_compass(bearing):
-    """Convert bearing to compass direction."""
-
-    compass_sectors = [
-        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-    ]
-
-    sector_size = 360 / len(compass_sectors)
-    sector_index = int((bearing + sector_size / 2) / sector_size) % len(compass_sectors)
-
-    return compass_sectors[sector_index]
+    """All known METAR stations, cached on disk for a day."""
+
+    # Cache plain tuples: pickled station objects would only load back in
+    # whichever module (llm_sky.__main__ or __main__) defined them
+    key = "nsd_cccc:v2:" + date.today().isoformat()
+    rows = cache().get(key)
+    if rows is None:
+        rows = _parse_stations()
+        cache().set(key, rows, expire=86400)
+    return {code: station(*row) for code, row in rows.items()}
+
+
+def _dms_to_decimal_vec(dms: pd.Series) -> pd.Series:
+    """Vectorized dms_to_decimal, yielding NaN for unparsable values."""
+
+    parts = dms.str.extract(r'(\d+)(?:-(\d+))?(?:-(\d+))?([NSEW])')
+    numbers = parts[[0, 1, 2]].astype(float).fillna(0)
+    decimal = numbers[0] + numbers[1] / 60 + numbers[2] / 3600
+    decimal[parts[3].isin(['S', 'W'])] *= -1
+
+    return decimal.where(parts[3].notna())
+
+
+def _parse_stations():
+    response = _HTTP.get('https://tgftp.nws.noaa.gov/data/nsd_cccc.txt')
+    response.raise_for_status()
+
+    FIELDNAMES = ('code', None, None, 'name', None, 'country', None, 'latitude', 'longitude', None, None, 'altitude')
+    usecols = [i for i, name in enumerate(FIELDNAMES) if name]
+    df = pd.read_csv(
+        StringIO(response.text), sep=';', header=None, usecols=usecols,
+        dtype=str, keep_default_na=False, na_values=['']
+    )
+    df.columns = [FIELDNAMES[i] for i in usecols]
+    df = df.apply(lambda s: s.str.strip()).replace('', np.nan)
+    df['altitude'] = pd.to_numeric(df['altitude'], errors='coerce').astype('Int64')
+    df['latitude'] = _dms_to_decimal_vec(df['latitude']).round(5)
+    df['longitude'] = _dms_to_decimal_vec(df['longitude']).round(5)
+    df = df.dropna(subset=['latitude', 'longitude'])
+    df = df.astype(object).where(df.notna(), None)
+
+    return {
+        row.code: (row.name, (row.latitude, row.longitude), row.altitude, row.country)
+        for row in df.itertuples(index=False)
+    }
+
+
+def save_stations(path):
+    """Write the station list as columns for llm_sky.metar_data."""
+
+    all_stations = stations()
+    coordinates = np.array([s.coordinate for s in all_stations.values()], dtype=np.float64)
+    lats_rad, lons_rad = np.radians(coordinates[:, 0]), np.radians(coordinates[:, 1])
+    np.savez_compressed(
+        path,
+        codes=np.array(list(all_stations)),
+        latitudes=coordinates[:, 0],
+        longitudes=coordinates[:, 1],
+        # Station-side terms of the distance and bearing formulas
+        lats_rad=lats_rad,
+        lons_rad=lons_rad,
+        sin_lats=np.sin(lats_rad),
+        cos_lats=np.cos(lats_rad),
+        names=np.array([s.name for s in all_stations.values()]),
+        altitudes=np.array([np.nan if s.altitude is None else s.altitude for s in all_stations.values()]),
+        countries=np.array([s.country or '' for s in all_stations.values()])
+    )
 
 
 if __name__ == '__main__':
-    from rich import console
-    print('from dataclasses import dataclass')
-    print('from pydantic_extra_types.coordinate import Coordinate')
-    print()
-    print("""
-@dataclass
-class station:
-    name: str
-    coordinate: Coordinate
-    altitude: int | None = None
-    country: str | None = None
-""") 
-    console.Console(width=200).print("STATIONS", "=", stations())
+    from importlib.resources import files
+    save_stations(files(__package__).joinpath('metar_data.npz'))
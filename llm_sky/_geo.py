@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+
+
+EARTH_RADIUS = 6371  # kilometers
+
+_COMPASS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+)
+_COMPASS_ARR = np.array(_COMPASS)
+
+
+def dms_to_decimal(dms: str) -> float:
+    """Convert degree-minutes-seconds format to decimal degrees."""
+    direction = dms[-1]
+    numbers = list(map(int, dms[:-1].split('-')))
+    while len(numbers) < 3: numbers.append(0)
+    degrees, minutes, seconds = numbers
+    decimal = degrees + minutes / 60 + seconds / 3600
+    if direction in 'SW': decimal = -decimal
+
+    return decimal
+
+
+def haversine_bearing_np(lat0, lon0, lats_rad, lons_rad, sin_lats, cos_lats):
+    """Great-circle distances and bearings from one point to many (given in radians)."""
+
+    lat0 = math.radians(lat0)
+    sin_lat0, cos_lat0 = math.sin(lat0), math.cos(lat0)
+    dlat = lats_rad - lat0
+    dlon = lons_rad - math.radians(lon0)
+    a = np.sin(dlat * 0.5) ** 2 + cos_lat0 * cos_lats * np.sin(dlon * 0.5) ** 2
+    x = np.sin(dlon) * cos_lats
+    y = cos_lat0 * sin_lats - sin_lat0 * cos_lats * np.cos(dlon)
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a)), np.degrees(np.arctan2(x, y)) % 360
+
+
+def bearing_to_compass(bearing):
+    """Convert bearing to compass direction."""
+
+    return _COMPASS[int(bearing * (16 / 360) + 0.5) & 15]
+
+
+def bearing_to_compass_np(bearings):
+    """Convert an array of bearings to compass directions."""
+
+    return _COMPASS_ARR[(bearings * (16 / 360) + 0.5).astype(np.int64) & 15]
@@ -0,0 +1,128 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+import os
+import sqlite3
+
+import diskcache
+import httpx
+import llm
+
+
+URL = 'https://tgftp.nws.noaa.gov/data/observations/metar/stations/{code}.TXT'
+METAR_TTL = 60  # seconds a fetched report is reused
+
+
+@lru_cache(maxsize=1)
+def cache() -> diskcache.Cache:
+    """
+    The on-disk cache under $XDG_CACHE_HOME/llm-sky, created on first use.
+
+    Falls back to a temporary directory if that location is not writable.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    try:
+        return diskcache.Cache(os.path.join(base, "llm-sky"))
+    except (OSError, sqlite3.Error):
+        return diskcache.Cache()
+
+
+def metar_fragment(code: str) -> llm.Fragment:
+    """Fetch a METAR weather report."""
+    time, report = metar(code)
+    delta = time - datetime.now(timezone.utc)
+    return llm.Fragment(f'{code.upper()} {round(-delta.total_seconds() / 60)}m ago: {report}', source=URL.format(code=code.upper()))
+
+
+@asynccontextmanager
+async def metar_client():
+    """A pooled HTTP/2 client shared by concurrent METAR fetches."""
+
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    headers = {'Accept-Encoding': 'gzip'}
+    async with httpx.AsyncClient(http2=True, limits=limits, headers=headers) as client:
+        yield client
+
+
+async def _metar_async(client: httpx.AsyncClient, code: str) -> tuple[datetime, str]:
+    code = code.upper()
+    key = f"metar:{code}"
+    result = cache().get(key)
+    if result is not None:
+        return result
+
+    response = await client.get(URL.format(code=code))
+    response.raise_for_status()
+
+    body = response.content
+    nl = body.index(b"\n")
+    nl2 = body.find(b"\n", nl + 1)
+    time_str = body[:nl].decode("ascii")
+    report = body[nl + 1:nl2 if nl2 >= 0 else None]
+    time = datetime.strptime(time_str, "%Y/%m/%d %H:%M").replace(tzinfo=timezone.utc)
+    result = time, b"".join(report.split(b" ", 2)[2:]).decode("ascii")
+    cache().set(key, result, expire=METAR_TTL)
+    return result
+
+
+async def _metar_nearest(codes: list[str], limit: int, max_seconds_ago: int):
+    """
+    Fetch reports nearest first, in batches of limit, until limit fresh ones are found.
+
+    Returns the reference time and (index, (time, report)) pairs.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+    now = datetime.now(timezone.utc)
+    found = []
+    async with metar_client() as client:
+        for start in range(0, len(codes), limit):
+            batch = codes[start:start + limit]
+            reports = await asyncio.gather(
+                *[_metar_async(client, code) for code in batch],
+                return_exceptions=True
+            )
+            for i, fetched in enumerate(reports, start):
+                if isinstance(fetched, BaseException):
+                    continue
+                if (fetched[0] - now).total_seconds() >= -max_seconds_ago:
+                    found.append((i, fetched))
+            if len(found) >= limit:
+                break
+
+    return now, found[:limit]
+
+
+def _run(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    llm calls sync tools inline from its own event loop when the model is
+    async, so in that case the coroutine gets a fresh loop on a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def metar_nearest(codes: list[str], limit: int, max_seconds_ago: int):
+    """Synchronous wrapper around _metar_nearest."""
+
+    return _run(_metar_nearest(codes, limit, max_seconds_ago))
+
+
+def metar(code: str) -> tuple[datetime, str]:
+    """Fetch a METAR weather report."""
+
+    async def fetch():
+        async with metar_client() as client:
+            return await _metar_async(client, code)
+
+    return _run(fetch())
@@ -1,3 +1,8 @@
+from collections.abc import Iterator, Mapping
+from importlib.resources import files
+import math
+
+import numpy as np
 from pydantic import BaseModel
 from pydantic_extra_types.coordinate import Coordinate
 
@@ -8,6706 +13,43 @@ class station(BaseModel):
     altitude: int | None = None
     country: str | None = None
 
-STATIONS = {
-    'AGGH': station(name='Honiara / Henderson', coordinate=(-9.41667, 160.05), altitude=8, country='Solomon Islands'),
-    'AGGL': station(name='Santa Cruz', coordinate=(-10.7, 165.8), altitude=23, country='Solomon Islands'),
-    'AGGM': station(name='Munda', coordinate=(-8.33333, 157.26667), altitude=6, country='Solomon Islands'),
-    'ANAU': station(name='Nauru Airport', coordinate=(-0.53333, 166.91667), altitude=6, country='Nauru'),
-    'AYMD': station(name='Madang', coordinate=(-5.21667, 145.78333), altitude=3, country='Papua New Guinea'),
-    'AYMO': station(name='Manus Island/Momote', coordinate=(-2.06194, 147.42417), altitude=4, country='Papua New Guinea'),
-    'AYPY': station(name='Moresby', coordinate=(-9.43333, 147.21667), altitude=38, country='Papua New Guinea'),
-    'AYWK': station(name='Wewak', coordinate=(-3.56667, 143.63333), altitude=6, country='Papua New Guinea'),
-    'BGAM': station(name='Tasiilaq', coordinate=(65.6, -37.63333), altitude=50, country='Greenland'),
-    'BGAS': station(name='Angisoq', coordinate=(59.98333, -45.2), altitude=16, country='Greenland'),
-    'BGAT': station(name='Aputiteeq', coordinate=(67.78333, -32.3), altitude=13, country='Greenland'),
-    'BGBW': station(name='Narsarsuaq', coordinate=(61.16667, -45.41667), altitude=34, country='Greenland'),
-    'BGCO': station(name='Constable Pynt', coordinate=(70.75, -22.65), altitude=14, country='Greenland'),
-    'BGDB': station(name='Daneborg', coordinate=(74.3, -20.21667), altitude=44, country='Greenland'),
-    'BGDH': station(name='Danmarkshavn', coordinate=(76.76667, -18.66667), altitude=11, country='Greenland'),
-    'BGEM': station(name='Egedesminde', coordinate=(68.7, -52.75), altitude=43, country='Greenland'),
-    'BGFH': station(name='Frederikshaab', coordinate=(62.0, -49.66667), altitude=13, country='Greenland'),
-    'BGGD': station(name='Groennedal', coordinate=(61.23333, -48.1), altitude=35, country='Greenland'),
-    'BGGH': station(name='Godthaab / Nuuk', coordinate=(64.16667, -51.75), altitude=80, country='Greenland'),
-    'BGHB': station(name='Holsteinsborg', coordinate=(66.91667, -53.66667), altitude=12, country='Greenland'),
-    'BGJH': station(name='Julianehaab', coordinate=(60.71667, -46.05), altitude=32, country='Greenland'),
-    'BGJN': station(name='Jacobshavn Lufthavn', coordinate=(69.23333, -51.06667), altitude=29, country='Greenland'),
-    'BGKK': station(name='Kulusuk Lufthavn', coordinate=(65.58333, -37.15), altitude=35, country='Greenland'),
-    'BGKT': station(name='Cape Tobin Automated Reporting Station', coordinate=(70.41667, -21.96667), altitude=41, country='Greenland'),
-    'BGPC': station(name='Prins Christian Sund', coordinate=(60.05, -43.16667), altitude=88, country='Greenland'),
-    'BGSC': station(name='Scoresbysund', coordinate=(70.48333, -21.95), altitude=65, country='Greenland'),
-    'BGSF': station(name='Sdr Stroemfjord', coordinate=(67.01667, -50.7), altitude=50, country='Greenland'),
-    'BGTL': station(name='Thule A. B.', coordinate=(76.53333, -68.75), altitude=77, country='Greenland'),
-    'BIAR': station(name='Akureyri', coordinate=(65.68333, -18.08333), altitude=23, country='Iceland'),
-    'BIEG': station(name='Egilsstadir', coordinate=(65.28333, -14.4), altitude=23, country='Iceland'),
-    'BIGR': station(name='Grimsey', coordinate=(66.53333, -18.01667), altitude=15, country='Iceland'),
-    'BIHN': station(name='Akurnes', coordinate=(64.3, -15.21667), altitude=17, country='Iceland'),
-    'BIKF': station(name='Keflavikurflugvollur', coordinate=(63.96667, -22.6), altitude=52, country='Iceland'),
-    'BIRG': station(name='Raufarhofn', coordinate=(66.45, -15.95), altitude=8, country='Iceland'),
-    'BIRK': station(name='Reykjavik', coordinate=(64.13333, -21.9), altitude=54, country='Iceland'),
-    'BIST': station(name='Stykkisholmur', coordinate=(65.08333, -22.73333), altitude=8, country='Iceland'),
-    'BIVM': station(name='Vestmannaeyjar', coordinate=(63.4, -20.28333), altitude=118, country='Iceland'),
-    'BIVO': station(name='Skjaldthingsstadir', coordinate=(65.7, -14.81667), altitude=44, country='Iceland'),
-    'BIX1': station(name='Biloxi, Keesler Air Force Base, Navu', coordinate=(30.40194, -88.91778), altitude=224, country='United States'),
-    'BIX2': station(name='Biloxi, Keesler Air Force Base, Navu', coordinate=(30.40944, -88.91889), altitude=7, country='United States'),
-    'BIX3': station(name='Biloxi, Keesler Air Force Base, Navu', coordinate=(30.41, -88.91917), altitude=7, country='United States'),
-    'CTPP': station(name='Camp Canargus', coordinate=(18.56667, -72.31667), altitude=38, country='Haiti'),
-    'CWAC': station(name='Nitinat Lake Meteorological Aeronautical Presentation System', coordinate=(48.66667, -124.83333), altitude=41, country='Canada'),
-    'CWAD': station(name='Cape Mudge Light House', coordinate=(50.0, -125.2), altitude=4, country='Canada'),
-    'CWAE': station(name='Whistler', coordinate=(50.13333, -122.95), altitude=658, country='Canada'),
-    'CWAF': station(name='Ile Rouge Meteorological Aeronautical Presentation System', coordinate=(48.08333, -69.55), altitude=5, country='Canada'),
-    'CWAG': station(name='La Scie, Nfld.', coordinate=(49.91667, -55.66667), altitude=192, country='Canada'),
-    'CWAH': station(name='Amherst, N. S.', coordinate=(45.85, -64.26667), altitude=22, country='Canada'),
-    'CWAJ': station(name='Erieau Meteorological Aeronautical Presentation System', coordinate=(42.25, -81.9), altitude=178, country='Canada'),
-    'CWAN': station(name='Amphitrite Point', coordinate=(48.91667, -125.55), altitude=27, country='Canada'),
-    'CWAQ': station(name='Coronach Spc', coordinate=(49.05, -105.48333), altitude=756, country='Canada'),
-    'CWAR': station(name='Argentia, Nfld', coordinate=(47.3, -54.0), altitude=16, country='Canada'),
-    'CWAS': station(name='Pam Rocks', coordinate=(49.48333, -123.3), altitude=None, country='Canada'),
-    'CWAU': station(name='Dryad Point Light House', coordinate=(52.18333, -128.11667), altitude=4, country='Canada'),
-    'CWAV': station(name='Sundre', coordinate=(51.76667, -114.68333), altitude=1114, country='Canada'),
-    'CWAX': station(name='St. Anthony, Nfld.', coordinate=(51.36667, -55.63333), altitude=106, country='Canada'),
-    'CWBA': station(name='Banff, Alta.', coordinate=(51.18333, -115.56667), altitude=1397, country='Canada'),
-    'CWBE': station(name='Killarney Meteorological Aeronautical Presentation System', coordinate=(45.96667, -81.48333), altitude=196, country='Canada'),
-    'CWBF': station(name='Burgeo Automated Reporting Station', coordinate=(47.61667, -57.63333), altitude=12, country='Canada'),
-    'CWBG': station(name='Big Creek', coordinate=(51.25, -123.08333), altitude=1670, country='Canada'),
-    'CWBI': station(name='Britt, Ont.', coordinate=(45.8, -80.53333), altitude=190, country='Canada'),
-    'CWBJ': station(name='Inner Whalebacks', coordinate=(61.91667, -113.73333), altitude=165, country='Canada'),
-    'CWBK': station(name='Caribou Point Meteorological Aeronautical Presentation System', coordinate=(45.76667, -62.68333), altitude=2, country='Canada'),
-    'CWBL': station(name='Bachelors Island Automated Reporting Station', coordinate=(51.75, -99.9), altitude=256, country='Canada'),
-    'CWBM': station(name='Beaverlodge', coordinate=(55.2, -119.4), altitude=745, country='Canada'),
-    'CWBO': station(name='Brooks Automatic Weather Reporting System', coordinate=(50.55, -111.85), altitude=747, country='Canada'),
-    'CWBR': station(name='B, R', coordinate=(66.03333, -91.83333), altitude=31, country='Canada'),
-    'CWBT': station(name='Longue Point De Mingan, Que.', coordinate=(50.26667, -64.23333), altitude=11, country='Canada'),
-    'CWBV': station(name='Beaven Island, N. S.', coordinate=(44.81667, -62.33333), altitude=14, country='Canada'),
-    'CWBY': station(name='Port Menier, Que.', coordinate=(49.83333, -64.3), altitude=53, country='Canada'),
-    'CWBZ': station(name='St Anicet', coordinate=(45.11667, -74.28333), altitude=49, country='Canada'),
-    'CWCA': station(name='Cartwright, Nfld.', coordinate=(53.7, -57.03333), altitude=14, country='Canada'),
-    'CWCB': station(name='Nanakwa Shoals', coordinate=(53.81667, -128.83333), altitude=0, country='Canada'),
-    'CWCD': station(name='Saskatoon Kernen', coordinate=(52.15, -106.55), altitude=510, country='Canada'),
-    'CWCF': station(name='Berens River CS , Man.', coordinate=(52.35, -97.03333), altitude=222, country='Canada'),
-    'CWCH': station(name='Atikokan Automated Reporting Station', coordinate=(48.75, -91.61667), altitude=424, country='Canada'),
-    'CWCI': station(name='Caribou Island, Ont.', coordinate=(47.33333, -85.83333), altitude=187, country='Canada'),
-    'CWCJ': station(name='Pukaskwa', coordinate=(48.6, -86.3), altitude=206, country='Canada'),
-    'CWCL': station(name='Clinton, B. C.', coordinate=(51.15, -121.5), altitude=1057, country='Canada'),
-    'CWCM': station(name='Carberry Mcdc', coordinate=(49.9, -99.35), altitude=384, country='Canada'),
-    'CWCN': station(name='Malloch Dome Automatic Weather Reporting System', coordinate=(78.21667, -101.05), altitude=12, country='Canada'),
-    'CWCO': station(name='Collingwood Automatic Weather Reporting System', coordinate=(44.5, -80.21667), altitude=180, country='Canada'),
-    'CWCQ': station(name='Chatham Automatic Weather Reporting System', coordinate=(47.0, -65.46667), altitude=34, country='Canada'),
-    'CWCS': station(name='Cote-Ste-Cath Mot', coordinate=(45.41667, -73.56667), altitude=17, country='Canada'),
-    'CWCT': station(name='Coronation Automated Reporting Station', coordinate=(52.06667, -111.46667), altitude=791, country='Canada'),
-    'CWCU': station(name='Barrie, Ont.', coordinate=(44.38333, -79.78333), altitude=295, country='Canada'),
-    'CWCV': station(name='Nootka Lightstation, B. C.', coordinate=(49.6, -126.61667), altitude=16, country='Canada'),
-    'CWCX': station(name='Clut Lake Automated Reporting Station', coordinate=(66.0, -117.76667), altitude=185, country='Canada'),
-    'CWCZ': station(name='Addenbrooke Island Light, B. C.', coordinate=(51.6, -127.86667), altitude=21, country='Canada'),
-    'CWDA': station(name='Englee Meteorological Aeronautical Presentation System', coordinate=(50.71667, -56.11667), altitude=29, country='Canada'),
-    'CWDB': station(name='Burwash Automatic Weather Reporting System', coordinate=(61.36667, -139.05), altitude=806, country='Canada'),
-    'CWDC': station(name='Uranium City, Sask.', coordinate=(59.56667, -108.48333), altitude=318, country='Canada'),
-    'CWDD': station(name='Belle River, Ont.', coordinate=(42.3, -82.7), altitude=184, country='Canada'),
-    'CWDE': station(name='Lac Benoit', coordinate=(51.55, -71.11667), altitude=549, country='Canada'),
-    'CWDF': station(name='Oliphant \\ Ont', coordinate=(44.73333, -81.28333), altitude=182, country='Canada'),
-    'CWDH': station(name="Daniel's Harbour, Nfld", coordinate=(50.23333, -57.58333), altitude=18, country='Canada'),
-    'CWDI': station(name='Badger, Nfld', coordinate=(48.96667, -56.06667), altitude=105, country='Canada'),
-    'CWDJ': station(name='Regina University', coordinate=(50.4, -104.58333), altitude=573, country='Canada'),
-    'CWDK': station(name='Claresholm Automatic Weather Reporting System', coordinate=(50.01667, -113.63333), altitude=1012, country='Canada'),
-    'CWDL': station(name='Dease Lake B. C.', coordinate=(58.41667, -130.0), altitude=816, country='Canada'),
-    'CWDM': station(name='Chevery, Que.', coordinate=(50.46667, -59.63333), altitude=6, country='Canada'),
-    'CWDN': station(name='Wasaga Beach Automatic Weather Reporting System', coordinate=(44.51667, -80.01667), altitude=182, country='Canada'),
-    'CWDO': station(name='Twillingate Meteorological Aeronautical Presentation System', coordinate=(49.68333, -54.8), altitude=92, country='Canada'),
-    'CWDP': station(name='Manouane-Est Automated Reporting Station', coordinate=(50.66667, -70.53333), altitude=496, country='Canada'),
-    'CWDQ': station(name='La Tuque', coordinate=(47.41667, -72.8), altitude=169, country='Canada'),
-    'CWDS': station(name='St. Lawrence, Nfld.', coordinate=(46.91667, -55.38333), altitude=46, country='Canada'),
-    'CWDT': station(name='Chute Des Passes', coordinate=(49.9, -71.25), altitude=399, country='Canada'),
-    'CWDU': station(name='Cop Upper', coordinate=(51.08333, -114.21667), altitude=1235, country='Canada'),
-    'CWDV': station(name='Upsala, Ont.', coordinate=(49.03333, -90.46667), altitude=489, country='Canada'),
-    'CWDZ': station(name='Drumheller East', coordinate=(51.43333, -112.66667), altitude=678, country='Canada'),
-    'CWEA': station(name='Pinawa Automatic Weather Reporting System', coordinate=(50.18333, -96.06667), altitude=268, country='Canada'),
-    'CWEB': station(name='Estevan Point, B. C.', coordinate=(49.38333, -126.55), altitude=7, country='Canada'),
-    'CWEC': station(name='Welcome Island', coordinate=(48.36667, -89.11667), altitude=209, country='Canada'),
-    'CWEE': station(name='Chamouchouane Automatic Weather Reporting System', coordinate=(49.28333, -73.35), altitude=305, country='Canada'),
-    'CWEF': station(name='Saint Paul Island Meteorological Aeronautical Presentation System', coordinate=(47.23333, -60.13333), altitude=26, country='Canada'),
-    'CWEG': station(name='Alberta Weather Centre', coordinate=(53.5, -113.5), altitude=None, country='Canada'),
-    'CWEH': station(name='Eastend Cypress, Sask', coordinate=(49.43333, -108.98333), altitude=1078, country='Canada'),
-    'CWEI': station(name='Melita, Man', coordinate=(49.28333, -100.98333), altitude=446, country='Canada'),
-    'CWEJ': station(name='Bow Drill Iii', coordinate=(47.2, -55.1), altitude=0, country='Canada'),
-    'CWEK': station(name='Grey Islet Meteorological Aeronautical Presentation System', coordinate=(54.58333, -130.7), altitude=8, country='Canada'),
-    'CWEL': station(name='Entrance Island Automatic Weather Reporting System', coordinate=(49.21667, -123.8), altitude=5, country='Canada'),
-    'CWEM': station(name='Egg Island Light', coordinate=(51.25, -127.83333), altitude=14, country='Canada'),
-    'CWEO': station(name='Lac Eon, Que', coordinate=(51.86667, -63.28333), altitude=561, country='Canada'),
-    'CWEP': station(name='East Point, P. E. I', coordinate=(46.45, -61.96667), altitude=11, country='Canada'),
-    'CWEQ': station(name='Swan River, Man.', coordinate=(52.11667, -101.23333), altitude=335, country='Canada'),
-    'CWER': station(name="Ile D'Orleans Automated Reporting Station", coordinate=(47.0, -70.81667), altitude=5, country='Canada'),
-    'CWES': station(name='Cape Scott Light', coordinate=(50.78333, -128.43333), altitude=70, country='Canada'),
-    'CWET': station(name='Egbert Meteorological Aeronautical Presentation System', coordinate=(44.23333, -79.78333), altitude=251, country='Canada'),
-    'CWEU': station(name='Eureka, N. W. T.', coordinate=(79.98333, -85.93333), altitude=10, country='Canada'),
-    'CWEV': station(name='Ellice River Automated Reporting Station', coordinate=(67.7, -104.46667), altitude=42, country='Canada'),
-    'CWEW': station(name="L'Assomption", coordinate=(45.81667, -73.43333), altitude=21, country='Canada'),
-    'CWEZ': station(name='Saturna Island Meteorological Aeronautical Presentation System', coordinate=(48.78333, -123.05), altitude=24, country='Canada'),
-    'CWFD': station(name='Cape Dyer, N. W. T.', coordinate=(66.58333, -61.61667), altitude=393, country='Canada'),
-    'CWFE': station(name='Elk Island National Park', coordinate=(53.68333, -112.86667), altitude=716, country='Canada'),
-    'CWFF': station(name='Melfort Automatic Weather Reporting System', coordinate=(52.81667, -104.6), altitude=490, country='Canada'),
-    'CWFG': station(name='Sartine Island Meteorological Aeronautical Presentation System', coordinate=(50.81667, -128.9), altitude=112, country='Canada'),
-    'CWFH': station(name='St. Shotts', coordinate=(46.71667, -53.48333), altitude=143, country='Canada'),
-    'CWFJ': station(name='Cardston Automated Reporting Station', coordinate=(49.2, -113.28333), altitude=1136, country='Canada'),
-    'CWFL': station(name='Fort Reliance', coordinate=(62.71667, -109.16667), altitude=164, country='Canada'),
-    'CWFM': station(name='Chatham Point Lighthouse', coordinate=(50.33333, -125.43333), altitude=23, country='Canada'),
-    'CWFN': station(name='Cree Lake Meteorological Aeronautical Presentation System', coordinate=(57.35, -107.13333), altitude=495, country='Canada'),
-    'CWFP': station(name='Nain', coordinate=(56.55, -61.7), altitude=7, country='Canada'),
-    'CWFQ': station(name='Frelighsburg', coordinate=(45.05, -72.83333), altitude=152, country='Canada'),
-    'CWFR': station(name='Horsefly River, B. C.', coordinate=(52.28333, -121.05), altitude=846, country='Canada'),
-    'CWFU': station(name='Little Macatina', coordinate=(52.23333, -61.31667), altitude=321, country='Canada'),
-    'CWFW': station(name='Baie Comeau', coordinate=(49.26667, -68.15), altitude=129, country='Canada'),
-    'CWFX': station(name='Colville Lake', coordinate=(67.03333, -126.08333), altitude=259, country='Canada'),
-    'CWFY': station(name='Conne River', coordinate=(48.16667, -55.48333), altitude=183, country='Canada'),
-    'CWFZ': station(name='Fort Reliance, N. W. T.', coordinate=(62.71667, -109.18333), altitude=168, country='Canada'),
-    'CWGB': station(name='Ballenas Island Automatic Weather Reporting System', coordinate=(49.35, -124.16667), altitude=5, country='Canada'),
-    'CWGD': station(name='Goderich Automatic Weather Reporting System', coordinate=(43.76667, -81.71667), altitude=214, country='Canada'),
-    'CWGF': station(name='Garden River Automatic Weather Reporting System', coordinate=(58.68333, -113.88333), altitude=241, country='Canada'),
-    'CWGH': station(name='Grenadier Island', coordinate=(44.41667, -75.85), altitude=82, country='Canada'),
-    'CWGJ': station(name='Montreal River Radar Site', coordinate=(47.23333, -84.51667), altitude=559, country='Canada'),
-    'CWGL': station(name='Lagoon City', coordinate=(44.53333, -79.21667), altitude=221, country='Canada'),
-    'CWGM': station(name='Waterton Park Gate', coordinate=(59.13333, -113.8), altitude=1296, country='Canada'),
-    'CWGN': station(name='Gretna, Man.', coordinate=(49.03333, -97.56667), altitude=251, country='Canada'),
-    'CWGP': station(name='Pemberton Automatic Weather Reporting System', coordinate=(50.3, -122.73333), altitude=204, country='Canada'),
-    'CWGQ': station(name='Roquemaure', coordinate=(48.63333, -79.45), altitude=269, country='Canada'),
-    'CWGR': station(name='Iles-De-La-Madelein', coordinate=(47.41667, -61.8), altitude=10, country='Canada'),
-    'CWGT': station(name='Sisters Island Automatic Weather Reporting System', coordinate=(49.48333, -124.43333), altitude=5, country='Canada'),
-    'CWGU': station(name='Gypsumville', coordinate=(51.66667, -98.75), altitude=265, country='Canada'),
-    'CWGV': station(name='Carp Radar Site', coordinate=(45.31667, -76.0), altitude=None, country='Canada'),
-    'CWGW': station(name='Sparwood Automatic Weather Reporting System', coordinate=(49.75, -114.9), altitude=1137, country='Canada'),
-    'CWGX': station(name='Gillam, Man.', coordinate=(56.36667, -94.7), altitude=145, country='Canada'),
-    'CWGY': station(name='Esther 1', coordinate=(51.66667, -110.2), altitude=707, country='Canada'),
-    'CWGZ': station(name='Grise Fiord Airport', coordinate=(76.41667, -82.9), altitude=45, country='Canada'),
-    'CWHA': station(name='Highvale', coordinate=(53.45, -114.46667), altitude=747, country='Canada'),
-    'CWHC': station(name='Vancouver Automatic Weather Reporting System', coordinate=(49.3, -123.11667), altitude=2, country='Canada'),
-    'CWHE': station(name='Ellerslie', coordinate=(53.41667, -113.2), altitude=694, country='Canada'),
-    'CWHH': station(name='Hunters Point Mar', coordinate=(53.03333, -100.93333), altitude=256, country='Canada'),
-    'CWHI': station(name='Three Hills', coordinate=(51.7, -113.21667), altitude=907, country='Canada'),
-    'CWHL': station(name='Holland Rock Automatic Weather Reporting System', coordinate=(54.16667, -130.36667), altitude=5, country='Canada'),
-    'CWHM': station(name='Varennes', coordinate=(45.71667, -73.38333), altitude=19, country='Canada'),
-    'CWHN': station(name='Jimmy Lake', coordinate=(54.91667, -109.95), altitude=658, country='Canada'),
-    'CWHO': station(name='Hopedale Meteorological Aeronautical Presentation System', coordinate=(55.45, -60.23333), altitude=8, country='Canada'),
-    'CWHP': station(name='Heath Point Meteorological Aeronautical Presentation System', coordinate=(49.08333, -61.7), altitude=4, country='Canada'),
-    'CWHQ': station(name='Deschambaults , Que.', coordinate=(46.68333, -71.95), altitude=55, country='Canada'),
-    'CWHS': station(name='Bernard Harbour', coordinate=(68.78333, -114.83333), altitude=65, country='Canada'),
-    'CWHT': station(name='Haines Junction', coordinate=(60.76667, -137.58333), altitude=599, country='Canada'),
-    'CWHU': station(name='Star Brook', coordinate=(48.58333, -57.23333), altitude=290, country='Canada'),
-    'CWHV': station(name='Beauceville', coordinate=(46.2, -70.78333), altitude=229, country='Canada'),
-    'CWHW': station(name='Comfort Cove, Nfld.', coordinate=(49.26667, -54.88333), altitude=96, country='Canada'),
-    'CWHY': station(name='Mont-Orford', coordinate=(45.31667, -72.25), altitude=851, country='Canada'),
-    'CWIA': station(name='Saint Henri , Que.', coordinate=(48.65, -71.85), altitude=103, country='Canada'),
-    'CWIC': station(name='Isachsen Meteorological Aeronautical Presentation System', coordinate=(78.78333, -103.55), altitude=58, country='Canada'),
-    'CWID': station(name='Fort Providence', coordinate=(61.31667, -117.6), altitude=161, country='Canada'),
-    'CWIE': station(name='Indian River', coordinate=(64.38333, -115.01667), altitude=478, country='Canada'),
-    'CWIF': station(name='Quatsino Light Station', coordinate=(50.43333, -128.03333), altitude=21, country='Canada'),
-    'CWIG': station(name='Ile Aux Grues, Que.', coordinate=(47.06667, -70.53333), altitude=18, country='Canada'),
-    'CWII': station(name='Victoria Beach', coordinate=(50.7, -96.56667), altitude=220, country='Canada'),
-    'CWIJ': station(name='Lupin, N. W. T.', coordinate=(65.76667, -111.23333), altitude=500, country='Canada'),
-    'CWIK': station(name='Broadview, Sask.', coordinate=(50.38333, -102.68333), altitude=598, country='Canada'),
-    'CWIL': station(name='Hat Island, N. W. T.', coordinate=(68.31667, -100.08333), altitude=36, country='Canada'),
-    'CWIM': station(name='Upsala Radar Site', coordinate=(49.03333, -90.41667), altitude=480, country='Canada'),
-    'CWIO': station(name='Iskut River', coordinate=(56.73333, -131.66667), altitude=15, country='Canada'),
-    'CWIP': station(name='Pointe Noire , Que.', coordinate=(50.16667, -66.43333), altitude=25, country='Canada'),
-    'CWIQ': station(name='Primrose Lake', coordinate=(54.75, -110.05), altitude=702, country='Canada'),
-    'CWIR': station(name='Victoria Marine', coordinate=(48.36667, -123.75), altitude=32, country='Canada'),
-    'CWIS': station(name='Charlevoix CS , Que.', coordinate=(47.28333, -70.63333), altitude=719, country='Canada'),
-    'CWIT': station(name='Saint Clothilde Automated Reporting Station', coordinate=(45.16667, -73.68333), altitude=52, country='Canada'),
-    'CWIU': station(name='Saint Gedeon, Que.', coordinate=(48.48333, -71.78333), altitude=103, country='Canada'),
-    'CWIW': station(name='Watrous East Automated Reporting Station', coordinate=(51.66667, -105.4), altitude=526, country='Canada'),
-    'CWIX': station(name='Mistook Automated Reporting Station', coordinate=(48.76667, -71.71667), altitude=113, country='Canada'),
-    'CWIY': station(name='St Leonard Automatic Weather Reporting System', coordinate=(47.15, -67.81667), altitude=49, country='Canada'),
-    'CWIZ': station(name="L'Acadie", coordinate=(45.3, -73.35), altitude=45, country='Canada'),
-    'CWJA': station(name='Jasper, Alta.', coordinate=(52.88333, -118.06667), altitude=1061, country='Canada'),
-    'CWJB': station(name='Ste Foy CS , Que.', coordinate=(47.3, -71.26667), altitude=91, country='Canada'),
-    'CWJC': station(name='Ennadai Lake Meteorological Aeronautical Presentation System', coordinate=(61.13333, -100.9), altitude=357, country='Canada'),
-    'CWJD': station(name='Grand Rapids, Man.', coordinate=(53.18333, -99.26667), altitude=223, country='Canada'),
-    'CWJG': station(name='Ivory Island Light', coordinate=(52.26667, -128.41667), altitude=10, country='Canada'),
-    'CWJH': station(name='Southend Automatic Weather Reporting System', coordinate=(56.33333, -103.28333), altitude=344, country='Canada'),
-    'CWJI': station(name='Assiniboia Airport Automated Reporting Station', coordinate=(49.73333, -105.93333), altitude=724, country='Canada'),
-    'CWJM': station(name='Upper Rideau Lake', coordinate=(44.7, -76.3), altitude=125, country='Canada'),
-    'CWJN': station(name='Herschel Island Automatic Weather Reporting System', coordinate=(69.56667, -138.91667), altitude=1, country='Canada'),
-    'CWJO': station(name='Jonquiere Automated Reporting Station', coordinate=(48.41667, -71.21667), altitude=133, country='Canada'),
-    'CWJP': station(name='Porter Lake', coordinate=(61.66667, -108.41667), altitude=396, country='Canada'),
-    'CWJR': station(name='Creston Automatic Weather Reporting System', coordinate=(49.08333, -116.5), altitude=646, country='Canada'),
-    'CWJT': station(name='St Jovite Automatic Weather Reporting System', coordinate=(46.06667, -74.53333), altitude=239, country='Canada'),
-    'CWJU': station(name='Langara, B. C.', coordinate=(54.25, -133.05), altitude=41, country='Canada'),
-    'CWJV': station(name='Vernon, B. C.', coordinate=(50.23333, -119.3), altitude=556, country='Canada'),
-    'CWJW': station(name='Jasper Warden Automated Reporting Station', coordinate=(52.93333, -118.31667), altitude=1020, country='Canada'),
-    'CWJX': station(name='Leader Airport Automatic Weather Reporting System', coordinate=(50.9, -109.5), altitude=672, country='Canada'),
-    'CWJY': station(name='Yathkyed Lake Meteorological Aeronautical Presentation System', coordinate=(62.7, -98.3), altitude=148, country='Canada'),
-    'CWJZ': station(name='Dubawnt Lake Meteorological Aeronautical Presentation System', coordinate=(63.23333, -101.76667), altitude=237, country='Canada'),
-    'CWKD': station(name='Bonnard 1, Que.', coordinate=(50.73333, -71.01667), altitude=497, country='Canada'),
-    'CWKE': station(name='Pelly Bay', coordinate=(68.43333, -89.71667), altitude=326, country='Canada'),
-    'CWKG': station(name='Kejimkujik 1, N. S.', coordinate=(44.43333, -65.2), altitude=127, country='Canada'),
-    'CWKH': station(name='Malahat Automatic Weather Reporting System', coordinate=(48.58333, -123.58333), altitude=366, country='Canada'),
-    'CWKI': station(name='Kitimat', coordinate=(54.05, -128.68333), altitude=13, country='Canada'),
-    'CWKK': station(name='Katatota Island', coordinate=(49.71667, -88.33333), altitude=260, country='Canada'),
-    'CWKM': station(name='Komakuk Beach, Y. T.', coordinate=(69.61667, -140.2), altitude=13, country='Canada'),
-    'CWKO': station(name='Rockglen, Sask.', coordinate=(49.16667, -105.98333), altitude=915, country='Canada'),
-    'CWKR': station(name='King Radar Site', coordinate=(43.96667, -79.56667), altitude=390, country='Canada'),
-    'CWKS': station(name='Sikanni Chief, B. C.', coordinate=(57.25, -122.71667), altitude=937, country='Canada'),
-    'CWKU': station(name='Whiskey Automated Reporting Station', coordinate=(81.03333, -76.95), altitude=829, country='Canada'),
-    'CWKV': station(name='Hope Slide', coordinate=(49.28333, -121.23333), altitude=674, country='Canada'),
-    'CWKW': station(name='Cape Kakkiviak', coordinate=(59.98333, -64.16667), altitude=551, country='Canada'),
-    'CWKX': station(name='Dease Lake Coastal Station', coordinate=(58.41667, -130.0), altitude=816, country='Canada'),
-    'CWLA': station(name='Langara, B. C.', coordinate=(54.25, -133.13333), altitude=41, country='Canada'),
-    'CWLB': station(name='Lac La Biche, Alta.', coordinate=(54.76667, -112.01667), altitude=565, country='Canada'),
-    'CWLC': station(name='Lucy Island, B. C.', coordinate=(54.3, -130.6), altitude=27, country='Canada'),
-    'CWLE': station(name='Lucky Lake Automatic Weather Reporting System', coordinate=(50.95, -107.15), altitude=665, country='Canada'),
-    'CWLF': station(name='Lansdowne House', coordinate=(52.23333, -87.88333), altitude=242, country='Canada'),
-    'CWLG': station(name='Little Chicago', coordinate=(67.2, -130.21667), altitude=63, country='Canada'),
-    'CWLI': station(name='Liverpool Bay', coordinate=(69.6, -130.9), altitude=102, country='Canada'),
-    'CWLM': station(name='Victoria Automatic Weather Reporting System', coordinate=(48.41667, -123.31667), altitude=70, country='Canada'),
-    'CWLO': station(name='Shilo', coordinate=(49.78333, -99.63333), altitude=373, country='Canada'),
-    'CWLP': station(name='Herbert Island Meteorological Aeronautical Presentation System', coordinate=(50.93333, -127.63333), altitude=17, country='Canada'),
-    'CWLQ': station(name='Nipissing', coordinate=(46.31667, -79.46667), altitude=204, country='Canada'),
-    'CWLS': station(name='Mount Forest, Ont.', coordinate=(43.98333, -80.75), altitude=415, country='Canada'),
-    'CWLT': station(name='Alert, N. W. T.', coordinate=(82.5, -62.33333), altitude=63, country='Canada'),
-    'CWLU': station(name='Lauzon, Que.', coordinate=(46.83333, -71.16667), altitude=20, country='Canada'),
-    'CWLV': station(name='Waskesiu Lake Automated Reporting Station', coordinate=(53.91667, -106.06667), altitude=569, country='Canada'),
-    'CWLX': station(name='Longstaff Bluff, N. W. T.', coordinate=(68.88333, -75.13333), altitude=162, country='Canada'),
-    'CWLY': station(name='Lytton, B. C.', coordinate=(50.23333, -121.58333), altitude=229, country='Canada'),
-    'CWLZ': station(name='Candle Lake', coordinate=(53.73333, -105.26667), altitude=503, country='Canada'),
-    'CWMA': station(name='Masset A', coordinate=(54.01667, -132.11667), altitude=5, country='Canada'),
-    'CWMD': station(name='Mould Bay Camp', coordinate=(76.23333, -119.31667), altitude=12, country='Canada'),
-    'CWME': station(name='Cathedral Point Meteorological Aeronautical Presentation System', coordinate=(52.18333, -127.46667), altitude=32, country='Canada'),
-    'CWMH': station(name="Mary's Harbour, Nfld.", coordinate=(52.3, -55.83333), altitude=10, country='Canada'),
-    'CWMI': station(name='Miscou Island, N. B.', coordinate=(48.01667, -64.5), altitude=3, country='Canada'),
-    'CWMJ': station(name='Maniwaki', coordinate=(46.28333, -76.0), altitude=200, country='Canada'),
-    'CWMM': station(name='P. Meadows Coastal Station Automatic Weather Reporting System', coordinate=(49.2, -122.68333), altitude=5, country='Canada'),
-    'CWMN': station(name='Mcgill Radar Site', coordinate=(45.41667, -73.93333), altitude=63, country='Canada'),
-    'CWMP': station(name='Powder Lake', coordinate=(61.05, -109.33333), altitude=396, country='Canada'),
-    'CWMQ': station(name='Maplecreek Automatic Weather Reporting System', coordinate=(49.9, -109.46667), altitude=767, country='Canada'),
-    'CWMR': station(name='Merry Island', coordinate=(49.46667, -123.91667), altitude=8, country='Canada'),
-    'CWMS': station(name='Mcinnes Island, B. C.', coordinate=(52.26667, -128.71667), altitude=25, country='Canada'),
-    'CWMT': station(name='Lac La Martre', coordinate=(63.15, -117.26667), altitude=271, country='Canada'),
-    'CWMU': station(name='Rampart River Automatic Weather Reporting System', coordinate=(65.95, -130.46667), altitude=155, country='Canada'),
-    'CWMV': station(name='St Charles Creek', coordinate=(64.75, -124.21667), altitude=341, country='Canada'),
-    'CWMW': station(name='Maniwaki, Que.', coordinate=(46.38333, -75.96667), altitude=170, country='Canada'),
-    'CWMX': station(name='Mildred Lake', coordinate=(57.53333, -111.56667), altitude=310, country='Canada'),
-    'CWMZ': station(name='Western Island Meteorological Aeronautical Presentation System', coordinate=(45.03333, -80.36667), altitude=191, country='Canada'),
-    'CWNB': station(name='S. E. Shoal Meteorological Aeronautical Presentation System', coordinate=(41.83333, -82.46667), altitude=195, country='Canada'),
-    'CWNC': station(name='Cobourg, Ont.', coordinate=(43.95, -78.16667), altitude=78, country='Canada'),
-    'CWND': station(name='Pelly Island Automatic Weather Reporting System', coordinate=(69.63333, -135.43333), altitude=12, country='Canada'),
-    'CWNE': station(name='North Point, Prince Edward Island', coordinate=(47.08333, -64.0), altitude=15, country='Canada'),
-    'CWNH': station(name='Riviere Du Loup, Que.', coordinate=(47.8, -69.55), altitude=148, country='Canada'),
-    'CWNI': station(name='Nipterk Base', coordinate=(69.61667, -135.33333), altitude=10, country='Canada'),
-    'CWNJ': station(name='Green Island Light Station - Heliport, B. C.', coordinate=(54.56667, -130.7), altitude=12, country='Canada'),
-    'CWNK': station(name='Carman U Of M', coordinate=(49.5, -98.03333), altitude=268, country='Canada'),
-    'CWNL': station(name='Great Duck Island', coordinate=(45.63333, -82.96667), altitude=183, country='Canada'),
-    'CWNM': station(name='Nelson Automatic Weather Reporting System', coordinate=(49.5, -117.3), altitude=535, country='Canada'),
-    'CWNO': station(name='Satah River Automatic Weather Reporting System', coordinate=(66.86667, -134.2), altitude=86, country='Canada'),
-    'CWNP': station(name='Nakusp Automatic Weather Reporting System', coordinate=(50.26667, -117.81667), altitude=524, country='Canada'),
-    'CWNQ': station(name='Nicolet Automatic Weather Reporting System', coordinate=(46.21667, -72.65), altitude=10, country='Canada'),
-    'CWNR': station(name='Nakiska Ridgetop', coordinate=(50.95, -115.18333), altitude=2543, country='Canada'),
-    'CWNT': station(name='Turtle Mountain', coordinate=(49.58333, -114.41667), altitude=2164, country='Canada'),
-    'CWNW': station(name='Haldane River Automatic Weather Reporting System', coordinate=(67.06667, -121.1), altitude=186, country='Canada'),
-    'CWNX': station(name='Nechako River', coordinate=(53.68333, -124.83333), altitude=715, country='Canada'),
-    'CWNZ': station(name='Nagagami, Ont.', coordinate=(49.75, -84.16667), altitude=259, country='Canada'),
-    'CWOA': station(name='Camsell River, N. W. T.', coordinate=(65.61667, -118.11667), altitude=230, country='Canada'),
-    'CWOB': station(name='Brevoort Island', coordinate=(63.33333, -64.15), altitude=367, country='Canada'),
-    'CWOC': station(name='New Carlisle1', coordinate=(48.01667, -65.33333), altitude=47, country='Canada'),
-    'CWOD': station(name='Normandin', coordinate=(48.83333, -72.55), altitude=137, country='Canada'),
-    'CWOE': station(name='Onefour Automatic Weather Reporting System', coordinate=(49.11667, -110.46667), altitude=935, country='Canada'),
-    'CWOH': station(name='Ste Agathe Des Mont', coordinate=(46.05, -74.28333), altitude=395, country='Canada'),
-    'CWOI': station(name='Ivvavik Park Automatic Weather Reporting System', coordinate=(69.15, -140.15), altitude=244, country='Canada'),
-    'CWOK': station(name='Elbow Marine Aviation Reporting Station', coordinate=(51.13333, -106.58333), altitude=595, country='Canada'),
-    'CWOL': station(name='Sable Island Man', coordinate=(43.91667, -59.91667), altitude=4, country='Canada'),
-    'CWON': station(name='Dawson Automatic Weather Reporting System', coordinate=(64.05, -139.15), altitude=370, country='Canada'),
-    'CWOU': station(name='Primrose Lake 2', coordinate=(54.78333, -110.06667), altitude=606, country='Canada'),
-    'CWOY': station(name='Wynyard Marine Aviation Reporting Station', coordinate=(51.76667, -104.21667), altitude=561, country='Canada'),
-    'CWPA': station(name='Henderickson Automatic Weather Reporting System', coordinate=(53.78333, -118.43333), altitude=1542, country='Canada'),
-    'CWPB': station(name='Beausoleil Island Automated Reporting Station', coordinate=(44.85, -79.86667), altitude=183, country='Canada'),
-    'CWPC': station(name='Port Colborne Automated Reporting Station', coordinate=(42.86667, -79.25), altitude=184, country='Canada'),
-    'CWPD': station(name='Parc Des Laurentid', coordinate=(47.56667, -71.23333), altitude=803, country='Canada'),
-    'CWPE': station(name='Point Lepreau, N. B.', coordinate=(45.06667, -66.46667), altitude=1, country='Canada'),
-    'CWPF': station(name='Esquimalt Harbour, B. C.', coordinate=(48.43333, -123.43333), altitude=3, country='Canada'),
-    'CWPH': station(name='Inukjuak, Que', coordinate=(58.45, -78.11667), altitude=3, country='Canada'),
-    'CWPI': station(name='Pine Island Meteorological Aeronautical Presentation System', coordinate=(50.98333, -127.73333), altitude=9, country='Canada'),
-    'CWPJ': station(name='Point Escuminac Meteorological Aeronautical Presentation System', coordinate=(47.06667, -64.8), altitude=5, country='Canada'),
-    'CWPK': station(name='Parent, Que.', coordinate=(47.91667, -74.61667), altitude=442, country='Canada'),
-    'CWPL': station(name='Pickle Lake, Ont.', coordinate=(51.45, -90.2), altitude=389, country='Canada'),
-    'CWPO': station(name='Pilot Mound, Man.', coordinate=(49.2, -98.9), altitude=470, country='Canada'),
-    'CWPQ': station(name='Montreal-Est', coordinate=(45.63333, -70.55), altitude=51, country='Canada'),
-    'CWPR': station(name='Princeton Automatic Weather Reporting System', coordinate=(50.6, -120.51667), altitude=700, country='Canada'),
-    'CWPS': station(name='Long Point Meteorological Aeronautical Presentation System', coordinate=(42.56667, -80.05), altitude=175, country='Canada'),
-    'CWPU': station(name='Puntzi Mountain, B. C.', coordinate=(52.11667, -124.13333), altitude=910, country='Canada'),
-    'CWPX': station(name='Cape Peel West, N. W. T.', coordinate=(69.03333, -107.81667), altitude=165, country='Canada'),
-    'CWPY': station(name='Fort Chipewyan Automated Reporting Station', coordinate=(58.76667, -111.13333), altitude=232, country='Canada'),
-    'CWPZ': station(name='Burns Lake CS , B. C.', coordinate=(54.38333, -125.95), altitude=713, country='Canada'),
-    'CWQC': station(name='Port Alberni, B. C.', coordinate=(49.25, -124.83333), altitude=2, country='Canada'),
-    'CWQE': station(name='Toronto Headland', coordinate=(43.61667, -79.35), altitude=87, country='Canada'),
-    'CWQF': station(name='Rabbit Kettle Automated Reporting Station', coordinate=(61.96667, -127.21667), altitude=634, country='Canada'),
-    'CWQG': station(name='Valcartier', coordinate=(46.9, -71.5), altitude=168, country='Canada'),
-    'CWQH': station(name='Lennoxville', coordinate=(45.36667, -71.81667), altitude=181, country='Canada'),
-    'CWQJ': station(name='Sedco 710', coordinate=(46.5, -48.5), altitude=0, country='Canada'),
-    'CWQK': station(name='Race Rocks Automatic Weather Reporting System', coordinate=(48.3, -123.53333), altitude=5, country='Canada'),
-    'CWQL': station(name='Lethbridge Automated Reporting Station', coordinate=(49.7, -112.78333), altitude=921, country='Canada'),
-    'CWQM': station(name='Cap Rouge', coordinate=(48.38333, -70.53333), altitude=7, country='Canada'),
-    'CWQO': station(name='Ile Bicquette, Que.', coordinate=(48.41556, -68.89333), altitude=7, country='Canada'),
-    'CWQP': station(name='Point Petre , Ont.', coordinate=(43.83333, -77.15), altitude=79, country='Canada'),
-    'CWQQ': station(name='Lacombe Cda', coordinate=(52.45, -113.75), altitude=874, country='Canada'),
-    'CWQR': station(name='Ile Aux Perroquets, Que.', coordinate=(50.22361, -64.20833), altitude=9, country='Canada'),
-    'CWQS': station(name='Kindakun Rocks, B. C.', coordinate=(53.31667, -132.75), altitude=14, country='Canada'),
-    'CWQV': station(name='Puinte Claveau', coordinate=(48.26667, -70.11667), altitude=0, country='Canada'),
-    'CWQW': station(name='Cape Whittle', coordinate=(50.16667, -60.06667), altitude=7, country='Canada'),
-    'CWQY': station(name='Hanbury River Automated Reporting Station', coordinate=(63.58333, -105.15), altitude=317, country='Canada'),
-    'CWQZ': station(name='Quesnel Automatic Weather Reporting System', coordinate=(53.03333, -122.53333), altitude=545, country='Canada'),
-    'CWRA': station(name='Cape Race, Nfld', coordinate=(46.65, -53.06667), altitude=27, country='Canada'),
-    'CWRD': station(name='Red Earth', coordinate=(56.53333, -115.26667), altitude=546, country='Canada'),
-    'CWRF': station(name='Pelly Bay 1', coordinate=(69.43333, -89.73333), altitude=325, country='Canada'),
-    'CWRH': station(name='Resolution Island, N. W. T.', coordinate=(61.58333, -64.65), altitude=369, country='Canada'),
-    'CWRJ': station(name='Rosetown East, Sask', coordinate=(51.56667, -107.91667), altitude=586, country='Canada'),
-    'CWRK': station(name='Bancroft Automatic Weather Reporting System', coordinate=(45.06667, -77.86667), altitude=331, country='Canada'),
-    'CWRM': station(name='Rocky House Marine Aviation Reporting Station', coordinate=(52.43333, -114.93333), altitude=988, country='Canada'),
-    'CWRN': station(name='Hart Island Meteorological Aeronautical Presentation System', coordinate=(45.35, -60.98333), altitude=4, country='Canada'),
-    'CWRO': station(name='Rose Spit Meteorological Aeronautical Presentation System', coordinate=(54.16667, -131.66667), altitude=7, country='Canada'),
-    'CWRP': station(name='Nicholson Peninsul', coordinate=(69.93333, -128.96667), altitude=89, country='Canada'),
-    'CWRQ': station(name='Trois Rivieres', coordinate=(46.38333, -72.61667), altitude=11, country='Canada'),
-    'CWRT': station(name='Crowsnest', coordinate=(49.63333, -114.48333), altitude=1303, country='Canada'),
-    'CWRU': station(name='Solander Island Meteorological Aeronautical Presentation System', coordinate=(50.11667, -127.93333), altitude=99, country='Canada'),
-    'CWRV': station(name='Camrose', coordinate=(53.03333, -112.81667), altitude=739, country='Canada'),
-    'CWRW': station(name='Fourchu Head Meteorological Aeronautical Presentation System', coordinate=(45.71667, -60.23333), altitude=10, country='Canada'),
-    'CWRX': station(name='Rowley Island, N. W. T.', coordinate=(69.06667, -79.06667), altitude=41, country='Canada'),
-    'CWRY': station(name='Milk River', coordinate=(49.13333, -112.05), altitude=1050, country='Canada'),
-    'CWRZ': station(name="Cap D'Espoir , Que.", coordinate=(48.41667, -64.31667), altitude=16, country='Canada'),
-    'CWSA': station(name='Sable Island, N. S.', coordinate=(43.93333, -60.01667), altitude=4, country='Canada'),
-    'CWSD': station(name='Summerside Automatic Weather Reporting System', coordinate=(46.43333, -63.85), altitude=24, country='Canada'),
-    'CWSE': station(name='Edmonton Stony Plain Alta.', coordinate=(53.53333, -114.1), altitude=766, country='Canada'),
-    'CWSF': station(name='Cap Madeleine Meteorological Aeronautical Presentation System', coordinate=(49.25, -65.33333), altitude=29, country='Canada'),
-    'CWSG': station(name='Cap Chat CS, Que.', coordinate=(49.11667, -66.65), altitude=5, country='Canada'),
-    'CWSH': station(name='Sousa Crk Avt', coordinate=(58.58333, -118.5), altitude=373, country='Canada'),
-    'CWSI': station(name='Simcoe, Ont.', coordinate=(42.85, -80.26667), altitude=241, country='Canada'),
-    'CWSK': station(name='Squamish Airport, B. C', coordinate=(49.78333, -123.16667), altitude=59, country='Canada'),
-    'CWSL': station(name='Salmon Arm Automatic Weather Reporting System', coordinate=(50.7, -119.28333), altitude=351, country='Canada'),
-    'CWSO': station(name='Exeter Radar Site', coordinate=(43.36667, -81.38333), altitude=None, country='Canada'),
-    'CWSP': station(name='Sheringham Automatic Weather Reporting System', coordinate=(48.38333, -123.91667), altitude=21, country='Canada'),
-    'CWSQ': station(name='Aulvik National Park', coordinate=(74.13333, -119.98333), altitude=32, country='Canada'),
-    'CWSR': station(name='Spiritwood West, Sask', coordinate=(53.36667, -107.55), altitude=584, country='Canada'),
-    'CWSS': station(name='St. Stephen, N. B.', coordinate=(45.21667, -67.25), altitude=26, country='Canada'),
-    'CWST': station(name='La Pocatiere', coordinate=(47.35, -70.03333), altitude=31, country='Canada'),
-    'CWSV': station(name='Blue River Marine Aviation Reporting Station', coordinate=(52.1, -119.3), altitude=683, country='Canada'),
-    'CWSW': station(name='Sparwood / Elk Valley', coordinate=(49.75, -114.88333), altitude=1138, country='Canada'),
-    'CWSY': station(name='Sachs Harbour, N. W. T.', coordinate=(72.0, -125.26667), altitude=88, country='Canada'),
-    'CWSZ': station(name='Fisher Branch Marine Aviation Reporting Station', coordinate=(51.08333, -97.55), altitude=253, country='Canada'),
-    'CWTA': station(name='Mc Tavish Automated Reporting Station', coordinate=(45.5, -73.58333), altitude=63, country='Canada'),
-    'CWTB': station(name='Border, Que.', coordinate=(55.33333, -63.21667), altitude=479, country='Canada'),
-    'CWTC': station(name='Ethelda Bay', coordinate=(53.05, -129.68333), altitude=10, country='Canada'),
-    'CWTD': station(name='Robertson Lake Automated Reporting Station', coordinate=(65.1, -102.43333), altitude=244, country='Canada'),
-    'CWTE': station(name='Trout Lake', coordinate=(60.43333, -121.23333), altitude=498, country='Canada'),
-    'CWTF': station(name='Beartooth Island', coordinate=(59.21667, -109.7), altitude=238, country='Canada'),
-    'CWTG': station(name='Pointe-Des-Monts , Que.', coordinate=(49.31667, -67.38333), altitude=5, country='Canada'),
-    'CWTH': station(name='Tetsa River', coordinate=(58.65, -124.23333), altitude=804, country='Canada'),
-    'CWTI': station(name='Triple Island Light, B. C.', coordinate=(54.3, -130.88333), altitude=21, country='Canada'),
-    'CWTN': station(name='Cap Tourmente', coordinate=(47.06667, -70.8), altitude=6, country='Canada'),
-    'CWTO': station(name='Toronto Aes Hq', coordinate=(43.78333, -79.46667), altitude=187, country='Canada'),
-    'CWTU': station(name='Tukialik Bay, Nfld.', coordinate=(54.71667, -58.35), altitude=683, country='Canada'),
-    'CWTY': station(name='Trois Rivieres', coordinate=(46.35, -72.51667), altitude=6, country='Canada'),
-    'CWTZ': station(name='Toronto Island', coordinate=(43.63333, -79.41667), altitude=77, country='Canada'),
-    'CWUL': station(name='Quebec Fcst Office', coordinate=(45.5, -73.68333), altitude=None, country='Canada'),
-    'CWUM': station(name='Faro, Y. T.', coordinate=(62.23333, -133.35), altitude=717, country='Canada'),
-    'CWUP': station(name='Cape Hooper, N. W. T.', coordinate=(68.46667, -66.8), altitude=401, country='Canada'),
-    'CWUR': station(name='Truro, N. S.', coordinate=(45.36667, -63.26667), altitude=40, country='Canada'),
-    'CWUS': station(name='Summerland Automatic Weather Reporting System', coordinate=(49.56667, -119.65), altitude=454, country='Canada'),
-    'CWUT': station(name='Shoal Lake Airport Automated Reporting Station', coordinate=(50.45, -100.6), altitude=561, country='Canada'),
-    'CWUU': station(name='Mackar Inlet', coordinate=(68.3, -85.66667), altitude=395, country='Canada'),
-    'CWUW': station(name='Dewar Lakes, N. W. T.', coordinate=(68.65, -71.16667), altitude=518, country='Canada'),
-    'CWUX': station(name='La Baie , Que.', coordinate=(48.3, -70.93333), altitude=135, country='Canada'),
-    'CWUY': station(name='Rouyn', coordinate=(48.25, -79.03333), altitude=318, country='Canada'),
-    'CWVA': station(name='Bonavista, Nfld.', coordinate=(48.66667, -53.11667), altitude=25, country='Canada'),
-    'CWVB': station(name='Bonilla Island Light', coordinate=(53.5, -130.63333), altitude=16, country='Canada'),
-    'CWVC': station(name='Swift Current Automatic Weather Reporting System', coordinate=(50.26667, -107.73333), altitude=825, country='Canada'),
-    'CWVD': station(name='Broughton Island', coordinate=(67.53333, -63.78333), altitude=584, country='Canada'),
-    'CWVE': station(name='Valleyfield', coordinate=(45.23333, -74.1), altitude=46, country='Canada'),
-    'CWVF': station(name='Sand Heads CS, B. C.', coordinate=(49.1, -123.3), altitude=13, country='Canada'),
-    'CWVH': station(name='Storm Hills , N. W. T.', coordinate=(68.9, -133.93333), altitude=261, country='Canada'),
-    'CWVI': station(name='Vegreville Automatic Weather Reporting System', coordinate=(53.61667, -112.03333), altitude=639, country='Canada'),
-    'CWVK': station(name='Vernon, B. C.', coordinate=(50.23333, -119.28333), altitude=555, country='Canada'),
-    'CWVN': station(name='Val Marie Southeast, Sask', coordinate=(49.06667, -107.58333), altitude=785, country='Canada'),
-    'CWVO': station(name='Vauxhall Cda', coordinate=(50.05, -112.13333), altitude=779, country='Canada'),
-    'CWVP': station(name='Cypress Hills Park', coordinate=(49.65, -109.51667), altitude=1271, country='Canada'),
-    'CWVQ': station(name='Ste Anne De Bell 1', coordinate=(45.43333, -73.93333), altitude=39, country='Canada'),
-    'CWVT': station(name='Buffalo Narrows, Sask.', coordinate=(55.83333, -108.43333), altitude=434, country='Canada'),
-    'CWVU': station(name='Brier Island, N. S.', coordinate=(44.28583, -66.34667), altitude=16, country='Canada'),
-    'CWVV': station(name='Vic. Hartland Automatic Weather Reporting System', coordinate=(48.53333, -123.46667), altitude=154, country='Canada'),
-    'CWVY': station(name='Villeroy Radar Site', coordinate=(46.43333, -71.93333), altitude=108, country='Canada'),
-    'CWVZ': station(name='Ile Charron, Que.', coordinate=(45.58333, -73.5), altitude=12, country='Canada'),
-    'CWWA': station(name='W Vancouver Automatic Weather Reporting System', coordinate=(49.35, -123.18333), altitude=178, country='Canada'),
-    'CWWB': station(name='Burlington Piers', coordinate=(43.3, -79.8), altitude=77, country='Canada'),
-    'CWWC': station(name='Collins Bay Automatic Weather Reporting System', coordinate=(58.18333, -103.7), altitude=492, country='Canada'),
-    'CWWE': station(name='Western Head, N. S.', coordinate=(43.98333, -64.66667), altitude=9, country='Canada'),
-    'CWWF': station(name='Weyburn Automatic Weather Reporting System', coordinate=(49.7, -103.8), altitude=589, country='Canada'),
-    'CWWK': station(name='White Rock Automatic Weather Reporting System', coordinate=(49.01667, -122.78333), altitude=15, country='Canada'),
-    'CWWL': station(name='Bonilla Island Meteorological Aeronautical Presentation System', coordinate=(53.5, -130.63333), altitude=17, country='Canada'),
-    'CWWM': station(name='Grant Automatic Weather Reporting System', coordinate=(82.5, -65.08333), altitude=1242, country='Canada'),
-    'CWWN': station(name='Peawanuck Meteorological Aeronautical Presentation System', coordinate=(54.98333, -85.43333), altitude=52, country='Canada'),
-    'CWWO': station(name='Willow Creek', coordinate=(53.38333, -118.33333), altitude=1402, country='Canada'),
-    'CWWP': station(name='Wasagaming, Man.', coordinate=(50.65, -99.93333), altitude=626, country='Canada'),
-    'CWWQ': station(name='Muncho Lake', coordinate=(58.91667, -125.76667), altitude=835, country='Canada'),
-    'CWWS': station(name='George Island Meteorological Aeronautical Presentation System', coordinate=(52.8, -97.61667), altitude=223, country='Canada'),
-    'CWWU': station(name='Ingenika Point', coordinate=(56.8, -124.9), altitude=680, country='Canada'),
-    'CWWV': station(name='Killinek Meteorological Aeronautical Presentation System', coordinate=(60.41667, -64.85), altitude=31, country='Canada'),
-    'CWWX': station(name='Cove Island Meteorological Aeronautical Presentation System', coordinate=(45.33333, -81.73333), altitude=181, country='Canada'),
-    'CWWZ': station(name='Port Weller, Ont.', coordinate=(43.25, -79.21667), altitude=79, country='Canada'),
-    'CWXA': station(name='Bow Valley', coordinate=(51.08333, -115.06667), altitude=1298, country='Canada'),
-    'CWXC': station(name='Onatchiway, Que.', coordinate=(48.88333, -71.03333), altitude=304, country='Canada'),
-    'CWXH': station(name='Holberg, B. C.', coordinate=(50.63333, -128.11667), altitude=568, country='Canada'),
-    'CWXI': station(name='Ferolle Point Meteorological Aeronautical Presentation System', coordinate=(51.01667, -57.1), altitude=8, country='Canada'),
-    'CWXJ': station(name='Bull Arm Automatic Weather Reporting System', coordinate=(47.81667, -53.9), altitude=119, country='Canada'),
-    'CWXL': station(name='Bow Island', coordinate=(49.63333, -111.45), altitude=838, country='Canada'),
-    'CWXM': station(name='Helmcken Island Meteorological Aeronautical Presentation System', coordinate=(50.4, -125.86667), altitude=19, country='Canada'),
-    'CWXO': station(name='Rowan Gorilla Iii', coordinate=(43.88333, -60.55), altitude=44, country='Canada'),
-    'CWXP': station(name='Pangnirtung', coordinate=(66.15, -65.73333), altitude=23, country='Canada'),
-    'CWXR': station(name='Croker River, N. W. T.', coordinate=(69.26667, -119.21667), altitude=69, country='Canada'),
-    'CWXV': station(name='Back River Meteorological Aeronautical Presentation System', coordinate=(66.08333, -96.5), altitude=28, country='Canada'),
-    'CWXW': station(name='Alexis River Meteorological Aeronautical Presentation System', coordinate=(52.65, -56.86667), altitude=43, country='Canada'),
-    'CWYB': station(name='N. Bay Weather Office', coordinate=(46.31667, -79.45), altitude=None, country='Canada'),
-    'CWYE': station(name='Outlook Pfra', coordinate=(51.48333, -107.05), altitude=541, country='Canada'),
-    'CWYG': station(name='Charlottetown', coordinate=(46.23333, -63.13333), altitude=50, country='Canada'),
-    'CWYH': station(name='Rae Lakes', coordinate=(64.11667, -117.36667), altitude=231, country='Canada'),
-    'CWYJ': station(name='Victoria University', coordinate=(48.45, -123.3), altitude=60, country='Canada'),
-    'CWYK': station(name='Cape Kiglapait, Nfld.', coordinate=(57.13333, -61.48333), altitude=834, country='Canada'),
-    'CWYL': station(name='Yoho Park Automatic Weather Reporting System', coordinate=(51.45, -116.33333), altitude=1615, country='Canada'),
-    'CWYM': station(name='Cape Mercy', coordinate=(64.95, -63.58333), altitude=583, country='Canada'),
-    'CWYO': station(name='Wynyard, Sask.', coordinate=(51.76667, -104.2), altitude=561, country='Canada'),
-    'CWYY': station(name='Osoyoos Automatic Weather Reporting System', coordinate=(49.03333, -119.43333), altitude=283, country='Canada'),
-    'CWZA': station(name='Agassiz Automated Reporting Station', coordinate=(49.25, -121.76667), altitude=15, country='Canada'),
-    'CWZB': station(name='Port-Aux-Basques, Nfld.', coordinate=(47.56667, -59.16667), altitude=40, country='Canada'),
-    'CWZD': station(name='Scudder Point Meteorological Aeronautical Presentation System', coordinate=(52.45, -131.23333), altitude=5, country='Canada'),
-    'CWZG': station(name='Banff Marine Aviation Reporting Station', coordinate=(51.2, -115.55), altitude=1397, country='Canada'),
-    'CWZL': station(name='Cumshewa Island Meteorological Aeronautical Presentation System', coordinate=(53.03333, -131.6), altitude=17, country='Canada'),
-    'CWZM': station(name='Boat Bluff Light', coordinate=(52.65, -128.51667), altitude=11, country='Canada'),
-    'CWZN': station(name='Sagona Island Meteorological Aeronautical Presentation System', coordinate=(47.36667, -55.8), altitude=35, country='Canada'),
-    'CWZO': station(name='Kelp Reefs, B. C.', coordinate=(48.55, -123.23333), altitude=0, country='Canada'),
-    'CWZQ': station(name='Grand Etang, N. S.', coordinate=(46.55, -61.05), altitude=13, country='Canada'),
-    'CWZS': station(name='Amqui , Que.', coordinate=(48.46667, -67.43333), altitude=166, country='Canada'),
-    'CWZT': station(name='Dauphin Coastal Station', coordinate=(51.1, -100.05), altitude=305, country='Canada'),
-    'CWZV': station(name='Virginia Falls', coordinate=(61.63333, -125.8), altitude=610, country='Canada'),
-    'CWZW': station(name='Teslin Marine Aviation Reporting Station', coordinate=(60.16667, -132.76667), altitude=705, country='Canada'),
-    'CWZZ': station(name='Saglek Bay', coordinate=(58.33333, -62.58333), altitude=483, country='Canada'),
-    'CXBK': station(name='Bratts Lake, Sask.', coordinate=(50.2, -104.7), altitude=580, country='Canada'),
-    'CXBO': station(name='Beauport CS, Que.', coordinate=(46.83333, -71.2), altitude=10, country='Canada'),
-    'CXBP': station(name='Confederation Bridge, Prince Edward Island', coordinate=(46.23333, -63.73333), altitude=54, country='Canada'),
-    'CXCH': station(name='Cheticamp, N. S.', coordinate=(46.65, -60.95), altitude=44, country='Canada'),
-    'CXCK': station(name='Carmacks CS, Y. T.', coordinate=(62.11667, -136.18333), altitude=632, country='Canada'),
-    'CXDE': station(name='Deline , N. W. T.', coordinate=(65.21667, -123.43333), altitude=213, country='Canada'),
-    'CXDI': station(name='Delhi CS, Ont.', coordinate=(42.86667, -80.55), altitude=232, country='Canada'),
-    'CXDW': station(name='Deerwood RCS , Man.', coordinate=(49.4, -98.31667), altitude=341, country='Canada'),
-    'CXEC': station(name='Edmonton Municipal CR10 , Alta.', coordinate=(53.56667, -113.51667), altitude=671, country='Canada'),
-    'CXEG': station(name='Edmonton International CS , Alta.', coordinate=(53.3, -113.6), altitude=715, country='Canada'),
-    'CXGH': station(name='Gimli Harbour CS, Man.', coordinate=(50.63111, -96.98222), altitude=217, country='Canada'),
-    'CXHF': station(name='High Falls , Que.', coordinate=(45.83333, -75.65), altitude=190, country='Canada'),
-    'CXKT': station(name='Kentville , N. S.', coordinate=(45.06667, -64.48333), altitude=49, country='Canada'),
-    'CXLC': station(name='Lower Carp Lake , N. W. T.', coordinate=(63.6, -113.86667), altitude=373, country='Canada'),
-    'CXLL': station(name='Lindberg Landing , N. W. T.', coordinate=(61.11667, -122.85), altitude=183, country='Canada'),
-    'CXMD': station(name='Morden CDA CS , Man.', coordinate=(49.18333, -98.08333), altitude=298, country='Canada'),
-    'CXMI': station(name='McNabs Island , N. S.', coordinate=(44.6, -63.53333), altitude=15, country='Canada'),
-    'CXMM': station(name='Fort McMurray CS, Alta.', coordinate=(56.65, -111.21667), altitude=369, country='Canada'),
-    'CXMY': station(name='Malay Falls , N. S.', coordinate=(44.98333, -62.48333), altitude=40, country='Canada'),
-    'CXNM': station(name='North Mountain , N. S.', coordinate=(46.81667, -60.66667), altitude=439, country='Canada'),
-    'CXOX': station(name='La Ronge , Sask.', coordinate=(55.15, -105.26667), altitude=378, country='Canada'),
-    'CXPV': station(name='Prairie River, Alta', coordinate=(58.62222, -111.6725), altitude=212, country='Canada'),
-    'CXQA': station(name='Qavvik Lake, N. W. T.', coordinate=(68.25778, -122.10361), altitude=530, country='Canada'),
-    'CXRH': station(name='Rocky Harbour CS, Nfld.', coordinate=(49.56667, -57.88333), altitude=68, country='Canada'),
-    'CXSH': station(name='Shawinigan CS , Que.', coordinate=(46.58333, -72.58333), altitude=110, country='Canada'),
-    'CXSR': station(name='Spirit River Auto Station, Alta', coordinate=(55.69528, -119.23417), altitude=1015, country='Canada'),
-    'CXSW': station(name="St. John's West CDA CS, Nfld.", coordinate=(47.51556, -52.78472), altitude=114, country='Canada'),
-    'CXTN': station(name='Tuktut Nogait , N. W. T.', coordinate=(69.18333, -122.35), altitude=552, country='Canada'),
-    'CXTP': station(name='Terra Nova National Park CS, Nfld.', coordinate=(48.55694, -53.97444), altitude=107, country='Canada'),
-    'CXTV': station(name='Trail Valley , N. W. T.', coordinate=(68.75, -133.5), altitude=85, country='Canada'),
-    'CXWN': station(name='Winnipeg The Forks, Man.', coordinate=(49.88333, -97.13333), altitude=230, country='Canada'),
-    'CXXX': station(name='Cluff Lake , Sask.', coordinate=(58.38333, -109.5), altitude=339, country='Canada'),
-    'CXZU': station(name='Whitecourt , Alta.', coordinate=(54.15, -115.78333), altitude=785, country='Canada'),
-    'CYAD': station(name='La Grande Iii Supplementary Aviation Weather Reporting Station', coordinate=(53.56667, -76.2), altitude=233, country='Canada'),
-    'CYAH': station(name='La Grande Iv, Que.', coordinate=(53.75, -73.66667), altitude=306, country='Canada'),
-    'CYAJ': station(name='Komakuk Beach Airport', coordinate=(69.58333, -140.18333), altitude=7, country='Canada'),
-    'CYAM': station(name='Sault Ste Marie, Ont.', coordinate=(46.48333, -84.5), altitude=187, country='Canada'),
-    'CYAS': station(name='Kangirsuk Supplementary Aviation Weather Reporting Station', coordinate=(60.01667, -70.0), altitude=117, country='Canada'),
-    'CYAW': station(name='Shearwater, N. S.', coordinate=(44.63333, -63.5), altitude=51, country='Canada'),
-    'CYAY': station(name='Saint Anthony Airport', coordinate=(51.4, -56.08333), altitude=28, country='Canada'),
-    'CYAZ': station(name='Tofino Airport', coordinate=(49.08333, -125.76667), altitude=24, country='Canada'),
-    'CYBB': station(name='Pelly Bay Airport', coordinate=(68.53333, -89.81667), altitude=15, country='Canada'),
-    'CYBC': station(name='Baie Comeau, Que.', coordinate=(49.13333, -68.2), altitude=21, country='Canada'),
-    'CYBD': station(name='Bella Coola Airport', coordinate=(52.38333, -126.58333), altitude=35, country='Canada'),
-    'CYBG': station(name='Bagotville, Que.', coordinate=(48.33333, -71.0), altitude=159, country='Canada'),
-    'CYBK': station(name='Baker Lake, N. W. T.', coordinate=(64.3, -96.08333), altitude=18, country='Canada'),
-    'CYBL': station(name='Campbell River Airport', coordinate=(49.95, -125.26667), altitude=106, country='Canada'),
-    'CYBN': station(name='Borden, Ont.', coordinate=(44.25, -79.91667), altitude=223, country='Canada'),
-    'CYBR': station(name='Brandon, Man.', coordinate=(49.91667, -99.95), altitude=409, country='Canada'),
-    'CYBU': station(name='Nipawin, Sask.', coordinate=(53.33333, -104.0), altitude=372, country='Canada'),
-    'CYBV': station(name='Berens River Airport', coordinate=(52.35, -97.03333), altitude=222, country='Canada'),
-    'CYBW': station(name='Calgary / Springbank', coordinate=(51.1, -114.36667), altitude=1200, country='Canada'),
-    'CYBX': station(name='Blanc Sablon, Que.', coordinate=(51.45, -57.18333), altitude=30, country='Canada'),
-    'CYCA': station(name='Cartwright Man', coordinate=(53.68333, -57.03333), altitude=12, country='Canada'),
-    'CYCB': station(name='Cambridge Bay, N. W. T.', coordinate=(69.1, -105.11667), altitude=23, country='Canada'),
-    'CYCD': station(name='Nanaimo Airport', coordinate=(49.05, -123.86667), altitude=28, country='Canada'),
-    'CYCG': station(name='Castlegar Airport', coordinate=(49.3, -117.63333), altitude=495, country='Canada'),
-    'CYCH': station(name='Chatham Can-Mil', coordinate=(47.0, -65.45), altitude=31, country='Canada'),
-    'CYCL': station(name='Charlo, N. B.', coordinate=(47.98333, -66.33333), altitude=38, country='Canada'),
-    'CYCO': station(name='Coppermine, N. W. T.', coordinate=(67.81667, -115.13333), altitude=22, country='Canada'),
-    'CYCP': station(name='Blue River, B. C.', coordinate=(52.13333, -119.3), altitude=679, country='Canada'),
-    'CYCQ': station(name='Chetwynd Airport', coordinate=(55.7, -121.63333), altitude=609, country='Canada'),
-    'CYCS': station(name='Chesterfield Inlet', coordinate=(63.33333, -90.71667), altitude=11, country='Canada'),
-    'CYCT': station(name='Coronation Marine Aviation Reporting Station', coordinate=(52.06667, -111.45), altitude=791, country='Canada'),
-    'CYCX': station(name='Gagetown Can-Mil', coordinate=(45.83333, -66.43333), altitude=51, country='Canada'),
-    'CYCY': station(name='Clyde, N. W. T.', coordinate=(70.48333, -68.51667), altitude=25, country='Canada'),
-    'CYDA': station(name='Dawson, Y. T.', coordinate=(64.05, -139.13333), altitude=370, country='Canada'),
-    'CYDB': station(name='Burwash Airport', coordinate=(61.36667, -139.03333), altitude=807, country='Canada'),
-    'CYDC': station(name='Princeton Airport', coordinate=(49.46667, -120.51667), altitude=700, country='Canada'),
-    'CYDF': station(name='Deer Lake, Nfld.', coordinate=(49.21667, -57.4), altitude=17, country='Canada'),
-    'CYDM': station(name='Ross River Airport', coordinate=(61.96667, -132.43333), altitude=705, country='Canada'),
-    'CYDN': station(name='Dauphin, Man.', coordinate=(51.1, -100.05), altitude=305, country='Canada'),
-    'CYDP': station(name='Nain, Nfld', coordinate=(56.55, -61.68333), altitude=6, country='Canada'),
-    'CYDQ': station(name='Dawson Creek Airport', coordinate=(55.75, -120.18333), altitude=655, country='Canada'),
-    'CYED': station(name='Edmonton Namao Alta.', coordinate=(53.66667, -113.46667), altitude=688, country='Canada'),
-    'CYEG': station(name='Edmonton International, Alta.', coordinate=(53.3, -113.58333), altitude=715, country='Canada'),
-    'CYEK': station(name='Arviat Airport', coordinate=(61.1, -94.06667), altitude=10, country='Canada'),
-    'CYEL': station(name='Elliot Lake Supplementary Aviation Weather Reporting Station', coordinate=(46.35, -82.56667), altitude=329, country='Canada'),
-    'CYEN': station(name='Estevan, Sask.', coordinate=(49.21667, -102.96667), altitude=572, country='Canada'),
-    'CYET': station(name='Edson, Alta.', coordinate=(53.58333, -116.46667), altitude=921, country='Canada'),
-    'CYEU': station(name='Eureka Man', coordinate=(80.0, -85.81667), altitude=78, country='Canada'),
-    'CYEV': station(name='Inuvik, N. W. T.', coordinate=(68.3, -133.48333), altitude=59, country='Canada'),
-    'CYFB': station(name='Iqaluit, N. W. T.', coordinate=(63.75, -68.55), altitude=34, country='Canada'),
-    'CYFC': station(name='Fredericton, N. B.', coordinate=(45.86667, -66.53333), altitude=17, country='Canada'),
-    'CYFO': station(name='Flin Flon Airport', coordinate=(54.68333, -101.68333), altitude=304, country='Canada'),
-    'CYFR': station(name='Fort Resolution', coordinate=(61.18333, -113.68333), altitude=164, country='Canada'),
-    'CYFS': station(name='Fort Simpson, N. W. T.', coordinate=(61.75, -121.23333), altitude=168, country='Canada'),
-    'CYFT': station(name='Makkovik Airport', coordinate=(55.08333, -59.18333), altitude=71, country='Canada'),
-    'CYGE': station(name='Golden Airport', coordinate=(51.3, -116.98333), altitude=785, country='Canada'),
-    'CYGH': station(name='Fort Good Hope Airport', coordinate=(66.26667, -128.61667), altitude=60, country='Canada'),
-    'CYGK': station(name='Kingston, Ont.', coordinate=(44.21667, -76.6), altitude=93, country='Canada'),
-    'CYGL': station(name='La Grande Riviere, Que', coordinate=(53.63333, -77.7), altitude=195, country='Canada'),
-    'CYGM': station(name='Gimli Industrial, Man', coordinate=(50.61667, -97.03333), altitude=230, country='Canada'),
-    'CYGP': station(name='Gaspe, Que.', coordinate=(48.76667, -64.48333), altitude=33, country='Canada'),
-    'CYGQ': station(name='Geraldton, Ont.', coordinate=(49.78333, -86.93333), altitude=349, country='Canada'),
-    'CYGR': station(name='Iles De La Madeleineque.', coordinate=(47.41667, -61.78333), altitude=10, country='Canada'),
-    'CYGT': station(name='Igloolik Airport', coordinate=(69.36667, -81.81667), altitude=51, country='Canada'),
-    'CYGV': station(name='Havre St Pierre', coordinate=(50.28333, -63.61667), altitude=33, country='Canada'),
-    'CYGW': station(name='Kuujjuarapik, Que.', coordinate=(55.28333, -77.76667), altitude=21, country='Canada'),
-    'CYGX': station(name='Gillam, Man.', coordinate=(56.35, -94.7), altitude=145, country='Canada'),
-    'CYHA': station(name='Quaqtaq Airport', coordinate=(61.05, -69.63333), altitude=30, country='Canada'),
-    'CYHB': station(name='Hudson Bay, Sask.', coordinate=(52.81667, -102.31667), altitude=357, country='Canada'),
-    'CYHD': station(name='Dryden Airport', coordinate=(49.83333, -92.75), altitude=413, country='Canada'),
-    'CYHE': station(name='Hope, B. C.', coordinate=(49.36667, -121.48333), altitude=39, country='Canada'),
-    'CYHH': station(name='Nemiscau Airport Supplementary Aviation Weather Reporting Station', coordinate=(51.7, -76.11667), altitude=244, country='Canada'),
-    'CYHI': station(name='Holman Island Airport', coordinate=(70.76667, -117.8), altitude=36, country='Canada'),
-    'CYHK': station(name='Gjoa Haven Airport', coordinate=(68.63333, -95.85), altitude=46, country='Canada'),
-    'CYHM': station(name='Hamilton Airport', coordinate=(43.16667, -79.93333), altitude=237, country='Canada'),
-    'CYHU': station(name='Saint Hubert Airport', coordinate=(45.51667, -73.41667), altitude=27, country='Canada'),
-    'CYHY': station(name='Hay River, N. W. T.', coordinate=(60.83333, -115.78333), altitude=164, country='Canada'),
-    'CYHZ': station(name='Halifax International Airport', coordinate=(44.88333, -63.5), altitude=145, country='Canada'),
-    'CYID': station(name='Digby Airport Aviation Weather Reporting Station', coordinate=(44.55, -65.78333), altitude=152, country='Canada'),
-    'CYIK': station(name='Ivujivik Airport Supplementary Aviation Weather Reporting Station', coordinate=(62.41667, -77.95), altitude=42, country='Canada'),
-    'CYIO': station(name='Pond Inlet, N. W. T.', coordinate=(72.7, -77.96667), altitude=59, country='Canada'),
-    'CYIV': station(name='Island Lake, Man.', coordinate=(53.85, -94.65), altitude=237, country='Canada'),
-    'CYJF': station(name='Fort Liard Airport', coordinate=(60.23333, -123.48333), altitude=215, country='Canada'),
-    'CYJT': station(name='Stephenville, Nfld.', coordinate=(48.53333, -58.55), altitude=8, country='Canada'),
-    'CYKA': station(name='Kamloops, B. C.', coordinate=(50.7, -120.45), altitude=345, country='Canada'),
-    'CYKD': station(name='Aklavik Airport', coordinate=(68.21667, -135.0), altitude=7, country='Canada'),
-    'CYKF': station(name='Waterloo Well', coordinate=(43.46667, -80.38333), altitude=317, country='Canada'),
-    'CYKG': station(name='Kangiqsujuaq Supplementary Aviation Weather Reporting Station', coordinate=(61.58333, -71.93333), altitude=151, country='Canada'),
-    'CYKJ': station(name='Key Lake', coordinate=(57.25, -105.61667), altitude=509, country='Canada'),
-    'CYKL': station(name='Schefferville, Que.', coordinate=(54.8, -66.8), altitude=521, country='Canada'),
-    'CYKO': station(name='Akulivik Airport', coordinate=(60.81667, -78.15), altitude=20, country='Canada'),
-    'CYKQ': station(name='Waskaganish Airport', coordinate=(51.48333, -78.75), altitude=23, country='Canada'),
-    'CYKY': station(name='Kindersley, Sask.', coordinate=(51.51667, -109.16667), altitude=694, country='Canada'),
-    'CYKZ': station(name='Toronto Buttonville', coordinate=(43.86667, -79.36667), altitude=198, country='Canada'),
-    'CYLA': station(name='Aupaluk, Que.', coordinate=(59.29667, -69.59972), altitude=35, country='Canada'),
-    'CYLC': station(name='Kimmirut A Nwt', coordinate=(62.85, -69.88333), altitude=53, country='Canada'),
-    'CYLD': station(name='Chapleau, Ont.', coordinate=(47.81667, -83.35), altitude=447, country='Canada'),
-    'CYLJ': station(name='Meadow Lake, Sask.', coordinate=(54.13333, -108.51667), altitude=480, country='Canada'),
-    'CYLK': station(name='Lutsel KE, N. W. T.', coordinate=(62.41667, -110.66667), altitude=179, country='Canada'),
-    'CYLL': station(name='Lloydminister, Alta.', coordinate=(53.31667, -110.06667), altitude=665, country='Canada'),
-    'CYLT': station(name='Alert Airport', coordinate=(82.51667, -62.28333), altitude=31, country='Canada'),
-    'CYLU': station(name='Kangiksualujjuaq A', coordinate=(58.71667, -65.98333), altitude=60, country='Canada'),
-    'CYLW': station(name='Kelowna Airport', coordinate=(49.96667, -119.38333), altitude=430, country='Canada'),
-    'CYMA': station(name='Mayo Airport', coordinate=(63.61667, -135.86667), altitude=504, country='Canada'),
-    'CYMD': station(name='Mould Bay, N. W. T.', coordinate=(76.23333, -119.33333), altitude=15, country='Canada'),
-    'CYMH': station(name="Mary's Harbour", coordinate=(52.3, -55.85), altitude=11, country='Canada'),
-    'CYMJ': station(name='Moose Jaw, Sask.', coordinate=(50.33333, -105.55), altitude=577, country='Canada'),
-    'CYML': station(name='Charlevoix Airport', coordinate=(47.6, -70.23333), altitude=298, country='Canada'),
-    'CYMM': station(name='Fort Mcmurray, Alta.', coordinate=(56.65, -111.21667), altitude=369, country='Canada'),
-    'CYMO': station(name='Moosonee, Ont.', coordinate=(51.26667, -80.65), altitude=10, country='Canada'),
-    'CYMT': station(name='Chibougamau-Chapais, Que', coordinate=(49.76667, -74.53333), altitude=388, country='Canada'),
-    'CYMU': station(name='Umiujaq', coordinate=(56.53333, -76.51667), altitude=71, country='Canada'),
-    'CYMX': station(name='Montreal / Mirabel', coordinate=(45.68333, -74.03333), altitude=82, country='Canada'),
-    'CYNA': station(name='Natashquan, Que.', coordinate=(50.18333, -61.81667), altitude=7, country='Canada'),
-    'CYNC': station(name='Aeroport de Wemindji, Que.', coordinate=(53.01083, -78.83028), altitude=15, country='Canada'),
-    'CYND': station(name='Gatineau Airport', coordinate=(45.51667, -75.56667), altitude=64, country='Canada'),
-    'CYNE': station(name='Norway House, Man.', coordinate=(53.96667, -97.83333), altitude=223, country='Canada'),
-    'CYNM': station(name='Matagami, Que.', coordinate=(49.76667, -77.81667), altitude=281, country='Canada'),
-    'CYOA': station(name='Ekati, N. W. T.', coordinate=(64.7, -110.61667), altitude=469, country='Canada'),
-    'CYOC': station(name='Old Crow Airport', coordinate=(67.56667, -139.81667), altitude=251, country='Canada'),
-    'CYOD': station(name='Cold Lake, Alta.', coordinate=(54.41667, -110.28333), altitude=541, country='Canada'),
-    'CYOJ': station(name='High Level, Alta', coordinate=(58.61667, -117.16667), altitude=338, country='Canada'),
-    'CYOW': station(name="Ottawa Int'L. Ont.", coordinate=(45.31667, -75.66667), altitude=116, country='Canada'),
-    'CYOY': station(name='Valcartier Airport', coordinate=(46.9, -71.5), altitude=168, country='Canada'),
-    'CYPA': station(name='Prince Albert, Sask.', coordinate=(53.21667, -105.68333), altitude=428, country='Canada'),
-    'CYPC': station(name='Paulatuk Airport', coordinate=(69.35, -124.03333), altitude=6, country='Canada'),
-    'CYPD': station(name='Port Hawkesbury', coordinate=(45.66667, -61.38333), altitude=114, country='Canada'),
-    'CYPE': station(name='Peace River, Alta.', coordinate=(56.23333, -117.43333), altitude=571, country='Canada'),
-    'CYPG': station(name='Portage Southport A', coordinate=(49.9, -98.26667), altitude=269, country='Canada'),
-    'CYPH': station(name='Inukjuak Airport Supplementary Aviation Weather Reporting Station', coordinate=(58.46667, -78.08333), altitude=25, country='Canada'),
-    'CYPL': station(name='Pickle Lake Man', coordinate=(51.45, -90.2), altitude=386, country='Canada'),
-    'CYPN': station(name='Port Menier Man', coordinate=(49.83333, -64.28333), altitude=51, country='Canada'),
-    'CYPQ': station(name='Peterborough Airport', coordinate=(44.23333, -78.36667), altitude=191, country='Canada'),
-    'CYPR': station(name='Prince Rupert, B. C.', coordinate=(54.3, -130.43333), altitude=34, country='Canada'),
-    'CYPW': station(name='Powell River Airport', coordinate=(49.83333, -124.5), altitude=130, country='Canada'),
-    'CYPX': station(name='Povungnituq', coordinate=(60.05, -77.28333), altitude=23, country='Canada'),
-    'CYPY': station(name='Fort Chipewyan, Alta.', coordinate=(58.76667, -111.11667), altitude=232, country='Canada'),
-    'CYPZ': station(name='Burns Lake', coordinate=(54.38333, -125.95), altitude=713, country='Canada'),
-    'CYQA': station(name='Muskoka, Ont.', coordinate=(44.96667, -79.3), altitude=280, country='Canada'),
-    'CYQB': station(name='Quebec, Que', coordinate=(46.8, -71.38333), altitude=70, country='Canada'),
-    'CYQD': station(name='The Pas, Man.', coordinate=(53.96667, -101.1), altitude=271, country='Canada'),
-    'CYQF': station(name='Red Deer, Alta.', coordinate=(52.18333, -113.9), altitude=905, country='Canada'),
-    'CYQG': station(name='Windsor, Ont.', coordinate=(42.26667, -82.96667), altitude=190, country='Canada'),
-    'CYQH': station(name='Watson Lake, Y. T.', coordinate=(60.11667, -128.81667), altitude=690, country='Canada'),
-    'CYQI': station(name='Yarmouth, N. S.', coordinate=(43.83333, -66.08333), altitude=43, country='Canada'),
-    'CYQK': station(name='Kenora, Ont.', coordinate=(49.78333, -94.36667), altitude=407, country='Canada'),
-    'CYQL': station(name='Lethbridge, Alta.', coordinate=(49.63333, -112.8), altitude=929, country='Canada'),
-    'CYQM': station(name='Moncton, N. B.', coordinate=(46.11667, -64.68333), altitude=71, country='Canada'),
-    'CYQQ': station(name='Comox, B. C.', coordinate=(49.71667, -124.9), altitude=24, country='Canada'),
-    'CYQR': station(name='Regina, Sask.', coordinate=(50.43333, -104.66667), altitude=577, country='Canada'),
-    'CYQT': station(name='Thunder Bay, Ont.', coordinate=(48.36667, -89.31667), altitude=199, country='Canada'),
-    'CYQU': station(name='Grande Prairie, Alta.', coordinate=(55.18333, -118.88333), altitude=666, country='Canada'),
-    'CYQV': station(name='Yorkton, Sask.', coordinate=(51.26667, -102.46667), altitude=498, country='Canada'),
-    'CYQW': station(name='North Battleford, Sask.', coordinate=(52.76667, -108.25), altitude=548, country='Canada'),
-    'CYQX': station(name='Gander Int. Airport, Nfld.', coordinate=(48.95, -54.56667), altitude=151, country='Canada'),
-    'CYQY': station(name='Sydney, N. S.', coordinate=(46.16667, -60.05), altitude=56, country='Canada'),
-    'CYQZ': station(name='Quesnel Airport', coordinate=(53.03333, -122.51667), altitude=545, country='Canada'),
-    'CYRB': station(name='Resolute, N. W. T.', coordinate=(74.71667, -94.98333), altitude=67, country='Canada'),
-    'CYRJ': station(name='Roberval, Que.', coordinate=(48.51667, -72.26667), altitude=179, country='Canada'),
-    'CYRL': station(name='Red Lake, Ont.', coordinate=(51.06667, -93.8), altitude=375, country='Canada'),
-    'CYRM': station(name='Rocky Mountain House, Alta', coordinate=(52.43333, -114.91667), altitude=988, country='Canada'),
-    'CYRT': station(name='Rankin Inlet, N. W. T.', coordinate=(62.81667, -92.11667), altitude=31, country='Canada'),
-    'CYRV': station(name='Revelstoke, B. C.', coordinate=(50.96667, -118.18333), altitude=443, country='Canada'),
-    'CYSA': station(name='Sable Island Airport', coordinate=(43.93333, -60.0), altitude=4, country='Canada'),
-    'CYSB': station(name='Sudbury, Ont.', coordinate=(46.61667, -80.8), altitude=348, country='Canada'),
-    'CYSC': station(name='Sherbrooke, Que.', coordinate=(45.4, -71.88333), altitude=170, country='Canada'),
-    'CYSD': station(name='Suffield Airport', coordinate=(50.26667, -111.18333), altitude=770, country='Canada'),
-    'CYSF': station(name='Stony Rapids Airport', coordinate=(59.25, -105.83333), altitude=250, country='Canada'),
-    'CYSJ': station(name='Saint John, N. B.', coordinate=(45.33333, -65.88333), altitude=103, country='Canada'),
-    'CYSK': station(name='Sanikiluaq Airport', coordinate=(56.53333, -79.25), altitude=32, country='Canada'),
-    'CYSL': station(name='Saint Leonard Airport', coordinate=(47.15, -67.83333), altitude=241, country='Canada'),
-    'CYSM': station(name='Fort Smith, N. W. T.', coordinate=(60.01667, -111.95), altitude=203, country='Canada'),
-    'CYSN': station(name='Saint Catharines Airport', coordinate=(43.2, -79.16667), altitude=98, country='Canada'),
-    'CYSR': station(name='Nanisivik Airport', coordinate=(72.98333, -84.63333), altitude=649, country='Canada'),
-    'CYSU': station(name='Summerside Can-Mil', coordinate=(46.43333, -63.83333), altitude=24, country='Canada'),
-    'CYSY': station(name='Sachs Harbour Airport', coordinate=(72.0, -125.28333), altitude=86, country='Canada'),
-    'CYTE': station(name='Cape Dorset, N. W. T.', coordinate=(64.21667, -76.53333), altitude=51, country='Canada'),
-    'CYTH': station(name='Thompson Weather Office, Man', coordinate=(55.8, -97.85), altitude=204, country='Canada'),
-    'CYTJ': station(name='Terrace Bay Supplementary Aviation Weather Reporting Station', coordinate=(48.81667, -87.1), altitude=287, country='Canada'),
-    'CYTL': station(name='Big Trout Lake', coordinate=(53.83333, -89.86667), altitude=224, country='Canada'),
-    'CYTN': station(name='Trenton Municipal A, N. S.', coordinate=(45.61139, -62.62194), altitude=97, country='Canada'),
-    'CYTQ': station(name='Tasiujaq A', coordinate=(58.66667, -69.95), altitude=31, country='Canada'),
-    'CYTR': station(name='Trenton, Ont.', coordinate=(44.11667, -77.53333), altitude=85, country='Canada'),
-    'CYTS': station(name='Timmins, Ont.', coordinate=(48.56667, -81.36667), altitude=295, country='Canada'),
-    'CYTZ': station(name='Toronto Island Airport Automated Reporting Station', coordinate=(43.63333, -79.4), altitude=77, country='Canada'),
-    'CYUA': station(name='Shingle Point, Y. T.', coordinate=(68.95, -137.21667), altitude=56, country='Canada'),
-    'CYUB': station(name='Tuktoyaktuk', coordinate=(69.45, -133.01667), altitude=5, country='Canada'),
-    'CYUI': station(name='Cape Young Airport', coordinate=(68.93333, -116.91667), altitude=16, country='Canada'),
-    'CYUJ': station(name='Lady Franklin Point, N. W. T.', coordinate=(68.5, -113.21667), altitude=21, country='Canada'),
-    'CYUK': station(name='Byron Bay Airport', coordinate=(68.75, -109.06667), altitude=92, country='Canada'),
-    'CYUL': station(name='Montreal / Pierre Elliot Trudeau International Airport, Que', coordinate=(45.46667, -73.75), altitude=31, country='Canada'),
-    'CYUQ': station(name='Jenny Lind Island Airport', coordinate=(68.65, -101.73333), altitude=18, country='Canada'),
-    'CYUS': station(name='Shepherd Bay, N. W. T.', coordinate=(68.81667, -93.43333), altitude=51, country='Canada'),
-    'CYUT': station(name='Repulse Bay Airport', coordinate=(66.53333, -86.25), altitude=24, country='Canada'),
-    'CYUV': station(name='Longstaff Blf Airport', coordinate=(68.93333, -75.28333), altitude=14, country='Canada'),
-    'CYUX': station(name='Hall Beach, N. W. T.', coordinate=(68.78333, -81.25), altitude=8, country='Canada'),
-    'CYUY': station(name='Rouyn Airport', coordinate=(48.2, -78.83333), altitude=301, country='Canada'),
-    'CYVC': station(name='La Ronge, Sask', coordinate=(55.15, -105.26667), altitude=375, country='Canada'),
-    'CYVM': station(name='Broughton Island Airport', coordinate=(67.55, -64.03333), altitude=6, country='Canada'),
-    'CYVO': station(name="Val D'Or, Que.", coordinate=(48.06667, -77.78333), altitude=337, country='Canada'),
-    'CYVP': station(name='Kuujjuaq, Que.', coordinate=(58.1, -68.41667), altitude=37, country='Canada'),
-    'CYVQ': station(name='Norman Wells, N. W. T.', coordinate=(65.28333, -126.8), altitude=67, country='Canada'),
-    'CYVR': station(name='Vancouver International Air-Port, B. C.', coordinate=(49.18333, -123.16667), altitude=3, country='Canada'),
-    'CYVT': station(name='Buffalo Narrows Man', coordinate=(55.83333, -108.45), altitude=434, country='Canada'),
-    'CYVV': station(name='Wiarton, Ont.', coordinate=(44.75, -81.1), altitude=222, country='Canada'),
-    'CYWA': station(name='Petawawa, Ont.', coordinate=(45.95, -77.31667), altitude=130, country='Canada'),
-    'CYWG': station(name='Winnipeg Int. Airportman.', coordinate=(49.9, -97.23333), altitude=239, country='Canada'),
-    'CYWH': station(name='Victoria Harbour', coordinate=(48.41667, -123.33333), altitude=5, country='Canada'),
-    'CYWJ': station(name='Fort Franklin Airport', coordinate=(65.2, -123.43333), altitude=176, country='Canada'),
-    'CYWK': station(name='Wabush Lake, Nfld.', coordinate=(52.93333, -66.86667), altitude=551, country='Canada'),
-    'CYWL': station(name='Williams Lake, B. C.', coordinate=(52.18333, -122.05), altitude=940, country='Canada'),
-    'CYWO': station(name='Lupin Airport Supplementary Aviation Weather Reporting Station', coordinate=(65.76667, -111.25), altitude=494, country='Canada'),
-    'CYWV': station(name='Wainwright Airport', coordinate=(52.8, -110.88333), altitude=662, country='Canada'),
-    'CYWY': station(name='Wrigley Airport', coordinate=(63.21667, -123.43333), altitude=150, country='Canada'),
-    'CYXC': station(name='Cranbrook, B. C.', coordinate=(49.61667, -115.78333), altitude=939, country='Canada'),
-    'CYXD': station(name='Edmonton Municipal Alta.', coordinate=(53.56667, -113.51667), altitude=671, country='Canada'),
-    'CYXE': station(name='Saskatoon, Sask.', coordinate=(52.16667, -106.68333), altitude=501, country='Canada'),
-    'CYXH': station(name='Medicine Hat, Alta.', coordinate=(50.01667, -110.71667), altitude=717, country='Canada'),
-    'CYXJ': station(name='Fort St John, B. C.', coordinate=(56.23333, -120.73333), altitude=695, country='Canada'),
-    'CYXL': station(name='Sioux Lookout, Ont.', coordinate=(50.11667, -91.9), altitude=389, country='Canada'),
-    'CYXN': station(name='Whale Cove Airport', coordinate=(62.23333, -92.6), altitude=20, country='Canada'),
-    'CYXP': station(name='Pangnirtung Airport', coordinate=(66.15, -65.71667), altitude=23, country='Canada'),
-    'CYXQ': station(name='Beaver Creek Airport', coordinate=(62.41667, -140.86667), altitude=649, country='Canada'),
-    'CYXR': station(name='Earlton, Ont.', coordinate=(47.7, -79.85), altitude=243, country='Canada'),
-    'CYXS': station(name='Prince George, B. C.', coordinate=(53.88333, -122.68333), altitude=691, country='Canada'),
-    'CYXT': station(name='Terrace, B. C.', coordinate=(54.46667, -128.58333), altitude=217, country='Canada'),
-    'CYXU': station(name='London, Ont.', coordinate=(43.03333, -81.15), altitude=278, country='Canada'),
-    'CYXX': station(name='Abbotsford, B. C.', coordinate=(49.03333, -122.36667), altitude=54, country='Canada'),
-    'CYXY': station(name='Whitehorse, Y. T.', coordinate=(60.71667, -135.06667), altitude=703, country='Canada'),
-    'CYXZ': station(name='Wawa, Ont.', coordinate=(47.96667, -84.78333), altitude=287, country='Canada'),
-    'CYYB': station(name='North Bay, Ont.', coordinate=(46.35, -79.43333), altitude=358, country='Canada'),
-    'CYYC': station(name='Calgary International, Alta.', coordinate=(51.11667, -114.01667), altitude=1077, country='Canada'),
-    'CYYD': station(name='Smithers, B. C.', coordinate=(54.81667, -127.18333), altitude=523, country='Canada'),
-    'CYYE': station(name='Fort Nelson, B. C.', coordinate=(58.83333, -122.58333), altitude=382, country='Canada'),
-    'CYYF': station(name='Penticton, B. C.', coordinate=(49.46667, -119.6), altitude=344, country='Canada'),
-    'CYYG': station(name='Charlottetown, P. E. I.', coordinate=(46.28333, -63.13333), altitude=48, country='Canada'),
-    'CYYH': station(name='Spence Bay Airport', coordinate=(69.55, -93.58333), altitude=28, country='Canada'),
-    'CYYJ': station(name='Victoria Int. Airport, B. C.', coordinate=(48.65, -123.43333), altitude=20, country='Canada'),
-    'CYYL': station(name='Lynn Lake, Man.', coordinate=(56.86667, -101.08333), altitude=357, country='Canada'),
-    'CYYN': station(name='Swift Current, Sask.', coordinate=(50.28333, -107.68333), altitude=818, country='Canada'),
-    'CYYQ': station(name='Churchill, Man.', coordinate=(58.73333, -94.06667), altitude=28, country='Canada'),
-    'CYYR': station(name='Goose, Nfld.', coordinate=(53.31667, -60.41667), altitude=46, country='Canada'),
-    'CYYT': station(name="St. John's, Nfld", coordinate=(47.61667, -52.73333), altitude=134, country='Canada'),
-    'CYYU': station(name='Kapuskasing, Ont.', coordinate=(49.41667, -82.46667), altitude=227, country='Canada'),
-    'CYYW': station(name='Armstrong, Ont.', coordinate=(50.3, -89.03333), altitude=351, country='Canada'),
-    'CYYY': station(name='Mont Joli, Que.', coordinate=(48.6, -68.21667), altitude=48, country='Canada'),
-    'CYYZ': station(name="Toronto Pearson Int'L. Ont.", coordinate=(43.66667, -79.63333), altitude=173, country='Canada'),
-    'CYZE': station(name='Gore Bay, Ont.', coordinate=(45.88333, -82.56667), altitude=193, country='Canada'),
-    'CYZF': station(name='Yellowknife, N. W. T.', coordinate=(62.46667, -114.45), altitude=205, country='Canada'),
-    'CYZG': station(name='Salliut Airport Supplementary Aviation Weather Reporting Station', coordinate=(62.18333, -75.66667), altitude=226, country='Canada'),
-    'CYZH': station(name='Slave Lake, Alta', coordinate=(55.3, -114.78333), altitude=581, country='Canada'),
-    'CYZP': station(name='Sandspit, B. C.', coordinate=(53.25, -131.81667), altitude=6, country='Canada'),
-    'CYZR': station(name='Sarnia Airport', coordinate=(43.0, -82.31667), altitude=181, country='Canada'),
-    'CYZS': station(name='Coral Harbour, N. W. T.', coordinate=(64.2, -83.36667), altitude=64, country='Canada'),
-    'CYZT': station(name='Port Hardy, B. C.', coordinate=(50.68333, -127.36667), altitude=22, country='Canada'),
-    'CYZU': station(name='Whitecourt, Alta.', coordinate=(54.15, -115.78333), altitude=783, country='Canada'),
-    'CYZV': station(name='Sept-Iles, Que.', coordinate=(50.21667, -66.26667), altitude=55, country='Canada'),
-    'CYZW': station(name='Teslin, Y. T.', coordinate=(60.16667, -132.73333), altitude=711, country='Canada'),
-    'CYZX': station(name='Greenwood, N. S.', coordinate=(44.98333, -64.91667), altitude=28, country='Canada'),
-    'CYZY': station(name='Mackenzie, B. C.', coordinate=(55.3, -123.13333), altitude=695, country='Canada'),
-    'CZAG': station(name='La Grande Iv Remote Environment Automatic Data Acquisition Concept', coordinate=(53.75, -73.68333), altitude=307, country='Canada'),
-    'CZBF': station(name='Bathurst Airport Aviation Weather Reporting Station', coordinate=(47.63333, -65.75), altitude=59, country='Canada'),
-    'CZCP': station(name='Cape Parry, N. W. T.', coordinate=(70.1, -124.71667), altitude=87, country='Canada'),
-    'CZDI': station(name='Churchill Falls', coordinate=(53.56667, -64.1), altitude=440, country='Canada'),
-    'CZEM': station(name='Eastmain River Airport', coordinate=(52.23333, -78.51667), altitude=7, country='Canada'),
-    'CZFA': station(name='Faro Airport', coordinate=(62.2, -133.36667), altitude=717, country='Canada'),
-    'CZFM': station(name='Fort Mcpherson Airport', coordinate=(67.4, -134.85), altitude=43, country='Canada'),
-    'CZFN': station(name='Fort Norman Airport', coordinate=(64.91667, -125.56667), altitude=98, country='Canada'),
-    'CZNB': station(name='North Bay Remote Environment Automatic Data Acquisition Concept', coordinate=(46.36667, -79.41667), altitude=364, country='Canada'),
-    'CZOC': station(name='Old Crow Automatic Weather Reporting System', coordinate=(67.56667, -139.83333), altitude=251, country='Canada'),
-    'CZPC': station(name='Pincher Creek Airport', coordinate=(49.51667, -113.98333), altitude=1190, country='Canada'),
-    'CZPK': station(name='Paulatuk Automated Reporting Station', coordinate=(69.35, -124.05), altitude=6, country='Canada'),
-    'CZST': station(name='Stewart Airport', coordinate=(55.93333, -129.98333), altitude=7, country='Canada'),
-    'CZUB': station(name='Tuktoyaktuk Automated Reporting Station', coordinate=(69.43333, -133.03333), altitude=6, country='Canada'),
-    'CZUE': station(name='Cape Parry, N. W. T.', coordinate=(70.16667, -124.7), altitude=17, country='Canada'),
-    'CZUM': station(name='Churchill Falls, Nfld.', coordinate=(53.55, -64.1), altitude=440, country='Canada'),
-    'CZVL': station(name='Edmonton / Villeneuve', coordinate=(53.66667, -113.86667), altitude=686, country='Canada'),
-    'CZWN': station(name='Wainwright Automatic Weather Reporting System', coordinate=(52.81667, -111.08333), altitude=684, country='Canada'),
-    'DAAD': station(name='Bou-Saada', coordinate=(35.33333, 4.2), altitude=461, country='Algeria'),
-    'DAAE': station(name='Bejaia', coordinate=(36.71667, 5.06667), altitude=2, country='Algeria'),
-    'DAAF': station(name='Aoulef', coordinate=(26.96667, 1.08333), altitude=309, country='Algeria'),
-    'DAAG': station(name='Dar-El-Beida', coordinate=(36.71667, 3.25), altitude=25, country='Algeria'),
-    'DAAJ': station(name='Djanet', coordinate=(24.55, 9.46667), altitude=1054, country='Algeria'),
-    'DAAP': station(name='Illizi', coordinate=(26.5, 8.41667), altitude=558, country='Algeria'),
-    'DAAS': station(name='Setif', coordinate=(36.18333, 5.41667), altitude=1038, country='Algeria'),
-    'DAAT': station(name='Tamanrasset / Aguenna', coordinate=(22.81667, 5.46667), altitude=1377, country='Algeria'),
-    'DAAV': station(name='Jijel Achouat', coordinate=(36.88333, 5.81667), altitude=2, country='Algeria'),
-    'DAAY': station(name='Mecheria', coordinate=(34.93333, -0.43333), altitude=1149, country='Algeria'),
-    'DABB': station(name='Annaba', coordinate=(36.83333, 7.81667), altitude=4, country='Algeria'),
-    'DABC': station(name='Constantine', coordinate=(36.28333, 6.61667), altitude=694, country='Algeria'),
-    'DABP': station(name='Skikda', coordinate=(36.93333, 6.95), altitude=7, country='Algeria'),
-    'DABS': station(name='Tebessa', coordinate=(35.48333, 8.13333), altitude=813, country='Algeria'),
-    'DABT': station(name='Batna', coordinate=(35.55, 6.18333), altitude=1052, country='Algeria'),
-    'DAFH': station(name="Tilrempt/Hassi R'mel", coordinate=(32.93, 3.31222), altitude=774, country='Algeria'),
-    'DAFI': station(name='Djelfa', coordinate=(34.68333, 3.25), altitude=1144, country='Algeria'),
-    'DAOB': station(name='Tiaret', coordinate=(35.25, 1.43333), altitude=1127, country='Algeria'),
-    'DAOF': station(name='Tindouf', coordinate=(27.66667, -8.13333), altitude=431, country='Algeria'),
-    'DAOI': station(name='Chlef', coordinate=(36.21667, 1.33333), altitude=143, country='Algeria'),
-    'DAOL': station(name='Oran/Tafaraoui', coordinate=(35.5425, -0.53222), altitude=112, country='Algeria'),
-    'DAON': station(name='Tlemcen Zenata', coordinate=(35.01667, -1.46667), altitude=247, country='Algeria'),
-    'DAOO': station(name='Oran / Es Senia', coordinate=(35.63333, -0.6), altitude=90, country='Algeria'),
-    'DAOR': station(name='Bechar', coordinate=(31.61667, -2.23333), altitude=773, country='Algeria'),
-    'DAOV': station(name='Mascara-Ghriss', coordinate=(35.2, 0.13333), altitude=514, country='Algeria'),
-    'DATG': station(name='In Guezzam', coordinate=(19.56667, 5.75), altitude=399, country='Algeria'),
-    'DATM': station(name='Bordj Mokhtar', coordinate=(21.375, 0.92389), altitude=396, country='Algeria'),
-    'DAUA': station(name='Adrar', coordinate=(27.88333, -0.28333), altitude=263, country='Algeria'),
-    'DAUB': station(name='Biskra', coordinate=(34.8, 5.73333), altitude=87, country='Algeria'),
-    'DAUE': station(name='El Golea', coordinate=(30.56667, 2.86667), altitude=397, country='Algeria'),
-    'DAUG': station(name='Ghardaia', coordinate=(32.38333, 3.81667), altitude=450, country='Algeria'),
-    'DAUH': station(name='Hassi-Messaoud', coordinate=(31.66667, 6.15), altitude=142, country='Algeria'),
-    'DAUI': station(name='In Salah North', coordinate=(27.25, 2.51667), altitude=269, country='Algeria'),
-    'DAUK': station(name='Touggourt', coordinate=(33.11667, 6.13333), altitude=85, country='Algeria'),
-    'DAUL': station(name='Laghouat', coordinate=(33.76667, 2.93333), altitude=765, country='Algeria'),
-    'DAUO': station(name='El Oued', coordinate=(33.5, 6.11667), altitude=63, country='Algeria'),
-    'DAUT': station(name='Timimoun', coordinate=(29.25, 0.28333), altitude=312, country='Algeria'),
-    'DAUU': station(name='Ouargla', coordinate=(31.91667, 5.4), altitude=141, country='Algeria'),
-    'DAUZ': station(name='In Amenas', coordinate=(28.05, 9.63333), altitude=562, country='Algeria'),
-    'DBBB': station(name='Cotonou', coordinate=(6.35, 2.38333), altitude=5, country='Benin'),
-    'DBBC': station(name='Bohicon', coordinate=(7.16667, 2.06667), altitude=166, country='Benin'),
-    'DBBK': station(name='Kandi', coordinate=(11.13333, 2.93333), altitude=290, country='Benin'),
-    'DBBN': station(name='Natitingou', coordinate=(10.31667, 1.38333), altitude=460, country='Benin'),
-    'DBBP': station(name='Parakou', coordinate=(9.35, 2.61667), altitude=392, country='Benin'),
-    'DBBS': station(name='Save', coordinate=(8.03333, 2.46667), altitude=199, country='Benin'),
-    'DFCC': station(name='Ouahigouya', coordinate=(13.56667, -2.41667), altitude=337, country='Burkina Faso'),
-    'DFCO': station(name='Boromo', coordinate=(11.75, -2.93333), altitude=270, country='Burkina Faso'),
-    'DFCP': station(name='Po', coordinate=(11.15, -1.15), altitude=320, country='Burkina Faso'),
-    'DFEE': station(name='Dori', coordinate=(14.03333, -0.03333), altitude=276, country='Burkina Faso'),
-    'DFEF': station(name="Fada N'Gourma", coordinate=(12.03333, 0.36667), altitude=308, country='Burkina Faso'),
-    'DFFD': station(name='Ouagadougou', coordinate=(12.35, -1.51667), altitude=316, country='Burkina Faso'),
-    'DFOD': station(name='Dedougou', coordinate=(12.46667, -3.48333), altitude=300, country='Burkina Faso'),
-    'DFOG': station(name='Gaoua', coordinate=(10.33333, -3.18333), altitude=333, country='Burkina Faso'),
-    'DFOO': station(name='Bobo-Dioulasso', coordinate=(11.16667, -4.31667), altitude=460, country='Burkina Faso'),
-    'DGAA': station(name='Accra', coordinate=(5.6, -0.16667), altitude=68, country='Ghana'),
-    'DGAD': station(name='Ada', coordinate=(5.78333, 0.63333), altitude=5, country='Ghana'),
-    'DGAH': station(name='Ho', coordinate=(6.6, 0.46667), altitude=158, country='Ghana'),
-    'DGAK': station(name='Akuse', coordinate=(6.1, 0.11667), altitude=17, country='Ghana'),
-    'DGAS': station(name='Saltpond', coordinate=(5.2, -1.06667), altitude=44, country='Ghana'),
-    'DGAT': station(name='Tema', coordinate=(5.61667, 0.0), altitude=14, country='Ghana'),
-    'DGKA': station(name='Akim Oda', coordinate=(5.93333, -0.98333), altitude=139, country='Ghana'),
-    'DGKK': station(name='Koforidua', coordinate=(6.08333, -0.25), altitude=166, country='Ghana'),
-    'DGLB': station(name='Bole', coordinate=(9.03333, -2.48333), altitude=299, country='Ghana'),
-    'DGLE': station(name='Tamale', coordinate=(9.5, -0.85), altitude=168, country='Ghana'),
-    'DGLN': station(name='Navrongo', coordinate=(10.9, -1.1), altitude=201, country='Ghana'),
-    'DGLW': station(name='Wa', coordinate=(10.05, -2.5), altitude=323, country='Ghana'),
-    'DGLY': station(name='Yendi', coordinate=(9.45, -0.01667), altitude=195, country='Ghana'),
-    'DGSB': station(name='Sefwi Bekwai', coordinate=(6.2, -2.33333), altitude=171, country='Ghana'),
-    'DGSI': station(name='Kumasi', coordinate=(6.71667, -1.6), altitude=287, country='Ghana'),
-    'DGSN': station(name='Sunyani', coordinate=(7.33333, -2.33333), altitude=309, country='Ghana'),
-    'DGSW': station(name='Wenchi', coordinate=(7.75, -2.1), altitude=339, country='Ghana'),
-    'DGTK': station(name='Takoradi', coordinate=(4.88333, -1.76667), altitude=5, country='Ghana'),
-    'DGTX': station(name='Axim', coordinate=(4.86667, -2.23333), altitude=38, country='Ghana'),
-    'DIAD': station(name='Adiake', coordinate=(5.3, -3.3), altitude=33, country="Cote d'Ivoire"),
-    'DIAP': station(name='Abidjan', coordinate=(5.25, -3.93333), altitude=7, country="Cote d'Ivoire"),
-    'DIBK': station(name='Bouake', coordinate=(7.73333, -5.06667), altitude=376, country="Cote d'Ivoire"),
-    'DIBU': station(name='Bondoukou', coordinate=(8.05, -2.78333), altitude=369, country="Cote d'Ivoire"),
-    'DIDK': station(name='Dimbokro', coordinate=(6.65, -4.7), altitude=92, country="Cote d'Ivoire"),
-    'DIDL': station(name='Daloa', coordinate=(6.86667, -6.46667), altitude=276, country="Cote d'Ivoire"),
-    'DIGA': station(name='Gagnoa', coordinate=(6.13333, -5.95), altitude=205, country="Cote d'Ivoire"),
-    'DIKO': station(name='Korhogo', coordinate=(9.41667, -5.61667), altitude=381, country="Cote d'Ivoire"),
-    'DIMN': station(name='Man', coordinate=(7.38333, -7.51667), altitude=339, country="Cote d'Ivoire"),
-    'DIOD': station(name='Odienne', coordinate=(9.5, -7.56667), altitude=434, country="Cote d'Ivoire"),
-    'DISP': station(name='San Pedro', coordinate=(4.75, -6.65), altitude=30, country="Cote d'Ivoire"),
-    'DISS': station(name='Sassandra', coordinate=(4.95, -6.08333), altitude=62, country="Cote d'Ivoire"),
-    'DITB': station(name='Tabou', coordinate=(4.41667, -7.36667), altitude=21, country="Cote d'Ivoire"),
-    'DIYO': station(name='Yamoussoukro', coordinate=(6.9, -5.35), altitude=196, country="Cote d'Ivoire"),
-    'DNBI': station(name='Bida', coordinate=(9.1, 6.01667), altitude=137, country='Nigeria'),
-    'DNCA': station(name='Calabar', coordinate=(4.96667, 8.35), altitude=63, country='Nigeria'),
-    'DNEN': station(name='Enugu', coordinate=(6.46667, 7.55), altitude=137, country='Nigeria'),
-    'DNGU': station(name='Gusau', coordinate=(12.16667, 6.7), altitude=463, country='Nigeria'),
-    'DNIB': station(name='Ibadan', coordinate=(7.43333, 3.9), altitude=234, country='Nigeria'),
-    'DNIL': station(name='Ilorin', coordinate=(8.48333, 4.58333), altitude=308, country='Nigeria'),
-    'DNJO': station(name='Jos', coordinate=(9.86667, 8.9), altitude=1295, country='Nigeria'),
-    'DNKA': station(name='Kaduna', coordinate=(10.6, 7.45), altitude=645, country='Nigeria'),
-    'DNKN': station(name='Kano', coordinate=(12.05, 8.53333), altitude=476, country='Nigeria'),
-    'DNMA': station(name='Maiduguri', coordinate=(11.85, 13.08333), altitude=354, country='Nigeria'),
-    'DNMK': station(name='Makurdi', coordinate=(7.68333, 8.61667), altitude=113, country='Nigeria'),
-    'DNMM': station(name='Lagos / Ikeja', coordinate=(6.58333, 3.33333), altitude=40, country='Nigeria'),
-    'DNOS': station(name='Oshogbo', coordinate=(7.78333, 4.48333), altitude=305, country='Nigeria'),
-    'DNPO': station(name='Port Harcourt', coordinate=(4.85, 7.01667), altitude=18, country='Nigeria'),
-    'DNSO': station(name='Sokoto', coordinate=(13.01667, 5.25), altitude=351, country='Nigeria'),
-    'DNYO': station(name='Yola', coordinate=(9.23333, 12.46667), altitude=191, country='Nigeria'),
-    'DNZA': station(name='Zaria', coordinate=(11.13333, 7.68333), altitude=664, country='Nigeria'),
-    'DRRB': station(name="Birni-N'Konni", coordinate=(13.8, 5.25), altitude=272, country='Niger'),
-    'DRRG': station(name='Gaya', coordinate=(11.88333, 3.45), altitude=202, country='Niger'),
-    'DRRI': station(name='Bilma', coordinate=(18.68333, 12.91667), altitude=355, country='Niger'),
-    'DRRL': station(name='Tillabery', coordinate=(14.2, 1.45), altitude=209, country='Niger'),
-    'DRRM': station(name='Maradi', coordinate=(13.46667, 7.08333), altitude=372, country='Niger'),
-    'DRRN': station(name='Niamey-Aero', coordinate=(13.48333, 2.16667), altitude=223, country='Niger'),
-    'DRRT': station(name='Tahoua', coordinate=(14.9, 5.25), altitude=386, country='Niger'),
-    'DRZA': station(name='Agadez', coordinate=(16.96667, 7.98333), altitude=501, country='Niger'),
-    'DRZF': station(name='Diffa', coordinate=(13.41667, 12.78333), altitude=303, country='Niger'),
-    'DRZG': station(name='Goure', coordinate=(13.98333, 10.3), altitude=464, country='Niger'),
-    'DRZM': station(name='Maine-Soroa', coordinate=(13.23333, 11.98333), altitude=338, country='Niger'),
-    'DRZR': station(name='Zinder', coordinate=(13.78333, 8.98333), altitude=452, country='Niger'),
-    'DTKA': station(name='Tabarka', coordinate=(36.95, 8.75), altitude=20, country='Tunisia'),
-    'DTMB': station(name='Habib Bourguiba', coordinate=(35.76667, 10.75), altitude=2, country='Tunisia'),
-    'DTTA': station(name='Tunis-Carthage', coordinate=(36.83333, 10.23333), altitude=3, country='Tunisia'),
-    'DTTB': station(name='Bizerte', coordinate=(37.25, 9.8), altitude=5, country='Tunisia'),
-    'DTTD': station(name='Remada', coordinate=(32.31667, 10.4), altitude=300, country='Tunisia'),
-    'DTTF': station(name='Gafsa', coordinate=(34.41667, 8.81667), altitude=313, country='Tunisia'),
-    'DTTG': station(name='Gabes', coordinate=(33.88333, 10.1), altitude=4, country='Tunisia'),
-    'DTTJ': station(name='Djerba Mellita', coordinate=(33.86667, 10.76667), altitude=3, country='Tunisia'),
-    'DTTK': station(name='Kairouan', coordinate=(35.66667, 10.1), altitude=60, country='Tunisia'),
-    'DTTL': station(name='Kelibia', coordinate=(36.85, 11.08333), altitude=29, country='Tunisia'),
-    'DTTM': station(name='Monastir-Skanes', coordinate=(35.66667, 10.75), altitude=2, country='Tunisia'),
-    'DTTN': station(name='Jendouba', coordinate=(36.48333, 8.8), altitude=143, country='Tunisia'),
-    'DTTR': station(name='El Borma', coordinate=(31.68333, 9.16667), altitude=258, country='Tunisia'),
-    'DTTX': station(name='Sfax El-Maou', coordinate=(34.71667, 10.68333), altitude=21, country='Tunisia'),
-    'DTTZ': station(name='Tozeur', coordinate=(33.91667, 8.1), altitude=87, country='Tunisia'),
-    'DXAK': station(name='Atakpame', coordinate=(7.58333, 1.11667), altitude=400, country='Togo'),
-    'DXMG': station(name='Mango', coordinate=(10.36667, 0.46667), altitude=145, country='Togo'),
-    'DXNG': station(name='Niamtougou', coordinate=(9.76667, 1.1), altitude=342, country='Togo'),
-    'DXSK': station(name='Sokode', coordinate=(8.98333, 1.15), altitude=386, country='Togo'),
-    'DXTA': station(name='Tabligbo', coordinate=(6.58333, 1.5), altitude=44, country='Togo'),
-    'DXXX': station(name='Lome', coordinate=(6.16667, 1.25), altitude=20, country='Togo'),
-    'EBAW': station(name='Antwerpen / Deurne', coordinate=(51.2, 4.46667), altitude=12, country='Belgium'),
-    'EBBE': station(name='Beauvechain', coordinate=(50.75, 4.76667), altitude=105, country='Belgium'),
-    'EBBL': station(name='Kleine Brogel', coordinate=(51.16667, 5.46667), altitude=55, country='Belgium'),
-    'EBBR': station(name='Bruxelles National', coordinate=(50.9, 4.53333), altitude=55, country='Belgium'),
-    'EBBT': station(name='Brasschaat', coordinate=(51.33333, 4.5), altitude=22, country='Belgium'),
-    'EBBX': station(name='Bertrix Bel-Afb', coordinate=(49.9, 5.21667), altitude=461, country='Belgium'),
-    'EBCI': station(name='Charleroi / Gosselies', coordinate=(50.46667, 4.45), altitude=187, country='Belgium'),
-    'EBCV': station(name='Chievres', coordinate=(50.56667, 3.83333), altitude=60, country='Belgium'),
-    'EBDT': station(name='Schaffen', coordinate=(51.0, 5.06667), altitude=30, country='Belgium'),
-    'EBFN': station(name='Koksijde', coordinate=(51.08333, 2.65), altitude=4, country='Belgium'),
-    'EBFS': station(name='Florennes', coordinate=(50.23333, 4.65), altitude=279, country='Belgium'),
-    'EBGT': station(name='Gent / Industrie-Zone', coordinate=(51.18333, 3.81667), altitude=10, country='Belgium'),
-    'EBLB': station(name='Elsenborn', coordinate=(50.46667, 6.18333), altitude=564, country='Belgium'),
-    'EBLG': station(name='Bierset', coordinate=(50.65, 5.45), altitude=186, country='Belgium'),
-    'EBMB': station(name='Melsbroek Bel-Afb', coordinate=(50.9, 4.5), altitude=55, country='Belgium'),
-    'EBMT': station(name='Munte', coordinate=(50.93333, 3.73333), altitude=55, country='Belgium'),
-    'EBOS': station(name='Oostende Airport', coordinate=(51.2, 2.86667), altitude=4, country='Belgium'),
-    'EBSP': station(name='Spa / La Sauveniere', coordinate=(50.48333, 5.91667), altitude=470, country='Belgium'),
-    'EBST': station(name='Sint-Truiden', coordinate=(50.8, 5.2), altitude=74, country='Belgium'),
-    'EBSU': station(name='St-Hubert', coordinate=(50.03333, 5.4), altitude=563, country='Belgium'),
-    'EBTN': station(name='Goetsenhoven', coordinate=(50.78333, 4.95), altitude=71, country='Belgium'),
-    'EBWE': station(name='Weelde Military', coordinate=(51.41667, 5.0), altitude=60, country='Belgium'),
-    'EBZW': station(name='Genk', coordinate=(50.93333, 5.5), altitude=61, country='Belgium'),
-    'EDAC': station(name='Altenburg Nobitz', coordinate=(50.96667, 12.5), altitude=195, country='Germany'),
-    'EDAH': station(name='Heringsdorf', coordinate=(53.88333, 14.15), altitude=28, country='Germany'),
-    'EDBM': station(name='Magdeburg, Sachsen-Anhalt', coordinate=(52.07639, 11.62361), altitude=82, country='Germany'),
-    'EDDB': station(name='Berlin-Schoenefeld', coordinate=(52.38333, 13.51667), altitude=47, country='Germany'),
-    'EDDC': station(name='Dresden-Klotzsche', coordinate=(51.13333, 13.75), altitude=230, country='Germany'),
-    'EDDE': station(name='Erfurt-Bindersleben', coordinate=(50.98333, 10.96667), altitude=315, country='Germany'),
-    'EDDF': station(name='Frankfurt / M-Flughafen', coordinate=(50.05, 8.6), altitude=111, country='Germany'),
-    'EDDG': station(name='Muenster / Osnabrueck', coordinate=(52.13333, 7.7), altitude=48, country='Germany'),
-    'EDDH': station(name='Hamburg-Fuhlsbuettel', coordinate=(53.63333, 10.0), altitude=16, country='Germany'),
-    'EDDI': station(name='Berlin-Tempelhof', coordinate=(52.46667, 13.4), altitude=50, country='Germany'),
-    'EDDK': station(name='Koeln / Bonn', coordinate=(50.86667, 7.16667), altitude=91, country='Germany'),
-    'EDDL': station(name='Duesseldorf', coordinate=(51.3, 6.76667), altitude=45, country='Germany'),
-    'EDDM': station(name='Munchen', coordinate=(48.35, 11.78333), altitude=453, country='Germany'),
-    'EDDN': station(name='Nuernberg', coordinate=(49.5, 11.05), altitude=318, country='Germany'),
-    'EDDP': station(name='Leipzig-Schkeuditz', coordinate=(51.41667, 12.23333), altitude=144, country='Germany'),
-    'EDDR': station(name='Saarbruecken / Ensheim', coordinate=(49.21667, 7.11667), altitude=322, country='Germany'),
-    'EDDS': station(name='Stuttgart-Echterdingen', coordinate=(48.68333, 9.21667), altitude=396, country='Germany'),
-    'EDDT': station(name='Berlin-Tegel', coordinate=(52.56667, 13.31667), altitude=37, country='Germany'),
-    'EDDV': station(name='Hannover', coordinate=(52.46667, 9.68333), altitude=56, country='Germany'),
-    'EDDW': station(name='Bremen', coordinate=(53.05, 8.8), altitude=3, country='Germany'),
-    'EDFH': station(name='Hahn', coordinate=(49.95, 7.26667), altitude=491, country='Germany'),
-    'EDFM': station(name='Baden Wurttemberg, Neuostheim', coordinate=(49.4725, 8.51556), altitude=100, country='Germany'),
-    'EDGS': station(name='Hessen', coordinate=(50.70778, 8.08306), altitude=602, country='Germany'),
-    'EDHI': station(name='Hamburg-Finkenwerder', coordinate=(53.53333, 9.83333), altitude=5, country='Germany'),
-    'EDHK': station(name='Kiel / Holtenau Civilian', coordinate=(54.38333, 10.16667), altitude=31, country='Germany'),
-    'EDHL': station(name='Luebeck-Blankensee', coordinate=(53.81667, 10.7), altitude=14, country='Germany'),
-    'EDLN': station(name='Monchengladbach', coordinate=(51.23028, 6.50444), altitude=38, country='Germany'),
-    'EDLP': station(name='Paderborn / Lippstadt', coordinate=(51.61667, 8.61667), altitude=213, country='Germany'),
-    'EDLV': station(name='Niederrhein', coordinate=(51.6025, 6.14222), altitude=32, country='Germany'),
-    'EDLW': station(name='Dortmund / Wickede', coordinate=(51.51667, 7.61667), altitude=127, country='Germany'),
-    'EDMA': station(name='Augsburg', coordinate=(48.43333, 10.93333), altitude=461, country='Germany'),
-    'EDMO': station(name='Oberpfaffenhofen', coordinate=(48.08333, 11.28333), altitude=600, country='Germany'),
-    'EDNY': station(name='Friedrichshafen', coordinate=(47.66667, 9.51667), altitude=416, country='Germany'),
-    'EDOP': station(name='Mecklenburg-Vorpommern, Parchim', coordinate=(53.42694, 11.78361), altitude=52, country='Germany'),
-    'EDQD': station(name='Bayreuth', coordinate=(49.98333, 11.63333), altitude=488, country='Germany'),
-    'EDQM': station(name='Hof', coordinate=(50.31667, 11.88333), altitude=567, country='Germany'),
-    'EDRZ': station(name='Zweibrucken, Rheinland-Pfalz', coordinate=(49.20944, 7.40111), altitude=344, country='Germany'),
-    'EDSB': station(name='Karlsruhe, Baden Wurttemberg', coordinate=(48.77861, 8.07972), altitude=124, country='Germany'),
-    'EDTD': station(name='Donaueschingen / Villingen', coordinate=(47.96667, 8.51667), altitude=680, country='Germany'),
-    'EDTL': station(name='Lahr, CAN-AFB', coordinate=(48.36917, 7.82778), altitude=156, country='Germany'),
-    'EDTZ': station(name='Konstanz', coordinate=(47.68333, 9.18333), altitude=443, country='Germany'),
-    'EDVE': station(name='Braunschweig', coordinate=(52.3, 10.45), altitude=81, country='Germany'),
-    'EDVK': station(name='Kassel / Calden', coordinate=(51.4, 9.38333), altitude=277, country='Germany'),
-    'EDWD': station(name='Lemwerder', coordinate=(53.15, 8.61667), altitude=30, country='Germany'),
-    'EDXW': station(name='Westerland / Sylt', coordinate=(54.91667, 8.35), altitude=16, country='Germany'),
-    'EDZE': station(name='Essen', coordinate=(51.4, 6.96667), altitude=152, country='Germany'),
-    'EEKA': station(name='Kardla', coordinate=(58.98333, 22.81667), altitude=5, country='Estonia'),
-    'EEKE': station(name='Kuressaare', coordinate=(58.23, 22.50944), altitude=4, country='Estonia'),
-    'EEPU': station(name='Parnu', coordinate=(58.41917, 24.47278), altitude=14, country='Estonia'),
-    'EETN': station(name='Tallinn', coordinate=(59.4, 24.81667), altitude=40, country='Estonia'),
-    'EETU': station(name='Tartu/Ulenurme', coordinate=(58.3, 26.73333), altitude=59, country='Estonia'),
-    'EFET': station(name='Enontekio', coordinate=(68.36444, 23.4275), altitude=308, country='Finland'),
-    'EFHA': station(name='Halli', coordinate=(61.85, 24.8), altitude=143, country='Finland'),
-    'EFHF': station(name='Helsinki-Malmi', coordinate=(60.25, 25.05), altitude=17, country='Finland'),
-    'EFHK': station(name='Helsinki-Vantaa', coordinate=(60.31667, 24.96667), altitude=51, country='Finland'),
-    'EFHL': station(name='Hailuoto', coordinate=(65.03333, 24.8), altitude=6, country='Finland'),
-    'EFHT': station(name='Ahtari', coordinate=(62.53333, 24.21667), altitude=157, country='Finland'),
-    'EFIL': station(name='Ilmajoki', coordinate=(62.7, 22.83333), altitude=92, country='Finland'),
-    'EFIV': station(name='Ivalo', coordinate=(68.61667, 27.41667), altitude=147, country='Finland'),
-    'EFJO': station(name='Joensuu', coordinate=(62.66667, 29.63333), altitude=119, country='Finland'),
-    'EFJY': station(name='Jyvaskyla', coordinate=(62.4, 25.68333), altitude=141, country='Finland'),
-    'EFKA': station(name='Kauhava', coordinate=(63.1, 23.03333), altitude=42, country='Finland'),
-    'EFKE': station(name='Kemi', coordinate=(65.78333, 24.58333), altitude=15, country='Finland'),
-    'EFKI': station(name='Kajaani', coordinate=(64.28333, 27.68333), altitude=143, country='Finland'),
-    'EFKK': station(name='Kruunupyy', coordinate=(63.71667, 23.15), altitude=25, country='Finland'),
-    'EFKS': station(name='Kuusamo', coordinate=(65.96667, 29.18333), altitude=262, country='Finland'),
-    'EFKT': station(name='Kittila', coordinate=(67.7, 24.85), altitude=643, country='Finland'),
-    'EFKU': station(name='Kuopio', coordinate=(63.01667, 27.8), altitude=98, country='Finland'),
-    'EFLP': station(name='Lappeenranta', coordinate=(61.04583, 28.14861), altitude=106, country='Finland'),
-    'EFMA': station(name='Mariehamn / Aland Island', coordinate=(60.11667, 19.9), altitude=6, country='Finland'),
-    'EFMI': station(name='Mikkeli', coordinate=(61.73333, 27.3), altitude=138, country='Finland'),
-    'EFOU': station(name='Oulu', coordinate=(64.93333, 25.36667), altitude=12, country='Finland'),
-    'EFPE': station(name='Pello', coordinate=(66.8, 24.0), altitude=84, country='Finland'),
-    'EFPO': station(name='Pori', coordinate=(61.46667, 21.8), altitude=13, country='Finland'),
-    'EFPU': station(name='Pudasjarvi', coordinate=(65.36667, 27.01667), altitude=114, country='Finland'),
-    'EFRO': station(name='Rovaniemi', coordinate=(66.56667, 25.83333), altitude=197, country='Finland'),
-    'EFSA': station(name='Savonlinna', coordinate=(61.95, 28.95), altitude=95, country='Finland'),
-    'EFSI': station(name='Seinajoki-Ilmajok', coordinate=(62.69361, 22.83194), altitude=91, country='Finland'),
-    'EFSO': station(name='Sodankyla', coordinate=(67.36667, 26.65), altitude=179, country='Finland'),
-    'EFSU': station(name='Suomussalmi', coordinate=(64.9, 29.01667), altitude=223, country='Finland'),
-    'EFTP': station(name='Tampere / Pirkkala', coordinate=(61.41667, 23.58333), altitude=112, country='Finland'),
-    'EFTU': station(name='Turku', coordinate=(60.51667, 22.26667), altitude=49, country='Finland'),
-    'EFUT': station(name='Utti', coordinate=(60.9, 26.93333), altitude=100, country='Finland'),
-    'EFVA': station(name='Vaasa', coordinate=(63.05, 21.76667), altitude=4, country='Finland'),
-    'EFVI': station(name='Viitasaari', coordinate=(63.08333, 25.86667), altitude=132, country='Finland'),
-    'EFVR': station(name='Varkaus', coordinate=(62.16667, 27.86667), altitude=87, country='Finland'),
-    'EGAA': station(name='Belfast / Aldergrove Airport', coordinate=(54.65, -6.21667), altitude=81, country='United Kingdom'),
-    'EGAC': station(name='Belfast / Harbour', coordinate=(54.6, -5.88333), altitude=5, country='United Kingdom'),
-    'EGAE': station(name='Eglinton / Londonderr', coordinate=(55.05, -7.15), altitude=9, country='United Kingdom'),
-    'EGBB': station(name='Birmingham / Airport', coordinate=(52.45, -1.73333), altitude=99, country='United Kingdom'),
-    'EGBE': station(name='Coventry Airport', coordinate=(52.36667, -1.48333), altitude=82, country='United Kingdom'),
-    'EGBJ': station(name='Staverton Private', coordinate=(51.9, -2.16667), altitude=29, country='United Kingdom'),
-    'EGCC': station(name='Manchester Airport', coordinate=(53.35, -2.28333), altitude=69, country='United Kingdom'),
-    'EGDB': station(name='Plymouth', coordinate=(50.35, -4.11667), altitude=50, country='United Kingdom'),
-    'EGDC': station(name='Chivenor', coordinate=(51.08333, -4.15), altitude=8, country='United Kingdom'),
-    'EGDG': station(name='Saint Mawgan', coordinate=(50.43333, -5.0), altitude=119, country='United Kingdom'),
-    'EGDK': station(name='Kemble Royal Air Force Base', coordinate=(51.66667, -2.05), altitude=133, country='United Kingdom'),
-    'EGDL': station(name='Lyneham', coordinate=(51.5, -1.98333), altitude=145, country='United Kingdom'),
-    'EGDM': station(name='Boscombe Down', coordinate=(51.16667, -1.75), altitude=124, country='United Kingdom'),
-    'EGDP': station(name='Portland / Rnas', coordinate=(50.56667, -2.45), altitude=3, country='United Kingdom'),
-    'EGDR': station(name='Culdrose', coordinate=(50.08333, -5.25), altitude=78, country='United Kingdom'),
-    'EGDX': station(name='St Athan Royal Air Force Base', coordinate=(51.4, -3.43333), altitude=50, country='United Kingdom'),
-    'EGDY': station(name='Yeovilton', coordinate=(51.0, -2.63333), altitude=23, country='United Kingdom'),
-    'EGEC': station(name='Campbeltown', coordinate=(55.43722, -5.68639), altitude=13, country='United Kingdom'),
-    'EGFF': station(name='Cardiff-Wales Airport', coordinate=(51.4, -3.35), altitude=67, country='United Kingdom'),
-    'EGFH': station(name='Swansea', coordinate=(51.6, -4.06667), altitude=90, country='United Kingdom'),
-    'EGGD': station(name='Bristol / Lulsgate', coordinate=(51.38333, -2.71667), altitude=189, country='United Kingdom'),
-    'EGGP': station(name='Liverpool Airport', coordinate=(53.33333, -2.85), altitude=26, country='United Kingdom'),
-    'EGGW': station(name='Luton Airport', coordinate=(51.86667, -0.36667), altitude=160, country='United Kingdom'),
-    'EGHD': station(name='Plymouth / Roborough', coordinate=(50.41667, -4.11667), altitude=25, country='United Kingdom'),
-    'EGHE': station(name="Scilly, Saint Mary'S", coordinate=(49.91667, -6.3), altitude=31, country='United Kingdom'),
-    'EGHH': station(name='Bournemouth Airport', coordinate=(50.78333, -1.83333), altitude=11, country='United Kingdom'),
-    'EGHI': station(name='Southampton / Weather Centre', coordinate=(50.9, -1.4), altitude=9, country='United Kingdom'),
-    'EGJA': station(name='Alderney / Channel Island', coordinate=(49.71667, -2.2), altitude=71, country='United Kingdom'),
-    'EGJB': station(name='Guernsey Airport', coordinate=(49.43333, -2.6), altitude=102, country='United Kingdom'),
-    'EGJJ': station(name='Jersey Airport', coordinate=(49.21667, -2.2), altitude=84, country='United Kingdom'),
-    'EGKA': station(name='Shoreham Airport', coordinate=(50.83333, -0.28333), altitude=2, country='United Kingdom'),
-    'EGKB': station(name='Biggin Hill', coordinate=(51.31667, 0.03333), altitude=183, country='United Kingdom'),
-    'EGKK': station(name='London / Gatwick Airport', coordinate=(51.15, -0.18333), altitude=62, country='United Kingdom'),
-    'EGLC': station(name='London City Airport', coordinate=(51.5, -0.5), altitude=5, country='United Kingdom'),
-    'EGLF': station(name='Farnborough', coordinate=(51.28333, -0.76667), altitude=65, country='United Kingdom'),
-    'EGLL': station(name='London / Heathrow Airport', coordinate=(51.48333, -0.45), altitude=24, country='United Kingdom'),
-    'EGMC': station(name='Southend-On-Sea', coordinate=(51.56667, 0.7), altitude=15, country='United Kingdom'),
-    'EGMD': station(name='Lydd Airport', coordinate=(50.95, 0.93333), altitude=3, country='United Kingdom'),
-    'EGMH': station(name='Manston, South East', coordinate=(51.34194, 1.34611), altitude=55, country='United Kingdom'),
-    'EGNC': station(name='Carlisle', coordinate=(54.93333, -2.95), altitude=26, country='United Kingdom'),
-    'EGNH': station(name='Blackpool Airport', coordinate=(53.76667, -3.03333), altitude=10, country='United Kingdom'),
-    'EGNJ': station(name='Humberside', coordinate=(53.58333, -0.35), altitude=31, country='United Kingdom'),
-    'EGNL': station(name='Walney Island', coordinate=(54.11667, -3.25), altitude=15, country='United Kingdom'),
-    'EGNM': station(name='Leeds And Bradford', coordinate=(53.86667, -1.65), altitude=208, country='United Kingdom'),
-    'EGNR': station(name='Hawarden', coordinate=(53.16667, -2.98333), altitude=10, country='United Kingdom'),
-    'EGNS': station(name='Isle Of Man / Ronaldsway Airport', coordinate=(54.08333, -4.63333), altitude=17, country='United Kingdom'),
-    'EGNT': station(name='Newcastle', coordinate=(55.03333, -1.7), altitude=81, country='United Kingdom'),
-    'EGNV': station(name='Tees-Side', coordinate=(54.51667, -1.41667), altitude=37, country='United Kingdom'),
-    'EGNX': station(name='East Midlands', coordinate=(52.83333, -1.33333), altitude=94, country='United Kingdom'),
-    'EGOD': station(name='Llanbedr', coordinate=(52.81667, -4.13333), altitude=9, country='United Kingdom'),
-    'EGOM': station(name='Spadeadam', coordinate=(55.05, -2.55), altitude=325, country='United Kingdom'),
-    'EGOP': station(name='Pembrey Sands', coordinate=(51.71667, -4.36667), altitude=3, country='United Kingdom'),
-    'EGOS': station(name='Shawbury', coordinate=(52.8, -2.66667), altitude=76, country='United Kingdom'),
-    'EGOV': station(name='Valley', coordinate=(53.25, -4.53333), altitude=1, country='United Kingdom'),
-    'EGOW': station(name='Woodvale', coordinate=(53.58167, -3.05556), altitude=11, country='United Kingdom'),
-    'EGOY': station(name='West Freugh', coordinate=(54.85, -4.95), altitude=11, country='United Kingdom'),
-    'EGPA': station(name='Kirkwall Airport', coordinate=(58.95, -2.9), altitude=21, country='United Kingdom'),
-    'EGPB': station(name='Sumburgh Cape', coordinate=(59.88333, -1.3), altitude=5, country='United Kingdom'),
-    'EGPC': station(name='Wick', coordinate=(58.45, -3.08333), altitude=39, country='United Kingdom'),
-    'EGPD': station(name='Aberdeen / Dyce', coordinate=(57.2, -2.21667), altitude=65, country='United Kingdom'),
-    'EGPE': station(name='Inverness / Dalcross', coordinate=(57.53333, -4.05), altitude=9, country='United Kingdom'),
-    'EGPF': station(name='Glasgow Airport', coordinate=(55.86667, -4.43333), altitude=8, country='United Kingdom'),
-    'EGPH': station(name='Edinburgh Airport', coordinate=(55.95, -3.35), altitude=41, country='United Kingdom'),
-    'EGPI': station(name='Islay', coordinate=(55.68194, -6.25667), altitude=16, country='United Kingdom'),
-    'EGPK': station(name='Prestwick Airport', coordinate=(55.5, -4.58333), altitude=20, country='United Kingdom'),
-    'EGPL': station(name='Benbecula', coordinate=(57.46667, -7.36667), altitude=6, country='United Kingdom'),
-    'EGPM': station(name='Scatsa / Shetland Island', coordinate=(60.43333, -1.3), altitude=22, country='United Kingdom'),
-    'EGPN': station(name='Dundee / Riverside', coordinate=(56.45, -3.01667), altitude=4, country='United Kingdom'),
-    'EGPO': station(name='Stornoway', coordinate=(58.21667, -6.31667), altitude=9, country='United Kingdom'),
-    'EGPT': station(name='Perth / Scone', coordinate=(56.45, -3.36667), altitude=121, country='United Kingdom'),
-    'EGPU': station(name='Tiree', coordinate=(56.5, -6.88333), altitude=12, country='United Kingdom'),
-    'EGPW': station(name='Unst Island', coordinate=(60.73333, -0.81667), altitude=285, country='United Kingdom'),
-    'EGQA': station(name='Tain Range', coordinate=(57.81667, -3.96667), altitude=4, country='United Kingdom'),
-    'EGQJ': station(name='Machrihanish', coordinate=(55.43333, -5.7), altitude=13, country='United Kingdom'),
-    'EGQK': station(name='Kinloss', coordinate=(57.65, -3.56667), altitude=7, country='United Kingdom'),
-    'EGQL': station(name='Leuchars', coordinate=(56.38333, -2.86667), altitude=12, country='United Kingdom'),
-    'EGQM': station(name='Boulmer', coordinate=(55.41667, -1.6), altitude=23, country='United Kingdom'),
-    'EGQS': station(name='Lossiemouth', coordinate=(57.71667, -3.31667), altitude=13, country='United Kingdom'),
-    'EGRB': station(name='London Weather Centre', coordinate=(51.51667, -0.11667), altitude=5, country='United Kingdom'),
-    'EGRR': station(name='Bracknell / Beaufort Park', coordinate=(51.38333, -0.78333), altitude=74, country='United Kingdom'),
-    'EGSC': station(name='Cambridge', coordinate=(52.2, 0.18333), altitude=15, country='United Kingdom'),
-    'EGSH': station(name='Norwich Weather Centre', coordinate=(52.63333, 1.3), altitude=14, country='United Kingdom'),
-    'EGSS': station(name='Stansted Airport', coordinate=(51.88333, 0.23333), altitude=106, country='United Kingdom'),
-    'EGSY': station(name='Yorkshire and Humberside, Sheffield City', coordinate=(53.39417, -1.38833), altitude=70, country='United Kingdom'),
-    'EGTC': station(name='Cranfield', coordinate=(52.06667, -0.61667), altitude=111, country='United Kingdom'),
-    'EGTE': station(name='Exeter Airport', coordinate=(50.73333, -3.41667), altitude=30, country='United Kingdom'),
-    'EGTG': station(name='Filton Private', coordinate=(51.51667, -2.58333), altitude=69, country='United Kingdom'),
-    'EGTH': station(name='Hatfeild Private', coordinate=(51.76667, -0.25), altitude=77, country='United Kingdom'),
-    'EGUA': station(name='Upper Heyford Royal Air Force Base', coordinate=(51.93333, -1.25), altitude=134, country='United Kingdom'),
-    'EGUB': station(name='Benson', coordinate=(51.61667, -1.08333), altitude=63, country='United Kingdom'),
-    'EGUC': station(name='Aberporth', coordinate=(52.13333, -4.56667), altitude=133, country='United Kingdom'),
-    'EGUF': station(name='Farnborough Military', coordinate=(51.28333, -0.76667), altitude=72, country='United Kingdom'),
-    'EGUL': station(name='Lakenheath Royal Air Force Base', coordinate=(52.41667, 0.56667), altitude=10, country='United Kingdom'),
-    'EGUM': station(name='Manston', coordinate=(51.35, 1.35), altitude=55, country='United Kingdom'),
-    'EGUN': station(name='Mildenhall Royal Air Force Base', coordinate=(52.36667, 0.48333), altitude=10, country='United Kingdom'),
-    'EGUO': station(name='Colerne', coordinate=(51.43917, -2.28639), altitude=181, country='United Kingdom'),
-    'EGUP': station(name='Sculthorpe Af Met', coordinate=(52.85, 0.76667), altitude=65, country='United Kingdom'),
-    'EGUW': station(name='Wattisham', coordinate=(52.11667, 0.96667), altitude=87, country='United Kingdom'),
-    'EGUY': station(name='Wyton Royal Air Force Base', coordinate=(52.35, -0.11667), altitude=41, country='United Kingdom'),
-    'EGVA': station(name='Fairford Royal Air Force Base', coordinate=(51.68333, -1.78333), altitude=87, country='United Kingdom'),
-    'EGVG': station(name='Woodbridge Royal Air Force Base', coordinate=(52.08333, 1.4), altitude=29, country='United Kingdom'),
-    'EGVI': station(name='Greenham Common Royal Air Force Base', coordinate=(51.38333, -1.28333), altitude=122, country='United Kingdom'),
-    'EGVJ': station(name='Bentwaters Royal Air Force Base', coordinate=(52.13333, 1.43333), altitude=26, country='United Kingdom'),
-    'EGVN': station(name='Brize Norton', coordinate=(51.75, -1.58333), altitude=88, country='United Kingdom'),
-    'EGVO': station(name='Odiham', coordinate=(51.23333, -0.95), altitude=123, country='United Kingdom'),
-    'EGVP': station(name='Middle Wallop', coordinate=(51.15, -1.56667), altitude=91, country='United Kingdom'),
-    'EGWC': station(name='Cosford Royal Air Force Base', coordinate=(52.63333, -2.3), altitude=83, country='United Kingdom'),
-    'EGWU': station(name='Northolt', coordinate=(51.55, -0.41667), altitude=38, country='United Kingdom'),
-    'EGWZ': station(name='Alconbury Royal Air Force Base', coordinate=(52.36667, -0.21667), altitude=49, country='United Kingdom'),
-    'EGXC': station(name='Coningsby Royal Air Force Base', coordinate=(53.08333, -0.16667), altitude=7, country='United Kingdom'),
-    'EGXD': station(name='Disforth', coordinate=(54.13333, -1.41667), altitude=36, country='United Kingdom'),
-    'EGXE': station(name='Leeming', coordinate=(54.3, -1.53333), altitude=40, country='United Kingdom'),
-    'EGXF': station(name='Cowden', coordinate=(53.85, -6.1), altitude=15, country='United Kingdom'),
-    'EGXG': station(name='Church Fenton', coordinate=(53.83333, -1.2), altitude=9, country='United Kingdom'),
-    'EGXH': station(name='Honington Royal Air Force Base', coordinate=(52.33333, 0.76667), altitude=54, country='United Kingdom'),
-    'EGXJ': station(name='Cottesmore', coordinate=(52.73333, -0.65), altitude=138, country='United Kingdom'),
-    'EGXN': station(name='Newton', coordinate=(52.96667, -0.98333), altitude=55, country='United Kingdom'),
-    'EGXP': station(name='Scampton', coordinate=(53.3075, -0.55083), altitude=62, country='United Kingdom'),
-    'EGXT': station(name='Wittering', coordinate=(52.61667, -0.46667), altitude=84, country='United Kingdom'),
-    'EGXU': station(name='Linton-On-Ouse', coordinate=(54.05, -1.25), altitude=16, country='United Kingdom'),
-    'EGXV': station(name='Leconfield', coordinate=(53.86667, -0.43333), altitude=6, country='United Kingdom'),
-    'EGXW': station(name='Waddington', coordinate=(53.16667, -0.51667), altitude=68, country='United Kingdom'),
-    'EGXZ': station(name='Topcliffe Royal Air Force Base', coordinate=(54.2, -1.38333), altitude=28, country='United Kingdom'),
-    'EGYC': station(name='Coltishall', coordinate=(52.43333, 1.35), altitude=20, country='United Kingdom'),
-    'EGYD': station(name='Cranwell', coordinate=(53.03333, -0.5), altitude=67, country='United Kingdom'),
-    'EGYE': station(name='Barkston Heath Royal Air Force Base', coordinate=(52.96667, -0.56667), altitude=112, country='United Kingdom'),
-    'EGYH': station(name='Holbeach', coordinate=(52.86667, 0.15), altitude=3, country='United Kingdom'),
-    'EGYM': station(name='Marham', coordinate=(52.65, 0.56667), altitude=23, country='United Kingdom'),
-    'EGYP': station(name='Mount Pleasant Airport', coordinate=(-51.81667, -58.45), altitude=74, country='South Georgia and the Islands'),
-    'EGYW': station(name='Wainfleet', coordinate=(53.08333, 0.26667), altitude=3, country='United Kingdom'),
-    'EHAM': station(name='Amsterdam Airport Schiphol', coordinate=(52.3, 4.76667), altitude=-4, country='Netherlands'),
-    'EHBK': station(name='Maastricht Airport Zuid Limburg', coordinate=(50.91667, 5.78333), altitude=114, country='Netherlands'),
-    'EHDB': station(name='De Bilt', coordinate=(52.1, 5.18333), altitude=2, country='Netherlands'),
-    'EHDL': station(name='Deelen', coordinate=(52.06667, 5.88333), altitude=48, country='Netherlands'),
-    'EHEH': station(name='Eindhoven', coordinate=(51.45, 5.41667), altitude=23, country='Netherlands'),
-    'EHGG': station(name='Groningen Airport Eelde', coordinate=(53.13333, 6.58333), altitude=4, country='Netherlands'),
-    'EHGR': station(name='Gilze-Rijen', coordinate=(51.56667, 4.93333), altitude=15, country='Netherlands'),
-    'EHKD': station(name='De Kooy', coordinate=(52.91667, 4.78333), altitude=0, country='Netherlands'),
-    'EHLE': station(name='Lelystad', coordinate=(52.45, 5.51667), altitude=0, country='Netherlands'),
-    'EHLW': station(name='Leeuwarden', coordinate=(53.21667, 5.76667), altitude=1, country='Netherlands'),
-    'EHRD': station(name='Rotterdam Airport Zestienhoven', coordinate=(51.95, 4.45), altitude=-5, country='Netherlands'),
-    'EHSB': station(name='Soesterberg', coordinate=(52.13333, 5.28333), altitude=20, country='Netherlands'),
-    'EHTW': station(name='Twenthe', coordinate=(52.26667, 6.9), altitude=35, country='Netherlands'),
-    'EHVB': station(name='Valkenburg', coordinate=(52.18333, 4.41667), altitude=0, country='Netherlands'),
-    'EHVK': station(name='Volkel', coordinate=(51.65, 5.7), altitude=22, country='Netherlands'),
-    'EHVL': station(name='Vlieland', coordinate=(53.25, 4.91667), altitude=11, country='Netherlands'),
-    'EHWO': station(name='Woensdrecht', coordinate=(51.45, 4.33333), altitude=20, country='Netherlands'),
-    'EICK': station(name='Cork Airport', coordinate=(51.85, -8.48333), altitude=153, country='Ireland'),
-    'EIDW': station(name='Dublin Airport', coordinate=(53.43333, -6.25), altitude=68, country='Ireland'),
-    'EIKN': station(name='Connaught', coordinate=(53.91028, -8.81806), altitude=203, country='Ireland'),
-    'EIME': station(name='Casement Aerodrome', coordinate=(53.3, -6.43333), altitude=97, country='Ireland'),
-    'EINN': station(name='Shannon Airport', coordinate=(52.7, -8.91667), altitude=14, country='Ireland'),
-    'EKAH': station(name='Tirstrup', coordinate=(56.3, 10.61667), altitude=23, country='Denmark'),
-    'EKAT': station(name='Anholt Island Automated Reporting Station', coordinate=(56.7, 11.55), altitude=8, country='Denmark'),
-    'EKAV': station(name='Avno Danish Air Force Base', coordinate=(55.08333, 11.78333), altitude=4, country='Denmark'),
-    'EKBI': station(name='Billund Lufthavn', coordinate=(55.73333, 9.16667), altitude=75, country='Denmark'),
-    'EKCH': station(name='Koebenhavn / Kastrup', coordinate=(55.61667, 12.65), altitude=5, country='Denmark'),
-    'EKEB': station(name='Esbjerg', coordinate=(55.53333, 8.56667), altitude=30, country='Denmark'),
-    'EKHO': station(name='Lindtorp Airport', coordinate=(56.4, 8.45), altitude=15, country='Denmark'),
-    'EKHS': station(name='Hadsund', coordinate=(56.71667, 10.11667), altitude=2, country='Denmark'),
-    'EKKA': station(name='Karup', coordinate=(56.3, 9.11667), altitude=52, country='Denmark'),
-    'EKMB': station(name='Maribo Lufthavn', coordinate=(54.7, 11.45), altitude=5, country='Denmark'),
-    'EKOD': station(name='Odense / Beldringe', coordinate=(55.48333, 10.33333), altitude=17, country='Denmark'),
-    'EKRK': station(name='Koebenhavn / Roskilde', coordinate=(55.58333, 12.13333), altitude=44, country='Denmark'),
-    'EKRN': station(name='Roenne', coordinate=(55.06667, 14.75), altitude=16, country='Denmark'),
-    'EKSB': station(name='Soenderborg Lufthavn', coordinate=(54.96667, 9.78333), altitude=7, country='Denmark'),
-    'EKSN': station(name='Sindal Flyveplads', coordinate=(57.5, 10.21667), altitude=28, country='Denmark'),
-    'EKSP': station(name='Skrydstrup', coordinate=(55.23333, 9.26667), altitude=43, country='Denmark'),
-    'EKST': station(name='Sydfyns Flyveplads', coordinate=(55.01667, 10.56667), altitude=6, country='Denmark'),
-    'EKSV': station(name='Skive Lufthavn', coordinate=(56.55, 9.16667), altitude=23, country='Denmark'),
-    'EKTS': station(name='Thisted Lufthavn', coordinate=(57.06667, 8.71667), altitude=7, country='Denmark'),
-    'EKVA': station(name='Vandel', coordinate=(55.7, 9.2), altitude=73, country='Denmark'),
-    'EKVD': station(name='Vamdrup', coordinate=(55.43333, 9.33333), altitude=44, country='Denmark'),
-    'EKVG': station(name='Soervaag / Vagar', coordinate=(62.06667, -7.28333), altitude=85, country='Denmark'),
-    'EKVJ': station(name='Stauning Lufthavn', coordinate=(56.0, 8.35), altitude=5, country='Denmark'),
-    'EKVL': station(name='Vaerloese', coordinate=(55.76667, 12.33333), altitude=18, country='Denmark'),
-    'EKYT': station(name='Aalborg', coordinate=(57.1, 9.85), altitude=3, country='Denmark'),
-    'ELLX': station(name='Luxembourg / Luxembourg', coordinate=(49.61667, 6.21667), altitude=376, country='Luxembourg'),
-    'ENAL': station(name='Alesund / Vigra', coordinate=(62.56667, 6.11667), altitude=2, country='Norway'),
-    'ENAN': station(name='Andoya', coordinate=(69.3, 16.15), altitude=1, country='Norway'),
-    'ENAS': station(name='Ny-Alesund Ii', coordinate=(78.91667, 11.93333), altitude=8, country='Norway'),
-    'ENAT': station(name='Alta Lufthavn', coordinate=(69.98333, 23.36667), altitude=0, country='Norway'),
-    'ENBJ': station(name='Bjornoya', coordinate=(74.51667, 19.01667), altitude=16, country='Norway'),
-    'ENBL': station(name='Forde / Bringeland', coordinate=(61.45, 5.86667), altitude=150, country='Norway'),
-    'ENBM': station(name='Voss-Bo', coordinate=(60.65, 6.5), altitude=125, country='Norway'),
-    'ENBN': station(name='Bronnoysund / Bronnoy', coordinate=(65.46667, 12.21667), altitude=0, country='Norway'),
-    'ENBO': station(name='Bodo Vi', coordinate=(67.26667, 14.36667), altitude=1, country='Norway'),
-    'ENBR': station(name='Bergen / Flesland', coordinate=(60.28333, 5.23333), altitude=5, country='Norway'),
-    'ENBS': station(name='Batsfjord', coordinate=(70.63333, 29.73333), altitude=10, country='Norway'),
-    'ENBV': station(name='Berlevag', coordinate=(70.86667, 29.03333), altitude=1, country='Norway'),
-    'ENCN': station(name='Kristiansand / Kjevik', coordinate=(58.2, 8.08333), altitude=1, country='Norway'),
-    'ENDI': station(name='Dagali', coordinate=(60.41667, 8.51667), altitude=798, country='Norway'),
-    'ENDR': station(name='Draugen', coordinate=(64.35556, 7.79167), altitude=0, country='Norway'),
-    'ENDU': station(name='Bardufoss', coordinate=(69.06667, 18.53333), altitude=7, country='Norway'),
-    'ENEK': station(name='Ekofisk Oil Platform', coordinate=(56.55, 3.25), altitude=3, country='Norway'),
-    'ENEV': station(name='Evenes', coordinate=(68.51667, 16.68333), altitude=26, country='Norway'),
-    'ENFB': station(name='Oslo / Fornebu', coordinate=(59.9, 10.63333), altitude=1, country='Norway'),
-    'ENFG': station(name='Fagernes Leirin', coordinate=(61.0, 9.3), altitude=822, country='Norway'),
-    'ENFL': station(name='Floro', coordinate=(61.58333, 5.03333), altitude=0, country='Norway'),
-    'ENFR': station(name='Frigg', coordinate=(59.93333, 2.0), altitude=None, country='Norway'),
-    'ENGC': station(name='Gullfax Platform', coordinate=(61.03333, 2.03333), altitude=10, country='Norway'),
-    'ENGM': station(name='Oslo / Gardermoen', coordinate=(60.2, 11.08333), altitude=20, country='Norway'),
-    'ENHD': station(name='Haugesund / Karmoy', coordinate=(59.35, 5.21667), altitude=2, country='Norway'),
-    'ENHE': station(name='Heidrun', coordinate=(65.325, 2.32667), altitude=0, country='Norway'),
-    'ENHF': station(name='Hammerfest', coordinate=(70.66667, 23.66667), altitude=8, country='Norway'),
-    'ENHK': station(name='Hasvik', coordinate=(70.48333, 22.15), altitude=10, country='Norway'),
-    'ENHO': station(name='Hopen', coordinate=(76.5, 25.06667), altitude=6, country='Norway'),
-    'ENHV': station(name='Honningsvag / Valan', coordinate=(71.01667, 25.98333), altitude=1, country='Norway'),
-    'ENJA': station(name='Jan Mayen', coordinate=(70.93333, -8.66667), altitude=10, country='Norway'),
-    'ENKA': station(name='Kautokeino', coordinate=(69.0, 23.03333), altitude=305, country='Norway'),
-    'ENKB': station(name='Kristiansund / Kvernberget', coordinate=(63.11667, 7.83333), altitude=6, country='Norway'),
-    'ENKR': station(name='Kirkenes Lufthavn', coordinate=(69.73333, 29.9), altitude=9, country='Norway'),
-    'ENLI': station(name='Lista Flyplass', coordinate=(58.1, 6.63333), altitude=1, country='Norway'),
-    'ENLK': station(name='Leknes', coordinate=(68.15, 13.61667), altitude=2, country='Norway'),
-    'ENMH': station(name='Mehamn', coordinate=(71.03333, 27.83333), altitude=1, country='Norway'),
-    'ENML': station(name='Molde / Aro', coordinate=(62.75, 7.26667), altitude=0, country='Norway'),
-    'ENMS': station(name='Mosjoen Kjaerstad', coordinate=(65.8, 13.13333), altitude=70, country='Norway'),
-    'ENNA': station(name='Banak', coordinate=(70.06667, 24.98333), altitude=0, country='Norway'),
-    'ENNK': station(name='Narvik Iii', coordinate=(68.46667, 17.5), altitude=17, country='Norway'),
-    'ENNM': station(name='Namsos Lufthavn', coordinate=(64.46667, 11.58333), altitude=0, country='Norway'),
-    'ENNO': station(name='Notodden', coordinate=(59.56667, 9.21667), altitude=19, country='Norway'),
-    'ENOA': station(name='Oseberg', coordinate=(59.31667, 10.45), altitude=15, country='Norway'),
-    'ENOL': station(name='Orland Iii', coordinate=(63.7, 9.6), altitude=0, country='Norway'),
-    'ENOV': station(name='Orsta-Volda / Hovden', coordinate=(62.18333, 6.06667), altitude=7, country='Norway'),
-    'ENRA': station(name='Mo I Rana / Rossvoll', coordinate=(66.36667, 14.3), altitude=7, country='Norway'),
-    'ENRM': station(name='Rorvik / Ryum', coordinate=(64.83333, 11.15), altitude=4, country='Norway'),
-    'ENRO': station(name='Roros Lufthavn', coordinate=(62.58333, 11.35), altitude=62, country='Norway'),
-    'ENRS': station(name='Rost Flyplass', coordinate=(67.51667, 12.1), altitude=4, country='Norway'),
-    'ENRY': station(name='Rygge', coordinate=(59.38333, 10.78333), altitude=5, country='Norway'),
-    'ENSB': station(name='Svalbard Lufthavn', coordinate=(78.25, 15.46667), altitude=2, country='Norway'),
-    'ENSD': station(name='Sandane / Anda', coordinate=(61.83333, 6.11667), altitude=6, country='Norway'),
-    'ENSG': station(name='Sogndal / Haukasen', coordinate=(61.15, 7.13333), altitude=49, country='Norway'),
-    'ENSH': station(name='Svolvaer / Helle', coordinate=(68.25, 14.66667), altitude=0, country='Norway'),
-    'ENSK': station(name='Storkmarknes / Skagen', coordinate=(68.58333, 15.01667), altitude=0, country='Norway'),
-    'ENSN': station(name='Skien-Geiteryggen', coordinate=(59.18333, 9.56667), altitude=1, country='Norway'),
-    'ENSO': station(name='Stord / Soerstokken', coordinate=(59.8, 5.35), altitude=49, country='Norway'),
-    'ENSR': station(name='Sorkjosen', coordinate=(69.78333, 20.96667), altitude=0, country='Norway'),
-    'ENSS': station(name='Svartnes', coordinate=(70.35, 31.05), altitude=12, country='Norway'),
-    'ENST': station(name='Sandnessjoen / Stokka', coordinate=(65.96667, 12.46667), altitude=1, country='Norway'),
-    'ENTC': station(name='Tromso / Langnes', coordinate=(69.68333, 18.91667), altitude=1, country='Norway'),
-    'ENTO': station(name='Torp', coordinate=(59.2, 10.26667), altitude=8, country='Norway'),
-    'ENVA': station(name='Trondheim / Vaernes', coordinate=(63.46667, 10.93333), altitude=1, country='Norway'),
-    'ENVD': station(name='Vadso', coordinate=(70.06667, 29.85), altitude=3, country='Norway'),
-    'ENZV': station(name='Stavanger / Sola', coordinate=(58.88333, 5.63333), altitude=0, country='Norway'),
-    'EPGD': station(name='Gdansk-Rebiechowo', coordinate=(54.38333, 18.46667), altitude=135, country='Poland'),
-    'EPKK': station(name='Krakow', coordinate=(50.08333, 19.8), altitude=237, country='Poland'),
-    'EPKO': station(name='Koszalin', coordinate=(54.2, 16.15), altitude=32, country='Poland'),
-    'EPKT': station(name='Katowice', coordinate=(50.23333, 19.03333), altitude=284, country='Poland'),
-    'EPPO': station(name='Poznan', coordinate=(52.41667, 16.83333), altitude=86, country='Poland'),
-    'EPRZ': station(name='Rzeszow-Jasionka', coordinate=(50.1, 22.05), altitude=200, country='Poland'),
-    'EPSC': station(name='Szczecin', coordinate=(53.4, 14.61667), altitude=1, country='Poland'),
-    'EPSK': station(name='Slupsk', coordinate=(54.46667, 17.01667), altitude=25, country='Poland'),
-    'EPWA': station(name='Warszawa-Okecie', coordinate=(52.16667, 20.96667), altitude=106, country='Poland'),
-    'EPWR': station(name='Wroclaw Ii', coordinate=(51.1, 16.88333), altitude=120, country='Poland'),
-    'EPZG': station(name='Zielona Gora', coordinate=(51.93333, 15.53333), altitude=192, country='Poland'),
-    'EQYG': station(name='NSA Souda Bay', coordinate=(35.53333, 24.15), altitude=146, country='Greece'),
-    'EQYN': station(name='Naples, Navsuppact', coordinate=(40.88333, 14.28333), altitude=91, country='Italy'),
-    'EQYR': station(name='Rota, Naval Station', coordinate=(36.65, -6.33333), altitude=26, country='Spain'),
-    'EQYS': station(name='Sigonella, NAS', coordinate=(37.4, 14.91667), altitude=25, country='Italy'),
-    'ESCF': station(name='Linkoping / Malmen', coordinate=(58.4, 15.51667), altitude=93, country='Sweden'),
-    'ESCL': station(name='Soderhamn', coordinate=(61.26667, 17.1), altitude=26, country='Sweden'),
-    'ESCM': station(name='Uppsala', coordinate=(59.88333, 17.6), altitude=21, country='Sweden'),
-    'ESDA': station(name='Ljungbyhed, Ljungbyhed, SWE-AFB', coordinate=(56.08528, 13.20722), altitude=52, country='Sweden'),
-    'ESDB': station(name='Angelholm', coordinate=(56.3, 12.85), altitude=20, country='Sweden'),
-    'ESDF': station(name='Ronneby', coordinate=(56.26667, 15.28333), altitude=58, country='Sweden'),
-    'ESGG': station(name='Goteborg / Landvetter', coordinate=(57.66667, 12.3), altitude=169, country='Sweden'),
-    'ESGJ': station(name='Jonkoping Flygplats', coordinate=(57.76667, 14.08333), altitude=226, country='Sweden'),
-    'ESGP': station(name='Goteborg / Save', coordinate=(57.78333, 11.88333), altitude=20, country='Sweden'),
-    'ESGR': station(name='Skovde Flygplats', coordinate=(58.45, 13.96667), altitude=98, country='Sweden'),
-    'ESGT': station(name='Trollhattan Private', coordinate=(58.31667, 12.35), altitude=41, country='Sweden'),
-    'ESIB': station(name='Satenas', coordinate=(58.43333, 12.7), altitude=54, country='Sweden'),
-    'ESKM': station(name='Siljan / Mora', coordinate=(60.96667, 14.51667), altitude=193, country='Sweden'),
-    'ESKN': station(name='Stockholm/Skavsta', coordinate=(58.78333, 16.91667), altitude=43, country='Sweden'),
-    'ESMK': station(name='Kristianstad / Everod', coordinate=(55.91667, 14.08333), altitude=23, country='Sweden'),
-    'ESMQ': station(name='Kalmar', coordinate=(56.73333, 16.3), altitude=16, country='Sweden'),
-    'ESMS': station(name='Malmo / Sturup', coordinate=(55.55, 13.36667), altitude=106, country='Sweden'),
-    'ESMT': station(name='Halmstad Swedish Air Force Base', coordinate=(56.68333, 12.83333), altitude=30, country='Sweden'),
-    'ESMV': station(name='Hagshult', coordinate=(57.3, 14.13333), altitude=169, country='Sweden'),
-    'ESMX': station(name='Vaxjo', coordinate=(56.85, 14.83333), altitude=199, country='Sweden'),
-    'ESNG': station(name='Gallivare', coordinate=(67.15, 20.65), altitude=359, country='Sweden'),
-    'ESNJ': station(name='Jokkmokk', coordinate=(66.63333, 19.65), altitude=263, country='Sweden'),
-    'ESNK': station(name='Kramfors Flygplats', coordinate=(63.05, 17.76667), altitude=10, country='Sweden'),
-    'ESNL': station(name='Lycksele', coordinate=(64.5475, 18.7175), altitude=211, country='Sweden'),
-    'ESNN': station(name='Sundsvall-Harnosand Flygplats', coordinate=(62.53333, 17.45), altitude=4, country='Sweden'),
-    'ESNO': station(name='Ornskoldsvik Airport', coordinate=(63.4, 18.96667), altitude=103, country='Sweden'),
-    'ESNQ': station(name='Kiruna Airport', coordinate=(67.81667, 20.33333), altitude=452, country='Sweden'),
-    'ESNS': station(name='Skelleftea Airport', coordinate=(64.63333, 21.08333), altitude=49, country='Sweden'),
-    'ESNU': station(name='Umea Flygplats', coordinate=(63.8, 20.28333), altitude=7, country='Sweden'),
-    'ESNY': station(name='Soderhamn', coordinate=(61.26139, 17.09917), altitude=27, country='Sweden'),
-    'ESOE': station(name='Orebro Private', coordinate=(59.23333, 15.05), altitude=57, country='Sweden'),
-    'ESOK': station(name='Karlstad', coordinate=(59.44472, 13.3375), altitude=107, country='Sweden'),
-    'ESOW': station(name='Vasteras / Hasslo', coordinate=(59.58333, 16.63333), altitude=6, country='Sweden'),
-    'ESPA': station(name='Lulea / Kallax', coordinate=(65.55, 22.13333), altitude=17, country='Sweden'),
-    'ESPC': station(name='Ostersund / Froson', coordinate=(63.18333, 14.5), altitude=376, country='Sweden'),
-    'ESPD': station(name='Gunnarn', coordinate=(64.96667, 17.7), altitude=280, country='Sweden'),
-    'ESPE': station(name='Vidsel', coordinate=(65.86667, 20.13333), altitude=180, country='Sweden'),
-    'ESSA': station(name='Stockholm / Arlanda', coordinate=(59.65, 17.95), altitude=38, country='Sweden'),
-    'ESSB': station(name='Stockholm / Bromma', coordinate=(59.35, 17.95), altitude=14, country='Sweden'),
-    'ESSD': station(name='Borlange', coordinate=(60.43333, 15.51667), altitude=145, country='Sweden'),
-    'ESSF': station(name='Hultsfred Swedish Air Force Base', coordinate=(57.51667, 15.83333), altitude=112, country='Sweden'),
-    'ESSK': station(name='Gavle / Sandviken Air Force Base', coordinate=(60.6, 16.95), altitude=79, country='Sweden'),
-    'ESSL': station(name='Linkoping / Saab', coordinate=(58.4, 15.68333), altitude=52, country='Sweden'),
-    'ESSP': station(name='Norrkoping', coordinate=(58.58333, 16.15), altitude=34, country='Sweden'),
-    'ESSQ': station(name='Karlstad Flygplats', coordinate=(59.36667, 13.46667), altitude=46, country='Sweden'),
-    'ESSV': station(name='Visby Flygplats', coordinate=(57.66667, 18.35), altitude=51, country='Sweden'),
-    'ESTL': station(name='Ljungbyhed', coordinate=(56.06667, 13.2), altitude=43, country='Sweden'),
-    'ETAD': station(name='Spangdahlem', coordinate=(49.98333, 6.7), altitude=365, country='Germany'),
-    'ETAR': station(name='Ramstein', coordinate=(49.43333, 7.6), altitude=238, country='Germany'),
-    'ETAS': station(name='Sembach United States Air Force Operated Base In Foreign Country', coordinate=(49.5, 7.86667), altitude=321, country='Germany'),
-    'ETBA': station(name='Aachen / Merzbruck', coordinate=(50.81667, 6.18333), altitude=191, country='Germany'),
-    'ETCE': station(name='Mebstetten / Albstadt', coordinate=(50.11667, 9.11667), altitude=475, country='Germany'),
-    'ETEB': station(name='Ansbach / Katterbach', coordinate=(49.31667, 10.63333), altitude=467, country='Germany'),
-    'ETEH': station(name='Bad Kreuznach', coordinate=(49.85, 7.88333), altitude=103, country='Germany'),
-    'ETEU': station(name='Giebelstadt', coordinate=(49.65, 9.96667), altitude=298, country='Germany'),
-    'ETGB': station(name='Bergen', coordinate=(52.81667, 9.93333), altitude=70, country='Germany'),
-    'ETGG': station(name='Gluecksburg / Meierwik', coordinate=(54.83333, 9.5), altitude=27, country='Germany'),
-    'ETGI': station(name='Idar-Oberstein', coordinate=(49.7, 7.33333), altitude=376, country='Germany'),
-    'ETGK': station(name='Kuemmersruck', coordinate=(49.43333, 11.9), altitude=419, country='Germany'),
-    'ETGW': station(name='Wittstock', coordinate=(53.2, 12.51667), altitude=72, country='Germany'),
-    'ETGY': station(name='Kalkar', coordinate=(51.73333, 6.26667), altitude=31, country='Germany'),
-    'ETGZ': station(name='Messstetten', coordinate=(48.18333, 9.0), altitude=920, country='Germany'),
-    'ETHA': station(name='Altenstadt', coordinate=(47.83333, 10.86667), altitude=739, country='Germany'),
-    'ETHB': station(name='Bueckeburg', coordinate=(52.28333, 9.08333), altitude=70, country='Germany'),
-    'ETHC': station(name='Celle', coordinate=(52.6, 10.01667), altitude=39, country='Germany'),
-    'ETHE': station(name='Rheine-Bentlage', coordinate=(52.3, 7.38333), altitude=40, country='Germany'),
-    'ETHF': station(name='Fritzlar', coordinate=(51.11667, 9.28333), altitude=172, country='Germany'),
-    'ETHI': station(name='Itzehoe', coordinate=(54.0, 9.58333), altitude=25, country='Germany'),
-    'ETHL': station(name='Laupheim', coordinate=(48.21667, 9.91667), altitude=538, country='Germany'),
-    'ETHM': station(name='Mendig', coordinate=(50.36667, 7.31667), altitude=182, country='Germany'),
-    'ETHN': station(name='Niederstetten', coordinate=(49.4, 9.96667), altitude=468, country='Germany'),
-    'ETHR': station(name='Roth', coordinate=(49.21667, 11.1), altitude=388, country='Germany'),
-    'ETHS': station(name='Fassberg', coordinate=(52.91667, 10.18333), altitude=75, country='Germany'),
-    'ETHT': station(name='Cottbus Flugplatz', coordinate=(51.76667, 14.3), altitude=67, country='Germany'),
-    'ETIC': station(name='Grafenwoehr', coordinate=(49.7, 11.95), altitude=415, country='Germany'),
-    'ETID': station(name='Hanau', coordinate=(50.16667, 8.96667), altitude=112, country='Germany'),
-    'ETIE': station(name='Heidelberg', coordinate=(49.4, 8.65), altitude=110, country='Germany'),
-    'ETIH': station(name='Hohenfels', coordinate=(49.21667, 11.83333), altitude=442, country='Germany'),
-    'ETIK': station(name='Illesheim', coordinate=(49.46667, 10.38333), altitude=325, country='Germany'),
-    'ETIN': station(name='Kitzingen Usa \\ Af', coordinate=(49.75, 10.2), altitude=210, country='Germany'),
-    'ETME': station(name='Eggebek', coordinate=(54.63333, 9.35), altitude=20, country='Germany'),
-    'ETMK': station(name='Kiel-Holtenau', coordinate=(54.38333, 10.15), altitude=31, country='Germany'),
-    'ETMN': station(name='Nordholz', coordinate=(53.76667, 8.66667), altitude=23, country='Germany'),
-    'ETND': station(name='Diepholz', coordinate=(52.58333, 8.35), altitude=39, country='Germany'),
-    'ETNG': station(name='Geilenkirchen', coordinate=(50.96667, 6.05), altitude=90, country='Germany'),
-    'ETNH': station(name='Hohn', coordinate=(54.31667, 9.53333), altitude=12, country='Germany'),
-    'ETNJ': station(name='Jever', coordinate=(53.53333, 7.88333), altitude=7, country='Germany'),
-    'ETNL': station(name='Laage', coordinate=(53.91667, 12.28333), altitude=40, country='Germany'),
-    'ETNN': station(name='Noervenich', coordinate=(50.83333, 6.66667), altitude=118, country='Germany'),
-    'ETNP': station(name='Hopsten', coordinate=(52.33333, 7.53333), altitude=39, country='Germany'),
-    'ETNR': station(name='Preschen', coordinate=(51.66667, 14.63333), altitude=100, country='Germany'),
-    'ETNS': station(name='Schleswig-Jagel', coordinate=(54.46667, 9.51667), altitude=22, country='Germany'),
-    'ETNT': station(name='Wittmundhaven', coordinate=(53.55, 7.66667), altitude=8, country='Germany'),
-    'ETNU': station(name='Trollenhagen', coordinate=(53.6, 13.31667), altitude=71, country='Germany'),
-    'ETNW': station(name='Wunstorf', coordinate=(52.45, 9.43333), altitude=57, country='Germany'),
-    'ETOR': station(name='Coleman Mannheim', coordinate=(49.56667, 8.46667), altitude=96, country='Germany'),
-    'ETOU': station(name='Wiesbaden', coordinate=(50.05, 8.33333), altitude=140, country='Germany'),
-    'ETSA': station(name='Landsberg', coordinate=(48.06667, 10.9), altitude=623, country='Germany'),
-    'ETSB': station(name='Buechel', coordinate=(50.16667, 7.06667), altitude=478, country='Germany'),
-    'ETSE': station(name='Erding', coordinate=(48.31667, 11.95), altitude=462, country='Germany'),
-    'ETSF': station(name='Fuerstenfeldbruck', coordinate=(48.2, 11.26667), altitude=519, country='Germany'),
-    'ETSH': station(name='Holzdorf', coordinate=(51.76667, 13.18333), altitude=79, country='Germany'),
-    'ETSI': station(name='Ingolstadt', coordinate=(48.71667, 11.53333), altitude=367, country='Germany'),
-    'ETSL': station(name='Lechfeld', coordinate=(48.18333, 10.86667), altitude=555, country='Germany'),
-    'ETSM': station(name='Memmingen', coordinate=(47.98333, 10.23333), altitude=634, country='Germany'),
-    'ETSN': station(name='Neuburg / Donau', coordinate=(48.71667, 11.21667), altitude=380, country='Germany'),
-    'ETSP': station(name='Pferdsfeld', coordinate=(49.85, 7.6), altitude=396, country='Germany'),
-    'ETUL': station(name='Laarbruch', coordinate=(51.6, 6.15), altitude=32, country='Germany'),
-    'ETUN': station(name='Nordhorn', coordinate=(52.45, 7.16667), altitude=26, country='Germany'),
-    'ETUO': station(name='Guetersloh', coordinate=(51.91667, 8.3), altitude=72, country='Germany'),
-    'ETUR': station(name='Brueggen', coordinate=(51.2, 6.13333), altitude=73, country='Germany'),
-    'ETWM': station(name='Meppen-Mil', coordinate=(52.72333, 7.32639), altitude=21, country='Germany'),
-    'EVLA': station(name='Liepaja International Airport', coordinate=(56.51667, 21.08333), altitude=5, country='Latvia'),
-    'EVRA': station(name='Riga International Airport', coordinate=(56.91667, 23.96667), altitude=10, country='Latvia'),
-    'EYKA': station(name='Kaunas', coordinate=(54.9, 23.92), altitude=77, country='Lithuania'),
-    'EYPA': station(name='Palanga Intl.', coordinate=(55.92, 21.05), altitude=10, country='Lithuania'),
-    'EYSA': station(name='Siauliai Intl./Mil.', coordinate=(55.89389, 23.395), altitude=135, country='Lithuania'),
-    'EYVI': station(name='Vilnius', coordinate=(54.63333, 25.1), altitude=162, country='Lithuania'),
-    'FAAB': station(name='Alexander Bay', coordinate=(-28.56667, 16.53333), altitude=21, country='South Africa'),
-    'FAAN': station(name='Aliwal North', coordinate=(-30.71667, 26.71667), altitude=1348, country='South Africa'),
-    'FABL': station(name='Bloemfontein, Bloemfontein Airport', coordinate=(-29.1, 26.3), altitude=1354, country='South Africa'),
-    'FABM': station(name='Bethlehem Airport', coordinate=(-28.25, 28.33333), altitude=1686, country='South Africa'),
-    'FABY': station(name='Beaufort West', coordinate=(-32.35, 22.58333), altitude=842, country='South Africa'),
-    'FACL': station(name='Carolina', coordinate=(-26.06667, 30.11667), altitude=1693, country='South Africa'),
-    'FACT': station(name='Cape Town, Cape Town International Airport', coordinate=(-33.98333, 18.6), altitude=42, country='South Africa'),
-    'FACV': station(name='Calvinia', coordinate=(-31.46667, 19.76667), altitude=975, country='South Africa'),
-    'FADA': station(name='De Aar', coordinate=(-30.65, 24.01667), altitude=1247, country='South Africa'),
-    'FADN': station(name='Durban, Durban International Airport', coordinate=(-29.96667, 30.95), altitude=14, country='South Africa'),
-    'FADY': station(name='De Aar', coordinate=(-30.63333, 23.91667), altitude=384, country='South Africa'),
-    'FAEL': station(name='East London, East London Airport', coordinate=(-33.03333, 27.83333), altitude=125, country='South Africa'),
-    'FAEO': station(name='Ermelo', coordinate=(-26.5, 29.98333), altitude=1737, country='South Africa'),
-    'FAER': station(name='Ellisras', coordinate=(-23.72639, 27.68833), altitude=851, country='South Africa'),
-    'FAFF': station(name='Frankfort', coordinate=(-27.26667, 28.5), altitude=1499, country='South Africa'),
-    'FAFR': station(name='Fraserburg', coordinate=(-31.91667, 21.51667), altitude=1264, country='South Africa'),
-    'FAGB': station(name='Gobabis', coordinate=(-22.46667, 18.96667), altitude=1440, country='Namibia'),
-    'FAGE': station(name='Gough Island', coordinate=(-40.35, -9.88333), altitude=54, country='South Africa'),
-    'FAGG': station(name='George, George Airport', coordinate=(-34.0, 22.38333), altitude=193, country='South Africa'),
-    'FAGM': station(name='Rand', coordinate=(-26.25, 28.0), altitude=1668, country='South Africa'),
-    'FAGR': station(name='Graaff Reinet', coordinate=(-32.25, 24.53333), altitude=752, country='South Africa'),
-    'FAGY': station(name='Greytown', coordinate=(-29.11667, 30.56667), altitude=1100, country='South Africa'),
-    'FAHS': station(name='Hoedspruit', coordinate=(-24.36667, 31.03333), altitude=513, country='South Africa'),
-    'FAIR': station(name='Pretoria Irene', coordinate=(-25.91667, 28.21667), altitude=1523, country='South Africa'),
-    'FAJS': station(name='Johannesburg International Airport', coordinate=(-26.13333, 28.23333), altitude=1694, country='South Africa'),
-    'FAKD': station(name='Klerksdorp', coordinate=(-26.86667, 26.71667), altitude=1355, country='South Africa'),
-    'FAKM': station(name='Kimberley, Kim-Apt', coordinate=(-28.8, 24.76667), altitude=1198, country='South Africa'),
-    'FALA': station(name='Lanseria', coordinate=(-25.93333, 27.93333), altitude=1377, country='South Africa'),
-    'FALT': station(name='Lichtenburg', coordinate=(-26.18333, 26.18333), altitude=1486, country='South Africa'),
-    'FALW': station(name='Langebaanweg', coordinate=(-32.96667, 18.16667), altitude=31, country='South Africa'),
-    'FALY': station(name='Ladysmith', coordinate=(-28.56667, 29.76667), altitude=1078, country='South Africa'),
-    'FAMB': station(name='Middelburg', coordinate=(-31.48333, 25.03333), altitude=1270, country='South Africa'),
-    'FAME': station(name='Marion Island', coordinate=(-46.88333, 37.86667), altitude=22, country='South Africa'),
-    'FAMG': station(name='Margate', coordinate=(-30.85, 30.35), altitude=151, country='South Africa'),
-    'FAMM': station(name='Mafikeng Intl. Ad', coordinate=(-25.78333, 25.53333), altitude=1281, country='South Africa'),
-    'FAMO': station(name='Mossel Bay Cape Saint Blaize', coordinate=(-34.18333, 22.15), altitude=59, country='South Africa'),
-    'FANC': station(name='Newcastle', coordinate=(-27.78333, 29.98333), altitude=1251, country='South Africa'),
-    'FANS': station(name='Nelspruit', coordinate=(-25.43333, 30.98333), altitude=671, country='South Africa'),
-    'FAOB': station(name='Overberg', coordinate=(-34.6, 20.28333), altitude=75, country='South Africa'),
-    'FAOH': station(name='Oudtshoorn', coordinate=(-33.56667, 22.21667), altitude=359, country='South Africa'),
-    'FAPB': station(name='Pietersburg', coordinate=(-23.86667, 29.45), altitude=1228, country='South Africa'),
-    'FAPE': station(name='Port Elizabeth, Port E Apt', coordinate=(-33.98333, 25.6), altitude=61, country='South Africa'),
-    'FAPG': station(name='Plettenberg Bay', coordinate=(-34.08806, 23.32944), altitude=139, country='South Africa'),
-    'FAPH': station(name='Phalaborwa', coordinate=(-23.93333, 31.15), altitude=427, country='South Africa'),
-    'FAPI': station(name='Pietersburg Civil', coordinate=(-23.9, 29.46667), altitude=1327, country='South Africa'),
-    'FAPJ': station(name='Port St Johns', coordinate=(-31.63333, 29.55), altitude=47, country='South Africa'),
-    'FAPM': station(name='Pietermaritzburg', coordinate=(-29.65, 30.4), altitude=739, country='South Africa'),
-    'FAPR': station(name='Pretoria', coordinate=(-25.73333, 28.18333), altitude=1330, country='South Africa'),
-    'FAPS': station(name='Potchefstroom', coordinate=(-26.67111, 27.08194), altitude=1378, country='South Africa'),
-    'FAQT': station(name='Queenstown', coordinate=(-31.9, 26.86667), altitude=1094, country='South Africa'),
-    'FARB': station(name='Richard Bay', coordinate=(-28.8, 32.1), altitude=47, country='South Africa'),
-    'FARG': station(name='Rustenburg', coordinate=(-25.64417, 27.27111), altitude=1128, country='South Africa'),
-    'FASB': station(name='Springbok', coordinate=(-29.66667, 17.86667), altitude=1006, country='South Africa'),
-    'FASI': station(name='Springs', coordinate=(-26.24833, 28.3975), altitude=1628, country='South Africa'),
-    'FASR': station(name='Standerton', coordinate=(-26.93333, 29.21667), altitude=1581, country='South Africa'),
-    'FASS': station(name='Sishen', coordinate=(-27.64972, 23.0), altitude=1173, country='South Africa'),
-    'FATC': station(name='Tristan Da Cunha', coordinate=(-37.05, -12.31667), altitude=23, country='South Africa'),
-    'FATZ': station(name='Tzaneen', coordinate=(-23.81667, 30.33333), altitude=583, country='South Africa'),
-    'FAUL': station(name='Ulundi', coordinate=(-28.31833, 31.41778), altitude=525, country='South Africa'),
-    'FAUP': station(name='Upington, Up-Apt', coordinate=(-28.4, 21.26667), altitude=839, country='South Africa'),
-    'FAUT': station(name='Umtata', coordinate=(-31.53333, 28.66667), altitude=742, country='South Africa'),
-    'FAVB': station(name='Vryburg', coordinate=(-26.95, 24.63333), altitude=1234, country='South Africa'),
-    'FAVG': station(name='Durban/Virginia', coordinate=(-29.77056, 31.06028), altitude=6, country='South Africa'),
-    'FAVR': station(name='Vredendal', coordinate=(-31.66667, 18.5), altitude=34, country='South Africa'),
-    'FAVV': station(name='Vereeniging', coordinate=(-26.57472, 27.9625), altitude=1483, country='South Africa'),
-    'FAVY': station(name='Vryheid', coordinate=(-27.78333, 30.8), altitude=1158, country='South Africa'),
-    'FAWB': station(name='Wonderboom / Pretoria', coordinate=(-25.65, 28.21667), altitude=1248, country='South Africa'),
-    'FAWI': station(name='Witbank', coordinate=(-25.83083, 29.19222), altitude=1553, country='South Africa'),
-    'FAWK': station(name='Waterkloof (SAAF)', coordinate=(-25.83333, 28.21667), altitude=1498, country='South Africa'),
-    'FAWM': station(name='Welkom', coordinate=(-28.0, 26.66667), altitude=1338, country='South Africa'),
-    'FBFT': station(name='Francistown', coordinate=(-21.21667, 27.5), altitude=1001, country='Botswana'),
-    'FBGZ': station(name='Ghanzi', coordinate=(-21.7, 21.65), altitude=1131, country='Botswana'),
-    'FBJW': station(name='Jwaneng', coordinate=(-24.6, 24.66667), altitude=1189, country='Botswana'),
-    'FBKE': station(name='Kasane', coordinate=(-17.81667, 25.15), altitude=968, country='Botswana'),
-    'FBLT': station(name='Letlhakane', coordinate=(-21.41667, 25.6), altitude=986, country='Botswana'),
-    'FBMN': station(name='Maun', coordinate=(-19.98333, 23.41667), altitude=945, country='Botswana'),
-    'FBSK': station(name='Seretse Khama International Airport', coordinate=(-24.21667, 25.91667), altitude=1005, country='Botswana'),
-    'FBSN': station(name='Sua-Pan', coordinate=(-20.46667, 25.98333), altitude=903, country='Botswana'),
-    'FBSP': station(name='Selebi Phikwe', coordinate=(-22.05528, 27.82028), altitude=892, country='Botswana'),
-    'FBSW': station(name='Shakawe', coordinate=(-18.36667, 21.85), altitude=1032, country='Botswana'),
-    'FBTE': station(name='Tshane', coordinate=(-24.01667, 21.88333), altitude=1118, country='Botswana'),
-    'FBTS': station(name='Tsabong', coordinate=(-26.05, 22.45), altitude=960, country='Botswana'),
-    'FCBB': station(name='Brazzaville / Maya-Maya', coordinate=(-4.25, 15.25), altitude=319, country='Congo, Republic of the'),
-    'FCBD': station(name='Djambala', coordinate=(-2.53333, 14.76667), altitude=791, country='Congo, Republic of the'),
-    'FCBM': station(name='Mouyondzi', coordinate=(-3.98333, 13.91667), altitude=509, country='Congo, Republic of the'),
-    'FCBO': station(name="M'Pouya", coordinate=(-2.61667, 16.21667), altitude=311, country='Congo, Republic of the'),
-    'FCBS': station(name='Sibiti', coordinate=(-3.68333, 13.35), altitude=530, country='Congo, Republic of the'),
-    'FCOG': station(name='Gamboma', coordinate=(-1.86667, 15.86667), altitude=476, country='Congo, Republic of the'),
-    'FCOI': station(name='Impfondo', coordinate=(1.61667, 18.06667), altitude=335, country='Congo, Republic of the'),
-    'FCOM': station(name='Makoua', coordinate=(-0.01667, 15.58333), altitude=394, country='Congo, Republic of the'),
-    'FCOS': station(name='Souanke', coordinate=(2.06667, 14.13333), altitude=549, country='Congo, Republic of the'),
-    'FCOU': station(name='Ouesso', coordinate=(1.61667, 16.05), altitude=352, country='Congo, Republic of the'),
-    'FCPA': station(name='Makabana', coordinate=(-3.48333, 12.61667), altitude=160, country='Congo, Republic of the'),
-    'FCPL': station(name='Loubomo', coordinate=(-4.2, 12.7), altitude=329, country='Congo, Republic of the'),
-    'FCPP': station(name='Pointe-Noire', coordinate=(-4.81667, 11.9), altitude=17, country='Congo, Republic of the'),
-    'FDMS': station(name='Manzini / Matsapa Airport', coordinate=(-26.53333, 31.3), altitude=641, country='Swaziland'),
-    'FEFA': station(name='Alindao', coordinate=(5.05, 21.2), altitude=447, country='Central African Republic'),
-    'FEFB': station(name='Obo', coordinate=(5.4, 26.5), altitude=650, country='Central African Republic'),
-    'FEFF': station(name='Bangui', coordinate=(4.4, 18.51667), altitude=365, country='Central African Republic'),
-    'FEFG': station(name='Bangassou', coordinate=(4.73333, 22.83333), altitude=499, country='Central African Republic'),
-    'FEFI': station(name='Birao', coordinate=(10.28333, 22.78333), altitude=463, country='Central African Republic'),
-    'FEFL': station(name='Bossembele', coordinate=(5.26667, 17.63333), altitude=673, country='Central African Republic'),
-    'FEFM': station(name='Bambari', coordinate=(5.85, 20.65), altitude=474, country='Central African Republic'),
-    'FEFN': station(name="N'Dele", coordinate=(8.4, 20.65), altitude=510, country='Central African Republic'),
-    'FEFO': station(name='Bouar', coordinate=(5.96667, 15.63333), altitude=1019, country='Central African Republic'),
-    'FEFR': station(name='Bria', coordinate=(6.53333, 21.98333), altitude=583, country='Central African Republic'),
-    'FEFS': station(name='Bossangoa', coordinate=(6.48333, 17.43333), altitude=464, country='Central African Republic'),
-    'FEFT': station(name='Berberati', coordinate=(4.25, 15.8), altitude=582, country='Central African Republic'),
-    'FEFY': station(name='Yalinga', coordinate=(6.5, 23.26667), altitude=601, country='Central African Republic'),
-    'FGSL': station(name='Malabo/Fernando Poo', coordinate=(3.75, 8.76667), altitude=56, country='Equatorial Guinea'),
-    'FHAW': station(name='Wide Awake Field Ascension Island', coordinate=(-7.96667, -14.4), altitude=86, country='Saint Helena'),
-    'FIMP': station(name='Plaisance Mauritius', coordinate=(-20.43333, 57.66667), altitude=55, country='Mauritius'),
-    'FIMR': station(name='Rodrigues', coordinate=(-19.68333, 63.41667), altitude=58, country='Mauritius'),
-    'FJDG': station(name='NSF DIEGO GARCIA', coordinate=(-7.3, 72.4), altitude=3, country='British Indian Ocean Territory'),
-    'FKAB': station(name='Banyo', coordinate=(6.78333, 11.81667), altitude=1110, country='Cameroon'),
-    'FKAF': station(name='Bafia', coordinate=(4.73333, 11.25), altitude=500, country='Cameroon'),
-    'FKAG': station(name='Abong-Mbang', coordinate=(3.96667, 13.2), altitude=693, country='Cameroon'),
-    'FKAL': station(name='Lomie', coordinate=(3.15, 13.61667), altitude=624, country='Cameroon'),
-    'FKAM': station(name='Meiganga', coordinate=(6.53333, 14.36667), altitude=1027, country='Cameroon'),
-    'FKAN': station(name='Nkongsamba', coordinate=(4.95, 9.93333), altitude=816, country='Cameroon'),
-    'FKAO': station(name='Betare-Oya', coordinate=(5.6, 14.06667), altitude=815, country='Cameroon'),
-    'FKAY': station(name='Yoko', coordinate=(5.55, 12.36667), altitude=1027, country='Cameroon'),
-    'FKKA': station(name='Maroua-Salak', coordinate=(10.45, 14.25), altitude=423, country='Cameroon'),
-    'FKKB': station(name='Kribi', coordinate=(2.95, 9.9), altitude=10, country='Cameroon'),
-    'FKKC': station(name='Tiko', coordinate=(4.08333, 9.36667), altitude=52, country='Cameroon'),
-    'FKKD': station(name='Douala Obs.', coordinate=(4.0, 9.73333), altitude=10, country='Cameroon'),
-    'FKKF': station(name='Mamfe', coordinate=(5.71667, 9.28333), altitude=126, country='Cameroon'),
-    'FKKI': station(name='Batouri', coordinate=(4.46667, 14.36667), altitude=656, country='Cameroon'),
-    'FKKM': station(name='Koundja', coordinate=(5.65, 10.75), altitude=1208, country='Cameroon'),
-    'FKKN': station(name='Ngaoundere', coordinate=(7.35, 13.56667), altitude=1114, country='Cameroon'),
-    'FKKR': station(name='Garoua', coordinate=(9.33333, 13.38333), altitude=242, country='Cameroon'),
-    'FKKV': station(name='Bamenda', coordinate=(6.05, 10.11667), altitude=1239, country='Cameroon'),
-    'FKKY': station(name='Younde Ii', coordinate=(3.83333, 11.53333), altitude=751, country='Cameroon'),
-    'FKYS': station(name='Yaounde', coordinate=(3.83333, 11.51667), altitude=751, country='Cameroon'),
-    'FLBA': station(name='Mbala', coordinate=(-8.85, 31.33333), altitude=1673, country='Zambia'),
-    'FLCH': station(name='Choma', coordinate=(-16.83333, 27.06667), altitude=1213, country='Zambia'),
-    'FLCP': station(name='Chipata', coordinate=(-13.55, 32.58333), altitude=1028, country='Zambia'),
-    'FLIK': station(name='Isoka', coordinate=(-10.11667, 32.63333), altitude=1360, country='Zambia'),
-    'FLKB': station(name='Kawambwa', coordinate=(-9.8, 29.08333), altitude=1323, country='Zambia'),
-    'FLKO': station(name='Kaoma', coordinate=(-14.8, 24.8), altitude=1213, country='Zambia'),
-    'FLKS': station(name='Kasama', coordinate=(-10.21667, 31.13333), altitude=1382, country='Zambia'),
-    'FLKW': station(name='Kabwe', coordinate=(-14.45, 28.46667), altitude=1206, country='Zambia'),
-    'FLLC': station(name='Lusaka City Airport', coordinate=(-14.45, 28.46667), altitude=1280, country='Zambia'),
-    'FLLD': station(name='Lundazi', coordinate=(-12.28333, 33.2), altitude=1143, country='Zambia'),
-    'FLLI': station(name='Livingstone', coordinate=(-17.81667, 25.81667), altitude=985, country='Zambia'),
-    'FLLS': station(name='Lusaka Internationalairport', coordinate=(-15.31667, 28.45), altitude=1152, country='Zambia'),
-    'FLMA': station(name='Mansa', coordinate=(-11.1, 28.85), altitude=1382, country='Zambia'),
-    'FLMF': station(name='Mfuwe', coordinate=(-13.25889, 31.93667), altitude=573, country='Zambia'),
-    'FLMG': station(name='Mongu', coordinate=(-15.25, 23.15), altitude=1052, country='Zambia'),
-    'FLMP': station(name='Mpika', coordinate=(-11.9, 31.43333), altitude=1400, country='Zambia'),
-    'FLMW': station(name='Mwinilunga', coordinate=(-11.75, 24.43333), altitude=1361, country='Zambia'),
-    'FLND': station(name='Ndola', coordinate=(-13.0, 28.65), altitude=1269, country='Zambia'),
-    'FLPA': station(name='Kasempa', coordinate=(-13.53333, 25.85), altitude=1234, country='Zambia'),
-    'FLPE': station(name='Petauke', coordinate=(-14.25, 31.28333), altitude=1035, country='Zambia'),
-    'FLPO': station(name='Kabompo', coordinate=(-13.6, 24.2), altitude=1075, country='Zambia'),
-    'FLSE': station(name='Serenje', coordinate=(-13.23333, 30.21667), altitude=1384, country='Zambia'),
-    'FLSN': station(name='Senanga', coordinate=(-16.1, 23.26667), altitude=1027, country='Zambia'),
-    'FLSS': station(name='Sesheke', coordinate=(-17.46667, 24.3), altitude=949, country='Zambia'),
-    'FLSW': station(name='Solwezi', coordinate=(-12.18333, 26.38333), altitude=1386, country='Zambia'),
-    'FLZB': station(name='Zambezi', coordinate=(-13.53333, 23.11667), altitude=1077, country='Zambia'),
-    'FMCH': station(name='Hahaya International Airport', coordinate=(-11.53333, 43.26667), altitude=29, country='Comoros'),
-    'FMCV': station(name='Ouani Anjouan', coordinate=(-12.11667, 44.43333), altitude=19, country='Comoros'),
-    'FMCZ': station(name='Dzaoudzi / Pamanzi Mayotte', coordinate=(-12.8, 45.28333), altitude=8, country='Comoros'),
-    'FMEE': station(name='Saint-Denis / Gillot', coordinate=(-20.88333, 55.51667), altitude=21, country='Reunion'),
-    'FMEP': station(name='Saint-Pierre', coordinate=(-21.33333, 55.48333), altitude=52, country='Reunion'),
-    'FMME': station(name='Antsirabe', coordinate=(-19.81667, 47.06667), altitude=1523, country='Madagascar'),
-    'FMMH': station(name='Mahanoro', coordinate=(-19.83333, 48.8), altitude=5, country='Madagascar'),
-    'FMMI': station(name='Antananarivo / Ivato', coordinate=(-18.8, 47.48333), altitude=1279, country='Madagascar'),
-    'FMMO': station(name='Maintirano', coordinate=(-18.05, 44.03333), altitude=23, country='Madagascar'),
-    'FMMS': station(name='Sainte-Marie Aerodrome', coordinate=(-17.08333, 49.81667), altitude=2, country='Madagascar'),
-    'FMMT': station(name='Tamatave', coordinate=(-18.11667, 49.4), altitude=5, country='Madagascar'),
-    'FMMV': station(name='Morondava', coordinate=(-20.28333, 44.31667), altitude=7, country='Madagascar'),
-    'FMNA': station(name='Diego-Suarez', coordinate=(-12.35, 49.3), altitude=114, country='Madagascar'),
-    'FMND': station(name='Andapa', coordinate=(-14.65, 49.61667), altitude=473, country='Madagascar'),
-    'FMNH': station(name='Antalaha', coordinate=(-14.88333, 50.25), altitude=87, country='Madagascar'),
-    'FMNL': station(name='Analalava', coordinate=(-14.63333, 47.76667), altitude=105, country='Madagascar'),
-    'FMNM': station(name='Majunga', coordinate=(-15.66667, 46.35), altitude=26, country='Madagascar'),
-    'FMNN': station(name='Fascene Nossi-Be', coordinate=(-13.31667, 48.31667), altitude=10, country='Madagascar'),
-    'FMNQ': station(name='Besalampy', coordinate=(-16.75, 44.48333), altitude=38, country='Madagascar'),
-    'FMNS': station(name='Sambava', coordinate=(-14.28333, 50.16667), altitude=5, country='Madagascar'),
-    'FMNV': station(name='Vohemar', coordinate=(-13.36667, 50.0), altitude=6, country='Madagascar'),
-    'FMSD': station(name='Fort-Dauphin', coordinate=(-25.03333, 46.95), altitude=8, country='Madagascar'),
-    'FMSF': station(name='Fianarantsoa', coordinate=(-21.45, 47.1), altitude=1115, country='Madagascar'),
-    'FMSG': station(name='Farafangana', coordinate=(-22.8, 47.83333), altitude=8, country='Madagascar'),
-    'FMSM': station(name='Mananjary', coordinate=(-21.2, 48.36667), altitude=5, country='Madagascar'),
-    'FMSO': station(name='Ranohira', coordinate=(-22.55, 45.4), altitude=824, country='Madagascar'),
-    'FMSR': station(name='Morombe', coordinate=(-21.75, 43.36667), altitude=5, country='Madagascar'),
-    'FMST': station(name='Tulear', coordinate=(-23.38333, 43.73333), altitude=8, country='Madagascar'),
-    'FNBG': station(name='Monbaca Benguela', coordinate=(-12.58333, 13.41667), altitude=33, country='Angola'),
-    'FNCA': station(name='Cabinda', coordinate=(-5.55, 12.18333), altitude=25, country='Angola'),
-    'FNHU': station(name='Huambo Nova Lisboa', coordinate=(-12.8, 15.75), altitude=1710, country='Angola'),
-    'FNKU': station(name='Bie Silva Porto', coordinate=(-12.38333, 16.95), altitude=1701, country='Angola'),
-    'FNLU': station(name='Luanda', coordinate=(-8.85, 13.23333), altitude=74, country='Angola'),
-    'FOGM': station(name='Mouila', coordinate=(-1.86667, 11.01667), altitude=88, country='Gabon'),
-    'FOGR': station(name='Lambarene', coordinate=(-0.71667, 10.23333), altitude=27, country='Gabon'),
-    'FOOB': station(name='Bitam', coordinate=(2.08333, 11.48333), altitude=600, country='Gabon'),
-    'FOOC': station(name='Cocobeach', coordinate=(1.0, 9.6), altitude=12, country='Gabon'),
-    'FOOD': station(name='Moanda', coordinate=(-1.53333, 13.26667), altitude=572, country='Gabon'),
-    'FOOE': station(name='Mekambo', coordinate=(1.01667, 13.93333), altitude=499, country='Gabon'),
-    'FOOG': station(name='Port-Gentil', coordinate=(-0.7, 8.75), altitude=3, country='Gabon'),
-    'FOOK': station(name='Makokou', coordinate=(0.56667, 12.86667), altitude=509, country='Gabon'),
-    'FOOL': station(name='Libreville', coordinate=(0.45, 9.41667), altitude=12, country='Gabon'),
-    'FOOM': station(name='Mitzic', coordinate=(0.78333, 11.53333), altitude=583, country='Gabon'),
-    'FOON': station(name='Franceville / Mvengue', coordinate=(-1.65, 13.43333), altitude=441, country='Gabon'),
-    'FOOR': station(name='Lastoursville', coordinate=(-0.83333, 12.71667), altitude=483, country='Gabon'),
-    'FOOT': station(name='Tchibanga', coordinate=(-2.85, 11.01667), altitude=83, country='Gabon'),
-    'FOOY': station(name='Mayumba', coordinate=(-3.41667, 10.65), altitude=31, country='Gabon'),
-    'FPPR': station(name='Principe', coordinate=(1.65, 7.41667), altitude=3, country='Sao Tome and Principe'),
-    'FPST': station(name='S. Tome', coordinate=(0.38333, 6.71667), altitude=8, country='Sao Tome and Principe'),
-    'FQBR': station(name='Beira', coordinate=(-19.8, 34.9), altitude=8, country='Mozambique'),
-    'FQCB': station(name='Cuamba', coordinate=(-14.81667, 36.53333), altitude=606, country='Mozambique'),
-    'FQCH': station(name='Chimoio', coordinate=(-19.11667, 33.46667), altitude=731, country='Mozambique'),
-    'FQIN': station(name='Inhambane', coordinate=(-23.86667, 35.38333), altitude=14, country='Mozambique'),
-    'FQLC': station(name='Lichinga', coordinate=(-13.3, 35.23333), altitude=1364, country='Mozambique'),
-    'FQLU': station(name='Lumbo', coordinate=(-15.03333, 40.66667), altitude=10, country='Mozambique'),
-    'FQMA': station(name='Maputo / Mavalane', coordinate=(-25.91667, 32.56667), altitude=39, country='Mozambique'),
-    'FQMP': station(name='Mocimboa Da Praia', coordinate=(-11.35, 40.36667), altitude=27, country='Mozambique'),
-    'FQNP': station(name='Nampula', coordinate=(-15.1, 39.28333), altitude=438, country='Mozambique'),
-    'FQPB': station(name='Pemba', coordinate=(-12.98333, 40.53333), altitude=101, country='Mozambique'),
-    'FQQL': station(name='Quelimane', coordinate=(-17.88333, 36.88333), altitude=6, country='Mozambique'),
-    'FQTE': station(name='Tete', coordinate=(-16.18333, 33.58333), altitude=149, country='Mozambique'),
-    'FQTT': station(name='Tete / Chingozi', coordinate=(-16.1, 33.63333), altitude=160, country='Mozambique'),
-    'FQVL': station(name='Vilanculos', coordinate=(-22.0, 35.31667), altitude=20, country='Mozambique'),
-    'FQXA': station(name='Xai Xai', coordinate=(-25.05, 33.63333), altitude=4, country='Mozambique'),
-    'FSIA': station(name='Seychelles Inter-National Airport', coordinate=(-4.66667, 55.51667), altitude=3, country='Seychelles'),
-    'FSSS': station(name='Seychelles International Airport Rawinsonde Station', coordinate=(-4.68333, 55.53333), altitude=4, country='Seychelles'),
-    'FTTA': station(name='Sarh', coordinate=(9.15, 18.38333), altitude=365, country='Chad'),
-    'FTTC': station(name='Abeche', coordinate=(13.85, 20.85), altitude=545, country='Chad'),
-    'FTTD': station(name='Moundou', coordinate=(8.61667, 16.06667), altitude=428, country='Chad'),
-    'FTTJ': station(name='Ndjamena', coordinate=(12.13333, 15.03333), altitude=295, country='Chad'),
-    'FTTK': station(name='Bokoro', coordinate=(12.38333, 17.05), altitude=300, country='Chad'),
-    'FTTL': station(name='Bol-Berim', coordinate=(13.43333, 14.73333), altitude=291, country='Chad'),
-    'FTTN': station(name='Am-Timan', coordinate=(11.03333, 20.28333), altitude=433, country='Chad'),
-    'FTTP': station(name='Pala', coordinate=(9.36667, 14.91667), altitude=467, country='Chad'),
-    'FTTY': station(name='Faya', coordinate=(18.0, 19.16667), altitude=235, country='Chad'),
-    'FVBB': station(name='Beitbridge', coordinate=(-22.21667, 30.0), altitude=456, country='Zimbabwe'),
-    'FVBI': station(name='Binga', coordinate=(-17.61667, 27.33333), altitude=620, country='Zimbabwe'),
-    'FVBU': station(name='Bulawayo Airport', coordinate=(-20.01667, 28.61667), altitude=1326, country='Zimbabwe'),
-    'FVCH': station(name='Chipinge', coordinate=(-20.2, 32.61667), altitude=1131, country='Zimbabwe'),
-    'FVCZ': station(name='Buffalo Range', coordinate=(-21.01667, 31.58333), altitude=429, country='Zimbabwe'),
-    'FVFA': station(name='Victoria Falls', coordinate=(-18.1, 25.85), altitude=1061, country='Zimbabwe'),
-    'FVGO': station(name='Gokwe', coordinate=(-18.21667, 28.93333), altitude=1282, country='Zimbabwe'),
-    'FVHA': station(name='Harare Kutsaga', coordinate=(-17.91667, 31.13333), altitude=1479, country='Zimbabwe'),
-    'FVKA': station(name='Karoi', coordinate=(-16.83333, 29.61667), altitude=1343, country='Zimbabwe'),
-    'FVKB': station(name='Kariba', coordinate=(-16.51667, 28.88333), altitude=518, country='Zimbabwe'),
-    'FVMT': station(name='Mutoko', coordinate=(-17.41667, 32.21667), altitude=1244, country='Zimbabwe'),
-    'FVMV': station(name='Masvingo', coordinate=(-20.06667, 30.86667), altitude=1094, country='Zimbabwe'),
-    'FVRU': station(name='Rusape', coordinate=(-18.53333, 32.13333), altitude=1430, country='Zimbabwe'),
-    'FVTL': station(name='Gweru', coordinate=(-19.45, 29.85), altitude=1428, country='Zimbabwe'),
-    'FVWN': station(name='Hwange National Park', coordinate=(-18.63333, 27.0), altitude=1079, country='Zimbabwe'),
-    'FWCL': station(name='Chileka', coordinate=(-15.68333, 34.96667), altitude=766, country='Malawi'),
-    'FWCT': station(name='Chitipa', coordinate=(-9.7, 33.26667), altitude=1278, country='Malawi'),
-    'FWDZ': station(name='Dedza', coordinate=(-14.31667, 34.26667), altitude=1630, country='Malawi'),
-    'FWKA': station(name='Karonga', coordinate=(-9.95, 33.88333), altitude=529, country='Malawi'),
-    'FWKI': station(name='Lilongwe International Airport', coordinate=(-13.78333, 33.76667), altitude=1229, country='Malawi'),
-    'FWKK': station(name='Nkhota Kota', coordinate=(-12.91667, 34.26667), altitude=500, country='Malawi'),
-    'FWMG': station(name='Mangochi', coordinate=(-14.43333, 35.25), altitude=485, country='Malawi'),
-    'FWMY': station(name='Monkey Bay', coordinate=(-14.08333, 34.91667), altitude=474, country='Malawi'),
-    'FWMZ': station(name='Mzimba', coordinate=(-11.88333, 33.61667), altitude=1349, country='Malawi'),
-    'FWSM': station(name='Salima', coordinate=(-13.75, 34.58333), altitude=513, country='Malawi'),
-    'FWUU': station(name='Mzuzu', coordinate=(-11.45, 34.01667), altitude=1251, country='Malawi'),
-    'FXMM': station(name='Maseru / Moshoeshoe', coordinate=(-29.45, 27.55), altitude=1631, country='Lesotho'),
-    'FXMU': station(name='Maseru-Mia', coordinate=(-29.45, 27.55), altitude=1631, country='Lesotho'),
-    'FYGF': station(name='Grootfontein', coordinate=(-19.6, 18.11667), altitude=1411, country='Namibia'),
-    'FYKM': station(name='Katima Mulilo', coordinate=(-17.63444, 24.17667), altitude=985, country='Namibia'),
-    'FYKT': station(name='Keetmanshoop', coordinate=(-26.53333, 18.11667), altitude=1067, country='Namibia'),
-    'FYLZ': station(name='Luderitz / Diaz Point', coordinate=(-26.68333, 15.25), altitude=130, country='Namibia'),
-    'FYOA': station(name='Ondangwa', coordinate=(-17.87833, 15.9525), altitude=1096, country='Namibia'),
-    'FYRK': station(name='Rooikop Saaf / Civ', coordinate=(-22.98333, 14.65), altitude=88, country='Namibia'),
-    'FYRU': station(name='Rundu', coordinate=(-17.91667, 19.76667), altitude=1083, country='Namibia'),
-    'FYWB': station(name='Walvis Bay', coordinate=(-22.98306, 14.65), altitude=46, country='Namibia'),
-    'FYWH': station(name='J. G. Strijdom', coordinate=(-22.48333, 17.46667), altitude=1715, country='Namibia'),
-    'FYWW': station(name='Windhoek, Town MET', coordinate=(-22.56667, 17.1), altitude=1725, country='Namibia'),
-    'FZAA': station(name="Kinshasa / N'Djili", coordinate=(-4.38333, 15.43333), altitude=309, country='Congo, Democratic Republic of the'),
-    'FZAG': station(name='Moanda', coordinate=(-6.0, 12.41667), altitude=27, country='Congo, Democratic Republic of the'),
-    'FZAM': station(name='Matadi', coordinate=(-5.8, 13.43333), altitude=355, country='Congo, Democratic Republic of the'),
-    'FZAN': station(name='Inga', coordinate=(-5.51667, 13.58333), altitude=277, country='Congo, Democratic Republic of the'),
-    'FZBA': station(name='Inongo', coordinate=(-1.96667, 18.26667), altitude=300, country='Congo, Democratic Republic of the'),
-    'FZBO': station(name='Bandundu', coordinate=(-3.3, 17.35), altitude=324, country='Congo, Democratic Republic of the'),
-    'FZCA': station(name='Kikwit', coordinate=(-5.03333, 18.8), altitude=518, country='Congo, Democratic Republic of the'),
-    'FZCS': station(name='Kenge', coordinate=(-4.91667, 17.06667), altitude=563, country='Congo, Democratic Republic of the'),
-    'FZEA': station(name='Mbandaka', coordinate=(0.05, 18.26667), altitude=345, country='Congo, Democratic Republic of the'),
-    'FZFK': station(name='Gemena', coordinate=(3.28333, 19.78333), altitude=475, country='Congo, Democratic Republic of the'),
-    'FZGN': station(name='Boende', coordinate=(-0.21667, 20.85), altitude=351, country='Congo, Democratic Republic of the'),
-    'FZIA': station(name='Kisangani', coordinate=(0.51667, 25.18333), altitude=415, country='Congo, Democratic Republic of the'),
-    'FZMB': station(name='Butembo', coordinate=(0.13333, 29.26667), altitude=1840, country='Congo, Democratic Republic of the'),
-    'FZNA': station(name='Goma', coordinate=(-1.68333, 29.23333), altitude=1552, country='Congo, Democratic Republic of the'),
-    'FZNC': station(name='Rutshuru', coordinate=(-1.18333, 29.45), altitude=1275, country='Congo, Democratic Republic of the'),
-    'FZOA': station(name='Kindu', coordinate=(-2.95, 25.91667), altitude=497, country='Congo, Democratic Republic of the'),
-    'FZQA': station(name='Lubumbashi-Luano', coordinate=(-11.66667, 27.48333), altitude=1276, country='Congo, Democratic Republic of the'),
-    'FZQM': station(name='Kolwezi', coordinate=(-10.71667, 25.45), altitude=1405, country='Congo, Democratic Republic of the'),
-    'FZRA': station(name='Manono', coordinate=(-7.28333, 27.43333), altitude=614, country='Congo, Democratic Republic of the'),
-    'FZRF': station(name='Kalemie', coordinate=(-5.88333, 29.18333), altitude=790, country='Congo, Democratic Republic of the'),
-    'FZRQ': station(name='Kongolo', coordinate=(-5.35, 27.0), altitude=561, country='Congo, Democratic Republic of the'),
-    'FZSA': station(name='Kamina / Base', coordinate=(-8.63333, 25.25), altitude=1088, country='Congo, Democratic Republic of the'),
-    'FZUA': station(name='Kananga', coordinate=(-5.88333, 22.41667), altitude=654, country='Congo, Democratic Republic of the'),
-    'FZUK': station(name='Tshikapa', coordinate=(-6.41667, 20.85), altitude=521, country='Congo, Democratic Republic of the'),
-    'FZVA': station(name='Lodja', coordinate=(-3.48333, 23.46667), altitude=479, country='Congo, Democratic Republic of the'),
-    'FZVI': station(name='Lusambo', coordinate=(-4.96667, 23.43333), altitude=424, country='Congo, Democratic Republic of the'),
-    'FZVS': station(name='Ilebo', coordinate=(-4.33333, 20.58333), altitude=465, country='Congo, Democratic Republic of the'),
-    'FZWA': station(name='Mbuji-Mayi', coordinate=(-6.16667, 23.61667), altitude=633, country='Congo, Democratic Republic of the'),
-    'GABG': station(name='Bougouni', coordinate=(11.41667, -7.5), altitude=350, country='Mali'),
-    'GABS': station(name='Bamako / Senou', coordinate=(12.53333, -7.95), altitude=380, country='Mali'),
-    'GAGO': station(name='Gao', coordinate=(16.26667, -0.05), altitude=265, country='Mali'),
-    'GAHB': station(name='Hombori', coordinate=(15.33333, -1.68333), altitude=287, country='Mali'),
-    'GAKA': station(name='Kenieba', coordinate=(12.85, -11.23333), altitude=132, country='Mali'),
-    'GAKL': station(name='Kidal', coordinate=(18.43333, 1.35), altitude=458, country='Mali'),
-    'GAKO': station(name='Koutiala', coordinate=(12.38333, -5.46667), altitude=365, country='Mali'),
-    'GAKT': station(name='Kita', coordinate=(13.06667, -9.46667), altitude=333, country='Mali'),
-    'GAKY': station(name='Kayes', coordinate=(14.43333, -11.43333), altitude=47, country='Mali'),
-    'GAMB': station(name='Mopti', coordinate=(14.51667, -4.1), altitude=276, country='Mali'),
-    'GAMK': station(name='Menaka', coordinate=(15.86667, 2.21667), altitude=278, country='Mali'),
-    'GANK': station(name='Nara', coordinate=(15.16667, -7.28333), altitude=271, country='Mali'),
-    'GANR': station(name='Nioro Du Sahel', coordinate=(15.23333, -9.35), altitude=235, country='Mali'),
-    'GASG': station(name='Segou', coordinate=(13.4, -6.15), altitude=288, country='Mali'),
-    'GASK': station(name='Sikasso', coordinate=(11.35, -5.68333), altitude=374, country='Mali'),
-    'GASN': station(name='San', coordinate=(13.33333, -4.83333), altitude=283, country='Mali'),
-    'GATB': station(name='Tombouctou', coordinate=(16.71667, -3.0), altitude=263, country='Mali'),
-    'GATS': station(name='Tessalit', coordinate=(20.2, 0.98333), altitude=494, country='Mali'),
-    'GBYD': station(name='Banjul / Yundum', coordinate=(13.35, -16.8), altitude=36, country='Gambia, The'),
-    'GCFV': station(name='Fuerteventura / Aeropuerto', coordinate=(28.45, -13.86667), altitude=22, country='Spain'),
-    'GCHI': station(name='Hierro / Aeropuerto', coordinate=(27.81667, -17.88333), altitude=32, country='Spain'),
-    'GCLA': station(name='La Palma / Aeropuerto', coordinate=(28.61667, -17.75), altitude=29, country='Spain'),
-    'GCLP': station(name='Gran Canaria - Canary Islands', coordinate=(27.93333, -15.38333), altitude=23, country='Spain'),
-    'GCRR': station(name='Lanzarote / Aeropuerto', coordinate=(28.95, -13.6), altitude=14, country='Spain'),
-    'GCTS': station(name='Tenerife Sur', coordinate=(28.05, -16.56667), altitude=64, country='Spain'),
-    'GCXO': station(name='Tenerife / Los Rodeos', coordinate=(28.46667, -16.31667), altitude=632, country='Spain'),
-    'GEML': station(name='Melilla', coordinate=(35.28333, -2.95), altitude=47, country='Spain'),
-    'GFLL': station(name='Lungi', coordinate=(8.61667, -13.2), altitude=25, country='Sierra Leone'),
-    'GGBF': station(name='Bafata', coordinate=(12.16667, -14.66667), altitude=42, country='Guinea-Bissau'),
-    'GGOV': station(name='Bissau Aeroport', coordinate=(11.88333, -15.65), altitude=39, country='Guinea-Bissau'),
-    'GLRB': station(name='Grand Bassa, Roberts Field', coordinate=(6.25, -10.35), altitude=18, country='Liberia'),
-    'GMAA': station(name='Agadir', coordinate=(30.38333, -9.56667), altitude=27, country='Morocco'),
-    'GMAD': station(name='Agadir Al Massira', coordinate=(30.33333, -9.4), altitude=74, country='Morocco'),
-    'GMAT': station(name='Tan-Tan', coordinate=(28.45, -11.15), altitude=229, country='Morocco'),
-    'GMFF': station(name='Fes-Sais', coordinate=(33.93333, -4.98333), altitude=579, country='Morocco'),
-    'GMFI': station(name='Ifrane', coordinate=(33.5, -5.16667), altitude=1664, country='Morocco'),
-    'GMFK': station(name='Errachidia', coordinate=(31.93333, -4.4), altitude=1034, country='Morocco'),
-    'GMFM': station(name='Meknes', coordinate=(33.88333, -5.53333), altitude=576, country='Morocco'),
-    'GMFN': station(name='Nador', coordinate=(35.15, -2.91667), altitude=3, country='Morocco'),
-    'GMFO': station(name='Oujda', coordinate=(34.78333, -1.93333), altitude=468, country='Morocco'),
-    'GMFZ': station(name='Taza', coordinate=(34.21667, -4.0), altitude=509, country='Morocco'),
-    'GMMC': station(name='Casablanca', coordinate=(33.56667, -7.66667), altitude=62, country='Morocco'),
-    'GMME': station(name='Rabat-Sale', coordinate=(34.05, -6.76667), altitude=84, country='Morocco'),
-    'GMMF': station(name='Sidi Ifni', coordinate=(29.36667, -10.18333), altitude=58, country='Morocco'),
-    'GMMI': station(name='Essaouira', coordinate=(31.51667, -9.78333), altitude=15, country='Morocco'),
-    'GMML': station(name='Laayoune/Hassan Isl', coordinate=(27.16667, -13.21639), altitude=6, country='Morocco'),
-    'GMMN': station(name='Nouasseur', coordinate=(33.36667, -7.58333), altitude=200, country='Morocco'),
-    'GMMS': station(name='Safi', coordinate=(32.28333, -9.23333), altitude=52, country='Morocco'),
-    'GMMW': station(name='Nador/Arwi', coordinate=(34.98889, -3.02833), altitude=175, country='Morocco'),
-    'GMMX': station(name='Marrakech', coordinate=(31.61667, -8.03333), altitude=468, country='Morocco'),
-    'GMMY': station(name='Kenitra', coordinate=(34.3, -6.6), altitude=5, country='Morocco'),
-    'GMMZ': station(name='Ouarzazate', coordinate=(30.93333, -6.9), altitude=1139, country='Morocco'),
-    'GMTA': station(name='Al Hoceima', coordinate=(35.18333, -3.85), altitude=27, country='Morocco'),
-    'GMTN': station(name='Tetuan / Sania Ramel', coordinate=(35.58333, -5.33333), altitude=10, country='Morocco'),
-    'GMTT': station(name='Tanger Aerodrome', coordinate=(35.73333, -5.9), altitude=19, country='Morocco'),
-    'GOGG': station(name='Ziguinchor', coordinate=(12.55, -16.26667), altitude=26, country='Senegal'),
-    'GOGK': station(name='Kolda', coordinate=(12.88333, -14.96667), altitude=10, country='Senegal'),
-    'GOGS': station(name='Cap-Skirring', coordinate=(12.4, -16.75), altitude=16, country='Senegal'),
-    'GOOD': station(name='Diourbel', coordinate=(14.65, -16.23333), altitude=7, country='Senegal'),
-    'GOOG': station(name='Linguere', coordinate=(15.38333, -15.11667), altitude=20, country='Senegal'),
-    'GOOK': station(name='Kaolack', coordinate=(14.13333, -16.06667), altitude=6, country='Senegal'),
-    'GOOY': station(name='Dakar / Yoff', coordinate=(14.73333, -17.5), altitude=27, country='Senegal'),
-    'GOSM': station(name='Matam', coordinate=(15.65, -13.25), altitude=15, country='Senegal'),
-    'GOSP': station(name='Podor', coordinate=(16.65, -14.96667), altitude=6, country='Senegal'),
-    'GOSS': station(name='Saint-Louis', coordinate=(16.05, -16.45), altitude=4, country='Senegal'),
-    'GOTK': station(name='Kedougou', coordinate=(12.56667, -12.21667), altitude=178, country='Senegal'),
-    'GOTT': station(name='Tambacounda', coordinate=(13.76667, -13.68333), altitude=49, country='Senegal'),
-    'GQNA': station(name='Aioun El Atrouss', coordinate=(16.7, -9.6), altitude=223, country='Mauritania'),
-    'GQNB': station(name='Boutilimit', coordinate=(17.53333, -14.68333), altitude=77, country='Mauritania'),
-    'GQND': station(name='Tidjikja', coordinate=(18.56667, -11.43333), altitude=396, country='Mauritania'),
-    'GQNF': station(name='Kiffa', coordinate=(16.63333, -11.4), altitude=115, country='Mauritania'),
-    'GQNI': station(name='Nema', coordinate=(16.6, -7.26667), altitude=269, country='Mauritania'),
-    'GQNJ': station(name='Akjoujt', coordinate=(19.75, -14.36667), altitude=123, country='Mauritania'),
-    'GQNK': station(name='Kaedi', coordinate=(16.15, -13.51667), altitude=18, country='Mauritania'),
-    'GQNN': station(name='Nouakchott', coordinate=(18.1, -15.95), altitude=2, country='Mauritania'),
-    'GQNR': station(name='Rosso', coordinate=(16.5, -15.81667), altitude=5, country='Mauritania'),
-    'GQPA': station(name='Atar', coordinate=(20.51667, -13.06667), altitude=226, country='Mauritania'),
-    'GQPP': station(name='Nouadhibou', coordinate=(20.93333, -17.03333), altitude=5, country='Mauritania'),
-    'GQPT': station(name='Bir Moghrein', coordinate=(25.23333, -11.61667), altitude=364, country='Mauritania'),
-    'GSVO': station(name='Villa Cisneros', coordinate=(23.7, -15.86667), altitude=10, country='Western Sahara'),
-    'GUCY': station(name='Conakry / Gbessia', coordinate=(9.56667, -13.61667), altitude=26, country='Guinea'),
-    'GUFH': station(name='Faranah / Badala', coordinate=(10.03333, -10.75), altitude=458, country='Guinea'),
-    'GUID': station(name='Kindia', coordinate=(10.05, -12.86667), altitude=458, country='Guinea'),
-    'GUKU': station(name='Kissidougou', coordinate=(9.18333, -10.1), altitude=525, country='Guinea'),
-    'GULB': station(name='Labe', coordinate=(11.31667, -12.3), altitude=1025, country='Guinea'),
-    'GUMA': station(name='Macenta', coordinate=(8.53333, -9.46667), altitude=543, country='Guinea'),
-    'GUNZ': station(name="N'Zerekore", coordinate=(7.73333, -8.83333), altitude=470, country='Guinea'),
-    'GUOK': station(name='Boke', coordinate=(10.93333, -14.31667), altitude=69, country='Guinea'),
-    'GUSI': station(name='Siguiri', coordinate=(11.43333, -9.16667), altitude=362, country='Guinea'),
-    'GUXD': station(name='Kankan', coordinate=(10.38333, -9.3), altitude=377, country='Guinea'),
-    'GVAC': station(name='Sal', coordinate=(16.73333, -22.95), altitude=54, country='Cape Verde'),
-    'HAAB': station(name='Addis Ababa', coordinate=(8.98333, 38.8), altitude=2355, country='Ethiopia'),
-    'HAAG': station(name='Agordat', coordinate=(15.55, 37.88333), altitude=626, country='Ethiopia'),
-    'HAAM': station(name='Arba Minch', coordinate=(6.06667, 37.66667), altitude=1219, country='Ethiopia'),
-    'HAAW': station(name='Awash', coordinate=(8.98333, 40.16667), altitude=1052, country='Ethiopia'),
-    'HAAX': station(name='Axum', coordinate=(14.11667, 38.71667), altitude=2134, country='Ethiopia'),
-    'HABC': station(name='Baco / Bako', coordinate=(5.83333, 36.61667), altitude=1311, country='Ethiopia'),
-    'HABD': station(name='Bahar Dar', coordinate=(11.6, 37.4), altitude=1820, country='Ethiopia'),
-    'HADC': station(name='Combolcha', coordinate=(11.08333, 39.71667), altitude=1864, country='Ethiopia'),
-    'HADM': station(name='Debremarcos', coordinate=(10.35, 37.71667), altitude=2476, country='Ethiopia'),
-    'HADR': station(name='Dire Dawa', coordinate=(9.6, 41.86667), altitude=1146, country='Ethiopia'),
-    'HAGH': station(name='Ghinnir / Ginir', coordinate=(7.15, 40.71667), altitude=1844, country='Ethiopia'),
-    'HAGN': station(name='Gondar', coordinate=(12.53333, 37.43333), altitude=1985, country='Ethiopia'),
-    'HAGO': station(name='Gode', coordinate=(5.1, 44.58333), altitude=320, country='Ethiopia'),
-    'HAGR': station(name='Gore', coordinate=(8.16667, 35.55), altitude=1974, country='Ethiopia'),
-    'HAHM': station(name='Harar Meda', coordinate=(8.73333, 39.0), altitude=1876, country='Ethiopia'),
-    'HAJJ': station(name='Jiggiga', coordinate=(9.33333, 42.71667), altitude=1644, country='Ethiopia'),
-    'HAJM': station(name='Jimma', coordinate=(7.66667, 36.83333), altitude=1676, country='Ethiopia'),
-    'HAKD': station(name='Kabre Dare Military', coordinate=(6.75, 44.28333), altitude=550, country='Ethiopia'),
-    'HALA': station(name='Awassa', coordinate=(7.06667, 38.5), altitude=1652, country='Ethiopia'),
-    'HAMK': station(name='Makale', coordinate=(13.5, 39.48333), altitude=2212, country='Ethiopia'),
-    'HAML': station(name='Masslo / Meslo', coordinate=(6.36667, 39.83333), altitude=2274, country='Ethiopia'),
-    'HAMS': station(name='Massawa', coordinate=(15.61667, 39.45), altitude=10, country='Ethiopia'),
-    'HANG': station(name='Neghelli', coordinate=(5.28333, 39.75), altitude=1455, country='Ethiopia'),
-    'HASB': station(name='Assab', coordinate=(13.06667, 42.71667), altitude=14, country='Ethiopia'),
-    'HASO': station(name='Assosa / Asosa', coordinate=(10.03333, 34.53333), altitude=1733, country='Ethiopia'),
-    'HATS': station(name='Tessenei / Teseney', coordinate=(15.11667, 36.68333), altitude=615, country='Ethiopia'),
-    'HBBA': station(name='Bujumbura', coordinate=(-3.31667, 29.31667), altitude=782, country='Burundi'),
-    'HCMH': station(name='Hargeisa', coordinate=(9.5, 44.08333), altitude=1326, country='Somalia'),
-    'HCMI': station(name='Berbera', coordinate=(10.41667, 45.01667), altitude=9, country='Somalia'),
-    'HCMM': station(name='Mogadiscio', coordinate=(2.03333, 45.35), altitude=9, country='Somalia'),
-    'HCMN': station(name='Belet Uen', coordinate=(4.7, 45.21667), altitude=173, country='Somalia'),
-    'HCMV': station(name='Burao', coordinate=(9.5, 45.56667), altitude=1032, country='Somalia'),
-    'HDAM': station(name='Djibouti \\ Ambouli', coordinate=(11.55, 43.16667), altitude=49, country='Djibouti'),
-    'HEAR': station(name='El Arish', coordinate=(31.08333, 33.81667), altitude=31, country='Egypt'),
-    'HEAT': station(name='Asyut', coordinate=(27.05, 31.01667), altitude=226, country='Egypt'),
-    'HEAX': station(name='Alexandria / Nouzha', coordinate=(31.2, 29.95), altitude=-2, country='Egypt'),
-    'HEBA': station(name='Alexandria Borg El Arab', coordinate=(31.51667, 30.16667), altitude=54, country='Egypt'),
-    'HECA': station(name='Cairo Airport', coordinate=(30.13333, 31.4), altitude=64, country='Egypt'),
-    'HEGN': station(name='Hurguada', coordinate=(27.15, 33.71667), altitude=16, country='Egypt'),
-    'HELX': station(name='Luxor', coordinate=(25.66667, 32.7), altitude=93, country='Egypt'),
-    'HEMM': station(name='Mersa Matruh', coordinate=(31.33333, 27.21667), altitude=25, country='Egypt'),
-    'HEPS': station(name='Port Said', coordinate=(31.26667, 32.3), altitude=6, country='Egypt'),
-    'HESH': station(name='Sharm El Sheikhintl', coordinate=(27.96667, 34.38333), altitude=50, country='Egypt'),
-    'HESN': station(name='Asswan', coordinate=(23.96667, 32.78333), altitude=200, country='Egypt'),
-    'HETB': station(name='Taba', coordinate=(29.59917, 34.77667), altitude=749, country='Egypt'),
-    'HETR': station(name='El Tor', coordinate=(28.23333, 32.61667), altitude=21, country='Egypt'),
-    'HFFF': station(name='Djibouti', coordinate=(11.55, 43.15), altitude=13, country='Djibouti'),
-    'HHAS': station(name='Asmara', coordinate=(15.28333, 38.91667), altitude=2356, country='Ethiopia'),
-    'HKEL': station(name='Eldoret', coordinate=(0.53333, 35.28333), altitude=2120, country='Kenya'),
-    'HKEM': station(name='Embu', coordinate=(-0.5, 37.45), altitude=1493, country='Kenya'),
-    'HKGA': station(name='Garissa', coordinate=(-0.46667, 39.63333), altitude=138, country='Kenya'),
-    'HKIS': station(name='Isiolo', coordinate=(0.35, 37.58333), altitude=1067, country='Kenya'),
-    'HKJK': station(name='Nairobi/Jomo Kenyatta Airport TWR/APP/NOF/Civil Airlines', coordinate=(-1.31667, 36.91667), altitude=1624, country='Kenya'),
-    'HKKG': station(name='Kakamega', coordinate=(0.28333, 34.78333), altitude=1530, country='Kenya'),
-    'HKKI': station(name='Kisumu', coordinate=(-0.1, 34.75), altitude=1157, country='Kenya'),
-    'HKKR': station(name='Kericho', coordinate=(-0.36667, 35.35), altitude=2184, country='Kenya'),
-    'HKKS': station(name='Kisii', coordinate=(-0.66667, 34.78333), altitude=1493, country='Kenya'),
-    'HKKT': station(name='Kitale', coordinate=(1.01667, 35.0), altitude=1890, country='Kenya'),
-    'HKLO': station(name='Lodwar', coordinate=(3.11667, 35.61667), altitude=506, country='Kenya'),
-    'HKLU': station(name='Lamu', coordinate=(-2.26667, 40.83333), altitude=6, country='Kenya'),
-    'HKMA': station(name='Mandera', coordinate=(3.93333, 41.86667), altitude=230, country='Kenya'),
-    'HKMB': station(name='Marsabit', coordinate=(2.3, 37.9), altitude=1219, country='Kenya'),
-    'HKME': station(name='Meru', coordinate=(0.08333, 37.65), altitude=1554, country='Kenya'),
-    'HKML': station(name='Malindi', coordinate=(-3.23333, 40.1), altitude=20, country='Kenya'),
-    'HKMO': station(name='Mombasa', coordinate=(-4.03333, 39.61667), altitude=57, country='Kenya'),
-    'HKMU': station(name='Makindu', coordinate=(-2.28333, 37.83333), altitude=1000, country='Kenya'),
-    'HKMY': station(name='Moyale', coordinate=(3.53333, 39.05), altitude=1097, country='Kenya'),
-    'HKNA': station(name='Nairobi ACC/FIC/RCC/MET/COM/', coordinate=(-1.31667, 36.93333), altitude=1624, country='Kenya'),
-    'HKNC': station(name='Nairobi / Dagoretti', coordinate=(-1.3, 36.75), altitude=1798, country='Kenya'),
-    'HKNI': station(name='Nyeri', coordinate=(-0.5, 36.96667), altitude=1759, country='Kenya'),
-    'HKNK': station(name='Nakuru', coordinate=(-0.26667, 36.1), altitude=1901, country='Kenya'),
-    'HKNO': station(name='Narok', coordinate=(-1.13333, 35.83333), altitude=1890, country='Kenya'),
-    'HKNW': station(name='Nairobi / Wilson', coordinate=(-1.31667, 36.81667), altitude=1683, country='Kenya'),
-    'HKNY': station(name='Nanyuki', coordinate=(-0.06667, 37.03333), altitude=1905, country='Kenya'),
-    'HKVO': station(name='Voi', coordinate=(-3.4, 38.56667), altitude=579, country='Kenya'),
-    'HKWJ': station(name='Wajir', coordinate=(1.75, 40.06667), altitude=244, country='Kenya'),
-    'HLGT': station(name='Ghat', coordinate=(25.13333, 10.15), altitude=699, country='Libya'),
-    'HLKF': station(name='Kufra', coordinate=(24.21667, 23.3), altitude=417, country='Libya'),
-    'HLLB': station(name='Benina', coordinate=(32.1, 20.26667), altitude=131, country='Libya'),
-    'HLLS': station(name='Sebha', coordinate=(27.01667, 14.45), altitude=435, country='Libya'),
-    'HLLT': station(name='Tripoli Inter-National Airport', coordinate=(32.66667, 13.15), altitude=80, country='Libya'),
-    'HLTD': station(name='Ghadames', coordinate=(30.13333, 9.5), altitude=346, country='Libya'),
-    'HRYG': station(name='Gisenyi', coordinate=(-1.66667, 29.25), altitude=1556, country='Rwanda'),
-    'HRYR': station(name='Kigali', coordinate=(-1.96667, 30.11667), altitude=1491, country='Rwanda'),
-    'HSAT': station(name='Atbara', coordinate=(17.7, 33.96667), altitude=347, country='Sudan'),
-    'HSDN': station(name='Dongola', coordinate=(19.16667, 30.48333), altitude=226, country='Sudan'),
-    'HSDZ': station(name='Damazine', coordinate=(11.78333, 34.38333), altitude=474, country='Sudan'),
-    'HSFS': station(name='El Fasher', coordinate=(13.61667, 25.33333), altitude=733, country='Sudan'),
-    'HSGF': station(name='Gedaref', coordinate=(14.03333, 35.4), altitude=599, country='Sudan'),
-    'HSGN': station(name='Geneina', coordinate=(13.48333, 22.45), altitude=805, country='Sudan'),
-    'HSKA': station(name='Kassala', coordinate=(15.46667, 36.4), altitude=500, country='Sudan'),
-    'HSKI': station(name='Kosti', coordinate=(13.16667, 32.66667), altitude=381, country='Sudan'),
-    'HSLI': station(name='Kadugli', coordinate=(11.0, 29.71667), altitude=499, country='Sudan'),
-    'HSNL': station(name='Nyala', coordinate=(12.05, 24.88333), altitude=67, country='Sudan'),
-    'HSNR': station(name='Sennar', coordinate=(13.55, 33.61667), altitude=418, country='Sudan'),
-    'HSOB': station(name='El Obeid', coordinate=(13.16667, 30.23333), altitude=574, country='Sudan'),
-    'HSPN': station(name='Port Sudan International', coordinate=(19.43333, 37.23333), altitude=138, country='Sudan'),
-    'HSRN': station(name='Renk', coordinate=(11.75, 32.78333), altitude=282, country='Sudan'),
-    'HSSJ': station(name='Juba', coordinate=(4.86667, 31.6), altitude=460, country='Sudan'),
-    'HSSM': station(name='Malakal', coordinate=(9.55, 31.65), altitude=387, country='Sudan'),
-    'HSSP': station(name='Port Sudan', coordinate=(19.58333, 37.21667), altitude=3, country='Sudan'),
-    'HSSS': station(name='Khartoum', coordinate=(15.6, 32.55), altitude=382, country='Sudan'),
-    'HSSW': station(name='Wadi Halfa', coordinate=(21.81667, 31.48333), altitude=183, country='Sudan'),
-    'HTAR': station(name='Arusha', coordinate=(-3.33333, 36.61667), altitude=1387, country='Tanzania'),
-    'HTBU': station(name='Bukoba', coordinate=(-1.33333, 31.81667), altitude=1137, country='Tanzania'),
-    'HTDA': station(name='Dar Es Salaam Airport', coordinate=(-6.86667, 39.2), altitude=55, country='Tanzania'),
-    'HTDO': station(name='Dodoma', coordinate=(-6.16667, 35.76667), altitude=1119, country='Tanzania'),
-    'HTIR': station(name='Iringa', coordinate=(-7.66667, 35.75), altitude=1426, country='Tanzania'),
-    'HTKA': station(name='Kigoma', coordinate=(-4.88333, 29.63333), altitude=882, country='Tanzania'),
-    'HTKI': station(name='Kilwa Masoko', coordinate=(-8.93333, 39.51667), altitude=18, country='Tanzania'),
-    'HTKJ': station(name='Kilimanjaro Airport', coordinate=(-3.41667, 37.06667), altitude=891, country='Tanzania'),
-    'HTMB': station(name='Mbeya', coordinate=(-8.93333, 33.46667), altitude=1704, country='Tanzania'),
-    'HTMG': station(name='Morogoro', coordinate=(-6.83333, 37.65), altitude=526, country='Tanzania'),
-    'HTMO': station(name='Mombo', coordinate=(-4.88333, 38.28333), altitude=511, country='Tanzania'),
-    'HTMS': station(name='Moshi', coordinate=(-3.35, 37.33333), altitude=854, country='Tanzania'),
-    'HTMT': station(name='Mtwara', coordinate=(-10.26667, 40.18333), altitude=113, country='Tanzania'),
-    'HTMU': station(name='Musoma', coordinate=(-1.5, 33.8), altitude=1147, country='Tanzania'),
-    'HTMW': station(name='Mwanza', coordinate=(-2.46667, 32.91667), altitude=1139, country='Tanzania'),
-    'HTNA': station(name='Nachingwea', coordinate=(-10.35, 38.75), altitude=463, country='Tanzania'),
-    'HTPE': station(name='Pemba / Karume Airport', coordinate=(-5.25, 39.81667), altitude=25, country='Tanzania'),
-    'HTSE': station(name='Same', coordinate=(-4.08333, 37.71667), altitude=872, country='Tanzania'),
-    'HTSO': station(name='Songea', coordinate=(-10.68333, 35.58333), altitude=1067, country='Tanzania'),
-    'HTSY': station(name='Shinyanga', coordinate=(-3.5, 33.0), altitude=1100, country='Tanzania'),
-    'HTTB': station(name='Tabora Airport', coordinate=(-5.08333, 32.83333), altitude=1181, country='Tanzania'),
-    'HTTG': station(name='Tanga', coordinate=(-5.08333, 39.06667), altitude=39, country='Tanzania'),
-    'HTZA': station(name='Zanzibar / Kisauni', coordinate=(-6.21667, 39.21667), altitude=15, country='Tanzania'),
-    'HUAR': station(name='Arua', coordinate=(3.05, 30.91667), altitude=1204, country='Uganda'),
-    'HUEN': station(name='Entebbe Airport', coordinate=(0.05, 32.45), altitude=1155, country='Uganda'),
-    'HUFP': station(name='Fort Portal', coordinate=(0.66667, 30.28333), altitude=1533, country='Uganda'),
-    'HUGU': station(name='Gulu', coordinate=(2.75, 32.33333), altitude=1104, country='Uganda'),
-    'HUJI': station(name='Jinja', coordinate=(0.45, 33.18333), altitude=1175, country='Uganda'),
-    'HUKB': station(name='Kabale', coordinate=(-1.25, 29.98333), altitude=1867, country='Uganda'),
-    'HUKS': station(name='Kasese', coordinate=(0.18333, 30.1), altitude=959, country='Uganda'),
-    'HULI': station(name='Lira', coordinate=(2.25, 32.9), altitude=1091, country='Uganda'),
-    'HUMA': station(name='Mbarara', coordinate=(-0.61667, 30.65), altitude=1412, country='Uganda'),
-    'HUMI': station(name='Masindi', coordinate=(1.68333, 31.71667), altitude=1146, country='Uganda'),
-    'HUMO': station(name='Moroto', coordinate=(2.53333, 34.65), altitude=1280, country='Uganda'),
-    'HUSO': station(name='Soroti', coordinate=(1.71667, 33.61667), altitude=1132, country='Uganda'),
-    'HUTO': station(name='Tororo', coordinate=(0.68333, 34.16667), altitude=1170, country='Uganda'),
-    'K01R': station(name='Claiborne Range, Airways Facilities Sector', coordinate=(31.13333, -92.56667), altitude=67, country='United States'),
-    'K01T': station(name='High Island', coordinate=(28.13333, -94.4), altitude=30, country='United States'),
-    'K03Y': station(name='Hallock', coordinate=(48.78333, -96.95), altitude=250, country='United States'),
-    'K04V': station(name='Saguache, Saguache Municipal Airport', coordinate=(38.09722, -106.16861), altitude=2385, country='United States'),
-    'K05F': station(name='Gatesville, City-County Airport', coordinate=(31.42111, -97.79694), altitude=276, country='United States'),
-    'K06D': station(name='Rolla Municipal Airport', coordinate=(48.88444, -99.62083), altitude=556, country='United States'),
-    'K07G': station(name='Charlotte, Fitch H Beach Airport', coordinate=(42.57444, -84.81139), altitude=271, country='United States'),
-    'K07S': station(name='Deer Park, Deer Park Airport', coordinate=(47.97417, -117.42833), altitude=672, country='United States'),
-    'K08D': station(name='Stanley Municipal Airport', coordinate=(48.30083, -102.40639), altitude=684, country='United States'),
-    'K0B9': station(name='Goat Island Remote Automatic Meteorological Observing System', coordinate=(43.33333, -70.4), altitude=12, country='United States'),
-    'K0D1': station(name='South Haven, South Haven Area Regional Airport', coordinate=(42.35083, -86.25611), altitude=203, country='United States'),
-    'K0E4': station(name='Payson', coordinate=(34.23333, -111.33333), altitude=1498, country='United States'),
-    'K0J4': station(name='FLORALA AIRPORT', coordinate=(31.03333, -86.3), altitude=96, country='UNITED STATES'),
-    'K0L3': station(name='Zuma Beach', coordinate=(34.01667, -118.81667), altitude=6, country='United States'),
-    'K0V1': station(name='Custer, Custer County Airport', coordinate=(43.73306, -103.61139), altitude=1711, country='United States'),
-    'K0VG': station(name='Lee County Airport', coordinate=(36.65389, -83.21778), altitude=430, country='United States'),
-    'K0W8': station(name='Chincoteague', coordinate=(37.93333, -75.38333), altitude=2, country='United States'),
-    'K0Y2': station(name='Sturgeon Bay', coordinate=(44.78333, -87.31667), altitude=176, country='United States'),
-    'K11J': station(name='Blakely, Early County Airport', coordinate=(31.39694, -84.895), altitude=65, country='United States'),
-    'K11R': station(name='Brenham, Brenham Municipal Airport', coordinate=(30.21889, -96.37417), altitude=94, country='United States'),
-    'K12B': station(name='New Castles Coast Guard Light Station', coordinate=(43.11667, -70.48333), altitude=1, country='United States'),
-    'K12C': station(name='Rochelle, Rochelle Municipal-Koritz Field Airport', coordinate=(41.89306, -89.07833), altitude=238, country='United States'),
-    'K12N': station(name='AEROFLEX-ANDOVER AIRPORT', coordinate=(41.01667, -74.73333), altitude=178, country='United States'),
-    'K13A': station(name='Nogales Automatic Meteorological Observing System', coordinate=(31.41667, -110.85), altitude=1198, country='United States'),
-    'K13G': station(name='Niagara Coast Guard Station', coordinate=(43.26667, -79.06667), altitude=82, country='United States'),
-    'K14B': station(name='Great Duck Island Coast Guard Light Station', coordinate=(44.15, -68.25), altitude=1, country='United States'),
-    'K14C': station(name='Frankfort Coast Guard Station', coordinate=(44.63333, -86.25), altitude=174, country='United States'),
-    'K14R': station(name='Caldwell, Caldwell Municipal Airport', coordinate=(30.51528, -96.70389), altitude=119, country='United States'),
-    'K14Y': station(name='Todd Field Airport', coordinate=(45.9, -94.86667), altitude=406, country='United States'),
-    'K15B': station(name='Halfway Rock Coast Guard Light Station', coordinate=(43.65, -70.03333), altitude=1, country='United States'),
-    'K15C': station(name='Milwaukee Coast Guard Light Station', coordinate=(43.01667, -87.95), altitude=179, country='United States'),
-    'K16B': station(name='Heron Neck Coast Guard Light Station', coordinate=(44.03333, -68.86667), altitude=1, country='United States'),
-    'K16C': station(name='Kenosha Coast Guard Station', coordinate=(42.58333, -87.75), altitude=223, country='United States'),
-    'K17C': station(name='Ludington Coast Guard Station', coordinate=(43.95, -86.46667), altitude=182, country='United States'),
-    'K17W': station(name='Wadena, Wadena Municipal Airport', coordinate=(46.44667, -95.21167), altitude=418, country='United States'),
-    'K17Y': station(name='Mc Gregor, Isedor Iverson Airport', coordinate=(46.61861, -93.30972), altitude=374, country='United States'),
-    'K18B': station(name='Monhegan / Manana Island', coordinate=(43.76667, -69.33333), altitude=1, country='United States'),
-    'K18C': station(name='Michigan City Coast Guard Station', coordinate=(41.71667, -86.91667), altitude=177, country='United States'),
-    'K18N': station(name='New London Ledge Coast Guard Station', coordinate=(41.3, -72.08333), altitude=8, country='United States'),
-    'K19C': station(name='Muskegon Coast Guard Station', coordinate=(43.23333, -86.33333), altitude=182, country='United States'),
-    'K19D': station(name='Mora Municipal Automatic Weather Observing / Reporting System', coordinate=(45.88333, -93.26667), altitude=309, country='United States'),
-    'K19G': station(name='Buffalo Coast Guard Station', coordinate=(42.88333, -78.88333), altitude=180, country='United States'),
-    'K19R': station(name='Ship Shoal Platform', coordinate=(28.68333, -91.21667), altitude=18, country='United States'),
-    'K1A5': station(name='Franklin, Macon County Airport', coordinate=(35.21667, -83.41667), altitude=616, country='United States'),
-    'K1A6': station(name='Middlesboro, Middlesboro-Bell County Airport', coordinate=(36.61056, -83.73722), altitude=352, country='United States'),
-    'K1B7': station(name='Boothville Heliport', coordinate=(29.35, -89.43333), altitude=1, country='United States'),
-    'K1F0': station(name='Ardmore, Ardmore Downtown Executive Airport', coordinate=(34.14694, -97.1225), altitude=257, country='United States'),
-    'K1F9': station(name='Bridgeport, Bridgeport Municipal Airport', coordinate=(33.17528, -97.82833), altitude=260, country='United States'),
-    'K1G2': station(name='Granite Falls, Granite Falls Municipal Airport/Lenzen-Roe Memorial Field', coordinate=(44.75306, -95.55583), altitude=319, country='United States'),
-    'K1G7': station(name='Mississippi Canyon', coordinate=(28.78333, -89.05), altitude=18, country='United States'),
-    'K1H2': station(name='Effingham, Effingham County Memorial Airport', coordinate=(39.07056, -88.53333), altitude=179, country='United States'),
-    'K1J0': station(name='TRI COUNTY AIRPORT', coordinate=(30.83333, -85.6), altitude=26, country='UNITED STATES'),
-    'K1J1': station(name='Saint Simon Island Coast Guard Station', coordinate=(31.13333, -81.36667), altitude=1, country='United States'),
-    'K1J2': station(name='Tybee Coast Guard Station', coordinate=(32.01667, -80.85), altitude=2, country='United States'),
-    'K1J3': station(name='Ponce De Leon Inlet', coordinate=(29.06667, -80.91667), altitude=3, country='United States'),
-    'K1J4': station(name='Cape San Blas Coast Guard Station', coordinate=(29.68333, -85.36667), altitude=2, country='United States'),
-    'K1J5': station(name='Santa Rosa Coast Guard Station', coordinate=(30.31667, -87.25), altitude=2, country='United States'),
-    'K1K5': station(name='Elkhart / Elkhart-Morton County Airport', coordinate=(37.0, -101.88333), altitude=1102, country='United States'),
-    'K1L2': station(name='Santa Monica Pier', coordinate=(34.0, -118.5), altitude=2, country='United States'),
-    'K1M4': station(name='Haleyville, Posey Field Airport', coordinate=(34.28028, -87.60028), altitude=284, country='United States'),
-    'K1O5': station(name='Montague', coordinate=(41.73333, -122.55), altitude=770, country='United States'),
-    'K1P1': station(name='Plymouth, Plymouth Municipal Airport', coordinate=(43.77917, -71.75361), altitude=154, country='United States'),
-    'K1V1': station(name='Rifle Aviation Weather Reporting Station', coordinate=(39.53333, -107.8), altitude=1622, country='United States'),
-    'K1V4': station(name='ST JOHNSBURY FAIRBANKS', coordinate=(44.41667, -72.01667), altitude=212, country='United States'),
-    'K1W9': station(name='Wrightsville Beach', coordinate=(34.18333, -77.81667), altitude=3, country='United States'),
-    'K20B': station(name='Rockland Coast Guard Station', coordinate=(44.1, -69.1), altitude=1, country='United States'),
-    'K20C': station(name='Saint Joseph Coast Guard Station', coordinate=(42.11667, -86.48333), altitude=176, country='United States'),
-    'K20G': station(name='Ashtabula Coast Guard Station', coordinate=(41.91667, -80.8), altitude=178, country='United States'),
-    'K20J': station(name='West Jonesport Coast Guard Station', coordinate=(44.53333, -67.61667), altitude=5, country='United States'),
-    'K20U': station(name='Beach Airport Beach', coordinate=(46.92528, -103.98194), altitude=840, country='United States'),
-    'K20V': station(name='Kremmling, Mc Elroy Airfield', coordinate=(40.05361, -106.36889), altitude=2259, country='United States'),
-    'K215': station(name='Rantoul, Frank Elliott Field Airport', coordinate=(40.28417, -88.13417), altitude=225, country='United States'),
-    'K21C': station(name='Sheboygan Coast Guard Station', coordinate=(43.75, -87.7), altitude=1, country='United States'),
-    'K21D': station(name='Lake Elmo Airport', coordinate=(45.0, -92.85), altitude=284, country='United States'),
-    'K21G': station(name='Marblehead Coast Guard Station', coordinate=(41.55, -82.73333), altitude=196, country='United States'),
-    'K23B': station(name='Seguin Island Coast Guard Light Station', coordinate=(43.66667, -69.76667), altitude=1, country='United States'),
-    'K23G': station(name='Cleveland Harbor Coast Guard Station', coordinate=(41.5, -81.71667), altitude=181, country='United States'),
-    'K24B': station(name='West Quoddy Head Coast Guard Light Station', coordinate=(44.8, -66.95), altitude=1, country='United States'),
-    'K24G': station(name='Toledo Coast Guard Station', coordinate=(41.7, -83.45), altitude=180, country='United States'),
-    'K25B': station(name='Portsmouth Harbor', coordinate=(43.06667, -70.71667), altitude=1, country='United States'),
-    'K25G': station(name='Erie Coast Guard Station', coordinate=(42.11667, -80.08333), altitude=175, country='United States'),
-    'K25R': station(name='Edinburg, Edinburg International Airport', coordinate=(26.44194, -98.12944), altitude=24, country='United States'),
-    'K26B': station(name='Isle Of Shoals Coast Guard Station', coordinate=(42.96667, -70.61667), altitude=1, country='United States'),
-    'K26G': station(name='Rochester Coast Guard Light Station', coordinate=(43.25, -77.6), altitude=82, country='United States'),
-    'K27A': station(name='Elberton, Elbert County Airport-Patz Field', coordinate=(34.095, -82.81583), altitude=184, country='United States'),
-    'K27B': station(name='Cape Neddick Coast Guard Light Station', coordinate=(43.16667, -70.6), altitude=12, country='United States'),
-    'K27G': station(name='Lorain Coast Guard Station', coordinate=(41.46667, -82.18333), altitude=176, country='United States'),
-    'K27U': station(name='Salmon', coordinate=(45.18333, -113.9), altitude=1210, country='United States'),
-    'K27Y': station(name='Grand Marais Coast Guard Station', coordinate=(46.66667, -85.98333), altitude=183, country='United States'),
-    'K28G': station(name='Oswego Coast Guard Station', coordinate=(43.46667, -76.51667), altitude=78, country='United States'),
-    'K28K': station(name='Grncyn Blk52 Supplementary Aviation Weather Reporting Station', coordinate=(27.88333, -91.5), altitude=1, country='United States'),
-    'K28T': station(name='Sabine Pass', coordinate=(29.7, -93.95), altitude=5, country='United States'),
-    'K28Y': station(name='North Manitou Shoal', coordinate=(45.01667, -85.95), altitude=177, country='United States'),
-    'K29B': station(name='Boston / Hull Coast Guard Light Station', coordinate=(42.31667, -70.88333), altitude=0, country='United States'),
-    'K29G': station(name='Ravenna / Portage County', coordinate=(41.21667, -81.25), altitude=365, country='United States'),
-    'K29Y': station(name='Devils Island Light Station', coordinate=(47.08333, -90.73333), altitude=192, country='United States'),
-    'K2B8': station(name='Portland Head Coast Guard Light Station', coordinate=(43.61667, -70.2), altitude=23, country='United States'),
-    'K2C2': station(name='White Sands', coordinate=(32.38333, -106.48333), altitude=1244, country='United States'),
-    'K2C8': station(name='Cavalier Municipal Airport', coordinate=(48.78361, -97.63194), altitude=272, country='United States'),
-    'K2D5': station(name='Oakes Municipal Airport', coordinate=(46.17306, -98.08), altitude=407, country='United States'),
-    'K2DP': station(name='Dare County Gunnery Range', coordinate=(35.66667, -75.9), altitude=3, country='United States'),
-    'K2F8': station(name='Bastrop, Morehouse Memorial Airport', coordinate=(32.75583, -91.88056), altitude=51, country='United States'),
-    'K2G6': station(name='Meadville, Port Meadville Airport', coordinate=(41.62583, -80.21222), altitude=426, country='United States'),
-    'K2GL': station(name='Galliano, Galliano Heliport', coordinate=(29.41333, -90.29889), altitude=2, country='United States'),
-    'K2H1': station(name='Huntington B. Oil', coordinate=(33.56667, -118.13333), altitude=36, country='United States'),
-    'K2I4': station(name='Columbus / Bolton Field', coordinate=(39.9, -83.13333), altitude=280, country='United States'),
-    'K2I5': station(name='Rantoul, Rantoul Natl Aviation Cntr-Frank Elliott Fld Airp.', coordinate=(40.29361, -88.1425), altitude=225, country='United States'),
-    'K2L6': station(name='Marina Del Rey', coordinate=(33.96667, -118.43333), altitude=8, country='United States'),
-    'K2L7': station(name='Solana Beach', coordinate=(32.98333, -117.26667), altitude=5, country='United States'),
-    'K2P3': station(name='Paynesville, Paynesville Municipal Airport', coordinate=(45.37222, -94.74639), altitude=360, country='United States'),
-    'K2PJ': station(name='Poinsett Range, Sumpter', coordinate=(33.85, -80.48333), altitude=68, country='United States'),
-    'K2R8': station(name='Port Aransas, Mustang Beach Airport', coordinate=(27.81139, -97.08889), altitude=2, country='United States'),
-    'K2S9': station(name='Willapa Harbor', coordinate=(46.7, -123.81667), altitude=5, country='United States'),
-    'K2U7': station(name='Stanley, Stanley Airport', coordinate=(44.20833, -114.93444), altitude=1952, country='United States'),
-    'K2V9': station(name='Gunnison Aviation Weather Reporting Station', coordinate=(38.6, -106.91667), altitude=2380, country='United States'),
-    'K2WX': station(name='BUFFALO', coordinate=(45.6, -103.55), altitude=916, country='United States'),
-    'K30B': station(name='Sandwich Coast Guard Station', coordinate=(41.78333, -70.5), altitude=1, country='United States'),
-    'K30G': station(name='Saginaw River Coast Guard Station', coordinate=(43.63333, -83.85), altitude=177, country='United States'),
-    'K30N': station(name='Faulkner Island Coast Guard Light Station', coordinate=(41.21667, -72.66667), altitude=15, country='United States'),
-    'K30Y': station(name='Duluth Harbor Coast Guard Station', coordinate=(46.76667, -92.08333), altitude=186, country='United States'),
-    'K31B': station(name='Chatham Coast Guard Station', coordinate=(41.66667, -69.95), altitude=1, country='United States'),
-    'K31F': station(name='Seminole, Gaines County Airport', coordinate=(32.67528, -102.6525), altitude=1010, country='United States'),
-    'K31G': station(name='Belle Isle Coast Guard Station', coordinate=(42.33333, -82.96667), altitude=177, country='United States'),
-    'K31Y': station(name='Eagle Harbor Coast Guard Light Station', coordinate=(47.46667, -88.16667), altitude=186, country='United States'),
-    'K32N': station(name='Little Gulf Island Light Station', coordinate=(41.2, -72.1), altitude=6, country='United States'),
-    'K32Y': station(name='Portage Coast Guard Station', coordinate=(47.23333, -88.63333), altitude=190, country='United States'),
-    'K33B': station(name='Buzzards Bay Coast Guard Light Station', coordinate=(41.38333, -71.03333), altitude=1, country='United States'),
-    'K33G': station(name='Port Huron Coast Guard Station', coordinate=(43.0, -82.41667), altitude=177, country='United States'),
-    'K34B': station(name='Gloucester Coast Guard Station', coordinate=(42.58333, -70.66667), altitude=1, country='United States'),
-    'K34N': station(name='Eatons Neck Coast Guard Station', coordinate=(40.95, -73.4), altitude=1, country='United States'),
-    'K34Y': station(name='Marquette Coast Guard Light Station', coordinate=(46.55, -87.38333), altitude=203, country='United States'),
-    'K35B': station(name='Merrimac River Coast Guard Station', coordinate=(42.81667, -70.86667), altitude=1, country='United States'),
-    'K36B': station(name='Race Point Coast Guard Station', coordinate=(42.05, -70.18333), altitude=1, country='United States'),
-    'K36U': station(name='Heber, Heber City Municipal-Russ McDonald Field Airport', coordinate=(40.48194, -111.42889), altitude=1718, country='United States'),
-    'K36Y': station(name='Point Betsie / Frankfort', coordinate=(44.61667, -86.2), altitude=183, country='United States'),
-    'K37B': station(name='Scituate Coast Guard Station', coordinate=(42.2, -70.71667), altitude=1, country='United States'),
-    'K37W': station(name='Erwin, Harnett County Airport', coordinate=(35.37861, -78.73361), altitude=60, country='United States'),
-    'K38Y': station(name='Saint Ignace', coordinate=(45.85, -84.71667), altitude=176, country='United States'),
-    'K39Y': station(name='Tawas Point Coast Guard Station', coordinate=(44.25, -83.43333), altitude=178, country='United States'),
-    'K3A1': station(name='Cullman, Folsom Field Airport', coordinate=(34.26861, -86.85833), altitude=294, country='United States'),
-    'K3A6': station(name='Newhall', coordinate=(34.36667, -118.56667), altitude=427, country='United States'),
-    'K3B1': station(name='Greenville, Greenville Municipal Airport', coordinate=(45.46306, -69.55167), altitude=427, country='United States'),
-    'K3B2': station(name='Marshfield Airport', coordinate=(42.1, -70.68333), altitude=3, country='United States'),
-    'K3B6': station(name='Eugene Island 330', coordinate=(28.08333, -92.7), altitude=0, country='United States'),
-    'K3B9': station(name='Chester, Chester Airport', coordinate=(41.38389, -72.50583), altitude=127, country='United States'),
-    'K3D4': station(name='Frankfort, Frankfort Dow Memorial Field Airport', coordinate=(44.625, -86.20056), altitude=193, country='United States'),
-    'K3DU': station(name='Drummond', coordinate=(46.66667, -113.15), altitude=1202, country='United States'),
-    'K3HE': station(name='Howell', coordinate=(42.63333, -83.98333), altitude=293, country='United States'),
-    'K3HT': station(name='Harlowton', coordinate=(46.43333, -109.83333), altitude=1268, country='United States'),
-    'K3I2': station(name='Point Pleasant, Mason County Airport', coordinate=(38.91444, -82.09833), altitude=196, country='United States'),
-    'K3J7': station(name='Greensboro, Greene County Regional Airport', coordinate=(33.5975, -83.13889), altitude=206, country='United States'),
-    'K3KM': station(name='Wichita, Colonel James Jabara Airport', coordinate=(37.74972, -97.21889), altitude=434, country='United States'),
-    'K3L3': station(name='Newport Beach', coordinate=(33.6, -117.88333), altitude=3, country='United States'),
-    'K3LC': station(name='Lincoln, Logan County Airport', coordinate=(40.15861, -89.335), altitude=182, country='United States'),
-    'K3LF': station(name='Litchfield, Litchfield Municipal Airport', coordinate=(39.16222, -89.67444), altitude=210, country='United States'),
-    'K3MW': station(name='Mount Werner', coordinate=(40.45944, -106.75972), altitude=3241, country='United States'),
-    'K3O6': station(name='Treasure Island', coordinate=(37.8, -122.36667), altitude=8, country='United States'),
-    'K3OI': station(name='Lamoni', coordinate=(40.61667, -93.95), altitude=342, country='United States'),
-    'K3R1': station(name='Bay City, Bay City Municipal Airport', coordinate=(28.96667, -95.85), altitude=14, country='United States'),
-    'K3RN': station(name='Graying Air Force Range', coordinate=(44.83333, -84.55), altitude=387, country='United States'),
-    'K3S2': station(name='Aurora State', coordinate=(45.25, -122.76667), altitude=60, country='United States'),
-    'K3SE': station(name='Spencer', coordinate=(43.16667, -95.15), altitude=404, country='United States'),
-    'K3T1': station(name='Mineola/Quitman, Wood County Airport', coordinate=(32.74194, -95.49639), altitude=132, country='United States'),
-    'K3T5': station(name='La Grange, Fayette Regional Air Center Airport', coordinate=(29.90806, -96.95), altitude=99, country='United States'),
-    'K3TH': station(name='Thompson Falls', coordinate=(47.6, -115.36667), altitude=725, country='United States'),
-    'K3V8': station(name='Venice Heliport', coordinate=(29.11667, -89.2), altitude=80, country='United States'),
-    'K3W4': station(name='Swansboro / Bogue', coordinate=(34.65, -77.1), altitude=2, country='United States'),
-    'K40B': station(name='Clayton Lake', coordinate=(46.61667, -69.53333), altitude=314, country='United States'),
-    'K40G': station(name='Grand Canyon, Valle Airport', coordinate=(35.65083, -112.14611), altitude=1829, country='United States'),
-    'K40J': station(name='PERRY-FOLEY AIRPORT', coordinate=(30.06667, -83.58333), altitude=14, country='United States'),
-    'K40N': station(name='Chester County Airport', coordinate=(39.98333, -75.86667), altitude=201, country='United States'),
-    'K40Y': station(name='Thunder Bay Island', coordinate=(45.06667, -83.55), altitude=178, country='United States'),
-    'K41G': station(name='Bath', coordinate=(42.85, -84.48333), altitude=261, country='United States'),
-    'K41I': station(name='Eugene Island', coordinate=(28.46667, -91.78333), altitude=30, country='United States'),
-    'K43F': station(name='Litchfield Municipal', coordinate=(45.1, -94.5), altitude=347, country='United States'),
-    'K43S': station(name='West Point Coast Guard Light Station', coordinate=(47.66667, -122.43333), altitude=4, country='United States'),
-    'K44N': station(name='Millbrook / Sky Acres', coordinate=(41.7, -73.73333), altitude=213, country='United States'),
-    'K44W': station(name='Diamond Shoals Coast Guard Station', coordinate=(35.15, -75.3), altitude=1, country='United States'),
-    'K44Y': station(name='Sault Ste. Marie Coast Guard Station', coordinate=(46.5, -84.33333), altitude=176, country='United States'),
-    'K45B': station(name='Brant Point Coast Guard Station', coordinate=(41.28333, -70.08333), altitude=8, country='United States'),
-    'K45J': station(name='Rockingham, Rockingham-Hamlet Airport', coordinate=(34.89083, -79.75889), altitude=109, country='United States'),
-    'K45N': station(name='Bay Shore / Fire Island', coordinate=(40.63333, -73.26667), altitude=5, country='United States'),
-    'K45W': station(name='Oracoke Coast Guard Station', coordinate=(35.11667, -75.98333), altitude=2, country='United States'),
-    'K46D': station(name='Carrington Municipal Airport', coordinate=(47.45111, -99.15139), altitude=490, country='United States'),
-    'K47A': station(name='Canton, Cherokee County Airport', coordinate=(34.31056, -84.42389), altitude=372, country='United States'),
-    'K48I': station(name='Sutton, Braxton County Airport', coordinate=(38.68694, -80.65167), altitude=387, country='United States'),
-    'K48N': station(name='Montauk Point Coast Guard Light Station', coordinate=(41.06667, -71.93333), altitude=1, country='United States'),
-    'K49N': station(name='East Moriches Coast Guard Station', coordinate=(40.78333, -72.75), altitude=1, country='United States'),
-    'K49Y': station(name='Preston, Fillmore County Airport', coordinate=(43.67667, -92.17972), altitude=389, country='United States'),
-    'K4A9': station(name='Fort Payne, Isbell Field Airport', coordinate=(34.47361, -85.72139), altitude=267, country='United States'),
-    'K4BK': station(name='Brookings', coordinate=(42.05, -124.28333), altitude=24, country='United States'),
-    'K4BL': station(name='Blanding', coordinate=(37.61667, -109.46667), altitude=1840, country='United States'),
-    'K4BM': station(name='Wilkerson Pass', coordinate=(39.05028, -105.51444), altitude=3438, country='United States'),
-    'K4BQ': station(name='Broadus', coordinate=(45.43333, -105.4), altitude=922, country='United States'),
-    'K4CB': station(name='Cuddleback Gunnery Range', coordinate=(35.26667, -117.43333), altitude=864, country='United States'),
-    'K4CR': station(name='Corona / Lincoln', coordinate=(34.1, -105.68333), altitude=1981, country='United States'),
-    'K4DG': station(name='Douglas', coordinate=(42.75, -105.38333), altitude=1477, country='United States'),
-    'K4F4': station(name='Gilmer, Fox Stephens Field - Gilmer Municipal Airport', coordinate=(32.69889, -94.94889), altitude=127, country='United States'),
-    'K4HV': station(name='Hanksville', coordinate=(38.36667, -110.71667), altitude=1314, country='United States'),
-    'K4L7': station(name='Hermosa Beach Pier', coordinate=(33.86667, -118.4), altitude=8, country='United States'),
-    'K4LW': station(name='Lakeview', coordinate=(42.21667, -120.35), altitude=1455, country='United States'),
-    'K4MR': station(name='Melrose Gunnery Range', coordinate=(34.3, -103.8), altitude=1326, country='United States'),
-    'K4MY': station(name='Moriarty', coordinate=(34.98333, -106.05), altitude=1890, country='United States'),
-    'K4O4': station(name='Idabel, Mc Curtain County Regional Airport', coordinate=(33.90917, -94.85917), altitude=144, country='United States'),
-    'K4OM': station(name='Omak', coordinate=(48.41667, -119.53333), altitude=374, country='United States'),
-    'K4SL': station(name='Torreon', coordinate=(35.8, -107.18333), altitude=2106, country='United States'),
-    'K4SU': station(name='Superior Valley Gunnery Range', coordinate=(36.33333, -117.1), altitude=962, country='United States'),
-    'K4SV': station(name='Strevell', coordinate=(42.01667, -113.25), altitude=1612, country='United States'),
-    'K4T6': station(name='Midlothian/Waxahachie, Mid-Way Regional Airport', coordinate=(32.45583, -96.91222), altitude=217, country='United States'),
-    'K4V5': station(name='Durango Aviation Weather Reporting Station', coordinate=(37.28333, -107.86667), altitude=2012, country='United States'),
-    'K50N': station(name='Rockaway Coast Guard Station', coordinate=(40.56667, -73.88333), altitude=3, country='United States'),
-    'K50Q': station(name='Farallon Island', coordinate=(37.7, -123.0), altitude=12, country='United States'),
-    'K51N': station(name='Short Beach Coast Guard Station', coordinate=(40.58333, -73.55), altitude=1, country='United States'),
-    'K51Q': station(name='San Francisco Pbs', coordinate=(37.75, -122.7), altitude=5, country='United States'),
-    'K52N': station(name='Wildwood', coordinate=(39.0, -74.81667), altitude=2, country='United States'),
-    'K52Q': station(name='Davis Point Aviation Weather Reporting Station', coordinate=(38.05, -122.26667), altitude=18, country='United States'),
-    'K53D': station(name='Glenwood', coordinate=(45.65, -95.38333), altitude=423, country='United States'),
-    'K53Q': station(name='Pillar Pt / El Granda', coordinate=(37.5, -122.5), altitude=40, country='United States'),
-    'K53S': station(name='Point Wilson Coast Guard Light Station', coordinate=(48.11667, -122.75), altitude=1, country='United States'),
-    'K54N': station(name='Manasquan Inl Coast Guard Station', coordinate=(40.1, -74.01667), altitude=1, country='United States'),
-    'K54Q': station(name='Castroville / Moss', coordinate=(36.8, -121.8), altitude=5, country='United States'),
-    'K55D': station(name='Grayling, Grayling AAF Airport', coordinate=(44.68028, -84.72889), altitude=353, country='United States'),
-    'K55N': station(name='Atlantic City Coast Guard Station', coordinate=(39.38333, -74.41667), altitude=4, country='United States'),
-    'K56N': station(name='Sandy Hook Coast Guard Station', coordinate=(40.46667, -74.01667), altitude=5, country='United States'),
-    'K5D3': station(name='Owosso, Owosso Community Airport', coordinate=(42.99278, -84.13889), altitude=224, country='United States'),
-    'K5G9': station(name='Lambertville, Toledo Suburban Airport', coordinate=(41.73583, -83.65528), altitude=204, country='United States'),
-    'K5H4': station(name='Harvey Municipal Airport', coordinate=(47.79111, -99.93167), altitude=490, country='United States'),
-    'K5I3': station(name='Pikeville Remote Automatic Meteorological Observing System', coordinate=(37.48333, -82.51667), altitude=446, country='United States'),
-    'K5J0': station(name='John Day, John Day State Airport', coordinate=(44.40417, -118.9625), altitude=1127, country='United States'),
-    'K5L8': station(name='Long Beach', coordinate=(33.76667, -118.16667), altitude=3, country='United States'),
-    'K5R0': station(name='East Addition B323', coordinate=(28.21667, -93.75), altitude=26, country='United States'),
-    'K5R5': station(name='Wharton, Wharton Regional Airport', coordinate=(29.25417, -96.15417), altitude=31, country='United States'),
-    'K5SM': station(name='Sunlight', coordinate=(39.42556, -107.37917), altitude=3232, country='United States'),
-    'K5T5': station(name='Hillsboro, Hillsboro Municipal Airport', coordinate=(32.08333, -97.09722), altitude=209, country='United States'),
-    'K5T6': station(name='Santa Teresa, Dona Ana County Airport at Santa Teresa', coordinate=(31.88083, -106.70472), altitude=1253, country='United States'),
-    'K60Y': station(name='Slayton, Slayton Municipal Airport', coordinate=(43.98667, -95.7825), altitude=495, country='United States'),
-    'K61N': station(name='Indian River Coast Guard Station', coordinate=(38.61667, -75.06667), altitude=1, country='United States'),
-    'K61W': station(name='Annapolis Coast Guard Station', coordinate=(38.91667, -76.46667), altitude=8, country='United States'),
-    'K62G': station(name='Wilmette Marines', coordinate=(42.06667, -87.68333), altitude=183, country='United States'),
-    'K62H': station(name='Giddings, Giddings-Lee County Airport', coordinate=(30.16917, -96.98), altitude=148, country='United States'),
-    'K62W': station(name='Cape Henry Coast Guard Light Station', coordinate=(36.93333, -76.0), altitude=1, country='United States'),
-    'K63G': station(name='Chicago / Calumet Coast Guard Station', coordinate=(41.71667, -87.53333), altitude=180, country='United States'),
-    'K63W': station(name='Milford Haven Coast Guard Station', coordinate=(37.48333, -76.31667), altitude=1, country='United States'),
-    'K64W': station(name='Parramore Beach', coordinate=(37.53333, -75.61667), altitude=1, country='United States'),
-    'K65W': station(name='Thomas Point Coast Guard Station', coordinate=(38.9, -76.43333), altitude=1, country='United States'),
-    'K66W': station(name='Cove Point Coast Guard Light Station', coordinate=(38.38333, -76.38333), altitude=1, country='United States'),
-    'K67B': station(name='Castle Hill Coast Guard Station', coordinate=(41.45, -71.35), altitude=15, country='United States'),
-    'K67W': station(name='Stillpond Coast Guard Station', coordinate=(39.33333, -76.1), altitude=8, country='United States'),
-    'K69R': station(name='Rocksprings, Edwards County Airport', coordinate=(29.94667, -100.17361), altitude=723, country='United States'),
-    'K6A3': station(name='Andrews, Andrews-Murphy Airport', coordinate=(35.19444, -83.86472), altitude=518, country='United States'),
-    'K6L9': station(name='Huntington Beach', coordinate=(33.65, -118.0), altitude=35, country='United States'),
-    'K6R6': station(name='DRYDEN-TERRELL COUNTY AIRPORT', coordinate=(30.05, -102.21667), altitude=708, country='United States'),
-    'K6R9': station(name='Llano, Llano Municipal Airport', coordinate=(30.78361, -98.66194), altitude=336, country='United States'),
-    'K6V3': station(name='Richlands, Tazewell County Airport', coordinate=(37.06361, -81.79806), altitude=808, country='United States'),
-    'K75S': station(name='Burlington / Mt Vern', coordinate=(48.46667, -122.41667), altitude=43, country='United States'),
-    'K76S': station(name='Oak Harbor Airpark', coordinate=(48.25, -122.66667), altitude=58, country='United States'),
-    'K77M': station(name='Malta', coordinate=(42.31667, -113.33333), altitude=1375, country='United States'),
-    'K77W': station(name='Cape Lookout Coast Guard Station', coordinate=(34.6, -76.53333), altitude=4, country='United States'),
-    'K78D': station(name='Caro, Tuscola Area Airport', coordinate=(43.45861, -83.44528), altitude=214, country='United States'),
-    'K78N': station(name='Reidsville, Rockingham County NC Shiloh Airport', coordinate=(36.43722, -79.85083), altitude=211, country='United States'),
-    'K78W': station(name='South Port / Oak Island Coast Guard Station', coordinate=(33.88333, -78.01667), altitude=1, country='United States'),
-    'K79J': station(name='OPP/ANDALUSIA', coordinate=(31.3, -86.38333), altitude=94, country='United States'),
-    'K79W': station(name='Oregon Inlet Coast Guard Station', coordinate=(35.76667, -75.51667), altitude=1, country='United States'),
-    'K7A9': station(name='Plains / Peterson Field', coordinate=(32.08333, -84.36667), altitude=160, country='United States'),
-    'K7B5': station(name='West Cameron 560A', coordinate=(28.28333, -93.18333), altitude=0, country='United States'),
-    'K7BM': station(name='Cottonwood Pass', coordinate=(38.7825, -106.21806), altitude=2995, country='United States'),
-    'K7D2': station(name='Troy, Oakland/Troy Airport', coordinate=(42.54278, -83.17778), altitude=222, country='United States'),
-    'K7F6': station(name='Clarksville, Clarksville-Red River County Airport', coordinate=(33.59306, -95.06333), altitude=134, country='United States'),
-    'K7F9': station(name='Comanche, Comanche County-City Airport', coordinate=(31.91667, -98.60028), altitude=423, country='United States'),
-    'K7L2': station(name='Linton Municipal Airport', coordinate=(46.22056, -100.24556), altitude=542, country='United States'),
-    'K7R1': station(name='Venice, Venice Heliport', coordinate=(29.26278, -89.36333), altitude=0, country='United States'),
-    'K7R2': station(name='Leeville', coordinate=(29.21667, -90.23333), altitude=2, country='United States'),
-    'K7R3': station(name='Amelia / Lake Palourd', coordinate=(29.7, -91.1), altitude=2, country='United States'),
-    'K7R4': station(name='Intracoastal City', coordinate=(29.78333, -92.13333), altitude=5, country='United States'),
-    'K7R5': station(name='Cameron Heliport', coordinate=(29.78333, -93.3), altitude=1, country='United States'),
-    'K7R8': station(name='South Marsh Island', coordinate=(28.3, -91.98333), altitude=1, country='United States'),
-    'K82S': station(name='Cape Disappointment', coordinate=(46.28333, -124.05), altitude=55, country='United States'),
-    'K83S': station(name='Coos Bay Coast Guard Station', coordinate=(43.35, -124.33333), altitude=23, country='United States'),
-    'K84J': station(name='Folly Beach Long Range Navigation', coordinate=(32.68333, -79.88333), altitude=3, country='United States'),
-    'K84Q': station(name='Blunts Reef Coast Guard Station', coordinate=(40.43333, -124.5), altitude=8, country='United States'),
-    'K84S': station(name='Grays Harbor Coast Guard Station', coordinate=(46.91667, -124.1), altitude=6, country='United States'),
-    'K85J': station(name='Georgetown Coast Guard Light Station', coordinate=(33.21667, -79.18333), altitude=8, country='United States'),
-    'K85Q': station(name='Santa Cruz Harbor', coordinate=(36.96667, -122.0), altitude=1, country='United States'),
-    'K85S': station(name='Siuslaw River Coast Guard Station', coordinate=(44.0, -124.11667), altitude=12, country='United States'),
-    'K86J': station(name='Sullivans Island Coast Guard Station', coordinate=(32.76667, -79.85), altitude=3, country='United States'),
-    'K86Q': station(name='St George Reef Coast Guard Light Station', coordinate=(41.83333, -124.4), altitude=45, country='United States'),
-    'K86S': station(name='Smith Island Coast Guard Light Station', coordinate=(48.31667, -122.85), altitude=1, country='United States'),
-    'K87Q': station(name='Point Piedras Blanca', coordinate=(35.66556, -121.28472), altitude=17, country='United States'),
-    'K87S': station(name='Quillayute River Coast Guard Light Station', coordinate=(47.9, -124.63333), altitude=1, country='United States'),
-    'K88Q': station(name='Samoa / Humboldt Bay', coordinate=(40.76667, -124.23333), altitude=2, country='United States'),
-    'K88S': station(name='Tillamook Bay Coast Guard Station', coordinate=(45.56667, -123.91667), altitude=15, country='United States'),
-    'K89Q': station(name='Point Arena Coast Guard Light Station', coordinate=(38.95, -123.73333), altitude=18, country='United States'),
-    'K8A0': station(name='Albertville, Albertville Municipal Airport', coordinate=(34.22889, -86.25556), altitude=315, country='United States'),
-    'K8B9': station(name='Egg Rock Light Station', coordinate=(44.35, -68.13333), altitude=12, country='United States'),
-    'K8D3': station(name='SISSETON MUNICIPAL AIRPORT', coordinate=(45.66667, -96.98333), altitude=354, country='United States'),
-    'K8F7': station(name='Decatur, Decatur Municipal Airport', coordinate=(33.25444, -97.58056), altitude=319, country='United States'),
-    'K8R0': station(name='Pascagoula Coast Guard Station', coordinate=(30.36667, -88.56667), altitude=8, country='United States'),
-    'K8R1': station(name='Mobile Point Coast Guard Station', coordinate=(30.23333, -88.03333), altitude=1, country='United States'),
-    'K8R3': station(name='Southwest Pass Coast Guard Station', coordinate=(28.91667, -89.43333), altitude=1, country='United States'),
-    'K8R5': station(name='Grand Isle Coast Guard Station', coordinate=(29.26667, -89.95), altitude=2, country='United States'),
-    'K8R6': station(name='Calcasieu Coast Guard Station', coordinate=(29.78333, -93.35), altitude=1, country='United States'),
-    'K8R7': station(name='Sabine Pass Coast Guard Station', coordinate=(29.73333, -93.86667), altitude=1, country='United States'),
-    'K8R8': station(name='Freeport Coast Guard Station', coordinate=(28.95, -95.3), altitude=2, country='United States'),
-    'K8S0': station(name='Browning, Starr-Browning Airstrip', coordinate=(48.60111, -113.11472), altitude=1419, country='United States'),
-    'K8Y2': station(name='Buffalo, Buffalo Municipal Airport', coordinate=(45.15889, -93.84306), altitude=295, country='United States'),
-    'K8Y8': station(name='Crane Lake Automatic Weather Observing / Reporting System', coordinate=(46.26667, -92.56667), altitude=350, country='United States'),
-    'K90S': station(name='Umpqua River Coast Guard Station', coordinate=(43.68333, -124.16667), altitude=41, country='United States'),
-    'K91Q': station(name='Point Blunt Coast Guard Light Station', coordinate=(37.85, -122.41667), altitude=73, country='United States'),
-    'K91S': station(name='Alki Point Coast Guard Light Station', coordinate=(47.51667, -122.41667), altitude=1, country='United States'),
-    'K92Q': station(name='Bodega Bay Coast Guard Light Station', coordinate=(38.31667, -123.05), altitude=3, country='United States'),
-    'K92S': station(name='Cape Blanco Coast Guard Station', coordinate=(42.83333, -124.56667), altitude=57, country='United States'),
-    'K93Q': station(name='Pigeon Point Coast Guard Light Station', coordinate=(37.18333, -122.4), altitude=1, country='United States'),
-    'K93S': station(name='Cape Flattery Coast Guard Light Station', coordinate=(48.38333, -124.73333), altitude=26, country='United States'),
-    'K94B': station(name='Wood Island Light Station', coordinate=(43.45, -70.31667), altitude=9, country='United States'),
-    'K94Q': station(name='Point Bonita Coast Guard Light Station', coordinate=(37.8, -122.51667), altitude=1, country='United States'),
-    'K95B': station(name='Cape Vincent Marine Aviation Reporting Station', coordinate=(44.11667, -76.33333), altitude=75, country='United States'),
-    'K95Q': station(name='Point Pinos Coast Guard Light Station', coordinate=(36.63333, -121.93333), altitude=6, country='United States'),
-    'K95S': station(name='Yaquina Bay Coast Guard Station', coordinate=(44.61667, -124.05), altitude=1, country='United States'),
-    'K96B': station(name="Owl's Head Light Station", coordinate=(44.08333, -69.03333), altitude=15, country='United States'),
-    'K96D': station(name='Walhalla Municipal Airport', coordinate=(48.94056, -97.90278), altitude=None, country='United States'),
-    'K96Q': station(name='Trinidad Head Coast Guard Light Station', coordinate=(41.05, -124.15), altitude=58, country='United States'),
-    'K96S': station(name='New Dungeness Coast Guard Station', coordinate=(48.16667, -123.1), altitude=12, country='United States'),
-    'K97Q': station(name='Point Reyes Coast Guard Station', coordinate=(38.0, -123.01667), altitude=87, country='United States'),
-    'K97S': station(name='Point No Point Coast Guard Station', coordinate=(47.91667, -122.53333), altitude=1, country='United States'),
-    'K98Q': station(name='Rio Vista Coast Guard Light Station', coordinate=(38.15, -121.7), altitude=1, country='United States'),
-    'K99M': station(name='Moorhead, Moorhead Municipal Airport', coordinate=(46.83917, -96.66306), altitude=280, country='United States'),
-    'K99Q': station(name='Port Chicago', coordinate=(38.03333, -122.03333), altitude=12, country='United States'),
-    'K99S': station(name='Point Robinson Coast Guard Light Station', coordinate=(47.38333, -122.36667), altitude=0, country='United States'),
-    'K9B2': station(name='Newport', coordinate=(44.93333, -72.2), altitude=233, country='United States'),
-    'K9B5': station(name='Bear Island Coast Guard Station', coordinate=(44.28333, -68.26667), altitude=12, country='United States'),
-    'K9BB': station(name='Wells', coordinate=(41.11667, -114.96667), altitude=1722, country='United States'),
-    'K9D7': station(name='Cando Municipal Airport', coordinate=(48.48, -99.23639), altitude=451, country='United States'),
-    'K9F2': station(name='Fourchon Supplementary Aviation Weather Reporting Station', coordinate=(29.1, -90.2), altitude=2, country='United States'),
-    'K9L0': station(name='Dana Point', coordinate=(33.45, -117.68333), altitude=15, country='United States'),
-    'K9L2': station(name='Edwards, Edwards Air Force Auxiliary North Base', coordinate=(34.98333, -117.85), altitude=701, country='United States'),
-    'K9R0': station(name='Galveston Coast Guard Station', coordinate=(29.33333, -94.76667), altitude=1, country='United States'),
-    'K9R1': station(name='Port Aransas Coast Guard Station', coordinate=(27.83333, -97.06667), altitude=1, country='United States'),
-    'K9V9': station(name='CHAMBERLAIN MUNICIPAL AIRPORT', coordinate=(43.76667, -99.31667), altitude=517, country='United States'),
-    'K9W7': station(name='Currituck, Currituck County Airport', coordinate=(36.39889, -76.01611), altitude=5, country='United States'),
-    'KA21': station(name='Portage Glacier, Portage Visitor Center', coordinate=(60.78417, -148.84611), altitude=31, country='United States'),
-    'KAAA': station(name='Lincoln, Logan County Airport', coordinate=(40.15861, -89.335), altitude=182, country='United States'),
-    'KAAF': station(name='APALACHICOLA MUNICIPAL AIRPORT', coordinate=(29.73333, -85.01667), altitude=6, country='United States'),
-    'KAAO': station(name='WICHITA JABARA AIRPORT', coordinate=(37.75, -97.21667), altitude=433, country='United States'),
-    'KAAT': station(name='ALTURAS', coordinate=(41.48333, -120.56667), altitude=1333, country='United States'),
-    'KABE': station(name='LEHIGH VALLEY INTERNATIONAL  AIRPORT', coordinate=(40.65, -75.45), altitude=120, country='United States'),
-    'KABI': station(name='ABILENE REGIONAL AIRPORT', coordinate=(32.41667, -99.68333), altitude=546, country='United States'),
-    'KABQ': station(name='ALBUQUERQUE INTERNATIONAL  AIRPORT', coordinate=(35.03333, -106.6), altitude=1631, country='United States'),
-    'KABR': station(name='ABERDEEN REGIONAL AIRPORT', coordinate=(45.45, -98.41667), altitude=397, country='United States'),
-    'KABX': station(name='Albuquerque Nexrad', coordinate=(35.15, -106.81667), altitude=1814, country='United States'),
-    'KABY': station(name='ALBANY SOUTHWEST GEORGIA', coordinate=(31.53333, -84.2), altitude=60, country='United States'),
-    'KACB': station(name='Bellaire, Antrim County Airport', coordinate=(44.98833, -85.19833), altitude=190, country='United States'),
-    'KACK': station(name='NANTUCKET MEMORIAL AIRPORT', coordinate=(41.25, -70.06667), altitude=15, country='United States'),
-    'KACP': station(name='Oakdale, Allen Parish Airport', coordinate=(30.75056, -92.68861), altitude=33, country='United States'),
-    'KACQ': station(name='Waseca, Waseca Municipal Airport', coordinate=(44.07333, -93.55306), altitude=343, country='United States'),
-    'KACT': station(name='WACO REGIONAL AIRPORT', coordinate=(31.6, -97.21667), altitude=157, country='United States'),
-    'KACV': station(name='ARCATA/EUREKA ARCATA AIRPORT', coordinate=(40.98333, -124.1), altitude=66, country='United States'),
-    'KACY': station(name='ATLANTIC CITY INTERNATIONAL', coordinate=(39.46667, -74.58333), altitude=23, country='United States'),
-    'KADC': station(name='Wadena, Wadena Municipal Airport', coordinate=(46.45028, -95.21083), altitude=417, country='United States'),
-    'KADG': station(name='ADRIAN LENAWEE COUNTY AIRPORT', coordinate=(41.86667, -84.08333), altitude=243, country='United States'),
-    'KADH': station(name='Ada, Ada Municipal Airport', coordinate=(34.80444, -96.67139), altitude=310, country='United States'),
-    'KADM': station(name='Ardmore, Ardmore Municipal Airport', coordinate=(34.30306, -97.01944), altitude=232, country='United States'),
-    'KADQ': station(name='Kodiak, Kodiak Airport', coordinate=(57.75111, -152.48556), altitude=22, country='United States'),
-    'KADS': station(name='Dallas / Addison Airport', coordinate=(32.96667, -96.83333), altitude=196, country='United States'),
-    'KADU': station(name='Audubon, Audubon County Airport', coordinate=(41.70111, -94.92028), altitude=392, country='United States'),
-    'KADW': station(name='Camp Springs / Andrews Air Force Base', coordinate=(38.81667, -76.85), altitude=86, country='United States'),
-    'KAEG': station(name='Albuquerque, Double Eagle II Airport', coordinate=(35.145, -106.795), altitude=1779, country='United States'),
-    'KAEJ': station(name='Buena Vista', coordinate=(38.81417, -106.12056), altitude=2422, country='United States'),
-    'KAEL': station(name='Albert Lea, Albert Lea Municipal Airport', coordinate=(43.68333, -93.36667), altitude=384, country='United States'),
-    'KAEX': station(name='ALEXANDRIA INTERNATIONAL AIRPORT', coordinate=(31.55, -92.93333), altitude=27, country='United States'),
-    'KAFF': station(name='Air Force Academy', coordinate=(38.96667, -104.81667), altitude=2003, country='United States'),
-    'KAFJ': station(name='Washington, Washington County Airport', coordinate=(40.13333, -80.28333), altitude=361, country='United States'),
-    'KAFK': station(name='Nebraska City, Nebraska City Municipal Airport', coordinate=(40.6, -95.85), altitude=354, country='United States'),
-    'KAFN': station(name='JAFFREY MUNI-SILVER RANCH', coordinate=(42.8, -72.0), altitude=317, country='United States'),
-    'KAFP': station(name='Wadesboro, Anson County Airport', coordinate=(35.02056, -80.07694), altitude=91, country='United States'),
-    'KAFW': station(name='FORT WORTH ALLIANCE AIRPORT', coordinate=(32.98333, -97.31667), altitude=220, country='United States'),
-    'KAGC': station(name='PITTSBURGH ALLEGHENY CTY.', coordinate=(40.35, -79.91667), altitude=382, country='United States'),
-    'KAGR': station(name='Avon Park Gunnery Range', coordinate=(27.65, -81.33333), altitude=20, country='United States'),
-    'KAGS': station(name='AUGUSTA BUSH FIELD', coordinate=(33.36667, -81.96667), altitude=44, country='United States'),
-    'KAHN': station(name='ATHENS BEN EPPS AIRPORT', coordinate=(33.95, -83.33333), altitude=246, country='United States'),
-    'KAIA': station(name='ALLIANCE MUNICIPAL AIRPORT', coordinate=(42.05, -102.8), altitude=1198, country='United States'),
-    'KAID': station(name='Anderson Municipal', coordinate=(40.11667, -85.61667), altitude=280, country='United States'),
-    'KAIG': station(name='Antigo, Langlade County Airport', coordinate=(45.15, -89.1), altitude=464, country='United States'),
-    'KAIO': station(name='Atlantic', coordinate=(41.4, -95.05), altitude=360, country='United States'),
-    'KAIT': station(name='Aitkin, Aitkin Municipal Airport-Steve Kurtz Field', coordinate=(46.55, -93.68333), altitude=367, country='United States'),
-    'KAIZ': station(name='Kaiser Lake Ozark, Lee C Fine Memorial Airport', coordinate=(38.1, -92.55), altitude=265, country='United States'),
-    'KAJG': station(name='Mount Carmel, Mount Carmel Municipal Airport', coordinate=(38.60639, -87.72667), altitude=131, country='United States'),
-    'KAKH': station(name='GASTONIA MUNICIPAL AIRPORT', coordinate=(35.2, -81.15), altitude=243, country='United States'),
-    'KAKO': station(name='COLORADO PLAINS REGIONAL', coordinate=(40.16667, -103.21667), altitude=1437, country='United States'),
-    'KAKQ': station(name='WAKEFIELD MUNICIPAL AIRPOR', coordinate=(36.98333, -77.0), altitude=34, country='United States'),
-    'KAKR': station(name='AKRON FULTON INTERNATIONAL', coordinate=(41.03333, -81.46667), altitude=326, country='United States'),
-    'KAKW': station(name='Klawock, Klawock Airport', coordinate=(55.57611, -133.07611), altitude=15, country='United States'),
-    'KALB': station(name='ALBANY INTERNATIONAL AIRPORT', coordinate=(42.75, -73.8), altitude=87, country='United States'),
-    'KALI': station(name='ALICE INTERNATIONAL AIRPORT', coordinate=(27.73333, -98.01667), altitude=54, country='United States'),
-    'KALM': station(name='Alamogordo-White', coordinate=(32.83333, -105.98333), altitude=1279, country='United States'),
-    'KALN': station(name='Alton/St. Louis, St. Louis Regional Airport', coordinate=(38.9, -90.05), altitude=166, country='United States'),
-    'KALO': station(name='WATERLOO MUNICIPAL AIRPORT', coordinate=(42.55, -92.4), altitude=266, country='United States'),
-    'KALS': station(name='SAN LUIS VALLEY REGIONAL', coordinate=(37.43333, -105.86667), altitude=2297, country='United States'),
-    'KALW': station(name='WALLA WALLA REGIONAL AIRPORT', coordinate=(46.1, -118.28333), altitude=367, country='United States'),
-    'KALX': station(name='Alexander City, Thomas C Russell Field Airport', coordinate=(32.91472, -85.96278), altitude=209, country='United States'),
-    'KAMA': station(name='AMARILLO INTERNATIONAL  AIRPORT', coordinate=(35.21667, -101.71667), altitude=1099, country='United States'),
-    'KAMG': station(name='ALMA BACON COUNTY AIRPORT', coordinate=(31.53333, -82.5), altitude=61, country='United States'),
-    'KAMN': station(name='Alma, Gratiot Community Airport', coordinate=(43.32194, -84.68778), altitude=229, country='United States'),
-    'KAMW': station(name='AMES MUNICIPAL AIRPORT', coordinate=(41.98333, -93.61667), altitude=291, country='United States'),
-    'KAMX': station(name='Miami Nexrad', coordinate=(25.61667, -80.41667), altitude=34, country='United States'),
-    'KANB': station(name='ANNISTON METRO AIRPORT', coordinate=(33.58333, -85.85), altitude=187, country='United States'),
-    'KAND': station(name='ANDERSON COUNTY AIRPORT', coordinate=(34.5, -82.71667), altitude=238, country='United States'),
-    'KANE': station(name='Minneapolis / Blaine', coordinate=(45.15, -93.21667), altitude=278, country='United States'),
-    'KANJ': station(name='SAULT STE. MARIE MUNI', coordinate=(46.48333, -84.35), altitude=218, country='United States'),
-    'KANN': station(name='Annette, Annette Island Airport', coordinate=(55.03028, -131.57611), altitude=36, country='United States'),
-    'KANW': station(name='Ainsworth Municipal', coordinate=(42.58333, -100.0), altitude=789, country='United States'),
-    'KAOH': station(name='LIMA ALLEN COUNTY AIRPORT', coordinate=(40.7, -84.01667), altitude=297, country='United States'),
-    'KAOO': station(name='ALTOONA-BLAIR COUNTY AIRPORT', coordinate=(40.3, -78.31667), altitude=458, country='United States'),
-    'KAPA': station(name='DENVER CENTENNIAL AIRPORT', coordinate=(39.56667, -104.85), altitude=1793, country='United States'),
-    'KAPC': station(name='NAPA COUNTY AIRPORT', coordinate=(38.2, -122.28333), altitude=10, country='United States'),
-    'KAPF': station(name='NAPLES MUNICIPAL AIRPORT', coordinate=(26.15, -81.76667), altitude=3, country='United States'),
-    'KAPG': station(name='Phillips Army Air Field / Aberdeen', coordinate=(39.46667, -76.16667), altitude=18, country='United States'),
-    'KAPN': station(name='ALPENA COUNTY REGIONAL AIRPORT', coordinate=(45.08333, -83.56667), altitude=210, country='United States'),
-    'KAPV': station(name='Apple Valley', coordinate=(34.58333, -117.18333), altitude=932, country='United States'),
-    'KAQO': station(name='Llano, Llano Municipal Airport', coordinate=(30.78361, -98.66194), altitude=336, country='United States'),
-    'KAQP': station(name='Appleton, Appleton Municipal Airport', coordinate=(45.2275, -96.00417), altitude=310, country='United States'),
-    'KAQQ': station(name='Apalachicola, Apalachicola', coordinate=(29.72694, -85.02472), altitude=6, country='United States'),
-    'KAQR': station(name='Atoka, Atoka Municipal Airport', coordinate=(34.39833, -96.14806), altitude=180, country='United States'),
-    'KAQV': station(name='Ft. Polk, Peason Ridge', coordinate=(31.66667, -93.45), altitude=111, country='United States'),
-    'KAQW': station(name='N ADAMS HARRIMAN-AND-WEST', coordinate=(42.7, -73.16667), altitude=199, country='United States'),
-    'KARA': station(name='NEW IBERIA ACADIANA REGIONAL', coordinate=(30.03333, -91.88333), altitude=7, country='United States'),
-    'KARB': station(name='ANN ARBOR MUNICIPAL AIRPORT', coordinate=(42.21667, -83.75), altitude=256, country='United States'),
-    'KARG': station(name='Walnut Ridge, Walnut Ridge Regional Airport', coordinate=(36.13333, -90.91667), altitude=83, country='United States'),
-    'KARL': station(name='Arlington', coordinate=(41.7, -106.21667), altitude=2179, country='United States'),
-    'KARM': station(name='Wharton, Wharton Regional Airport', coordinate=(29.25417, -96.15417), altitude=31, country='United States'),
-    'KARR': station(name='CHICAGO AURORA MUNICIPAL', coordinate=(41.76667, -88.46667), altitude=217, country='United States'),
-    'KART': station(name='WATERTOWN INTERNATIONAL  AIRPORT', coordinate=(43.98333, -76.03333), altitude=99, country='United States'),
-    'KARV': station(name='Minocqua/Woodruff, Lakeland Airport/Noble F. Lee Memorial Field', coordinate=(45.93333, -89.73333), altitude=497, country='United States'),
-    'KASD': station(name='SLIDELL AIRPORT', coordinate=(30.35, -89.81667), altitude=9, country='United States'),
-    'KASE': station(name='ASPEN-PITKIN COUNTY AIRPORT', coordinate=(39.23333, -106.86667), altitude=2384, country='United States'),
-    'KASG': station(name='Springdale Municipal', coordinate=(36.18333, -94.11667), altitude=412, country='United States'),
-    'KASH': station(name='Nashua, Boire Field Airport', coordinate=(42.78167, -71.51472), altitude=61, country='United States'),
-    'KASJ': station(name='Ahoskie, Tri-County Airport', coordinate=(36.2975, -77.17083), altitude=21, country='United States'),
-    'KAST': station(name='PORT OF ASTORIA AIRPORT', coordinate=(46.15, -123.88333), altitude=3, country='United States'),
-    'KASW': station(name='Warsaw, Warsaw Municipal Airport', coordinate=(41.27444, -85.84), altitude=259, country='United States'),
-    'KASX': station(name='ASHLAND KENNEDY MEMORIAL', coordinate=(46.55, -90.91667), altitude=252, country='United States'),
-    'KATL': station(name='HARTSFIELD-JACKSON ATLANTA', coordinate=(33.65, -84.43333), altitude=313, country='United States'),
-    'KATP': station(name='Atlantis', coordinate=(27.19556, -90.02694), altitude=None, country='United States'),
-    'KATS': station(name='Artesia, Artesia Municipal Airport', coordinate=(32.8525, -104.4675), altitude=1079, country='United States'),
-    'KATT': station(name='CAMP MABRY/AUSTIN CITY ASOS', coordinate=(30.31667, -97.76667), altitude=201, country='United States'),
-    'KATW': station(name='Appleton / Outagamie', coordinate=(44.25, -88.51667), altitude=280, country='United States'),
-    'KATX': station(name='Seattle NEXRAD', coordinate=(48.2, -122.5), altitude=185, country='United States'),
-    'KATY': station(name='WATERTOWN MUNICIPAL AIRPORT', coordinate=(44.9, -97.15), altitude=533, country='United States'),
-    'KAUB': station(name='Auburn University Automatic Meteorological Observing System', coordinate=(32.6, -85.5), altitude=198, country='United States'),
-    'KAUD': station(name='Audubon Park', coordinate=(29.93333, -90.13333), altitude=2, country='United States'),
-    'KAUG': station(name='AUGUSTA STATE AIRPORT', coordinate=(44.31667, -69.8), altitude=107, country='United States'),
-    'KAUH': station(name='Aurora, Aurora Municipal Airport', coordinate=(40.89389, -97.99444), altitude=550, country='United States'),
-    'KAUM': station(name='Austin Municipal', coordinate=(43.66667, -92.93333), altitude=375, country='United States'),
-    'KAUN': station(name='Auburn, Auburn Municipal Airport', coordinate=(38.95, -121.06667), altitude=467, country='United States'),
-    'KAUO': station(name='Auburn-Opelika Airport', coordinate=(32.61667, -85.43333), altitude=236, country='United States'),
-    'KAUS': station(name='AUSTIN-BERGSTROM INTERNATIONAL  AIRPORT', coordinate=(30.18333, -97.68333), altitude=165, country='United States'),
-    'KAUW': station(name='WAUSAU DOWNTOWN AIRPORT', coordinate=(44.93333, -89.61667), altitude=366, country='United States'),
-    'KAVC': station(name='South Hill, Mecklenburg-Brunswick Regional Airport', coordinate=(36.68861, -78.05417), altitude=135, country='United States'),
-    'KAVK': station(name='Alva, Alva Regional Airport', coordinate=(36.77306, -98.67), altitude=449, country='United States'),
-    'KAVL': station(name='ASHEVILLE REGIONAL AIRPORT', coordinate=(35.43333, -82.53333), altitude=660, country='United States'),
-    'KAVP': station(name='WILKES-BARRE/SCRANTON INTERNATIONAL', coordinate=(41.33333, -75.73333), altitude=293, country='United States'),
-    'KAVX': station(name='AVALON CATALINA AIRPORT', coordinate=(33.4, -118.41667), altitude=488, country='United States'),
-    'KAWG': station(name='Washington', coordinate=(41.28333, -91.66667), altitude=230, country='United States'),
-    'KAWH': station(name='Wildhorse Reservation / Elko', coordinate=(41.66667, -115.78333), altitude=1902, country='United States'),
-    'KAWI': station(name='Wainwright, Wainwright Airport', coordinate=(70.63861, -160.00667), altitude=9, country='United States'),
-    'KAWM': station(name='WEST MEMPHIS MUNICIPAL AIRPORT', coordinate=(35.13333, -90.23333), altitude=65, country='United States'),
-    'KAWO': station(name='Arlington Municipal', coordinate=(48.16667, -122.16667), altitude=42, country='United States'),
-    'KAXA': station(name='Algona', coordinate=(43.08333, -94.26667), altitude=372, country='United States'),
-    'KAXN': station(name='CHANDLER FIELD', coordinate=(45.86667, -95.4), altitude=434, country='United States'),
-    'KAXO': station(name='Grand Isle Supplementary Aviation Weather Reporting Station', coordinate=(29.25, -89.96667), altitude=2, country='United States'),
-    'KAXS': station(name='Altus, Altus/Quartz Mountain Regional Airport', coordinate=(34.69861, -99.33806), altitude=437, country='United States'),
-    'KAYE': station(name='Fort Devens / Ayer', coordinate=(42.56667, -71.6), altitude=82, country='United States'),
-    'KAYS': station(name='Waycross / Ware County, Ga', coordinate=(31.25, -82.4), altitude=46, country='United States'),
-    'KAZC': station(name='Colorado City, Colorado City Municipal Airport', coordinate=(36.95, -113.0), altitude=1486, country='United States'),
-    'KAZO': station(name='KALAMAZOO/BATTLE CREEK AIRPORT', coordinate=(42.23333, -85.55), altitude=266, country='United States'),
-    'KB23': station(name='Battle Mountain', coordinate=(40.6, -116.86667), altitude=1381, country='United States'),
-    'KBAB': station(name='Marysville, Beale Air Force Base', coordinate=(39.13333, -121.43333), altitude=34, country='United States'),
-    'KBAC': station(name='Barnes County Municipal Airport', coordinate=(46.94111, -98.01806), altitude=427, country='United States'),
-    'KBAD': station(name='Barksdale Air Force Base', coordinate=(32.5, -93.66667), altitude=51, country='United States'),
-    'KBAF': station(name='WESTFIELD BARNES MUNICIPAL', coordinate=(42.16667, -72.71667), altitude=83, country='United States'),
-    'KBAK': station(name='Columbus / Bakalar', coordinate=(39.26667, -85.9), altitude=200, country='United States'),
-    'KBAN': station(name='MCMWTC BRIDGEPORT, CA', coordinate=(38.35, -119.51667), altitude=2057, country=None),
-    'KBAX': station(name='Bad Axe, Huron County Memorial Airport', coordinate=(43.78083, -82.98556), altitude=233, country='United States'),
-    'KBAZ': station(name='NEW BRAUNFELS MUNICIPAL AIRPORT', coordinate=(29.71667, -98.05), altitude=198, country='United States'),
-    'KBBB': station(name='Benson Municipal', coordinate=(45.31667, -95.65), altitude=317, country='United States'),
-    'KBBD': station(name='Brady, Curtis Field Airport', coordinate=(31.17917, -99.32389), altitude=557, country='United States'),
-    'KBBF': station(name='Brazos 133', coordinate=(27.835, -96.01306), altitude=None, country='United States'),
-    'KBBW': station(name='BROKEN BOW MUNICIPAL AIRPORT', coordinate=(41.43333, -99.63333), altitude=776, country='United States'),
-    'KBCB': station(name='Virginia Tech Airport', coordinate=(37.21667, -80.41667), altitude=650, country='United States'),
-    'KBCE': station(name='BRYCE CANYON AIRPORT', coordinate=(37.7, -112.15), altitude=2312, country='United States'),
-    'KBCG': station(name='Butte La Rose', coordinate=(30.11667, -91.55), altitude=10, country='United States'),
-    'KBCT': station(name='Boca Raton, Boca Raton Airport', coordinate=(26.37861, -80.10778), altitude=4, country='United States'),
-    'KBDE': station(name='BAUDETTE INTERNATIONAL AIRPORT', coordinate=(48.73333, -94.61667), altitude=330, country='United States'),
-    'KBDF': station(name='Bradford / Rinkenberg', coordinate=(41.23333, -89.61667), altitude=247, country='United States'),
-    'KBDL': station(name='BRADLEY INTERNATIONAL AIRPORT', coordinate=(41.93333, -72.68333), altitude=53, country='United States'),
-    'KBDR': station(name='SIKORSKY MEMORIAL AIRPORT', coordinate=(41.16667, -73.13333), altitude=3, country='United States'),
-    'KBED': station(name='BEDFORD HANSCOM FIELD', coordinate=(42.46667, -71.3), altitude=41, country='United States'),
-    'KBEH': station(name='SOUTHWEST MICHIGAN REGIONAL', coordinate=(42.13333, -86.41667), altitude=196, country='United States'),
-    'KBET': station(name='Bethel, Bethel Airport', coordinate=(60.78583, -161.82639), altitude=39, country='United States'),
-    'KBFD': station(name='BRADFORD REGIONAL AIRPORT', coordinate=(41.8, -78.63333), altitude=653, country='United States'),
-    'KBFF': station(name='SCOTTSBLUFF HEILIG FIELD', coordinate=(41.86667, -103.6), altitude=1209, country='United States'),
-    'KBFI': station(name='SEATTLE BOEING FIELD', coordinate=(47.55, -122.31667), altitude=5, country='United States'),
-    'KBFL': station(name='BAKERSFIELD MEADOWS FIELD', coordinate=(35.43333, -119.05), altitude=155, country='United States'),
-    'KBFM': station(name='MOBILE DOWNTOWN AIRPORT', coordinate=(30.63333, -88.06667), altitude=8, country='United States'),
-    'KBFU': station(name='Belle Fourche', coordinate=(43.93333, -105.45), altitude=1422, country='United States'),
-    'KBFW': station(name='Silver Bay', coordinate=(47.2, -91.4), altitude=331, country='United States'),
-    'KBGD': station(name='BORGER HUTCHINSON CO AIRPORT', coordinate=(35.7, -101.4), altitude=931, country='United States'),
-    'KBGE': station(name='Bainbridge, Decatur County Industrial Air Park Airport', coordinate=(30.96667, -84.63333), altitude=43, country='United States'),
-    'KBGM': station(name='BINGHAMTON REGIONAL AIRPORT', coordinate=(42.2, -75.98333), altitude=499, country='United States'),
-    'KBGR': station(name="BANGOR INT'L AIRPORT", coordinate=(44.8, -68.81667), altitude=59, country='United States'),
-    'KBHB': station(name='Bar Harbor, Hancock County-Bar Harbor Airport', coordinate=(44.45, -68.36667), altitude=25, country='United States'),
-    'KBHK': station(name='BAKER MUNICIPAL AIRPORT', coordinate=(46.35, -104.25), altitude=906, country='United States'),
-    'KBHM': station(name="BIRMINGHAM INT'L AIRPORT", coordinate=(33.56667, -86.75), altitude=196, country='United States'),
-    'KBHX': station(name='Eureka NEXRAD', coordinate=(40.5, -124.3), altitude=767, country='United States'),
-    'KBID': station(name='Block Island, Block Island State Airport', coordinate=(41.16667, -71.56667), altitude=33, country='United States'),
-    'KBIE': station(name='Beatrice Municipal', coordinate=(40.3, -96.75), altitude=403, country='United States'),
-    'KBIF': station(name='Biggs Army Air Field / Ft. Bliss', coordinate=(31.85, -106.38333), altitude=1204, country='United States'),
-    'KBIG': station(name='Delta Junction / Ft. Greely, Allen Army Air Field', coordinate=(63.99361, -145.6925), altitude=389, country='United States'),
-    'KBIH': station(name='BISHOP AIRPORT', coordinate=(37.36667, -118.36667), altitude=1256, country='United States'),
-    'KBIL': station(name='LOGAN INTERNATIONAL AIRPORT', coordinate=(45.81667, -108.55), altitude=1112, country='United States'),
-    'KBIS': station(name='BISMARCK MUNICIPAL AIRPORT', coordinate=(46.78333, -100.75), altitude=511, country='United States'),
-    'KBIT': station(name='Bittercreek', coordinate=(41.65, -108.58333), altitude=2160, country='United States'),
-    'KBIV': station(name='HOLLAND TULIP CITY AIRPORT', coordinate=(42.75, -86.1), altitude=210, country='United States'),
-    'KBIX': station(name='Keesler Air Force Base / Biloxi', coordinate=(30.41667, -88.91667), altitude=10, country='United States'),
-    'KBJC': station(name='Broomfield / Jeffco', coordinate=(39.91667, -105.11667), altitude=1724, country='United States'),
-    'KBJI': station(name='Bemidji', coordinate=(47.5, -94.93333), altitude=423, country='United States'),
-    'KBJJ': station(name='WOOSTER WAYNE COUNTY AIRPORT', coordinate=(40.86667, -81.88333), altitude=347, country='United States'),
-    'KBJN': station(name='Las Vegas, Tonopah Range #74 Nellis AFB', coordinate=(37.61667, -116.26417), altitude=1756, country='United States'),
-    'KBKB': station(name='Ft. Polk, Fullerton Landing Strip', coordinate=(31.0, -93.61667), altitude=94, country='United States'),
-    'KBKE': station(name='BAKER MUNICIPAL AIRPORT', coordinate=(44.83333, -117.81667), altitude=1027, country='United States'),
-    'KBKF': station(name='Aurora, Buckley Air Force Base Airport', coordinate=(39.71, -104.75806), altitude=1726, country='United States'),
-    'KBKL': station(name='CLEVELAND BURKE LAKEFRONT', coordinate=(41.53333, -81.66667), altitude=178, country='United States'),
-    'KBKS': station(name='Falfurrias, Brooks County Airport', coordinate=(27.20667, -98.12111), altitude=34, country='United States'),
-    'KBKT': station(name='Ft. Pickett / Blackstone', coordinate=(37.08333, -77.95), altitude=130, country='United States'),
-    'KBKV': station(name='BROOKSVILLE HERNANDO CO AIRPORT', coordinate=(28.46667, -82.45), altitude=23, country='United States'),
-    'KBKW': station(name='RALEIGH COUNTY MEM AIRPORT', coordinate=(37.8, -81.11667), altitude=763, country='United States'),
-    'KBKX': station(name='Brookings, Brookings Municipal Airport', coordinate=(44.3, -96.81667), altitude=502, country='United States'),
-    'KBLF': station(name='BLUEFIELD MERCER COUNTY AIRPORT', coordinate=(37.3, -81.2), altitude=871, country='United States'),
-    'KBLH': station(name='BLYTHE AIRPORT', coordinate=(33.61667, -114.71667), altitude=121, country='United States'),
-    'KBLI': station(name='BELLINGHAM INTERNATIONAL  AIRPORT', coordinate=(48.8, -122.53333), altitude=51, country='United States'),
-    'KBLM': station(name='Belmar-Farmingdale', coordinate=(40.18333, -74.13333), altitude=48, country='United States'),
-    'KBLU': station(name='BLUE CANYON AIRPORT', coordinate=(39.28333, -120.7), altitude=1611, country='United States'),
-    'KBLV': station(name='Belleville, Scott AFB/MidAmerica Airport', coordinate=(38.55, -89.85), altitude=140, country='United States'),
-    'KBLX': station(name='Billing Yell Nexrad', coordinate=(45.85389, -108.60611), altitude=1116, country='United States'),
-    'KBMG': station(name='MONROE COUNTY AIRPORT', coordinate=(39.15, -86.61667), altitude=258, country='United States'),
-    'KBMI': station(name='Bloomington/Normal, Central Illinois Regional Airport at Bloomington-Normal', coordinate=(40.47694, -88.91583), altitude=266, country='United States'),
-    'KBML': station(name='BERLIN MUNICIPAL AIRPORT', coordinate=(44.58333, -71.18333), altitude=353, country='United States'),
-    'KBMQ': station(name='BURNET MUNICIPAL CRADDOCK FIELD', coordinate=(30.73333, -98.23333), altitude=393, country='United States'),
-    'KBMX': station(name='Birmingham Nexrad', coordinate=(33.16667, -86.75), altitude=231, country='United States'),
-    'KBNA': station(name='NASHVILLE INTERNATIONAL  AIRPORT', coordinate=(36.11667, -86.68333), altitude=183, country='United States'),
-    'KBNO': station(name='BURNS MUNICIPAL AIRPORT', coordinate=(43.6, -118.95), altitude=1263, country='United States'),
-    'KBNW': station(name='Boone Municipal', coordinate=(42.05, -93.85), altitude=354, country='United States'),
-    'KBNY': station(name='Burney', coordinate=(40.88333, -121.66667), altitude=957, country='United States'),
-    'KBOI': station(name='BOISE AIR TERMINAL', coordinate=(43.56667, -116.23333), altitude=871, country='United States'),
-    'KBOK': station(name='Brookings, Brookings Airport', coordinate=(42.07444, -124.29), altitude=140, country='United States'),
-    'KBOS': station(name='BOSTON LOGAN INTERNATIONAL', coordinate=(42.36667, -71.01667), altitude=6, country='United States'),
-    'KBOW': station(name='Bartow Municipal', coordinate=(27.95, -81.78333), altitude=39, country='United States'),
-    'KBOX': station(name='Boston Nexrad', coordinate=(41.95, -71.13333), altitude=71, country='United States'),
-    'KBPG': station(name='Big Spring, Big Spring McMahon-Wrinkle Airport', coordinate=(32.2, -101.51667), altitude=784, country='United States'),
-    'KBPI': station(name='BIG PINEY-MARBLETON AIRPORT', coordinate=(42.58333, -110.1), altitude=2131, country='United States'),
-    'KBPK': station(name='OZARK REGIONAL AIRPORT', coordinate=(36.36667, -92.46667), altitude=283, country='United States'),
-    'KBPP': station(name='Bowman, Bowman Municipal Airport', coordinate=(46.18694, -103.42806), altitude=902, country='United States'),
-    'KBPT': station(name='SOUTHEAST TEXAS RGNL AIRPORT', coordinate=(30.58333, -94.13333), altitude=5, country='United States'),
-    'KBQK': station(name='Brunswick / Glynco', coordinate=(31.25, -81.46667), altitude=8, country='United States'),
-    'KBQX': station(name='Brazos 451', coordinate=(28.49361, -95.72444), altitude=None, country='United States'),
-    'KBRD': station(name='BRAINERD-CROW WING CO AIRPORT', coordinate=(46.4, -94.13333), altitude=374, country='United States'),
-    'KBRL': station(name='BURLINGTON REGIONAL AIRPORT', coordinate=(40.76667, -91.13333), altitude=213, country='United States'),
-    'KBRO': station(name='BROWNSVILLE/SOUTH PADRE IS', coordinate=(25.9, -97.41667), altitude=7, country='United States'),
-    'KBRX': station(name='Bordeaux', coordinate=(41.93333, -104.95), altitude=1422, country='United States'),
-    'KBTL': station(name='W.K.KELLOGG REGIONAL AIRPORT', coordinate=(42.3, -85.25), altitude=290, country='United States'),
-    'KBTM': station(name='BERT MOONEY AIRPORT', coordinate=(45.96667, -112.5), altitude=1690, country='United States'),
-    'KBTP': station(name='Butler, Butler County Airport/K W Scholter Field', coordinate=(40.78333, -79.95), altitude=380, country='United States'),
-    'KBTR': station(name='BATON ROUGE METRO RYAN FIELD', coordinate=(30.53333, -91.15), altitude=21, country='United States'),
-    'KBTT': station(name='Bettles, Bettles Airport', coordinate=(66.91611, -151.50889), altitude=196, country='United States'),
-    'KBTV': station(name='BURLINGTON INTERNATIONAL', coordinate=(44.46667, -73.15), altitude=102, country='United States'),
-    'KBUF': station(name='GREATER BUFFALO INTERNATIONAL  AIRPORT', coordinate=(42.93333, -78.73333), altitude=221, country='United States'),
-    'KBUO': station(name='Beaumont', coordinate=(33.93333, -116.96667), altitude=692, country='United States'),
-    'KBUR': station(name='BURBANK-GLENDALE-PASADENA', coordinate=(34.2, -118.36667), altitude=236, country='United States'),
-    'KBUU': station(name='Burlington, Burlington Municipal Airport', coordinate=(42.69056, -88.30472), altitude=237, country='United States'),
-    'KBUY': station(name='BURLINGTON ALAMANCE REGIONAL', coordinate=(36.03333, -79.46667), altitude=188, country='United States'),
-    'KBVE': station(name='Boothville', coordinate=(29.33333, -89.4), altitude=0, country='United States'),
-    'KBVI': station(name='Beaver Falls Airport', coordinate=(40.76667, -80.4), altitude=382, country='United States'),
-    'KBVN': station(name='Albion, Albion Municipal Airport', coordinate=(41.72833, -98.05556), altitude=551, country='United States'),
-    'KBVO': station(name='BARTLESVILLE MUNICIPAL AIRPORT', coordinate=(36.76667, -96.01667), altitude=217, country='United States'),
-    'KBVR': station(name='Beaver Rim', coordinate=(42.58333, -108.28333), altitude=2072, country='United States'),
-    'KBVS': station(name='Burlington/Mount Vernon, Skagit Regional Airport', coordinate=(48.47083, -122.42083), altitude=44, country='United States'),
-    'KBVX': station(name='Batesville, Batesville Regional Airport', coordinate=(35.73333, -91.65), altitude=141, country='United States'),
-    'KBVY': station(name='BEVERLY MUNICIPAL AIRPORT', coordinate=(42.58333, -70.91667), altitude=33, country='United States'),
-    'KBWD': station(name='Brownwood, Brownwood Regional Airport', coordinate=(31.8, -98.95), altitude=422, country='United States'),
-    'KBWG': station(name='BOWLING GREEN-WARREN CO RGNL', coordinate=(36.96667, -86.41667), altitude=167, country='United States'),
-    'KBWI': station(name='BALTIMORE-WASHINGTON INTERNATIONAL', coordinate=(39.16667, -76.68333), altitude=45, country='United States'),
-    'KBWP': station(name='Wahpeton, Harry Stern Airport', coordinate=(46.24389, -96.60722), altitude=295, country='United States'),
-    'KBXA': station(name='Bogalusa, George R Carr Memorial Air Field', coordinate=(30.81361, -89.86472), altitude=36, country='United States'),
-    'KBYG': station(name='BUFFALO JOHNSON COUNTY AIRPORT', coordinate=(44.38333, -106.71667), altitude=1514, country='United States'),
-    'KBYH': station(name='Eaker Air Force Base', coordinate=(35.96667, -89.95), altitude=78, country='United States'),
-    'KBYI': station(name='BURLEY MUNICIPAL AIRPORT', coordinate=(42.55, -113.76667), altitude=1265, country='United States'),
-    'KBYS': station(name='Fort Irwin/Barstow, Bicycle Lake Army Airfield', coordinate=(35.28333, -116.61667), altitude=716, country='United States'),
-    'KBYY': station(name='Bay City, Bay City Municipal Airport', coordinate=(28.97306, -95.86333), altitude=14, country='United States'),
-    'KBZN': station(name='BOZEMAN GALLATIN FIELD', coordinate=(45.78333, -111.15), altitude=1364, country='United States'),
-    'KC09': station(name='Morris, Morris Municipal-James R Washburn Field Airport', coordinate=(41.42528, -88.41861), altitude=178, country='United States'),
-    'KC19': station(name='Holland / Tulip City', coordinate=(42.75, -86.1), altitude=210, country='United States'),
-    'KC52': station(name='Burlington, Burlington Municipal Airport', coordinate=(42.69056, -88.30472), altitude=237, country='United States'),
-    'KC58': station(name='Two Rivers Coast Guard Station', coordinate=(44.13333, -87.55), altitude=176, country='United States'),
-    'KC73': station(name='Dixon / Walgreen Field', coordinate=(41.83333, -89.45), altitude=240, country='United States'),
-    'KC75': station(name='Lacon, Marshall County Airport', coordinate=(41.01917, -89.38639), altitude=173, country='United States'),
-    'KC96': station(name='Winter Park Resort', coordinate=(39.88333, -105.76667), altitude=2771, country='United States'),
-    'KCAD': station(name='Cadillac / Wexford County', coordinate=(44.28333, -85.41667), altitude=398, country='United States'),
-    'KCAE': station(name='COLUMBIA METROPOLITAN AIRPORT', coordinate=(33.95, -81.11667), altitude=72, country='United States'),
-    'KCAG': station(name='CRAIG MOFFAT AIRPORT', coordinate=(40.5, -107.51667), altitude=1888, country='United States'),
-    'KCAK': station(name='AKRON-CANTON REGIONAL AIRPORT', coordinate=(40.91667, -81.45), altitude=374, country='United States'),
-    'KCAO': station(name='CLAYTON MUNICIPAL AIRPARK', coordinate=(36.45, -103.15), altitude=1513, country='United States'),
-    'KCAR': station(name='CARIBOU MUNICIPAL AIRPORT', coordinate=(46.86667, -68.01667), altitude=191, country='United States'),
-    'KCAV': station(name='Clarion', coordinate=(42.75, -93.76667), altitude=354, country='United States'),
-    'KCBE': station(name='Cumberland, Greater Cumberland Regional Airport', coordinate=(39.61528, -78.76083), altitude=236, country='United States'),
-    'KCBF': station(name='Council Bluffs', coordinate=(41.26667, -95.76667), altitude=382, country='United States'),
-    'KCBG': station(name='Cambridge Municipal', coordinate=(45.56667, -93.26667), altitude=287, country='United States'),
-    'KCBM': station(name='Columbus Air Force Base', coordinate=(33.65, -88.45), altitude=67, country='United States'),
-    'KCCO': station(name='Newnan, Newnan Coweta County Airport', coordinate=(33.31222, -84.77028), altitude=296, country='United States'),
-    'KCCR': station(name='CONCORD BUCHANAN FIELD', coordinate=(38.0, -122.05), altitude=7, country='United States'),
-    'KCCU': station(name='Copper Mountain, Red Cliff Pass', coordinate=(39.46722, -106.15028), altitude=3680, country='United States'),
-    'KCCX': station(name='State College Nexrad', coordinate=(40.91667, -78.0), altitude=758, country='United States'),
-    'KCCY': station(name='Charles City', coordinate=(43.06667, -92.61667), altitude=343, country='United States'),
-    'KCDC': station(name='CEDAR CITY MUN AIRPORT', coordinate=(37.7, -113.1), altitude=1715, country='United States'),
-    'KCDD': station(name='Crane Lake, Scotts Seaplane Base', coordinate=(48.26639, -92.48361), altitude=341, country='United States'),
-    'KCDH': station(name='Camden / Harrell Field', coordinate=(33.61667, -92.76667), altitude=40, country='United States'),
-    'KCDJ': station(name='CHILLICOTHE AGRI-SCIENCE CTR', coordinate=(39.81667, -93.58333), altitude=234, country='United States'),
-    'KCDR': station(name='CHADRON MUNICIPAL AIRPORT', coordinate=(42.83333, -103.1), altitude=1005, country='United States'),
-    'KCDS': station(name='CHILDRESS MUNICIPAL AIRPORT', coordinate=(34.43333, -100.28333), altitude=595, country='United States'),
-    'KCDV': station(name='Cordova, Smith Airport', coordinate=(60.48889, -145.45111), altitude=12, country='United States'),
-    'KCDW': station(name='CALDWELL ESSEX COUNTY AIRPORT', coordinate=(40.88333, -74.28333), altitude=53, country='United States'),
-    'KCEC': station(name='CRESCENT CITY MC NAMARA', coordinate=(41.78333, -124.23333), altitude=17, country='United States'),
-    'KCEF': station(name='Chicopee Falls / Westover Air Force Base', coordinate=(42.2, -72.53333), altitude=75, country='United States'),
-    'KCEU': station(name='CLEMSON-OCONEE COUNTY AIRPORT', coordinate=(34.66667, -82.88333), altitude=272, country='United States'),
-    'KCEW': station(name='CRESTVIEW SIKES AIRPORT', coordinate=(30.76667, -86.51667), altitude=65, country='United States'),
-    'KCEZ': station(name='CORTEZ MONTEZUMA COUNTY AIRPORT', coordinate=(37.3, -108.63333), altitude=1804, country='United States'),
-    'KCFE': station(name='Buffalo, Buffalo Municipal Airport', coordinate=(45.15889, -93.84306), altitude=295, country='United States'),
-    'KCFS': station(name='Caro, Tuscola Area Airport', coordinate=(43.45861, -83.44528), altitude=214, country='United States'),
-    'KCFT': station(name='Clifton/Morenci, Greenlee County Airport', coordinate=(32.95278, -109.21028), altitude=1162, country='United States'),
-    'KCFV': station(name='COFFEYVILLE MUNICIPAL AIRPORT', coordinate=(37.08333, -95.56667), altitude=230, country='United States'),
-    'KCGF': station(name='Cleveland / Cuyahoga', coordinate=(41.56667, -81.48333), altitude=268, country='United States'),
-    'KCGI': station(name='CAPE GIRARDEAU REGIONAL', coordinate=(37.23333, -89.58333), altitude=104, country='United States'),
-    'KCGX': station(name='Chicago / Meigs', coordinate=(41.86667, -87.6), altitude=181, country='United States'),
-    'KCGZ': station(name='Casa Grande, Casa Grande Municipal Airport', coordinate=(32.95, -111.76667), altitude=446, country='United States'),
-    'KCHA': station(name='LOVELL FIELD', coordinate=(35.03333, -85.2), altitude=208, country='United States'),
-    'KCHD': station(name='Chandler, Chandler Municipal Airport', coordinate=(33.26917, -111.81111), altitude=379, country='United States'),
-    'KCHH': station(name='Chatham', coordinate=(41.66667, -69.96667), altitude=14, country='United States'),
-    'KCHI': station(name='Chicago Weather Service Forecast Office', coordinate=(42.0, -87.88333), altitude=181, country='United States'),
-    'KCHK': station(name='Chickasha, Chickasha Municipal Airport', coordinate=(35.09611, -97.96611), altitude=351, country='United States'),
-    'KCHO': station(name='CHARLOTTESVILLE-ALBEMARLE', coordinate=(38.13333, -78.45), altitude=195, country='United States'),
-    'KCHS': station(name="CHARLESTON INT'L AIRPORT", coordinate=(32.9, -80.03333), altitude=14, country='United States'),
-    'KCIC': station(name='Chico Municipal', coordinate=(39.8, -121.85), altitude=73, country='United States'),
-    'KCID': station(name='CEDAR RAPIDS AIRPORT', coordinate=(41.88333, -91.71667), altitude=263, country='United States'),
-    'KCIN': station(name='Carroll', coordinate=(42.05, -94.78333), altitude=375, country='United States'),
-    'KCIR': station(name='Cairo, Cairo Regional Airport', coordinate=(37.06444, -89.21944), altitude=98, country='United States'),
-    'KCIU': station(name='Sault Ste Marie, Chippewa County International Airport', coordinate=(46.25, -84.46667), altitude=244, country='United States'),
-    'KCJR': station(name='Culpeper, Culpeper County Airport', coordinate=(38.52667, -77.85889), altitude=95, country='United States'),
-    'KCKB': station(name='HARRISON/MARION REGIONAL', coordinate=(39.3, -80.21667), altitude=367, country='United States'),
-    'KCKC': station(name='Grand Marais, Grand Marais/Cook County Airport', coordinate=(47.83833, -90.38306), altitude=548, country='United States'),
-    'KCKL': station(name='Centreville', coordinate=(32.9, -87.25), altitude=140, country='United States'),
-    'KCKN': station(name='Crookston Municipal Field', coordinate=(47.85, -96.61667), altitude=273, country='United States'),
-    'KCKP': station(name='Cherokee, Cherokee Municipal Airport', coordinate=(42.73167, -95.55583), altitude=374, country='United States'),
-    'KCKV': station(name='CLARKSVILLE OUTLAW FIELD', coordinate=(36.61667, -87.41667), altitude=168, country='United States'),
-    'KCLE': station(name='CLEVELAND-HOPKINS INTERNATIONAL', coordinate=(41.4, -81.85), altitude=241, country='United States'),
-    'KCLI': station(name='Clintonville, Clintonville Municipal Airport', coordinate=(44.61389, -88.73139), altitude=251, country='United States'),
-    'KCLK': station(name='Clinton, Clinton Regional Airport', coordinate=(35.53806, -98.92139), altitude=492, country='United States'),
-    'KCLL': station(name='COLLEGE STN EASTERWOOD FIELD', coordinate=(30.58333, -96.36667), altitude=98, country='United States'),
-    'KCLM': station(name='PORT ANGELES FAIRCHILD INTERNATIONAL', coordinate=(48.11667, -123.5), altitude=88, country='United States'),
-    'KCLT': station(name='CHARLOTTE/DOUGLAS INTERNATIONAL', coordinate=(35.21667, -80.95), altitude=228, country='United States'),
-    'KCMA': station(name='CAMARILLO AIRPORT', coordinate=(34.21667, -119.08333), altitude=23, country='United States'),
-    'KCMB': station(name='East Cameron 47', coordinate=(29.44056, -92.97917), altitude=None, country='United States'),
-    'KCMH': station(name='PORT COLUMBUS INTERNATIONAL  AIRPORT', coordinate=(40.0, -82.88333), altitude=248, country='United States'),
-    'KCMI': station(name='UNIV OF ILLINOIS-WILLARD', coordinate=(40.03333, -88.26667), altitude=230, country='United States'),
-    'KCMS': station(name='Cemetery Separa', coordinate=(41.53333, -109.46667), altitude=1949, country='United States'),
-    'KCMX': station(name='HANCOCK HOUGHTON CTY. MEMO', coordinate=(47.16667, -88.48333), altitude=334, country='United States'),
-    'KCMY': station(name='Sparta, Sparta / Fort McCoy Airport', coordinate=(43.95833, -90.73778), altitude=255, country='United States'),
-    'KCNB': station(name='Myers Field Airport', coordinate=(44.71667, -96.26667), altitude=364, country='United States'),
-    'KCNC': station(name='Chariton', coordinate=(41.03333, -93.36667), altitude=320, country='United States'),
-    'KCNK': station(name='Concordia, Blosser Municipal Airport', coordinate=(39.55139, -97.65056), altitude=453, country='United States'),
-    'KCNM': station(name='CARLSBAD CAVERN CITY', coordinate=(32.33333, -104.26667), altitude=1004, country='United States'),
-    'KCNO': station(name='CHINO AIRPORT', coordinate=(33.96667, -117.63333), altitude=198, country='United States'),
-    'KCNU': station(name='CHANUTE JOHNSON AIRPORT', coordinate=(37.66667, -95.48333), altitude=305, country='United States'),
-    'KCNY': station(name='MOAB CANYONLANDS FIELD', coordinate=(38.76667, -109.75), altitude=1388, country='United States'),
-    'KCOD': station(name='Cody', coordinate=(44.51667, -109.01667), altitude=1551, country='United States'),
-    'KCOE': station(name="Coeur d'Alene, Coeur d'Alene Air Terminal", coordinate=(47.76667, -116.81667), altitude=707, country='United States'),
-    'KCOF': station(name='Cocoa / Patrick Air Force Base', coordinate=(28.23333, -80.6), altitude=3, country='United States'),
-    'KCOI': station(name='Merritt Island, Merritt Island Airport', coordinate=(28.34139, -80.68528), altitude=2, country='United States'),
-    'KCON': station(name='Concord, Concord Municipal Airport', coordinate=(43.19528, -71.50111), altitude=105, country='United States'),
-    'KCOQ': station(name='Cloquet, Cloquet Carlton County Airport', coordinate=(46.7, -92.5), altitude=390, country='United States'),
-    'KCOS': station(name='COLORADO SPRINGS MUNI', coordinate=(38.81667, -104.71667), altitude=1885, country='United States'),
-    'KCOT': station(name='COTULLA-LASALLE COUNTY AIRPORT', coordinate=(28.45, -99.21667), altitude=145, country='United States'),
-    'KCOU': station(name='COLUMBIA REGIONAL AIRPORT', coordinate=(38.81667, -92.21667), altitude=271, country='United States'),
-    'KCPC': station(name='Whiteville, Columbus County Municipal Airport', coordinate=(34.27278, -78.715), altitude=30, country='United States'),
-    'KCPK': station(name='Chesapeake, Chesapeake Municipal Airport', coordinate=(36.66556, -76.32056), altitude=6, country='United States'),
-    'KCPR': station(name='NATRONA COUNTY INTERNATIONAL  AIRPORT', coordinate=(42.9, -106.46667), altitude=1630, country='United States'),
-    'KCPS': station(name='ST LOUIS DOWNTOWN AIRPORT', coordinate=(38.56667, -90.15), altitude=126, country='United States'),
-    'KCPT': station(name='Cleburne, Cleburne Municipal Airport', coordinate=(32.35361, -97.43361), altitude=260, country='United States'),
-    'KCPW': station(name='Pagosa Springs, Wolf Creek Pass', coordinate=(37.45139, -106.80028), altitude=3584, country='United States'),
-    'KCQB': station(name='Chandler, Chandler Municipal Airport', coordinate=(35.72389, -96.82028), altitude=300, country='United States'),
-    'KCQC': station(name='Clines Corners', coordinate=(35.0, -105.66667), altitude=2160, country='United States'),
-    'KCQM': station(name='Cook, Cook Municipal Airport', coordinate=(47.82194, -92.68944), altitude=405, country='United States'),
-    'KCQN': station(name='Chattanooga / Daisy', coordinate=(35.16667, -85.15), altitude=225, country='United States'),
-    'KCQT': station(name='LOS ANGELES USC CAMPUS', coordinate=(34.03333, -118.28333), altitude=56, country='United States'),
-    'KCQV': station(name='Colville Municipal', coordinate=(48.55, -117.88333), altitude=572, country='United States'),
-    'KCQX': station(name='CHATHAM MUNICIPAL AIRPORT', coordinate=(41.68333, -70.0), altitude=21, country='United States'),
-    'KCRE': station(name='N. MYRTLE BCH.GRAND STRAND', coordinate=(33.81667, -78.71667), altitude=10, country='United States'),
-    'KCRG': station(name='JACKSONVILLE CRAIG MUN', coordinate=(30.33333, -81.51667), altitude=13, country='United States'),
-    'KCRH': station(name='West Cameron', coordinate=(28.90861, -93.30167), altitude=None, country='United States'),
-    'KCRP': station(name='CORPUS CHRISTI INTERNATIONAL', coordinate=(27.76667, -97.51667), altitude=13, country='United States'),
-    'KCRQ': station(name='CARLSBAD MCCLELLAN-PALOMAR', coordinate=(33.13333, -117.28333), altitude=100, country='United States'),
-    'KCRS': station(name='CORSICANA AIRFIELD', coordinate=(32.01667, -96.38333), altitude=136, country='United States'),
-    'KCRV': station(name='Nederland Mountain, Corona Pass', coordinate=(40.05028, -105.58389), altitude=3538, country='United States'),
-    'KCRW': station(name='YEAGER AIRPORT', coordinate=(38.36667, -81.6), altitude=299, country='United States'),
-    'KCSG': station(name='COLUMBUS METROPOLITAN AIRPORT', coordinate=(32.51667, -84.95), altitude=121, country='United States'),
-    'KCSL': station(name='Camp San Luis Airport', coordinate=(35.33333, -120.73333), altitude=76, country='United States'),
-    'KCSM': station(name='CLINTON-SHERMAN AIRPORT', coordinate=(35.35, -99.2), altitude=586, country='United States'),
-    'KCSQ': station(name='Creston', coordinate=(41.01667, -94.36667), altitude=394, country='United States'),
-    'KCSV': station(name='CROSSVILLE MEMORIAL AIRPORT', coordinate=(35.95, -85.08333), altitude=573, country='United States'),
-    'KCTB': station(name='CUT BANK MUNICIPAL AIRPORT', coordinate=(48.6, -112.38333), altitude=1175, country='United States'),
-    'KCTD': station(name='Continental Div', coordinate=(41.71667, -107.78333), altitude=2146, country='United States'),
-    'KCTO': station(name='Calverton / Grumman', coordinate=(40.91667, -72.78333), altitude=23, country='United States'),
-    'KCTY': station(name='CROSS CITY AIRPORT', coordinate=(29.63333, -83.1), altitude=13, country='United States'),
-    'KCTZ': station(name='Clinton, Sampson County Airport', coordinate=(34.97556, -78.36472), altitude=45, country='United States'),
-    'KCUB': station(name='OWENS DOWNTOWN AIRPORT', coordinate=(33.96667, -81.0), altitude=65, country='United States'),
-    'KCUH': station(name='Cushing, Cushing Municipal Airport', coordinate=(35.94972, -96.77278), altitude=279, country='United States'),
-    'KCUL': station(name='Carmi, Carmi Municipal Airport', coordinate=(38.08944, -88.12306), altitude=118, country='United States'),
-    'KCUT': station(name='CUSTER COUNTY AIRPORT', coordinate=(43.73333, -103.61667), altitude=1707, country='United States'),
-    'KCVG': station(name='CINCINNATI/NORTHERN KY INTERNATIONAL', coordinate=(39.05, -84.66667), altitude=273, country='United States'),
-    'KCVN': station(name='Clovis, Clovis Municipal Airport', coordinate=(34.43333, -103.08333), altitude=1285, country='United States'),
-    'KCVO': station(name='Corvallis, Corvallis Municipal Airport', coordinate=(44.5, -123.28333), altitude=75, country='United States'),
-    'KCVS': station(name='Cannon Air Force Base / Clovis', coordinate=(34.38333, -103.31667), altitude=1309, country='United States'),
-    'KCVX': station(name='Charlevoix, Charlevoix Municipal Airport', coordinate=(45.30472, -85.27472), altitude=204, country='United States'),
-    'KCWA': station(name='Mosinee / Central Wisconsin', coordinate=(44.78333, -89.66667), altitude=389, country='United States'),
-    'KCWF': station(name='Chenault Airpark', coordinate=(30.21667, -93.15), altitude=4, country='United States'),
-    'KCWI': station(name='Clinton, Clinton Municipal Airport', coordinate=(41.83333, -90.33333), altitude=216, country='United States'),
-    'KCWL': station(name='Calexico, Calexico International Airport', coordinate=(32.66944, -115.51333), altitude=1, country='United States'),
-    'KCXO': station(name='LONE STAR EXECUTIVE AIRPORT', coordinate=(30.35, -95.41667), altitude=75, country='United States'),
-    'KCXP': station(name='Carson City', coordinate=(39.19222, -119.7325), altitude=1434, country='United States'),
-    'KCXY': station(name='HARRISBURG CAPITAL CITY', coordinate=(40.21667, -76.85), altitude=106, country='United States'),
-    'KCYS': station(name='CHEYENNE AIRPORT', coordinate=(41.15, -104.8), altitude=1878, country='United States'),
-    'KCZD': station(name='Cozad Municipal', coordinate=(40.86667, -100.0), altitude=762, country='United States'),
-    'KCZK': station(name='Cascade Locks State', coordinate=(45.66667, -121.88333), altitude=46, country='United States'),
-    'KCZZ': station(name='Campo', coordinate=(32.62611, -116.46833), altitude=807, country='United States'),
-    'KD07': station(name='FAITH, SOUTH DAKOTA', coordinate=(45.03333, -102.01667), altitude=787, country='United States'),
-    'KD19': station(name='Luverne, Quentin Aanenson Field Airport', coordinate=(43.62111, -96.21556), altitude=436, country='United States'),
-    'KD45': station(name='Warroad', coordinate=(48.93333, -95.35), altitude=328, country='United States'),
-    'KD50': station(name='Crosby Municipal Airport', coordinate=(48.92861, -103.29722), altitude=594, country='United States'),
-    'KD55': station(name='Roberston Field Landon', coordinate=(48.75306, -98.39361), altitude=490, country='United States'),
-    'KD60': station(name='Tioga Municipal Airport', coordinate=(48.38028, -102.8975), altitude=692, country='United States'),
-    'KD87': station(name='Harbor Springs, Harbor Springs Airport', coordinate=(45.42556, -84.91333), altitude=209, country='United States'),
-    'KD97': station(name='South St. Paul Municipal', coordinate=(44.85, -93.15), altitude=250, country='United States'),
-    'KDAA': station(name='Fort Belvoir', coordinate=(38.71667, -77.18333), altitude=21, country='United States'),
-    'KDAB': station(name='DAYTONA BEACH INTERNATIONAL', coordinate=(29.16667, -81.06667), altitude=11, country='United States'),
-    'KDAG': station(name='BARSTOW-DAGGETT AIRPORT', coordinate=(34.85, -116.78333), altitude=587, country='United States'),
-    'KDAL': station(name='DALLAS LOVE FIELD', coordinate=(32.85, -96.85), altitude=148, country='United States'),
-    'KDAN': station(name='DANVILLE REGIONAL AIRPORT', coordinate=(36.56667, -79.33333), altitude=174, country='United States'),
-    'KDAW': station(name='SKYHAVEN AIRPORT', coordinate=(43.28333, -70.91667), altitude=98, country='United States'),
-    'KDAX': station(name='Sacramento Nexrad', coordinate=(38.5, -121.68333), altitude=44, country='United States'),
-    'KDAY': station(name='COX DAYTON INTERNATIONAL', coordinate=(39.9, -84.21667), altitude=308, country='United States'),
-    'KDBN': station(name="Dublin, W H 'Bud' Barron Airport", coordinate=(32.56444, -82.985), altitude=94, country='United States'),
-    'KDBQ': station(name='DUBUQUE REGIONAL AIRPORT', coordinate=(42.4, -90.7), altitude=328, country='United States'),
-    'KDCA': station(name='WASHINGTON NATIONAL AIRPORT', coordinate=(38.85, -77.03333), altitude=5, country='United States'),
-    'KDCU': station(name='PRYOR FIELD', coordinate=(34.65, -86.95), altitude=180, country='United States'),
-    'KDDC': station(name='DODGE CITY REGIONAL AIRPORT', coordinate=(37.76667, -99.96667), altitude=791, country='United States'),
-    'KDDH': station(name='BENNINGTON MORSE STATE AIRPORT', coordinate=(42.88333, -73.25), altitude=252, country='United States'),
-    'KDEC': station(name='DECATUR AIRPORT', coordinate=(39.83333, -88.86667), altitude=208, country='United States'),
-    'KDEE': station(name='Deering, Deering Airport', coordinate=(66.07056, -162.75833), altitude=4, country='United States'),
-    'KDEH': station(name='Decorah', coordinate=(43.28333, -91.73333), altitude=353, country='United States'),
-    'KDEN': station(name='DENVER INTERNATIONAL AIRPORT', coordinate=(39.86667, -104.66667), altitude=1655, country='United States'),
-    'KDEQ': station(name='DE QUEEN HELMS SEVIER COUNTY', coordinate=(34.05, -94.4), altitude=108, country='United States'),
-    'KDET': station(name='DETROIT CITY AIRPORT', coordinate=(42.41667, -83.01667), altitude=191, country='United States'),
-    'KDEW': station(name='DEER PARK AIRPORT', coordinate=(47.96667, -117.43333), altitude=672, country='United States'),
-    'KDFI': station(name='DEFIANCE MEMORIAL AIRPORT', coordinate=(41.33333, -84.43333), altitude=216, country='United States'),
-    'KDFW': station(name='DALLAS/FT. WORTH INTERNATIONAL  AIRPORT', coordinate=(32.9, -97.03333), altitude=184, country='United States'),
-    'KDGW': station(name='DOUGLAS CONVERSE COUNTY', coordinate=(42.8, -105.38333), altitude=1502, country='United States'),
-    'KDHN': station(name='DOTHAN AIRPORT', coordinate=(31.31667, -85.45), altitude=122, country='United States'),
-    'KDHS': station(name='Dead Horse', coordinate=(44.21667, -106.1), altitude=1241, country='United States'),
-    'KDHT': station(name='DALHART MUNICIPAL AIRPORT', coordinate=(36.01667, -102.55), altitude=1216, country='United States'),
-    'KDIK': station(name='THEODORE ROOSEVELT REGIONAL', coordinate=(46.8, -102.8), altitude=789, country='United States'),
-    'KDIX': station(name='Philadelphia NEXRAD', coordinate=(39.95, -74.41667), altitude=70, country='United States'),
-    'KDKB': station(name='De Kalb, De Kalb Taylor Municipal Airport', coordinate=(41.93194, -88.70833), altitude=279, country='United States'),
-    'KDKK': station(name='CHAUTAUQUA COUNTY/DUNKIRK', coordinate=(42.5, -79.28333), altitude=211, country='United States'),
-    'KDKR': station(name='Crockett, Houston County Airport', coordinate=(31.30694, -95.40361), altitude=106, country='United States'),
-    'KDKX': station(name='Knoxville Downtown', coordinate=(35.96667, -83.86667), altitude=254, country='United States'),
-    'KDLF': station(name='Laughlin, Laughlin Air Force Base Auxiliary Airfield', coordinate=(29.11667, -100.46667), altitude=294, country='United States'),
-    'KDLH': station(name='Duluth, Duluth International Airport', coordinate=(46.84278, -92.22611), altitude=435, country='United States'),
-    'KDLL': station(name='Baraboo, Baraboo Wisconsin Dells Airport', coordinate=(43.52194, -89.77083), altitude=298, country='United States'),
-    'KDLN': station(name='DILLON AIRPORT', coordinate=(45.25, -112.55), altitude=1597, country='United States'),
-    'KDLP': station(name='West Delta', coordinate=(29.12139, -89.54722), altitude=None, country='United States'),
-    'KDLS': station(name='THE DALLES MUNICIPAL AIRPORT', coordinate=(45.61667, -121.16667), altitude=74, country='United States'),
-    'KDMA': station(name='Davis-Monthan Air Force Base', coordinate=(32.16667, -110.88333), altitude=824, country='United States'),
-    'KDMH': station(name='BALTIMORE DOWNTOWN', coordinate=(39.28333, -76.61667), altitude=6, country='United States'),
-    'KDMN': station(name='DEMING MUNICIPAL AIRPORT', coordinate=(32.26667, -107.71667), altitude=1315, country='United States'),
-    'KDMO': station(name='SEDALIA MEMORIAL AIRPORT', coordinate=(38.71667, -93.16667), altitude=277, country='United States'),
-    'KDMX': station(name='Des Moines Nexrad', coordinate=(41.73333, -93.71667), altitude=322, country='United States'),
-    'KDNK': station(name='Ft. Polk, Self Strip', coordinate=(31.16667, -93.0), altitude=114, country='United States'),
-    'KDNL': station(name='AUGUSTA DANIEL FIELD', coordinate=(33.46667, -82.03333), altitude=129, country='United States'),
-    'KDNN': station(name='Dalton, Dalton Municipal Airport', coordinate=(34.72167, -84.86917), altitude=216, country='United States'),
-    'KDNR': station(name='Denver / Stapleton International, Co.', coordinate=(39.78333, -104.86667), altitude=1626, country='United States'),
-    'KDNS': station(name='Denison', coordinate=(41.98333, -95.38333), altitude=388, country='United States'),
-    'KDNV': station(name='Danville, Vermilion County Airport', coordinate=(40.19944, -87.59556), altitude=212, country='United States'),
-    'KDOV': station(name='Dover Air Force Base', coordinate=(39.13333, -75.46667), altitude=9, country='United States'),
-    'KDPA': station(name='CHICAGO/WEST CH DUPAGE', coordinate=(41.9, -88.25), altitude=231, country='United States'),
-    'KDPG': station(name='Dugway Proving Grounds', coordinate=(40.16667, -112.93333), altitude=1326, country='United States'),
-    'KDPL': station(name='Kenansville, Duplin County Airport', coordinate=(35.0, -77.98167), altitude=42, country='United States'),
-    'KDQH': station(name='Douglas, Douglas Municipal Airport', coordinate=(31.47667, -82.86028), altitude=78, country='United States'),
-    'KDRA': station(name='DESERT ROCK AIRPORT', coordinate=(36.63333, -116.03333), altitude=1010, country='United States'),
-    'KDRC': station(name='Deer Creek', coordinate=(42.83333, -105.86667), altitude=1543, country='United States'),
-    'KDRI': station(name='De Ridder, Beauregard Parish Airport', coordinate=(30.83167, -93.33972), altitude=63, country='United States'),
-    'KDRO': station(name='DURANGO-LA PLATA COUNTY AIRPORT', coordinate=(37.15, -107.76667), altitude=2038, country='United States'),
-    'KDRT': station(name='DEL RIO INTERNATIONAL  AIRPORT', coordinate=(29.36667, -100.91667), altitude=304, country='United States'),
-    'KDSM': station(name='DES MOINES INTERNATIONAL', coordinate=(41.53333, -93.66667), altitude=292, country='United States'),
-    'KDSV': station(name='DANSVILLE MUNICIPAL AIRPORT', coordinate=(42.56667, -77.71667), altitude=202, country='United States'),
-    'KDTL': station(name='Detroit Lakes, Detroit Lakes Airport-Wething Field', coordinate=(46.83333, -95.88333), altitude=426, country='United States'),
-    'KDTN': station(name='SHREVEPORT DOWNTOWN AIRPORT', coordinate=(32.53333, -93.75), altitude=55, country='United States'),
-    'KDTO': station(name='DENTON MUNICIPAL AIRPORT', coordinate=(33.2, -97.2), altitude=196, country='United States'),
-    'KDTS': station(name='DESTIN-FT WALTON BEACH AIRPORT', coordinate=(30.4, -86.46667), altitude=7, country='United States'),
-    'KDTW': station(name='DETROIT METROPOLITAN', coordinate=(42.23333, -83.33333), altitude=195, country='United States'),
-    'KDTX': station(name='Detroit NEXRAD', coordinate=(42.7, -83.45), altitude=361, country='United States'),
-    'KDUA': station(name='Durant, Eaker Field Airport', coordinate=(33.94222, -96.39444), altitude=213, country='United States'),
-    'KDUC': station(name='Duncan, Halliburton Field Airport', coordinate=(34.47083, -97.96), altitude=339, country='United States'),
-    'KDUG': station(name='BISBEE DOUGLAS INTERNATIONAL  AIRPORT', coordinate=(31.46667, -109.6), altitude=1265, country='United States'),
-    'KDUH': station(name='Lambertville, Toledo Suburban Airport', coordinate=(41.73583, -83.65528), altitude=204, country='United States'),
-    'KDUJ': station(name='DU BOIS-JEFFERSON COUNTY', coordinate=(41.18333, -78.88333), altitude=555, country='United States'),
-    'KDUX': station(name='Dumas, Moore County Airport', coordinate=(35.85778, -102.01306), altitude=1129, country='United States'),
-    'KDVL': station(name='Devils Lake, Devils Lake Municipal Airport', coordinate=(48.11667, -98.91667), altitude=444, country='United States'),
-    'KDVN': station(name='DAVENPORT MUNICIPAL AIRPORT', coordinate=(41.61667, -90.58333), altitude=230, country='United States'),
-    'KDVP': station(name='Slayton, Slayton Municipal Airport', coordinate=(43.98667, -95.7825), altitude=495, country='United States'),
-    'KDVT': station(name='PHOENIX-DEER VALLEY MUN', coordinate=(33.68333, -112.06667), altitude=450, country='United States'),
-    'KDWH': station(name='HOUSTON HOOKS MEMORIAL', coordinate=(30.06667, -95.55), altitude=46, country='United States'),
-    'KDXR': station(name='DANBURY MUNICIPAL AIRPORT', coordinate=(41.36667, -73.48333), altitude=140, country='United States'),
-    'KDXX': station(name='Madison, Madison-Lac Qui Parle County Airport', coordinate=(44.98611, -96.17778), altitude=330, country='United States'),
-    'KDYL': station(name='DOYLESTOWN AIRPORT', coordinate=(40.33333, -75.11667), altitude=120, country='United States'),
-    'KDYR': station(name='Dyersburg, Dyersburg Municipal Airport', coordinate=(36.0, -89.4), altitude=103, country='United States'),
-    'KDYS': station(name='Abilene, Dyess Air Force Base', coordinate=(32.42, -99.85694), altitude=545, country='United States'),
-    'KDYT': station(name='Duluth, Sky Harbor Airport', coordinate=(46.72194, -92.04333), altitude=186, country='United States'),
-    'KE12': station(name='East Cameron 345', coordinate=(28.08333, -92.7), altitude=0, country='United States'),
-    'KE15': station(name='Graham, Graham Municipal Airport', coordinate=(33.11, -98.55528), altitude=342, country='United States'),
-    'KE24': station(name='Whiteriver, Whiteriver Airport', coordinate=(33.81667, -109.98333), altitude=1570, country='United States'),
-    'KE28': station(name='Northrup Landing Strip', coordinate=(33.9, -106.4), altitude=1193, country='United States'),
-    'KE29': station(name='Sonora, Sonora Municipal Airport', coordinate=(30.58556, -100.64833), altitude=652, country='United States'),
-    'KE33': station(name='Chama', coordinate=(36.9, -106.58333), altitude=2393, country='United States'),
-    'KE38': station(name='Alpine, Alpine-Casparis Municipal Airport', coordinate=(30.38417, -103.68333), altitude=1376, country='United States'),
-    'KE74': station(name='Safford Automatic Meteorological Observing System', coordinate=(32.81667, -109.68333), altitude=950, country='United States'),
-    'KE80': station(name='Belen Alexander Muni', coordinate=(34.64889, -106.83167), altitude=1583, country='United States'),
-    'KEAA': station(name='Eagle, Eagle Airport', coordinate=(64.77639, -141.16056), altitude=268, country='United States'),
-    'KEAR': station(name='Kearney, Kearney Municipal Airport', coordinate=(40.73333, -99.0), altitude=650, country='United States'),
-    'KEAT': station(name='WENATCHEE PANGBORN MEMO', coordinate=(47.4, -120.2), altitude=379, country='United States'),
-    'KEAU': station(name='EAU CLAIRE CHIPPEWA VALLEY', coordinate=(44.86667, -91.48333), altitude=278, country='United States'),
-    'KEAX': station(name='Pleasant NEXRAD', coordinate=(38.81667, -94.26667), altitude=335, country='United States'),
-    'KEBG': station(name='Edinburg, Edinburg International Airport', coordinate=(26.44194, -98.12944), altitude=24, country='United States'),
-    'KEBS': station(name='Webster City', coordinate=(42.43333, -93.86667), altitude=342, country='United States'),
-    'KECG': station(name='ELIZABETH CITY C/G REGN AIRPORT', coordinate=(36.25, -76.16667), altitude=4, country='United States'),
-    'KECP': station(name='Northwest Florida Beaches International Airport', coordinate=(30.35361, -85.79917), altitude=27, country='United States'),
-    'KECU': station(name='Rocksprings, Edwards County Airport', coordinate=(29.94667, -100.17361), altitude=723, country='United States'),
-    'KEDE': station(name='Edenton, Northeastern Regional Airport', coordinate=(36.02778, -76.56722), altitude=6, country='United States'),
-    'KEDW': station(name='Edwards Air Force Base', coordinate=(34.91667, -117.9), altitude=702, country='United States'),
-    'KEED': station(name='NEEDLES AIRPORT', coordinate=(34.76667, -114.61667), altitude=300, country='United States'),
-    'KEEN': station(name='Keene, Dillant-Hopkins Airport', coordinate=(42.9, -72.26667), altitude=149, country='United States'),
-    'KEEO': station(name='MEEKER AIRPORT', coordinate=(40.05, -107.88333), altitude=1957, country='United States'),
-    'KEET': station(name='SHELBY COUNTY AIRPORT', coordinate=(33.18333, -86.78333), altitude=178, country='United States'),
-    'KEEW': station(name='Neenah', coordinate=(44.21667, -88.55), altitude=275, country='United States'),
-    'KEFC': station(name='Belle Fourche, Belle Fourche Municipal Airport', coordinate=(44.73333, -103.86667), altitude=972, country='United States'),
-    'KEFD': station(name='Houston / Ellington', coordinate=(29.6, -95.16667), altitude=10, country='United States'),
-    'KEFT': station(name='Monroe, Monroe Municipal Airport', coordinate=(42.615, -89.59083), altitude=331, country='United States'),
-    'KEGE': station(name='Eagle County Regional', coordinate=(39.65, -106.91667), altitude=1993, country='United States'),
-    'KEGI': station(name='Duke Field / Eglin Auxiliary', coordinate=(30.65, -86.51667), altitude=59, country='United States'),
-    'KEGV': station(name='Eagle River, Eagle River Union Airport', coordinate=(45.93167, -89.26917), altitude=501, country='United States'),
-    'KEHA': station(name='Elkhart, Elkhart-Morton County Airport', coordinate=(37.0, -101.88333), altitude=1104, country='United States'),
-    'KEHC': station(name='East Cameron 278', coordinate=(28.42889, -92.87806), altitude=None, country='United States'),
-    'KEHO': station(name='Shelby, Shelby Municipal Airport', coordinate=(35.25, -81.6), altitude=258, country='United States'),
-    'KEHR': station(name='Henderson City', coordinate=(37.81667, -87.68333), altitude=117, country='United States'),
-    'KEHY': station(name='Elk Mountain AWOS', coordinate=(41.72528, -106.45944), altitude=2225, country='United States'),
-    'KEIR': station(name='Eugene Island', coordinate=(28.63472, -91.48917), altitude=None, country='United States'),
-    'KEKA': station(name='Eureka', coordinate=(40.8, -124.16667), altitude=13, country='United States'),
-    'KEKM': station(name='Elkhart Municipal', coordinate=(41.71667, -86.0), altitude=237, country='United States'),
-    'KEKN': station(name='JENNINGS RANDOLPH FIELD', coordinate=(38.88333, -79.85), altitude=606, country='United States'),
-    'KEKO': station(name='ELKO REGIONAL AIRPORT', coordinate=(40.83333, -115.78333), altitude=1565, country='United States'),
-    'KEKQ': station(name='Monticello, Wayne County Airport', coordinate=(36.85528, -84.85611), altitude=294, country='United States'),
-    'KELD': station(name='SOUTH ARKANSAS REGIONAL', coordinate=(33.21667, -92.81667), altitude=84, country='United States'),
-    'KELM': station(name='ELMIRA COUNTY AIRPORT', coordinate=(42.16667, -76.9), altitude=291, country='United States'),
-    'KELN': station(name='ELLENSBURG BOWERS FIELD', coordinate=(47.03333, -120.53333), altitude=536, country='United States'),
-    'KELO': station(name='Ely, Ely Municipal Airport', coordinate=(47.81667, -91.83333), altitude=444, country='United States'),
-    'KELP': station(name='EL PASO INTERNATIONAL AIRPORT', coordinate=(31.81667, -106.38333), altitude=1206, country='United States'),
-    'KELY': station(name='ELY AIRPORT (YELLAND FIELD)', coordinate=(39.3, -114.85), altitude=1907, country='United States'),
-    'KELZ': station(name='WELLSVILLE MUNICIPAL AIRPORT', coordinate=(42.1, -78.0), altitude=647, country='United States'),
-    'KEMK': station(name='East Breaks', coordinate=(27.81861, -94.32278), altitude=None, country='United States'),
-    'KEMP': station(name='EMPORIA MUNICIPAL AIRPORT', coordinate=(38.33333, -96.2), altitude=368, country='United States'),
-    'KEMT': station(name='El Monte', coordinate=(34.08333, -118.03333), altitude=90, country='United States'),
-    'KEMV': station(name='Emporia, Emporia-Greensville Regional Airport', coordinate=(36.68694, -77.48278), altitude=39, country='United States'),
-    'KEND': station(name='Vance Air Force Base / Enid', coordinate=(36.33333, -97.91667), altitude=398, country='United States'),
-    'KENL': station(name='Centralia, Centralia Municipal Airport', coordinate=(38.51472, -89.09222), altitude=163, country='United States'),
-    'KENN': station(name='Nenana, Nenana Municipal Airport', coordinate=(64.54778, -149.08389), altitude=110, country='United States'),
-    'KENV': station(name='Wendover / Air Force Auxillary Field', coordinate=(40.73333, -114.03333), altitude=1291, country='United States'),
-    'KENW': station(name='KENOSHA REGIONAL AIRPORT', coordinate=(42.6, -87.93333), altitude=226, country='United States'),
-    'KENX': station(name='Albany NEXRAD', coordinate=(42.6, -74.06667), altitude=581, country='United States'),
-    'KEOK': station(name='Keokuk Municipal', coordinate=(40.46667, -91.43333), altitude=205, country='United States'),
-    'KEPH': station(name='EPHRATA MUNICIPAL AIRPORT', coordinate=(47.3, -119.51667), altitude=388, country='United States'),
-    'KEPO': station(name='Eastport', coordinate=(44.91667, -67.0), altitude=24, country='United States'),
-    'KEPZ': station(name='Santa Teresa', coordinate=(31.86667, -106.7), altitude=1252, country='United States'),
-    'KEQY': station(name='MONROE AIRPORT', coordinate=(35.01667, -80.61667), altitude=207, country='United States'),
-    'KERI': station(name='ERIE INTERNATIONAL AIRPORT', coordinate=(42.08333, -80.18333), altitude=223, country='United States'),
-    'KERV': station(name='Kerrville, Kerrville Municipal Airport/Louis Schreiner Field', coordinate=(29.96667, -99.08333), altitude=493, country='United States'),
-    'KERY': station(name='Newberry, Luce County Airport', coordinate=(46.31111, -85.45722), altitude=265, country='United States'),
-    'KESC': station(name='Escanaba', coordinate=(45.75, -87.03333), altitude=180, country='United States'),
-    'KESF': station(name='ALEXANDRIA ESLER RGNL AIRPORT', coordinate=(31.4, -92.3), altitude=34, country='United States'),
-    'KESN': station(name='Easton / Newman Field', coordinate=(38.8, -76.06667), altitude=22, country='United States'),
-    'KEST': station(name='ESTHERVILLE MUNICIPAL AIRPORT', coordinate=(43.4, -94.75), altitude=401, country='United States'),
-    'KESX': station(name='Las Vegas Nexrad', coordinate=(35.71667, -114.9), altitude=1509, country='United States'),
-    'KETB': station(name='West Bend, West Bend Municipal Airport', coordinate=(43.42222, -88.12806), altitude=270, country='United States'),
-    'KETH': station(name='Wheaton, Wheaton Municipal Airport', coordinate=(45.76667, -96.53333), altitude=312, country='United States'),
-    'KEUF': station(name='WEEDON FIELD AIRPORT', coordinate=(31.95139, -85.13194), altitude=87, country='UNITED STATES'),
-    'KEUG': station(name='MAHLON SWEET FIELD', coordinate=(44.13333, -123.21667), altitude=111, country='United States'),
-    'KEUL': station(name='Caldwell, Caldwell Industrial Airport', coordinate=(43.63333, -116.63333), altitude=741, country='United States'),
-    'KEVB': station(name='New Smyrna Beach, New Smyrna Beach Municipal Airport', coordinate=(29.05556, -80.94833), altitude=3, country='United States'),
-    'KEVM': station(name='Eveleth, Eveleth-Virginia Municipal Airport', coordinate=(47.41667, -92.5), altitude=420, country='United States'),
-    'KEVV': station(name='EVANSVILLE REGIONAL', coordinate=(38.03333, -87.53333), altitude=127, country='United States'),
-    'KEVW': station(name='EVANSTON-UINTA COUNTY FIELD', coordinate=(41.26667, -111.03333), altitude=2183, country='United States'),
-    'KEWB': station(name='NEW BEDFORD REGIONAL AIRPORT', coordinate=(41.68333, -70.96667), altitude=24, country='United States'),
-    'KEWK': station(name='Newton, Newton City/County Airport', coordinate=(38.05, -97.28333), altitude=467, country='United States'),
-    'KEWN': station(name='New Bern, Craven County Regional Airport', coordinate=(35.0675, -77.04722), altitude=5, country='United States'),
-    'KEWR': station(name='NEWARK INTERNATIONAL  AIRPORT', coordinate=(40.68333, -74.16667), altitude=5, country='United States'),
-    'KEWX': station(name='San Antonio Nexrad', coordinate=(29.7, -98.03333), altitude=223, country='United States'),
-    'KEXX': station(name='Lexington, Davidson County Airport', coordinate=(35.78111, -80.30389), altitude=223, country='United States'),
-    'KEYE': station(name='INDIANAPOLIS EAGLE CREEK', coordinate=(39.83333, -86.3), altitude=251, country='United States'),
-    'KEYF': station(name='Elizabethtown, Curtis L Brown Jr. Field Airport', coordinate=(34.6, -78.58333), altitude=40, country='United States'),
-    'KEYW': station(name='KEY WEST INTERNATIONAL AIRPORT', coordinate=(24.55, -81.76667), altitude=1, country='United States'),
-    'KEZF': station(name='Fredericksburg, Shannon Airport', coordinate=(38.26667, -77.45), altitude=26, country='United States'),
-    'KEZM': station(name='Eastman, Heart of Georgia Regional Airport', coordinate=(32.21417, -83.12778), altitude=93, country='United States'),
-    'KF05': station(name='Vernon, Wilbarger County Airport', coordinate=(34.22556, -99.28361), altitude=386, country='United States'),
-    'KF10': station(name='Henryetta Municipal', coordinate=(35.4, -96.01667), altitude=259, country='United States'),
-    'KF18': station(name='Cleburne, Cleburne Municipal Airport', coordinate=(32.35361, -97.43361), altitude=260, country='United States'),
-    'KF28': station(name='El Reno, El Reno Municipal Air Park', coordinate=(35.4725, -98.00556), altitude=432, country='United States'),
-    'KF30': station(name='Sulphur Municipal', coordinate=(34.51667, -96.98333), altitude=320, country='United States'),
-    'KF39': station(name='Sherman-Denison', coordinate=(33.71667, -96.66667), altitude=228, country='United States'),
-    'KF55': station(name='Granbury, Granbury Municipal Airport', coordinate=(32.44417, -97.81694), altitude=237, country='United States'),
-    'KFAF': station(name='Fort Eustis / Felker', coordinate=(37.13333, -76.61667), altitude=4, country='United States'),
-    'KFAM': station(name='Farmington Airport', coordinate=(37.76667, -90.43333), altitude=288, country='United States'),
-    'KFAR': station(name='HECTOR INTERNATIONAL AIRPORT', coordinate=(46.93333, -96.81667), altitude=274, country='United States'),
-    'KFAT': station(name='FRESNO AIR TERMINAL', coordinate=(36.78333, -119.71667), altitude=101, country='United States'),
-    'KFAY': station(name='FAYETTEVILLE REGIONAL AIRPORT', coordinate=(34.98333, -78.88333), altitude=58, country='United States'),
-    'KFBG': station(name='Fort Bragg / Simmons Army Airfield', coordinate=(35.13333, -78.93333), altitude=74, country='United States'),
-    'KFBL': station(name='Faribault, Faribault Municipal Airport', coordinate=(44.33333, -93.31667), altitude=323, country='United States'),
-    'KFCA': station(name='Kalispell, Glacier Park International Airport', coordinate=(48.30417, -114.26361), altitude=906, country='United States'),
-    'KFCH': station(name='Fresno-Chandler', coordinate=(36.73333, -119.81667), altitude=85, country='United States'),
-    'KFCL': station(name='Fort Collins Supplementary Aviation Weather Reporting Station', coordinate=(40.58333, -105.08333), altitude=1525, country='United States'),
-    'KFCM': station(name='Minneapolis, Flying Cloud Airport', coordinate=(44.83222, -93.47028), altitude=287, country='United States'),
-    'KFCS': station(name='Fort Carson', coordinate=(38.7, -104.76667), altitude=1789, country='United States'),
-    'KFCX': station(name='Roanoke NEXRAD', coordinate=(37.01667, -80.26667), altitude=904, country='United States'),
-    'KFDK': station(name='Frederick, Frederick Municipal Airport', coordinate=(39.4175, -77.37444), altitude=92, country='United States'),
-    'KFDR': station(name='FREDERICK MUNICIPAL AIRPORT', coordinate=(34.35, -98.98333), altitude=383, country='United States'),
-    'KFDY': station(name='FINDLAY AIRPORT', coordinate=(41.01667, -83.66667), altitude=247, country='United States'),
-    'KFEP': station(name='Freeport, Albertus Airport', coordinate=(42.24639, -89.58222), altitude=262, country='United States'),
-    'KFET': station(name='Fremont Municipal Airport', coordinate=(41.45, -96.51667), altitude=379, country='United States'),
-    'KFFA': station(name='Kill Devil Hills, First Flight Airport', coordinate=(36.01667, -75.66667), altitude=4, country='United States'),
-    'KFFC': station(name='PEACHTREE CITY-FALCON FIELD', coordinate=(33.36667, -84.56667), altitude=246, country='United States'),
-    'KFFL': station(name='Fair Field', coordinate=(41.05, -91.98333), altitude=244, country='United States'),
-    'KFFM': station(name='Fergus Falls, Fergus Falls Municipal Airport-Einar Mickelson Field', coordinate=(46.28333, -96.15), altitude=360, country='United States'),
-    'KFFO': station(name='Dayton / Wright-Patterson Air Force Base', coordinate=(39.83333, -84.05), altitude=251, country='United States'),
-    'KFFT': station(name='FRANKFORT CAPITAL CITY AIRPORT', coordinate=(38.18333, -84.9), altitude=245, country='United States'),
-    'KFFZ': station(name='Mesa / Falcon Field', coordinate=(33.46667, -111.73333), altitude=424, country='United States'),
-    'KFGN': station(name='Flag Island', coordinate=(49.31667, -94.9), altitude=329, country='United States'),
-    'KFHR': station(name='FRIDAY HARBOR AIRPORT', coordinate=(48.51667, -123.03333), altitude=33, country='United States'),
-    'KFHU': station(name='Fort Huachuca, Libby AAF Ft Huachuca', coordinate=(47.63333, -110.33333), altitude=1438, country='United States'),
-    'KFIG': station(name='CLEARFIELD-LAWRENCE AIRPORT', coordinate=(41.05, -78.41667), altitude=462, country='United States'),
-    'KFIR': station(name='First Divide', coordinate=(41.3, -110.76667), altitude=2294, country='United States'),
-    'KFIT': station(name='Fitchburg, Fitchburg Municipal Airport', coordinate=(42.55194, -71.75583), altitude=106, country='United States'),
-    'KFKA': station(name='Preston, Fillmore County Airport', coordinate=(43.67667, -92.17972), altitude=389, country='United States'),
-    'KFKL': station(name='Franklin, Venango Regional Airport', coordinate=(41.38333, -79.86667), altitude=469, country='United States'),
-    'KFKN': station(name='Franklin / J B Rose', coordinate=(36.7, -76.9), altitude=12, country='United States'),
-    'KFKS': station(name='Frankfort, Frankfort Dow Memorial Field Airport', coordinate=(44.625, -86.20056), altitude=193, country='United States'),
-    'KFLD': station(name='FOND DU LAC COUNTY AIRPORT', coordinate=(43.76667, -88.48333), altitude=247, country='United States'),
-    'KFLG': station(name='FLAGSTAFF PULLIAM AIRPORT', coordinate=(35.13333, -111.66667), altitude=2137, country='United States'),
-    'KFLL': station(name='FORT LAUDERDALE/HOLLYWOOD', coordinate=(26.06667, -80.15), altitude=3, country='United States'),
-    'KFLO': station(name='FLORENCE REGIONAL AIRPORT', coordinate=(34.18333, -79.73333), altitude=45, country='United States'),
-    'KFLP': station(name='Flippin, Marion County Regional Airport', coordinate=(36.3, -92.58333), altitude=219, country='United States'),
-    'KFLV': station(name='Fort Leavenworth', coordinate=(39.36667, -94.91667), altitude=235, country='United States'),
-    'KFME': station(name='Fort Meade / Tipton', coordinate=(39.08333, -76.76667), altitude=46, country='United States'),
-    'KFMH': station(name='Otis Air National Guard Base', coordinate=(41.65, -70.51667), altitude=40, country='United States'),
-    'KFMN': station(name='FARMINGTON FOUR CORNERS', coordinate=(36.75, -108.23333), altitude=1677, country='United States'),
-    'KFMY': station(name='FORT MYERS PAGE FIELD', coordinate=(26.58333, -81.86667), altitude=5, country='United States'),
-    'KFNB': station(name='FALLS CITY BRENNER FLD AIRPORT', coordinate=(40.08333, -95.58333), altitude=300, country='United States'),
-    'KFNL': station(name='Fort Collins/Loveland, Fort Collins-Loveland Municipal Airport', coordinate=(40.45, -105.01667), altitude=1529, country='United States'),
-    'KFNT': station(name='FLINT BISHOP INTERNATIONAL  AIRPORT', coordinate=(42.96667, -83.75), altitude=238, country='United States'),
-    'KFOA': station(name='Flora, Flora Municipal Airport', coordinate=(38.665, -88.45306), altitude=144, country='United States'),
-    'KFOD': station(name='Fort Dodge', coordinate=(42.55, -94.18333), altitude=354, country='United States'),
-    'KFOE': station(name='FORBES FIELD', coordinate=(38.93333, -95.65), altitude=329, country='United States'),
-    'KFOK': station(name='THE GABRESKI AIRPORT', coordinate=(40.85, -72.61667), altitude=20, country='United States'),
-    'KFOQ': station(name='Freeport Supplementary Aviation Weather Reporting Station', coordinate=(29.0, -95.31667), altitude=2, country='United States'),
-    'KFOZ': station(name='Bigfork, Bigfork Municipal Airport', coordinate=(47.78278, -93.65028), altitude=411, country='United States'),
-    'KFPK': station(name='Charlotte, Fitch H Beach Airport', coordinate=(42.57444, -84.81139), altitude=271, country='United States'),
-    'KFPR': station(name='FORT PIERCE ST LUCIE', coordinate=(27.5, -80.38333), altitude=8, country='United States'),
-    'KFQD': station(name='Rutherfordton, Rutherford County-Marchman Field Airport', coordinate=(35.42833, -81.935), altitude=329, country='United States'),
-    'KFRG': station(name='FARMINGDALE REPUBLIC AIRPORT', coordinate=(40.73333, -73.41667), altitude=25, country='United States'),
-    'KFRI': station(name='Fort Riley, Marshall AAF Ft Riley', coordinate=(39.05556, -96.76417), altitude=324, country='United States'),
-    'KFRM': station(name='Fairmont, Fairmont Municipal Airport', coordinate=(43.65, -94.41667), altitude=354, country='United States'),
-    'KFSD': station(name='SIOUX FALLS FOSS FIELD', coordinate=(43.58333, -96.75), altitude=436, country='United States'),
-    'KFSE': station(name='Fosston, Fosston Municipal Airport', coordinate=(47.59278, -95.77333), altitude=389, country='United States'),
-    'KFSI': station(name='Fort Sill', coordinate=(34.6, -98.4), altitude=362, country='United States'),
-    'KFSM': station(name='FORT SMITH REGIONAL AIRPORT', coordinate=(35.33333, -94.36667), altitude=143, country='United States'),
-    'KFST': station(name='FORT STOCKTON PECOS CO AIRPORT', coordinate=(30.91667, -102.91667), altitude=917, country='United States'),
-    'KFSW': station(name='Fort Madison', coordinate=(40.66667, -91.33333), altitude=221, country='United States'),
-    'KFTG': station(name='Denver Nexrad', coordinate=(39.78333, -104.55), altitude=1709, country='United States'),
-    'KFTK': station(name='Fort Knox', coordinate=(37.9, -85.96667), altitude=230, country='United States'),
-    'KFTW': station(name='FORT WORTH MEACHAM INTERNATIONAL .', coordinate=(32.83333, -97.36667), altitude=216, country='United States'),
-    'KFTY': station(name='ATLANTA FULTON COUNTY AIRPORT', coordinate=(33.78333, -84.51667), altitude=256, country='United States'),
-    'KFUL': station(name='FULLERTON MUNICIPAL AIRPORT', coordinate=(33.86667, -117.98333), altitude=29, country='United States'),
-    'KFVE': station(name='NORTHERN AROOSTOOK REGIONAL', coordinate=(47.28333, -68.3), altitude=301, country='United States'),
-    'KFVX': station(name='Farmville', coordinate=(37.35, -78.43333), altitude=125, country='United States'),
-    'KFWA': station(name='FORT WAYNE INTERNATIONAL', coordinate=(41.0, -85.2), altitude=248, country='United States'),
-    'KFWC': station(name='Fairfield, Fairfield Municipal Airport', coordinate=(38.37861, -88.41278), altitude=133, country='United States'),
-    'KFWD': station(name='Fort Worth', coordinate=(32.83333, -97.3), altitude=196, country='United States'),
-    'KFWN': station(name='SUSSEX AIRPORT', coordinate=(41.2, -74.63333), altitude=128, country='United States'),
-    'KFWQ': station(name='Monongahela, Rostraver Airport', coordinate=(40.20972, -79.83139), altitude=374, country='United States'),
-    'KFWS': station(name='Fort Worth, Forth Worth Spinks Airport', coordinate=(32.56667, -97.3), altitude=213, country='United States'),
-    'KFXE': station(name='FORT LAUDERDALE EXECUTIVE', coordinate=(26.2, -80.18333), altitude=4, country='United States'),
-    'KFYJ': station(name='West Point, Middle Peninsula Regional Airport', coordinate=(37.52111, -76.76444), altitude=7, country='United States'),
-    'KFYV': station(name='FAYETTEVILLE DRAKE FIELD', coordinate=(36.0, -94.16667), altitude=381, country='United States'),
-    'KFZY': station(name='FULTON OSWEGO COUNTY AIRPORT', coordinate=(43.35, -76.38333), altitude=145, country='United States'),
-    'KGAD': station(name='Gadsden, Gadsden Municipal Airport', coordinate=(33.96667, -86.08333), altitude=173, country='United States'),
-    'KGAF': station(name='Huston Field', coordinate=(48.40472, -97.37083), altitude=251, country='United States'),
-    'KGAG': station(name='GAGE AIRPORT', coordinate=(36.3, -99.76667), altitude=678, country='United States'),
-    'KGAO': station(name='Galliano, South Lafourche Airport', coordinate=(29.44472, -90.26111), altitude=0, country='United States'),
-    'KGBD': station(name='Great Bend, Great Bend Municipal Airport', coordinate=(38.35, -98.86667), altitude=575, country='United States'),
-    'KGBG': station(name='Galesburg, Galesburg Municipal Airport', coordinate=(40.93806, -90.43111), altitude=233, country='United States'),
-    'KGBK': station(name='Magnolia', coordinate=(27.20389, -92.2025), altitude=None, country='United States'),
-    'KGBN': station(name='Gila Bend U. S. Army Airfield', coordinate=(32.43333, -112.68333), altitude=262, country='United States'),
-    'KGCC': station(name='GILLETTE-CAMPBELL CTY AIRPORT', coordinate=(44.33333, -105.55), altitude=1330, country='United States'),
-    'KGCK': station(name='GARDEN CITY REGIONAL AIRPORT', coordinate=(37.91667, -100.71667), altitude=881, country='United States'),
-    'KGCM': station(name='Claremore, Claremore Regional Airport', coordinate=(36.29444, -95.47972), altitude=221, country='United States'),
-    'KGCN': station(name='GRAND CANYON NATL PARK AIRPORT', coordinate=(35.95, -112.15), altitude=2014, country='United States'),
-    'KGDB': station(name='Granite Falls, Granite Falls Municipal Airport/Lenzen-Roe Memorial Field', coordinate=(44.75306, -95.55583), altitude=319, country='United States'),
-    'KGDJ': station(name='Granbury, Granbury Municipal Airport', coordinate=(32.44417, -97.81667), altitude=237, country='United States'),
-    'KGDP': station(name='GUADALUPE PASS', coordinate=(31.83333, -104.81667), altitude=1663, country='United States'),
-    'KGDV': station(name='Glendive, Dawson Community Airport', coordinate=(47.13333, -104.8), altitude=749, country='United States'),
-    'KGED': station(name='GEORGETOWN SUSSEX CO AIRPORT', coordinate=(38.68333, -75.36667), altitude=16, country='United States'),
-    'KGEG': station(name='SPOKANE INTERNATIONAL AIRPORT', coordinate=(47.61667, -117.53333), altitude=723, country='United States'),
-    'KGEU': station(name='Glendale, Glendale Municipal Airport', coordinate=(33.52722, -112.29528), altitude=325, country='United States'),
-    'KGEV': station(name='Jefferson, Ashe County Airport', coordinate=(36.43333, -81.41667), altitude=969, country='United States'),
-    'KGEY': station(name='SOUTH BIG HORN COUNTY AIRPORT', coordinate=(44.51667, -108.08333), altitude=1199, country='United States'),
-    'KGEZ': station(name='SHELBYVILLE MUNICIPAL AIRPORT', coordinate=(39.58333, -85.8), altitude=245, country='United States'),
-    'KGFA': station(name='Malmstrom Air Force Base', coordinate=(47.5, -111.18333), altitude=1075, country='United States'),
-    'KGFK': station(name='GRAND FORKS INTERNATIONAL', coordinate=(47.95, -97.18333), altitude=257, country='United States'),
-    'KGFL': station(name='FLOYD BENNETT MEMORIAL AIRPORT', coordinate=(43.33333, -73.61667), altitude=100, country='United States'),
-    'KGGB': station(name='Golden Gate Bridge', coordinate=(37.81667, -122.46667), altitude=81, country='United States'),
-    'KGGG': station(name='LONGVIEW GREGG COUNTY AIRPORT', coordinate=(32.38333, -94.71667), altitude=111, country='United States'),
-    'KGGW': station(name='GLASGOW INTERNATIONAL AIRPORT', coordinate=(48.21667, -106.61667), altitude=699, country='United States'),
-    'KGHB': station(name='Salsa', coordinate=(27.84028, -91.98778), altitude=None, country='United States'),
-    'KGHW': station(name='Glenwood, Glenwood Municipal Airport', coordinate=(45.65, -95.31667), altitude=425, country='United States'),
-    'KGIF': station(name='WINTER HAVENS GILBERT AIRPORT', coordinate=(28.06667, -81.75), altitude=45, country='United States'),
-    'KGJT': station(name='GRAND JUNCTION WALKER FIELD', coordinate=(39.13333, -108.53333), altitude=1481, country='United States'),
-    'KGKJ': station(name='PORT MEADVILLE AIRPORT', coordinate=(41.63333, -80.21667), altitude=427, country='United States'),
-    'KGKN': station(name='Gulkana, Gulkana Airport', coordinate=(62.16028, -145.4575), altitude=481, country='United States'),
-    'KGKY': station(name='ARLINGTON MUNICIPAL AIRPORT', coordinate=(32.66667, -97.1), altitude=192, country='United States'),
-    'KGLD': station(name='GOODLAND RENNER FIELD', coordinate=(39.36667, -101.7), altitude=1114, country='United States'),
-    'KGLE': station(name='Gainesville, Gainesville Municipal Airport', coordinate=(33.65139, -97.19694), altitude=256, country='United States'),
-    'KGLH': station(name='GREENVILLE MUNICIPAL AIRPORT', coordinate=(33.48333, -90.98333), altitude=39, country='United States'),
-    'KGLR': station(name='GAYLORD REGIONAL AIRPORT', coordinate=(45.01667, -84.68333), altitude=405, country='United States'),
-    'KGLS': station(name='SCHOLES FIELD', coordinate=(29.26667, -94.86667), altitude=2, country='United States'),
-    'KGLW': station(name='Glasgow, Glasgow Municipal Airport', coordinate=(37.03167, -85.95361), altitude=218, country='United States'),
-    'KGMJ': station(name='Grove, Grove Municipal Airport', coordinate=(36.60528, -94.73861), altitude=254, country='United States'),
-    'KGMU': station(name='GREENVILLE DOWNTOWN AIRPORT', coordinate=(34.85, -82.35), altitude=319, country='United States'),
-    'KGNA': station(name='Grand Marais, The Bay of Grand Marais', coordinate=(47.83333, -90.38333), altitude=186, country='United States'),
-    'KGNC': station(name='Seminole, Gaines County Airport', coordinate=(32.67528, -102.6525), altitude=1010, country='United States'),
-    'KGNR': station(name='Greenville', coordinate=(45.46667, -69.58333), altitude=427, country='United States'),
-    'KGNT': station(name='GRANTS-MILAN MUNICIPAL AIRPORT', coordinate=(35.16667, -107.9), altitude=1988, country='United States'),
-    'KGNV': station(name='GAINESVILLE REGIONAL AIRPORT', coordinate=(29.7, -82.28333), altitude=46, country='United States'),
-    'KGOK': station(name='GUTHRIE MUNICIPAL AIRPORT', coordinate=(35.85, -97.41667), altitude=326, country='United States'),
-    'KGON': station(name='GROTON/NEW LONDON AIRPORT', coordinate=(41.33333, -72.05), altitude=3, country='United States'),
-    'KGOP': station(name='Gatesville, City-County Airport', coordinate=(31.42111, -97.79694), altitude=276, country='United States'),
-    'KGOV': station(name='Grayling, Grayling Army Airfield', coordinate=(44.68028, -84.72889), altitude=353, country='United States'),
-    'KGPI': station(name='GLACIER PARK INTERNATIONAL  AIRPORT', coordinate=(48.3, -114.26667), altitude=906, country='United States'),
-    'KGPM': station(name='Grand Prairie, Grand Prairie Municipal Airport', coordinate=(32.69861, -97.04667), altitude=180, country='United States'),
-    'KGPT': station(name='GULFPORT-BILOXI REG AIRPORT', coordinate=(30.41667, -89.08333), altitude=9, country='United States'),
-    'KGPZ': station(name='Grand Rapids, Grand Rapids/Itasca County Airport-Gordon Newstrom Field', coordinate=(47.21667, -93.51667), altitude=413, country='United States'),
-    'KGRB': station(name='AUSTIN STRAUBEL INTERNATIONAL  AIRPORT', coordinate=(44.48333, -88.13333), altitude=212, country='United States'),
-    'KGRD': station(name='GREENWOOD COUNTY AIRPORT', coordinate=(34.23333, -82.15), altitude=192, country='United States'),
-    'KGRF': station(name='Fort Lewis / Gray U. S. Army Airfield', coordinate=(47.11667, -122.55), altitude=92, country='United States'),
-    'KGRI': station(name='CENTRAL NEBRASKA REGIONAL', coordinate=(40.96667, -98.31667), altitude=563, country='United States'),
-    'KGRK': station(name='Fort Hood, Robert Gray AAF Ft Hood', coordinate=(31.06667, -97.81667), altitude=309, country='United States'),
-    'KGRN': station(name='Gordon Municipal', coordinate=(42.8, -102.16667), altitude=1085, country='United States'),
-    'KGRR': station(name='GERALD R. FORD INTERNATIONAL', coordinate=(42.88333, -85.51667), altitude=242, country='United States'),
-    'KGRY': station(name='Green Canyon 338', coordinate=(27.62472, -90.44111), altitude=None, country='United States'),
-    'KGSB': station(name='Seymour-Johnson Air Force Base', coordinate=(35.33333, -77.96667), altitude=33, country='United States'),
-    'KGSH': station(name='GOSHEN MUNICIPAL AIRPORT', coordinate=(41.53333, -85.78333), altitude=252, country='United States'),
-    'KGSM': station(name='Ship Shoal 207A', coordinate=(28.53333, -90.98333), altitude=1, country='United States'),
-    'KGSN': station(name='SAIPAN INTERNATIONAL AIRPORT', coordinate=(15.11667, 145.73333), altitude=66, country='NORTHERN MARIANA ISLAND'),
-    'KGSO': station(name='PIEDMONT TRIAD INTERNATIONAL  AIRPORT', coordinate=(36.1, -79.95), altitude=282, country='United States'),
-    'KGSP': station(name='GREER GREENVILLE SPARTBURG', coordinate=(34.88333, -82.21667), altitude=296, country='United States'),
-    'KGTB': station(name='Fort Drum / Wheeler-Sack U. S. Army Airfield', coordinate=(44.05, -75.73333), altitude=207, country='United States'),
-    'KGTF': station(name='GREAT FALLS INTERNATIONAL', coordinate=(47.46667, -111.38333), altitude=1120, country='United States'),
-    'KGTR': station(name='Columbus/West Point/Starkville, Golden Triangle Regional Airport', coordinate=(33.45, -88.58333), altitude=81, country='United States'),
-    'KGTU': station(name='Georgetown, Georgetown Municipal Airport', coordinate=(30.68333, -97.68333), altitude=241, country='United States'),
-    'KGUC': station(name='Gunnison, Gunnison-Crested Butte Regional Airport', coordinate=(38.53333, -106.93333), altitude=2340, country='United States'),
-    'KGUL': station(name='Gunnison', coordinate=(27.30389, -93.53833), altitude=None, country='United States'),
-    'KGUP': station(name='GALLUP MUNICIPAL AIRPORT', coordinate=(35.51667, -108.78333), altitude=1973, country='United States'),
-    'KGUS': station(name='Grissom Air Force Base / Peru', coordinate=(40.65, -86.15), altitude=247, country='United States'),
-    'KGUY': station(name='GUYMON MUNICIPAL AIRPORT', coordinate=(36.68333, -101.5), altitude=952, country='United States'),
-    'KGVB': station(name='Bogalusa', coordinate=(30.88167, -89.86222), altitude=None, country='United States'),
-    'KGVL': station(name='GILMER MEMORIAL AIRPORT', coordinate=(34.26667, -83.83333), altitude=389, country='United States'),
-    'KGVT': station(name='Greenville / Majors', coordinate=(33.06667, -96.06667), altitude=163, country='United States'),
-    'KGVW': station(name='Kansas City, Richards-Gebaur Airport', coordinate=(38.835, -94.56139), altitude=332, country='United States'),
-    'KGVX': station(name='Galveston 424', coordinate=(28.57667, -94.97667), altitude=None, country='United States'),
-    'KGWO': station(name='GREENWOOD-LEFLORE AIRPORT', coordinate=(33.5, -90.08333), altitude=47, country='United States'),
-    'KGWR': station(name='Gwinner-Roger Melroe Field Airport', coordinate=(46.21861, -97.64333), altitude=386, country='United States'),
-    'KGWW': station(name='Goldsboro, Goldsboro-Wayne Municipal Airport', coordinate=(35.46056, -77.965), altitude=40, country='United States'),
-    'KGXY': station(name='Greeley, Greeley-Weld County Airport', coordinate=(40.43333, -104.63333), altitude=1432, country='United States'),
-    'KGYB': station(name='Giddings, Giddings-Lee County Airport', coordinate=(30.16917, -96.98), altitude=148, country='United States'),
-    'KGYI': station(name='Sherman/Denison, Grayson County Airport', coordinate=(33.71667, -96.66667), altitude=228, country='United States'),
-    'KGYL': station(name='Glencoe, Glencoe Municipal Airport', coordinate=(44.75611, -94.08111), altitude=302, country='United States'),
-    'KGYR': station(name='Goodyear Municipal', coordinate=(33.41667, -112.38333), altitude=295, country='United States'),
-    'KGYY': station(name='Gary Regional', coordinate=(41.61667, -87.41667), altitude=180, country='United States'),
-    'KGZH': station(name='EVERGREEN MIDDLETON FIELD', coordinate=(31.41667, -87.05), altitude=79, country='United States'),
-    'KH08': station(name='High Island 264C', coordinate=(28.46667, -93.73333), altitude=0, country='United States'),
-    'KH32': station(name='Southwest Harbor', coordinate=(44.26667, -68.31667), altitude=5, country='United States'),
-    'KH39': station(name='High Island A572c', coordinate=(27.95, -93.98333), altitude=30, country='United States'),
-    'KH45': station(name='Seminole, Seminole Municipal Airport', coordinate=(35.27444, -96.675), altitude=312, country='United States'),
-    'KH92': station(name='Hominy Municipal', coordinate=(36.43333, -96.38333), altitude=251, country='United States'),
-    'KHAO': station(name='BUTLER COUNTY REGIONAL AIRPORT', coordinate=(39.36667, -84.51667), altitude=193, country='United States'),
-    'KHAT': station(name='Cape Hatteras', coordinate=(35.26667, -75.55), altitude=2, country='United States'),
-    'KHBG': station(name='HATTIESBURG CHAIN MUNICIPAL', coordinate=(31.26667, -89.25), altitude=46, country='United States'),
-    'KHBI': station(name='Asheboro, Asheboro Municipal Airport', coordinate=(35.65389, -79.895), altitude=205, country='United States'),
-    'KHBR': station(name='HOBART MUNICIPAL AIRPORT', coordinate=(34.98333, -99.05), altitude=477, country='United States'),
-    'KHBV': station(name='Hebbronville, Jim Hogg County Airport', coordinate=(27.33333, -98.73333), altitude=202, country='United States'),
-    'KHCD': station(name='Hutchinson, Hutchinson Municipal Airport-Butler Field', coordinate=(44.86667, -94.38333), altitude=323, country='United States'),
-    'KHCO': station(name='Hallock, Hallock Municipal Airport', coordinate=(48.75278, -96.94306), altitude=250, country='United States'),
-    'KHDC': station(name='Hammond, Hammond Municipal Airport', coordinate=(30.52083, -90.4175), altitude=13, country='United States'),
-    'KHDE': station(name='Brewster Field Airport', coordinate=(40.45, -99.33333), altitude=704, country='United States'),
-    'KHDN': station(name='Hayden, Yampa Valley Airport', coordinate=(40.48333, -107.21667), altitude=2012, country='United States'),
-    'KHDO': station(name='HONDO MUNICIPAL AIRPORT', coordinate=(29.36667, -99.16667), altitude=283, country='United States'),
-    'KHEF': station(name='Manassas, Manassas Regional Airport/Harry P. Davis Field', coordinate=(38.71667, -77.51667), altitude=59, country='United States'),
-    'KHEI': station(name='HETTINGER MUNICIPAL AIRPORT', coordinate=(46.01667, -102.65), altitude=824, country='United States'),
-    'KHEY': station(name='Hanchey AHP / Ozark', coordinate=(31.35, -85.66667), altitude=97, country='United States'),
-    'KHEZ': station(name='Natchez, Hardy-Anders Field Natchez-Adams County Airport', coordinate=(31.61667, -91.3), altitude=83, country='United States'),
-    'KHFD': station(name='HARTFORD-BRAINARD AIRPORT', coordinate=(41.73333, -72.65), altitude=6, country='United States'),
-    'KHFF': station(name='Mackall U. S. Army Airfield', coordinate=(35.03333, -79.5), altitude=115, country='United States'),
-    'KHGR': station(name='HAGERSTOWN REGIONAL AIRPORT', coordinate=(39.7, -77.73333), altitude=215, country='United States'),
-    'KHGX': station(name='Houston / Galviston Nexrad', coordinate=(29.46667, -95.08333), altitude=35, country='United States'),
-    'KHHF': station(name='Canadian, Hemphill County Airport', coordinate=(35.9, -100.4), altitude=730, country='United States'),
-    'KHHR': station(name='HAWTHORNE MUNICIPAL AIRPORT', coordinate=(33.91667, -118.33333), altitude=19, country='United States'),
-    'KHHV': station(name='Hoover Diana', coordinate=(26.93917, -94.68861), altitude=None, country='United States'),
-    'KHIB': station(name='CHISHOLM-HIBBING AIRPORT', coordinate=(47.38333, -92.83333), altitude=412, country='United States'),
-    'KHIE': station(name='MT WASHINGTON REGIONAL AIRPORT', coordinate=(44.36667, -71.55), altitude=327, country='United States'),
-    'KHIF': station(name='Hill Air Force Base / Ogden', coordinate=(41.11667, -111.96667), altitude=1459, country='United States'),
-    'KHIO': station(name='PORTLAND-HILLSBORO AIRPORT', coordinate=(45.55, -122.95), altitude=62, country='United States'),
-    'KHJH': station(name='Hebron, Hebron Municipal Airport', coordinate=(40.15222, -97.58694), altitude=447, country='United States'),
-    'KHJO': station(name='Hanford, Hanford Municipal Airport', coordinate=(36.31861, -119.62889), altitude=74, country='United States'),
-    'KHKA': station(name='BLYTHEVILLE MUNICIPAL AIRPORT', coordinate=(35.93333, -89.83333), altitude=78, country='United States'),
-    'KHKS': station(name='HAWKINS FIELD', coordinate=(32.33333, -90.21667), altitude=104, country='United States'),
-    'KHKY': station(name='HICKORY REGIONAL AIRPORT', coordinate=(35.75, -81.38333), altitude=362, country='United States'),
-    'KHLC': station(name='HILL CITY MUNICIPAL AIRPORT', coordinate=(39.36667, -99.83333), altitude=680, country='United States'),
-    'KHLD': station(name='Hiland', coordinate=(43.1, -107.31667), altitude=1846, country='United States'),
-    'KHLG': station(name='WHEELING OHIO COUNTY AIRPORT', coordinate=(40.16667, -80.65), altitude=364, country='United States'),
-    'KHLN': station(name='HELENA REGIONAL AIRPORT', coordinate=(46.6, -111.96667), altitude=1180, country='United States'),
-    'KHLR': station(name='Fort Hood, Hood AAF Ft Hood', coordinate=(31.13333, -97.7), altitude=282, country='United States'),
-    'KHLX': station(name='Hillsville', coordinate=(36.76667, -80.81667), altitude=834, country='United States'),
-    'KHMM': station(name='Hamilton / Ravalli County', coordinate=(46.25, -114.15), altitude=1110, country='United States'),
-    'KHMN': station(name='Holloman Air Force Base', coordinate=(32.85, -106.1), altitude=1248, country='United States'),
-    'KHMS': station(name='Hanford', coordinate=(46.56667, -119.6), altitude=223, country='United States'),
-    'KHMZ': station(name='Bedford, Bedford County Airport', coordinate=(40.08528, -78.51222), altitude=354, country='United States'),
-    'KHNB': station(name='Huntingburg', coordinate=(38.25, -86.95), altitude=161, country='United States'),
-    'KHND': station(name='Las Vegas, Henderson Executive Airport', coordinate=(35.97278, -115.13444), altitude=760, country='United States'),
-    'KHNR': station(name='Harlan, Harlan Municipal Airport', coordinate=(41.58444, -95.33972), altitude=375, country='United States'),
-    'KHNS': station(name='Haines, Haines Airport', coordinate=(59.24389, -135.50944), altitude=4, country='United States'),
-    'KHNZ': station(name='Oxford, Henderson-Oxford Airport', coordinate=(36.36167, -78.52917), altitude=161, country='United States'),
-    'KHOB': station(name='Hobbs / Lea County', coordinate=(32.68333, -103.21667), altitude=1115, country='United States'),
-    'KHOM': station(name='Homer, Homer Airport', coordinate=(59.6425, -151.48722), altitude=23, country='United States'),
-    'KHON': station(name='HURON REGIONAL AIRPORT', coordinate=(44.38333, -98.23333), altitude=393, country='United States'),
-    'KHOP': station(name='Fort Campbell U. S. Army Airfield', coordinate=(36.66667, -87.5), altitude=174, country='United States'),
-    'KHOT': station(name='HOT SPRINGS MEMORIAL FIELD', coordinate=(34.48333, -93.1), altitude=165, country='United States'),
-    'KHOU': station(name='HOUSTON HOBBY AIRPORT', coordinate=(29.63333, -95.28333), altitude=14, country='United States'),
-    'KHPN': station(name='WHITE PLAINS WESTCHESTER', coordinate=(41.06667, -73.7), altitude=134, country='United States'),
-    'KHQI': station(name='High Island 376', coordinate=(27.96194, -93.67083), altitude=None, country='United States'),
-    'KHQM': station(name='HOQUIAM BOWERMAN AIRPORT', coordinate=(46.96667, -123.93333), altitude=4, country='United States'),
-    'KHQU': station(name='Thomson, Thomson-McDuffie County Airport', coordinate=(33.52944, -82.51639), altitude=152, country='United States'),
-    'KHQZ': station(name='Mesquite, Mesquite Metro Airport', coordinate=(32.74694, -96.53028), altitude=136, country='United States'),
-    'KHRI': station(name='HERMISTON MUNICIPAL AIRPORT', coordinate=(45.83333, -119.26667), altitude=195, country='United States'),
-    'KHRJ': station(name='Erwin, Harnett County Airport', coordinate=(35.37861, -78.73361), altitude=60, country='United States'),
-    'KHRL': station(name='RIO GRANDE VALLEY', coordinate=(26.21667, -97.65), altitude=11, country='United States'),
-    'KHRO': station(name='HARRISON BOONE COUNTY AIRPORT', coordinate=(36.26667, -93.15), altitude=416, country='United States'),
-    'KHRT': station(name='Hurlburt Field', coordinate=(30.41667, -86.68333), altitude=12, country='United States'),
-    'KHSA': station(name='Bay St. Louis, Stennis International Airport', coordinate=(30.36778, -89.45472), altitude=7, country='United States'),
-    'KHSB': station(name='Harrisburg, Harrisburg-Raleigh Airport', coordinate=(37.81139, -88.54917), altitude=121, country='United States'),
-    'KHSE': station(name='MITCHELL FIELD', coordinate=(35.23333, -75.61667), altitude=5, country='United States'),
-    'KHSI': station(name='HASTINGS MUNICIPAL AIRPORT', coordinate=(40.6, -98.43333), altitude=598, country='United States'),
-    'KHSP': station(name='Hot Springs / Ingalls', coordinate=(37.95, -79.83333), altitude=1156, country='United States'),
-    'KHSS': station(name='Hot Springs Aviation Weather Reporting Station', coordinate=(35.9, -82.81667), altitude=451, country='United States'),
-    'KHST': station(name='Homestead Air Force Base', coordinate=(25.48333, -80.38333), altitude=2, country='United States'),
-    'KHSV': station(name='HUNTSVILLE INTERNATIONAL  JONES FIELD', coordinate=(34.65, -86.78333), altitude=192, country='United States'),
-    'KHTH': station(name='Hawthorne Municipal', coordinate=(38.55, -118.63333), altitude=1285, country='United States'),
-    'KHTL': station(name='ROSCOMMON COUNTY AIRPORT', coordinate=(44.35, -84.66667), altitude=351, country='United States'),
-    'KHTO': station(name='East Hampton, East Hampton Airport', coordinate=(40.95944, -72.25194), altitude=17, country='United States'),
-    'KHTS': station(name='TRI-STATE AIRPORT', coordinate=(38.36667, -82.55), altitude=252, country='United States'),
-    'KHUF': station(name='TERRE HAUTE INTERNATIONAL -HULMAN FLD', coordinate=(39.45, -87.31667), altitude=178, country='United States'),
-    'KHUL': station(name="HOULTON INT'L AIRPORT", coordinate=(46.11667, -67.8), altitude=150, country='United States'),
-    'KHUM': station(name='Houma-Terrebonne', coordinate=(29.56667, -90.66667), altitude=3, country='United States'),
-    'KHUT': station(name='HUTCHINSON MUNICIPAL AIRPORT', coordinate=(38.06667, -97.86667), altitude=470, country='United States'),
-    'KHVN': station(name='TWEED-NEW HAVEN AIRPORT', coordinate=(41.26667, -72.88333), altitude=4, country='United States'),
-    'KHVR': station(name='HAVRE CITY-COUNTY AIRPORT', coordinate=(48.55, -109.76667), altitude=789, country='United States'),
-    'KHWD': station(name='HAYWARD AIR TERMINAL', coordinate=(37.66667, -122.11667), altitude=14, country='United States'),
-    'KHWO': station(name='HOLLYWOOD NORTH PERRY AIRPORT', coordinate=(26.0, -80.23333), altitude=3, country='United States'),
-    'KHWV': station(name='SHIRLEY BROOKHAVEN AIRPORT', coordinate=(40.81667, -72.86667), altitude=25, country='United States'),
-    'KHXD': station(name='Hilton Head Island, Hilton Head Airport', coordinate=(32.21667, -80.7), altitude=6, country='United States'),
-    'KHYA': station(name='HYANNIS BARNSTABLE BOARDMN', coordinate=(41.66667, -70.26667), altitude=16, country='United States'),
-    'KHYI': station(name='San Marcos, San Marcos Municipal Airport', coordinate=(29.89361, -97.86472), altitude=182, country='United States'),
-    'KHYR': station(name='HAYWARD MUNICIPAL AIRPORT', coordinate=(46.01667, -91.45), altitude=370, country='United States'),
-    'KHYS': station(name='Hays, Hays Regional Airport', coordinate=(38.85, -99.26667), altitude=609, country='United States'),
-    'KHYX': station(name='Saginaw, Saginaw County H.W. Browne Airport', coordinate=(43.43333, -83.8625), altitude=183, country='United States'),
-    'KHZE': station(name='Mercer County Regional Airport', coordinate=(47.29, -101.58083), altitude=553, country='United States'),
-    'KHZX': station(name='Mc Gregor, Isedor Iverson Airport', coordinate=(46.61861, -93.30972), altitude=374, country='United States'),
-    'KHZY': station(name='ASHTABULA COUNTY AIRPORT', coordinate=(41.78333, -80.7), altitude=282, country='United States'),
-    'KI12': station(name='Sidney, Sidney Municipal Airport', coordinate=(40.24111, -84.15083), altitude=318, country='United States'),
-    'KI16': station(name='Pineville, Kee Field Airport', coordinate=(37.60028, -81.55917), altitude=544, country='United States'),
-    'KI63': station(name='Mount Sterling, Mount Sterling Municipal Airport', coordinate=(39.9875, -90.80417), altitude=223, country='United States'),
-    'KIAB': station(name='McConnell Air Force Base', coordinate=(37.61667, -97.26667), altitude=418, country='United States'),
-    'KIAD': station(name='DULLES INTERNATIONAL AIRPORT', coordinate=(38.93333, -77.45), altitude=95, country='United States'),
-    'KIAG': station(name='NIAGARA FALLS INTERNATIONAL  AIRPORT', coordinate=(43.11667, -78.93333), altitude=178, country='United States'),
-    'KIAH': station(name='HOUSTON INTERCONTINENTAL', coordinate=(30.0, -95.36667), altitude=30, country='United States'),
-    'KIBM': station(name='Kimball, Kimball Municipal Airport/Robert E Arraj Field', coordinate=(41.18333, -103.66667), altitude=1501, country='United States'),
-    'KICL': station(name='Clarinda', coordinate=(40.71667, -95.03333), altitude=303, country='United States'),
-    'KICR': station(name='WINNER REGIONAL AIRPORT', coordinate=(43.38333, -99.85), altitude=619, country='UNITED STATES'),
-    'KICT': station(name='WICHITA MID-CONTINENT AIRPORT', coordinate=(37.65, -97.43333), altitude=406, country='United States'),
-    'KIDA': station(name='IDAHO FALLS REGIONAL AIRPORT', coordinate=(43.51667, -112.06667), altitude=1445, country='United States'),
-    'KIDI': station(name='Indiana / Stewart Field', coordinate=(40.63333, -79.1), altitude=429, country='United States'),
-    'KIDV': station(name='I-25 Divide', coordinate=(43.93333, -106.65), altitude=1531, country='United States'),
-    'KIEN': station(name='PINE RIDGE AIRPORT', coordinate=(43.03333, -102.51667), altitude=1015, country='United States'),
-    'KIER': station(name='Natchitoches, Natchitoches Regional Airport', coordinate=(31.73583, -93.09917), altitude=37, country='United States'),
-    'KIFP': station(name='Bullhead City, Laughlin/Bullhead International Airport', coordinate=(35.1575, -114.55944), altitude=212, country='United States'),
-    'KIGC': station(name='Charleston Air Force Base', coordinate=(32.9, -80.05), altitude=14, country='United States'),
-    'KIGM': station(name='KINGMAN AIRPORT', coordinate=(35.25, -113.93333), altitude=1050, country='United States'),
-    'KIGQ': station(name='Chicago, Lansing Municipal Airport', coordinate=(41.54, -87.53222), altitude=188, country='United States'),
-    'KIGX': station(name='CHAPEL HILL WILLIAMS AIRPORT', coordinate=(35.93333, -79.06667), altitude=156, country='United States'),
-    'KIIB': station(name='Independence, Independence Municipal Airport', coordinate=(42.45, -91.93333), altitude=298, country='United States'),
-    'KIIY': station(name='Washington, Washington-Wilkes County Airport', coordinate=(33.77972, -82.81639), altitude=197, country='United States'),
-    'KIJD': station(name='WILLIMANTIC WINDHAM AIRPORT', coordinate=(41.75, -72.18333), altitude=75, country='United States'),
-    'KIJX': station(name='Jacksonville, Jacksonville Municipal Airport', coordinate=(39.77417, -90.23861), altitude=190, country='United States'),
-    'KIKA': station(name='Inyan Kara', coordinate=(44.3, -104.63333), altitude=1319, country='United States'),
-    'KIKK': station(name='Kankakee, Greater Kankakee Airport', coordinate=(41.07139, -87.84639), altitude=192, country='United States'),
-    'KIKR': station(name='Kirtland, Kirtland Air Force Base Auxiliary Field', coordinate=(34.95, -106.56667), altitude=1612, country='United States'),
-    'KIKT': station(name='Nakika', coordinate=(28.52083, -88.28889), altitude=None, country='United States'),
-    'KIKV': station(name='Ankeny, Ankeny Regional Airport', coordinate=(41.69, -93.56583), altitude=275, country='United States'),
-    'KILE': station(name='Killeen, Skylark Field Airport', coordinate=(31.08333, -97.68333), altitude=259, country='United States'),
-    'KILG': station(name='WILMINGTON NEW CASTLE CO', coordinate=(39.66667, -75.6), altitude=24, country='United States'),
-    'KILI': station(name='Iliamna, Iliamna Airport', coordinate=(59.74917, -154.90917), altitude=63, country='United States'),
-    'KILL': station(name='Willmar, Willmar Municipal Airport-John L Rice Field', coordinate=(45.11667, -95.08333), altitude=344, country='United States'),
-    'KILM': station(name="WILMINGTON INT'L AIRPORT", coordinate=(34.26667, -77.9), altitude=10, country='United States'),
-    'KILN': station(name='WILMINGTON INDUSTRIAL AIRPORT', coordinate=(39.43333, -83.78333), altitude=328, country='United States'),
-    'KIML': station(name='IMPERIAL MUNICIPAL AIRPORT', coordinate=(40.51667, -101.61667), altitude=998, country='United States'),
-    'KIMT': station(name='IRON MOUNTAIN FORD AIRPORT', coordinate=(45.81667, -88.11667), altitude=360, country='United States'),
-    'KIND': station(name='INDIANAPOLIS INTERNATIONAL  AIRPORT', coordinate=(39.71667, -86.28333), altitude=243, country='United States'),
-    'KINJ': station(name='Hillsboro, Hillsboro Municipal Airport', coordinate=(32.08333, -97.09722), altitude=209, country='United States'),
-    'KINK': station(name='WINKLER COUNTY AIRPORT', coordinate=(31.78333, -103.2), altitude=860, country='United States'),
-    'KINL': station(name='FALLS INTERNATIONAL AIRPORT', coordinate=(48.56667, -93.4), altitude=361, country='United States'),
-    'KINS': station(name='Indian Springs, Indian Springs Auxiliary AFLD Nellis AFB', coordinate=(36.58333, -115.66667), altitude=955, country='United States'),
-    'KINT': station(name='WINSTON SALEM SMITH REYNOLDS', coordinate=(36.13333, -80.23333), altitude=296, country='United States'),
-    'KINW': station(name='WINSLOW MUNICIPAL AIRPORT', coordinate=(35.03333, -110.71667), altitude=1505, country='United States'),
-    'KINX': station(name='Tulsa Nexrad', coordinate=(36.18333, -95.56667), altitude=226, country='United States'),
-    'KIOW': station(name='IOWA CITY MUNICIPAL AIRPORT', coordinate=(41.63333, -91.55), altitude=204, country='United States'),
-    'KIPJ': station(name='Lincolnton, Lincolnton-Lincoln County Regional Airport', coordinate=(35.48306, -81.16139), altitude=267, country='United States'),
-    'KIPL': station(name='Imperial, Imperial County Airport', coordinate=(32.83417, -115.57861), altitude=-17, country='United States'),
-    'KIPN': station(name='Independence', coordinate=(28.085, -87.98583), altitude=None, country='United States'),
-    'KIPT': station(name='WILLIAMSPORT-LYCOMING COUNTY', coordinate=(41.25, -76.91667), altitude=161, country='United States'),
-    'KIRK': station(name='KIRKSVILLE REGIONAL AIRPORT', coordinate=(40.1, -92.55), altitude=294, country='United States'),
-    'KIRS': station(name='Sturgis, Kirsch Municipal Airport', coordinate=(41.81278, -85.43917), altitude=282, country='United States'),
-    'KISM': station(name='Orlando, Kissimmee Municipal Airport', coordinate=(28.28972, -81.43722), altitude=25, country='United States'),
-    'KISN': station(name='SLOULIN FIELD INTERNATIONAL  AIRPORT', coordinate=(48.18333, -103.65), altitude=604, country='United States'),
-    'KISO': station(name='Kinston, Kinston Regional Jetport at Stallings Field', coordinate=(35.33333, -77.61667), altitude=29, country='United States'),
-    'KISP': station(name='ISLIP LONG ISLAND MAC ART', coordinate=(40.8, -73.1), altitude=30, country='United States'),
-    'KISQ': station(name='Manistique, Schoolcraft County Airport', coordinate=(45.97472, -86.17194), altitude=209, country='United States'),
-    'KISW': station(name='WI RAPIDS ALEXANDER FIELD', coordinate=(44.36667, -89.83333), altitude=311, country='United States'),
-    'KITH': station(name='Ithaca, Ithaca Tompkins Regional Airport', coordinate=(42.49083, -76.45833), altitude=335, country='United States'),
-    'KITR': station(name='BURLINGTON CARSON COUNTY', coordinate=(39.25, -102.28333), altitude=1285, country='United States'),
-    'KIWA': station(name='Mesa, Williams Gateway Airport', coordinate=(33.31667, -111.65), altitude=421, country='United States'),
-    'KIWD': station(name='Ironwood, Gogebic-Iron County Airport', coordinate=(46.53333, -90.13333), altitude=375, country='United States'),
-    'KIWI': station(name='WISCASSET MUNICIPAL AIRPORT', coordinate=(43.96667, -69.71667), altitude=21, country='United States'),
-    'KIWS': station(name='West Houston / Lakeside', coordinate=(29.81667, -95.66667), altitude=34, country='United States'),
-    'KIXD': station(name='NEW CENTURY AIRCENTER', coordinate=(38.81667, -94.88333), altitude=331, country='United States'),
-    'KIYK': station(name='Inyokern', coordinate=(35.66667, -117.83333), altitude=749, country='United States'),
-    'KIZA': station(name='Santa Ynez, Santa Ynez Airport', coordinate=(34.60694, -120.07556), altitude=205, country='United States'),
-    'KIZG': station(name='FRYEBURG EASTERN SLOPES RGNL', coordinate=(43.98333, -70.95), altitude=138, country='United States'),
-    'KJAC': station(name='Jackson, Jackson Hole Airport', coordinate=(43.6, -110.73333), altitude=1966, country='United States'),
-    'KJAN': station(name='Jackson, Jackson International Airport', coordinate=(32.31972, -90.0775), altitude=105, country='United States'),
-    'KJAS': station(name='Jasper, Jasper County-Bell Field Airport', coordinate=(30.88556, -94.03472), altitude=65, country='United States'),
-    'KJAX': station(name='JACKSONVILLE INTERNATIONAL', coordinate=(30.5, -81.7), altitude=9, country='United States'),
-    'KJBR': station(name='JONESBORO MUNICIPAL AIRPORT', coordinate=(35.83333, -90.65), altitude=80, country='United States'),
-    'KJCT': station(name='KIMBLE COUNTY AIRPORT', coordinate=(30.51667, -99.76667), altitude=533, country='United States'),
-    'KJDD': station(name='Mineola/Quitman, Wood County Airport', coordinate=(32.74194, -95.49639), altitude=132, country='United States'),
-    'KJDN': station(name='JORDAN AIRPORT', coordinate=(47.33333, -106.95), altitude=811, country='United States'),
-    'KJEF': station(name='JEFFERSON CITY MEMORIAL AIRPORT', coordinate=(38.6, -92.15), altitude=167, country='United States'),
-    'KJER': station(name='JEROME COUNTY AIRPORT', coordinate=(42.73333, -114.45), altitude=1234, country='United States'),
-    'KJES': station(name='Jesup-Wayne County Airport', coordinate=(31.55389, -81.8825), altitude=33, country='United States'),
-    'KJFK': station(name='KENNEDY INTERNATIONAL AIRPORT', coordinate=(40.63333, -73.76667), altitude=4, country='United States'),
-    'KJGG': station(name='Williamsburg, Williamsburg-Jamestown Airport', coordinate=(37.23917, -76.71583), altitude=15, country='United States'),
-    'KJHW': station(name='Jamestown, Chautauqua County/Jamestown Airport', coordinate=(42.15, -79.26667), altitude=525, country='United States'),
-    'KJKJ': station(name='Moorhead, Moorhead Municipal Airport', coordinate=(46.83917, -96.66306), altitude=280, country='United States'),
-    'KJKL': station(name='JACKSON CARROLL AIRPORT', coordinate=(37.58333, -83.31667), altitude=421, country='United States'),
-    'KJLN': station(name='JOPLIN REGIONAL AIRPORT', coordinate=(37.15, -94.5), altitude=299, country='United States'),
-    'KJMR': station(name='Mora, Mora Municipal Airport', coordinate=(45.88611, -93.27167), altitude=309, country='United States'),
-    'KJMS': station(name='JAMESTOWN MUNICIPAL AIRPORT', coordinate=(46.93333, -98.66667), altitude=457, country='United States'),
-    'KJNW': station(name='Newport', coordinate=(44.58333, -124.06667), altitude=48, country='United States'),
-    'KJNX': station(name='Smithfield, Johnston County Airport', coordinate=(35.54083, -78.39028), altitude=50, country='United States'),
-    'KJOT': station(name='Joliet, Joliet Regional Airport', coordinate=(41.51806, -88.17528), altitude=177, country='United States'),
-    'KJQF': station(name='Concord, Concord Regional Airport', coordinate=(35.38528, -80.70972), altitude=210, country='United States'),
-    'KJSO': station(name='Jacksonville, Cherokee County Airport', coordinate=(31.86917, -95.21722), altitude=206, country='United States'),
-    'KJST': station(name='JOHNSTOWN-CAMBRIA CO AIRPORT', coordinate=(40.31667, -78.83333), altitude=696, country='United States'),
-    'KJSV': station(name='Sallisaw, Sallisaw Municipal Airport', coordinate=(35.43806, -94.80278), altitude=161, country='United States'),
-    'KJVL': station(name='Janesville / Rock County', coordinate=(42.61667, -89.03333), altitude=246, country='United States'),
-    'KJWG': station(name='Watonga, Watonga Airport', coordinate=(35.86472, -98.42083), altitude=472, country='United States'),
-    'KJWX': station(name='Fort Ritchie', coordinate=(39.73333, -77.43333), altitude=275, country='United States'),
-    'KJWY': station(name='Midlothian/Waxahachie, Mid-Way Regional Airport', coordinate=(32.45583, -96.91222), altitude=217, country='United States'),
-    'KJXI': station(name='Gilmer, Fox Stephens Field - Gilmer Municipal Airport', coordinate=(32.69889, -94.94861), altitude=127, country='United States'),
-    'KJXN': station(name='JACKSON COUNTY-REYNOLDS', coordinate=(42.26667, -84.46667), altitude=305, country='United States'),
-    'KJYG': station(name='St. James, St. James Municipal Airport', coordinate=(43.98639, -94.55806), altitude=325, country='United States'),
-    'KJYL': station(name='Sylvania, Plantation Airpark', coordinate=(32.64528, -81.59639), altitude=57, country='United States'),
-    'KJYM': station(name='Hillsdale, Hillsdale Municipal Airport', coordinate=(41.92139, -84.58583), altitude=360, country='United States'),
-    'KJYO': station(name='Leesburg / Godfrey', coordinate=(39.08333, -77.56667), altitude=119, country='United States'),
-    'KJYR': station(name='York, York Municipal Airport', coordinate=(40.89667, -97.62278), altitude=509, country='United States'),
-    'KKAL': station(name='Kaltag, Kaltag Airport', coordinate=(64.32417, -158.73306), altitude=60, country='United States'),
-    'KKLS': station(name='Kelso, Kelso-Longview Airport', coordinate=(46.11667, -122.9), altitude=6, country='United States'),
-    'KKVL': station(name='Kivalina, Kivalina Airport', coordinate=(67.73111, -164.5425), altitude=3, country='United States'),
-    'KL10': station(name='San Clemente', coordinate=(33.41667, -117.61667), altitude=3, country='United States'),
-    'KL13': station(name='Point Loma / Cabrillo', coordinate=(32.66667, -117.48333), altitude=111, country='United States'),
-    'KL14': station(name='Cabrillo Beach', coordinate=(33.71667, -118.28333), altitude=8, country='United States'),
-    'KL21': station(name='Scripps Pier / La Jol', coordinate=(32.86667, -117.25), altitude=4, country='United States'),
-    'KL27': station(name='Santa Catalina Island', coordinate=(33.33333, -118.33333), altitude=3, country='United States'),
-    'KL34': station(name='Oceanside Harbor', coordinate=(33.21667, -117.4), altitude=9, country='United States'),
-    'KL40': station(name='High Island A489b', coordinate=(28.2, -94.2), altitude=None, country='United States'),
-    'KL42': station(name='Oakdale, Allen Parish Airport', coordinate=(30.75056, -92.68861), altitude=33, country='United States'),
-    'KL46': station(name='Anacapa Island', coordinate=(34.01667, -119.36667), altitude=42, country='United States'),
-    'KL49': station(name='Galliano, South Lafourche Airport', coordinate=(29.44472, -90.26111), altitude=0, country='United States'),
-    'KL55': station(name='Malibu Beach', coordinate=(34.03333, -118.68333), altitude=139, country='United States'),
-    'KL58': station(name='Mission Beach', coordinate=(32.76667, -117.23333), altitude=2, country='United States'),
-    'KL79': station(name='Oxnard / Channel Island', coordinate=(34.16667, -119.21667), altitude=2, country='United States'),
-    'KL82': station(name='Terminal Island', coordinate=(33.73333, -118.26667), altitude=10, country='United States'),
-    'KL97': station(name='Point Vincente', coordinate=(33.73333, -118.4), altitude=5, country='United States'),
-    'KL98': station(name='El Capitan Beach', coordinate=(33.45, -120.03333), altitude=27, country='United States'),
-    'KLAA': station(name='LAMAR MUNICIPAL AIRPORT', coordinate=(38.06667, -102.68333), altitude=1129, country='United States'),
-    'KLAF': station(name='LAFAYETTE PURDUE UNIV AIRPORT', coordinate=(40.41667, -86.95), altitude=185, country='United States'),
-    'KLAL': station(name='Lakeland Regional', coordinate=(27.98333, -82.01667), altitude=43, country='United States'),
-    'KLAM': station(name='Los Alamos, Los Alamos Airport', coordinate=(35.87972, -106.26917), altitude=2186, country='United States'),
-    'KLAN': station(name='CAPITAL CITY AIRPORT', coordinate=(42.78333, -84.58333), altitude=262, country='United States'),
-    'KLAR': station(name='LARAMIE REGIONAL AIRPORT', coordinate=(41.31667, -105.66667), altitude=2218, country='United States'),
-    'KLAS': station(name='MCCARRAN INTERNATIONAL AIRPORT', coordinate=(36.11667, -115.26667), altitude=663, country='United States'),
-    'KLAW': station(name='LAWTON - FORT SILL REGIONAL', coordinate=(34.56667, -98.41667), altitude=338, country='United States'),
-    'KLAX': station(name='LOS ANGELES INTERNTL AIRPORT', coordinate=(33.93333, -118.38333), altitude=38, country='United States'),
-    'KLBB': station(name='LUBBOCK INTERNATIONAL AIRPORT', coordinate=(33.66667, -101.81667), altitude=1000, country='United States'),
-    'KLBE': station(name='Latrobe / Westmorland', coordinate=(40.28333, -79.4), altitude=361, country='United States'),
-    'KLBF': station(name='NORTH PLATTE REGIONAL AIRPORT', coordinate=(41.11667, -100.66667), altitude=847, country='United States'),
-    'KLBL': station(name='Liberal, Liberal Municipal Airport', coordinate=(37.05, -100.96667), altitude=879, country='United States'),
-    'KLBR': station(name='Clarksville, Clarksville/Red River County-J D Trissell Field Airport', coordinate=(33.59306, -95.06333), altitude=134, country='United States'),
-    'KLBT': station(name='LUMBERTON MUNICIPAL AIRPORT', coordinate=(34.6, -79.06667), altitude=38, country='United States'),
-    'KLBX': station(name='BRAZORIA COUNTY AIRPORT', coordinate=(29.11667, -95.46667), altitude=8, country='United States'),
-    'KLCG': station(name='Wayne, Wayne Municipal Airport', coordinate=(42.24167, -96.98139), altitude=436, country='United States'),
-    'KLCH': station(name='LAKE CHARLES REGIONAL AIRPORT', coordinate=(30.2, -93.38333), altitude=5, country='United States'),
-    'KLCI': station(name='Laconia, Laconia Municipal Airport', coordinate=(43.56667, -71.41667), altitude=166, country='United States'),
-    'KLCK': station(name='Rickenbacker Air National Guard Base', coordinate=(39.81667, -82.93333), altitude=227, country='United States'),
-    'KLDM': station(name='Ludington, Mason County Airport', coordinate=(43.96667, -86.4), altitude=197, country='United States'),
-    'KLDS': station(name='Leeds', coordinate=(48.55, -109.68333), altitude=775, country='United States'),
-    'KLEB': station(name='LEBANON MUNICIPAL AIRPORT', coordinate=(43.63333, -72.3), altitude=182, country='United States'),
-    'KLEE': station(name='LEESBURG REGIONAL AIRPORT', coordinate=(28.81667, -81.81667), altitude=23, country='United States'),
-    'KLEW': station(name='Auburn-Lewiston', coordinate=(44.05, -70.28333), altitude=88, country='United States'),
-    'KLEX': station(name='LEXINGTON BLUE GRASS AIRPORT', coordinate=(38.03333, -84.6), altitude=299, country='United States'),
-    'KLFI': station(name='Langley Air Force Base', coordinate=(37.08333, -76.35), altitude=3, country='United States'),
-    'KLFK': station(name='LUFKIN ANGELINA COUNTY AIRPORT', coordinate=(31.23333, -94.75), altitude=90, country='United States'),
-    'KLFT': station(name='LAFAYETTE REGIONAL AIRPORT', coordinate=(30.2, -92.0), altitude=13, country='United States'),
-    'KLGA': station(name='NEW YORK LA GUARDIA AIRPORT', coordinate=(40.78333, -73.88333), altitude=7, country='United States'),
-    'KLGB': station(name='LONG BEACH AIRPORT', coordinate=(33.81667, -118.15), altitude=17, country='United States'),
-    'KLGC': station(name='La Grange, Callaway Airport', coordinate=(33.00889, -85.0725), altitude=211, country='United States'),
-    'KLGD': station(name='La Grande, La Grande/Union County Airport', coordinate=(45.28333, -118.0), altitude=828, country='United States'),
-    'KLGU': station(name='LOGAN CACHE AIRPORT', coordinate=(41.78333, -111.85), altitude=1358, country='United States'),
-    'KLHB': station(name='Hearne, Hearne Municipal Airport', coordinate=(30.87167, -96.62222), altitude=87, country='United States'),
-    'KLHD': station(name='Anchorage, Lake Hood Sea Plane Base', coordinate=(61.17806, -149.96361), altitude=21, country='United States'),
-    'KLHQ': station(name='LANCASTER FAIRFIELD CO AIRPORT', coordinate=(39.75, -82.66667), altitude=265, country='United States'),
-    'KLHU': station(name='Lake Havasu Automatic Weather Observing / Reporting System', coordinate=(34.46667, -111.76667), altitude=147, country='United States'),
-    'KLHW': station(name='Ft. Stewart', coordinate=(31.88333, -81.56667), altitude=14, country='United States'),
-    'KLHX': station(name='LA JUNTA MUNICIPAL AIRPORT', coordinate=(38.05, -103.51667), altitude=1292, country='United States'),
-    'KLHZ': station(name='Louisburg, Franklin County Airport', coordinate=(36.02333, -78.33028), altitude=113, country='United States'),
-    'KLIC': station(name='LIMON MUNICIPAL AIRPORT', coordinate=(39.26667, -103.66667), altitude=1635, country='United States'),
-    'KLIT': station(name='LITTLE ROCK ADAMS FIELD', coordinate=(34.73333, -92.23333), altitude=79, country='United States'),
-    'KLIX': station(name='Slidell', coordinate=(30.33333, -89.81667), altitude=8, country='United States'),
-    'KLIZ': station(name='Loring Air Force Base / Limeston', coordinate=(46.95, -67.88333), altitude=227, country='United States'),
-    'KLJF': station(name='Litchfield, Litchfield Municipal Airport', coordinate=(45.09722, -94.50722), altitude=348, country='United States'),
-    'KLKU': station(name='Louisa, Louisa County Airport/Freeman Field', coordinate=(38.00972, -77.97028), altitude=150, country='United States'),
-    'KLKV': station(name='Lakeview, Lake County Airport', coordinate=(42.16667, -120.4), altitude=1443, country='United States'),
-    'KLLJ': station(name='Challis, Challis Airport', coordinate=(44.52278, -114.215), altitude=1546, country='United States'),
-    'KLLQ': station(name='MONTICELLO MUNICIPAL AIRPORT', coordinate=(33.63333, -91.75), altitude=82, country='United States'),
-    'KLMT': station(name='KLAMATH FALLS INTERNATIONAL  AIRPORT', coordinate=(42.15, -121.71667), altitude=1247, country='United States'),
-    'KLNC': station(name='Lancaster, Lancaster Airport', coordinate=(32.57917, -96.71889), altitude=153, country='United States'),
-    'KLND': station(name='LANDER HUNT FIELD', coordinate=(42.81667, -108.73333), altitude=1703, country='United States'),
-    'KLNK': station(name='LINCOLN MUNICIPAL AIRPORT', coordinate=(40.83333, -96.76667), altitude=372, country='United States'),
-    'KLNL': station(name="Land O' Lakes, Kings Land O' Lakes Airport", coordinate=(46.15389, -89.21194), altitude=520, country='United States'),
-    'KLNN': station(name='Willoughby', coordinate=(41.68333, -81.38333), altitude=191, country='United States'),
-    'KLNP': station(name='Wise / Lonesome Pine', coordinate=(36.98333, -82.53333), altitude=817, country='United States'),
-    'KLNR': station(name='LONE ROCK TRI-COUNTY REG', coordinate=(43.21667, -90.18333), altitude=219, country='United States'),
-    'KLNS': station(name='LANCASTER AIRPORT', coordinate=(40.11667, -76.3), altitude=123, country='United States'),
-    'KLOL': station(name='LOVELOCK DERBY FIELD', coordinate=(40.06667, -118.56667), altitude=1190, country='United States'),
-    'KLOM': station(name='Philadelphia, Wings Field Airport', coordinate=(40.1375, -75.265), altitude=92, country='United States'),
-    'KLOR': station(name='Fort Rucker, Lowe Army Heliport', coordinate=(31.35889, -85.74833), altitude=78, country='United States'),
-    'KLOT': station(name='Chicago/Romeoville, Lewis University Airport', coordinate=(41.60833, -88.09417), altitude=205, country='United States'),
-    'KLOU': station(name='BOWMAN FIELD', coordinate=(38.23333, -85.66667), altitude=167, country='United States'),
-    'KLOZ': station(name='LONDON-CORBIN AIRPORT', coordinate=(37.08333, -84.06667), altitude=369, country='United States'),
-    'KLPC': station(name='Lompoc, Lompoc Airport', coordinate=(34.66667, -120.46667), altitude=27, country='United States'),
-    'KLPR': station(name='LORAIN COUNTY REGIONAL AIRPORT', coordinate=(41.35, -82.18333), altitude=242, country='United States'),
-    'KLRD': station(name='Laredo, Laredo International Airport', coordinate=(27.54361, -99.46139), altitude=155, country='United States'),
-    'KLRF': station(name='Little Rock Air Force Base', coordinate=(34.91667, -92.15), altitude=95, country='United States'),
-    'KLRJ': station(name='Le Mars, Le Mars Municipal Airport', coordinate=(42.77806, -96.19361), altitude=365, country='United States'),
-    'KLRU': station(name='Las Cruces, Las Cruces International Airport', coordinate=(32.28944, -106.92194), altitude=1358, country='United States'),
-    'KLRX': station(name='Elko Nexrad', coordinate=(40.73889, -116.80278), altitude=2019, country='United States'),
-    'KLSD': station(name='Lexington / Creech', coordinate=(38.03333, -84.61667), altitude=299, country='United States'),
-    'KLSE': station(name='LA CROSSE MUNICIPAL AIRPORT', coordinate=(43.88333, -91.25), altitude=199, country='United States'),
-    'KLSF': station(name='Fort Benning', coordinate=(32.33333, -84.83333), altitude=71, country='United States'),
-    'KLSV': station(name='Nellis Air Force Base', coordinate=(36.23333, -115.03333), altitude=570, country='United States'),
-    'KLTS': station(name='Altus Air Force Base', coordinate=(34.65, -99.26667), altitude=420, country='United States'),
-    'KLTX': station(name='Wilmington Nexrad', coordinate=(33.98333, -78.43333), altitude=44, country='United States'),
-    'KLUD': station(name='Decatur, Decatur Municipal Airport', coordinate=(33.25444, -97.58056), altitude=319, country='United States'),
-    'KLUF': station(name='Luke Air Force Base / Phoenix', coordinate=(33.53333, -112.38333), altitude=332, country='United States'),
-    'KLUK': station(name='CINCINNATI MUN LUNKEN FLD', coordinate=(39.1, -84.41667), altitude=147, country='United States'),
-    'KLUM': station(name='Menomonie, Menomonie Municipal Airport-Score Field', coordinate=(44.89222, -91.86778), altitude=273, country='United States'),
-    'KLVJ': station(name='PEARLAND REGIONAL AIRPORT', coordinate=(29.51667, -95.25), altitude=13, country='United States'),
-    'KLVK': station(name='LIVERMORE MUNICIPAL AIRPORT', coordinate=(37.7, -121.81667), altitude=121, country='United States'),
-    'KLVM': station(name='LIVINGSTON MISSION FIELD', coordinate=(45.7, -110.43333), altitude=1419, country='United States'),
-    'KLVN': station(name='Minneapolis, Airlake Airport', coordinate=(44.62778, -93.22806), altitude=293, country='United States'),
-    'KLVS': station(name='LAS VEGAS MUNICIPAL AIRPORT', coordinate=(35.65, -105.13333), altitude=2096, country='United States'),
-    'KLVX': station(name='Louisville Nexrad', coordinate=(37.98333, -85.93333), altitude=254, country='United States'),
-    'KLWA': station(name='South Haven, South Haven Area Regional Airport', coordinate=(42.35083, -86.25611), altitude=203, country='United States'),
-    'KLWB': station(name='Lewisburg / Greenbrier', coordinate=(37.86667, -80.4), altitude=702, country='United States'),
-    'KLWC': station(name='LAWRENCE MUNICIPAL AIRPORT', coordinate=(39.01667, -95.21667), altitude=254, country='United States'),
-    'KLWD': station(name='LAMONI MUNICIPAL AIRPORT', coordinate=(40.63333, -93.9), altitude=345, country='United States'),
-    'KLWM': station(name='LAWRENCE MUNICIPAL AIRPORT', coordinate=(42.71667, -71.13333), altitude=45, country='United States'),
-    'KLWS': station(name='LEWISTON NEZ PERCE CO AIRPORT', coordinate=(46.36667, -117.01667), altitude=438, country='United States'),
-    'KLWT': station(name='LEWISTOWN MUNICIPAL AIRPORT', coordinate=(47.05, -109.45), altitude=1270, country='United States'),
-    'KLWV': station(name='LAWRENCEVILLE-VINCENNES INTERNATIONAL', coordinate=(38.76667, -87.6), altitude=131, country='United States'),
-    'KLWX': station(name='Baltimore / DC Nexrad', coordinate=(38.98333, -77.48333), altitude=113, country='United States'),
-    'KLXL': station(name='Little Falls, Little Falls/Morrison County Airport-Lindbergh Field', coordinate=(45.95, -94.35), altitude=342, country='United States'),
-    'KLXN': station(name='Lexington, Jim Kelly Field Airport', coordinate=(40.79111, -99.77722), altitude=736, country='United States'),
-    'KLXT': station(name="LEE'S SUMMIT MUNICIPAL", coordinate=(38.96667, -94.36667), altitude=306, country='United States'),
-    'KLXV': station(name='LEADVILLE LAKE CO', coordinate=(39.23333, -106.31667), altitude=3026, country='United States'),
-    'KLYH': station(name='LYNCHBURG REGIONAL AIRPORT', coordinate=(37.31667, -79.2), altitude=286, country='United States'),
-    'KLYV': station(name='Luverne, Quentin Aanenson Field Airport', coordinate=(43.62111, -96.21556), altitude=436, country='United States'),
-    'KLZK': station(name='North Little Rock, North Little Rock Airport', coordinate=(34.83333, -92.25), altitude=165, country='United States'),
-    'KLZU': station(name='Lawrenceville, Gwinnett County-Briscoe Field Airport', coordinate=(33.97806, -83.9625), altitude=323, country='United States'),
-    'KLZZ': station(name='Lampasas, Lampasas Airport', coordinate=(31.10611, -98.19583), altitude=370, country='United States'),
-    'KM19': station(name='Newport, Newport Municipal Airport', coordinate=(35.6375, -91.17611), altitude=73, country='United States'),
-    'KM30': station(name='Metropolis, Metropolis Municipal Airport', coordinate=(37.18583, -88.75056), altitude=117, country='United States'),
-    'KM39': station(name='Mena, Mena Intermountain Municipal Airport', coordinate=(34.54528, -94.2025), altitude=329, country='United States'),
-    'KM82': station(name='Huntsville, Madison County Executive Airport', coordinate=(34.86139, -86.55722), altitude=230, country='United States'),
-    'KM89': station(name='Arkadelphia, Dexter B Florence Memorial Field Airport', coordinate=(34.09972, -93.06611), altitude=56, country='United States'),
-    'KM97': station(name='Tunica, Tunica Municipal Airport', coordinate=(34.68083, -90.34639), altitude=59, country='United States'),
-    'KMAE': station(name='MADERA MUNICIPAL AIRPORT', coordinate=(36.98333, -120.11667), altitude=77, country='United States'),
-    'KMAF': station(name='MIDLAND INTERNATIONAL AIRPORT', coordinate=(31.93333, -102.2), altitude=875, country='United States'),
-    'KMAI': station(name='MARIANNA MUNICIPAL AIRPORT', coordinate=(30.83333, -85.18333), altitude=34, country='United States'),
-    'KMAN': station(name='Nampa', coordinate=(43.58139, -116.52306), altitude=773, country='United States'),
-    'KMAX': station(name='Medford Nexrad', coordinate=(42.08083, -122.71583), altitude=2290, country='United States'),
-    'KMBG': station(name='MOBRIDGE MUNICIPAL AIRPORT', coordinate=(45.55, -100.41667), altitude=523, country='United States'),
-    'KMBL': station(name='Manistee, Manistee County-Blacker Airport', coordinate=(44.26667, -86.25), altitude=189, country='United States'),
-    'KMBS': station(name='MBS INTERNATIONAL AIRPORT', coordinate=(43.53333, -84.08333), altitude=204, country='United States'),
-    'KMCB': station(name='MCCOMB/PIKE COUNTY AIRPORT', coordinate=(31.18333, -90.46667), altitude=126, country='United States'),
-    'KMCC': station(name='Sacramento, McClellan Airfield Airport', coordinate=(38.66667, -121.4), altitude=23, country='United States'),
-    'KMCD': station(name='Macinac Island, Mackinac Island Airport', coordinate=(45.865, -84.63722), altitude=226, country='United States'),
-    'KMCE': station(name='MERCED MUNICIPAL AIRPORT', coordinate=(37.28333, -120.5), altitude=48, country='United States'),
-    'KMCF': station(name='Macdill Air Force Base, Fl.', coordinate=(27.85, -82.5), altitude=4, country='United States'),
-    'KMCG': station(name='McGrath, McGrath Airport', coordinate=(62.95611, -155.60583), altitude=102, country='United States'),
-    'KMCI': station(name='KANSAS CITY INTERNATIONAL  AIRPORT', coordinate=(39.3, -94.73333), altitude=313, country='United States'),
-    'KMCK': station(name='MC COOK MUNICIPAL AIRPORT', coordinate=(40.2, -100.58333), altitude=786, country='United States'),
-    'KMCN': station(name='MIDDLE GEORGIA REGIONAL AIRPORT', coordinate=(32.68333, -83.65), altitude=108, country='United States'),
-    'KMCO': station(name='ORLANDO INTERNATIONAL AIRPORT', coordinate=(28.41667, -81.33333), altitude=29, country='United States'),
-    'KMCW': station(name='MASON CITY MUNICIPAL AIRPORT', coordinate=(43.15, -93.33333), altitude=370, country='United States'),
-    'KMDD': station(name='Midland, Midland Airpark', coordinate=(32.03639, -102.10083), altitude=854, country='United States'),
-    'KMDH': station(name='SOUTHERN ILLINOIS AIRPORT', coordinate=(37.78333, -89.25), altitude=125, country='United States'),
-    'KMDJ': station(name='Mississippi Canyon', coordinate=(28.6425, -89.79417), altitude=None, country='United States'),
-    'KMDQ': station(name='Huntsville, Madison County Executive Airport', coordinate=(34.86139, -86.55722), altitude=230, country='United States'),
-    'KMDT': station(name='HARRISBURG INTERNATIONAL  AIRPORT', coordinate=(40.2, -76.76667), altitude=94, country='United States'),
-    'KMDW': station(name='CHICAGO MIDWAY AIRPORT', coordinate=(41.78333, -87.75), altitude=189, country='United States'),
-    'KMDZ': station(name='Medford, Taylor County Airport', coordinate=(45.10111, -90.30333), altitude=448, country='United States'),
-    'KMEB': station(name='LAURINBURG MAXTON AIRPORT', coordinate=(34.78333, -79.36667), altitude=67, country='United States'),
-    'KMEH': station(name='MEACHAM', coordinate=(45.51667, -118.41667), altitude=1135, country='United States'),
-    'KMEI': station(name='MERIDIAN KEY FIELD', coordinate=(32.33333, -88.75), altitude=91, country='United States'),
-    'KMEM': station(name='MEMPHIS INTERNATIONAL AIRPORT', coordinate=(35.03333, -89.98333), altitude=102, country='United States'),
-    'KMER': station(name='Merced / Castle Air Force Base', coordinate=(37.36667, -120.56667), altitude=57, country='United States'),
-    'KMEZ': station(name='Mena, Mena Intermountain Municipal Airport', coordinate=(34.54528, -94.2025), altitude=329, country='United States'),
-    'KMFD': station(name='LAHM MUNICIPAL AIRPORT', coordinate=(40.81667, -82.51667), altitude=395, country='United States'),
-    'KMFE': station(name='MCALLEN MILLER INTERNATIONAL  AIRPORT', coordinate=(26.18333, -98.25), altitude=33, country='United States'),
-    'KMFI': station(name='MARSHFIELD MUNICIPAL AIRPORT', coordinate=(44.63333, -90.18333), altitude=389, country='United States'),
-    'KMFR': station(name='ROGUE VALLEY INTERNATIONAL  AIRPORT', coordinate=(42.38333, -122.88333), altitude=406, country='United States'),
-    'KMFV': station(name='Melfa / Accomack Airport', coordinate=(37.65, -75.76667), altitude=15, country='United States'),
-    'KMGE': station(name='Marietta / Dobbins Air Force Base', coordinate=(33.91667, -84.51667), altitude=326, country='United States'),
-    'KMGG': station(name='Maple Lake, Maple Lake Municipal Airport', coordinate=(45.23611, -93.98556), altitude=313, country='United States'),
-    'KMGJ': station(name='MONTGOMERY ORANGE CO AIRPORT', coordinate=(41.51667, -74.26667), altitude=108, country='United States'),
-    'KMGM': station(name='MONTGOMERY DANNELLY FIELD', coordinate=(32.3, -86.4), altitude=67, country='United States'),
-    'KMGN': station(name='Harbor Springs, Harbor Springs Airport', coordinate=(45.42556, -84.91333), altitude=209, country='United States'),
-    'KMGR': station(name='Moultrie, Moultrie Municipal Airport', coordinate=(31.08472, -83.80306), altitude=90, country='United States'),
-    'KMGW': station(name='MORGANTOWN MUNI-HART FIELD', coordinate=(39.65, -79.91667), altitude=380, country='United States'),
-    'KMGY': station(name='DAYTON WRIGHT BROTHERS AIRPORT', coordinate=(39.6, -84.23333), altitude=293, country='United States'),
-    'KMHE': station(name='MITCHELL MUNICIPAL AIRPORT', coordinate=(43.76667, -98.03333), altitude=397, country='United States'),
-    'KMHK': station(name='MANHATTAN REGIONAL AIRPORT', coordinate=(39.13333, -96.68333), altitude=322, country='United States'),
-    'KMHN': station(name='Mullen / Hooker County', coordinate=(42.05, -101.06667), altitude=994, country='United States'),
-    'KMHR': station(name='Sacramento, Sacramento Mather Airport', coordinate=(38.55, -121.3), altitude=29, country='United States'),
-    'KMHS': station(name='MOUNT SHASTA', coordinate=(41.31667, -122.31667), altitude=1077, country='United States'),
-    'KMHT': station(name='MANCHESTER AIRPORT', coordinate=(42.93333, -71.43333), altitude=71, country='United States'),
-    'KMHV': station(name='Mojave', coordinate=(35.06667, -118.15), altitude=849, country='United States'),
-    'KMHX': station(name='Newport', coordinate=(34.78333, -76.88333), altitude=11, country='United States'),
-    'KMIA': station(name='MIAMI INTERNATIONAL AIRPORT', coordinate=(25.78333, -80.31667), altitude=4, country='United States'),
-    'KMIB': station(name='Minot Air Force Base', coordinate=(48.41667, -101.35), altitude=508, country='United States'),
-    'KMIC': station(name='CRYSTAL AIRPORT', coordinate=(45.06667, -93.35), altitude=265, country='United States'),
-    'KMIE': station(name='MUNCIE DELAWARE JOHNSON', coordinate=(40.23333, -85.4), altitude=286, country='United States'),
-    'KMIS': station(name='Main Pass', coordinate=(29.29556, -88.84222), altitude=None, country='United States'),
-    'KMIU': station(name='Mustang Island 31', coordinate=(27.28889, -96.73667), altitude=None, country='United States'),
-    'KMIV': station(name='MILLVILLE MUNICIPAL AIRPORT', coordinate=(39.36667, -75.08333), altitude=26, country='United States'),
-    'KMIW': station(name='MARSHALLTOWN MUNICIPAL AIRPORT', coordinate=(42.11667, -92.91667), altitude=297, country='United States'),
-    'KMJQ': station(name='Jackson, Jackson Municipal Airport', coordinate=(43.65, -94.98333), altitude=441, country='United States'),
-    'KMKC': station(name='KANSAS CITY DOWNTOWN AIRPORT', coordinate=(39.11667, -94.6), altitude=231, country='United States'),
-    'KMKE': station(name='GEN MITCHELL INTERNATIONAL  AIRPORT', coordinate=(42.95, -87.9), altitude=220, country='United States'),
-    'KMKG': station(name='MUSKEGON COUNTY AIRPORT', coordinate=(43.16667, -86.23333), altitude=191, country='United States'),
-    'KMKJ': station(name='Marion / Wytheville', coordinate=(36.9, -81.35), altitude=780, country='United States'),
-    'KMKK': station(name='Kaunakakai, Molokai Airport', coordinate=(21.15778, -157.09861), altitude=138, country='United States'),
-    'KMKL': station(name='JACKSON MCKELLAR-SIPES RGNL', coordinate=(35.6, -88.91667), altitude=132, country='United States'),
-    'KMKN': station(name='Comanche, Comanche County-City Airport', coordinate=(31.91667, -98.60028), altitude=423, country='United States'),
-    'KMKO': station(name='MUSKOGEE DAVIS FIELD', coordinate=(35.65, -95.36667), altitude=186, country='United States'),
-    'KMKT': station(name='Mankato, Mankato Regional Airport', coordinate=(44.21667, -93.91667), altitude=311, country='United States'),
-    'KMKX': station(name='Milwaukee NEXRAD', coordinate=(42.96667, -88.55), altitude=312, country='United States'),
-    'KMLB': station(name='MELBOURNE INTERNATIONAL', coordinate=(28.1, -80.65), altitude=10, country='United States'),
-    'KMLC': station(name='MCALESTER REGIONAL AIRPORT', coordinate=(34.88333, -95.78333), altitude=235, country='United States'),
-    'KMLD': station(name='Malad City', coordinate=(42.16667, -112.3), altitude=1373, country='United States'),
-    'KMLE': station(name='Omaha, Millard Airport', coordinate=(41.19583, -96.11222), altitude=320, country='United States'),
-    'KMLF': station(name='MILFORD MUNICIPAL AIRPORT', coordinate=(38.41667, -113.01667), altitude=1536, country='United States'),
-    'KMLI': station(name='MOLINE QUAD-CITY AIRPORT', coordinate=(41.45, -90.51667), altitude=180, country='United States'),
-    'KMLJ': station(name='Milledgeville, Baldwin County Airport', coordinate=(33.15417, -83.24056), altitude=117, country='United States'),
-    'KMLP': station(name='MULLAN PASS VOR', coordinate=(47.45, -115.66667), altitude=1851, country='United States'),
-    'KMLS': station(name='MILES CITY WILEY FIELD', coordinate=(46.43333, -105.88333), altitude=801, country='United States'),
-    'KMLT': station(name='MILLINOCKET MUNICIPAL AIRPORT', coordinate=(45.65, -68.7), altitude=124, country='United States'),
-    'KMLU': station(name='MONROE REGIONAL AIRPORT', coordinate=(32.51667, -92.03333), altitude=24, country='United States'),
-    'KMMG': station(name='Matterhorn', coordinate=(28.74222, -88.82556), altitude=None, country='United States'),
-    'KMMH': station(name='Mammoth / June Lakes', coordinate=(37.61667, -118.83333), altitude=2173, country='United States'),
-    'KMMK': station(name='MERIDEN MARKHAM MUNICIPAL AIRPORT', coordinate=(41.51667, -72.83333), altitude=31, country='United States'),
-    'KMML': station(name='Marshall, Southwest Minnesota Regional Airport - Marshall/Ryan Field', coordinate=(44.45, -95.81667), altitude=360, country='United States'),
-    'KMMO': station(name='Marseilles Island', coordinate=(41.36667, -88.68333), altitude=223, country='United States'),
-    'KMMT': station(name='McEntire Air National Guard Weather Facility Base', coordinate=(33.91667, -80.8), altitude=77, country='United States'),
-    'KMMU': station(name='Morristown Municipal', coordinate=(40.8, -74.41667), altitude=57, country='United States'),
-    'KMMV': station(name='MCMINNVILLE MUNICIPAL AIRPORT', coordinate=(45.2, -123.13333), altitude=48, country='United States'),
-    'KMNH': station(name='Elbert Mountain, Monument Pass', coordinate=(39.21667, -104.63389), altitude=2152, country='United States'),
-    'KMNI': station(name='Manning / Cooper Regional', coordinate=(33.58333, -80.21667), altitude=32, country='United States'),
-    'KMNM': station(name='Menominee, Menominee-Marinette Twin County Airport', coordinate=(45.13333, -87.63333), altitude=191, country='United States'),
-    'KMNN': station(name='MARION MUNICIPAL AIRPORT', coordinate=(40.61667, -83.06667), altitude=303, country='United States'),
-    'KMOB': station(name='MOBILE REGIONAL AIRPORT', coordinate=(30.68333, -88.23333), altitude=66, country='United States'),
-    'KMOD': station(name='MODESTO CITY CO SHAM FLD', coordinate=(37.61667, -120.95), altitude=30, country='United States'),
-    'KMOP': station(name='Mount Pleasant, Mount Pleasant Municipal Airport', coordinate=(43.61667, -84.73333), altitude=230, country='United States'),
-    'KMOT': station(name='MINOT INTERNATIONAL AIRPORT', coordinate=(48.26667, -101.28333), altitude=523, country='United States'),
-    'KMOX': station(name='Morris, Morris Municipal Airport', coordinate=(45.56667, -95.96667), altitude=347, country='United States'),
-    'KMPO': station(name='MT POCONO POCONO MOUNTAINS', coordinate=(41.13333, -75.38333), altitude=584, country='United States'),
-    'KMPV': station(name='KNAPP STATE AIRPORT', coordinate=(44.2, -72.56667), altitude=355, country='United States'),
-    'KMPZ': station(name='Mount Pleasant, Mount Pleasant Municipal Airport', coordinate=(40.94667, -91.51111), altitude=224, country='United States'),
-    'KMQB': station(name='Macomb, Macomb Municipal Airport', coordinate=(40.52028, -90.6525), altitude=216, country='United States'),
-    'KMQE': station(name='MILTON BLUE HILL OBSERV', coordinate=(42.21667, -71.11667), altitude=192, country='United States'),
-    'KMQI': station(name='Manteo / Dare County Regional', coordinate=(35.91667, -75.7), altitude=4, country='United States'),
-    'KMQM': station(name='Monida', coordinate=(44.56667, -112.31667), altitude=2068, country='United States'),
-    'KMQT': station(name='Marquette', coordinate=(46.53333, -87.55), altitude=434, country='United States'),
-    'KMQY': station(name='Smyrna, Smyrna Airport', coordinate=(36.00889, -86.52), altitude=166, country='United States'),
-    'KMRB': station(name='MARTINSBURG EASTERN WV REG', coordinate=(39.4, -77.98333), altitude=170, country='United States'),
-    'KMRC': station(name='Columbia / Maury County', coordinate=(35.55, -87.18333), altitude=206, country='United States'),
-    'KMRF': station(name='Marfa', coordinate=(30.36667, -104.01667), altitude=1478, country='United States'),
-    'KMRH': station(name='BEAUFORT SMITH FIELD', coordinate=(34.73333, -76.65), altitude=3, country='United States'),
-    'KMRI': station(name='Anchorage, Merrill Field', coordinate=(61.21694, -149.855), altitude=41, country='United States'),
-    'KMRJ': station(name='Mineral Point, Iowa County Airport', coordinate=(42.88528, -90.23194), altitude=359, country='United States'),
-    'KMRN': station(name='Morganton, Morganton-Lenoir Airport', coordinate=(35.82139, -81.61083), altitude=387, country='United States'),
-    'KMRX': station(name='Morristown Nexrad', coordinate=(36.16667, -83.4), altitude=437, country='United States'),
-    'KMRY': station(name='MONTEREY PENINSULA AIRPORT', coordinate=(36.58333, -121.85), altitude=77, country='United States'),
-    'KMSL': station(name='NORTH WEST ALABAMA REGIONAL', coordinate=(34.75, -87.6), altitude=168, country='United States'),
-    'KMSN': station(name='MADISON DANE COUNTY RGNL', coordinate=(43.13333, -89.35), altitude=263, country='United States'),
-    'KMSO': station(name='MISSOULA INTERNATIONAL AIRPORT', coordinate=(46.91667, -114.1), altitude=976, country='United States'),
-    'KMSP': station(name='MINNEAPOLIS-ST PAUL INTERNATIONAL', coordinate=(44.86667, -93.21667), altitude=256, country='United States'),
-    'KMSS': station(name='MASSENA INTERNATIONAL -RICHARDS FLD', coordinate=(44.93333, -74.85), altitude=65, country='United States'),
-    'KMSV': station(name='Monticello, Sullivan County International Airport', coordinate=(41.7, -74.8), altitude=428, country='United States'),
-    'KMSX': station(name='Missoula NEXRAD', coordinate=(47.03333, -113.98333), altitude=2451, country='United States'),
-    'KMSY': station(name='NEW ORLEANS INTERNATIONAL  AIRPORT', coordinate=(30.0, -90.25), altitude=2, country='United States'),
-    'KMTC': station(name='Selfridge Air National Guard Base', coordinate=(42.61667, -82.83333), altitude=177, country='United States'),
-    'KMTH': station(name='MARATHON AIRPORT', coordinate=(24.73333, -81.05), altitude=2, country='United States'),
-    'KMTJ': station(name='MONTROSE REGIONAL AIRPORT', coordinate=(38.5, -107.9), altitude=1755, country='United States'),
-    'KMTN': station(name='Baltimore / Martin', coordinate=(39.33333, -76.41667), altitude=7, country='United States'),
-    'KMTO': station(name='MATTOON/CHARLESTON COLES CO', coordinate=(39.46667, -88.26667), altitude=220, country='United States'),
-    'KMTP': station(name='MONTAUK AIRPORT', coordinate=(41.06667, -71.91667), altitude=2, country='United States'),
-    'KMTV': station(name='Martinsville', coordinate=(36.63333, -80.01667), altitude=287, country='United States'),
-    'KMTW': station(name='Manitowoc, Manitowoc County Airport', coordinate=(44.13333, -87.68333), altitude=198, country='United States'),
-    'KMTX': station(name='Salt Lake Nexrad', coordinate=(41.43333, -112.75), altitude=2004, country='United States'),
-    'KMUI': station(name='Muir Army Air Field / Indiantown', coordinate=(40.43333, -76.56667), altitude=149, country='United States'),
-    'KMUO': station(name='Mountain Home Air Force Base', coordinate=(43.05, -115.86667), altitude=913, country='United States'),
-    'KMUT': station(name='Muscatine', coordinate=(41.36667, -91.15), altitude=167, country='United States'),
-    'KMUX': station(name='Monterey NEXRAD', coordinate=(37.16667, -121.9), altitude=1082, country='United States'),
-    'KMVE': station(name='Montevideo, Montevideo-Chippewa County Airport', coordinate=(44.96667, -95.71667), altitude=315, country='United States'),
-    'KMVL': station(name='MORRISVILLE STOWE STATE AIRPORT', coordinate=(44.53333, -72.61667), altitude=223, country='United States'),
-    'KMVN': station(name='Mount Vernon, Mount Vernon Airport', coordinate=(38.31667, -88.86667), altitude=146, country='United States'),
-    'KMVY': station(name='VINEYARD HAVEN MARTHAS VIN', coordinate=(41.4, -70.61667), altitude=21, country='United States'),
-    'KMWA': station(name='Marion, Williamson County Regional Airport', coordinate=(37.75028, -89.00111), altitude=144, country='United States'),
-    'KMWC': station(name='Milwaukee / Timmerman', coordinate=(43.11667, -88.03333), altitude=227, country='United States'),
-    'KMWH': station(name='GRANT COUNTY AIRPORT', coordinate=(47.2, -119.31667), altitude=361, country='United States'),
-    'KMWK': station(name='Mount Airy, Mount Airy/Surry County Airport', coordinate=(36.45972, -80.55306), altitude=380, country='United States'),
-    'KMWL': station(name='MINERAL WELLS AIRPORT', coordinate=(32.78333, -98.06667), altitude=296, country='United States'),
-    'KMWM': station(name='Windom, Windom Municipal Airport', coordinate=(43.91333, -95.10944), altitude=430, country='United States'),
-    'KMWN': station(name='Mount Washington', coordinate=(44.26667, -71.3), altitude=1909, country='United States'),
-    'KMWS': station(name='Mount Wilson', coordinate=(34.23333, -118.06667), altitude=1739, country='United States'),
-    'KMWT': station(name='MT IDA', coordinate=(34.55, -93.58333), altitude=214, country='United States'),
-    'KMXF': station(name='Maxwell Air Force Base / Montgomery', coordinate=(32.38333, -86.36667), altitude=51, country='United States'),
-    'KMXO': station(name='Monticello Municipal', coordinate=(42.23333, -91.16667), altitude=259, country='United States'),
-    'KMYF': station(name='SAN DIEGO MONTGOMERY FIELD', coordinate=(32.81667, -117.13333), altitude=129, country='United States'),
-    'KMYL': station(name='MCCALL AIRPORT', coordinate=(44.88333, -116.08333), altitude=1530, country='United States'),
-    'KMYP': station(name='Salida Mountain, Monarch Pass', coordinate=(38.48444, -106.31694), altitude=3667, country='United States'),
-    'KMYR': station(name='Myrtle Beach Air Force Base', coordinate=(33.68333, -78.93333), altitude=8, country='United States'),
-    'KMYT': station(name='Innovator', coordinate=(28.22056, -89.615), altitude=None, country='United States'),
-    'KMYV': station(name='MARYSVILLE YUBA COUNTY', coordinate=(39.1, -121.56667), altitude=19, country='United States'),
-    'KMZG': station(name='Mustang Island A85A', coordinate=(27.72694, -96.19111), altitude=None, country='United States'),
-    'KMZH': station(name='Moose Lake, Moose Lake Carlton County Airport', coordinate=(46.41667, -92.8), altitude=328, country='United States'),
-    'KN00': station(name='Fulton, Oswego County Airport', coordinate=(43.34972, -76.38472), altitude=144, country='United States'),
-    'KN11': station(name='New Haven Coast Guard Station', coordinate=(41.26667, -72.9), altitude=3, country='United States'),
-    'KN28': station(name='Ambrose / Ft. Tilden', coordinate=(40.45, -73.81667), altitude=1, country='United States'),
-    'KN60': station(name='GARRISON MUNICIPAL AIRPORT', coordinate=(47.65, -101.43333), altitude=583, country='United States'),
-    'KN67': station(name='Philadelphia, Wings Field Airport', coordinate=(40.1375, -75.265), altitude=92, country='United States'),
-    'KN78': station(name='Barnegat Coast Guard Station', coordinate=(39.76667, -74.1), altitude=6, country='United States'),
-    'KN80': station(name='Ocean City, Ocean City Municipal Airport', coordinate=(38.30833, -75.12389), altitude=3, country='United States'),
-    'KN84': station(name='Bronx / Execution Coast Guard Station', coordinate=(40.88333, -73.73333), altitude=8, country='United States'),
-    'KN91': station(name='Cape May Coast Guard Station', coordinate=(38.95, -74.88333), altitude=2, country='United States'),
-    'KNAE': station(name='Astor, Bombing Range Detachment Astor', coordinate=(29.14306, -81.63278), altitude=28, country='United States'),
-    'KNAK': station(name='ANNAPOLIS US NAVAL ACADEMY', coordinate=(38.98333, -76.48333), altitude=2, country='United States'),
-    'KNBC': station(name='BEAUFORT MCAS', coordinate=(32.48333, -80.71667), altitude=12, country='United States'),
-    'KNBE': station(name='Dallas United States Naval Air Station', coordinate=(32.73333, -96.96667), altitude=150, country='United States'),
-    'KNBG': station(name='NEW ORLEANS NAVAL AIR STN', coordinate=(29.83333, -90.01667), altitude=0, country='United States'),
-    'KNBJ': station(name='FOLEY, BARIN FIELD', coordinate=(30.38333, -87.63333), altitude=14, country='United States'),
-    'KNBQ': station(name='Kings Bay, Naval Station', coordinate=(30.79417, -81.55694), altitude=8, country='United States'),
-    'KNBT': station(name='PINEY ISLAND BT11 BOMB RANGE', coordinate=(35.01667, -76.46667), altitude=5, country='United States'),
-    'KNCA': station(name='MCAS NEW RIVER', coordinate=(34.7, -77.45), altitude=8, country='United States'),
-    'KNDZ': station(name='MILTON WHITING FIELD (SOUTH)', coordinate=(30.7, -87.01667), altitude=54, country='United States'),
-    'KNED': station(name='Winner, Wiley Field', coordinate=(43.38944, -99.84278), altitude=619, country='United States'),
-    'KNEL': station(name='Lakehurst Naval Air Station', coordinate=(40.03333, -74.31667), altitude=31, country='United States'),
-    'KNEN': station(name='NOLF WHITEHOUSE FIELD, FL', coordinate=(30.35, -81.86667), altitude=30, country='UNITED STATES'),
-    'KNEW': station(name='NEW ORLEANS LAKEFRONT AIRPORT', coordinate=(30.05, -90.03333), altitude=3, country='United States'),
-    'KNEX': station(name='Charleston Nise', coordinate=(32.91667, -79.98333), altitude=12, country='United States'),
-    'KNFE': station(name='FENTRESS NALF', coordinate=(36.7, -76.13333), altitude=4, country='United States'),
-    'KNFG': station(name='MCAS CAMP PENDLETON', coordinate=(33.3, -117.35), altitude=24, country='United States'),
-    'KNFJ': station(name='CHOCTAW, WHITING FIELD, NOLF', coordinate=(30.5, -86.95), altitude=34, country='United States'),
-    'KNFL': station(name='FALLON NAVAL AIR STATION', coordinate=(39.43333, -118.68333), altitude=1199, country='United States'),
-    'KNFW': station(name='NAS FORT WORTH TX', coordinate=(32.76667, -97.45), altitude=198, country='United States'),
-    'KNGP': station(name='CORPUS CHRISTI NAVAL AIR STN', coordinate=(27.68333, -97.28333), altitude=6, country='United States'),
-    'KNGU': station(name='Norfolk, Naval Air Station', coordinate=(36.93361, -76.29583), altitude=4, country='United States'),
-    'KNGW': station(name='CABINESS FIELD', coordinate=(28.16667, -97.71667), altitude=9, country='United States'),
-    'KNGZ': station(name='Alameda Naval Air Station', coordinate=(37.78333, -122.31667), altitude=4, country='United States'),
-    'KNHK': station(name='NAS PATUXENT RIVER MD', coordinate=(38.3, -76.4), altitude=12, country='United States'),
-    'KNHZ': station(name='BRUNSWICK NAVAL AIR STN', coordinate=(43.9, -69.93333), altitude=23, country='United States'),
-    'KNID': station(name='NAWS CHINA LAKE', coordinate=(35.68333, -117.7), altitude=696, country='United States'),
-    'KNIP': station(name='JACKSONVILLE NAVAL AIR STN', coordinate=(30.23333, -81.66667), altitude=7, country='United States'),
-    'KNIS': station(name='Cherry Point, Marine Corps Air Station', coordinate=(34.88639, -76.86306), altitude=8, country='United States'),
-    'KNJK': station(name='El Centro, Naval Air Facility', coordinate=(32.825, -115.66056), altitude=-13, country='United States'),
-    'KNJM': station(name='BOGUE FIELD, MCALF', coordinate=(34.7, -77.03333), altitude=7, country='United States'),
-    'KNJW': station(name='MERIDIAN RANGE B', coordinate=(32.8, -88.83333), altitude=165, country='United States'),
-    'KNKT': station(name='Cherry Point, Marine Corps Air Station', coordinate=(34.89778, -76.88083), altitude=8, country='United States'),
-    'KNKX': station(name='MCAS MIRAMAR', coordinate=(32.86667, -117.15), altitude=146, country='United States'),
-    'KNLC': station(name='LEMOORE NAVAL AIR STATION', coordinate=(36.33333, -119.95), altitude=71, country='United States'),
-    'KNLT': station(name='Atlantic, Atlantic Field Outlying Landing Field', coordinate=(34.87917, -76.33611), altitude=4, country='United States'),
-    'KNMM': station(name='MERIDIAN NAVAL AIR STATION', coordinate=(32.91667, -88.93333), altitude=97, country='United States'),
-    'KNMT': station(name='McMullen, McMullen Target Site', coordinate=(28.23611, -98.72417), altitude=79, country='United States'),
-    'KNNZ': station(name='Point Sur', coordinate=(36.3, -121.88333), altitude=34, country='United States'),
-    'KNOG': station(name='ORANGE GROVE, NALF', coordinate=(28.48333, -98.06667), altitude=78, country='United States'),
-    'KNOW': station(name='Port Angeles Coast Guard Air Station', coordinate=(48.13333, -123.4), altitude=5, country='United States'),
-    'KNPA': station(name='Pensacola, Naval Air Station', coordinate=(30.35611, -87.32333), altitude=9, country='United States'),
-    'KNQA': station(name='Millington, Millington Municipal Airport', coordinate=(35.35667, -89.87028), altitude=98, country='United States'),
-    'KNQI': station(name='KINGSVILLE NAS', coordinate=(27.83333, -98.35), altitude=15, country='United States'),
-    'KNQX': station(name='KEY WEST NAVAL AIR STATION', coordinate=(24.58333, -81.68333), altitude=2, country='United States'),
-    'KNRA': station(name='OLF COUPEVILLE', coordinate=(48.18333, -122.63333), altitude=61, country='United States'),
-    'KNRB': station(name='MAYPORT NAVAL AIR FACILITY', coordinate=(30.4, -81.41667), altitude=5, country='United States'),
-    'KNRC': station(name='Crows Landing Naval Auxiliary Landing Field', coordinate=(37.4, -121.1), altitude=50, country='United States'),
-    'KNRS': station(name='IMPERIAL BEACH, NOLF', coordinate=(32.56667, -117.11667), altitude=7, country='United States'),
-    'KNSE': station(name='MILTON WHITING FIELD (NORTH)', coordinate=(30.73333, -87.01667), altitude=61, country='United States'),
-    'KNSI': station(name='SAN NICOLAS ISLAND', coordinate=(33.23333, -119.46667), altitude=154, country='United States'),
-    'KNTD': station(name='NAWCWPNS POINT MUGU, CA', coordinate=(34.11667, -119.11667), altitude=4, country='United States'),
-    'KNTU': station(name='OCEANA, NAVAL AIR STATION', coordinate=(36.81667, -76.03333), altitude=7, country='United States'),
-    'KNUC': station(name='SAN CLEMENTE ISLAND NALF', coordinate=(33.01667, -118.58333), altitude=55, country='United States'),
-    'KNUI': station(name='KNUI WEBSTER FIELD ANNEX', coordinate=(38.15, -76.41667), altitude=6, country='United States'),
-    'KNUQ': station(name='MOFFETT FIELD', coordinate=(37.43333, -122.05), altitude=10, country='United States'),
-    'KNUW': station(name='NAS WHIDBEY ISLAND', coordinate=(48.35, -122.65), altitude=14, country='United States'),
-    'KNVT': station(name='WALDRON FLD NOLF', coordinate=(27.63333, -97.31667), altitude=8, country='United States'),
-    'KNXP': station(name='TWENTYNINE PALMS MARINE', coordinate=(34.3, -116.16667), altitude=626, country='United States'),
-    'KNXX': station(name='WILLOW GROVE NAVAL AIR STA', coordinate=(40.2, -75.13333), altitude=110, country='United States'),
-    'KNYC': station(name='NEW YORK CITY CENTRAL PARK', coordinate=(40.78333, -73.96667), altitude=48, country='United States'),
-    'KNYG': station(name='QUANTICO MARINE CORPS AIRFAC', coordinate=(38.5, -77.3), altitude=4, country='United States'),
-    'KNYL': station(name='MCAS YUMA', coordinate=(32.65, -114.6), altitude=65, country='United States'),
-    'KNZC': station(name='Cecil, Naval Air Station', coordinate=(30.21222, -81.87028), altitude=24, country='United States'),
-    'KNZY': station(name='NAS NORTH ISLAND, SAN DIEGO', coordinate=(32.7, -117.21667), altitude=8, country='United States'),
-    'KO18': station(name='Hanford, Hanford Municipal Airport', coordinate=(36.3175, -119.62944), altitude=75, country='United States'),
-    'KO54': station(name='Weaverville', coordinate=(40.74722, -122.92222), altitude=716, country='United States'),
-    'KO64': station(name='Fort Bragg', coordinate=(39.4, -123.81667), altitude=19, country='United States'),
-    'KO72': station(name='Point Cabrillo', coordinate=(39.35, -123.81667), altitude=20, country='United States'),
-    'KO87': station(name='Shelter Cove', coordinate=(40.01667, -124.06667), altitude=21, country='United States'),
-    'KOAJ': station(name='Jacksonville, Albert J Ellis Airport', coordinate=(34.83333, -77.61667), altitude=29, country='United States'),
-    'KOAK': station(name='METRO OAKLAND INTERNATIONAL  AIRPORT', coordinate=(37.71667, -122.23333), altitude=2, country='United States'),
-    'KOAX': station(name='Valley', coordinate=(41.31667, -96.36667), altitude=350, country='United States'),
-    'KOBE': station(name='Okeechobee County Airport', coordinate=(27.26667, -80.85056), altitude=10, country='United States'),
-    'KOCF': station(name='Ocala, Ocala International Airport-Jim Taylor Field', coordinate=(29.16667, -82.21667), altitude=27, country='United States'),
-    'KOCH': station(name='Nacogdoches, A L Mangham Jr. Regional Airport', coordinate=(31.58333, -94.71667), altitude=108, country='United States'),
-    'KOCW': station(name='Washington, Warren Field Airport', coordinate=(35.57056, -77.04972), altitude=12, country='United States'),
-    'KODO': station(name='ODESSA SCHLEMEYER FIELD', coordinate=(31.91667, -102.4), altitude=915, country='United States'),
-    'KODX': station(name='ORD EVELYN SHARP FLD AIRPORT', coordinate=(41.61667, -98.95), altitude=631, country='United States'),
-    'KOEB': station(name='Coldwater, Branch County Memorial Airport', coordinate=(41.93333, -85.0525), altitude=292, country='United States'),
-    'KOEO': station(name='Osceola, L O Simenstad Municipal Airport', coordinate=(45.30861, -92.69), altitude=275, country='United States'),
-    'KOFF': station(name='Omaha / Offutt Air Force Base', coordinate=(41.11667, -95.9), altitude=319, country='United States'),
-    'KOFK': station(name='KARL STEFAN MEMORIAL AIRPORT', coordinate=(41.98333, -97.43333), altitude=479, country='United States'),
-    'KOFP': station(name='HANOVER COUNTY MUNICIPAL', coordinate=(37.7, -77.43333), altitude=62, country='United States'),
-    'KOGA': station(name='Ogallala, Searle Field Airport', coordinate=(41.11972, -101.76889), altitude=999, country='United States'),
-    'KOGB': station(name='ORANGEBURG MUNICIPAL AIRPORT', coordinate=(33.46667, -80.85), altitude=60, country='United States'),
-    'KOGD': station(name='OGDEN-HINCKLEY AIRPORT', coordinate=(41.2, -112.01667), altitude=1362, country='United States'),
-    'KOGS': station(name='Ogdensburg International', coordinate=(44.68333, -75.46667), altitude=91, country='United States'),
-    'KOHX': station(name='Nashville NEXRAD', coordinate=(36.75, -86.56667), altitude=206, country='United States'),
-    'KOJA': station(name='Weatherford, Thomas P Stafford Airport', coordinate=(35.54472, -98.66833), altitude=489, country='United States'),
-    'KOJC': station(name='OLATHE JOHNSON CO EXECUTIVE', coordinate=(38.83333, -94.73333), altitude=334, country='United States'),
-    'KOKB': station(name='OCEANSIDE', coordinate=(33.21667, -117.35), altitude=9, country='United States'),
-    'KOKC': station(name='WILL ROGERS WORLD AIRPORT', coordinate=(35.38333, -97.6), altitude=395, country='United States'),
-    'KOKH': station(name='Oceanside, Oceanside Municipal Airport', coordinate=(33.21944, -117.34944), altitude=8, country='United States'),
-    'KOKK': station(name='Kokomo, Kokomo Municipal Airport', coordinate=(40.53333, -86.06667), altitude=253, country='United States'),
-    'KOKM': station(name='Okmulgee, Okmulgee Municipal Airport', coordinate=(35.66806, -95.94861), altitude=220, country='United States'),
-    'KOKV': station(name='Winchester Regional', coordinate=(39.15, -78.15), altitude=222, country='United States'),
-    'KOKX': station(name='N. Y. City NEXRAD', coordinate=(40.86667, -72.86667), altitude=60, country='United States'),
-    'KOLD': station(name='Old Town / Dewitt Field', coordinate=(44.95, -68.66667), altitude=39, country='United States'),
-    'KOLE': station(name='Olean Municipal', coordinate=(42.23333, -78.36667), altitude=651, country='United States'),
-    'KOLF': station(name='WOLF POINT CLAYTON AIRPORT', coordinate=(48.1, -105.58333), altitude=605, country='United States'),
-    'KOLM': station(name='OLYMPIA AIRPORT', coordinate=(46.96667, -122.9), altitude=63, country='United States'),
-    'KOLS': station(name='NOGALES INTERNATIONAL AIRPORT', coordinate=(31.41667, -110.85), altitude=1198, country='United States'),
-    'KOLU': station(name='Columbus, Columbus Municipal Airport', coordinate=(41.45, -97.33333), altitude=440, country='United States'),
-    'KOLV': station(name='Olive Branch, Olive Branch Airport', coordinate=(34.97889, -89.78694), altitude=122, country='United States'),
-    'KOLY': station(name='Olney-Noble, Olney-Noble Airport', coordinate=(38.72194, -88.17639), altitude=147, country='United States'),
-    'KOLZ': station(name='Oelwein, Oelwein Municipal Airport', coordinate=(42.68083, -91.97444), altitude=328, country='United States'),
-    'KOMA': station(name='OMAHA EPPLEY AIRFIELD', coordinate=(41.3, -95.9), altitude=300, country='United States'),
-    'KOMH': station(name='Orange, Orange County Airport', coordinate=(38.24722, -78.04556), altitude=142, country='United States'),
-    'KOMK': station(name='OMAK AIRPORT', coordinate=(48.46667, -119.51667), altitude=397, country='United States'),
-    'KOMN': station(name='Ormond Beach, Ormond Beach Municipal Airport', coordinate=(29.30111, -81.11361), altitude=9, country='United States'),
-    'KONA': station(name='Winona, Winona Municipal Airport-Max Conrad Field', coordinate=(44.08333, -91.7), altitude=200, country='United States'),
-    'KONL': station(name="O'Neill / Baker Field", coordinate=(42.46667, -98.68333), altitude=619, country='United States'),
-    'KONM': station(name='Socorro Municipal', coordinate=(34.01667, -106.9), altitude=1478, country='United States'),
-    'KONO': station(name='ONTARIO MUNICIPAL AIRPORT', coordinate=(44.01667, -117.01667), altitude=668, country='United States'),
-    'KONP': station(name='Newport, Newport Municipal Airport', coordinate=(44.58028, -124.05806), altitude=49, country='United States'),
-    'KONT': station(name='ONTARIO INTERNATIONAL  AIRPORT', coordinate=(34.05, -117.58333), altitude=287, country='United States'),
-    'KONX': station(name='Currituck, Currituck County Airport', coordinate=(36.39889, -76.01611), altitude=5, country='United States'),
-    'KONZ': station(name='Detroit/Grosse Ile, Grosse Ile Airport', coordinate=(42.09861, -83.16111), altitude=180, country='United States'),
-    'KOOA': station(name='Oskaloosa, Oskaloosa Municipal Airport', coordinate=(41.22611, -92.49361), altitude=256, country='United States'),
-    'KOPF': station(name='MIAMI OPA LOCKA AIRPORT', coordinate=(25.9, -80.28333), altitude=2, country='United States'),
-    'KOPM': station(name='N. Padre Island', coordinate=(26.83278, -96.94), altitude=None, country='United States'),
-    'KOPN': station(name='Thomaston, Thomaston-Upson County Airport', coordinate=(32.955, -84.26444), altitude=243, country='United States'),
-    'KOQT': station(name='OAK RIDGE', coordinate=(36.01667, -84.23333), altitude=277, country='United States'),
-    'KOQU': station(name='N. Kingston / Quonset', coordinate=(41.6, -71.41667), altitude=6, country='United States'),
-    'KORB': station(name='Orr', coordinate=(48.01667, -92.86667), altitude=397, country='United States'),
-    'KORC': station(name='Orange City', coordinate=(42.98333, -96.06667), altitude=431, country='United States'),
-    'KORD': station(name="CHICAGO O'HARE INTERNATIONAL", coordinate=(41.98333, -87.91667), altitude=204, country='United States'),
-    'KORE': station(name='Orange, Orange Municipal Airport', coordinate=(42.57167, -72.2775), altitude=169, country='United States'),
-    'KORF': station(name='NORFOLK INTERNATIONAL AIRPORT', coordinate=(36.9, -76.2), altitude=8, country='United States'),
-    'KORG': station(name='Orange, Orange County Airport', coordinate=(30.06917, -93.80361), altitude=4, country='United States'),
-    'KORH': station(name='WORCESTER REGIONAL AIRPORT', coordinate=(42.26667, -71.86667), altitude=308, country='United States'),
-    'KORL': station(name='ORLANDO EXECUTIVE AIRPORT', coordinate=(28.55, -81.33333), altitude=34, country='United States'),
-    'KORS': station(name='Eastsound, Orcas Island Airport', coordinate=(48.70806, -122.91028), altitude=9, country='United States'),
-    'KOSA': station(name='Mount Pleasant, Mount Pleasant Regional Airport', coordinate=(33.09528, -94.96139), altitude=111, country='United States'),
-    'KOSC': station(name='Oscoda, Oscoda-Wurtsmith Airport', coordinate=(44.45, -83.36667), altitude=193, country='United States'),
-    'KOSH': station(name='WITTMAN REGIONAL AIRPORT', coordinate=(43.96667, -88.55), altitude=246, country='United States'),
-    'KOSU': station(name='OHIO STATE UNIVERSITY AIRPORT', coordinate=(40.08333, -83.08333), altitude=276, country='United States'),
-    'KOTG': station(name='Worthington, Worthington Municipal Airport', coordinate=(43.65, -95.58333), altitude=480, country='United States'),
-    'KOTH': station(name='North Bend, North Bend Municipal Airport', coordinate=(43.41667, -124.25), altitude=5, country='United States'),
-    'KOTM': station(name='OTTUMWA INDUSTRIAL AIRPORT', coordinate=(41.1, -92.45), altitude=258, country='United States'),
-    'KOUN': station(name='Norman / Max Westheimer', coordinate=(35.21667, -97.45), altitude=357, country='United States'),
-    'KOVE': station(name='OROVILLE MUNICIPAL AIRPORT', coordinate=(39.5, -121.61667), altitude=59, country='United States'),
-    'KOVL': station(name='Olivia, Olivia Regional Airport', coordinate=(44.77861, -95.03278), altitude=328, country='United States'),
-    'KOVS': station(name='BOSCOBEL AIRPORT', coordinate=(43.15, -90.68333), altitude=205, country='United States'),
-    'KOWA': station(name='Owatonna, Owatonna Degner Regional Airport', coordinate=(44.11667, -93.25), altitude=349, country='United States'),
-    'KOWB': station(name='Owensboro, Owensboro-Daviess County Airport', coordinate=(37.74, -87.16667), altitude=124, country='United States'),
-    'KOWD': station(name='NORWOOD MEMORIAL AIRPORT', coordinate=(42.18333, -71.16667), altitude=15, country='United States'),
-    'KOWY': station(name='Owyhee', coordinate=(41.95, -116.1), altitude=1645, country='United States'),
-    'KOXB': station(name='OCEAN CITY MUNICIPAL AIRPORT', coordinate=(38.31667, -75.11667), altitude=4, country='United States'),
-    'KOXC': station(name='Oxford, Waterbury-Oxford Airport', coordinate=(41.48333, -73.13333), altitude=221, country='United States'),
-    'KOXR': station(name='OXNARD AIRPORT', coordinate=(34.2, -119.2), altitude=13, country='United States'),
-    'KOXV': station(name='Knoxville', coordinate=(41.3, -93.11667), altitude=283, country='United States'),
-    'KOZR': station(name='Cairns Army Air Field / Ozark', coordinate=(31.28333, -85.71667), altitude=91, country='United States'),
-    'KOZW': station(name='Howell, Livingston County Airport', coordinate=(42.62944, -83.98417), altitude=293, country='United States'),
-    'KP00': station(name='Tenneco Platform', coordinate=(28.0, -93.0), altitude=15, country='United States'),
-    'KP01': station(name='Ajo Municipal', coordinate=(32.45, -112.86667), altitude=444, country='United States'),
-    'KP06': station(name='Bullhead City', coordinate=(35.16667, -114.56667), altitude=167, country='United States'),
-    'KP07': station(name='Sanderson', coordinate=(30.16667, -102.41667), altitude=865, country='United States'),
-    'KP11': station(name='Devils Lake', coordinate=(48.1, -98.86667), altitude=439, country='United States'),
-    'KP21': station(name='Main Pass B68', coordinate=(29.66667, -88.88333), altitude=1, country='United States'),
-    'KP22': station(name='Vermilion B131', coordinate=(29.06667, -92.18333), altitude=1, country='United States'),
-    'KP24': station(name='Roseglen', coordinate=(47.75, -101.83333), altitude=624, country='United States'),
-    'KP25': station(name='Vermilion B215', coordinate=(28.7, -92.31667), altitude=1, country='United States'),
-    'KP26': station(name='Grand Isle B95', coordinate=(28.5, -90.11667), altitude=1, country='United States'),
-    'KP28': station(name='MEDICINE LODGE', coordinate=(37.28333, -98.55), altitude=469, country='United States'),
-    'KP30': station(name='West Cameron', coordinate=(28.33333, -93.01667), altitude=24, country='United States'),
-    'KP35': station(name='Spickard', coordinate=(40.25, -93.71667), altitude=271, country='United States'),
-    'KP38': station(name='Caliente', coordinate=(37.61222, -114.52639), altitude=1333, country='United States'),
-    'KP39': station(name='Pequot Lake', coordinate=(46.6, -94.31667), altitude=390, country='United States'),
-    'KP43': station(name='Ventura Harbor', coordinate=(34.25, -119.25), altitude=7, country='United States'),
-    'KP44': station(name='Santa Barbara Harbor', coordinate=(34.4, -119.7), altitude=8, country='United States'),
-    'KP47': station(name='Chetco River Coast Guard Station', coordinate=(42.15, -124.26667), altitude=6, country='United States'),
-    'KP53': station(name='MUNISING LAKESHORE', coordinate=(46.41667, -86.65), altitude=187, country='United States'),
-    'KP58': station(name='PORT HOPE', coordinate=(44.01667, -82.8), altitude=180, country='United States'),
-    'KP59': station(name='COPPER HARBOR', coordinate=(47.46667, -87.88333), altitude=191, country='United States'),
-    'KP60': station(name='YELLOWSTONE LAKE', coordinate=(44.55, -110.41667), altitude=2388, country='United States'),
-    'KP61': station(name='Grand Marais', coordinate=(47.74722, -90.34444), altitude=185, country='United States'),
-    'KP65': station(name='Lukeville', coordinate=(31.88333, -112.81667), altitude=511, country='United States'),
-    'KP67': station(name='Lidgerwood Remote Automatic Meteorological Observing System', coordinate=(46.1, -97.15), altitude=351, country='United States'),
-    'KP68': station(name='EUREKA', coordinate=(39.6, -116.0), altitude=1812, country='United States'),
-    'KP69': station(name='Lowell', coordinate=(46.14417, -115.59639), altitude=480, country='United States'),
-    'KP75': station(name='Manistique', coordinate=(45.95, -86.22972), altitude=178, country='United States'),
-    'KP88': station(name='Rome Automatic Meteorological Observing System', coordinate=(42.9, -117.65), altitude=1162, country='United States'),
-    'KP92': station(name='SALT POINT', coordinate=(29.56667, -91.53333), altitude=1, country='United States'),
-    'KPAE': station(name='EVERETT SNOHOMISH COUNTY', coordinate=(47.91667, -122.28333), altitude=185, country='United States'),
-    'KPAH': station(name='BARKLEY REGIONAL AIRPORT', coordinate=(37.05, -88.76667), altitude=125, country='United States'),
-    'KPAM': station(name='Tyndall Air Force Base', coordinate=(30.06667, -85.58333), altitude=5, country='United States'),
-    'KPAO': station(name='Palo Alto Airport', coordinate=(37.46667, -122.11667), altitude=2, country='United States'),
-    'KPAQ': station(name='Palmer, Palmer Municipal Airport', coordinate=(61.59611, -149.09167), altitude=70, country='United States'),
-    'KPAT': station(name='Pathfinder Hill', coordinate=(42.56667, -106.85), altitude=1912, country='United States'),
-    'KPBF': station(name='PINE BLUFF GRIDER FIELD', coordinate=(34.18333, -91.93333), altitude=63, country='United States'),
-    'KPBG': station(name='PLATTSBURGH INTERNATIONAL  AIRPORT', coordinate=(44.65, -73.46667), altitude=73, country='United States'),
-    'KPBH': station(name='Phillips / Price County', coordinate=(45.7, -90.4), altitude=449, country='United States'),
-    'KPBI': station(name='PALM BEACH INTERNATIONAL', coordinate=(26.68333, -80.1), altitude=6, country='United States'),
-    'KPBV': station(name='St. George Island, New St. George Airport', coordinate=(56.57694, -169.66306), altitude=27, country='United States'),
-    'KPBZ': station(name='Pittsburgh Nexrad', coordinate=(40.53333, -80.21667), altitude=386, country='United States'),
-    'KPCM': station(name='Plant City, Plant City Municipal Airport', coordinate=(28.0, -82.15), altitude=47, country='United States'),
-    'KPCU': station(name='Picayune / Pearl River', coordinate=(30.51667, -89.7), altitude=19, country='United States'),
-    'KPCZ': station(name='Waupaca, Waupaca Municipal Airport', coordinate=(44.33361, -89.01528), altitude=252, country='United States'),
-    'KPDC': station(name='Prairie Du Chien, Prairie Du Chien Municipal Airport', coordinate=(43.02194, -91.12472), altitude=201, country='United States'),
-    'KPDK': station(name='ATLANTA DE KALB-PEACHTREE', coordinate=(33.88333, -84.3), altitude=305, country='United States'),
-    'KPDT': station(name='PENDLETON MUNICIPAL AIRPORT', coordinate=(46.16667, -119.38333), altitude=455, country='United States'),
-    'KPDX': station(name='PORTLAND INTERNATIONAL  AIRPORT', coordinate=(45.58333, -122.6), altitude=8, country='United States'),
-    'KPEA': station(name='Pella, Pella Municipal Airport', coordinate=(41.4, -92.93333), altitude=270, country='United States'),
-    'KPEF': station(name='Peterson Air Force Base', coordinate=(38.81667, -104.73333), altitude=1876, country='United States'),
-    'KPEO': station(name='PENN YAN AIRPORT', coordinate=(42.65, -77.05), altitude=298, country='United States'),
-    'KPEQ': station(name='Pecos, Pecos Municipal Airport', coordinate=(31.38222, -103.51056), altitude=796, country='United States'),
-    'KPEX': station(name='Paynesville, Paynesville Municipal Airport', coordinate=(45.37222, -94.74639), altitude=360, country='United States'),
-    'KPFC': station(name='Pacific City State', coordinate=(45.2, -123.96667), altitude=2, country='United States'),
-    'KPFN': station(name='PANAMA CITY-BAY CTY INTERNATIONAL', coordinate=(30.2, -85.68333), altitude=6, country='United States'),
-    'KPGA': station(name='PAGE MUNICIPAL AIRPORT', coordinate=(36.93333, -111.45), altitude=1314, country='United States'),
-    'KPGD': station(name='PUNTA GORDA CHARLOTTE COUNTY', coordinate=(26.91667, -82.0), altitude=7, country='United States'),
-    'KPGL': station(name='Pascagoula / Jackson', coordinate=(30.4, -88.48333), altitude=3, country='United States'),
-    'KPGV': station(name='Pitt-Greenville Airport', coordinate=(35.63333, -77.4), altitude=8, country='United States'),
-    'KPHD': station(name='NEW PHILADELPHIA CLEVER FLD', coordinate=(40.46667, -81.41667), altitude=273, country='United States'),
-    'KPHF': station(name='WILLIAMSBURG INTERNATIONAL  AIRPORT', coordinate=(37.13333, -76.5), altitude=13, country='United States'),
-    'KPHL': station(name='PHILADELPHIA INTERNATIONAL  AIRPT', coordinate=(39.86667, -75.23333), altitude=6, country='United States'),
-    'KPHN': station(name='St. Clair County International', coordinate=(42.91667, -82.53333), altitude=198, country='United States'),
-    'KPHP': station(name='PHILIP AIRPORT', coordinate=(44.05, -101.6), altitude=673, country='United States'),
-    'KPHX': station(name='Phoenix, Phoenix Sky Harbor International Airport', coordinate=(33.43417, -112.05111), altitude=345, country='United States'),
-    'KPIA': station(name='GREATER PEORIA REGIONAL AIRPORT', coordinate=(40.66667, -89.68333), altitude=201, country='United States'),
-    'KPIB': station(name='Hattiesburg/Laurel, Hattiesburg-Laurel Regional Airport', coordinate=(31.46667, -89.33333), altitude=91, country='United States'),
-    'KPIE': station(name='ST PETERSBURG/CLEARWATER', coordinate=(27.91667, -82.68333), altitude=3, country='United States'),
-    'KPIH': station(name='POCATELLO REGIONAL AIRPORT', coordinate=(42.91667, -112.6), altitude=1356, country='United States'),
-    'KPIL': station(name='PORT ISABEL CAMERON', coordinate=(26.16667, -97.33333), altitude=6, country='United States'),
-    'KPIN': station(name='Piney Creek', coordinate=(44.56667, -106.81667), altitude=1392, country='United States'),
-    'KPIR': station(name='PIERRE REGIONAL AIRPORT', coordinate=(44.38333, -100.28333), altitude=531, country='United States'),
-    'KPIT': station(name='GREATER PITTSBURGH INTERNATIONAL', coordinate=(40.48333, -80.23333), altitude=367, country='United States'),
-    'KPJB': station(name='Payson', coordinate=(34.26667, -111.35), altitude=1571, country='United States'),
-    'KPJI': station(name='Point Judith Coast Guard Station', coordinate=(41.35, -71.46667), altitude=2, country='United States'),
-    'KPKB': station(name='MID-OHIO VALLEY RGNL AIRPORT', coordinate=(39.33333, -81.45), altitude=262, country='United States'),
-    'KPKD': station(name='PARK RAPIDS MUNICIPAL AIRPORT', coordinate=(46.9, -95.06667), altitude=440, country='United States'),
-    'KPKF': station(name='Park Falls', coordinate=(45.93333, -90.45), altitude=462, country='United States'),
-    'KPKV': station(name='Port Lavaca, Calhoun County Airport', coordinate=(28.65389, -96.68111), altitude=9, country='United States'),
-    'KPLB': station(name='PLATTSBURGH CLINTON CO AIRPORT', coordinate=(44.68333, -73.53333), altitude=113, country='United States'),
-    'KPLN': station(name='PELLSTON REGIONAL AIRPORT', coordinate=(45.56667, -84.8), altitude=219, country='United States'),
-    'KPMD': station(name='PALMDALE PROD FLIGHT PLANT', coordinate=(34.63333, -118.08333), altitude=775, country='United States'),
-    'KPMP': station(name='POMPANO BEACH AIRPARK', coordinate=(26.25, -80.11667), altitude=6, country='United States'),
-    'KPMV': station(name='Plattsmouth, Plattsmouth Municipal Airport', coordinate=(40.95, -95.91778), altitude=366, country='United States'),
-    'KPNA': station(name='Pinedale, Ralph Wenz Field Airport', coordinate=(42.79528, -109.80694), altitude=2160, country='United States'),
-    'KPNC': station(name='PONCA CITY MUNICIPAL AIRPORT', coordinate=(36.73333, -97.1), altitude=307, country='United States'),
-    'KPNE': station(name='N.E. PHILADELPHIA AIRPORT', coordinate=(40.08333, -75.01667), altitude=37, country='United States'),
-    'KPNM': station(name='Princeton', coordinate=(45.55, -93.6), altitude=298, country='United States'),
-    'KPNS': station(name='PENSACOLA REGIONAL AIRPORT', coordinate=(30.48333, -87.18333), altitude=37, country='United States'),
-    'KPNT': station(name='Pontiac, Pontiac Municipal Airport', coordinate=(40.92361, -88.62528), altitude=201, country='United States'),
-    'KPOB': station(name='Pope Air Force Base', coordinate=(35.16667, -79.03333), altitude=61, country='United States'),
-    'KPOC': station(name='La Verne / Brackett', coordinate=(34.1, -117.78333), altitude=308, country='United States'),
-    'KPOE': station(name='Fort Polk, Polk AAF Ft Polk', coordinate=(31.05, -93.19389), altitude=101, country='United States'),
-    'KPOF': station(name='POPLAR BLUFF MUN AIRPORT', coordinate=(36.76667, -90.31667), altitude=101, country='United States'),
-    'KPOU': station(name='POUGHKEEPSIE DUTCHESS CTY', coordinate=(41.63333, -73.88333), altitude=51, country='United States'),
-    'KPPA': station(name='Pampa, Perry Lefors Field Airport', coordinate=(35.61278, -100.99611), altitude=989, country='United States'),
-    'KPPF': station(name='PARSONS TRI-CITY AIRPORT', coordinate=(37.33333, -95.5), altitude=274, country='United States'),
-    'KPPQ': station(name='Pittsfield, Pittsfield Penstone Municipal Airport', coordinate=(39.63889, -90.77833), altitude=216, country='United States'),
-    'KPQI': station(name='Presque Isle', coordinate=(46.68333, -68.05), altitude=163, country='United States'),
-    'KPQL': station(name='PASCAGOULA LOTT INTERNATIONAL  AIRPORT', coordinate=(30.46667, -88.53333), altitude=5, country='United States'),
-    'KPQN': station(name='Pipestone, Pipestone Municipal Airport', coordinate=(43.98333, -96.31667), altitude=529, country='United States'),
-    'KPRB': station(name='PASO ROBLES AIRPORT', coordinate=(35.66667, -120.63333), altitude=255, country='United States'),
-    'KPRC': station(name='PRESCOTT LOVE FIELD', coordinate=(34.65, -112.41667), altitude=1537, country='United States'),
-    'KPRG': station(name='Paris, Edgar County Airport', coordinate=(39.70028, -87.66972), altitude=199, country='United States'),
-    'KPRN': station(name='GREENVILLE AIRPORT', coordinate=(31.78333, -85.95), altitude=137, country='UNITED STATES'),
-    'KPRX': station(name='Paris / Cox Field', coordinate=(33.63333, -95.45), altitude=167, country='United States'),
-    'KPSC': station(name='TRI-CITIES AIRPORT', coordinate=(46.26667, -119.11667), altitude=124, country='United States'),
-    'KPSF': station(name='PITTSFIELD MUNICIPAL AIRPORT', coordinate=(42.43333, -73.28333), altitude=364, country='United States'),
-    'KPSK': station(name='Dublin / New River Valley', coordinate=(37.13333, -80.68333), altitude=642, country='United States'),
-    'KPSM': station(name='Pease Air Force Base / Portsmouth', coordinate=(43.08333, -70.81667), altitude=31, country='United States'),
-    'KPSN': station(name='Palestine, Palestine Municipal Airport', coordinate=(31.77944, -95.70611), altitude=129, country='United States'),
-    'KPSP': station(name='PALM SPRINGS REGIONAL AIRPORT', coordinate=(33.83333, -116.5), altitude=141, country='United States'),
-    'KPSX': station(name='PALACIOS MUNICIPAL AIRPORT', coordinate=(28.71667, -96.25), altitude=5, country='United States'),
-    'KPTB': station(name='Petersburg, Dinwiddie County Airport', coordinate=(37.18333, -77.51667), altitude=59, country='United States'),
-    'KPTK': station(name='OAKLAND COUNTY INTERNATIONAL', coordinate=(42.66667, -83.41667), altitude=299, country='United States'),
-    'KPTN': station(name='Patterson Memorial', coordinate=(29.71667, -91.33333), altitude=3, country='United States'),
-    'KPTT': station(name='Pratt Municipal', coordinate=(37.7, -98.75), altitude=595, country='United States'),
-    'KPTV': station(name='Porterville, Porterville Municipal Airport', coordinate=(36.03333, -119.06667), altitude=135, country='United States'),
-    'KPTW': station(name='POTTSTOWN LIMERICK AIRPORT', coordinate=(40.23333, -75.55), altitude=89, country='United States'),
-    'KPUB': station(name='PUEBLO MEMORIAL AIRPORT', coordinate=(38.28333, -104.5), altitude=1440, country='United States'),
-    'KPUC': station(name='PRICE CARBON COUNTY AIRPORT', coordinate=(39.61667, -110.75), altitude=1814, country='United States'),
-    'KPUM': station(name='Pumpkin Vine', coordinate=(41.05, -105.46667), altitude=2420, country='United States'),
-    'KPUW': station(name='PULLMAN/MOSCOW RGNL AIRPORT', coordinate=(46.75, -117.11667), altitude=778, country='United States'),
-    'KPUX': station(name='Pueblo NEXRAD', coordinate=(38.46667, -104.18333), altitude=1620, country='United States'),
-    'KPVC': station(name='Provincetown, Provincetown Municipal Airport', coordinate=(42.06667, -70.21667), altitude=2, country='United States'),
-    'KPVD': station(name='PROVIDENCE GREEN STATE AIRPORT', coordinate=(41.73333, -71.43333), altitude=17, country='United States'),
-    'KPVJ': station(name='Pauls Valley, Pauls Valley Municipal Airport', coordinate=(34.71111, -97.22333), altitude=295, country='United States'),
-    'KPVU': station(name='Provo, Provo Municipal Airport', coordinate=(40.21667, -111.71667), altitude=1371, country='United States'),
-    'KPVW': station(name='Plainview, Hale County Airport', coordinate=(34.16806, -101.71722), altitude=1028, country='United States'),
-    'KPWA': station(name='WILEY POST', coordinate=(35.53333, -97.65), altitude=396, country='United States'),
-    'KPWC': station(name='Pine River, Pine River Regional Airport', coordinate=(46.725, -94.38361), altitude=395, country='United States'),
-    'KPWG': station(name='Waco, Mc Gregor Executive Airport', coordinate=(31.48333, -97.31667), altitude=180, country='United States'),
-    'KPWK': station(name='CHICAGO EXECUTIVE AIRPORT', coordinate=(42.11667, -87.9), altitude=197, country='United States'),
-    'KPWM': station(name='PORTLAND INTERNATIONAL  JETPORT', coordinate=(43.65, -70.3), altitude=23, country='United States'),
-    'KPWT': station(name='Bremerton, Bremerton National Airport', coordinate=(47.5, -122.75), altitude=134, country='United States'),
-    'KPYM': station(name='PLYMOUTH MUNICIPAL AIRPORT', coordinate=(41.9, -70.73333), altitude=45, country='United States'),
-    'KPYX': station(name='Perryton, Perryton Ochiltree County Airport', coordinate=(36.4, -100.73333), altitude=890, country='United States'),
-    'KPZQ': station(name='Rogers City, Presque Isle County Airport', coordinate=(45.40694, -83.81278), altitude=204, country='United States'),
-    'KQCA': station(name='Granite Peak', coordinate=(40.16667, -113.35), altitude=1310, country='United States'),
-    'KQCB': station(name='Little Mountain', coordinate=(41.25, -112.25), altitude=1326, country='United States'),
-    'KQCJ': station(name='Eagle Range', coordinate=(41.05, -113.08333), altitude=1294, country='United States'),
-    'KQHA': station(name='FOB Mandrian', coordinate=(19.66667, -73.03333), altitude=17, country='Haiti'),
-    'KQIR': station(name='Al Udeid', coordinate=(25.11667, 51.3), altitude=42, country='Qatar'),
-    'KQTA': station(name='ATSUGI, JAPAN NAVAL AIR', coordinate=(35.45, 139.45), altitude=62, country='JAPAN'),
-    'KQUK': station(name='Camp Bondsteel', coordinate=(42.58333, 21.38333), altitude=592, country='Serbia and Montenegro'),
-    'KRAC': station(name='BATTEN INTERNATIONAL AIRPORT', coordinate=(42.76667, -87.81667), altitude=205, country='United States'),
-    'KRAD': station(name='Warroad Automatic Weather Observing / Reporting System', coordinate=(48.93333, -95.33333), altitude=328, country='United States'),
-    'KRAL': station(name='RIVERSIDE MUNICIPAL AIRPORT', coordinate=(33.95, -117.45), altitude=249, country='United States'),
-    'KRAP': station(name='RAPID CITY REGIONAL AIRPORT', coordinate=(44.05, -103.05), altitude=976, country='United States'),
-    'KRAS': station(name='Port Aransas, Mustang Beach Airport', coordinate=(27.81167, -97.08861), altitude=2, country='United States'),
-    'KRAX': station(name='Raleigh NEXRAD', coordinate=(35.66667, -78.5), altitude=141, country='United States'),
-    'KRBD': station(name='DALLAS EXECUTIVE AIRPORT', coordinate=(32.68333, -96.86667), altitude=201, country='United States'),
-    'KRBG': station(name='ROSEBURG REGIONAL AIRPORT', coordinate=(43.23333, -123.35), altitude=160, country='United States'),
-    'KRBL': station(name='RED BLUFF MUNICIPAL AIRPORT', coordinate=(40.15, -122.25), altitude=106, country='United States'),
-    'KRBO': station(name='Robstown, Nueces County Airport', coordinate=(27.77833, -97.69028), altitude=24, country='United States'),
-    'KRCA': station(name='Ellsworth Air Force Base', coordinate=(44.15, -103.1), altitude=999, country='United States'),
-    'KRCX': station(name='Ladysmith, Ruck County Airport', coordinate=(45.49667, -91.00028), altitude=377, country='United States'),
-    'KRDD': station(name='REDDING MUNICIPAL AIRPORT', coordinate=(40.5, -122.28333), altitude=153, country='United States'),
-    'KRDG': station(name='READING REGIONAL AIRPORT', coordinate=(40.36667, -75.96667), altitude=105, country='United States'),
-    'KRDK': station(name='Red Oak', coordinate=(41.01667, -95.26667), altitude=318, country='United States'),
-    'KRDM': station(name='REDMOND ROBERTS FIELD', coordinate=(44.25, -121.13333), altitude=938, country='United States'),
-    'KRDR': station(name='Grand Forks Air Force Base', coordinate=(47.96667, -97.4), altitude=278, country='United States'),
-    'KRDU': station(name='RALEIGH-DURHAM INTERNATIONAL  AIRPORT', coordinate=(35.9, -78.76667), altitude=133, country='United States'),
-    'KRED': station(name='Red Lodge', coordinate=(45.18333, -109.26667), altitude=1757, country='United States'),
-    'KREE': station(name='Reese Air Force Base / Lubbock', coordinate=(33.6, -102.05), altitude=1017, country='United States'),
-    'KREO': station(name='ROME', coordinate=(42.58333, -117.86667), altitude=1234, country='United States'),
-    'KRFD': station(name='GREATER ROCKFORD AIRPORT', coordinate=(42.2, -89.1), altitude=224, country='United States'),
-    'KRGK': station(name='Red Wing, Red Wing Municipal Airport', coordinate=(44.59028, -92.48611), altitude=239, country='United States'),
-    'KRGX': station(name='Reno NEXRAD', coordinate=(39.75, -119.46667), altitude=2560, country='United States'),
-    'KRHI': station(name='RHINELANDER-ONEIDA CO AIRPORT', coordinate=(45.63333, -89.48333), altitude=495, country='United States'),
-    'KRHP': station(name='Andrews, Andrews-Murphy Airport', coordinate=(35.195, -83.86361), altitude=517, country='United States'),
-    'KRHV': station(name='San Jose / Reid / Hillv', coordinate=(37.33333, -121.81667), altitude=41, country='United States'),
-    'KRIC': station(name='RICHMOND INTERNATIONAL  AIRPORT', coordinate=(37.51667, -77.31667), altitude=51, country='United States'),
-    'KRIE': station(name='Rice Lake Municipal', coordinate=(45.48333, -91.71667), altitude=347, country='United States'),
-    'KRIL': station(name='RIFLE GARFIELD COUNTY RGNL', coordinate=(39.51667, -107.73333), altitude=1690, country='United States'),
-    'KRIV': station(name='Riverside / March Air Force Base', coordinate=(33.9, -117.25), altitude=469, country='United States'),
-    'KRIW': station(name='RIVERTON REGIONAL AIRPORT', coordinate=(43.06667, -108.45), altitude=1684, country='United States'),
-    'KRJO': station(name='San Marcos Automatic Weather Observing / Reporting System', coordinate=(29.9, -97.86667), altitude=182, country='United States'),
-    'KRKD': station(name='Rockland, Knox County Regional Airport', coordinate=(44.06667, -69.1), altitude=17, country='United States'),
-    'KRKP': station(name='ROCKPORT ARANSAS COUNTY AIRPORT', coordinate=(28.08333, -97.05), altitude=7, country='United States'),
-    'KRKR': station(name='Poteau, Robert S Kerr Airport', coordinate=(35.02167, -94.62139), altitude=138, country='United States'),
-    'KRKS': station(name='ROCK SPRINGS-SWEETWATER CO', coordinate=(41.6, -109.05), altitude=2060, country='United States'),
-    'KRLX': station(name='Charleston', coordinate=(38.31667, -81.71667), altitude=364, country='United States'),
-    'KRME': station(name='GRIFFISS AIRFIELD', coordinate=(43.23333, -75.4), altitude=154, country='United States'),
-    'KRMG': station(name='ROME R. B. RUSSELL AIRPORT', coordinate=(34.35, -85.16667), altitude=195, country='United States'),
-    'KRMN': station(name='Stafford, Stafford Regional Airport', coordinate=(38.39806, -77.45528), altitude=65, country='United States'),
-    'KRMY': station(name='Marshall, Brooks Field Airport', coordinate=(42.25111, -84.95556), altitude=287, country='United States'),
-    'KRND': station(name='Randolph Air Force Base', coordinate=(29.53333, -98.28333), altitude=232, country='United States'),
-    'KRNH': station(name='New Richmond, New Richmond Municipal Airport', coordinate=(45.14833, -92.53806), altitude=304, country='United States'),
-    'KRNM': station(name='RAMONA AIRPORT', coordinate=(33.03333, -116.91667), altitude=425, country='United States'),
-    'KRNO': station(name='RENO/TAHOE INTERNATIONAL  AIRPORT', coordinate=(39.48333, -119.76667), altitude=1345, country='United States'),
-    'KRNP': station(name='Owosso, Owosso Community Airport', coordinate=(42.99278, -84.13889), altitude=224, country='United States'),
-    'KRNT': station(name='RENTON MUNICIPAL AIRPORT', coordinate=(47.5, -122.21667), altitude=9, country='United States'),
-    'KROA': station(name='ROANOKE REGIONAL AIRPORT', coordinate=(37.31667, -79.96667), altitude=358, country='United States'),
-    'KROC': station(name='GREATER ROCHESTER INTERNATIONAL', coordinate=(43.11667, -77.68333), altitude=170, country='United States'),
-    'KROG': station(name='Rogers, Rogers Municipal Airport-Carter Field', coordinate=(36.36667, -94.1), altitude=414, country='United States'),
-    'KROS': station(name='Rush City, Rush City Regional Airport', coordinate=(45.69806, -92.95306), altitude=281, country='United States'),
-    'KROW': station(name='ROSWELL INDUSTRIAL AIR CENTR', coordinate=(33.3, -104.53333), altitude=1118, country='United States'),
-    'KROX': station(name='Roseau, Roseau Municipal Airport/Rudy Billberg Field', coordinate=(48.85, -95.7), altitude=323, country='United States'),
-    'KRPD': station(name="Rice Lake, Rice Lake Regional-Carl's Field Airport", coordinate=(45.41806, -91.77361), altitude=337, country='United States'),
-    'KRPE': station(name='Sabine Pass', coordinate=(29.7, -93.95), altitude=3, country='United States'),
-    'KRPH': station(name='Graham, Graham Municipal Airport', coordinate=(33.11, -98.55528), altitude=342, country='United States'),
-    'KRPJ': station(name='Rochelle, Rochelle Municipal-Koritz Field Airport', coordinate=(41.89306, -89.07833), altitude=238, country='United States'),
-    'KRQB': station(name='Big Rapids, Roben-Hood Airport', coordinate=(43.7225, -85.50417), altitude=302, country='United States'),
-    'KRQE': station(name='WINDOW ROCK AIRPORT', coordinate=(35.65, -109.06667), altitude=2054, country='United States'),
-    'KRQO': station(name='El Reno, El Reno Regional Airport', coordinate=(35.4725, -98.00556), altitude=432, country='United States'),
-    'KRRF': station(name='New Port Richey, Tampa Bay Executive Airport', coordinate=(28.18917, -82.62583), altitude=12, country='United States'),
-    'KRRL': station(name='Merrill, Merrill Municipal Airport', coordinate=(45.18333, -89.7), altitude=401, country='United States'),
-    'KRRT': station(name='Warroad, Warroad International Airport-Swede Carlston Field', coordinate=(48.94139, -95.34833), altitude=327, country='United States'),
-    'KRSL': station(name='RUSSELL MUNICIPAL AIRPORT', coordinate=(38.86667, -98.81667), altitude=568, country='United States'),
-    'KRSN': station(name='Ruston, Ruston Regional Airport', coordinate=(32.51444, -92.58833), altitude=95, country='United States'),
-    'KRST': station(name='ROCHESTER INTERNATIONAL AIRPORT', coordinate=(43.9, -92.5), altitude=401, country='United States'),
-    'KRSV': station(name='Robinson, Robinson Municipal Airport', coordinate=(39.01583, -87.64972), altitude=141, country='United States'),
-    'KRSW': station(name='FORT MYERS SW FL INTERNATIONAL  AIRPORT', coordinate=(26.53333, -81.76667), altitude=9, country='United States'),
-    'KRTN': station(name='Raton, Raton Municipal \\ Crews Field Airport', coordinate=(36.74194, -104.65778), altitude=1935, country='United States'),
-    'KRTX': station(name='Portland NEXRAD', coordinate=(45.71667, -122.96667), altitude=514, country='United States'),
-    'KRUE': station(name='RUSSELVILLE MUNICIPAL AIRPORT', coordinate=(35.25, -93.1), altitude=123, country='United States'),
-    'KRUG': station(name='Rugby Municipal Airport', coordinate=(48.39056, -100.02444), altitude=472, country='United States'),
-    'KRUM': station(name='Rumford', coordinate=(44.53333, -70.53333), altitude=192, country='United States'),
-    'KRUQ': station(name='Salisbury, Rowan County Airport', coordinate=(35.65, -80.51667), altitude=236, country='United States'),
-    'KRUT': station(name='Rutland, Rutland-Southern Vermont Regional Airport', coordinate=(43.53333, -72.95), altitude=240, country='United States'),
-    'KRVL': station(name='Reedsville / Mifflin', coordinate=(40.68333, -77.63333), altitude=250, country='United States'),
-    'KRVS': station(name='TULSA JONES JR. AIRPORT', coordinate=(36.05, -95.98333), altitude=194, country='United States'),
-    'KRWF': station(name='REDWOOD FALLS MUNICIPAL', coordinate=(44.55, -95.08333), altitude=312, country='United States'),
-    'KRWI': station(name='ROCKY MOUNT-WILSON AIRPORT', coordinate=(35.85, -77.9), altitude=49, country='United States'),
-    'KRWL': station(name='RAWLINS MUNICIPAL AIRPORT', coordinate=(41.8, -107.2), altitude=2077, country='United States'),
-    'KRWV': station(name='Caldwell, Caldwell Municipal Airport', coordinate=(30.51528, -96.70389), altitude=119, country='United States'),
-    'KRXE': station(name='REXBURG-MADISON COUNTY AIRPORT', coordinate=(43.83333, -111.8), altitude=1481, country='United States'),
-    'KRYV': station(name='Watertown', coordinate=(43.16667, -88.71667), altitude=254, country='United States'),
-    'KRYY': station(name='Marietta, Cobb County-McCollum Field Airport', coordinate=(34.01306, -84.59861), altitude=317, country='United States'),
-    'KRZN': station(name='Siren, Burnett County Airport', coordinate=(45.82278, -92.3725), altitude=301, country='United States'),
-    'KRZZ': station(name='HALIFAX COUNTY AIRPORT', coordinate=(36.43333, -77.71667), altitude=78, country='United States'),
-    'KS02': station(name='Ship Shoal B224a', coordinate=(28.5, -91.3), altitude=32, country='United States'),
-    'KS06': station(name='Mullan Aviation Weather Reporting Station', coordinate=(47.46667, -115.8), altitude=1011, country='United States'),
-    'KS14': station(name='Spencer', coordinate=(44.35, -112.18333), altitude=1793, country='United States'),
-    'KS21': station(name='Sunriver', coordinate=(43.88333, -121.45), altitude=1266, country='United States'),
-    'KS25': station(name='Watford City Municipal Airport', coordinate=(47.79667, -103.25528), altitude=643, country='United States'),
-    'KS29': station(name='Salida', coordinate=(38.51667, -106.01667), altitude=2186, country='United States'),
-    'KS32': station(name='Rands Airport', coordinate=(47.42278, -98.10583), altitude=434, country='United States'),
-    'KS38': station(name='Burrows Island', coordinate=(48.08333, -122.1), altitude=18, country='United States'),
-    'KS47': station(name='Tillamook, Tillamook Airport', coordinate=(45.41806, -123.81444), altitude=11, country='United States'),
-    'KS53': station(name='Destruction Island', coordinate=(47.66667, -124.48333), altitude=24, country='United States'),
-    'KS58': station(name='South Timbalier', coordinate=(28.53333, -90.58333), altitude=1, country='United States'),
-    'KS65': station(name='Ship Shoal 198g', coordinate=(28.5, -91.2), altitude=2, country='United States'),
-    'KS80': station(name='Grangeville', coordinate=(45.95, -116.13333), altitude=1009, country='United States'),
-    'KS88': station(name='Skykomish, Skykomish State Airport', coordinate=(47.7, -121.33333), altitude=304, country='United States'),
-    'KSAC': station(name='SACRAMENTO EXECUTIVE AIRPORT', coordinate=(38.5, -121.5), altitude=6, country='United States'),
-    'KSAD': station(name='SAFFORD MUNICIPAL AIRPORT', coordinate=(32.85, -109.63333), altitude=968, country='United States'),
-    'KSAF': station(name='SANTA FE COUNTY MUNICIPAL', coordinate=(35.61667, -106.08333), altitude=1934, country='United States'),
-    'KSAN': station(name='SAN DIEGO INTERNATIONAL \\LINDBERGH FLD', coordinate=(32.73333, -117.18333), altitude=5, country='United States'),
-    'KSAR': station(name='Sparta, Sparta Community-Hunter Field Airport', coordinate=(38.14889, -89.69861), altitude=164, country='United States'),
-    'KSAT': station(name='SAN ANTONIO INTERNATIONAL  AIRPORT', coordinate=(29.53333, -98.46667), altitude=247, country='United States'),
-    'KSAV': station(name='SAVANNAH INTERNATIONAL AIRPORT', coordinate=(32.11667, -81.2), altitude=16, country='United States'),
-    'KSAW': station(name='Marquette, Sawyer International Airport', coordinate=(46.35361, -87.39528), altitude=372, country='United States'),
-    'KSAZ': station(name='Staples, Staples Municipal Airport', coordinate=(46.38083, -94.80667), altitude=392, country='United States'),
-    'KSBA': station(name='SANTA BARBARA MUNICIPAL', coordinate=(34.43333, -119.85), altitude=3, country='United States'),
-    'KSBD': station(name='Norton Air Force Base / San Bern', coordinate=(34.1, -117.23333), altitude=353, country='United States'),
-    'KSBM': station(name='SHEBOYGAN CO MEMORIAL AIRPORT', coordinate=(43.78333, -87.85), altitude=228, country='United States'),
-    'KSBN': station(name='SOUTH BEND REGIONAL AIRPORT', coordinate=(41.7, -86.31667), altitude=244, country='United States'),
-    'KSBP': station(name='SAN LUIS OBISPO MC CHESNEY', coordinate=(35.23333, -120.63333), altitude=64, country='United States'),
-    'KSBS': station(name='Steamboat Springs', coordinate=(40.51667, -106.86667), altitude=2096, country='United States'),
-    'KSBY': station(name='SALISBURY-WICOMICO CTY REG', coordinate=(38.33333, -75.5), altitude=16, country='United States'),
-    'KSCC': station(name='Deadhorse, Deadhorse Airport', coordinate=(70.19167, -148.47722), altitude=17, country='United States'),
-    'KSCF': station(name='South Marsh 268', coordinate=(29.11583, -91.87111), altitude=None, country='United States'),
-    'KSCH': station(name='Schenectady Airport', coordinate=(42.85, -73.93333), altitude=115, country='United States'),
-    'KSCK': station(name='STOCKTON METROPOLITAN AIRPORT', coordinate=(37.9, -121.23333), altitude=9, country='United States'),
-    'KSDA': station(name='Shenandoah Municipal', coordinate=(40.75, -95.41667), altitude=296, country='United States'),
-    'KSDB': station(name='SANDBERG', coordinate=(34.75, -118.71667), altitude=1379, country='United States'),
-    'KSDF': station(name='STANDIFORD FIELD', coordinate=(38.18333, -85.73333), altitude=151, country='United States'),
-    'KSDL': station(name='SCOTTSDALE AIRPORT', coordinate=(33.61667, -111.91667), altitude=460, country='United States'),
-    'KSDM': station(name='San Diego, Brown Field Municipal Airport', coordinate=(32.57528, -116.99306), altitude=164, country='United States'),
-    'KSDY': station(name='Sidney-Richland', coordinate=(47.7, -104.2), altitude=605, country='United States'),
-    'KSEA': station(name='SEATTLE-TACOMA INTERNATIONAL  AIRPORT', coordinate=(47.45, -122.31667), altitude=131, country='United States'),
-    'KSEE': station(name='San Diego/El Cajon, Gillespie Field Airport', coordinate=(32.82611, -116.97222), altitude=118, country='United States'),
-    'KSEG': station(name='SELINSGROVE PENN VALLEY AIRPORT', coordinate=(40.81667, -76.86667), altitude=137, country='United States'),
-    'KSEM': station(name='Craig Field / Selma', coordinate=(32.35, -86.98333), altitude=51, country='United States'),
-    'KSEP': station(name='Stephenville, Clark Field Municipal Airport', coordinate=(32.21667, -98.18333), altitude=403, country='United States'),
-    'KSET': station(name='ST. CHARLES CO SMARTT AIRPORT', coordinate=(38.93333, -90.43333), altitude=133, country='United States'),
-    'KSEZ': station(name='Sedona Airport', coordinate=(34.85, -111.78333), altitude=1471, country='United States'),
-    'KSFB': station(name='ORLANDO SANFORD AIRPORT', coordinate=(28.78333, -81.25), altitude=17, country='United States'),
-    'KSFD': station(name='Winner, Bob Wiley Field Airport', coordinate=(43.39056, -99.8425), altitude=619, country='United States'),
-    'KSFF': station(name='FELTS FIELD', coordinate=(47.68333, -117.31667), altitude=595, country='United States'),
-    'KSFM': station(name='Sanford, Sanford Regional Airport', coordinate=(43.4, -70.71667), altitude=74, country='United States'),
-    'KSFO': station(name='SAN FRANCISCO INTERNATIONAL  AIRPORT', coordinate=(37.61667, -122.36667), altitude=3, country='United States'),
-    'KSFQ': station(name='Suffolk, Suffolk Municipal Airport', coordinate=(36.68222, -76.60194), altitude=22, country='United States'),
-    'KSFY': station(name='Savanna, Tri-Township Airport', coordinate=(42.04583, -90.10778), altitude=188, country='United States'),
-    'KSFZ': station(name='Pawtucket, North Central State Airport', coordinate=(41.91667, -71.5), altitude=134, country='United States'),
-    'KSGF': station(name='SPRINGFIELD-BRANSON NATIONAL', coordinate=(37.23333, -93.38333), altitude=386, country='United States'),
-    'KSGH': station(name='Springfield, Springfield-Beckley Municipal Airport', coordinate=(39.84028, -83.84), altitude=320, country='United States'),
-    'KSGJ': station(name='St. Augustine, St. Augustine Airport', coordinate=(29.95917, -81.33972), altitude=3, country='United States'),
-    'KSGR': station(name='SUGARLAND REGIONAL AIRPORT', coordinate=(29.61667, -95.65), altitude=25, country='United States'),
-    'KSGS': station(name='South St. Paul, South St. Paul Municipal-Richard E. Fleming Field Airport', coordinate=(44.85722, -93.03278), altitude=250, country='United States'),
-    'KSGT': station(name='Stuttgart, Stuttgart Municipal Airport', coordinate=(34.6, -91.56667), altitude=68, country='United States'),
-    'KSGU': station(name='St George, St George Municipal Airport', coordinate=(37.08333, -113.6), altitude=896, country='United States'),
-    'KSHD': station(name='Staunton / Shenandoah', coordinate=(38.26667, -78.9), altitude=366, country='United States'),
-    'KSHI': station(name='Ashtabula, Ashtabula County Airport', coordinate=(41.77944, -80.69667), altitude=281, country='United States'),
-    'KSHL': station(name='Sheldon', coordinate=(43.21667, -95.83333), altitude=432, country='United States'),
-    'KSHN': station(name='SHELTON SANDERSON FIELD', coordinate=(47.23333, -123.13333), altitude=82, country='United States'),
-    'KSHP': station(name='Sheppard Air Force Base', coordinate=(33.96667, -98.48333), altitude=314, country='United States'),
-    'KSHR': station(name='SHERIDAN COUNTY AIRPORT', coordinate=(44.76667, -106.96667), altitude=1226, country='United States'),
-    'KSHV': station(name='SHREVEPORT REGIONAL AIRPORT', coordinate=(32.45, -93.83333), altitude=79, country='United States'),
-    'KSIB': station(name='Sibley Peak', coordinate=(42.45, -105.03333), altitude=1500, country='United States'),
-    'KSIL': station(name='Slidell Radar Site', coordinate=(30.25, -89.76667), altitude=3, country='United States'),
-    'KSIY': station(name='MONTAGUE SISKIYOU COUNTY', coordinate=(41.76667, -122.46667), altitude=807, country='United States'),
-    'KSJC': station(name='SAN JOSE INTERNATIONAL  AIRPORT', coordinate=(37.36667, -121.91667), altitude=19, country='United States'),
-    'KSJN': station(name='ST JOHNS INDUSTRIAL AIRPRK', coordinate=(34.51667, -109.38333), altitude=1747, country='United States'),
-    'KSJT': station(name='MATHIS FIELD', coordinate=(31.35, -100.5), altitude=584, country='United States'),
-    'KSJX': station(name='Beaver Island, Beaver Island Airport', coordinate=(45.69222, -85.56639), altitude=204, country='United States'),
-    'KSKA': station(name='Fairchild Air Force Base', coordinate=(47.61667, -117.65), altitude=750, country='United States'),
-    'KSKC': station(name='Waukesha', coordinate=(43.03333, -88.23333), altitude=284, country='United States'),
-    'KSKF': station(name='Kelly Air Force Base', coordinate=(29.38333, -98.58333), altitude=210, country='United States'),
-    'KSKX': station(name='Taos, Taos Regional Airport', coordinate=(36.45, -105.66667), altitude=2161, country='United States'),
-    'KSLB': station(name='Storm Lake', coordinate=(42.6, -95.23333), altitude=454, country='United States'),
-    'KSLC': station(name='SALT LAKE CITY INTERNATIONAL  AIRPORT', coordinate=(40.78333, -111.96667), altitude=1288, country='United States'),
-    'KSLE': station(name='SALEM MCNARY FIELD', coordinate=(44.9, -123.0), altitude=64, country='United States'),
-    'KSLG': station(name='Siloam Springs, Smith Field Airport', coordinate=(36.2, -94.48333), altitude=364, country='United States'),
-    'KSLH': station(name='Cheboygan, Cheboygan County Airport', coordinate=(45.65361, -84.51917), altitude=195, country='United States'),
-    'KSLI': station(name='Los Alamitos U. S. Army Airfield', coordinate=(33.78333, -118.05), altitude=11, country='United States'),
-    'KSLK': station(name='ADIRONDACK REGIONAL AIRPORT', coordinate=(44.4, -74.2), altitude=507, country='United States'),
-    'KSLN': station(name='SALINA MUNICIPAL AIRPORT', coordinate=(38.78333, -97.65), altitude=388, country='United States'),
-    'KSLO': station(name='Salem, Salem-Leckrone Airport', coordinate=(38.64278, -88.96417), altitude=175, country='United States'),
-    'KSLR': station(name='Sulphur Springs, Sulphur Springs Municipal Airport', coordinate=(33.16111, -95.62111), altitude=149, country='United States'),
-    'KSLW': station(name='Smithville / Wooster', coordinate=(40.88333, -81.83333), altitude=357, country='United States'),
-    'KSME': station(name='Somerset, Somerset-Pulaski County - J.T. Wilson Field Airport', coordinate=(37.05417, -84.615), altitude=283, country='United States'),
-    'KSMF': station(name='SACRAMENTO INTERNATIONAL  AIRPORT', coordinate=(38.7, -121.6), altitude=8, country='United States'),
-    'KSMN': station(name='Salmon, Lemhi County Airport', coordinate=(45.11667, -113.88333), altitude=1233, country='United States'),
-    'KSMO': station(name='SANTA MONICA MUNICIPAL AIRPORT', coordinate=(34.01667, -118.45), altitude=53, country='United States'),
-    'KSMP': station(name='STAMPEDE PASS', coordinate=(47.28333, -121.33333), altitude=1209, country='United States'),
-    'KSMQ': station(name='SOMERVILLE SOMERSET AIRPORT', coordinate=(40.61667, -74.66667), altitude=32, country='United States'),
-    'KSMX': station(name='SANTA MARIA PUBLIC AIRPORT', coordinate=(34.9, -120.46667), altitude=79, country='United States'),
-    'KSNA': station(name='SANTA ANA WAYNE ORANGE CTY', coordinate=(33.68333, -117.86667), altitude=16, country='United States'),
-    'KSNC': station(name='Chester, Chester Airport', coordinate=(41.38389, -72.50583), altitude=127, country='United States'),
-    'KSNK': station(name='Snyder, Winston Field Airport', coordinate=(32.69333, -100.95028), altitude=741, country='United States'),
-    'KSNL': station(name='Shawnee, Shawnee Municipal Airport', coordinate=(35.35722, -96.94278), altitude=327, country='United States'),
-    'KSNP': station(name='St. Paul Island, St. Paul Island Airport', coordinate=(57.15583, -170.22083), altitude=13, country='United States'),
-    'KSNS': station(name='SALINAS MUNICIPAL AIRPORT', coordinate=(36.66667, -121.6), altitude=26, country='United States'),
-    'KSNT': station(name='Stanley, Stanley Ranger Station', coordinate=(44.20861, -114.93444), altitude=1980, country='United States'),
-    'KSNY': station(name='SIDNEY MUNICIPAL AIRPORT', coordinate=(41.1, -102.98333), altitude=1315, country='United States'),
-    'KSOA': station(name='Sonora, Sonora Municipal Airport', coordinate=(30.58556, -100.64833), altitude=652, country='United States'),
-    'KSOP': station(name='Pinehurst/Southern Pines, Moore County Airport', coordinate=(35.23333, -79.4), altitude=141, country='United States'),
-    'KSOV': station(name='Seldovia, Seldovia Airport', coordinate=(59.44667, -151.70444), altitude=8, country='United States'),
-    'KSOW': station(name='Show Low, Show Low Regional Airport', coordinate=(34.26528, -110.00556), altitude=1955, country='United States'),
-    'KSPA': station(name='Spartanburg Memorial', coordinate=(34.91667, -81.95), altitude=246, country='United States'),
-    'KSPB': station(name='SCAPPOOSE INDUSTRIAL AIRPARK', coordinate=(45.76667, -122.86667), altitude=17, country='United States'),
-    'KSPD': station(name='SPRINGFIELD COMANCHE NATL', coordinate=(37.28333, -102.61667), altitude=1335, country='United States'),
-    'KSPF': station(name='Spearfish / Clyde Ice', coordinate=(44.48333, -103.78333), altitude=1188, country='United States'),
-    'KSPG': station(name='ST PETERSBURG WHITTED AIRPORT', coordinate=(27.76667, -82.63333), altitude=2, country='United States'),
-    'KSPI': station(name='ABRAHAM LINCOLN CAPITAL AIRPORT', coordinate=(39.85, -89.68333), altitude=182, country='United States'),
-    'KSPL': station(name='South Padre Island Heliport', coordinate=(26.07056, -97.15722), altitude=3, country='United States'),
-    'KSPR': station(name='Ship Shoal', coordinate=(28.59889, -91.20639), altitude=None, country='United States'),
-    'KSPS': station(name='WICHITA FALLS SHEPPARD AFB', coordinate=(33.98333, -98.5), altitude=309, country='United States'),
-    'KSPW': station(name='SPENCER MUNICIPAL AIRPORT', coordinate=(43.16667, -95.21667), altitude=408, country='United States'),
-    'KSQI': station(name='Sterling Rockfalls', coordinate=(41.75, -89.66667), altitude=197, country='United States'),
-    'KSQL': station(name='San Carlos Airport', coordinate=(37.51667, -122.25), altitude=1, country='United States'),
-    'KSRC': station(name='Searcy, Searcy Municipal Airport', coordinate=(35.21194, -91.73722), altitude=81, country='United States'),
-    'KSRE': station(name='Seminole, Seminole Municipal Airport', coordinate=(35.27444, -96.675), altitude=312, country='United States'),
-    'KSRF': station(name='Hamilton U. S. Army Airfield', coordinate=(38.06667, -122.5), altitude=1, country='United States'),
-    'KSRN': station(name='South Marsh 268A', coordinate=(29.11667, -91.86667), altitude=0, country='United States'),
-    'KSRQ': station(name='SARASOTA/BRADENTON INTERNATIONAL .', coordinate=(27.4, -82.55), altitude=9, country='United States'),
-    'KSRR': station(name='Ruidoso Regional', coordinate=(33.46667, -105.53333), altitude=2076, country='United States'),
-    'KSSC': station(name='Shaw Air Force Base', coordinate=(33.96667, -80.48333), altitude=74, country='United States'),
-    'KSSF': station(name='SAN ANTONIO STINSON MUNI', coordinate=(29.33333, -98.46667), altitude=176, country='United States'),
-    'KSSI': station(name='BRUNSWICK MC KINNON AIRPORT', coordinate=(31.15, -81.38333), altitude=6, country='United States'),
-    'KSSU': station(name='White Sulphur Sprng', coordinate=(37.76667, -80.33333), altitude=549, country='United States'),
-    'KSTC': station(name='ST. CLOUD REGIONAL AIRPORT', coordinate=(45.55, -94.05), altitude=312, country='United States'),
-    'KSTE': station(name='Stevens Point, Stevens Point Municipal Airport', coordinate=(44.545, -89.53028), altitude=338, country='United States'),
-    'KSTJ': station(name='ROSECRANS MEMORIAL AIRPORT', coordinate=(39.76667, -94.91667), altitude=252, country='United States'),
-    'KSTL': station(name='LAMBERT-ST LOUIS INTERNATIONAL  AIRPORT', coordinate=(38.75, -90.36667), altitude=184, country='United States'),
-    'KSTP': station(name='DOWNTOWN HOLMAN FIELD', coordinate=(44.93333, -93.05), altitude=215, country='United States'),
-    'KSTS': station(name='SANTA ROSA SONOMA COUNTY', coordinate=(38.5, -122.81667), altitude=38, country='United States'),
-    'KSTT': station(name="CYRIL E. KING INT'L AIRPORT .", coordinate=(18.33333, -64.98333), altitude=7, country='United States'),
-    'KSTX': station(name='HENRY E. ROHLSEN', coordinate=(17.7, -64.8), altitude=19, country='United States'),
-    'KSUA': station(name='Stuart, Witham Field Airport', coordinate=(27.18167, -80.22111), altitude=6, country='United States'),
-    'KSUE': station(name='Sturgeon Bay', coordinate=(44.85, -87.41667), altitude=221, country='United States'),
-    'KSUN': station(name='Hailey, Friedman Memorial Airport', coordinate=(43.5, -114.3), altitude=1621, country='United States'),
-    'KSUS': station(name='SPIRIT OF ST. LOUIS AIRPORT', coordinate=(38.65, -90.65), altitude=141, country='United States'),
-    'KSUT': station(name='Oak Island, Brunswick County Airport', coordinate=(33.92917, -78.07472), altitude=8, country='United States'),
-    'KSUU': station(name='Fairfield / Travis Air Force Base', coordinate=(38.26667, -121.95), altitude=19, country='United States'),
-    'KSUW': station(name='Superior, Richard I. Bong Airport', coordinate=(46.68972, -92.09472), altitude=205, country='United States'),
-    'KSUX': station(name='SIOUX GATEWAY AIRPORT', coordinate=(42.38333, -96.38333), altitude=335, country='United States'),
-    'KSVC': station(name='Silver City / Grant', coordinate=(32.63333, -108.15), altitude=1659, country='United States'),
-    'KSVE': station(name='Susanville Municipal', coordinate=(40.38333, -120.56667), altitude=1263, country='United States'),
-    'KSVH': station(name='Statesville, Statesville Municipal Airport', coordinate=(35.76528, -80.95667), altitude=294, country='United States'),
-    'KSVN': station(name='Hunter U. S. Army Airfield', coordinate=(32.01667, -81.15), altitude=13, country='United States'),
-    'KSWD': station(name='Seward, Seward Airport', coordinate=(60.12694, -149.41861), altitude=6, country='United States'),
-    'KSWF': station(name='Newburgh / Stewart', coordinate=(41.5, -74.1), altitude=150, country='United States'),
-    'KSWO': station(name='STILLWATER REGIONAL AIRPORT', coordinate=(36.16667, -97.08333), altitude=300, country='United States'),
-    'KSWW': station(name='Sweetwater, Avenger Field Airport', coordinate=(32.46722, -100.46639), altitude=725, country='United States'),
-    'KSXT': station(name='SEXTON SUMMIT', coordinate=(42.6, -123.36667), altitude=1171, country='United States'),
-    'KSYN': station(name='Stanton, Stanton Airfield', coordinate=(44.47528, -93.01611), altitude=280, country='United States'),
-    'KSYR': station(name='SYRACUSE HANCOCK INTERNATIONAL  AIRPORT', coordinate=(43.11667, -76.1), altitude=125, country='United States'),
-    'KSZL': station(name='Whiteman Air Force Base', coordinate=(38.73333, -93.55), altitude=265, country='United States'),
-    'KSZN': station(name='Santa Cruz Island', coordinate=(34.01667, -119.75), altitude=10, country='United States'),
-    'KSZT': station(name='Sandpoint, Sandpoint Airport', coordinate=(48.29944, -116.56), altitude=648, country='United States'),
-    'KT08': station(name='Tomahawk, Tomahawk Regional Airport', coordinate=(45.46889, -89.80556), altitude=453, country='United States'),
-    'KT18': station(name='Falfurrias, Brooks County Airport', coordinate=(27.20667, -98.12111), altitude=34, country='United States'),
-    'KT46': station(name='South Brazos A70', coordinate=(28.01667, -95.86667), altitude=23, country='United States'),
-    'KT49': station(name='Big Spring, Big Spring McMahon-Wrinkle Airport', coordinate=(32.2, -101.51667), altitude=784, country='United States'),
-    'KT53': station(name='Robstown, Nueces County Airport', coordinate=(27.77833, -97.69028), altitude=24, country='United States'),
-    'KT56': station(name='Crockett, Houston County Airport', coordinate=(31.30694, -95.40361), altitude=106, country='United States'),
-    'KT62': station(name='Tooele', coordinate=(40.31667, -112.3), altitude=1628, country='United States'),
-    'KT65': station(name='Weslaco, Mid Valley Airport', coordinate=(26.1775, -97.97306), altitude=21, country='United States'),
-    'KT72': station(name='Hearne, Hearne Municipal Airport', coordinate=(30.87167, -96.62222), altitude=87, country='United States'),
-    'KT82': station(name='Fredericksburg, Gillespie County Airport', coordinate=(30.24361, -98.90944), altitude=517, country='United States'),
-    'KT97': station(name='Port Lavaca, Calhoun County Airport', coordinate=(28.65389, -96.68111), altitude=9, country='United States'),
-    'KTAD': station(name='Trinidad, Perry Stokes Airport', coordinate=(37.26667, -104.43333), altitude=1756, country='United States'),
-    'KTAL': station(name='Tanana, Calhoun Memorial Airport', coordinate=(65.17444, -152.10694), altitude=69, country='United States'),
-    'KTAN': station(name='TAUNTON MUNICIPAL AIRPORT', coordinate=(41.88333, -71.01667), altitude=13, country='United States'),
-    'KTAZ': station(name='Taylorville, Taylorville Municipal Airport', coordinate=(39.53417, -89.32778), altitude=190, country='United States'),
-    'KTBN': station(name='Fort Leonard Wood', coordinate=(37.73333, -92.13333), altitude=353, country='United States'),
-    'KTBR': station(name='Statesboro, Statesboro-Bulloch County Airport', coordinate=(32.48306, -81.73722), altitude=57, country='United States'),
-    'KTBW': station(name='Tampa Bay Area', coordinate=(27.7, -82.4), altitude=12, country='United States'),
-    'KTCC': station(name='TUCUMCARI MUNICIPAL AIRPORT', coordinate=(35.18333, -103.6), altitude=1239, country='United States'),
-    'KTCL': station(name='TUSCALOOSA REGIONAL AIRPORT', coordinate=(33.21667, -87.61667), altitude=52, country='United States'),
-    'KTCM': station(name='Tacoma / McChord Air Force Base', coordinate=(47.15, -122.48333), altitude=98, country='United States'),
-    'KTCS': station(name='TRUTH OR CONSEQUENCES MUNI', coordinate=(33.23333, -107.26667), altitude=1478, country='United States'),
-    'KTDF': station(name='Roxboro, Person County Airport', coordinate=(36.285, -78.98417), altitude=186, country='United States'),
-    'KTDO': station(name='Toledo-Winlock Memorial', coordinate=(46.48333, -122.8), altitude=113, country='United States'),
-    'KTDZ': station(name='TOLEDO METCALF FIELD', coordinate=(41.56667, -83.48333), altitude=190, country='United States'),
-    'KTEB': station(name='TETERBORO AIRPORT', coordinate=(40.86667, -74.05), altitude=3, country='United States'),
-    'KTEW': station(name='Mason, Mason Jewett Field Airport', coordinate=(42.56583, -84.42333), altitude=280, country='United States'),
-    'KTEX': station(name='Telluride, Telluride Regional Airport', coordinate=(37.95389, -107.90861), altitude=2767, country='United States'),
-    'KTFX': station(name='Great Falls Nexrad', coordinate=(47.46667, -111.36667), altitude=1151, country='United States'),
-    'KTHV': station(name='YORK AIRPORT', coordinate=(39.91667, -76.88333), altitude=146, country='United States'),
-    'KTIF': station(name='Thedford, Thomas County Airport', coordinate=(41.96194, -100.56889), altitude=892, country='United States'),
-    'KTIK': station(name='Tinker Air Force Base', coordinate=(35.41667, -97.38333), altitude=394, country='United States'),
-    'KTIP': station(name='Rantoul, Rantoul National Aviation Center Airport-Frank Elliott Field', coordinate=(40.29361, -88.1425), altitude=225, country='United States'),
-    'KTIW': station(name='Tacoma, Tacoma Narrows Airport', coordinate=(47.2675, -122.57611), altitude=96, country='United States'),
-    'KTIX': station(name='Titusville', coordinate=(28.51667, -80.8), altitude=11, country='United States'),
-    'KTKA': station(name='Talkeetna, Talkeetna Airport', coordinate=(62.32, -150.095), altitude=109, country='United States'),
-    'KTKC': station(name='Tracy, Tracy Municipal Airport', coordinate=(44.24889, -95.60722), altitude=408, country='United States'),
-    'KTKI': station(name='COLLIN CNTY REGIONAL AIRPORT', coordinate=(33.18333, -96.58333), altitude=178, country='United States'),
-    'KTKV': station(name='Tomahawk, Tomahawk Regional Airport', coordinate=(45.46889, -89.80556), altitude=453, country='United States'),
-    'KTLH': station(name='TALLAHASSEE REGIONAL AIRPORT', coordinate=(30.4, -84.35), altitude=25, country='United States'),
-    'KTLX': station(name='Oklahoma City Nexrad', coordinate=(35.33333, -97.28333), altitude=338, country='United States'),
-    'KTMB': station(name='KENDALL-TAMIAMI EXEC AIRPORT', coordinate=(25.65, -80.43333), altitude=3, country='United States'),
-    'KTMH': station(name='20 Mile Hill', coordinate=(43.11667, -106.33333), altitude=1743, country='United States'),
-    'KTNB': station(name='Boone, Watauga County Hospital Heliport', coordinate=(36.2, -81.65), altitude=959, country='United States'),
-    'KTNU': station(name='Newton Municipal', coordinate=(41.68333, -93.01667), altitude=290, country='United States'),
-    'KTNX': station(name='Tonopah Test Range', coordinate=(37.8, -116.78333), altitude=1691, country='United States'),
-    'KTOA': station(name='Torrance, Zamperini Field Airport', coordinate=(33.8, -118.33333), altitude=31, country='United States'),
-    'KTOB': station(name='Dodge Center, Dodge Center Airport', coordinate=(44.01806, -92.83139), altitude=398, country='United States'),
-    'KTOI': station(name='TROY MUNICIPAL AIRPORT', coordinate=(31.86667, -86.01667), altitude=121, country='United States'),
-    'KTOL': station(name='TOLEDO EXPRESS AIRPORT', coordinate=(41.58333, -83.8), altitude=208, country='United States'),
-    'KTOP': station(name='TOPEKA BILLARD MUNICIPAL AIRPORT', coordinate=(39.06667, -95.63333), altitude=269, country='United States'),
-    'KTOR': station(name='TORRINGTON MUNICIPAL AIRPORT', coordinate=(42.05, -104.15), altitude=1282, country='United States'),
-    'KTPA': station(name='TAMPA INTERNATIONAL AIRPORT', coordinate=(27.96667, -82.53333), altitude=8, country='United States'),
-    'KTPF': station(name='Tampa, Peter O Knight Airport', coordinate=(27.91556, -82.44917), altitude=2, country='United States'),
-    'KTPH': station(name='TONOPAH AIRPORT', coordinate=(38.03333, -117.08333), altitude=1654, country='United States'),
-    'KTPL': station(name='Temple, Draughon-Miller Central Texas Regional Airport', coordinate=(31.15, -97.4), altitude=208, country='United States'),
-    'KTQE': station(name='TEKAMAH MUNICIPAL AIRPORT', coordinate=(41.76667, -96.18333), altitude=313, country='United States'),
-    'KTQH': station(name='Tahlequah, Tahlequah Municipal Airport', coordinate=(35.92889, -95.00444), altitude=266, country='United States'),
-    'KTRI': station(name='TRI-CITY REGIONAL AIRPORT', coordinate=(36.46667, -82.4), altitude=463, country='United States'),
-    'KTRK': station(name='Truckee-Tahoe', coordinate=(39.31667, -120.13333), altitude=1798, country='United States'),
-    'KTRL': station(name='TERRELL MUNICIPAL AIRPORT', coordinate=(32.71667, -96.26667), altitude=145, country='United States'),
-    'KTRM': station(name='Palm Springs, Jacqueline Cochran Regional Airport', coordinate=(33.62667, -116.15944), altitude=-38, country='United States'),
-    'KTTA': station(name='Sanford, Sanford-Lee County Regional Airport', coordinate=(35.5825, -79.10139), altitude=75, country='United States'),
-    'KTTD': station(name='PORTLAND-TROUTDALE AIRPORT', coordinate=(45.55, -122.41667), altitude=11, country='United States'),
-    'KTTF': station(name='Monroe, Custer Airport', coordinate=(41.94, -83.43472), altitude=188, country='United States'),
-    'KTTN': station(name='TRENTON MERCER COUNTY AIRPORT', coordinate=(40.28333, -74.81667), altitude=65, country='United States'),
-    'KTTS': station(name='Titusville, NASA Shuttle Landing Facility', coordinate=(28.61667, -80.7), altitude=3, country='United States'),
-    'KTUL': station(name='TULSA INTERNATIONAL AIRPORT', coordinate=(36.2, -95.88333), altitude=206, country='United States'),
-    'KTUP': station(name='TUPELO REGIONAL AIRPORT', coordinate=(34.26667, -88.76667), altitude=105, country='United States'),
-    'KTUS': station(name='TUCSON INTERNATIONAL AIRPORT', coordinate=(32.13333, -110.95), altitude=805, country='United States'),
-    'KTVC': station(name='CHERRY CAPITAL AIRPORT', coordinate=(44.73333, -85.56667), altitude=190, country='United States'),
-    'KTVF': station(name='Thief River Falls, Thief River Falls Regional Airport', coordinate=(48.06667, -96.18333), altitude=340, country='United States'),
-    'KTVI': station(name='Thomasville', coordinate=(30.90167, -83.88139), altitude=80, country='United States'),
-    'KTVL': station(name='SOUTH LAKE TAHOE AIRPORT', coordinate=(38.88333, -119.98333), altitude=1909, country='United States'),
-    'KTVR': station(name='Vicksburg, Vicksburg / Tallulah Regional Airport', coordinate=(32.34806, -91.03), altitude=26, country='United States'),
-    'KTWF': station(name='JOSLIN FLD-MAGIC VALLEY REGL', coordinate=(42.48333, -114.48333), altitude=1265, country='United States'),
-    'KTWM': station(name='Two Harbors', coordinate=(47.05, -91.75), altitude=328, country='United States'),
-    'KTWX': station(name='Topeka NEXRAD', coordinate=(39.0, -96.23333), altitude=431, country='United States'),
-    'KTXK': station(name='TEXARKANA RGNL WEBB FIELD', coordinate=(33.45, -93.98333), altitude=119, country='United States'),
-    'KTYR': station(name='TYLER POUNDS FIELDS', coordinate=(32.35, -95.4), altitude=166, country='United States'),
-    'KTYS': station(name='MCGHEE TYSON AIRPORT', coordinate=(35.81667, -83.98333), altitude=299, country='United States'),
-    'KTZR': station(name='Columbus, Bolton Field Airport', coordinate=(39.90083, -83.13722), altitude=276, country='United States'),
-    'KU15': station(name='Challis, Challis Airport', coordinate=(44.52278, -114.215), altitude=1534, country='United States'),
-    'KU16': station(name='Eagle Range', coordinate=(41.05, -113.06667), altitude=1292, country='United States'),
-    'KU17': station(name='Bullfrog Marina', coordinate=(37.5, -110.7), altitude=1110, country='United States'),
-    'KU24': station(name='Delta', coordinate=(39.33333, -112.58333), altitude=1414, country='United States'),
-    'KU28': station(name='Green River Range', coordinate=(39.0, -110.16667), altitude=1241, country='United States'),
-    'KU31': station(name='Austin', coordinate=(39.5, -117.08333), altitude=2014, country='United States'),
-    'KU42': station(name='Salt Lake City, Salt Lake City Municipal 2 Airport', coordinate=(40.61944, -111.99278), altitude=1403, country='United States'),
-    'KU59': station(name='Driggs, Driggs-Reed Memorial Airport', coordinate=(43.74167, -111.09778), altitude=1898, country='United States'),
-    'KU67': station(name='Roosevelt', coordinate=(40.3, -109.98333), altitude=1553, country='United States'),
-    'KU71': station(name='Vernal', coordinate=(40.46667, -109.53333), altitude=1612, country='United States'),
-    'KU73': station(name='Jerome, Jerome County Airport', coordinate=(42.7275, -114.45306), altitude=1233, country='United States'),
-    'KU78': station(name='Soda Springs / Tigert', coordinate=(42.65, -111.58333), altitude=1780, country='United States'),
-    'KUAO': station(name='AURORA STATE AIRPORT', coordinate=(45.25, -122.76667), altitude=60, country='United States'),
-    'KUCA': station(name='GRIFFISS AIRFIELD', coordinate=(43.11667, -75.38333), altitude=226, country='United States'),
-    'KUCP': station(name='New Castle, New Castle Municipal Airport', coordinate=(41.02528, -80.41333), altitude=327, country='United States'),
-    'KUDG': station(name='Darlington, Darlington County Jetport Airport', coordinate=(34.44917, -79.89028), altitude=59, country='United States'),
-    'KUES': station(name='Waukesha, Waukesha County Airport', coordinate=(43.04111, -88.23694), altitude=278, country='United States'),
-    'KUEX': station(name='Grand Island Nexrad', coordinate=(40.31667, -98.43333), altitude=626, country='United States'),
-    'KUGN': station(name='CHICAGO/WAUKEGAN REGIONAL', coordinate=(42.41667, -87.86667), altitude=222, country='United States'),
-    'KUIL': station(name='QUILLAYUTE STATE AIRPORT', coordinate=(47.93333, -124.56667), altitude=59, country='United States'),
-    'KUIN': station(name='QUINCY MUNI. BALDWIN FIELD', coordinate=(39.93333, -91.2), altitude=234, country='United States'),
-    'KUKF': station(name='North Wilkesboro, Wilkes County Airport', coordinate=(36.21667, -81.08333), altitude=396, country='United States'),
-    'KUKI': station(name='UKIAH MUNICIPAL AIRPORT', coordinate=(39.13333, -123.2), altitude=187, country='United States'),
-    'KUKL': station(name='Burlington, Coffey County Airport', coordinate=(38.3025, -95.725), altitude=358, country='United States'),
-    'KUKT': station(name='Quakertown, Quakertown Airport', coordinate=(40.435, -75.38167), altitude=160, country='United States'),
-    'KULM': station(name='New Ulm, New Ulm Municipal Airport', coordinate=(44.31667, -94.5), altitude=308, country='United States'),
-    'KUNO': station(name='WEST PLAINS MUNICIPAL AIRPORT', coordinate=(36.88333, -91.9), altitude=374, country='United States'),
-    'KUNU': station(name='Juneau, Dodge County Airport', coordinate=(43.42667, -88.70333), altitude=285, country='United States'),
-    'KUNV': station(name='State College, University Park Airport', coordinate=(40.85, -77.85), altitude=378, country='United States'),
-    'KUOX': station(name='Oxford, University-Oxford Airport', coordinate=(34.38444, -89.53556), altitude=138, country='United States'),
-    'KUTA': station(name='Tunica, Tunica Municipal Airport', coordinate=(34.68083, -90.34639), altitude=59, country='United States'),
-    'KUTS': station(name='HUNTSVILLE MUNICIPAL AIRPORT', coordinate=(30.75, -95.58333), altitude=112, country='United States'),
-    'KUUU': station(name='NEWPORT STATE AIRPORT', coordinate=(41.53333, -71.28333), altitude=52, country='United States'),
-    'KUVA': station(name='Uvalde, Garner Field Airport', coordinate=(29.21111, -99.74333), altitude=287, country='United States'),
-    'KUZA': station(name='ROCK HILL-YORK COUNTY AIRPORT', coordinate=(34.98333, -81.05), altitude=204, country='United States'),
-    'KVAD': station(name='Moody Air Force Base', coordinate=(30.96667, -83.2), altitude=71, country='United States'),
-    'KVAF': station(name='Boomvang', coordinate=(27.35361, -94.62528), altitude=None, country='United States'),
-    'KVAY': station(name='MT HOLLY SOUTH JERSEY RGNL', coordinate=(39.93333, -74.83333), altitude=16, country='United States'),
-    'KVBG': station(name='Lompoc, Vandenberg Air Force Base', coordinate=(34.72944, -120.57667), altitude=112, country='United States'),
-    'KVBS': station(name='Sabine 13B', coordinate=(29.47833, -93.63833), altitude=None, country='United States'),
-    'KVBT': station(name='Bentonville, Bentonville Municipal Airport/Louise M Thaden Field', coordinate=(36.35, -94.21667), altitude=395, country='United States'),
-    'KVCB': station(name='VACAVILLE NUT TREE AIRPORT', coordinate=(38.38333, -121.95), altitude=35, country='United States'),
-    'KVCT': station(name='VICTORIA REGIONAL AIRPORT', coordinate=(28.86667, -96.93333), altitude=35, country='United States'),
-    'KVCV': station(name='Victorville, Southern California Logistics Airport', coordinate=(34.59722, -117.38278), altitude=879, country='United States'),
-    'KVDF': station(name='Tampa, Vandenberg Airport', coordinate=(28.01389, -82.34528), altitude=7, country='United States'),
-    'KVDI': station(name='Vidalia, Vidalia Municipal Airport', coordinate=(32.1925, -82.37194), altitude=84, country='United States'),
-    'KVDW': station(name='Vedauwoo', coordinate=(41.15, -105.4), altitude=2542, country='United States'),
-    'KVEL': station(name='VERNAL AIRPORT', coordinate=(40.43333, -109.5), altitude=1609, country='United States'),
-    'KVGT': station(name='NORTH LAS VEGAS', coordinate=(36.2, -115.18333), altitude=671, country='United States'),
-    'KVIH': station(name='ROLLA/VICHY ROLLA NATIONAL', coordinate=(38.13333, -91.76667), altitude=350, country='United States'),
-    'KVIS': station(name='Visalia, Visalia Municipal Airport', coordinate=(36.31667, -119.4), altitude=90, country='United States'),
-    'KVJI': station(name='Abingdon', coordinate=(36.68333, -82.03333), altitude=631, country='United States'),
-    'KVKS': station(name='Vicksburg Municipal', coordinate=(32.23333, -90.93333), altitude=32, country='United States'),
-    'KVLD': station(name='VALDOSTA REGIONAL AIRPORT', coordinate=(30.78333, -83.26667), altitude=62, country='United States'),
-    'KVLG': station(name='The Villages', coordinate=(28.96667, -81.96667), altitude=27, country='United States'),
-    'KVLL': station(name='Troy, Oakland/Troy Airport', coordinate=(42.54278, -83.17778), altitude=222, country='United States'),
-    'KVNP': station(name='Vermillion 26', coordinate=(29.46667, -92.36861), altitude=None, country='United States'),
-    'KVNY': station(name='VAN NUYS AIRPORT', coordinate=(34.21667, -118.48333), altitude=244, country='United States'),
-    'KVOK': station(name='Volk / Camp Douglas', coordinate=(43.93333, -90.26667), altitude=277, country='United States'),
-    'KVPC': station(name='CARTERSVILLE AIRPORT', coordinate=(34.13333, -84.85), altitude=233, country='United States'),
-    'KVPS': station(name='Valparaiso / Eglin Air Force Base', coordinate=(30.48333, -86.51667), altitude=26, country='United States'),
-    'KVPZ': station(name='VALPARAISO PORTER CO MUNI', coordinate=(41.45, -87.0), altitude=235, country='United States'),
-    'KVQN': station(name='Volens', coordinate=(36.95, -78.98333), altitude=185, country='United States'),
-    'KVQQ': station(name='Jacksonville, Cecil Field Airport', coordinate=(30.21861, -81.87667), altitude=25, country='United States'),
-    'KVRB': station(name='VERO BEACH MUNICIPAL AIRPORT', coordinate=(27.65, -80.41667), altitude=7, country='United States'),
-    'KVRX': station(name='Vermillion Area', coordinate=(28.58333, -92.45), altitude=1, country='United States'),
-    'KVSF': station(name='HARTNESS STATE AIRPORT', coordinate=(43.35, -72.51667), altitude=176, country='United States'),
-    'KVTA': station(name='NEWARK HEATH AIRPORT', coordinate=(40.01667, -82.46667), altitude=269, country='United States'),
-    'KVTI': station(name='Vinton, Vinton Veterans Memorial Airpark Airport', coordinate=(42.21861, -92.02583), altitude=258, country='United States'),
-    'KVTN': station(name='MILLER FIELD - VALENTINE, NE', coordinate=(42.86667, -100.55), altitude=789, country='United States'),
-    'KVTP': station(name='La Veta Mountain, La Veta Pass', coordinate=(37.50111, -105.16694), altitude=3114, country='United States'),
-    'KVTX': station(name='Los Angeles Nexrad', coordinate=(34.41667, -119.18333), altitude=856, country='United States'),
-    'KVUJ': station(name='Albemarle, Stanly County Airport', coordinate=(35.41667, -80.15083), altitude=186, country='United States'),
-    'KVUO': station(name='PEARSON AIRFIELD', coordinate=(45.61667, -122.65), altitude=8, country='United States'),
-    'KVUW': station(name='Eugene Island', coordinate=(28.25, -91.83333), altitude=1, country='United States'),
-    'KVVG': station(name='The Villages', coordinate=(28.96667, -81.96667), altitude=27, country='United States'),
-    'KVVV': station(name='Ortonville, Ortonville Muncipal-Martinson Field Airport', coordinate=(45.30556, -96.42444), altitude=335, country='United States'),
-    'KVWU': station(name='Waskish, Waskish Municipal Airport', coordinate=(48.15417, -94.51694), altitude=360, country='United States'),
-    'KVYS': station(name='Peru, Illinois Valley Regional-Walter A Duncan Field Airport', coordinate=(41.35194, -89.15306), altitude=199, country='United States'),
-    'KW08': station(name='Weirwood / Kellam Field', coordinate=(37.46667, -75.88333), altitude=12, country='United States'),
-    'KW11': station(name='Menomonie, Menomonie Municipal Airport-Score Field', coordinate=(44.89222, -91.86778), altitude=273, country='United States'),
-    'KW22': station(name='Buckhannon, Upshur County Regional Airport', coordinate=(39.0, -80.26667), altitude=498, country='United States'),
-    'KW30': station(name='Ocean City', coordinate=(38.33333, -75.08333), altitude=4, country='United States'),
-    'KW39': station(name='Norfolk / Chesapeak', coordinate=(36.9, -75.71667), altitude=23, country='United States'),
-    'KW44': station(name='Asheboro, Asheboro Municipal Airport', coordinate=(35.65389, -79.895), altitude=205, country='United States'),
-    'KW45': station(name='Luray Caverns Airport', coordinate=(38.66694, -78.50056), altitude=274, country='United States'),
-    'KW51': station(name='Cape Charles Coast Guard Station', coordinate=(37.25, -76.0), altitude=2, country='United States'),
-    'KW60': station(name='West Cameron 560', coordinate=(28.15, -93.35), altitude=0, country='United States'),
-    'KW63': station(name='Clarksville / Marks', coordinate=(36.6, -78.56667), altitude=128, country='United States'),
-    'KW71': station(name='Smith Point / Sunnybank', coordinate=(37.88333, -76.18333), altitude=1, country='United States'),
-    'KW76': station(name='West Cameron B522', coordinate=(28.38333, -93.5), altitude=29, country='United States'),
-    'KW77': station(name='Sanford, Sanford-Lee County Brick Field Airport', coordinate=(35.43333, -79.18333), altitude=131, country='United States'),
-    'KW99': station(name='Petersburg, Grant County Airport', coordinate=(38.98333, -79.13333), altitude=293, country='United States'),
-    'KWAL': station(name='WALLOPS FLIGHT FAC AIRPORT', coordinate=(37.93333, -75.46667), altitude=12, country='United States'),
-    'KWDD': station(name='Belle River', coordinate=(42.3, -82.7), altitude=184, country='Canada'),
-    'KWDG': station(name='Enid, Enid Woodring Regional Airport', coordinate=(36.37917, -97.79111), altitude=356, country='United States'),
-    'KWDR': station(name='Winder, Winder-Barrow Airport', coordinate=(33.98222, -83.66806), altitude=287, country='United States'),
-    'KWEY': station(name='West Yellowstone', coordinate=(44.65, -111.1), altitude=2031, country='United States'),
-    'KWHP': station(name='Los Angeles, Whiteman Airport', coordinate=(34.25, -118.4), altitude=306, country='United States'),
-    'KWJF': station(name='LANCASTER FOX AIRFIELD', coordinate=(34.73333, -118.21667), altitude=715, country='United States'),
-    'KWLD': station(name='STROTHER FIELD', coordinate=(37.16667, -97.03333), altitude=354, country='United States'),
-    'KWMC': station(name='WINNEMUCCA MUNICIPAL AIRPORT', coordinate=(40.9, -117.8), altitude=1312, country='United States'),
-    'KWRB': station(name='Warner Robins Air Force Base', coordinate=(32.63333, -83.6), altitude=90, country='United States'),
-    'KWRI': station(name='Mcguire Air Force Base', coordinate=(40.01667, -74.6), altitude=41, country='United States'),
-    'KWRL': station(name='WORLAND MUNICIPAL AIRPORT', coordinate=(43.96667, -107.95), altitude=1288, country='United States'),
-    'KWST': station(name='WESTERLY STATE AIRPORT', coordinate=(41.35, -71.8), altitude=25, country='United States'),
-    'KWTR': station(name='Whitaker', coordinate=(41.68333, -105.45), altitude=1888, country='United States'),
-    'KWVI': station(name='WATSONVILLE MUNICIPAL AIRPORT', coordinate=(36.93333, -121.78333), altitude=49, country='United States'),
-    'KWVL': station(name='Waterville, Waterville Robert LaFleur Airport', coordinate=(44.53333, -69.68333), altitude=102, country='United States'),
-    'KWWD': station(name='Wildwood, Cape May County Airport', coordinate=(39.01667, -74.91667), altitude=7, country='United States'),
-    'KWWR': station(name='Woodward, West Woodward Airport', coordinate=(36.43667, -99.52111), altitude=667, country='United States'),
-    'KWYS': station(name='West Yellowstone', coordinate=(44.68333, -111.11667), altitude=2025, country='United States'),
-    'KX21': station(name='Titusville, Arthur Dunn Air Park', coordinate=(28.62222, -80.83556), altitude=9, country='United States'),
-    'KX53': station(name='Clewiston', coordinate=(26.75, -80.95), altitude=6, country='United States'),
-    'KX68': station(name='Titusville, NASA Shuttle Landing Facility', coordinate=(28.61667, -80.7), altitude=3, country='United States'),
-    'KX80': station(name='Jupiter Inlet Coast Guard Station', coordinate=(27.03333, -80.11667), altitude=1, country='United States'),
-    'KX81': station(name='Lake Worth Inlet', coordinate=(26.76667, -80.05), altitude=1, country='United States'),
-    'KX82': station(name='Fort Pierce Coast Guard Station', coordinate=(27.46667, -80.3), altitude=1, country='United States'),
-    'KX84': station(name='Islamorada Coast Guard Station', coordinate=(24.95, -80.58333), altitude=1, country='United States'),
-    'KX86': station(name='Fowey Rocks Coast Guard Station', coordinate=(25.58333, -80.1), altitude=1, country='United States'),
-    'KX87': station(name='Miami Beach Coast Guard Station', coordinate=(25.76667, -80.13333), altitude=1, country='United States'),
-    'KX88': station(name='Marathon Coast Guard Station', coordinate=(24.71667, -81.11667), altitude=1, country='United States'),
-    'KX89': station(name='Ft. Myers Beach Coast Guard Station', coordinate=(26.45, -81.95), altitude=1, country='United States'),
-    'KX90': station(name='Venice Long Range Navigation', coordinate=(27.08333, -82.45), altitude=1, country='United States'),
-    'KX91': station(name='Egmont Key Coast Guard Station', coordinate=(27.6, -82.76667), altitude=1, country='United States'),
-    'KXBP': station(name='Bridgeport, Bridgeport Municipal Airport', coordinate=(33.17528, -97.82833), altitude=260, country='United States'),
-    'KXCN': station(name='Green Canyon 184', coordinate=(27.76667, -91.51667), altitude=0, country='United States'),
-    'KXMR': station(name='Cocoa Beach, Cape Canaveral Air Force Station Skid Strip', coordinate=(28.46667, -80.56667), altitude=3, country='United States'),
-    'KXNA': station(name='NORTHWEST ARKANSAS REGIONAL', coordinate=(36.28333, -94.3), altitude=392, country='United States'),
-    'KXVG': station(name='Longville, Longville Municipal Airport', coordinate=(46.99028, -94.20389), altitude=407, country='United States'),
-    'KXVW': station(name='Vandenberg Range', coordinate=(34.71667, -120.56667), altitude=100, country='United States'),
-    'KY12': station(name='Airlake', coordinate=(44.63333, -93.23333), altitude=292, country='United States'),
-    'KY15': station(name='Cheboygan, Cheboygan County Airport', coordinate=(45.65361, -84.51917), altitude=195, country='United States'),
-    'KY19': station(name='Mandan Municipal Airport', coordinate=(46.76806, -100.89389), altitude=592, country='United States'),
-    'KY26': station(name='Mobridge', coordinate=(45.53333, -100.43333), altitude=508, country='United States'),
-    'KY39': station(name='Olivia, Olivia Regional Airport', coordinate=(44.77861, -95.03278), altitude=328, country='United States'),
-    'KY50': station(name='Wautoma, Wautoma Municipal Airport', coordinate=(44.04139, -89.30444), altitude=262, country='United States'),
-    'KY51': station(name='Viroqua Municipal Airport', coordinate=(43.58139, -90.89972), altitude=390, country='United States'),
-    'KY63': station(name='Elbow Lake Municipal, Pride of the Prairie', coordinate=(45.98333, -95.98333), altitude=367, country='United States'),
-    'KY68': station(name='Tracy, Tracy Municipal Airport', coordinate=(44.24889, -95.60722), altitude=408, country='United States'),
-    'KYAK': station(name='Yakutat, Yakutat Airport', coordinate=(59.51028, -139.66278), altitude=10, country='United States'),
-    'KYIP': station(name='WILLOW RUN AIRPORT', coordinate=(42.23333, -83.53333), altitude=218, country='United States'),
-    'KYKM': station(name='YAKIMA AIR TERMINAL', coordinate=(46.56667, -120.53333), altitude=334, country='United States'),
-    'KYKN': station(name='Yankton, Chan Gurney Municipal Airport', coordinate=(42.91667, -97.38333), altitude=398, country='United States'),
-    'KYNG': station(name='YOUNGSTOWN-WARREN REG AIRPRT', coordinate=(41.25, -80.66667), altitude=365, country='United States'),
-    'KYUK': station(name='YUKON RANGE R-2205', coordinate=(64.71667, -146.51667), altitude=536, country='UNITED STATES'),
-    'KYUM': station(name='Yuma / Yuma International', coordinate=(32.65, -114.6), altitude=65, country='United States'),
-    'KZAB': station(name='Albuquerque Radar Site', coordinate=(35.16667, -106.56667), altitude=1621, country='United States'),
-    'KZLC': station(name='Salt Lake City', coordinate=(40.78333, -111.95), altitude=1288, country='United States'),
-    'KZSE': station(name='Auburn', coordinate=(47.28333, -122.18333), altitude=99, country='United States'),
-    'KZZV': station(name='ZANESVILLE MUNICIPAL AIRPORT', coordinate=(39.95, -81.9), altitude=274, country='United States'),
-    'LATI': station(name='Tirana', coordinate=(41.33333, 19.78333), altitude=89, country='Albania'),
-    'LBBG': station(name='Burgas', coordinate=(42.48333, 27.48333), altitude=16, country='Bulgaria'),
-    'LBGO': station(name='Gorna Orechovista', coordinate=(43.15, 25.6), altitude=None, country='Bulgaria'),
-    'LBPD': station(name='Plovdiv', coordinate=(42.13333, 24.75), altitude=179, country='Bulgaria'),
-    'LBRS': station(name='Rousse', coordinate=(43.85, 25.95), altitude=37, country='Bulgaria'),
-    'LBSF': station(name='Sofia Observ.', coordinate=(42.65, 23.38333), altitude=586, country='Bulgaria'),
-    'LBWN': station(name='Varna', coordinate=(43.2, 27.91667), altitude=41, country='Bulgaria'),
-    'LCEN': station(name='Ercan', coordinate=(35.15, 33.5), altitude=91, country='Cyprus'),
-    'LCLK': station(name='Larnaca Airport', coordinate=(34.88333, 33.63333), altitude=2, country='Cyprus'),
-    'LCNC': station(name='Athalassa', coordinate=(35.15, 33.4), altitude=162, country='Cyprus'),
-    'LCPH': station(name='Paphos Airport', coordinate=(34.71667, 32.48333), altitude=11, country='Cyprus'),
-    'LCRA': station(name='Akrotiri', coordinate=(34.58333, 32.98333), altitude=23, country='Cyprus'),
-    'LDDD': station(name='Zagreb / Maksimir', coordinate=(45.81667, 16.03333), altitude=123, country='Croatia'),
-    'LDDU': station(name='Dubrovnik / Cilipi', coordinate=(42.56667, 18.26667), altitude=157, country='Croatia'),
-    'LDLO': station(name='Losinj Island', coordinate=(44.56583, 14.39306), altitude=45, country='Croatia'),
-    'LDOC': station(name='Cepin', coordinate=(45.51667, 18.55), altitude=72, country='Croatia'),
-    'LDOR': station(name='Slavonski Brod', coordinate=(45.16667, 18.0), altitude=88, country='Croatia'),
-    'LDOS': station(name='Osijek / Cepin', coordinate=(45.45, 18.8), altitude=88, country='Croatia'),
-    'LDPL': station(name='Pula Aerodrome', coordinate=(45.9, 13.91667), altitude=63, country='Croatia'),
-    'LDRI': station(name='Rijeka / Omisalj', coordinate=(45.21667, 14.58333), altitude=85, country='Croatia'),
-    'LDSB': station(name='Brac', coordinate=(43.28583, 16.67972), altitude=541, country='Croatia'),
-    'LDSH': station(name='Hvar', coordinate=(43.16667, 16.45), altitude=20, country='Croatia'),
-    'LDSP': station(name='Split / Resnik', coordinate=(43.53333, 16.3), altitude=19, country='Croatia'),
-    'LDVA': station(name='Varazdin', coordinate=(46.3, 16.38333), altitude=167, country='Croatia'),
-    'LDZA': station(name='Zagreb / Pleso', coordinate=(45.73333, 16.06667), altitude=106, country='Croatia'),
-    'LDZD': station(name='Zadar / Zemunik', coordinate=(44.1, 15.35), altitude=82, country='Croatia'),
-    'LEAB': station(name='Albacete / Los Llanos', coordinate=(38.95, -1.85), altitude=702, country='Spain'),
-    'LEAL': station(name='Alicante / El Altet', coordinate=(38.28333, -0.55), altitude=43, country='Spain'),
-    'LEAM': station(name='Almeria / Aeropuerto', coordinate=(36.85, -2.38333), altitude=15, country='Spain'),
-    'LEAS': station(name='Asturias / Aviles', coordinate=(43.55, -6.03333), altitude=127, country='Spain'),
-    'LEBA': station(name='Cordoba / Aeropuerto', coordinate=(37.85, -4.85), altitude=90, country='Spain'),
-    'LEBB': station(name='Bilbao / Sondica', coordinate=(43.3, -2.93333), altitude=42, country='Spain'),
-    'LEBG': station(name='Burgos / Villafria', coordinate=(42.36667, -3.63333), altitude=894, country='Spain'),
-    'LEBL': station(name='Barcelona / Aeropuerto', coordinate=(41.28333, 2.06667), altitude=4, country='Spain'),
-    'LEBZ': station(name='Badajoz / Talavera La Real', coordinate=(38.88333, -6.81667), altitude=185, country='Spain'),
-    'LECH': station(name='Calamocha', coordinate=(40.93333, -1.3), altitude=890, country='Spain'),
-    'LECO': station(name='La Coruna / Alvedro', coordinate=(43.3, -8.38333), altitude=97, country='Spain'),
-    'LECV': station(name='Madri-Colmenar', coordinate=(40.65, -3.73333), altitude=None, country='Spain'),
-    'LEGA': station(name='Granada / Armilla', coordinate=(37.13333, -3.63556), altitude=700, country='Spain'),
-    'LEGE': station(name='Gerona / Costa Brava', coordinate=(41.9, 2.76667), altitude=143, country='Spain'),
-    'LEGR': station(name='Granada / Aeropuerto', coordinate=(37.18333, -3.78333), altitude=567, country='Spain'),
-    'LEGT': station(name='Madrid / Getafe', coordinate=(40.3, -3.71667), altitude=620, country='Spain'),
-    'LEHI': station(name='Hinojosa Del Duque', coordinate=(38.51667, -5.11667), altitude=540, country='Spain'),
-    'LEIB': station(name='Ibiza / Es Codola', coordinate=(38.86667, 1.38333), altitude=7, country='Spain'),
-    'LEJR': station(name='Jerez De La Fronteraaeropuerto', coordinate=(36.75, -6.06667), altitude=27, country='Spain'),
-    'LELC': station(name='Murcia / San Javier', coordinate=(37.78333, -0.8), altitude=5, country='Spain'),
-    'LELL': station(name='Sabadell', coordinate=(41.51667, 2.1), altitude=250, country='Spain'),
-    'LELN': station(name='Leon / Virgen Del Camino', coordinate=(42.58333, -5.65), altitude=926, country='Spain'),
-    'LELO': station(name='Logrono / Agoncillo', coordinate=(42.45, -2.33333), altitude=353, country='Spain'),
-    'LEMD': station(name='Madrid / Barajas', coordinate=(40.45, -3.55), altitude=609, country='Spain'),
-    'LEMG': station(name='Malaga / Aeropuerto', coordinate=(36.66667, -4.48333), altitude=16, country='Spain'),
-    'LEMH': station(name='Menorca / Mahon', coordinate=(39.86667, 4.23333), altitude=87, country='Spain'),
-    'LEMO': station(name='Moron De La Frontera', coordinate=(37.15, -5.61667), altitude=87, country='Spain'),
-    'LEPA': station(name='Palma De Mallorca / Son San Juan', coordinate=(39.55, 2.73333), altitude=4, country='Spain'),
-    'LEPP': station(name='Pamplona / Noain', coordinate=(42.76667, -1.63333), altitude=459, country='Spain'),
-    'LERI': station(name='Murcia / Alcantarilla', coordinate=(37.95, -1.23333), altitude=75, country='Spain'),
-    'LERS': station(name='Reus / Aeropuerto', coordinate=(41.15, 1.16667), altitude=71, country='Spain'),
-    'LERT': station(name='Rota', coordinate=(36.65, -6.35), altitude=26, country='Spain'),
-    'LESA': station(name='Salamanca / Matacan', coordinate=(40.95, -5.5), altitude=793, country='Spain'),
-    'LESO': station(name='San Sebastian / Fuenterrabia', coordinate=(43.35, -1.8), altitude=5, country='Spain'),
-    'LEST': station(name='Santiago / Labacolla', coordinate=(42.9, -8.43333), altitude=370, country='Spain'),
-    'LETO': station(name='Madrid / Torrejon', coordinate=(40.48333, -3.45), altitude=607, country='Spain'),
-    'LEVC': station(name='Valencia / Aeropuerto', coordinate=(39.5, -0.46667), altitude=69, country='Spain'),
-    'LEVD': station(name='Valladolid / Villanubla', coordinate=(41.71667, -4.85), altitude=849, country='Spain'),
-    'LEVS': station(name='Madrid / Cuatro Vientos', coordinate=(40.38333, -3.78333), altitude=690, country='Spain'),
-    'LEVT': station(name='Vitoria', coordinate=(42.88333, -2.71667), altitude=513, country='Spain'),
-    'LEVX': station(name='Vigo / Peinador', coordinate=(42.21667, -8.63333), altitude=264, country='Spain'),
-    'LEXJ': station(name='Santander / Parayas', coordinate=(43.43333, -3.81667), altitude=6, country='Spain'),
-    'LEZA': station(name='Zaragoza United States Air Force Operated Base In Foreign Country', coordinate=(41.66667, -1.05), altitude=263, country='Spain'),
-    'LEZG': station(name='Zaragoza / Aeropuerto', coordinate=(41.66667, -1.01667), altitude=263, country='Spain'),
-    'LEZL': station(name='Sevilla / San Pablo', coordinate=(37.41667, -5.9), altitude=34, country='Spain'),
-    'LFAT': station(name='Le Touquet', coordinate=(50.51667, 1.61667), altitude=10, country='France'),
-    'LFBA': station(name='Agen', coordinate=(44.18333, 0.6), altitude=61, country='France'),
-    'LFBC': station(name='Cazaux', coordinate=(44.53333, -1.13333), altitude=25, country='France'),
-    'LFBD': station(name='Bordeaux / Merignac', coordinate=(44.83333, -0.7), altitude=49, country='France'),
-    'LFBE': station(name='Bergerac', coordinate=(44.81667, 0.51667), altitude=51, country='France'),
-    'LFBF': station(name='Toulouse / Francazal', coordinate=(43.53333, 1.36667), altitude=164, country='France'),
-    'LFBG': station(name='Cognac', coordinate=(45.66667, -0.31667), altitude=30, country='France'),
-    'LFBH': station(name='La Rochelle', coordinate=(46.15, -1.15), altitude=4, country='France'),
-    'LFBI': station(name='Poitiers', coordinate=(46.58333, 0.31667), altitude=129, country='France'),
-    'LFBK': station(name='Montlucon / Gueret', coordinate=(46.21667, 2.36667), altitude=415, country='France'),
-    'LFBL': station(name='Limoges', coordinate=(45.86667, 1.18333), altitude=396, country='France'),
-    'LFBM': station(name='Mont-De-Marsan', coordinate=(43.91667, -0.5), altitude=62, country='France'),
-    'LFBN': station(name='Niort', coordinate=(46.31667, -0.4), altitude=61, country='France'),
-    'LFBO': station(name='Toulouse / Blagnac', coordinate=(43.63333, 1.36667), altitude=152, country='France'),
-    'LFBP': station(name='Pau', coordinate=(43.38333, -0.41667), altitude=188, country='France'),
-    'LFBS': station(name='Biscarosse', coordinate=(44.43333, -1.25), altitude=33, country='France'),
-    'LFBT': station(name='Tarbes Ossun Lourdes', coordinate=(43.18333, -0.0), altitude=379, country='France'),
-    'LFBV': station(name='Brive', coordinate=(45.15, 1.46667), altitude=111, country='France'),
-    'LFBX': station(name='Perigueux', coordinate=(45.2, 0.81667), altitude=100, country='France'),
-    'LFBY': station(name='Dax', coordinate=(43.68333, -1.06667), altitude=32, country='France'),
-    'LFBZ': station(name='Biarritz', coordinate=(43.46667, -1.53333), altitude=75, country='France'),
-    'LFCG': station(name='St-Girons', coordinate=(43.0, 1.1), altitude=414, country='France'),
-    'LFCI': station(name='Albi', coordinate=(43.91667, 2.11667), altitude=172, country='France'),
-    'LFCR': station(name='Rodez', coordinate=(44.4, 2.48333), altitude=581, country='France'),
-    'LFDH': station(name='Auch', coordinate=(43.68333, 0.6), altitude=125, country='France'),
-    'LFFS': station(name='Suippes Range Met', coordinate=(49.15, 4.53333), altitude=199, country='France'),
-    'LFGJ': station(name='Dole Tavaux', coordinate=(47.04278, 5.435), altitude=196, country='France'),
-    'LFHP': station(name='Le Puy', coordinate=(45.08333, 3.76667), altitude=832, country='France'),
-    'LFIG': station(name='Cassagnes-Begonhes', coordinate=(44.18333, 2.51667), altitude=1020, country='France'),
-    'LFJL': station(name='Metz-Nancy-Lorraine', coordinate=(48.98333, 6.25), altitude=264, country='France'),
-    'LFKB': station(name='Bastia', coordinate=(42.55, 9.48333), altitude=8, country='France'),
-    'LFKC': station(name='Calvi', coordinate=(42.53333, 8.8), altitude=64, country='France'),
-    'LFKF': station(name='Figari', coordinate=(41.5, 9.1), altitude=26, country='France'),
-    'LFKJ': station(name='Ajaccio', coordinate=(41.91667, 8.8), altitude=6, country='France'),
-    'LFKS': station(name='Solenzara', coordinate=(41.91667, 9.4), altitude=8, country='France'),
-    'LFLA': station(name='Auxerre', coordinate=(47.8, 3.55), altitude=207, country='France'),
-    'LFLB': station(name='Chambery / Aix-Les-Bains', coordinate=(45.65, 5.88333), altitude=235, country='France'),
-    'LFLC': station(name='Clermont-Ferrand', coordinate=(45.78333, 3.16667), altitude=332, country='France'),
-    'LFLD': station(name='Bourges', coordinate=(47.06667, 2.36667), altitude=161, country='France'),
-    'LFLL': station(name='Lyon / Satolas', coordinate=(45.73333, 5.08333), altitude=248, country='France'),
-    'LFLM': station(name='Macon', coordinate=(46.3, 4.8), altitude=221, country='France'),
-    'LFLN': station(name='Saint-Yan', coordinate=(46.41667, 4.01667), altitude=242, country='France'),
-    'LFLQ': station(name='Montelimar', coordinate=(44.58333, 4.73333), altitude=73, country='France'),
-    'LFLS': station(name='Grenoble / St. Geoirs', coordinate=(45.36667, 5.33333), altitude=384, country='France'),
-    'LFLV': station(name='Vichy', coordinate=(46.16667, 3.4), altitude=249, country='France'),
-    'LFLW': station(name='Aurillac', coordinate=(44.9, 2.41667), altitude=640, country='France'),
-    'LFLX': station(name='Chateauroux', coordinate=(46.85, 1.71667), altitude=160, country='France'),
-    'LFLY': station(name='Lyon / Bron', coordinate=(45.71667, 4.95), altitude=200, country='France'),
-    'LFMA': station(name='Aix Les Milles', coordinate=(43.5, 5.36667), altitude=111, country='France'),
-    'LFMC': station(name='Le Luc', coordinate=(43.38333, 6.38333), altitude=80, country='France'),
-    'LFMD': station(name='Cannes', coordinate=(43.55, 6.95), altitude=3, country='France'),
-    'LFME': station(name='Nimes / Courbessac', coordinate=(43.86667, 4.4), altitude=60, country='France'),
-    'LFMH': station(name='St-Etienne Boutheon', coordinate=(45.53333, 4.3), altitude=404, country='France'),
-    'LFMI': station(name='Istres', coordinate=(43.51667, 4.93333), altitude=23, country='France'),
-    'LFMK': station(name='Carcassonne', coordinate=(43.21667, 2.31667), altitude=130, country='France'),
-    'LFML': station(name='Marseille / Marignane', coordinate=(43.45, 5.23333), altitude=6, country='France'),
-    'LFMN': station(name='Nice', coordinate=(43.65, 7.2), altitude=4, country='France'),
-    'LFMO': station(name='Orange', coordinate=(44.13333, 4.83333), altitude=60, country='France'),
-    'LFMP': station(name='Perpignan', coordinate=(42.73333, 2.86667), altitude=43, country='France'),
-    'LFMT': station(name='Montpellier', coordinate=(43.58333, 3.96667), altitude=5, country='France'),
-    'LFMU': station(name='Beziers / Vias', coordinate=(43.31667, 3.35), altitude=17, country='France'),
-    'LFMX': station(name='St-Auban-Sur-Durance', coordinate=(44.06667, 6.0), altitude=460, country='France'),
-    'LFMY': station(name='Salon', coordinate=(43.6, 5.1), altitude=59, country='France'),
-    'LFNB': station(name='Mende / Brenoux', coordinate=(44.5, 3.53333), altitude=1024, country='France'),
-    'LFOA': station(name='Avord', coordinate=(47.05333, 2.6325), altitude=177, country='France'),
-    'LFOB': station(name='Beauvais', coordinate=(49.46667, 2.11667), altitude=109, country='France'),
-    'LFOC': station(name='Chateaudun', coordinate=(48.05, 1.38333), altitude=134, country='France'),
-    'LFOE': station(name='Evreux', coordinate=(49.01667, 1.21667), altitude=141, country='France'),
-    'LFOF': station(name='Alencon', coordinate=(48.45, 0.11667), altitude=144, country='France'),
-    'LFOH': station(name='La Heve', coordinate=(49.51667, 0.06667), altitude=100, country='France'),
-    'LFOI': station(name='Abbeville', coordinate=(50.13333, 1.83333), altitude=74, country='France'),
-    'LFOJ': station(name='Orleans', coordinate=(47.98333, 1.75), altitude=126, country='France'),
-    'LFOK': station(name='Chalons-Vatry', coordinate=(48.77611, 4.18444), altitude=179, country='France'),
-    'LFOP': station(name='Rouen', coordinate=(49.38333, 1.18333), altitude=157, country='France'),
-    'LFOR': station(name='Chartres', coordinate=(48.46667, 1.51667), altitude=155, country='France'),
-    'LFOS': station(name='Vittefleur / St. Vale', coordinate=(49.83333, 0.65), altitude=83, country='France'),
-    'LFOT': station(name='Tours', coordinate=(47.45, 0.71667), altitude=108, country='France'),
-    'LFOW': station(name='Saint-Quentin', coordinate=(49.81667, 3.2), altitude=98, country='France'),
-    'LFPB': station(name='Paris / Le Bourget', coordinate=(48.96667, 2.45), altitude=66, country='France'),
-    'LFPC': station(name='Creil Fafb', coordinate=(49.25, 2.51667), altitude=88, country='France'),
-    'LFPG': station(name='Paris-Aeroport Charles De Gaulle', coordinate=(49.01667, 2.53333), altitude=118, country='France'),
-    'LFPM': station(name='Melun', coordinate=(48.61667, 2.68333), altitude=95, country='France'),
-    'LFPN': station(name='Toussus Le Noble', coordinate=(48.76667, 1.1), altitude=164, country='France'),
-    'LFPO': station(name='Paris-Orly', coordinate=(48.73333, 2.4), altitude=89, country='France'),
-    'LFPV': station(name='Villacoublay', coordinate=(48.76667, 2.2), altitude=177, country='France'),
-    'LFPW': station(name='Paris Met Center', coordinate=(48.83333, 2.33333), altitude=75, country='France'),
-    'LFQB': station(name='Troyes', coordinate=(48.33333, 4.01667), altitude=118, country='France'),
-    'LFQG': station(name='Nevers', coordinate=(47.0, 3.1), altitude=180, country='France'),
-    'LFQH': station(name='Chatillon-Sur-Seine', coordinate=(47.85, 4.55), altitude=264, country='France'),
-    'LFQI': station(name='Cambrai', coordinate=(50.21667, 3.15), altitude=78, country='France'),
-    'LFQQ': station(name='Lille', coordinate=(50.56667, 3.1), altitude=48, country='France'),
-    'LFQV': station(name='Charleville', coordinate=(49.78333, 4.63333), altitude=149, country='France'),
-    'LFRA': station(name='Angers', coordinate=(47.5, -0.56667), altitude=57, country='France'),
-    'LFRB': station(name='Brest', coordinate=(48.45, -4.41667), altitude=99, country='France'),
-    'LFRC': station(name='Cherbourg / Maupertus', coordinate=(49.65, -1.46667), altitude=138, country='France'),
-    'LFRD': station(name='Dinard', coordinate=(48.58333, -2.06667), altitude=65, country='France'),
-    'LFRH': station(name='Lann Bihoue', coordinate=(47.76667, -3.45), altitude=52, country='France'),
-    'LFRI': station(name='La Roche-Sur-Yon', coordinate=(46.7, -1.38333), altitude=90, country='France'),
-    'LFRJ': station(name='Landivisiau', coordinate=(48.51667, -4.15), altitude=106, country='France'),
-    'LFRK': station(name='Caen', coordinate=(49.18333, -0.45), altitude=78, country='France'),
-    'LFRL': station(name='Lanveoc Poulmic', coordinate=(48.28333, -4.43333), altitude=87, country='France'),
-    'LFRM': station(name='Le Mans', coordinate=(47.93333, 0.2), altitude=59, country='France'),
-    'LFRN': station(name='Rennes', coordinate=(48.06667, -1.73333), altitude=37, country='France'),
-    'LFRO': station(name='Lannion / Servel', coordinate=(48.75, -3.46667), altitude=89, country='France'),
-    'LFRQ': station(name='Quimper', coordinate=(47.96667, -4.16667), altitude=92, country='France'),
-    'LFRS': station(name='Nantes', coordinate=(47.16667, -1.6), altitude=27, country='France'),
-    'LFRT': station(name='Saint-Brieuc', coordinate=(48.53333, -2.85), altitude=138, country='France'),
-    'LFRU': station(name='Morlaix / Ploujean', coordinate=(48.6, -3.81667), altitude=86, country='France'),
-    'LFRZ': station(name='St-Nazaire', coordinate=(47.31667, -2.16667), altitude=3, country='France'),
-    'LFSA': station(name='Besancon', coordinate=(47.25, 5.98333), altitude=307, country='France'),
-    'LFSB': station(name='Bale-Mulhouse', coordinate=(47.6, 7.51667), altitude=270, country='France'),
-    'LFSC': station(name='Colmar', coordinate=(47.91667, 7.4), altitude=211, country='France'),
-    'LFSD': station(name='Dijon', coordinate=(47.26667, 5.08333), altitude=222, country='France'),
-    'LFSF': station(name='Metz / Frescaty', coordinate=(49.08333, 6.13333), altitude=190, country='France'),
-    'LFSI': station(name='St-Dizier', coordinate=(48.63333, 4.9), altitude=139, country='France'),
-    'LFSL': station(name='Toul / Rosieres', coordinate=(48.78333, 5.48333), altitude=285, country='France'),
-    'LFSN': station(name='Nancy / Essey', coordinate=(48.68333, 6.21667), altitude=225, country='France'),
-    'LFSO': station(name='Nancy / Ochey', coordinate=(48.58333, 5.96667), altitude=336, country='France'),
-    'LFSQ': station(name='Belfort', coordinate=(47.63333, 6.86667), altitude=422, country='France'),
-    'LFSR': station(name='Reims', coordinate=(49.3, 4.03333), altitude=95, country='France'),
-    'LFST': station(name='Strasbourg', coordinate=(48.55, 7.63333), altitude=153, country='France'),
-    'LFSX': station(name='Luxeuil', coordinate=(47.78333, 6.35), altitude=278, country='France'),
-    'LFTH': station(name='Hyeres', coordinate=(43.1, 6.15), altitude=3, country='France'),
-    'LFTU': station(name='St-Raphael', coordinate=(43.41667, 6.75), altitude=2, country='France'),
-    'LFTW': station(name='Nimes / Garons', coordinate=(43.75, 4.41667), altitude=94, country='France'),
-    'LFVP': station(name='Saint-Pierre', coordinate=(46.76667, -56.16667), altitude=3, country='Saint Pierre and Miquelon'),
-    'LFXA': station(name='Amberieu', coordinate=(45.98333, 5.33333), altitude=250, country='France'),
-    'LFYR': station(name='Romorantin', coordinate=(47.31667, 1.68333), altitude=85, country='France'),
-    'LGAD': station(name='Andravida Airport', coordinate=(37.91667, 21.28333), altitude=10, country='Greece'),
-    'LGAL': station(name='Alexandroupoli Airport', coordinate=(40.85, 25.91667), altitude=7, country='Greece'),
-    'LGAT': station(name='Athinai Airport', coordinate=(37.9, 23.73333), altitude=28, country='Greece'),
-    'LGAV': station(name='Athens Eleftherios Venizelos International Airport', coordinate=(37.93333, 23.93333), altitude=94, country='Greece'),
-    'LGBL': station(name='Anchialos Airport', coordinate=(39.21667, 22.8), altitude=25, country='Greece'),
-    'LGEL': station(name='Elefsis Airport', coordinate=(38.06667, 23.55), altitude=44, country='Greece'),
-    'LGHI': station(name='Chios Airport', coordinate=(38.33333, 26.13333), altitude=5, country='Greece'),
-    'LGIR': station(name='Heraklion Airport', coordinate=(35.33333, 25.18333), altitude=37, country='Greece'),
-    'LGKA': station(name='Kastoria Airport', coordinate=(40.45, 21.28333), altitude=604, country='Greece'),
-    'LGKC': station(name='Kithira Airport', coordinate=(36.28917, 23.02333), altitude=321, country='Greece'),
-    'LGKF': station(name='Kefalhnia Airport', coordinate=(38.11667, 20.5), altitude=19, country='Greece'),
-    'LGKL': station(name='Kalamata Airport', coordinate=(37.06667, 22.01667), altitude=6, country='Greece'),
-    'LGKO': station(name='Kos Airport', coordinate=(36.78333, 27.06667), altitude=129, country='Greece'),
-    'LGKP': station(name='Karpathos Airport', coordinate=(35.41417, 27.14833), altitude=6, country='Greece'),
-    'LGKR': station(name='Kerkyra Airport', coordinate=(39.61667, 19.91667), altitude=2, country='Greece'),
-    'LGKV': station(name='Chrysoupoli Airport', coordinate=(40.98333, 24.6), altitude=5, country='Greece'),
-    'LGKZ': station(name='Kozani Airport', coordinate=(40.3, 21.78333), altitude=634, country='Greece'),
-    'LGLM': station(name='Limnos Airport', coordinate=(39.91667, 25.23333), altitude=5, country='Greece'),
-    'LGLR': station(name='Larissa Airport', coordinate=(39.63333, 22.41667), altitude=73, country='Greece'),
-    'LGMK': station(name='Mikonos Island, Mikonos Airport', coordinate=(37.43583, 25.34583), altitude=123, country='Greece'),
-    'LGMT': station(name='Mytilini Airport', coordinate=(39.06667, 26.6), altitude=3, country='Greece'),
-    'LGNX': station(name='Cyclades Islands, Naxos Airport', coordinate=(37.07972, 25.36694), altitude=3, country='Greece'),
-    'LGPA': station(name='Paros Community Airport', coordinate=(37.01111, 25.12556), altitude=36, country='Greece'),
-    'LGPZ': station(name='Aktion Airport', coordinate=(38.61667, 20.76667), altitude=4, country='Greece'),
-    'LGRD': station(name='Rhodes / Maritsa', coordinate=(36.38333, 28.11667), altitude=62, country='Greece'),
-    'LGRP': station(name='Rhodes Airport', coordinate=(36.4, 28.08333), altitude=4, country='Greece'),
-    'LGRX': station(name='Araxos Airport', coordinate=(38.15, 21.41667), altitude=11, country='Greece'),
-    'LGSA': station(name='Souda Airport', coordinate=(35.48333, 24.11667), altitude=146, country='Greece'),
-    'LGSK': station(name='Skiathos Island', coordinate=(39.18333, 23.5), altitude=15, country='Greece'),
-    'LGSM': station(name='Samos Airport', coordinate=(37.7, 26.91667), altitude=2, country='Greece'),
-    'LGSO': station(name='Syros Airport', coordinate=(37.42111, 24.94833), altitude=73, country='Greece'),
-    'LGSR': station(name='Santorini Island', coordinate=(36.4, 25.48333), altitude=38, country='Greece'),
-    'LGTG': station(name='Tanagra Airport', coordinate=(38.31667, 23.53333), altitude=148, country='Greece'),
-    'LGTP': station(name='Tripolis Airport', coordinate=(37.53333, 22.4), altitude=644, country='Greece'),
-    'LGTS': station(name='Thessaloniki Airport', coordinate=(40.51667, 22.96667), altitude=8, country='Greece'),
-    'LGTT': station(name='Tatoi', coordinate=(38.1, 23.78333), altitude=239, country='Greece'),
-    'LGZA': station(name='Zakinthos Airport', coordinate=(37.75, 20.88333), altitude=3, country='Greece'),
-    'LHBC': station(name='Bekescsaba', coordinate=(46.68333, 21.16667), altitude=88, country='Hungary'),
-    'LHBM': station(name='Budapest Met Center', coordinate=(47.51667, 19.03333), altitude=129, country='Hungary'),
-    'LHBP': station(name='Budapest / Ferihegy', coordinate=(47.43333, 19.26667), altitude=151, country='Hungary'),
-    'LHBS': station(name='Budaors', coordinate=(47.45, 18.96667), altitude=132, country='Hungary'),
-    'LHDC': station(name='Debrecen', coordinate=(47.48333, 21.6), altitude=108, country='Hungary'),
-    'LHKE': station(name='Kecskemet', coordinate=(46.91667, 19.75), altitude=113, country='Hungary'),
-    'LHKV': station(name='Kaposvar', coordinate=(46.38333, 17.83333), altitude=144, country='Hungary'),
-    'LHMC': station(name='Miskolc', coordinate=(48.08333, 20.76667), altitude=232, country='Hungary'),
-    'LHNY': station(name='Nyiregyhaza / Napkor', coordinate=(47.96667, 21.98333), altitude=141, country='Hungary'),
-    'LHPA': station(name='Papa', coordinate=(47.2, 17.5), altitude=145, country='Hungary'),
-    'LHPP': station(name='Pecs / Pogany', coordinate=(46.1, 18.23333), altitude=201, country='Hungary'),
-    'LHSA': station(name='Szentkiralyszabadja', coordinate=(47.06667, 17.98333), altitude=280, country='Hungary'),
-    'LHSK': station(name='Siofok', coordinate=(46.91667, 18.05), altitude=108, country='Hungary'),
-    'LHSN': station(name='Szolnok', coordinate=(47.11667, 20.23333), altitude=89, country='Hungary'),
-    'LHSY': station(name='Szombathely', coordinate=(47.26667, 16.63333), altitude=220, country='Hungary'),
-    'LHTA': station(name='Taszar', coordinate=(46.4, 17.91667), altitude=160, country='Hungary'),
-    'LHTL': station(name='Tokol', coordinate=(47.35, 18.98333), altitude=101, country='Hungary'),
-    'LHUD': station(name='Szeged', coordinate=(46.25, 20.1), altitude=82, country='Hungary'),
-    'LIBA': station(name='Amendola', coordinate=(41.53333, 15.71667), altitude=57, country='Italy'),
-    'LIBC': station(name='Crotone', coordinate=(39.0, 17.06667), altitude=155, country='Italy'),
-    'LIBD': station(name='Bari / Palese Macchie', coordinate=(41.13333, 16.78333), altitude=34, country='Italy'),
-    'LIBE': station(name='Monte S. Angelo', coordinate=(41.7, 15.95), altitude=838, country='Italy'),
-    'LIBG': station(name='Grottaglie', coordinate=(40.51667, 17.4), altitude=64, country='Italy'),
-    'LIBH': station(name='Marina Di Ginosa', coordinate=(40.43333, 16.88333), altitude=2, country='Italy'),
-    'LIBN': station(name='Lecce', coordinate=(40.23333, 18.15), altitude=48, country='Italy'),
-    'LIBP': station(name='Pescara', coordinate=(42.43333, 14.2), altitude=10, country='Italy'),
-    'LIBQ': station(name='Monte Scuro', coordinate=(39.33333, 16.4), altitude=1710, country='Italy'),
-    'LIBR': station(name='Brindisi', coordinate=(40.65, 17.95), altitude=15, country='Italy'),
-    'LIBS': station(name='Campobasso', coordinate=(41.56667, 14.65), altitude=793, country='Italy'),
-    'LIBT': station(name='Termoli', coordinate=(42.0, 15.0), altitude=16, country='Italy'),
-    'LIBU': station(name='Latronico', coordinate=(40.08333, 16.01667), altitude=888, country='Italy'),
-    'LIBV': station(name='Gioia Del Colle', coordinate=(40.76667, 16.93333), altitude=345, country='Italy'),
-    'LIBW': station(name='Bonifati', coordinate=(39.58333, 15.88333), altitude=484, country='Italy'),
-    'LIBY': station(name='S. Maria Di Leuca', coordinate=(39.81667, 18.35), altitude=104, country='Italy'),
-    'LIBZ': station(name='Potenza', coordinate=(40.63333, 15.8), altitude=823, country='Italy'),
-    'LICA': station(name='Lamezia Terme', coordinate=(38.9, 16.25), altitude=15, country='Italy'),
-    'LICB': station(name='Comiso As Usaf', coordinate=(36.93333, 14.6), altitude=220, country='Italy'),
-    'LICC': station(name='Catania / Fontanarossa', coordinate=(37.46667, 15.05), altitude=11, country='Italy'),
-    'LICD': station(name='Lampedusa', coordinate=(35.5, 12.6), altitude=16, country='Italy'),
-    'LICE': station(name='Enna', coordinate=(37.56667, 14.28333), altitude=940, country='Italy'),
-    'LICF': station(name='Messina', coordinate=(38.2, 15.55), altitude=59, country='Italy'),
-    'LICG': station(name='Pantelleria', coordinate=(36.81667, 11.96667), altitude=191, country='Italy'),
-    'LICJ': station(name='Palermo / Punta Raisi', coordinate=(38.18333, 13.1), altitude=21, country='Italy'),
-    'LICL': station(name='Gela', coordinate=(37.08333, 14.21667), altitude=11, country='Italy'),
-    'LICM': station(name='Calopezzati', coordinate=(39.55, 16.8), altitude=179, country='Italy'),
-    'LICO': station(name='Cozzo Spadaro', coordinate=(36.68333, 15.13333), altitude=46, country='Italy'),
-    'LICP': station(name='Palermo Boccadifalco', coordinate=(38.1, 13.3), altitude=107, country='Italy'),
-    'LICR': station(name='Reggio Calabria', coordinate=(38.06667, 15.65), altitude=11, country='Italy'),
-    'LICT': station(name='Trapani / Birgi', coordinate=(37.91667, 12.5), altitude=7, country='Italy'),
-    'LICU': station(name='Ustica', coordinate=(38.7, 13.18333), altitude=250, country='Italy'),
-    'LICZ': station(name='Catania / Sigonella', coordinate=(37.4, 14.91667), altitude=22, country='Italy'),
-    'LIEA': station(name='Alghero', coordinate=(40.63333, 8.28333), altitude=23, country='Italy'),
-    'LIEB': station(name='Capo Bellavista', coordinate=(39.93333, 9.71667), altitude=138, country='Italy'),
-    'LIEC': station(name='Capo Carbonara', coordinate=(39.1, 9.51667), altitude=116, country='Italy'),
-    'LIED': station(name='Decimomannu', coordinate=(39.35, 8.96667), altitude=29, country='Italy'),
-    'LIEE': station(name='Cagliari / Elmas', coordinate=(39.25, 9.06667), altitude=4, country='Italy'),
-    'LIEF': station(name='Capo Frasca', coordinate=(39.75, 8.46667), altitude=89, country='Italy'),
-    'LIEG': station(name='Guardiavecchia', coordinate=(41.21667, 9.4), altitude=158, country='Italy'),
-    'LIEH': station(name='Capo Caccia', coordinate=(40.56667, 8.16667), altitude=200, country='Italy'),
-    'LIEL': station(name='Capo S. Lorenzo', coordinate=(39.5, 9.63333), altitude=4, country='Italy'),
-    'LIEN': station(name='Fonni', coordinate=(40.11667, 9.25), altitude=1022, country='Italy'),
-    'LIEO': station(name='Olbia / Costa Smeralda', coordinate=(40.9, 9.51667), altitude=11, country='Italy'),
-    'LIEP': station(name='Perdasdefogu', coordinate=(39.66667, 9.43333), altitude=608, country='Italy'),
-    'LIMC': station(name='Milano / Malpensa', coordinate=(45.61667, 8.73333), altitude=234, country='Italy'),
-    'LIME': station(name='Bergamo / Orio Al Serio', coordinate=(45.66667, 9.7), altitude=238, country='Italy'),
-    'LIMF': station(name='Torino / Caselle', coordinate=(45.21667, 7.65), altitude=301, country='Italy'),
-    'LIMG': station(name='Albenga', coordinate=(44.05, 8.11667), altitude=45, country='Italy'),
-    'LIMH': station(name='Pian Rosa', coordinate=(45.93333, 7.7), altitude=3480, country='Italy'),
-    'LIMJ': station(name='Genova / Sestri', coordinate=(44.41667, 8.85), altitude=2, country='Italy'),
-    'LIMK': station(name='Torino / Bric Della Croce', coordinate=(45.03333, 7.73333), altitude=709, country='Italy'),
-    'LIML': station(name='Milano / Linate', coordinate=(45.43333, 9.28333), altitude=107, country='Italy'),
-    'LIMN': station(name='Novara / Cameri', coordinate=(45.51667, 8.66667), altitude=178, country='Italy'),
-    'LIMO': station(name='Monte Bisbino', coordinate=(45.86667, 9.06667), altitude=1319, country='Italy'),
-    'LIMP': station(name='Parma', coordinate=(44.82139, 10.29472), altitude=50, country='Italy'),
-    'LIMS': station(name='Piacenza', coordinate=(44.91667, 9.73333), altitude=134, country='Italy'),
-    'LIMT': station(name='Passo Della Cisa', coordinate=(44.43333, 9.93333), altitude=1039, country='Italy'),
-    'LIMU': station(name='Capo Mele', coordinate=(43.95, 8.16667), altitude=220, country='Italy'),
-    'LIMV': station(name='Passo Dei Giovi', coordinate=(44.63333, 8.93333), altitude=468, country='Italy'),
-    'LIMY': station(name='Monte Malanotte', coordinate=(44.25, 7.8), altitude=1741, country='Italy'),
-    'LIMZ': station(name='Cuneo / Levaldigi', coordinate=(44.54639, 7.62222), altitude=386, country='Italy'),
-    'LIPA': station(name='Aviano', coordinate=(46.03333, 12.6), altitude=128, country='Italy'),
-    'LIPB': station(name='Bolzano', coordinate=(46.46667, 11.33333), altitude=1459, country='Italy'),
-    'LIPC': station(name='Cervia', coordinate=(44.21667, 12.3), altitude=6, country='Italy'),
-    'LIPD': station(name='Udine / Campoformido', coordinate=(46.03333, 13.18333), altitude=93, country='Italy'),
-    'LIPE': station(name='Bologna / Borgo Panigale', coordinate=(44.53333, 11.3), altitude=36, country='Italy'),
-    'LIPF': station(name='Ferrara', coordinate=(44.83333, 11.61667), altitude=10, country='Italy'),
-    'LIPH': station(name='Treviso / S. Angelo', coordinate=(45.65, 12.18333), altitude=18, country='Italy'),
-    'LIPI': station(name='Udine / Rivolto', coordinate=(45.98333, 13.03333), altitude=51, country='Italy'),
-    'LIPK': station(name='Forli', coordinate=(44.2, 12.06667), altitude=27, country='Italy'),
-    'LIPL': station(name='Brescia / Ghedi', coordinate=(45.41667, 10.28333), altitude=102, country='Italy'),
-    'LIPO': station(name='Brescia / Montichia', coordinate=(45.40056, 10.31639), altitude=104, country='Italy'),
-    'LIPP': station(name='Dova Area Control Center', coordinate=(45.4, 11.86667), altitude=14, country='Italy'),
-    'LIPQ': station(name='Ronchi Dei Legionari', coordinate=(45.81667, 13.48333), altitude=12, country='Italy'),
-    'LIPR': station(name='Rimini', coordinate=(44.03333, 12.61667), altitude=12, country='Italy'),
-    'LIPS': station(name='Treviso / Istrana', coordinate=(45.68333, 12.1), altitude=45, country='Italy'),
-    'LIPT': station(name='Vicenza', coordinate=(45.56667, 11.51667), altitude=39, country='Italy'),
-    'LIPX': station(name='Verona / Villafranca', coordinate=(45.38333, 10.86667), altitude=67, country='Italy'),
-    'LIPY': station(name='Falconara', coordinate=(43.61667, 13.36667), altitude=12, country='Italy'),
-    'LIPZ': station(name='Venezia / Tessera', coordinate=(45.5, 12.33333), altitude=2, country='Italy'),
-    'LIQB': station(name='Arezzo', coordinate=(43.46667, 11.85), altitude=248, country='Italy'),
-    'LIQC': station(name='Capri', coordinate=(40.55, 14.2), altitude=160, country='Italy'),
-    'LIQD': station(name='Porretta Pass', coordinate=(44.03333, 10.93333), altitude=932, country='Italy'),
-    'LIQI': station(name='Gran Sasso Mountain Range', coordinate=(42.45, 13.7), altitude=2138, country='Italy'),
-    'LIQJ': station(name='Civitavecchia', coordinate=(42.03333, 11.83333), altitude=3, country='Italy'),
-    'LIQK': station(name='Capo Palinuro', coordinate=(40.01667, 15.28333), altitude=184, country='Italy'),
-    'LIQN': station(name='Rieti', coordinate=(42.41667, 12.85), altitude=389, country='Italy'),
-    'LIQO': station(name='Monte Argentario', coordinate=(42.38333, 11.16667), altitude=630, country='Italy'),
-    'LIQP': station(name='Isola Di Palmaria', coordinate=(44.03333, 9.83333), altitude=192, country='Italy'),
-    'LIQR': station(name='Radicofani', coordinate=(42.9, 11.76667), altitude=816, country='Italy'),
-    'LIQV': station(name='Volterra', coordinate=(43.4, 10.86667), altitude=555, country='Italy'),
-    'LIQW': station(name='Sarzana / Luni', coordinate=(44.08333, 9.98333), altitude=9, country='Italy'),
-    'LIQZ': station(name='Ponza', coordinate=(40.91667, 12.95), altitude=184, country='Italy'),
-    'LIRA': station(name='Roma / Ciampino', coordinate=(41.78333, 12.58333), altitude=129, country='Italy'),
-    'LIRB': station(name='Vigna Di Valle', coordinate=(42.08333, 12.21667), altitude=262, country='Italy'),
-    'LIRE': station(name='Pratica Di Mare', coordinate=(41.65, 12.45), altitude=6, country='Italy'),
-    'LIRF': station(name='Roma Fiumicino', coordinate=(41.8, 12.23333), altitude=2, country='Italy'),
-    'LIRG': station(name='Guidonia', coordinate=(42.0, 12.73333), altitude=88, country='Italy'),
-    'LIRH': station(name='Frosinone', coordinate=(41.63333, 13.3), altitude=180, country='Italy'),
-    'LIRI': station(name='Pontecagnano Air Force Base', coordinate=(40.61667, 14.91667), altitude=40, country='Italy'),
-    'LIRJ': station(name='M. Calamita', coordinate=(42.73333, 10.4), altitude=396, country='Italy'),
-    'LIRK': station(name='Monte Terminillo', coordinate=(42.46667, 12.98333), altitude=1874, country='Italy'),
-    'LIRL': station(name='Latina', coordinate=(41.55, 12.9), altitude=25, country='Italy'),
-    'LIRM': station(name='Grazzanise', coordinate=(41.05, 14.06667), altitude=9, country='Italy'),
-    'LIRN': station(name='Napoli / Capodichino', coordinate=(40.85, 14.3), altitude=88, country='Italy'),
-    'LIRP': station(name='Pisa / S. Giusto', coordinate=(43.68333, 10.38333), altitude=2, country='Italy'),
-    'LIRQ': station(name='Firenze / Peretola', coordinate=(43.8, 11.2), altitude=40, country='Italy'),
-    'LIRS': station(name='Grosseto', coordinate=(42.75, 11.06667), altitude=5, country='Italy'),
-    'LIRT': station(name='Trevico', coordinate=(41.05, 15.23333), altitude=1085, country='Italy'),
-    'LIRU': station(name='Roma / Urbe', coordinate=(41.95, 12.5), altitude=18, country='Italy'),
-    'LIRV': station(name='Viterbo', coordinate=(42.43333, 12.05), altitude=300, country='Italy'),
-    'LIRZ': station(name='Perugia', coordinate=(43.08333, 12.5), altitude=208, country='Italy'),
-    'LIVC': station(name='Monte Cimone', coordinate=(44.2, 10.7), altitude=2165, country='Italy'),
-    'LIVD': station(name='Dobbiaco', coordinate=(46.73333, 12.21667), altitude=1222, country='Italy'),
-    'LIVE': station(name='Resia Pass', coordinate=(46.83333, 10.5), altitude=1800, country='Italy'),
-    'LIVF': station(name='Frontone', coordinate=(43.51667, 12.73333), altitude=570, country='Italy'),
-    'LIVM': station(name='Punta Marina', coordinate=(44.45, 12.3), altitude=2, country='Italy'),
-    'LIVO': station(name='Tarvisio', coordinate=(46.5, 13.58333), altitude=777, country='Italy'),
-    'LIVP': station(name='Paganella', coordinate=(46.15, 11.03333), altitude=2125, country='Italy'),
-    'LIVR': station(name='Passo Rolle', coordinate=(46.3, 11.78333), altitude=2004, country='Italy'),
-    'LIVT': station(name='Trieste', coordinate=(45.65, 13.75), altitude=8, country='Italy'),
-    'LIYW': station(name='Aviano Usaf', coordinate=(46.03333, 12.61667), altitude=126, country='Italy'),
-    'LJLJ': station(name='Ljubljana / Brnik', coordinate=(46.21667, 14.48333), altitude=385, country='Slovenia'),
-    'LJMB': station(name='Maribor / Slivnica', coordinate=(46.48333, 15.68333), altitude=264, country='Slovenia'),
-    'LJMS': station(name='Murska Sobota', coordinate=(46.65, 16.18333), altitude=188, country='Slovenia'),
-    'LJPZ': station(name='Portoroz', coordinate=(45.51667, 13.56667), altitude=95, country='Slovenia'),
-    'LKHO': station(name='Holesov', coordinate=(49.31667, 17.56667), altitude=224, country='Czech Republic'),
-    'LKKU': station(name='Kunovice', coordinate=(49.02944, 17.43972), altitude=177, country='Czech Republic'),
-    'LKKV': station(name='Karlovy Vary', coordinate=(50.2, 12.91667), altitude=603, country='Czech Republic'),
-    'LKKZ': station(name='Kosice', coordinate=(48.66667, 21.21667), altitude=230, country='Slovakia'),
-    'LKLB': station(name='Liberec', coordinate=(50.76833, 15.025), altitude=405, country='Czech Republic'),
-    'LKMT': station(name='Ostrava / Mosnov', coordinate=(49.68333, 18.11667), altitude=256, country='Czech Republic'),
-    'LKPP': station(name='Piestany', coordinate=(48.61667, 17.83333), altitude=163, country='Slovakia'),
-    'LKPR': station(name='Praha / Ruzyne', coordinate=(50.1, 14.25), altitude=365, country='Czech Republic'),
-    'LKSL': station(name='Sliac', coordinate=(48.65, 19.15), altitude=314, country='Slovakia'),
-    'LKTB': station(name='Brno / Turany', coordinate=(49.15, 16.7), altitude=241, country='Czech Republic'),
-    'LLBG': station(name='Ben-Gurion International Airport', coordinate=(32.0, 34.9), altitude=40, country='Israel'),
-    'LLBS': station(name='Beer-Sheva', coordinate=(31.23333, 34.78333), altitude=275, country='Israel'),
-    'LLET': station(name='Eilat', coordinate=(29.55, 34.95), altitude=12, country='Israel'),
-    'LLHA': station(name='Sde-Haifa Haifa', coordinate=(32.8, 35.03333), altitude=8, country='Israel'),
-    'LLIB': station(name='Galilee / Pina', coordinate=(32.98, 35.57), altitude=None, country='Israel'),
-    'LLJR': station(name='Jerusalem Airport', coordinate=(31.86667, 35.21667), altitude=749, country='Israel'),
-    'LLOV': station(name='Ovda', coordinate=(30.0, 34.83333), altitude=432, country='Israel'),
-    'LLSD': station(name='Tel Aviv / Sde-Dov Airport', coordinate=(32.11472, 34.78222), altitude=13, country='Israel'),
-    'LMML': station(name='Luqa', coordinate=(35.85, 14.48333), altitude=91, country='Malta'),
-    'LOAG': station(name='Krems-Langenlois', coordinate=(48.44611, 15.63361), altitude=312, country='Austria'),
-    'LOAN': station(name='Niederosterreich / Wiener Neustadt-Ost Flugplatz', coordinate=(47.84333, 16.25806), altitude=272, country='Austria'),
-    'LOAV': station(name='Niederosterreich / Lugplatz  Voslau', coordinate=(47.96444, 16.25944), altitude=233, country='Austria'),
-    'LOGG': station(name='Punitz-Gussing', coordinate=(47.1475, 16.31778), altitude=290, country='Austria'),
-    'LOIH': station(name='Hohenems-Dornbirn', coordinate=(47.38472, 9.70056), altitude=418, country='Austria'),
-    'LOLF': station(name='Oberosterreich / Freistadt Flugplatz', coordinate=(48.51472, 14.40889), altitude=685, country='Austria'),
-    'LOLW': station(name='Wels', coordinate=(48.16667, 14.03333), altitude=None, country='Austria'),
-    'LOWG': station(name='Graz-Thalerhof-Flughafen', coordinate=(47.0, 15.43333), altitude=340, country='Austria'),
-    'LOWI': station(name='Innsbruck-Flughafen', coordinate=(47.26667, 11.35), altitude=581, country='Austria'),
-    'LOWK': station(name='Klagenfurt-Flughafen', coordinate=(46.65, 14.33333), altitude=448, country='Austria'),
-    'LOWL': station(name='Linz / Hoersching-Flughafen', coordinate=(48.23333, 14.18333), altitude=298, country='Austria'),
-    'LOWS': station(name='Salzburg-Flughafen', coordinate=(47.8, 13.0), altitude=430, country='Austria'),
-    'LOWW': station(name='Wien / Schwechat-Flughafen', coordinate=(48.11667, 16.56667), altitude=183, country='Austria'),
-    'LOWZ': station(name='Zell Am See', coordinate=(47.2925, 12.7875), altitude=754, country='Austria'),
-    'LOXA': station(name='Aigen Im Ennstal', coordinate=(47.53333, 14.13333), altitude=638, country='Austria'),
-    'LOXL': station(name='Horsching Aus-Afb', coordinate=(48.23333, 14.18333), altitude=313, country='Austria'),
-    'LOXS': station(name='Schwaz Heliport', coordinate=(47.33333, 11.7), altitude=543, country='Austria'),
-    'LOXT': station(name='Tulln', coordinate=(48.31667, 16.11667), altitude=175, country='Austria'),
-    'LOXZ': station(name='Zeltweg', coordinate=(47.2, 14.75), altitude=677, country='Austria'),
-    'LPAZ': station(name='Santa Maria Acores', coordinate=(36.96667, -25.16667), altitude=100, country='Portugal'),
-    'LPBG': station(name='Braganca', coordinate=(41.8, -6.73333), altitude=691, country='Portugal'),
-    'LPBJ': station(name='Beja', coordinate=(38.01667, -7.86667), altitude=246, country='Portugal'),
-    'LPFL': station(name='Flores Acores', coordinate=(39.45, -31.13333), altitude=28, country='Portugal'),
-    'LPFR': station(name='Faro / Aeroporto', coordinate=(37.01667, -7.96667), altitude=7, country='Portugal'),
-    'LPFU': station(name='Funchal / S. Catarina', coordinate=(32.68333, -16.76667), altitude=58, country='Portugal'),
-    'LPHR': station(name='Horta / Castelo Branco Acores', coordinate=(38.51667, -28.71667), altitude=40, country='Portugal'),
-    'LPLA': station(name='Lajes Acores', coordinate=(38.76667, -27.1), altitude=52, country='Portugal'),
-    'LPMA': station(name='Aeroporto Da Madeira', coordinate=(32.69778, -16.77444), altitude=59, country='Portugal'),
-    'LPMR': station(name='Monte Real Mil.', coordinate=(39.83111, -8.88722), altitude=57, country='Portugal'),
-    'LPMT': station(name='Montijo Mil.', coordinate=(38.70389, -9.03583), altitude=14, country='Portugal'),
-    'LPOV': station(name='Ovar Mil.', coordinate=(40.91583, -8.64583), altitude=17, country='Portugal'),
-    'LPPD': station(name='Ponta Delgada / Nordela Acores', coordinate=(37.73333, -25.7), altitude=71, country='Portugal'),
-    'LPPR': station(name='Porto / Pedras Rubras', coordinate=(41.23333, -8.68333), altitude=69, country='Portugal'),
-    'LPPS': station(name='Porto Santo', coordinate=(33.06667, -16.35), altitude=97, country='Portugal'),
-    'LPPT': station(name='Lisboa / Portela', coordinate=(38.76667, -9.13333), altitude=114, country='Portugal'),
-    'LPST': station(name='Sintra Mil.', coordinate=(38.83111, -9.33944), altitude=134, country='Portugal'),
-    'LPTN': station(name='Tancos Mil.', coordinate=(39.47528, -8.36444), altitude=81, country='Portugal'),
-    'LPVR': station(name='Vila Real', coordinate=(41.26667, -7.71667), altitude=561, country='Portugal'),
-    'LQBI': station(name='Bihac', coordinate=(44.81667, 15.88333), altitude=250, country='Serbia and Montenegro'),
-    'LQBK': station(name='Banja Luka', coordinate=(44.78333, 17.21667), altitude=156, country='Bosnia and Herzegovina'),
-    'LQLV': station(name='Livno', coordinate=(43.83333, 17.01667), altitude=724, country='Bosnia and Herzegovina'),
-    'LQMO': station(name='Mostar', coordinate=(43.35, 17.8), altitude=108, country='Bosnia and Herzegovina'),
-    'LQSA': station(name='Sarajevo', coordinate=(43.81667, 18.33333), altitude=511, country='Bosnia and Herzegovina'),
-    'LQTZ': station(name='Tuzla', coordinate=(44.55, 18.7), altitude=306, country='Bosnia and Herzegovina'),
-    'LRAR': station(name='Arad', coordinate=(46.2, 21.4), altitude=117, country='Romania'),
-    'LRBC': station(name='Bacau', coordinate=(46.58333, 26.96667), altitude=184, country='Romania'),
-    'LRBM': station(name='Baia Mare', coordinate=(47.66667, 23.58333), altitude=218, country='Romania'),
-    'LRBS': station(name='Bucuresti / Imh', coordinate=(44.5, 26.13333), altitude=90, country='Romania'),
-    'LRCK': station(name='Kogalniceanu', coordinate=(44.33333, 28.43333), altitude=97, country='Romania'),
-    'LRCL': station(name='Cluj-Napoca', coordinate=(46.78333, 23.56667), altitude=410, country='Romania'),
-    'LRCS': station(name='Caransebes', coordinate=(45.41667, 22.25), altitude=241, country='Romania'),
-    'LRCV': station(name='Craiova', coordinate=(44.23333, 23.86667), altitude=192, country='Romania'),
-    'LRIA': station(name='Iasi', coordinate=(47.16667, 27.63333), altitude=102, country='Romania'),
-    'LROD': station(name='Oradea', coordinate=(47.05, 21.93333), altitude=135, country='Romania'),
-    'LROP': station(name='Bucuresti Otopeni', coordinate=(44.55, 26.1), altitude=95, country='Romania'),
-    'LRSB': station(name='Sibiu', coordinate=(45.8, 24.15), altitude=443, country='Romania'),
-    'LRSM': station(name='Satu Mare', coordinate=(47.8, 22.88333), altitude=123, country='Romania'),
-    'LRSV': station(name='Suceava / Salcea', coordinate=(47.65, 26.25), altitude=351, country='Romania'),
-    'LRTC': station(name='Tulcea', coordinate=(45.18333, 28.81667), altitude=4, country='Romania'),
-    'LRTM': station(name='Tirgu Mures', coordinate=(46.53333, 24.53333), altitude=308, country='Romania'),
-    'LRTR': station(name='Timisoara', coordinate=(45.76667, 21.25), altitude=86, country='Romania'),
-    'LSGC': station(name='Les Eplatures', coordinate=(47.08417, 6.79361), altitude=1027, country='Switzerland'),
-    'LSGG': station(name='Geneve-Cointrin', coordinate=(46.25, 6.13333), altitude=420, country='Switzerland'),
-    'LSGL': station(name='Lausanne', coordinate=(46.55, 6.61667), altitude=616, country='Switzerland'),
-    'LSGN': station(name='Neuchatel', coordinate=(47.0, 6.95), altitude=485, country='Switzerland'),
-    'LSGS': station(name='Sion', coordinate=(46.21667, 7.33333), altitude=482, country='Switzerland'),
-    'LSMP': station(name='Payerne', coordinate=(46.81667, 6.95), altitude=490, country='Switzerland'),
-    'LSZA': station(name='Lugano', coordinate=(46.0, 8.96667), altitude=273, country='Switzerland'),
-    'LSZB': station(name='Bern / Belp', coordinate=(46.91667, 7.5), altitude=505, country='Switzerland'),
-    'LSZG': station(name='Grenchen', coordinate=(47.18139, 7.41639), altitude=430, country='Switzerland'),
-    'LSZH': station(name='Zurich-Kloten', coordinate=(47.48333, 8.53333), altitude=436, country='Switzerland'),
-    'LSZR': station(name='Saint Gallen-Altenrhein', coordinate=(47.485, 9.56194), altitude=398, country='Switzerland'),
-    'LTAB': station(name='Ankara / Guvercin Lik', coordinate=(39.93333, 32.75), altitude=819, country='Turkey'),
-    'LTAC': station(name='Ankara / Esenboga', coordinate=(40.11667, 32.98333), altitude=953, country='Turkey'),
-    'LTAD': station(name='Ankara / Etimesgut', coordinate=(39.95, 32.68333), altitude=799, country='Turkey'),
-    'LTAE': station(name='Murted Tur-Afb', coordinate=(40.08333, 32.56667), altitude=843, country='Turkey'),
-    'LTAF': station(name='Adana / Sakirpasa', coordinate=(36.98333, 35.3), altitude=20, country='Turkey'),
-    'LTAG': station(name='Adana / Incirlik', coordinate=(37.0, 35.41667), altitude=73, country='Turkey'),
-    'LTAH': station(name='Afyon', coordinate=(38.75, 30.53333), altitude=1034, country='Turkey'),
-    'LTAI': station(name='Antalya', coordinate=(36.7, 30.73333), altitude=50, country='Turkey'),
-    'LTAJ': station(name='Gaziantep', coordinate=(37.08333, 37.36667), altitude=701, country='Turkey'),
-    'LTAK': station(name='Iskenderun', coordinate=(36.58333, 36.16667), altitude=3, country='Turkey'),
-    'LTAN': station(name='Konya', coordinate=(37.96667, 32.55), altitude=1032, country='Turkey'),
-    'LTAP': station(name='Merzifon', coordinate=(40.85, 35.58333), altitude=545, country='Turkey'),
-    'LTAQ': station(name='Samsun', coordinate=(41.26667, 36.3), altitude=162, country='Turkey'),
-    'LTAR': station(name='Sivas', coordinate=(39.75, 37.01667), altitude=1285, country='Turkey'),
-    'LTAS': station(name='Zonguldak', coordinate=(41.45, 31.8), altitude=136, country='Turkey'),
-    'LTAT': station(name='Malatya / Erhac', coordinate=(38.43333, 38.08333), altitude=862, country='Turkey'),
-    'LTAU': station(name='Kayseri / Erkilet', coordinate=(38.78333, 35.48333), altitude=1053, country='Turkey'),
-    'LTAV': station(name='Sivrihisar', coordinate=(39.45, 31.35), altitude=96, country='Turkey'),
-    'LTAW': station(name='Tokat', coordinate=(40.3, 36.56667), altitude=608, country='Turkey'),
-    'LTAY': station(name='Cardak', coordinate=(37.78333, 29.7), altitude=849, country='Turkey'),
-    'LTAZ': station(name='Nevsehir', coordinate=(38.77, 34.54167), altitude=945, country='Turkey'),
-    'LTBA': station(name='Istanbul / Ataturk', coordinate=(40.96667, 28.81667), altitude=48, country='Turkey'),
-    'LTBD': station(name='Aydin', coordinate=(37.85, 27.85), altitude=57, country='Turkey'),
-    'LTBE': station(name='Bursa', coordinate=(40.18333, 29.06667), altitude=101, country='Turkey'),
-    'LTBF': station(name='Balikesir', coordinate=(39.61667, 27.91667), altitude=101, country='Turkey'),
-    'LTBG': station(name='Bandirma', coordinate=(40.31667, 27.96667), altitude=51, country='Turkey'),
-    'LTBH': station(name='Canakkale', coordinate=(40.13333, 26.4), altitude=3, country='Turkey'),
-    'LTBI': station(name='Eskisehir', coordinate=(39.78333, 30.56667), altitude=785, country='Turkey'),
-    'LTBJ': station(name='Izmir / Adnan Menderes', coordinate=(38.26667, 27.15), altitude=125, country='Turkey'),
-    'LTBL': station(name='Izmir / Cigli', coordinate=(38.5, 27.01667), altitude=5, country='Turkey'),
-    'LTBM': station(name='Isparta', coordinate=(37.75, 30.55), altitude=997, country='Turkey'),
-    'LTBO': station(name='Usak', coordinate=(38.66667, 29.41667), altitude=919, country='Turkey'),
-    'LTBQ': station(name='Topel Tur-Afb', coordinate=(40.73333, 30.08333), altitude=50, country='Turkey'),
-    'LTBR': station(name='Bursa / Yenisehir, Mil-Civ', coordinate=(40.25528, 29.5625), altitude=233, country='Turkey'),
-    'LTBS': station(name='Dalaman', coordinate=(36.7, 28.78333), altitude=7, country='Turkey'),
-    'LTBT': station(name='Akhisar', coordinate=(38.91667, 27.85), altitude=93, country='Turkey'),
-    'LTBU': station(name='Corlu', coordinate=(41.13333, 27.91667), altitude=173, country='Turkey'),
-    'LTBV': station(name='Bodrum', coordinate=(37.03333, 27.41667), altitude=27, country='Turkey'),
-    'LTCA': station(name='Elazig', coordinate=(38.6, 39.28333), altitude=902, country='Turkey'),
-    'LTCC': station(name='Diyarbakir', coordinate=(37.88333, 40.18333), altitude=686, country='Turkey'),
-    'LTCD': station(name='Erzincan', coordinate=(39.73333, 39.5), altitude=1156, country='Turkey'),
-    'LTCE': station(name='Erzurum', coordinate=(39.91667, 41.26667), altitude=1756, country='Turkey'),
-    'LTCF': station(name='Kars', coordinate=(40.6, 43.08333), altitude=1775, country='Turkey'),
-    'LTCG': station(name='Trabzon', coordinate=(41.0, 39.71667), altitude=35, country='Turkey'),
-    'LTCH': station(name='Urfa', coordinate=(37.13333, 38.76667), altitude=547, country='Turkey'),
-    'LTCI': station(name='Van', coordinate=(38.45, 43.31667), altitude=1667, country='Turkey'),
-    'LTCJ': station(name='Batman', coordinate=(37.86667, 41.16667), altitude=540, country='Turkey'),
-    'LTCK': station(name='Mus Tur-Afb', coordinate=(38.75, 41.66667), altitude=1266, country='Turkey'),
-    'LTFA': station(name='Izmir \\ Kaklic', coordinate=(38.51667, 26.98333), altitude=4, country='Turkey'),
-    'LTFC': station(name='Suleyman Demirel', coordinate=(37.85, 30.36667), altitude=864, country='Turkey'),
-    'LTFE': station(name='Bodrum Milas Airport', coordinate=(37.24806, 27.68194), altitude=6, country='Turkey'),
-    'LTFH': station(name='Samsun / Carsamba', coordinate=(41.25417, 36.5675), altitude=5, country='Turkey'),
-    'LTFJ': station(name='Istanbul / Sabiha Gokcen', coordinate=(40.89861, 29.30917), altitude=95, country='Turkey'),
-    'LUBL': station(name='Baltsi-Leadoveni - The North of Moldova', coordinate=(47.83417, 27.76917), altitude=231, country='Moldova'),
-    'LUCH': station(name='Kaxul - The South of Moldova', coordinate=(45.84389, 28.26528), altitude=199, country='Moldova'),
-    'LUKK': station(name='Chisinau International Airport', coordinate=(46.92778, 28.93083), altitude=122, country='Moldova'),
-    'LWOH': station(name='Ohrid', coordinate=(41.11667, 20.8), altitude=760, country='Macedonia, The Republic of'),
-    'LWSK': station(name='Skopje-Petrovec', coordinate=(41.96667, 21.65), altitude=238, country='Macedonia, The Republic of'),
-    'LXGB': station(name='Gibraltar', coordinate=(36.15, -5.35), altitude=5, country='Gibraltar'),
-    'LYBE': station(name='Beograd / Surcin', coordinate=(44.81667, 20.28333), altitude=96, country='Serbia and Montenegro'),
-    'LYNI': station(name='Nis', coordinate=(43.33333, 21.9), altitude=202, country='Serbia and Montenegro'),
-    'LYPG': station(name='Podgorica Titograd', coordinate=(42.43333, 19.28333), altitude=53, country='Serbia and Montenegro'),
-    'LYPR': station(name='Pristina', coordinate=(42.56667, 21.03333), altitude=545, country='Serbia and Montenegro'),
-    'LYPZ': station(name='Portoroz / Secovlje', coordinate=(45.48333, 13.61667), altitude=2, country='Slovenia'),
-    'LYTI': station(name='Podgorica / Golubovci', coordinate=(42.36667, 19.25), altitude=33, country='Serbia and Montenegro'),
-    'LYTV': station(name='Tivat', coordinate=(42.4, 18.73333), altitude=5, country='Serbia and Montenegro'),
-    'LYVR': station(name='Vrsac', coordinate=(45.15, 21.31667), altitude=83, country='Serbia and Montenegro'),
-    'LZIB': station(name='Bratislava Ivanka', coordinate=(48.2, 17.2), altitude=133, country='Slovakia'),
-    'LZKC': station(name='Kamenica Nad Cirochou', coordinate=(48.93333, 22.0), altitude=177, country='Slovakia'),
-    'LZKZ': station(name='Kosice, Barca', coordinate=(48.66306, 21.24111), altitude=232, country='Slovakia'),
-    'LZLU': station(name='Lucenec', coordinate=(48.33333, 19.73333), altitude=214, country='Slovakia'),
-    'LZNI': station(name='Nitra', coordinate=(48.27944, 18.13278), altitude=134, country='Slovakia'),
-    'LZPE': station(name='Prievidza', coordinate=(48.76639, 18.58833), altitude=260, country='Slovakia'),
-    'LZPP': station(name='Piestany', coordinate=(48.625, 17.82861), altitude=163, country='Slovakia'),
-    'LZSL': station(name='Sliac', coordinate=(48.63806, 19.13417), altitude=318, country='Slovakia'),
-    'LZTT': station(name='Poprad / Tatry', coordinate=(49.06667, 20.25), altitude=694, country='Slovakia'),
-    'LZZI': station(name='Dolny Hricov', coordinate=(49.23333, 18.61361), altitude=312, country='Slovakia'),
-    'MBPV': station(name='Providenciales', coordinate=(21.77361, -72.26583), altitude=5, country='Turks and Caicos Islands'),
-    'MDBH': station(name='Barahona', coordinate=(18.2, -71.1), altitude=3, country='Dominican Republic'),
-    'MDHE': station(name='Herrera', coordinate=(18.46667, -69.96667), altitude=58, country='Dominican Republic'),
-    'MDLR': station(name='La Romana International Airport', coordinate=(18.41667, -68.95), altitude=8, country='Dominican Republic'),
-    'MDPC': station(name='Punta Cana', coordinate=(18.56667, -68.36667), altitude=12, country='Dominican Republic'),
-    'MDPP': station(name='Puerto Plata International', coordinate=(19.75, -70.55), altitude=15, country='Dominican Republic'),
-    'MDSD': station(name='Las Americas', coordinate=(18.43333, -69.66667), altitude=18, country='Dominican Republic'),
-    'MDSI': station(name='San Isidro Air Force Base', coordinate=(18.5, -69.76667), altitude=111, country='Dominican Republic'),
-    'MDST': station(name='Santiago', coordinate=(19.45, -70.7), altitude=183, country='Dominican Republic'),
-    'MGCB': station(name='Coban', coordinate=(15.46667, -90.31667), altitude=1316, country='Guatemala'),
-    'MGFL': station(name='Flores', coordinate=(16.91667, -89.88333), altitude=115, country='Guatemala'),
-    'MGGT': station(name='Guatemala Aeropuertola Aurora', coordinate=(14.58333, -90.51667), altitude=1489, country='Guatemala'),
-    'MGHT': station(name='Huehuetenango', coordinate=(15.31667, -91.46667), altitude=1901, country='Guatemala'),
-    'MGPB': station(name='Puerto Barrios', coordinate=(15.71667, -88.6), altitude=1, country='Guatemala'),
-    'MGQZ': station(name='Quezaltenango', coordinate=(14.83333, -91.51667), altitude=2500, country='Guatemala'),
-    'MGRT': station(name='Retalhuleu', coordinate=(14.53333, -91.66667), altitude=239, country='Guatemala'),
-    'MGSJ': station(name='San Jose', coordinate=(13.91667, -90.81667), altitude=2, country='Guatemala'),
-    'MGTK': station(name='Tikal', coordinate=(16.9, -89.85), altitude=128, country='Guatemala'),
-    'MGZA': station(name='Zacapa', coordinate=(14.96667, -89.53333), altitude=490, country='Guatemala'),
-    'MHAM': station(name='Amapala', coordinate=(13.26667, -87.65), altitude=5, country='Honduras'),
-    'MHCA': station(name='Catacamas', coordinate=(14.9, -85.93333), altitude=442, country='Honduras'),
-    'MHCH': station(name='Choluteca', coordinate=(13.3, -87.18333), altitude=48, country='Honduras'),
-    'MHIC': station(name='Islas Del Cisne', coordinate=(17.4, -83.93333), altitude=9, country='Honduras'),
-    'MHLC': station(name='La Ceiba Airport', coordinate=(15.73333, -86.86667), altitude=3, country='Honduras'),
-    'MHLE': station(name='La Esperanza', coordinate=(14.31667, -88.15), altitude=1100, country='Honduras'),
-    'MHLM': station(name='La Mesa San Pedro Sula', coordinate=(15.45, -87.93333), altitude=31, country='Honduras'),
-    'MHNJ': station(name='Guanaja', coordinate=(16.46667, -85.91667), altitude=2, country='Honduras'),
-    'MHNO': station(name='Guanaja', coordinate=(16.46667, -86.06667), altitude=2, country='Honduras'),
-    'MHPL': station(name='Puerto Lempira', coordinate=(15.21667, -83.8), altitude=13, country='Honduras'),
-    'MHRO': station(name='Roatan', coordinate=(16.31667, -86.51667), altitude=5, country='Honduras'),
-    'MHSC': station(name='Coronel Enrique Soto Cano Air Base', coordinate=(14.38333, -87.61667), altitude=628, country='Honduras'),
-    'MHSR': station(name='Santa Rosa De Copan', coordinate=(14.78333, -88.78333), altitude=1079, country='Honduras'),
-    'MHTE': station(name='Tela', coordinate=(15.71667, -87.48333), altitude=3, country='Honduras'),
-    'MHTG': station(name='Tegucigalpa', coordinate=(14.05, -87.21667), altitude=994, country='Honduras'),
-    'MHYR': station(name='Yoro', coordinate=(15.16667, -87.11667), altitude=670, country='Honduras'),
-    'MKJP': station(name='Kingston / Norman Manley', coordinate=(17.93333, -76.78333), altitude=3, country='Jamaica'),
-    'MKJS': station(name='Montego Bay / Sangster', coordinate=(18.5, -77.91667), altitude=1, country='Jamaica'),
-    'MMAA': station(name='Acapulco / G. Alvarez', coordinate=(16.76667, -99.75), altitude=5, country='Mexico'),
-    'MMAN': station(name='Aerop. Internacional Monterrey, N. L.', coordinate=(25.86667, -100.23333), altitude=448, country='Mexico'),
-    'MMAS': station(name='Aguascalientes, Ags.', coordinate=(21.88333, -102.3), altitude=1874, country='Mexico'),
-    'MMBT': station(name='Bahias De Huatulco', coordinate=(15.78333, -96.26667), altitude=143, country='Mexico'),
-    'MMCB': station(name='Cuernavaca, Mor.', coordinate=(18.88333, -99.23333), altitude=1618, country='Mexico'),
-    'MMCE': station(name='Ciudad Del Carmen', coordinate=(18.65, -91.8), altitude=2, country='Mexico'),
-    'MMCL': station(name='Culiacan, Sin.', coordinate=(24.81667, -107.4), altitude=39, country='Mexico'),
-    'MMCM': station(name='Chetumal, Q. Roo', coordinate=(18.48333, -88.3), altitude=9, country='Mexico'),
-    'MMCN': station(name='Ciudad Obregon', coordinate=(27.39278, -109.83306), altitude=62, country='Mexico'),
-    'MMCP': station(name='Campeche, Camp.', coordinate=(19.85, -90.55), altitude=5, country='Mexico'),
-    'MMCS': station(name='Ciudad Juarez International', coordinate=(31.63333, -106.43333), altitude=1171, country='Mexico'),
-    'MMCT': station(name='Chichen-Itza', coordinate=(20.64167, -88.44944), altitude=31, country='Mexico'),
-    'MMCU': station(name='Chihuahua International Airport', coordinate=(28.7, -105.96667), altitude=1360, country='Mexico'),
-    'MMCV': station(name='Ciudad Victoria Airport', coordinate=(23.71667, -98.96667), altitude=238, country='Mexico'),
-    'MMCZ': station(name='Cozumel Civ / Mil', coordinate=(20.53333, -86.93333), altitude=5, country='Mexico'),
-    'MMDO': station(name='Durango Airport', coordinate=(24.13333, -104.53333), altitude=1857, country='Mexico'),
-    'MMEP': station(name='Tepic, Nay.', coordinate=(21.51667, -104.9), altitude=922, country='Mexico'),
-    'MMGL': station(name='Don Miguel / Guadalaj', coordinate=(20.51667, -103.31667), altitude=1528, country='Mexico'),
-    'MMGM': station(name='Guaymas International Airport', coordinate=(27.96667, -110.93333), altitude=27, country='Mexico'),
-    'MMHO': station(name='Hermosillo, Son.', coordinate=(29.06667, -110.95), altitude=211, country='Mexico'),
-    'MMIA': station(name='Colima', coordinate=(19.26667, -103.58333), altitude=723, country='Mexico'),
-    'MMIO': station(name='Saltillo, Coah.', coordinate=(25.45, -100.98333), altitude=1790, country='Mexico'),
-    'MMIT': station(name='Ixtepec Ox', coordinate=(16.45, -95.08333), altitude=61, country='Mexico'),
-    'MMLC': station(name='Lazaro Cardenas', coordinate=(17.98333, -102.21667), altitude=12, country='Mexico'),
-    'MMLM': station(name='Los Mochis Airport', coordinate=(25.68333, -109.08333), altitude=4, country='Mexico'),
-    'MMLO': station(name='Del Bajio / Leon', coordinate=(21.0, -101.48333), altitude=1819, country='Mexico'),
-    'MMLP': station(name='La Paz International Airport', coordinate=(24.06667, -110.36667), altitude=21, country='Mexico'),
-    'MMLT': station(name='Loreto, B. C. S.', coordinate=(26.01667, -111.35), altitude=15, country='Mexico'),
-    'MMMA': station(name='Matamoros International', coordinate=(25.76667, -97.53333), altitude=8, country='Mexico'),
-    'MMMD': station(name='Merida / lic Manuel Crecencio', coordinate=(20.93333, -89.65), altitude=10, country='Mexico'),
-    'MMML': station(name='Mexicali International Airport', coordinate=(32.63333, -117.0), altitude=22, country='Mexico'),
-    'MMMM': station(name='Morelia New', coordinate=(19.85, -101.03333), altitude=1833, country='Mexico'),
-    'MMMT': station(name='Minatitlan', coordinate=(18.1, -94.58333), altitude=40, country='Mexico'),
-    'MMMV': station(name='Monclova, Coah.', coordinate=(26.88333, -101.41667), altitude=615, country='Mexico'),
-    'MMMX': station(name='Mexico City / Licenci', coordinate=(19.43333, -99.1), altitude=2238, country='Mexico'),
-    'MMMY': station(name='Monterrey / Gen Maria', coordinate=(25.78333, -100.1), altitude=387, country='Mexico'),
-    'MMMZ': station(name='Mazatlan / G. Buelna', coordinate=(23.16667, -106.26667), altitude=10, country='Mexico'),
-    'MMNL': station(name='Nuevo Laredo International', coordinate=(27.43333, -99.56667), altitude=148, country='Mexico'),
-    'MMOX': station(name='Oaxaca / Xoxocotlan', coordinate=(16.96667, -96.73333), altitude=1528, country='Mexico'),
-    'MMPA': station(name='Poza Rica / Palizada', coordinate=(20.51667, -97.46667), altitude=15, country='Mexico'),
-    'MMPB': station(name='Puebla, Pue.', coordinate=(19.05, -98.16667), altitude=2179, country='Mexico'),
-    'MMPG': station(name='Piedras Negras, Coah.', coordinate=(28.7, -100.51667), altitude=250, country='Mexico'),
-    'MMPN': station(name='Uruapan / Gen Rayon', coordinate=(19.4, -102.03333), altitude=1593, country='Mexico'),
-    'MMPR': station(name='Puerto Vallarta / Lic', coordinate=(20.68333, -105.25), altitude=6, country='Mexico'),
-    'MMPS': station(name='Puerto Escondido', coordinate=(15.86667, -97.08333), altitude=88, country='Mexico'),
-    'MMQT': station(name='Queretaro, Qro.', coordinate=(20.6, -100.38333), altitude=1813, country='Mexico'),
-    'MMRX': station(name='Reynosa International Airport', coordinate=(26.01667, -98.23333), altitude=39, country='Mexico'),
-    'MMSD': station(name='San Jose Del Cabo', coordinate=(23.15, -109.7), altitude=109, country='Mexico'),
-    'MMSP': station(name='San Luis Potosi, S. L. P.', coordinate=(22.15, -100.98333), altitude=1870, country='Mexico'),
-    'MMTC': station(name='Torreon, Coah.', coordinate=(25.53333, -103.45), altitude=1124, country='Mexico'),
-    'MMTG': station(name='Tuxtla Gutierrez, Chis.', coordinate=(16.75, -93.11667), altitude=528, country='Mexico'),
-    'MMTJ': station(name='Tijuana International Airport', coordinate=(32.55, -116.96667), altitude=152, country='Mexico'),
-    'MMTL': station(name='Tulancingo', coordinate=(20.08333, -98.36667), altitude=2181, country='Mexico'),
-    'MMTM': station(name='Tampico / Gen Fj Mina', coordinate=(22.28333, -97.86667), altitude=24, country='Mexico'),
-    'MMTO': station(name='Toluca / Jose Maria', coordinate=(19.35, -99.56667), altitude=2576, country='Mexico'),
-    'MMTP': station(name='Tapachula', coordinate=(14.78333, -92.38333), altitude=29, country='Mexico'),
-    'MMUN': station(name='Cancun International Airport', coordinate=(21.03333, -86.86667), altitude=5, country='Mexico'),
-    'MMVA': station(name='Villahermosa', coordinate=(18.0, -92.81667), altitude=13, country='Mexico'),
-    'MMVR': station(name='Veracruz / Las Bajadas / General Heriberto Jara', coordinate=(19.15, -96.18333), altitude=32, country='Mexico'),
-    'MMZC': station(name='Zacatecas Airport', coordinate=(22.9, -102.68333), altitude=2140, country='Mexico'),
-    'MMZH': station(name='Ixtapa-Zihuatanejo', coordinate=(17.6, -101.46667), altitude=6, country='Mexico'),
-    'MMZO': station(name='Manzanillo International', coordinate=(19.15, -104.56667), altitude=8, country='Mexico'),
-    'MMZP': station(name='Zapopan Military', coordinate=(20.75, -103.46667), altitude=1625, country='Mexico'),
-    'MNBL': station(name='Bluefields', coordinate=(12.0, -86.76667), altitude=5, country='Nicaragua'),
-    'MNCH': station(name='Chinandega', coordinate=(12.63333, -87.13333), altitude=53, country='Nicaragua'),
-    'MNJG': station(name='Jinotega', coordinate=(13.08333, -85.98333), altitude=985, country='Nicaragua'),
-    'MNJU': station(name='Juigalpa', coordinate=(12.1, -85.36667), altitude=90, country='Nicaragua'),
-    'MNMG': station(name='Managua A. C. Sandino', coordinate=(12.15, -86.16667), altitude=50, country='Nicaragua'),
-    'MNPC': station(name='Puerto Cabezas', coordinate=(14.05, -83.36667), altitude=20, country='Nicaragua'),
-    'MNRS': station(name='Rivas', coordinate=(11.41667, -85.83333), altitude=53, country='Nicaragua'),
-    'MPBO': station(name='Bocas Del Toro International', coordinate=(9.35, -82.25), altitude=3, country='Panama'),
-    'MPCH': station(name='Changuinola / Captain Manuel Nino', coordinate=(9.46667, -82.51667), altitude=6, country='Panama'),
-    'MPDA': station(name='David', coordinate=(8.4, -82.41667), altitude=29, country='Panama'),
-    'MPFS': station(name='Ft Sherman Rocob', coordinate=(9.33333, -79.98333), altitude=52, country='Panama'),
-    'MPHO': station(name='Howard Air Force Base', coordinate=(8.91667, -79.6), altitude=16, country='Panama'),
-    'MPLB': station(name='Albrook Afs / Balboa', coordinate=(8.96667, -79.55), altitude=9, country='Panama'),
-    'MPMG': station(name='Marcos A. Gelabert', coordinate=(8.98333, -79.51667), altitude=13, country='Panama'),
-    'MPNU': station(name='Augusto Vergara', coordinate=(7.83333, -80.28333), altitude=21, country='Panama'),
-    'MPSA': station(name='Santiago', coordinate=(8.08333, -80.95), altitude=83, country='Panama'),
-    'MPTO': station(name='Tocumen', coordinate=(9.05, -79.36667), altitude=45, country='Panama'),
-    'MRCH': station(name='Chacarita', coordinate=(9.98333, -84.78333), altitude=2, country='Costa Rica'),
-    'MRLB': station(name='Liberia', coordinate=(10.61667, -85.43333), altitude=80, country='Costa Rica'),
-    'MRLM': station(name='Puerto Limon', coordinate=(10.0, -83.05), altitude=5, country='Costa Rica'),
-    'MRNC': station(name='Nicoya', coordinate=(10.15, -85.45), altitude=120, country='Costa Rica'),
-    'MROC': station(name='Juan Santamaria', coordinate=(10.0, -84.21667), altitude=920, country='Costa Rica'),
-    'MRPM': station(name='Palmar Sur', coordinate=(8.95, -83.46667), altitude=15, country='Costa Rica'),
-    'MRPV': station(name='Tobias Bolanos International', coordinate=(9.95, -84.15), altitude=994, country='Costa Rica'),
-    'MSAC': station(name='Acajutla', coordinate=(13.56667, -89.83333), altitude=15, country='El Salvador'),
-    'MSLP': station(name='El Salvador Intl. Airport / Comalapa', coordinate=(13.43333, -89.05), altitude=25, country='El Salvador'),
-    'MSSA': station(name='Santa Ana / El Palmar', coordinate=(13.98333, -89.56667), altitude=725, country='El Salvador'),
-    'MSSM': station(name='San Miguel / El Papalon', coordinate=(13.45, -88.11667), altitude=80, country='El Salvador'),
-    'MSSS': station(name='San Salvador / Ilopango', coordinate=(13.7, -89.11667), altitude=616, country='El Salvador'),
-    'MTCH': station(name='Cap-Haitien', coordinate=(19.75, -72.18333), altitude=2, country='Haiti'),
-    'MTPP': station(name='Port-Au-Prince / Aeroport International', coordinate=(18.56667, -72.3), altitude=31, country='Haiti'),
-    'MUBA': station(name='Baracoa, Oriente', coordinate=(20.35, -74.5), altitude=9, country='Cuba'),
-    'MUBY': station(name='Bayamo', coordinate=(20.4, -76.61667), altitude=64, country='Cuba'),
-    'MUCA': station(name='Venezuela, Ciego De Avila', coordinate=(21.78333, -78.78333), altitude=26, country='Cuba'),
-    'MUCC': station(name='Cayo Coco / Jardines Del Ray', coordinate=(22.46111, -78.32833), altitude=4, country='Cuba'),
-    'MUCF': station(name='Cienfuegos, Las Villas', coordinate=(22.15, -80.4), altitude=39, country='Cuba'),
-    'MUCL': station(name='Cayo Largo Del Sur', coordinate=(21.61667, -81.55), altitude=2, country='Cuba'),
-    'MUCM': station(name='Camaguey Aeropuerto', coordinate=(21.41667, -77.85), altitude=122, country='Cuba'),
-    'MUCU': station(name='Santiago De Cuba, Oriente', coordinate=(19.96667, -75.85), altitude=69, country='Cuba'),
-    'MUGM': station(name='GUANTANAMO BAY, CUBA NAVAL', coordinate=(19.91667, -75.2), altitude=17, country='Cuba'),
-    'MUGT': station(name='Guantanamo, Oriente', coordinate=(20.08333, -75.15), altitude=8, country='Cuba'),
-    'MUHA': station(name='Aeropuerto Jose Marti, Rancho-Boyeros, Habana', coordinate=(22.98333, -82.4), altitude=59, country='Cuba'),
-    'MUHG': station(name='Holguin Civ / Mil', coordinate=(20.78333, -76.31667), altitude=106, country='Cuba'),
-    'MUMO': station(name='Moa Military', coordinate=(20.65, -74.91667), altitude=5, country='Cuba'),
-    'MUMZ': station(name='Manzanillo, Oriente', coordinate=(20.33333, -77.11667), altitude=60, country='Cuba'),
-    'MUNG': station(name='Nueva Gerona, Isla De Pinos', coordinate=(21.83333, -82.78333), altitude=23, country='Cuba'),
-    'MUPR': station(name='Pinar Del Rio, Pinar Del Rio', coordinate=(22.41667, -83.68333), altitude=37, country='Cuba'),
-    'MUSN': station(name='Siguanea', coordinate=(21.6425, -82.955), altitude=None, country='Cuba'),
-    'MUVR': station(name='Varadero, Matanzas', coordinate=(23.13333, -81.28333), altitude=3, country='Cuba'),
-    'MUVT': station(name='Las Tunas, Las Tunas', coordinate=(20.95, -76.95), altitude=106, country='Cuba'),
-    'MWCB': station(name='Gerrard Smith Intl. / Cayman Brac', coordinate=(19.68694, -79.88278), altitude=2, country='Cayman Islands'),
-    'MWCG': station(name='Grand Cayman City', coordinate=(19.3, -81.36667), altitude=None, country='Cayman Islands'),
-    'MWCR': station(name='Owen Roberts Airportgrand Cayman', coordinate=(19.28333, -81.35), altitude=3, country='Cayman Islands'),
-    'MYAK': station(name='Congo Town, Andros Island', coordinate=(24.15861, -77.58972), altitude=5, country='Bahamas,The'),
-    'MYBS': station(name='Alice Town, Bimini', coordinate=(25.73333, -79.3), altitude=2, country='Bahamas, The'),
-    'MYEG': station(name='Georgetown, Exuma', coordinate=(23.475, -75.76667), altitude=2, country='Bahamas, The'),
-    'MYGF': station(name='Freeport, Grand Bahama', coordinate=(26.55, -78.7), altitude=2, country='Bahamas, The'),
-    'MYGW': station(name='West End, Grand Bahama', coordinate=(26.7, -78.96667), altitude=2, country='Bahamas, The'),
-    'MYIG': station(name='Matthew Town, Inagua', coordinate=(20.95, -73.68333), altitude=2, country='Bahamas, The'),
-    'MYNN': station(name='Nassau Airport', coordinate=(25.05, -77.46667), altitude=3, country='Bahamas, The'),
-    'MYSM': station(name='Cockburn Town, San Salvador', coordinate=(24.05, -74.53333), altitude=3, country='Bahamas, The'),
-    'MZBZ': station(name='Belize / Phillip Goldston Intl. Airport', coordinate=(17.53333, -88.3), altitude=5, country='Belize'),
-    'NCRG': station(name='Rarotonga', coordinate=(-21.2, -159.81667), altitude=7, country='Cook Islands'),
-    'NEXC': station(name='Charleston, Navelexcen', coordinate=(32.91556, -79.97917), altitude=8, country='United States'),
-    'NFFN': station(name='Nandi', coordinate=(-17.75, 177.45), altitude=13, country='Fiji'),
-    'NFNA': station(name='Nausori', coordinate=(-18.05, 178.56667), altitude=5, country='Fiji'),
-    'NFNK': station(name='Lakemba', coordinate=(-18.23333, -178.8), altitude=2, country='Fiji'),
-    'NFNR': station(name='Rotuma', coordinate=(-12.5, 177.05), altitude=26, country='Fiji'),
-    'NFTF': station(name="Fua'Amotu", coordinate=(-21.23333, -175.15), altitude=38, country='Tonga'),
-    'NFTL': station(name='Haapai', coordinate=(-19.8, -174.35), altitude=2, country='Tonga'),
-    'NGBR': station(name='Beru', coordinate=(-1.35, 176.0), altitude=2, country='Kiribati'),
-    'NGFO': station(name='Nanumea', coordinate=(-5.66667, 176.13333), altitude=2, country='Tuvalu'),
-    'NGFU': station(name='Funafuti', coordinate=(-8.51667, 179.21667), altitude=1, country='Tuvalu'),
-    'NGTA': station(name='Tarawa', coordinate=(1.35, 172.91667), altitude=2, country='Kiribati'),
-    'NGTR': station(name='Arorae', coordinate=(-2.66667, 176.83333), altitude=4, country='Kiribati'),
-    'NGTU': station(name='Butaritari', coordinate=(3.03333, 172.78333), altitude=1, country='Kiribati'),
-    'NIUE': station(name='Alofi / Niue', coordinate=(-19.06667, -169.91667), altitude=20, country='Cook Islands'),
-    'NLWF': station(name='Maopoopo Ile Futuna', coordinate=(-14.31667, -178.11667), altitude=6, country='France'),
-    'NLWW': station(name='Hihifo Ile Wallis', coordinate=(-13.23333, -176.16667), altitude=23, country='France'),
-    'NSAP': station(name='Apia / Upolu Island', coordinate=(-13.8, -171.78333), altitude=2, country='Samoa'),
-    'NSFA': station(name='Faleolo Intl / Apia', coordinate=(-13.81667, -172.0), altitude=5, country='Samoa'),
-    'NSTU': station(name='Pago Pago / Int. Airport', coordinate=(-14.33333, -170.71667), altitude=3, country='United States Minor Outlying Islands'),
-    'NTAA': station(name='Tahiti-Faaa', coordinate=(-17.55, -149.61667), altitude=2, country='French Polynesia'),
-    'NTAT': station(name='Tubuai', coordinate=(-23.35, -149.48333), altitude=2, country='French Polynesia'),
-    'NTTB': station(name='Bora-Bora', coordinate=(-16.45, -151.75), altitude=4, country='French Polynesia'),
-    'NTTG': station(name='Rangiroa / Tuamoto Island', coordinate=(-14.96667, -147.66667), altitude=3, country='French Polynesia'),
-    'NTTO': station(name='Hao', coordinate=(-18.06667, -140.95), altitude=2, country='French Polynesia'),
-    'NTTX': station(name='Mururoa', coordinate=(-21.81667, -138.8), altitude=2, country='French Polynesia'),
-    'NVSC': station(name='Sola Vanua Lava', coordinate=(-13.85, 167.55), altitude=17, country='Vanuatu'),
-    'NVSL': station(name='Lamap Malekula', coordinate=(-16.41667, 167.8), altitude=26, country='Vanuatu'),
-    'NVSS': station(name='Pekoa Airport Santo', coordinate=(-15.51667, 167.21667), altitude=41, country='Vanuatu'),
-    'NVVV': station(name='Bauerfield Efate', coordinate=(-17.7, 168.3), altitude=20, country='Vanuatu'),
-    'NWWE': station(name='Moue Ile Des Pins', coordinate=(-22.6, 167.45), altitude=96, country='New Caledonia'),
-    'NWWK': station(name='Koumac Nlle-Caledonie', coordinate=(-20.56667, 164.28333), altitude=23, country='New Caledonia'),
-    'NWWL': station(name='Ouanaham Ile Lifou', coordinate=(-20.76667, 167.23333), altitude=28, country='New Caledonia'),
-    'NWWN': station(name='Noumea Nlle-Caledonie', coordinate=(-22.26667, 166.45), altitude=69, country='New Caledonia'),
-    'NWWR': station(name='La Roche Ile Mare', coordinate=(-21.48333, 168.03333), altitude=43, country='New Caledonia'),
-    'NWWV': station(name='Ouloup Ile Ouvea', coordinate=(-20.65, 166.58333), altitude=7, country='New Caledonia'),
-    'NWWW': station(name='La Tontouta Nlle-Caledonie', coordinate=(-22.01667, 166.21667), altitude=16, country='New Caledonia'),
-    'NZAA': station(name='Auckland Airport', coordinate=(-37.01667, 174.8), altitude=7, country='New Zealand'),
-    'NZCH': station(name='Christchurch', coordinate=(-43.48333, 172.55), altitude=38, country='New Zealand'),
-    'NZCI': station(name='Chatham Island', coordinate=(-43.95, -176.56667), altitude=44, country='New Zealand'),
-    'NZCM': station(name='Williams Field', coordinate=(-77.86667, 166.96667), altitude=8, country='Antarctica'),
-    'NZDN': station(name='Dunedin Aerodrome', coordinate=(-45.93333, 170.2), altitude=1, country='New Zealand'),
-    'NZGS': station(name='Gisborne Aerodrome', coordinate=(-38.66667, 177.98333), altitude=5, country='New Zealand'),
-    'NZHK': station(name='Hokitika Aerodrome', coordinate=(-42.71667, 170.98333), altitude=45, country='New Zealand'),
-    'NZIR': station(name='Ice Runway', coordinate=(-77.86667, 166.53333), altitude=2, country='Antarctica'),
-    'NZKI': station(name='Kaikoura', coordinate=(-42.41667, 173.7), altitude=101, country='New Zealand'),
-    'NZNP': station(name='New Plymouth Aerodrome', coordinate=(-39.01667, 174.18333), altitude=28, country='New Zealand'),
-    'NZNV': station(name='Invercargill Aerodrome', coordinate=(-46.7, 168.55), altitude=0, country='New Zealand'),
-    'NZOH': station(name='Ohakea', coordinate=(-40.2, 175.36667), altitude=50, country='New Zealand'),
-    'NZPP': station(name='Paraparaumu Aerodrome', coordinate=(-40.9, 174.98333), altitude=7, country='New Zealand'),
-    'NZRN': station(name='Raoul Island, Kermadec Island', coordinate=(-29.25, -177.91667), altitude=38, country='New Zealand'),
-    'NZRO': station(name='Rotorua Aerodrome', coordinate=(-38.11667, 176.31667), altitude=285, country='New Zealand'),
-    'NZSP': station(name='Amundsen-Scott South Pole Station', coordinate=(-90.0, 0.0), altitude=2830, country='Antarctica'),
-    'NZTG': station(name='Tauranga Aerodrome Aws', coordinate=(-37.66667, 176.2), altitude=4, country='New Zealand'),
-    'NZWD': station(name='Williams Field, Antarctic', coordinate=(-77.88333, 166.65), altitude=12, country='New Zealand'),
-    'NZWN': station(name='Wellington Airport', coordinate=(-41.33333, 174.8), altitude=12, country='New Zealand'),
-    'NZWP': station(name='Whenuapai', coordinate=(-36.78333, 174.63333), altitude=30, country='New Zealand'),
-    'OAFR': station(name='Farah', coordinate=(32.36667, 62.18333), altitude=700, country='Afghanistan'),
-    'OAFZ': station(name='Faizabad', coordinate=(37.11667, 70.51667), altitude=1200, country='Afghanistan'),
-    'OAHR': station(name='Herat', coordinate=(34.21667, 62.21667), altitude=964, country='Afghanistan'),
-    'OAJL': station(name='Jalalabad', coordinate=(34.43333, 70.46667), altitude=580, country='Afghanistan'),
-    'OAJS': station(name='Jabul-Saraj', coordinate=(35.13333, 69.25), altitude=1630, country='Afghanistan'),
-    'OAKB': station(name='Kabul Airport', coordinate=(34.63333, 69.2), altitude=1789, country='Afghanistan'),
-    'OAMS': station(name='Mazar-I-Sharif', coordinate=(36.7, 67.2), altitude=378, country='Afghanistan'),
-    'OASD': station(name='Shindand', coordinate=(33.4, 62.28333), altitude=1150, country='Afghanistan'),
-    'OASG': station(name='Shebirghan', coordinate=(36.66667, 65.71667), altitude=360, country='Afghanistan'),
-    'OAZB': station(name='Zebak', coordinate=(36.5, 71.25), altitude=2600, country='Afghanistan'),
-    'OAZG': station(name='Zaranj', coordinate=(31.0, 61.85), altitude=478, country='Afghanistan'),
-    'OBBI': station(name='Bahrain International Airport', coordinate=(26.26667, 50.65), altitude=2, country='Bahrain'),
-    'OEAB': station(name='Abha', coordinate=(18.23333, 42.65), altitude=2090, country='Saudi Arabia'),
-    'OEAH': station(name='Al Ahsa', coordinate=(25.3, 49.48333), altitude=179, country='Saudi Arabia'),
-    'OEBA': station(name='Al Baha', coordinate=(20.3, 41.63333), altitude=1652, country='Saudi Arabia'),
-    'OEBH': station(name='Bisha', coordinate=(19.98333, 42.61667), altitude=1167, country='Saudi Arabia'),
-    'OEDF': station(name='Dammam-King Fahd International Airport', coordinate=(26.46667, 49.78333), altitude=22, country='Saudi Arabia'),
-    'OEDR': station(name='Dhahran', coordinate=(26.26667, 50.15), altitude=26, country='Saudi Arabia'),
-    'OEDW': station(name='Dawadmi', coordinate=(24.5, 44.35), altitude=990, country='Saudi Arabia'),
-    'OEGN': station(name='Gizan', coordinate=(16.9, 42.58333), altitude=6, country='Saudi Arabia'),
-    'OEGS': station(name='Gassim', coordinate=(26.3, 43.76667), altitude=648, country='Saudi Arabia'),
-    'OEGT': station(name='Guriat', coordinate=(31.4, 37.26667), altitude=509, country='Saudi Arabia'),
-    'OEHL': station(name='Hail', coordinate=(27.43333, 41.68333), altitude=1015, country='Saudi Arabia'),
-    'OEJB': station(name='Jubail Naval', coordinate=(27.05, 49.4), altitude=8, country='Saudi Arabia'),
-    'OEJD': station(name='Jeddah', coordinate=(21.5, 39.2), altitude=15, country='Saudi Arabia'),
-    'OEJN': station(name='Jeddah King Abdul Aziz International Airport', coordinate=(21.7, 39.18333), altitude=15, country='Saudi Arabia'),
-    'OEKK': station(name='Hafr Al-Batin', coordinate=(27.9, 45.53333), altitude=413, country='Saudi Arabia'),
-    'OEKM': station(name='Khamis Mushait', coordinate=(18.3, 42.8), altitude=2066, country='Saudi Arabia'),
-    'OEMA': station(name='Madinah', coordinate=(24.55, 39.7), altitude=654, country='Saudi Arabia'),
-    'OEMK': station(name='Makkah', coordinate=(21.43333, 39.76667), altitude=310, country='Saudi Arabia'),
-    'OENG': station(name='Najran', coordinate=(17.61667, 44.41667), altitude=1212, country='Saudi Arabia'),
-    'OEPA': station(name='Al Qaysumah', coordinate=(28.31667, 46.11667), altitude=358, country='Saudi Arabia'),
-    'OERF': station(name='Rafha', coordinate=(29.61667, 43.48333), altitude=449, country='Saudi Arabia'),
-    'OERK': station(name='King Khaled International Airport', coordinate=(24.93333, 46.71667), altitude=614, country='Saudi Arabia'),
-    'OERR': station(name='Arar', coordinate=(30.9, 41.13333), altitude=555, country='Saudi Arabia'),
-    'OERY': station(name='Riyadh', coordinate=(24.71667, 46.73333), altitude=635, country='Saudi Arabia'),
-    'OESH': station(name='Sharurah', coordinate=(17.46667, 47.11667), altitude=720, country='Saudi Arabia'),
-    'OESK': station(name='Al-Jouf', coordinate=(29.78333, 40.1), altitude=689, country='Saudi Arabia'),
-    'OETB': station(name='Tabuk', coordinate=(28.36667, 36.6), altitude=778, country='Saudi Arabia'),
-    'OETF': station(name='Taif', coordinate=(21.48333, 40.55), altitude=1478, country='Saudi Arabia'),
-    'OETR': station(name='Turaif', coordinate=(31.68333, 38.73333), altitude=813, country='Saudi Arabia'),
-    'OEWD': station(name='Wadi Al Dawasser Airport', coordinate=(20.5, 45.2), altitude=624, country='Saudi Arabia'),
-    'OEWJ': station(name='Wejh', coordinate=(26.2, 36.46667), altitude=20, country='Saudi Arabia'),
-    'OEYN': station(name='Yenbo', coordinate=(24.15, 38.06667), altitude=8, country='Saudi Arabia'),
-    'OIAA': station(name='Abadan', coordinate=(30.36667, 48.25), altitude=3, country='Iran'),
-    'OIAG': station(name='Omidieh', coordinate=(30.76667, 49.66667), altitude=29, country='Iran'),
-    'OIAH': station(name='Gach Saran Du Gunbadan', coordinate=(30.43333, 50.76667), altitude=738, country='Iran'),
-    'OIAI': station(name='Masjed-Soleyman', coordinate=(31.98333, 49.26667), altitude=372, country='Iran'),
-    'OIAJ': station(name='Omidiyeh', coordinate=(30.83528, 49.535), altitude=26, country='Iran'),
-    'OIAM': station(name='Bandar Mahshahr / Mahshahr', coordinate=(30.55639, 49.15194), altitude=2, country='Iran'),
-    'OIAW': station(name='Ahwaz', coordinate=(31.33333, 48.66667), altitude=20, country='Iran'),
-    'OIBA': station(name='Abumusa Island / Abumusa', coordinate=(25.87583, 55.03361), altitude=7, country='Iran'),
-    'OIBB': station(name='Bushehr Civ / Afb', coordinate=(28.98333, 50.83333), altitude=19, country='Iran'),
-    'OIBK': station(name='Kish Island / Kish', coordinate=(26.52667, 53.98167), altitude=30, country='Iran'),
-    'OIBL': station(name='Bandar Lengeh', coordinate=(26.58333, 54.83333), altitude=14, country='Iran'),
-    'OIBS': station(name='Sirri Island / Sirri', coordinate=(25.90944, 54.53944), altitude=13, country='Iran'),
-    'OICC': station(name='Kermanshah', coordinate=(34.26667, 47.11667), altitude=1320, country='Iran'),
-    'OICG': station(name='Ghasre-Shirin', coordinate=(34.51667, 45.58333), altitude=378, country='Iran'),
-    'OICI': station(name='Ilam', coordinate=(33.58583, 46.40556), altitude=1334, country='Iran'),
-    'OICK': station(name='Khorram Abad', coordinate=(33.43639, 48.28583), altitude=1155, country='Iran'),
-    'OICS': station(name='Sanandaj', coordinate=(35.33333, 47.0), altitude=1373, country='Iran'),
-    'OIFK': station(name='Kashan', coordinate=(33.98333, 51.45), altitude=982, country='Iran'),
-    'OIFM': station(name='Esfahan', coordinate=(32.46667, 51.71667), altitude=1590, country='Iran'),
-    'OIFS': station(name='Shahre-Kord', coordinate=(32.33333, 50.85), altitude=2078, country='Iran'),
-    'OIGG': station(name='Rasht', coordinate=(37.2, 49.63333), altitude=-7, country='Iran'),
-    'OIHH': station(name='Hamadan', coordinate=(34.86806, 48.55222), altitude=1757, country='Iran'),
-    'OIHR': station(name='Arak', coordinate=(34.1, 49.4), altitude=1720, country='Iran'),
-    'OIII': station(name='Tehran-Mehrabad', coordinate=(35.68333, 51.35), altitude=1204, country='Iran'),
-    'OIIK': station(name='Ghazvin', coordinate=(36.25, 50.0), altitude=1278, country='Iran'),
-    'OIIP': station(name='Karaj / Payam', coordinate=(35.77611, 50.82667), altitude=1271, country='Iran'),
-    'OIIS': station(name='Semnan', coordinate=(35.55, 53.38333), altitude=1171, country='Iran'),
-    'OIKB': station(name='Bandarabbass', coordinate=(27.21667, 56.36667), altitude=10, country='Iran'),
-    'OIKK': station(name='Kerman', coordinate=(30.25, 56.96667), altitude=1748, country='Iran'),
-    'OIKM': station(name='Bam', coordinate=(29.1, 58.4), altitude=1067, country='Iran'),
-    'OIKQ': station(name='Gheshm Island / Dayrestan', coordinate=(26.755, 55.90222), altitude=12, country='Iran'),
-    'OIMB': station(name='Birjand', coordinate=(32.86667, 59.2), altitude=1491, country='Iran'),
-    'OIMC': station(name='Sarakhs', coordinate=(36.50111, 61.065), altitude=288, country='Iran'),
-    'OIMH': station(name='Torbat-Heydarieh', coordinate=(35.26667, 59.21667), altitude=1333, country='Iran'),
-    'OIMM': station(name='Mashhad', coordinate=(36.26667, 59.63333), altitude=989, country='Iran'),
-    'OIMN': station(name='Bojnourd', coordinate=(37.46667, 57.33333), altitude=1074, country='Iran'),
-    'OIMS': station(name='Sabzevar', coordinate=(36.21667, 57.66667), altitude=941, country='Iran'),
-    'OIMT': station(name='Tabas', coordinate=(33.6, 56.91667), altitude=710, country='Iran'),
-    'OING': station(name='Gorgan', coordinate=(36.81667, 54.46667), altitude=155, country='Iran'),
-    'OINN': station(name='Noshahr', coordinate=(36.66333, 51.46472), altitude=0, country='Iran'),
-    'OINR': station(name='Ramsar', coordinate=(36.9, 50.66667), altitude=-23, country='Iran'),
-    'OISA': station(name='Abadeh', coordinate=(31.18333, 52.66667), altitude=2004, country='Iran'),
-    'OISF': station(name='Fasa', coordinate=(28.96667, 53.68333), altitude=1383, country='Iran'),
-    'OISL': station(name='Lar', coordinate=(27.67389, 54.38139), altitude=792, country='Iran'),
-    'OISS': station(name='Shiraz', coordinate=(29.53333, 52.58333), altitude=1486, country='Iran'),
-    'OISY': station(name='Yasouj / National', coordinate=(30.69694, 51.55), altitude=1825, country='Iran'),
-    'OITK': station(name='Khoy', coordinate=(38.55, 44.96667), altitude=1107, country='Iran'),
-    'OITL': station(name='Ardabil', coordinate=(38.32639, 48.42444), altitude=1315, country='Iran'),
-    'OITM': station(name='Maragheh / Sahand', coordinate=(37.34861, 46.12639), altitude=1340, country='Iran'),
-    'OITR': station(name='Orumieh', coordinate=(37.53333, 45.08333), altitude=1297, country='Iran'),
-    'OITS': station(name='Saghez', coordinate=(36.25, 46.26667), altitude=1493, country='Iran'),
-    'OITT': station(name='Tabriz', coordinate=(38.08333, 46.28333), altitude=1367, country='Iran'),
-    'OITZ': station(name='Zanjan', coordinate=(36.68333, 48.48333), altitude=1663, country='Iran'),
-    'OIYY': station(name='Yazd', coordinate=(31.9, 54.4), altitude=1238, country='Iran'),
-    'OIZB': station(name='Zabol', coordinate=(31.33333, 61.48333), altitude=489, country='Iran'),
-    'OIZC': station(name='Chahbahar', coordinate=(25.41667, 60.75), altitude=6, country='Iran'),
-    'OIZH': station(name='Zahedan', coordinate=(29.46667, 60.88333), altitude=1370, country='Iran'),
-    'OIZI': station(name='Iranshahr', coordinate=(27.2, 60.7), altitude=591, country='Iran'),
-    'OIZJ': station(name='Jask', coordinate=(26.63333, 57.76667), altitude=3, country='Iran'),
-    'OJAI': station(name='Queen Alia Airport', coordinate=(31.66667, 35.96667), altitude=721, country='Jordan'),
-    'OJAM': station(name='Amman Airport', coordinate=(31.98333, 35.98333), altitude=767, country='Jordan'),
-    'OJAQ': station(name='Aqaba Airport', coordinate=(29.63333, 35.01667), altitude=53, country='Jordan'),
-    'OJBD': station(name='Irbid', coordinate=(32.55, 35.85), altitude=618, country='Jordan'),
-    'OJHF': station(name="H-5'Safawi", coordinate=(32.2, 37.13333), altitude=668, country='Jordan'),
-    'OJHR': station(name="H-4'Irwaished", coordinate=(32.5, 38.2), altitude=686, country='Jordan'),
-    'OJMF': station(name='Mafraq', coordinate=(32.36667, 36.25), altitude=686, country='Jordan'),
-    'OJMN': station(name="Ma'An", coordinate=(30.16667, 35.78333), altitude=1069, country='Jordan'),
-    'OKBK': station(name='Kuwait Internationalairport', coordinate=(29.21667, 47.98333), altitude=55, country='Kuwait'),
-    'OLBA': station(name='Beyrouth Aeroport', coordinate=(33.81667, 35.48333), altitude=29, country='Lebanon'),
-    'OMAA': station(name='Abu Dhabi International Airport', coordinate=(24.43333, 54.65), altitude=16, country='United Arab Emirates'),
-    'OMAB': station(name='Buhasa', coordinate=(23.61667, 53.38333), altitude=94, country='United Arab Emirates'),
-    'OMAD': station(name='Abu Dhabi Bateen Airport', coordinate=(24.43333, 54.46667), altitude=5, country='United Arab Emirates'),
-    'OMAL': station(name='Al Ain International Airport', coordinate=(24.26667, 55.6), altitude=265, country='United Arab Emirates'),
-    'OMDB': station(name='Dubai International Airport', coordinate=(25.25, 55.33333), altitude=8, country='United Arab Emirates'),
-    'OMFJ': station(name='Fujairah', coordinate=(25.1, 56.33333), altitude=28, country='United Arab Emirates'),
-    'OMRK': station(name='Ras Al Khaimah International Airport', coordinate=(25.61667, 55.93333), altitude=31, country='United Arab Emirates'),
-    'OMSJ': station(name='Sharjah International Airport', coordinate=(25.33333, 55.51667), altitude=35, country='United Arab Emirates'),
-    'OOBR': station(name='Buraimi', coordinate=(24.23333, 55.78333), altitude=299, country='Oman'),
-    'OOFD': station(name='Fahud', coordinate=(22.35, 56.48333), altitude=170, country='Oman'),
-    'OOKB': station(name='Khassab', coordinate=(26.21667, 56.23333), altitude=3, country='Oman'),
-    'OOMA': station(name='Masirah', coordinate=(20.66667, 58.9), altitude=19, country='Oman'),
-    'OOMS': station(name='Seeb, International Airport', coordinate=(23.58333, 58.28333), altitude=8, country='Oman'),
-    'OOSA': station(name='Salalah', coordinate=(17.03333, 54.08333), altitude=20, country='Oman'),
-    'OOSH': station(name='Sohar Majis', coordinate=(24.46667, 56.63333), altitude=4, country='Oman'),
-    'OOSQ': station(name='Saiq', coordinate=(23.06667, 57.65), altitude=1755, country='Oman'),
-    'OOSR': station(name='Sur', coordinate=(22.53333, 59.48333), altitude=14, country='Oman'),
-    'OOTH': station(name='Thumrait', coordinate=(17.66667, 54.03333), altitude=467, country='Oman'),
-    'OPDI': station(name='Dera Ismail Khan', coordinate=(31.81667, 70.91667), altitude=172, country='Pakistan'),
-    'OPJA': station(name='Jacobabad', coordinate=(28.3, 68.46667), altitude=55, country='Pakistan'),
-    'OPJI': station(name='Jiwani', coordinate=(25.06667, 61.8), altitude=56, country='Pakistan'),
-    'OPKC': station(name='Karachi Airport', coordinate=(24.9, 67.13333), altitude=21, country='Pakistan'),
-    'OPKD': station(name='Hyderabad Airport', coordinate=(25.38333, 68.41667), altitude=40, country='Pakistan'),
-    'OPLA': station(name='Lahore Airport', coordinate=(31.51667, 74.4), altitude=216, country='Pakistan'),
-    'OPLH': station(name='Lahore City', coordinate=(31.55, 74.33333), altitude=214, country='Pakistan'),
-    'OPMI': station(name='Mianwali', coordinate=(32.55, 71.51667), altitude=210, country='Pakistan'),
-    'OPMT': station(name='Multan', coordinate=(30.2, 71.43333), altitude=122, country='Pakistan'),
-    'OPNH': station(name='Nawabshah', coordinate=(26.25, 68.36667), altitude=37, country='Pakistan'),
-    'OPPG': station(name='Panjgur', coordinate=(26.96667, 64.1), altitude=980, country='Pakistan'),
-    'OPPS': station(name='Peshawar', coordinate=(34.01667, 71.58333), altitude=359, country='Pakistan'),
-    'OPQT': station(name='Quetta Airport', coordinate=(30.25, 66.88333), altitude=1587, country='Pakistan'),
-    'OPRN': station(name='Islamabad Airport', coordinate=(33.61667, 73.1), altitude=507, country='Pakistan'),
-    'OPRS': station(name='Risalpur', coordinate=(34.06667, 71.98333), altitude=315, country='Pakistan'),
-    'OPSB': station(name='Sibi', coordinate=(29.55, 67.88333), altitude=133, country='Pakistan'),
-    'OPSK': station(name='Sukkur', coordinate=(27.72194, 68.79194), altitude=60, country='Pakistan'),
-    'OPSR': station(name='Sargodha', coordinate=(32.05, 72.66667), altitude=187, country='Pakistan'),
-    'ORBB': station(name='Baghdad', coordinate=(33.23333, 44.23333), altitude=34, country='Iraq'),
-    'ORBM': station(name='Mosul', coordinate=(36.31667, 43.15), altitude=223, country='Iraq'),
-    'ORBS': station(name='Saddam Irq-Afb / Civ', coordinate=(33.26667, 44.23333), altitude=34, country='Iraq'),
-    'ORMS': station(name='Shaibah / Basrah', coordinate=(30.41667, 47.65), altitude=19, country='Iraq'),
-    'OSAP': station(name='Aleppo International Airport', coordinate=(36.18333, 37.2), altitude=393, country='Syria'),
-    'OSDI': station(name='Damascus Int. Airport', coordinate=(33.41667, 36.51667), altitude=608, country='Syria'),
-    'OSDZ': station(name='Deir Ezzor', coordinate=(35.31667, 40.15), altitude=215, country='Syria'),
-    'OSKL': station(name='Kamishli', coordinate=(37.05, 41.21667), altitude=455, country='Syria'),
-    'OSLK': station(name='Lattakia', coordinate=(35.53333, 35.76667), altitude=7, country='Syria'),
-    'OSPR': station(name='Palmyra', coordinate=(34.55, 38.3), altitude=408, country='Syria'),
-    'OTBD': station(name='Doha International Airport', coordinate=(25.25, 51.56667), altitude=11, country='Qatar'),
-    'OYAA': station(name='Aden', coordinate=(12.66667, 45.03333), altitude=3, country='Yemen'),
-    'OYAR': station(name='Riyan', coordinate=(14.65, 49.38333), altitude=16, country='Yemen'),
-    'OYAT': station(name='Ataq', coordinate=(14.51667, 46.85), altitude=1067, country='Yemen'),
-    'OYHD': station(name='Hodeidah', coordinate=(14.75, 42.98333), altitude=115, country='Yemen'),
-    'OYMB': station(name='Marib', coordinate=(15.43333, 45.33333), altitude=1000, country='Yemen'),
-    'OYMC': station(name='Mokha', coordinate=(13.25, 44.13333), altitude=4, country='Yemen'),
-    'OYMK': station(name='Mokha', coordinate=(13.25, 43.28333), altitude=3, country='Yemen'),
-    'OYSH': station(name="Sa'Ada / Sadah", coordinate=(16.96667, 43.73333), altitude=1890, country='Yemen'),
-    'OYSN': station(name="Sana'A", coordinate=(15.51667, 44.18333), altitude=2206, country='Yemen'),
-    'OYSQ': station(name='Socotra', coordinate=(12.63333, 53.9), altitude=45, country='Yemen'),
-    'OYSY': station(name='Sayun', coordinate=(15.96667, 48.8), altitude=701, country='Yemen'),
-    'OYTZ': station(name='Taiz', coordinate=(13.68333, 44.13333), altitude=1402, country='Yemen'),
-    'OYZM': station(name='Al-Hazm', coordinate=(16.2, 44.78333), altitude=1900, country='Yemen'),
-    'PAAK': station(name='Atka, Atka Airport', coordinate=(52.22028, -174.20639), altitude=17, country='United States'),
-    'PAAP': station(name='Port Alexander, Port Alexander Seaplane Base', coordinate=(56.25, -134.65), altitude=0, country='United States'),
-    'PAAQ': station(name='PALMER MUNICIPAL AIRPORT', coordinate=(61.6, -149.1), altitude=76, country='United States'),
-    'PABA': station(name='Barter Island, Barter Island LRRS Airport', coordinate=(70.13389, -143.57694), altitude=2, country='United States'),
-    'PABE': station(name='BETHEL AIRPORT', coordinate=(60.78333, -161.83333), altitude=37, country='United States'),
-    'PABG': station(name='Big Delta Arctic Weather', coordinate=(64.0, -145.71667), altitude=389, country='United States'),
-    'PABI': station(name='ALLEN ARMY AIRFIELD', coordinate=(64.0, -145.71667), altitude=389, country='United States'),
-    'PABL': station(name='Buckland, Buckland Airport', coordinate=(65.98222, -161.15194), altitude=7, country='United States'),
-    'PABN': station(name='Nabesna, Devil Mountain Lodge', coordinate=(62.39778, -142.99583), altitude=884, country='United States'),
-    'PABR': station(name='POST ROGERS MEMORIAL AIRPORT', coordinate=(71.28333, -156.76667), altitude=13, country='United States'),
-    'PABT': station(name='BETTLES AIRPORT', coordinate=(66.9, -151.51667), altitude=196, country='United States'),
-    'PABV': station(name='Birchwood, Birchwood Airport', coordinate=(61.41667, -149.51667), altitude=29, country='United States'),
-    'PACD': station(name='COLD BAY AIRPORT', coordinate=(55.21667, -162.73333), altitude=30, country='United States'),
-    'PACE': station(name='Central, Central', coordinate=(65.56694, -144.76667), altitude=282, country='United States'),
-    'PACL': station(name='Clear', coordinate=(64.3, -149.11667), altitude=168, country='United States'),
-    'PACP': station(name='Cape Saint Elias', coordinate=(59.8, -144.6), altitude=18, country='United States'),
-    'PACR': station(name='Circle City Airport', coordinate=(65.83333, -144.06667), altitude=182, country='United States'),
-    'PACS': station(name='Cape Sarichef Airport', coordinate=(54.6, -164.93333), altitude=9, country='United States'),
-    'PACV': station(name='MERLE K. SMITH AIRPORT', coordinate=(60.5, -145.48333), altitude=13, country='United States'),
-    'PACY': station(name='Yakataga', coordinate=(60.08333, -142.5), altitude=4, country='United States'),
-    'PACZ': station(name='Cape Romanzof, Cape Romanzof LRRS Airport', coordinate=(61.78333, -166.03333), altitude=139, country='United States'),
-    'PADE': station(name='DEERING AIRPORT', coordinate=(66.06667, -162.76667), altitude=6, country='United States'),
-    'PADK': station(name='Adak Island, Adak Airport', coordinate=(51.87778, -176.64583), altitude=6, country='United States'),
-    'PADL': station(name='Dillingham, Dillingham Airport', coordinate=(59.05, -158.51667), altitude=26, country='United States'),
-    'PADQ': station(name='KODIAK AIRPORT', coordinate=(57.75, -152.48333), altitude=22, country='United States'),
-    'PADT': station(name='Slana', coordinate=(62.70889, -143.98111), altitude=668, country='United States'),
-    'PADU': station(name='Unalaska, Unalaska Airport', coordinate=(53.9, -166.53333), altitude=7, country='United States'),
-    'PAEC': station(name='Chulitna, Chulitna River', coordinate=(62.82556, -149.90639), altitude=412, country='United States'),
-    'PAED': station(name='Anchorage, Elmendorf Air Force Base', coordinate=(61.25306, -149.79389), altitude=65, country='United States'),
-    'PAEG': station(name='EAGLE AIRPORT', coordinate=(64.78333, -141.15), altitude=274, country='United States'),
-    'PAEH': station(name='Cape Newenham, Cape Newenham LRRS Airport', coordinate=(58.65, -162.06667), altitude=165, country='United States'),
-    'PAEI': station(name='Fairbanks, Eielson Air Force Base', coordinate=(64.65, -147.1), altitude=167, country='United States'),
-    'PAEL': station(name='Elfin Cove, Elfin Cove Seaplane Base', coordinate=(58.2, -136.35), altitude=0, country='United States'),
-    'PAEM': station(name='Emmonak, Emmonak Airport', coordinate=(62.78333, -164.5), altitude=4, country='United States'),
-    'PAEN': station(name='KENAI MUNICIPAL AIRPORT', coordinate=(60.58333, -151.23333), altitude=28, country='United States'),
-    'PAER': station(name='Merrill Pass West', coordinate=(61.25, -153.81667), altitude=358, country='United States'),
-    'PAFA': station(name='Fairbanks, Fairbanks International Airport', coordinate=(64.80389, -147.87611), altitude=132, country='United States'),
-    'PAFB': station(name='FT. WAINWRIGHT AAF', coordinate=(64.83333, -147.58333), altitude=138, country='United States'),
-    'PAFE': station(name='Kake, Kake Airport', coordinate=(56.95, -133.9), altitude=52, country='United States'),
-    'PAFK': station(name='Farewell Lake, Farewell Lake Seaplane Base', coordinate=(62.5425, -153.6225), altitude=321, country='United States'),
-    'PAFM': station(name='Ambler, Ambler Airport', coordinate=(67.1, -157.85), altitude=88, country='United States'),
-    'PAFR': station(name='Ft. Richardson / Bryant U. S. Army Heliport, Ak', coordinate=(61.26667, -149.65), altitude=115, country='United States'),
-    'PAFW': station(name='Farewell Lake', coordinate=(62.53333, -153.61667), altitude=323, country='United States'),
-    'PAGA': station(name='Galena, Edward G. Pitka Sr. Airport', coordinate=(64.73333, -156.93333), altitude=46, country='United States'),
-    'PAGB': station(name='Galbraith Lake, Galbraith Lake Airport', coordinate=(68.48333, -149.48333), altitude=814, country='United States'),
-    'PAGK': station(name='GULKANA AIRPORT', coordinate=(62.15, -145.45), altitude=481, country='United States'),
-    'PAGL': station(name='Golovin, Golovin Airport', coordinate=(64.54333, -163.03944), altitude=8, country='United States'),
-    'PAGM': station(name='Gambell, Gambell Airport', coordinate=(63.76667, -171.73333), altitude=8, country='United States'),
-    'PAGN': station(name='Angoon', coordinate=(57.5, -134.58333), altitude=0, country='United States'),
-    'PAGS': station(name='Gustavus, Gustavus Airport', coordinate=(58.41667, -135.7), altitude=10, country='United States'),
-    'PAGT': station(name='Nightmute', coordinate=(60.46667, -164.7), altitude=4, country='United States'),
-    'PAGY': station(name='SKAGWAY AIRPORT', coordinate=(59.46667, -135.31667), altitude=13, country='United States'),
-    'PAHD': station(name='Homer / Municipal', coordinate=(59.63333, -151.5), altitude=24, country='United States'),
-    'PAHL': station(name='Huslia, Huslia Airport', coordinate=(65.6975, -156.35111), altitude=65, country='United States'),
-    'PAHN': station(name='HAINES AIRPORT', coordinate=(59.25, -135.51667), altitude=5, country='United States'),
-    'PAHO': station(name='HOMER AIRPORT', coordinate=(59.65, -151.48333), altitude=24, country='United States'),
-    'PAHP': station(name='Hooper Bay, Hooper Bay Airport', coordinate=(61.51667, -166.13333), altitude=5, country='United States'),
-    'PAHS': station(name='Huslia, Huslia Airport', coordinate=(65.7, -156.38333), altitude=55, country='United States'),
-    'PAHV': station(name='Healy, Healy', coordinate=(63.87778, -149.01139), altitude=431, country='United States'),
-    'PAHY': station(name='Hydaburg, Hydaburg Seaplane Base', coordinate=(55.2, -132.83333), altitude=0, country='United States'),
-    'PAHZ': station(name='Hayes River, Hayes River Airport', coordinate=(61.98333, -152.08333), altitude=305, country='United States'),
-    'PAII': station(name='Egegik, Egegik Airport', coordinate=(58.18528, -157.38556), altitude=28, country='United States'),
-    'PAIK': station(name='Kiana Kinana/Bob Baker Mem', coordinate=(66.98333, -160.43333), altitude=46, country='United States'),
-    'PAIL': station(name='ILIAMNA AIRPORT', coordinate=(59.75, -154.91667), altitude=63, country='United States'),
-    'PAIM': station(name='Utopia Creek, Indian Mountain LRRS Airport', coordinate=(66.98333, -153.7), altitude=372, country='United States'),
-    'PAIN': station(name='McKinley Park, McKinley National Park Airport', coordinate=(63.73333, -148.91667), altitude=524, country='United States'),
-    'PAIW': station(name='Wales', coordinate=(65.61667, -168.1), altitude=7, country='United States'),
-    'PAIZ': station(name='Lazy Mtn / Wolverine', coordinate=(61.63333, -149.03333), altitude=236, country='United States'),
-    'PAJB': station(name='Biorka Island Supplementary Aviation Weather Reporting Station', coordinate=(56.85, -135.53333), altitude=15, country='United States'),
-    'PAJC': station(name='Chignik, Chignik Airport', coordinate=(56.31139, -158.37333), altitude=6, country='United States'),
-    'PAJN': station(name='JUNEAU INTERNATIONAL AIRPORT', coordinate=(58.35, -134.56667), altitude=6, country='United States'),
-    'PAJO': station(name='Johnstone Point', coordinate=(60.48333, -146.6), altitude=14, country='United States'),
-    'PAJV': station(name='Sutton', coordinate=(61.71667, -148.88333), altitude=265, country='United States'),
-    'PAKI': station(name='Kipnuk, Kipnuk Airport', coordinate=(59.93278, -164.03028), altitude=3, country='United States'),
-    'PAKK': station(name='Koyuk, Koyuk Airport', coordinate=(64.93389, -161.15806), altitude=37, country='United States'),
-    'PAKN': station(name='KING SALMON AIRPORT', coordinate=(58.68333, -156.65), altitude=17, country='United States'),
-    'PAKO': station(name='Nikolski', coordinate=(52.95, -168.85), altitude=21, country='United States'),
-    'PAKP': station(name='Anaktuvuk Pass, Anaktuvuk Pass Airport', coordinate=(68.13361, -151.74333), altitude=641, country='United States'),
-    'PAKT': station(name='KETCHIKAN INTERNATIONAL AIRPORT', coordinate=(55.35, -131.71667), altitude=27, country='United States'),
-    'PAKU': station(name='Kuparuk, Ugnu-Kuparuk Airport', coordinate=(70.31667, -149.58333), altitude=20, country='United States'),
-    'PAKV': station(name='KALTAG AIRPORT', coordinate=(64.31667, -158.73333), altitude=57, country='United States'),
-    'PAKW': station(name='Klawock, Klawock Airport', coordinate=(55.58333, -133.08333), altitude=24, country='United States'),
-    'PALH': station(name='LAKE HOOD', coordinate=(61.18333, -149.98333), altitude=22, country='United States'),
-    'PALJ': station(name='Port Alsworth, Port Alsworth Airport', coordinate=(60.2, -154.31667), altitude=85, country='United States'),
-    'PALK': station(name='Snowshoe Lake', coordinate=(62.03, -146.6925), altitude=701, country='United States'),
-    'PALP': station(name='Deadhorse, Alpine Airstrip', coordinate=(70.33333, -150.93333), altitude=5, country='United States'),
-    'PALR': station(name='Chandalar Lake, Chandalar Lake Airport', coordinate=(67.5, -148.48333), altitude=585, country='United States'),
-    'PALU': station(name='Cape Lisburne, Cape Lisburne LRRS Airport', coordinate=(68.88333, -166.1), altitude=4, country='United States'),
-    'PALV': station(name='Big River Lake', coordinate=(60.81667, -152.3), altitude=12, country='United States'),
-    'PAMC': station(name='MCGRATH AIRPORT', coordinate=(62.95, -155.6), altitude=103, country='United States'),
-    'PAMD': station(name='Middleton Island, Middleton Island Airport', coordinate=(59.43333, -146.3), altitude=27, country='United States'),
-    'PAMH': station(name='Minchumina, Minchumina Airport', coordinate=(63.88056, -152.30056), altitude=208, country='United States'),
-    'PAML': station(name='Manley Hot Springs, Manly Hot Springs Airport', coordinate=(64.99861, -150.63806), altitude=81, country='United States'),
-    'PAMM': station(name='Metlakatla, Metlakatla Seaplane Base', coordinate=(55.13111, -131.57806), altitude=0, country='United States'),
-    'PAMR': station(name='ANCHORAGE MERRILL FIELD', coordinate=(61.21667, -149.85), altitude=42, country='United States'),
-    'PAMX': station(name='McCarthy', coordinate=(61.43333, -142.93333), altitude=455, country='United States'),
-    'PAMY': station(name='Mekoryuk, Mekoryuk Airport', coordinate=(60.36667, -166.26667), altitude=15, country='United States'),
-    'PANC': station(name='TED STEVENS ANCHORAGE INTERNATIONAL', coordinate=(61.16667, -150.03333), altitude=44, country='United States'),
-    'PANI': station(name='Aniak, Aniak Airport', coordinate=(61.58139, -159.54278), altitude=27, country='United States'),
-    'PANN': station(name='NENANA MUNICIPAL AIRPORT', coordinate=(64.55, -149.06667), altitude=110, country='United States'),
-    'PANR': station(name='Funter Bay Seaplane', coordinate=(58.25, -134.9), altitude=0, country='United States'),
-    'PANT': station(name='ANNETTE ISLAND AIRPORT', coordinate=(55.03333, -131.58333), altitude=36, country='United States'),
-    'PANV': station(name='Anvik, Anvik Airport', coordinate=(62.64833, -160.18972), altitude=94, country='United States'),
-    'PAOH': station(name='Hoonah, Hoonah Seaplane Base', coordinate=(58.11667, -135.45), altitude=0, country='United States'),
-    'PAOM': station(name='NOME AIRPORT', coordinate=(64.51667, -165.43333), altitude=11, country='United States'),
-    'PAOR': station(name='NORTHWAY AIRPORT', coordinate=(62.96667, 141.93333), altitude=523, country='United States'),
-    'PAOT': station(name='WIEN MEMORIAL AIRPORT', coordinate=(66.88333, -162.6), altitude=3, country='United States'),
-    'PAPB': station(name='ST. GEORGE AIRPORT', coordinate=(56.58333, -169.66667), altitude=38, country='United States'),
-    'PAPC': station(name='Port Clarence, Port Clarence Coast Guard Station', coordinate=(65.25, -166.85), altitude=3, country='United States'),
-    'PAPG': station(name='Petersburg', coordinate=(56.81667, -132.96667), altitude=0, country='United States'),
-    'PAPH': station(name='Port Heiden, Port Heiden Airport', coordinate=(56.95, -158.63333), altitude=29, country='United States'),
-    'PAPM': station(name='Platinum', coordinate=(59.01667, -161.81667), altitude=3, country='United States'),
-    'PAPO': station(name='Point Hope, Point Hope Airport', coordinate=(68.35, -166.8), altitude=4, country='United States'),
-    'PAPR': station(name='Prospect Creek, Prospect Creek Airport', coordinate=(66.81278, -150.64389), altitude=335, country='United States'),
-    'PAPT': station(name='Puntilla', coordinate=(62.1, -152.75), altitude=560, country='United States'),
-    'PAQT': station(name='NUIQSUT AIRPORT', coordinate=(70.21667, -150.98333), altitude=12, country='United States'),
-    'PARC': station(name='Arctic Village, Arctic Village Airport', coordinate=(68.11444, -145.57917), altitude=638, country='United States'),
-    'PARD': station(name='Red Dog, Red Dog Airport', coordinate=(68.03139, -162.90306), altitude=297, country='United States'),
-    'PARL': station(name='Central, Central Airport', coordinate=(65.57389, -144.78306), altitude=284, country='United States'),
-    'PASA': station(name='Savoonga Airport', coordinate=(63.68333, -170.5), altitude=16, country='United States'),
-    'PASC': station(name='DEADHORSE AIRPORT', coordinate=(70.2, -148.48333), altitude=19, country='United States'),
-    'PASD': station(name='Sand Point', coordinate=(55.31667, -160.51667), altitude=7, country='United States'),
-    'PASG': station(name='Skagway, Skagway Airport', coordinate=(59.45528, -136.32306), altitude=13, country='United States'),
-    'PASH': station(name='Shishmaref, Shishmaref Airport', coordinate=(66.26667, -166.08333), altitude=4, country='United States'),
-    'PASI': station(name='SITKA AIRPORT', coordinate=(57.05, -135.36667), altitude=6, country='United States'),
-    'PASK': station(name='Selawik', coordinate=(66.61667, -160.0), altitude=8, country='United States'),
-    'PASL': station(name='Sleetmute', coordinate=(61.71667, -157.15), altitude=54, country='United States'),
-    'PASM': station(name="St. Mary's, St. Mary's Airport", coordinate=(62.05, -163.3), altitude=95, country='United States'),
-    'PASN': station(name='ST PAUL ISLAND AIRPORT', coordinate=(57.16667, -170.21667), altitude=19, country='United States'),
-    'PASO': station(name='SELDOVIA AIRPORT', coordinate=(59.45, -151.7), altitude=9, country='United States'),
-    'PASP': station(name='Sheep Mountain, Sheep Mountain Lodge', coordinate=(61.8125, -147.49972), altitude=838, country='United States'),
-    'PASV': station(name='Sparrevohn Airways Facilities Sector', coordinate=(61.1, -155.56667), altitude=484, country='United States'),
-    'PASW': station(name='Skwentna', coordinate=(61.97722, -151.21722), altitude=46, country='United States'),
-    'PASX': station(name='Soldotna', coordinate=(60.48333, -151.03333), altitude=33, country='United States'),
-    'PASY': station(name='SHEMYA EARECKSON AS', coordinate=(52.71667, 174.11667), altitude=30, country='United States'),
-    'PATA': station(name='TANANA CALHOUN MEMORIAL AIRPORT', coordinate=(65.16667, -152.1), altitude=72, country='United States'),
-    'PATC': station(name='Tin City Airways Facilities Sector', coordinate=(65.56667, -167.91667), altitude=83, country='United States'),
-    'PATE': station(name='Teller', coordinate=(65.23333, -166.33333), altitude=90, country='United States'),
-    'PATG': station(name='Togiac Village, Togiak Airport', coordinate=(59.05, -160.4), altitude=6, country='United States'),
-    'PATJ': station(name='Tok', coordinate=(63.31667, -142.71667), altitude=509, country='United States'),
-    'PATK': station(name='TALKEETNA AIRPORT', coordinate=(62.31667, -150.1), altitude=109, country='United States'),
-    'PATL': station(name='Takotna, Tatalina LRRS Airport', coordinate=(62.9, -155.98333), altitude=294, country='United States'),
-    'PATO': station(name='PORTAGE GLACIER', coordinate=(60.78333, -148.85), altitude=31, country='United States'),
-    'PATW': station(name='Cantwell, Cantwell', coordinate=(62.39528, -148.89667), altitude=651, country='United States'),
-    'PAUM': station(name='Umiat', coordinate=(69.36667, -152.13333), altitude=81, country='United States'),
-    'PAUN': station(name='Unalakleet', coordinate=(63.88333, -160.8), altitude=6, country='United States'),
-    'PAUO': station(name='Willow Lake', coordinate=(61.74806, -150.05444), altitude=64, country='United States'),
-    'PAVD': station(name='Valdez 2', coordinate=(61.13333, -146.26667), altitude=37, country='United States'),
-    'PAVL': station(name='KIVALINA AIRPORT', coordinate=(67.73333, -164.55), altitude=4, country='United States'),
-    'PAVW': station(name='Valdez Weather Station Office', coordinate=(61.13333, -146.35), altitude=10, country='United States'),
-    'PAWD': station(name='Seward', coordinate=(60.11667, -149.45), altitude=9, country='United States'),
-    'PAWG': station(name='Wrangell', coordinate=(56.48333, -132.36667), altitude=13, country='United States'),
-    'PAWI': station(name='WAINWRIGHT AIRPORT', coordinate=(70.63333, -160.03333), altitude=9, country='United States'),
-    'PAWN': station(name='Noatak, Noatak Airport', coordinate=(67.56667, -162.98333), altitude=27, country='United States'),
-    'PAWR': station(name='Whittier', coordinate=(60.77278, -148.685), altitude=20, country='United States'),
-    'PAWS': station(name='Wasilla, Wasilla Airport', coordinate=(61.57194, -149.54056), altitude=106, country='United States'),
-    'PAXK': station(name='Paxson', coordinate=(63.03278, -145.49806), altitude=823, country='United States'),
-    'PAYA': station(name='YAKUTAT AIRPORT', coordinate=(59.5, -139.66667), altitude=10, country='United States'),
-    'PAZK': station(name='Eureka, Skelton Airport', coordinate=(61.93333, -147.16667), altitude=1002, country='United States'),
-    'PBTI': station(name='Barter Island Distant Early Warning', coordinate=(70.13333, -143.58333), altitude=2, country='United States'),
-    'PFYU': station(name='Fort Yukon, Fort Yukon Airport', coordinate=(66.56667, -145.26667), altitude=433, country='United States'),
-    'PGAC': station(name='Guam, Mariana Island', coordinate=(13.91667, 144.83333), altitude=111, country='United States'),
-    'PGNT': station(name='Sabanettan / Tinian Island', coordinate=(15.6, 145.1), altitude=80, country='United States'),
-    'PGRO': station(name='Rota Island, N. Mariana Is, Rota International Airport', coordinate=(14.18333, 145.25), altitude=185, country='United States'),
-    'PGSN': station(name='Saipan Island, Saipan International Airport', coordinate=(15.11667, 145.73333), altitude=66, country='United States'),
-    'PGUA': station(name='Andersen, Mariana Is, Andersen Air Force Base', coordinate=(13.58333, 144.93333), altitude=187, country='United States'),
-    'PGUM': station(name='Agana, Guam International Airport', coordinate=(13.48333, 144.8), altitude=91, country='United States'),
-    'PGWT': station(name='Tinian Island, N. Mariana Is, West Tinian Airport', coordinate=(14.98333, 145.61667), altitude=82, country='United States'),
-    'PHBK': station(name='PMRF BARKING SANDS', coordinate=(22.03333, -159.78333), altitude=4, country='United States'),
-    'PHHI': station(name='Wheeler Air Force Base / Oahu', coordinate=(21.48333, -158.03333), altitude=255, country='United States'),
-    'PHHN': station(name='Hana, Hana Airport', coordinate=(20.79556, -156.01444), altitude=24, country='United States'),
-    'PHIK': station(name='Hickam Air Force Base / Oahu', coordinate=(21.31667, -157.91667), altitude=4, country='United States'),
-    'PHJH': station(name='Lahaina / West Maui', coordinate=(21.01667, -156.63333), altitude=40, country='United States'),
-    'PHJR': station(name='KALAELOA AIRPORT', coordinate=(21.31667, -158.06667), altitude=10, country='United States'),
-    'PHKO': station(name='KONA INTERNATIONAL AIRPORT', coordinate=(19.73333, -156.05), altitude=13, country='United States'),
-    'PHLI': station(name='LIHUE AIRPORT', coordinate=(21.98333, -159.33333), altitude=45, country='United States'),
-    'PHMK': station(name='Kaunakakai, Molokai Airport', coordinate=(21.15, -157.1), altitude=138, country='United States'),
-    'PHMO': station(name='KAUNAKAKAI MOLOKAI AIRPORT', coordinate=(21.15, -157.1), altitude=138, country='UNITED STATES'),
-    'PHMU': station(name='Kamuela, Waimea-Kohala Airport', coordinate=(20.0, -155.66667), altitude=814, country='United States'),
-    'PHNG': station(name='MCBH KANEOHE BAY HAWAII', coordinate=(21.45, -157.75), altitude=7, country='United States'),
-    'PHNL': station(name='HONOLULU INTERNATIONAL AIRPORT', coordinate=(21.33333, -157.95), altitude=4, country='United States'),
-    'PHNY': station(name='Lanai City, Lanai Airport', coordinate=(20.78556, -156.95139), altitude=399, country='United States'),
-    'PHOG': station(name='KAHULUI AIRPORT', coordinate=(20.9, -156.43333), altitude=16, country='United States'),
-    'PHSF': station(name='Bradshaw Army Air Field / Hawaii', coordinate=(19.78333, -155.55), altitude=1887, country='United States'),
-    'PHTO': station(name='HILO INTERNATIONAL AIRPORT', coordinate=(19.71667, -155.05), altitude=12, country='United States'),
-    'PHWH': station(name='South Kona / Hawaii', coordinate=(19.1, -155.75), altitude=808, country='United States'),
-    'PJON': station(name='Johnston Island, Johnston Atoll Airport', coordinate=(16.73333, -169.53333), altitude=2, country='United States Minor Outlying Islands'),
-    'PKMJ': station(name='Majuro Atoll, Marshall Islands Int. Airp.', coordinate=(7.06667, 171.28333), altitude=2, country='Marshall Islands'),
-    'PKMR': station(name='Majuro Atoll, NWS Office', coordinate=(7.08333, 171.2), altitude=4, country='Marshall Islands'),
-    'PKWA': station(name='Kwajalein, Bucholz AAF, Kwajalein KMR ATOL Airport', coordinate=(8.71667, 167.73333), altitude=3, country='Marshall Islands'),
-    'PLCH': station(name='Christmas / Cassidy', coordinate=(1.98333, -157.48333), altitude=3, country='New Zealand'),
-    'PLFA': station(name='Fanning Island', coordinate=(3.85, -159.36667), altitude=5, country='New Zealand'),
-    'PMDY': station(name='Sand Island, Henderson Field Airport', coordinate=(28.21667, -177.36667), altitude=4, country='United States'),
-    'POLI': station(name='Oliktok Distant Early Warning', coordinate=(70.5, -149.88333), altitude=5, country='United States'),
-    'PPIZ': station(name='Point Lay, Point Lay LRRS Airport', coordinate=(69.71667, -163.0), altitude=8, country='United States'),
-    'PTKK': station(name='Weno Island, Chuuk Int. Airp.', coordinate=(7.46667, 151.85), altitude=3, country='Micronesia, Federated States of'),
-    'PTKR': station(name='Koror, Palau, NWS Office', coordinate=(7.33333, 134.48333), altitude=30, country='Palau'),
-    'PTPN': station(name='Pohnpei Island, Pohnpei Int. Airp.', coordinate=(6.98333, 158.2), altitude=2, country='Micronesia, Federated States of'),
-    'PTRO': station(name='Babelthuap Island, Babelthuap/Koror Airport', coordinate=(7.36667, 134.53333), altitude=54, country='Palau'),
-    'PTSA': station(name='Kosrae Island, Kosrae Airport', coordinate=(5.35, 162.95), altitude=3, country='Micronesia, Federated States of'),
-    'PTTK': station(name='Kosrae Carolines / V', coordinate=(5.35, 162.95), altitude=2, country='Micronesia, Federated States of'),
-    'PTTP': station(name='Pohnpei, NWS Office', coordinate=(6.96667, 158.21667), altitude=39, country='Micronesia, Federated States of'),
-    'PTYA': station(name='Yap Island, Yap Int. Airp.', coordinate=(9.48333, 138.08333), altitude=28, country='Micronesia, Federated States of'),
-    'PWAK': station(name='Wake Island, Wake Island Army Airfield Airport', coordinate=(19.28333, 166.65), altitude=4, country='United States'),
-    'RCAY': station(name='Kangshan Tw-Afb', coordinate=(22.78333, 120.26667), altitude=10, country='Taiwan'),
-    'RCBS': station(name='Chinmem / Shatou Air Force Base', coordinate=(24.43333, 118.36667), altitude=9, country='Taiwan'),
-    'RCDC': station(name='Pingtung South Air Force Base', coordinate=(22.68333, 120.46667), altitude=24, country='Taiwan'),
-    'RCFG': station(name='Mazu', coordinate=(26.16667, 119.93333), altitude=91, country='Taiwan'),
-    'RCFN': station(name='Feng Nin Tw-Afb', coordinate=(22.76667, 121.08333), altitude=42, country='Taiwan'),
-    'RCFS': station(name='Chia Tung', coordinate=(22.41667, 120.55), altitude=20, country='Taiwan'),
-    'RCGM': station(name='Taoyuan Ab = 589650', coordinate=(25.06667, 121.23333), altitude=45, country='Taiwan'),
-    'RCKH': station(name='Kaohsiung International Airport', coordinate=(22.58333, 120.35), altitude=9, country='Taiwan'),
-    'RCKU': station(name='Chiayi Tw-Afb', coordinate=(23.46667, 120.38333), altitude=25, country='Taiwan'),
-    'RCKW': station(name='Hengchun', coordinate=(21.93333, 120.83333), altitude=13, country='Taiwan'),
-    'RCLG': station(name='Taichung Tw-Afb', coordinate=(24.18333, 120.65), altitude=112, country='Taiwan'),
-    'RCLM': station(name='Dongsha', coordinate=(20.66667, 116.71667), altitude=6, country='Taiwan'),
-    'RCLY': station(name='Lan Yu', coordinate=(22.03333, 121.55), altitude=325, country='Taiwan'),
-    'RCMJ': station(name='Donggang', coordinate=(22.46667, 120.43333), altitude=8, country='Taiwan'),
-    'RCMQ': station(name='Wuchia Observatory', coordinate=(24.26667, 120.61667), altitude=5, country='Taiwan'),
-    'RCMS': station(name='Ilan', coordinate=(24.75, 121.76667), altitude=9, country='Taiwan'),
-    'RCNN': station(name='Tainan Tw-Afb', coordinate=(22.95, 120.2), altitude=19, country='Taiwan'),
-    'RCNO': station(name='Dongshi', coordinate=(23.26667, 119.66667), altitude=45, country='Taiwan'),
-    'RCPO': station(name='Hsinchu Tw-Afb', coordinate=(24.81667, 120.93333), altitude=8, country='Taiwan'),
-    'RCQC': station(name='Makung Ab', coordinate=(23.58333, 119.61667), altitude=31, country='Taiwan'),
-    'RCQS': station(name='Chihhang Tw-Afb', coordinate=(22.8, 121.18333), altitude=37, country='Taiwan'),
-    'RCSQ': station(name='Pingtung North Air Force Base', coordinate=(22.7, 120.48333), altitude=29, country='Taiwan'),
-    'RCSS': station(name='Sungshan / Taipei', coordinate=(25.06667, 121.55), altitude=6, country='Taiwan'),
-    'RCTP': station(name='Chiang Kai Shek', coordinate=(25.08333, 121.21667), altitude=33, country='Taiwan'),
-    'RCUK': station(name='Pa Kuei / Bakuai', coordinate=(24.93333, 121.3), altitude=141, country='Taiwan'),
-    'RCYU': station(name='Hulien Ab', coordinate=(24.03333, 121.61667), altitude=16, country='Taiwan'),
-    'RJAA': station(name='New Tokyo Inter-National Airport', coordinate=(35.76667, 140.38333), altitude=41, country='Japan'),
-    'RJAF': station(name='Matsumoto Airport', coordinate=(36.16667, 137.93333), altitude=668, country='Japan'),
-    'RJAH': station(name='Hyakuri Ab', coordinate=(36.18333, 140.41667), altitude=32, country='Japan'),
-    'RJAI': station(name='Ichikawa', coordinate=(35.73333, 139.91667), altitude=31, country='Japan'),
-    'RJAK': station(name='Kasumigaura Ab', coordinate=(36.03333, 140.2), altitude=26, country='Japan'),
-    'RJAM': station(name='Minamitorishima', coordinate=(24.3, 153.96667), altitude=8, country='Japan'),
-    'RJAO': station(name='Chichijima', coordinate=(27.08333, 142.18333), altitude=3, country='Japan'),
-    'RJAT': station(name='Fuji Ab', coordinate=(35.31667, 138.86667), altitude=680, country='Japan'),
-    'RJAW': station(name='Iwojima', coordinate=(24.78333, 141.31667), altitude=113, country='Japan'),
-    'RJBB': station(name='Kansai International Airport', coordinate=(34.41667, 135.25), altitude=5, country='Japan'),
-    'RJBD': station(name='Nankishirahama Airport', coordinate=(33.66667, 135.35), altitude=105, country='Japan'),
-    'RJBH': station(name='Hiroshimanishi', coordinate=(34.36667, 132.43333), altitude=5, country='Japan'),
-    'RJBT': station(name='Tajima', coordinate=(35.51667, 134.8), altitude=210, country='Japan'),
-    'RJCA': station(name='Asahikawa Ab', coordinate=(43.8, 142.36667), altitude=115, country='Japan'),
-    'RJCB': station(name='Obihiro Airport', coordinate=(42.73333, 143.21667), altitude=149, country='Japan'),
-    'RJCC': station(name='Chitose Ab', coordinate=(42.8, 141.66667), altitude=27, country='Japan'),
-    'RJCH': station(name='Hakodate Airport', coordinate=(41.76667, 140.81667), altitude=33, country='Japan'),
-    'RJCJ': station(name='Chitose Japanese Air Self Defense Force', coordinate=(42.81667, 141.68333), altitude=27, country='Japan'),
-    'RJCK': station(name='Kushiro Airport', coordinate=(43.03333, 144.2), altitude=95, country='Japan'),
-    'RJCM': station(name='Memambetsu Airport', coordinate=(43.88333, 144.16667), altitude=33, country='Japan'),
-    'RJCN': station(name='Nakashibetsu Airport', coordinate=(43.56667, 144.96667), altitude=66, country='Japan'),
-    'RJCO': station(name='Sapporo Ab', coordinate=(43.11667, 141.38333), altitude=8, country='Japan'),
-    'RJCR': station(name='Rebun Island', coordinate=(45.45, 141.03333), altitude=27, country='Japan'),
-    'RJCS': station(name='Kushiro', coordinate=(42.98333, 144.4), altitude=32, country='Japan'),
-    'RJCT': station(name='Tokachi Japanese Ground Self Defense Force', coordinate=(42.9, 143.16667), altitude=84, country='Japan'),
-    'RJCW': station(name='Wakkanai Airport', coordinate=(45.4, 141.8), altitude=8, country='Japan'),
-    'RJCY': station(name='Muroran', coordinate=(42.31667, 140.98333), altitude=40, country='Japan'),
-    'RJDB': station(name='Iki Airport', coordinate=(33.75, 129.78333), altitude=13, country='Japan'),
-    'RJDC': station(name='Yamaguchi Ube Airport', coordinate=(33.93333, 131.28333), altitude=5, country='Japan'),
-    'RJDK': station(name='Kamigoto', coordinate=(33.01667, 129.18333), altitude=20, country='Japan'),
-    'RJDM': station(name='Metabaru Ab', coordinate=(33.31667, 130.41667), altitude=16, country='Japan'),
-    'RJDO': station(name='Ojika Island', coordinate=(33.21667, 129.05), altitude=20, country='Japan'),
-    'RJDT': station(name='Tsushima Airport', coordinate=(34.28333, 129.33333), altitude=63, country='Japan'),
-    'RJEB': station(name='Mombetsu Airport', coordinate=(44.25, 143.53333), altitude=6, country='Japan'),
-    'RJEC': station(name='Asahikawa Airport', coordinate=(43.66667, 142.45), altitude=208, country='Japan'),
-    'RJEO': station(name='Okushiri Island', coordinate=(42.06667, 139.45), altitude=36, country='Japan'),
-    'RJER': station(name='Rishiri Island', coordinate=(45.25, 141.18333), altitude=30, country='Japan'),
-    'RJFA': station(name='Ashiya Ab', coordinate=(33.88333, 130.65), altitude=30, country='Japan'),
-    'RJFC': station(name='Yakushima', coordinate=(30.38333, 130.66667), altitude=36, country='Japan'),
-    'RJFE': station(name='Fukue Airport', coordinate=(32.66667, 128.83333), altitude=77, country='Japan'),
-    'RJFF': station(name='Fukuoka Airport', coordinate=(33.58333, 130.45), altitude=9, country='Japan'),
-    'RJFG': station(name='Tanegashima Airport', coordinate=(30.55, 130.95), altitude=92, country='Japan'),
-    'RJFK': station(name='Kagoshima Airport', coordinate=(31.8, 130.71667), altitude=272, country='Japan'),
-    'RJFM': station(name='Miyazaki Airport', coordinate=(31.86667, 131.45), altitude=6, country='Japan'),
-    'RJFN': station(name='Nyutabaru Ab', coordinate=(32.08333, 131.45), altitude=79, country='Japan'),
-    'RJFO': station(name='Oita Airport', coordinate=(33.48333, 131.73333), altitude=5, country='Japan'),
-    'RJFR': station(name='Kitakyushu Airport', coordinate=(33.83333, 130.95), altitude=3, country='Japan'),
-    'RJFS': station(name='Saga Airport', coordinate=(33.15, 130.3), altitude=2, country='Japan'),
-    'RJFT': station(name='Kumamoto Airport', coordinate=(32.83333, 130.85), altitude=193, country='Japan'),
-    'RJFU': station(name='Nagasaki Airport', coordinate=(32.91667, 129.91667), altitude=2, country='Japan'),
-    'RJFW': station(name='Sasebo Usn', coordinate=(33.15, 129.71667), altitude=19, country='Japan'),
-    'RJFY': station(name='Kanoya Ab', coordinate=(31.36667, 130.83333), altitude=65, country='Japan'),
-    'RJFZ': station(name='Tsuiki Ab', coordinate=(33.68333, 131.05), altitude=17, country='Japan'),
-    'RJGG': station(name='Nagoya Airport', coordinate=(35.25, 136.93333), altitude=14, country='Japan'),
-    'RJKA': station(name='Amami Airport', coordinate=(28.43333, 129.71667), altitude=4, country='Japan'),
-    'RJKB': station(name='Okinoerabu', coordinate=(27.43333, 128.7), altitude=27, country='Japan'),
-    'RJKI': station(name='Kikai Island', coordinate=(28.31667, 129.93333), altitude=6, country='Japan'),
-    'RJKN': station(name='Tokunoshima Island', coordinate=(27.83333, 128.88333), altitude=5, country='Japan'),
-    'RJNF': station(name='Fukui Airport', coordinate=(36.13333, 136.23333), altitude=5, country='Japan'),
-    'RJNG': station(name='Gifu Ab', coordinate=(35.38333, 136.86667), altitude=39, country='Japan'),
-    'RJNH': station(name='Hamamatsu Ab', coordinate=(34.75, 137.7), altitude=45, country='Japan'),
-    'RJNK': station(name='Komatsu Ab', coordinate=(36.38333, 136.41667), altitude=6, country='Japan'),
-    'RJNN': station(name='Nagoya Airport', coordinate=(35.25, 136.93333), altitude=14, country='Japan'),
-    'RJNO': station(name='Oki Airport', coordinate=(36.18333, 133.33333), altitude=92, country='Japan'),
-    'RJNT': station(name='Toyama Airport', coordinate=(36.65, 137.18333), altitude=24, country='Japan'),
-    'RJNY': station(name='Shizuhama Ab', coordinate=(34.81667, 138.3), altitude=7, country='Japan'),
-    'RJOA': station(name='Hiroshima Airport', coordinate=(34.43333, 132.91667), altitude=331, country='Japan'),
-    'RJOB': station(name='Okayama Airport', coordinate=(34.75, 133.85), altitude=241, country='Japan'),
-    'RJOC': station(name='Izumo Airport', coordinate=(35.41667, 132.9), altitude=2, country='Japan'),
-    'RJOE': station(name='Akeno Ab', coordinate=(34.53333, 136.68333), altitude=6, country='Japan'),
-    'RJOF': station(name='Hofu Ab', coordinate=(34.03333, 131.55), altitude=2, country='Japan'),
-    'RJOH': station(name='Miho Ab', coordinate=(35.48333, 133.25), altitude=6, country='Japan'),
-    'RJOI': station(name='MCAS IWAKUNI,JAPAN', coordinate=(34.15, 132.23333), altitude=2, country='Japan'),
-    'RJOK': station(name='Kochi Airport', coordinate=(33.53333, 133.66667), altitude=7, country='Japan'),
-    'RJOM': station(name='Matsuyama Airport', coordinate=(33.81667, 132.7), altitude=4, country='Japan'),
-    'RJOO': station(name='Osaka International Airport', coordinate=(34.78333, 135.45), altitude=12, country='Japan'),
-    'RJOP': station(name='Komatsujima Ab', coordinate=(34.0, 134.63333), altitude=3, country='Japan'),
-    'RJOR': station(name='Tottori Airport', coordinate=(35.53333, 134.16667), altitude=15, country='Japan'),
-    'RJOS': station(name='Tokushima Ab', coordinate=(34.13333, 134.61667), altitude=8, country='Japan'),
-    'RJOT': station(name='Takamatsu Airport', coordinate=(34.21667, 134.01667), altitude=185, country='Japan'),
-    'RJOW': station(name='Iwami Airport', coordinate=(34.66667, 131.8), altitude=54, country='Japan'),
-    'RJOY': station(name='Yao Airport', coordinate=(34.6, 135.6), altitude=10, country='Japan'),
-    'RJOZ': station(name='Ozuki Ab', coordinate=(34.05, 131.05), altitude=4, country='Japan'),
-    'RJSA': station(name='Aomori Airport', coordinate=(40.73333, 140.7), altitude=199, country='Japan'),
-    'RJSC': station(name='Yamagata Airport', coordinate=(38.41667, 140.36667), altitude=105, country='Japan'),
-    'RJSD': station(name='Sado Airport', coordinate=(38.05, 138.41667), altitude=23, country='Japan'),
-    'RJSF': station(name='Fukushima Airport', coordinate=(37.23333, 140.43333), altitude=372, country='Japan'),
-    'RJSH': station(name='Hachinohe Ab', coordinate=(40.55, 141.46667), altitude=46, country='Japan'),
-    'RJSI': station(name='Hanamaki Airport', coordinate=(39.43333, 141.13333), altitude=90, country='Japan'),
-    'RJSK': station(name='Akita Airport', coordinate=(39.61667, 140.21667), altitude=93, country='Japan'),
-    'RJSM': station(name='Misawa Ab', coordinate=(40.7, 141.38333), altitude=36, country='Japan'),
-    'RJSN': station(name='Niigata Airport', coordinate=(37.95, 139.11667), altitude=1, country='Japan'),
-    'RJSO': station(name='Ominato Ab', coordinate=(41.23333, 141.13333), altitude=7, country='Japan'),
-    'RJSR': station(name='Odate-Noshiro Airport', coordinate=(40.18333, 140.2), altitude=84, country='Japan'),
-    'RJSS': station(name='Sendai Airport', coordinate=(38.13333, 140.91667), altitude=1, country='Japan'),
-    'RJST': station(name='Matsushima Ab', coordinate=(38.4, 141.21667), altitude=2, country='Japan'),
-    'RJSU': station(name='Kasuminome Ab', coordinate=(38.23333, 140.91667), altitude=7, country='Japan'),
-    'RJSY': station(name='Shonai', coordinate=(38.81667, 139.78333), altitude=22, country='Japan'),
-    'RJTA': station(name='Atsugi United States Naval Air Station', coordinate=(35.45, 139.45), altitude=62, country='Japan'),
-    'RJTC': station(name='Tachikawa Ab', coordinate=(35.7, 139.4), altitude=95, country='Japan'),
-    'RJTD': station(name='Tokyo', coordinate=(35.68333, 139.76667), altitude=5, country='Japan'),
-    'RJTE': station(name='Tateyama Ab', coordinate=(34.98333, 139.83333), altitude=3, country='Japan'),
-    'RJTF': station(name='Chofu Airport', coordinate=(35.66667, 139.53333), altitude=41, country='Japan'),
-    'RJTH': station(name='Hachijojima Airport', coordinate=(33.11667, 139.78333), altitude=92, country='Japan'),
-    'RJTI': station(name='Tokyo Heliport', coordinate=(35.63333, 139.85), altitude=5, country='Japan'),
-    'RJTJ': station(name='Iruma Ab', coordinate=(35.83333, 139.41667), altitude=90, country='Japan'),
-    'RJTK': station(name='Kisarazu Ab', coordinate=(35.4, 139.91667), altitude=3, country='Japan'),
-    'RJTL': station(name='Shimofusa Ab', coordinate=(35.8, 140.01667), altitude=30, country='Japan'),
-    'RJTO': station(name='Oshima Airport', coordinate=(34.78333, 139.36667), altitude=38, country='Japan'),
-    'RJTQ': station(name='Miyakejima Airport', coordinate=(34.06667, 139.56667), altitude=20, country='Japan'),
-    'RJTR': station(name='Zama Airfield', coordinate=(35.51667, 139.4), altitude=109, country='Japan'),
-    'RJTT': station(name='Tokyo International Airport', coordinate=(35.55, 139.78333), altitude=5, country='Japan'),
-    'RJTU': station(name='Utsunomiya Ab', coordinate=(36.51667, 139.86667), altitude=102, country='Japan'),
-    'RJTX': station(name='Yokosuka Fwf', coordinate=(35.28333, 139.66667), altitude=49, country='Japan'),
-    'RJTY': station(name='Yokota Ab', coordinate=(35.75, 139.35), altitude=139, country='Japan'),
-    'RKJJ': station(name='Kwangju Ab', coordinate=(35.11667, 126.81667), altitude=13, country='Korea, South'),
-    'RKJK': station(name='Kunsan Ab', coordinate=(35.91667, 126.61667), altitude=10, country='Korea, South'),
-    'RKJY': station(name='Yosu Airport', coordinate=(34.83333, 127.61667), altitude=21, country='Korea, South'),
-    'RKNC': station(name='Chunchon Ab', coordinate=(37.86667, 127.71667), altitude=76, country='Korea, South'),
-    'RKNF': station(name='Whang Ryeong', coordinate=(37.75, 128.66667), altitude=1407, country='Korea, South'),
-    'RKNH': station(name='Hoengsong Ab', coordinate=(37.43333, 127.95), altitude=100, country='Korea, South'),
-    'RKNN': station(name='Kangnung Ab', coordinate=(37.75, 128.95), altitude=11, country='Korea, South'),
-    'RKNO': station(name='Keo Jin', coordinate=(38.46667, 128.46667), altitude=107, country='Korea, South'),
-    'RKNR': station(name='Kotar Range', coordinate=(37.1, 128.9), altitude=792, country='Korea, South'),
-    'RKNW': station(name='Wonju', coordinate=(37.33333, 127.95), altitude=150, country='Korea, South'),
-    'RKPC': station(name='Cheju International Airport', coordinate=(33.5, 126.5), altitude=36, country='Korea, South'),
-    'RKPK': station(name='Pusan / Kimhae International Airport', coordinate=(35.18333, 128.93333), altitude=4, country='Korea, South'),
-    'RKPM': station(name='Mosulpo Ab', coordinate=(33.2, 126.26667), altitude=27, country='Korea, South'),
-    'RKPS': station(name="Sach'On Ab", coordinate=(35.08333, 128.08333), altitude=8, country='Korea, South'),
-    'RKPU': station(name='Ulsan', coordinate=(35.55, 129.31667), altitude=32, country='Korea, South'),
-    'RKSB': station(name='Tonghae Radar Site', coordinate=(37.5, 129.13333), altitude=31, country='Korea, South'),
-    'RKSC': station(name='Sv Ri San', coordinate=(37.35, 126.91667), altitude=406, country='Korea, South'),
-    'RKSD': station(name='Maesanri', coordinate=(37.35, 127.26667), altitude=144, country='Korea, South'),
-    'RKSF': station(name="Seoul / Yongdungp'O Rokaf Wc", coordinate=(37.5, 126.93333), altitude=49, country='Korea, South'),
-    'RKSG': station(name='Pyongtaek Ab', coordinate=(36.93333, 127.0), altitude=16, country='Korea, South'),
-    'RKSH': station(name='Command Post Tango', coordinate=(37.51667, 126.98333), altitude=73, country='Korea, South'),
-    'RKSI': station(name='Incheon International Airport', coordinate=(37.46667, 126.45), altitude=7, country='Korea, South'),
-    'RKSJ': station(name='Taesong-San', coordinate=(38.2, 127.55), altitude=1182, country='Korea, South'),
-    'RKSL': station(name='Seoul', coordinate=(37.56667, 126.96667), altitude=86, country='Korea, South'),
-    'RKSM': station(name='Seoul E Ab', coordinate=(37.43333, 127.11667), altitude=20, country='Korea, South'),
-    'RKSN': station(name='Koon-Ni Range', coordinate=(37.03333, 126.75), altitude=15, country='Korea, South'),
-    'RKSO': station(name='Osan Ab', coordinate=(37.1, 127.03333), altitude=11, country='Korea, South'),
-    'RKSP': station(name='Paengnyongdo Ab', coordinate=(37.96667, 124.66667), altitude=171, country='Korea, South'),
-    'RKSQ': station(name='Yeonpyeungdo', coordinate=(37.7, 125.7), altitude=91, country='Korea, South'),
-    'RKSS': station(name="Seoul / Kimp'O International Airport", coordinate=(37.55, 126.8), altitude=18, country='Korea, South'),
-    'RKST': station(name='Camp Casey / Tongduch', coordinate=(37.91667, 127.05), altitude=60, country='Korea, South'),
-    'RKSU': station(name='Yeoju Range', coordinate=(37.43333, 127.63333), altitude=43, country='Korea, South'),
-    'RKSV': station(name='Pyoripsan', coordinate=(37.78333, 126.36667), altitude=250, country='Korea, South'),
-    'RKSW': station(name='Suwon Ab', coordinate=(37.25, 127.0), altitude=24, country='Korea, South'),
-    'RKSX': station(name='Camp Stanley / H-207', coordinate=(37.71667, 127.1), altitude=71, country='Korea, South'),
-    'RKSY': station(name='Yongsan / H-208 Hp', coordinate=(37.51667, 126.98333), altitude=12, country='Korea, South'),
-    'RKTA': station(name='Andong', coordinate=(36.55, 128.71667), altitude=139, country='Korea, South'),
-    'RKTB': station(name='Paekado', coordinate=(37.01667, 126.05), altitude=46, country='Korea, South'),
-    'RKTD': station(name='Taejon Kor-Afb', coordinate=(36.33333, 127.38333), altitude=63, country='Korea, South'),
-    'RKTE': station(name='Songmu Ab', coordinate=(36.4, 127.5), altitude=79, country='Korea, South'),
-    'RKTF': station(name='Taejon', coordinate=(36.3, 127.4), altitude=77, country='Korea, South'),
-    'RKTG': station(name='Camp Walker H-805', coordinate=(35.85, 128.58333), altitude=75, country='Korea, South'),
-    'RKTH': station(name='Pohang Ab', coordinate=(35.98333, 129.41667), altitude=20, country='Korea, South'),
-    'RKTI': station(name='Jung Won Rok-Ab', coordinate=(37.03333, 127.88333), altitude=91, country='Korea, South'),
-    'RKTM': station(name='Mangilsan Ab', coordinate=(36.93333, 126.45), altitude=302, country='Korea, South'),
-    'RKTN': station(name='Taegu Ab', coordinate=(35.9, 128.65), altitude=35, country='Korea, South'),
-    'RKTP': station(name='Hae Mi', coordinate=(36.4, 126.35), altitude=31, country='Korea, South'),
-    'RKTS': station(name='Sangju', coordinate=(36.41667, 128.16667), altitude=150, country='Korea, South'),
-    'RKTT': station(name='Taegu', coordinate=(35.88333, 128.61667), altitude=58, country='Korea, South'),
-    'RKTU': station(name='Chongju Ab', coordinate=(36.7, 127.5), altitude=58, country='Korea, South'),
-    'RKTV': station(name='Chungju', coordinate=(37.06667, 127.88333), altitude=59, country='Korea, South'),
-    'RKTW': station(name='Woong Cheon', coordinate=(36.2, 126.55), altitude=13, country='Korea, South'),
-    'RKTY': station(name='Yechon Ab', coordinate=(36.63333, 128.35), altitude=108, country='Korea, South'),
-    'RKXX': station(name='Nightmare Range', coordinate=(38.06667, 127.35), altitude=None, country='Korea, South'),
-    'ROAH': station(name='Naha Airport', coordinate=(26.18333, 127.65), altitude=3, country='Japan'),
-    'RODE': station(name='Iejima Auxiliary Ab', coordinate=(26.71667, 127.78333), altitude=70, country='Japan'),
-    'RODN': station(name='Kadena Ab', coordinate=(26.35, 127.76667), altitude=45, country='Japan'),
-    'ROHF': station(name='Hamby U. S. Army Airfield', coordinate=(26.3, 127.76667), altitude=5, country='Japan'),
-    'ROIG': station(name='Ishigakijima', coordinate=(24.33333, 124.16667), altitude=6, country='Japan'),
-    'ROKJ': station(name='Kumejima', coordinate=(26.33333, 126.8), altitude=4, country='Japan'),
-    'ROMD': station(name='Minamidaitojima', coordinate=(25.83333, 131.23333), altitude=16, country='Japan'),
-    'ROMY': station(name='Miyakojima', coordinate=(24.78333, 125.28333), altitude=40, country='Japan'),
-    'RORA': station(name='Aguni Island', coordinate=(26.6, 127.23333), altitude=29, country='Japan'),
-    'RORH': station(name='Hateruma', coordinate=(24.06667, 123.8), altitude=13, country='Japan'),
-    'RORK': station(name='Kitadaito Island', coordinate=(25.91667, 131.33333), altitude=22, country='Japan'),
-    'RORS': station(name='Shimoji-Shima Island', coordinate=(24.83333, 125.15), altitude=16, country='Japan'),
-    'RORT': station(name='Tarama Island', coordinate=(24.65, 124.7), altitude=9, country='Japan'),
-    'RORY': station(name='Yoron Island', coordinate=(27.05, 128.4), altitude=16, country='Japan'),
-    'ROTM': station(name='Futenma Marine Corps Air Facility', coordinate=(26.26667, 127.75), altitude=75, country='Japan'),
-    'ROYN': station(name='Yonaguni Airport', coordinate=(24.46667, 122.98333), altitude=16, country='Japan'),
-    'RPLB': station(name='Subic Bay Weather Station', coordinate=(14.8, 120.26667), altitude=18, country='Philippines'),
-    'RPLC': station(name='Clarkfield Pampanga International Airport', coordinate=(15.18333, 120.55), altitude=148, country='Philippines'),
-    'RPLI': station(name='Laoag', coordinate=(18.18333, 120.53333), altitude=4, country='Philippines'),
-    'RPLL': station(name='Ninoy Aquino Inter-National Airport', coordinate=(14.51667, 121.0), altitude=14, country='Philippines'),
-    'RPMD': station(name='Davao Airport', coordinate=(7.11667, 125.65), altitude=17, country='Philippines'),
-    'RPMK': station(name='Clark Ab', coordinate=(15.16667, 120.56667), altitude=196, country='Philippines'),
-    'RPMP': station(name='Legaspi', coordinate=(13.13333, 123.73333), altitude=16, country='Philippines'),
-    'RPMR': station(name='Romblon', coordinate=(12.58333, 122.26667), altitude=46, country='Philippines'),
-    'RPMS': station(name='Sangley Point', coordinate=(14.5, 120.91667), altitude=3, country='Philippines'),
-    'RPMT': station(name='Mactan', coordinate=(10.3, 123.96667), altitude=23, country='Philippines'),
-    'RPMZ': station(name='Zamboanga', coordinate=(6.9, 122.06667), altitude=5, country='Philippines'),
-    'RPUA': station(name='Aparri', coordinate=(18.36667, 121.63333), altitude=2, country='Philippines'),
-    'RPUB': station(name='Baguio', coordinate=(16.41667, 120.6), altitude=1500, country='Philippines'),
-    'RPUD': station(name='Daet', coordinate=(14.13333, 122.98333), altitude=3, country='Philippines'),
-    'RPUH': station(name='San Jose', coordinate=(12.35, 121.03333), altitude=2, country='Philippines'),
-    'RPUI': station(name='Iba', coordinate=(15.33333, 119.96667), altitude=4, country='Philippines'),
-    'RPUK': station(name='Calapan', coordinate=(13.41667, 121.18333), altitude=39, country='Philippines'),
-    'RPUN': station(name='Naga / Luzon Island', coordinate=(13.58333, 123.26667), altitude=43, country='Philippines'),
-    'RPUO': station(name='Basco', coordinate=(20.45, 121.96667), altitude=10, country='Philippines'),
-    'RPUQ': station(name='Vigan', coordinate=(17.56667, 120.38333), altitude=31, country='Philippines'),
-    'RPUR': station(name='Baler', coordinate=(15.76667, 121.56667), altitude=4, country='Philippines'),
-    'RPUT': station(name='Tuguegarao', coordinate=(17.61667, 121.73333), altitude=61, country='Philippines'),
-    'RPUV': station(name='Virac', coordinate=(13.58333, 124.23333), altitude=39, country='Philippines'),
-    'RPUW': station(name='Marinduque Island', coordinate=(13.36667, 121.83333), altitude=5, country='Philippines'),
-    'RPVA': station(name='Tacloban', coordinate=(11.25, 125.0), altitude=2, country='Philippines'),
-    'RPVD': station(name='Dumaguete', coordinate=(9.3, 123.3), altitude=5, country='Philippines'),
-    'RPVF': station(name='Catarman', coordinate=(12.48333, 124.63333), altitude=4, country='Philippines'),
-    'RPVG': station(name='Guiuan', coordinate=(11.03333, 126.73333), altitude=56, country='Philippines'),
-    'RPVI': station(name='Iloilo', coordinate=(10.7, 122.56667), altitude=7, country='Philippines'),
-    'RPVM': station(name='Masbate', coordinate=(12.36667, 123.61667), altitude=6, country='Philippines'),
-    'RPVP': station(name='Puerto Princesa', coordinate=(9.75, 118.73333), altitude=14, country='Philippines'),
-    'RPVR': station(name='Roxas', coordinate=(11.58333, 122.75), altitude=3, country='Philippines'),
-    'RPVT': station(name='Tagbilaran', coordinate=(9.6, 123.85), altitude=7, country='Philippines'),
-    'RPWB': station(name='Gen. Santos', coordinate=(6.11667, 125.18333), altitude=14, country='Philippines'),
-    'RPWC': station(name='Cotobato', coordinate=(7.16667, 124.21667), altitude=58, country='Philippines'),
-    'RPWE': station(name='Butuan', coordinate=(9.93333, 125.51667), altitude=45, country='Philippines'),
-    'RPWG': station(name='Dipolog', coordinate=(8.6, 123.35), altitude=3, country='Philippines'),
-    'RPWL': station(name='Cagayan De Oro', coordinate=(8.48333, 124.63333), altitude=5, country='Philippines'),
-    'RPWS': station(name='Surigao', coordinate=(9.8, 125.5), altitude=54, country='Philippines'),
-    'RPWY': station(name='Malaybalay', coordinate=(8.15, 125.08333), altitude=626, country='Philippines'),
-    'RPXT': station(name='Alabat', coordinate=(14.08333, 122.01667), altitude=4, country='Philippines'),
-    'SAAC': station(name='Concordia Aerodrome', coordinate=(-31.3, -58.01667), altitude=35, country='Argentina'),
-    'SAAG': station(name='Gualeguaychu Aerodrome', coordinate=(-33.0, -58.61667), altitude=23, country='Argentina'),
-    'SAAJ': station(name='Junin Aerodrome', coordinate=(-34.55, -60.91667), altitude=82, country='Argentina'),
-    'SAAP': station(name='Parana Aerodrome', coordinate=(-31.78333, -60.48333), altitude=74, country='Argentina'),
-    'SAAR': station(name='Rosario Aerodrome', coordinate=(-32.91667, -60.78333), altitude=25, country='Argentina'),
-    'SAAU': station(name='Villaguay Aerodrome', coordinate=(-31.85, -59.08333), altitude=40, country='Argentina'),
-    'SAAV': station(name='Sauce Viejo Aerodrome', coordinate=(-31.7, -60.81667), altitude=17, country='Argentina'),
-    'SABA': station(name='Buenos Aires Observatorio', coordinate=(-34.58333, -58.48333), altitude=25, country='Argentina'),
-    'SABE': station(name='Aeroparque Bs. As. Aerodrome', coordinate=(-34.56667, -58.41667), altitude=6, country='Argentina'),
-    'SACI': station(name='Pilar Observatorio', coordinate=(-31.66667, -63.88333), altitude=338, country='Argentina'),
-    'SACO': station(name='Cordoba Aerodrome', coordinate=(-31.31667, -64.21667), altitude=484, country='Argentina'),
-    'SACP': station(name='Chepes', coordinate=(-31.33333, -66.6), altitude=658, country='Argentina'),
-    'SACT': station(name='Gobernador Gordillo', coordinate=(-30.36667, -66.3), altitude=457, country='Argentina'),
-    'SACV': station(name='Villa De Maria Del Rio Seco', coordinate=(-29.9, -63.68333), altitude=341, country='Argentina'),
-    'SADD': station(name='Don Torcuato Aerodrome', coordinate=(-34.48333, -58.61667), altitude=5, country='Argentina'),
-    'SADF': station(name='San Fernando, BA', coordinate=(-34.45306, -58.58972), altitude=3, country='Argentina'),
-    'SADL': station(name='La Plata Aerodrome', coordinate=(-34.96667, -57.9), altitude=21, country='Argentina'),
-    'SADP': station(name='El Palomar Aerodrome', coordinate=(-34.6, -58.6), altitude=18, country='Argentina'),
-    'SAEZ': station(name='Ezeiza Aerodrome', coordinate=(-34.81667, -58.53333), altitude=20, country='Argentina'),
-    'SAME': station(name='Mendoza Aerodrome', coordinate=(-32.83333, -68.78333), altitude=705, country='Argentina'),
-    'SAMI': station(name='San Martin', coordinate=(-33.08333, -68.41667), altitude=653, country='Argentina'),
-    'SAMJ': station(name='Jachal', coordinate=(-30.25, -68.75), altitude=1165, country='Argentina'),
-    'SAMM': station(name='Malargue Aerodrome', coordinate=(-35.5, -69.58333), altitude=1426, country='Argentina'),
-    'SAMR': station(name='San Rafael Aerodrome', coordinate=(-34.58333, -68.4), altitude=745, country='Argentina'),
-    'SAMS': station(name='San Carlos', coordinate=(-33.76667, -69.03333), altitude=940, country='Argentina'),
-    'SAMU': station(name='Uspallata', coordinate=(-32.6, -69.33333), altitude=1844, country='Argentina'),
-    'SANC': station(name='Catamarca Aero.', coordinate=(-28.6, -65.76667), altitude=454, country='Argentina'),
-    'SANE': station(name='Santiago Del Estero Aero.', coordinate=(-27.76667, -64.3), altitude=198, country='Argentina'),
-    'SANI': station(name='Tinogasta', coordinate=(-28.06667, -67.56667), altitude=1201, country='Argentina'),
-    'SANL': station(name='La Rioja Aero.', coordinate=(-29.38333, -66.81667), altitude=438, country='Argentina'),
-    'SANO': station(name='Chilecito', coordinate=(-29.21667, -67.43333), altitude=950, country='Argentina'),
-    'SANT': station(name='Tucuman Aerodrome', coordinate=(-26.85, -65.1), altitude=440, country='Argentina'),
-    'SANU': station(name='San Juan Aerodrome', coordinate=(-31.56667, -68.86667), altitude=597, country='Argentina'),
-    'SANW': station(name='Ceres Aerodrome', coordinate=(-29.88333, -61.95), altitude=87, country='Argentina'),
-    'SAOC': station(name='Rio Cuarto Aerodrome', coordinate=(-33.11667, -64.23333), altitude=420, country='Argentina'),
-    'SAOD': station(name='Villa Dolores Aerodrome', coordinate=(-31.95, -65.13333), altitude=561, country='Argentina'),
-    'SAOL': station(name='Laboulaye', coordinate=(-34.13333, -63.36667), altitude=136, country='Argentina'),
-    'SAOM': station(name='Marcos Juarez Aerodrome', coordinate=(-32.7, -62.15), altitude=110, country='Argentina'),
-    'SAOR': station(name='Villa Reynolds Aerodrome', coordinate=(-33.73333, -65.38333), altitude=485, country='Argentina'),
-    'SAOU': station(name='San Luis Aerodrome', coordinate=(-33.26667, -66.35), altitude=710, country='Argentina'),
-    'SARC': station(name='Corrientes Aero.', coordinate=(-27.45, -58.76667), altitude=62, country='Argentina'),
-    'SARE': station(name='Resistencia Aero.', coordinate=(-27.45, -59.05), altitude=53, country='Argentina'),
-    'SARF': station(name='Formosa Aerodrome', coordinate=(-26.2, -58.23333), altitude=59, country='Argentina'),
-    'SARI': station(name='Iguazu Aerodrome', coordinate=(-25.73333, -54.46667), altitude=270, country='Argentina'),
-    'SARL': station(name='Paso De Los Libres Aerodrome', coordinate=(-29.68333, -57.15), altitude=69, country='Argentina'),
-    'SARM': station(name='Monte Caseros Aerodrome', coordinate=(-30.26667, -57.65), altitude=53, country='Argentina'),
-    'SARP': station(name='Posadas Aero.', coordinate=(-27.36667, -55.96667), altitude=131, country='Argentina'),
-    'SARS': station(name='Presidencia Roque Saenz Pena Aerodrome', coordinate=(-26.81667, -60.45), altitude=91, country='Argentina'),
-    'SASA': station(name='Salta Aerodrome', coordinate=(-24.85, -65.48333), altitude=1238, country='Argentina'),
-    'SASJ': station(name='Jujuy Aerodrome', coordinate=(-24.38333, -65.08333), altitude=921, country='Argentina'),
-    'SASO': station(name='Oran Aerodrome', coordinate=(-23.15, -64.31667), altitude=357, country='Argentina'),
-    'SASQ': station(name='La Quiaca Observatorio', coordinate=(-22.1, -65.6), altitude=3462, country='Argentina'),
-    'SASR': station(name='Rivadavia', coordinate=(-24.16667, -62.9), altitude=205, country='Argentina'),
-    'SAST': station(name='Tartagal Aerodrome', coordinate=(-22.65, -63.81667), altitude=450, country='Argentina'),
-    'SATK': station(name='Las Lomitas', coordinate=(-24.7, -60.58333), altitude=130, country='Argentina'),
-    'SATR': station(name='Reconquista, SF', coordinate=(-29.21028, -59.69083), altitude=49, country='Argentina'),
-    'SATU': station(name='Curuzu Cuatia Aerodrome', coordinate=(-29.78333, -57.98333), altitude=80, country='Argentina'),
-    'SAVB': station(name='El Bolson Aerodrome', coordinate=(-41.96667, -71.51667), altitude=337, country='Argentina'),
-    'SAVC': station(name='Comodoro Rivadavia Aerodrome', coordinate=(-45.78333, -67.5), altitude=58, country='Argentina'),
-    'SAVE': station(name='Esquel Aerodrome', coordinate=(-42.93333, -71.15), altitude=789, country='Argentina'),
-    'SAVO': station(name='San Antonio Oeste Aerodrome', coordinate=(-40.78333, -65.1), altitude=20, country='Argentina'),
-    'SAVP': station(name='Paso De Indios', coordinate=(-43.81667, -68.88333), altitude=460, country='Argentina'),
-    'SAVT': station(name='Trelew Aerodrome', coordinate=(-43.2, -65.26667), altitude=39, country='Argentina'),
-    'SAVV': station(name='Viedma Aerodrome', coordinate=(-40.85, -63.01667), altitude=6, country='Argentina'),
-    'SAVY': station(name='Puerto Madryn, CHT', coordinate=(-42.75917, -65.10278), altitude=136, country='Argentina'),
-    'SAWA': station(name='Lago Argentino Aerodrome', coordinate=(-50.33333, -72.3), altitude=223, country='Argentina'),
-    'SAWD': station(name='Puerto Deseado Aerodrome', coordinate=(-47.73333, -65.91667), altitude=81, country='Argentina'),
-    'SAWE': station(name='Rio Grande B. A.', coordinate=(-53.8, -67.75), altitude=13, country='Argentina'),
-    'SAWG': station(name='Rio Gallegos Aerodrome', coordinate=(-51.61667, -69.28333), altitude=20, country='Argentina'),
-    'SAWH': station(name='Ushuaia Aerodrome', coordinate=(-54.8, -68.31667), altitude=16, country='Argentina'),
-    'SAWJ': station(name='San Julian Aerodrome', coordinate=(-49.31667, -67.75), altitude=58, country='Argentina'),
-    'SAWP': station(name='Perito Moreno Aerodrome', coordinate=(-46.51667, -71.01667), altitude=429, country='Argentina'),
-    'SAWR': station(name='Gobernador Gregores Aerodrome', coordinate=(-48.78333, -70.16667), altitude=358, country='Argentina'),
-    'SAWU': station(name='Santa Cruz Aerodrome', coordinate=(-50.01667, -68.56667), altitude=113, country='Argentina'),
-    'SAZA': station(name='Azul Airport', coordinate=(-36.75, -59.83333), altitude=132, country='Argentina'),
-    'SAZB': station(name='Bahia Blanca Aerodrome', coordinate=(-38.73333, -62.16667), altitude=75, country='Argentina'),
-    'SAZD': station(name='Dolores Aerodrome', coordinate=(-36.35, -57.73333), altitude=10, country='Argentina'),
-    'SAZE': station(name='Pigue Aerodrome', coordinate=(-37.6, -62.38333), altitude=304, country='Argentina'),
-    'SAZG': station(name='General Pico Aerodrome', coordinate=(-35.7, -63.75), altitude=139, country='Argentina'),
-    'SAZH': station(name='Tres Arroyos', coordinate=(-38.33333, -60.25), altitude=115, country='Argentina'),
-    'SAZM': station(name='Mar Del Plata Aerodrome', coordinate=(-37.93333, -57.58333), altitude=18, country='Argentina'),
-    'SAZN': station(name='Neuquen Aerodrome', coordinate=(-38.95, -68.13333), altitude=270, country='Argentina'),
-    'SAZP': station(name='Pehuajo Aerodrome', coordinate=(-35.86667, -61.9), altitude=87, country='Argentina'),
-    'SAZQ': station(name='Rio Colorado', coordinate=(-39.01667, -64.08333), altitude=79, country='Argentina'),
-    'SAZR': station(name='Santa Rosa Aerodrome', coordinate=(-36.56667, -64.26667), altitude=190, country='Argentina'),
-    'SAZS': station(name='Bariloche Aerodrome', coordinate=(-41.15, -71.16667), altitude=845, country='Argentina'),
-    'SAZT': station(name='Tandil Aerodrome', coordinate=(-37.23333, -59.25), altitude=175, country='Argentina'),
-    'SAZV': station(name='Villa Gesell', coordinate=(-37.23333, -57.03333), altitude=7, country='Argentina'),
-    'SAZY': station(name='Chapelco', coordinate=(-40.08333, -71.13333), altitude=779, country='Argentina'),
-    'SBAA': station(name='Conceicao Do Araguaia', coordinate=(-8.25, -49.28333), altitude=157, country='Brazil'),
-    'SBAF': station(name='Afonsos Aeroporto', coordinate=(-22.86667, -43.36667), altitude=34, country='Brazil'),
-    'SBAN': station(name='Anapolis Braz-Afb', coordinate=(-16.23333, -48.96667), altitude=1137, country='Brazil'),
-    'SBAR': station(name='Aracaju Aeroporto', coordinate=(-10.98333, -37.06667), altitude=8, country='Brazil'),
-    'SBAT': station(name='Alta Floresta Aeroporto', coordinate=(-9.86667, -56.1), altitude=288, country='Brazil'),
-    'SBBC': station(name='Benjamin Constant', coordinate=(-4.38333, -70.03333), altitude=65, country='Brazil'),
-    'SBBE': station(name='Belem Aeroporto', coordinate=(-1.38333, -48.48333), altitude=16, country='Brazil'),
-    'SBBG': station(name='Bage Aeroporto', coordinate=(-31.35, -54.11667), altitude=180, country='Brazil'),
-    'SBBH': station(name='Belo Horizonte Aeroporto', coordinate=(-19.85, -43.95), altitude=785, country='Brazil'),
-    'SBBI': station(name='Curitiba', coordinate=(-25.43333, -49.26667), altitude=924, country='Brazil'),
-    'SBBQ': station(name='Barbacena', coordinate=(-21.25, -43.76667), altitude=1171, country='Brazil'),
-    'SBBR': station(name='Brasilia Aeroporto', coordinate=(-15.86667, -47.93333), altitude=1061, country='Brazil'),
-    'SBBU': station(name='Bauru', coordinate=(-22.31667, -49.06667), altitude=590, country='Brazil'),
-    'SBBV': station(name='Boa Vista, Boa Vista Intl', coordinate=(2.83333, -60.7), altitude=84, country='Brazil'),
-    'SBBW': station(name='Barra Do Garcas', coordinate=(-15.86667, -52.38333), altitude=350, country='Brazil'),
-    'SBCC': station(name='Cachimbo', coordinate=(-9.33333, -54.95), altitude=536, country='Brazil'),
-    'SBCF': station(name='Belo Horizonte', coordinate=(-19.93333, -43.93333), altitude=850, country='Brazil'),
-    'SBCG': station(name='Campo Grande Aeroporto', coordinate=(-20.46667, -54.66667), altitude=567, country='Brazil'),
-    'SBCI': station(name='Maranhao / Carolina Airport', coordinate=(-7.31667, -47.46667), altitude=183, country='Brazil'),
-    'SBCJ': station(name='Carajas / Maraba', coordinate=(-6.11667, -50.0), altitude=621, country='Brazil'),
-    'SBCO': station(name='Porto Alegre', coordinate=(-30.01667, -51.21667), altitude=47, country='Brazil'),
-    'SBCP': station(name='Campos', coordinate=(-21.75, -41.33333), altitude=11, country='Brazil'),
-    'SBCR': station(name='Corumba', coordinate=(-19.08333, -57.5), altitude=130, country='Brazil'),
-    'SBCT': station(name='Curitiba Aeroporto', coordinate=(-25.51667, -49.16667), altitude=908, country='Brazil'),
-    'SBCV': station(name='Caravelas', coordinate=(-17.65, -39.25), altitude=11, country='Brazil'),
-    'SBCY': station(name='Cuiaba Aeroporto', coordinate=(-15.65, -56.1), altitude=187, country='Brazil'),
-    'SBCZ': station(name='Cruzeiro Do Sul', coordinate=(-7.63333, -72.66667), altitude=170, country='Brazil'),
-    'SBDN': station(name='Presidente Prudente', coordinate=(-22.11667, -51.38333), altitude=436, country='Brazil'),
-    'SBEG': station(name='Eduardo Gomes International', coordinate=(-3.03333, -60.05), altitude=2, country='Brazil'),
-    'SBEK': station(name='Jacareacanga', coordinate=(-6.26667, -57.73333), altitude=98, country='Brazil'),
-    'SBES': station(name='S. P. Aldeia Aerodrome', coordinate=(-22.81667, -42.1), altitude=10, country='Brazil'),
-    'SBFI': station(name='Foz Do Iguacu Aeroporto', coordinate=(-25.51667, -54.58333), altitude=180, country='Brazil'),
-    'SBFL': station(name='Florianopolis Aeroporto', coordinate=(-27.66667, -48.55), altitude=5, country='Brazil'),
-    'SBFN': station(name='Fernando De Noronha', coordinate=(-3.85, -32.41667), altitude=56, country='Brazil'),
-    'SBFZ': station(name='Fortaleza / pinto Martins', coordinate=(-3.78333, -38.53333), altitude=25, country='Brazil'),
-    'SBGA': station(name='Gama', coordinate=(-16.05, -48.05), altitude=700, country='Brazil'),
-    'SBGL': station(name='Galeao', coordinate=(-22.81667, -43.25), altitude=6, country='Brazil'),
-    'SBGO': station(name='Goiania Aeroporto', coordinate=(-16.63333, -49.21667), altitude=747, country='Brazil'),
-    'SBGR': station(name='Guarulhos Civ / Mil', coordinate=(-23.43333, -46.46667), altitude=750, country='Brazil'),
-    'SBGW': station(name='Guaratingueta', coordinate=(-22.78333, -45.2), altitude=537, country='Brazil'),
-    'SBHT': station(name='Altamira', coordinate=(-3.2, -52.2), altitude=74, country='Brazil'),
-    'SBIH': station(name='Itaituba', coordinate=(-4.25, -56.0), altitude=34, country='Brazil'),
-    'SBIL': station(name='Ilheus Aeroporto', coordinate=(-14.81667, -39.03333), altitude=4, country='Brazil'),
-    'SBIZ': station(name='Imperatriz', coordinate=(-5.53333, -47.5), altitude=123, country='Brazil'),
-    'SBJF': station(name='Juiz De Fora', coordinate=(-21.76667, -43.35), altitude=939, country='Brazil'),
-    'SBJP': station(name='Joao Pessoa', coordinate=(-7.1, -34.86667), altitude=7, country='Brazil'),
-    'SBJR': station(name='Rio / Jacarepagua', coordinate=(-22.98333, -43.36667), altitude=3, country='Brazil'),
-    'SBKG': station(name='Campina Grande', coordinate=(-7.21667, -35.88333), altitude=548, country='Brazil'),
-    'SBKP': station(name='Campinas Aeroporto', coordinate=(-23.0, -47.13333), altitude=661, country='Brazil'),
-    'SBLO': station(name='Londrina Aeroporto', coordinate=(-23.33333, -51.13333), altitude=569, country='Brazil'),
-    'SBLP': station(name='Bom Jesus Da Lapa', coordinate=(-13.26667, -43.41667), altitude=440, country='Brazil'),
-    'SBMA': station(name='Maraba', coordinate=(-5.35, -49.15), altitude=95, country='Brazil'),
-    'SBME': station(name='Macae', coordinate=(-22.35, -41.76667), altitude=2, country='Brazil'),
-    'SBMG': station(name='Maringa', coordinate=(-23.41667, -51.95), altitude=542, country='Brazil'),
-    'SBMK': station(name='Montes Claros', coordinate=(-16.71667, -43.86667), altitude=646, country='Brazil'),
-    'SBMN': station(name='Manaus Aeroporto', coordinate=(-3.15, -59.98333), altitude=84, country='Brazil'),
-    'SBMO': station(name='Maceio Aeroporto', coordinate=(-9.51667, -35.78333), altitude=117, country='Brazil'),
-    'SBMQ': station(name='Macapa', coordinate=(0.03333, -50.05), altitude=15, country='Brazil'),
-    'SBMS': station(name='Mocoro / 17 Rosado', coordinate=(-5.2, -37.36667), altitude=23, country='Brazil'),
-    'SBMT': station(name='Marte Civ / Mil', coordinate=(-23.51667, -46.63333), altitude=722, country='Brazil'),
-    'SBMY': station(name='Manicore', coordinate=(-5.81667, -61.3), altitude=50, country='Brazil'),
-    'SBNT': station(name='Natal Aeroporto', coordinate=(-5.91667, -35.25), altitude=52, country='Brazil'),
-    'SBOI': station(name='Oiapoque', coordinate=(3.83333, -51.83333), altitude=39, country='Brazil'),
-    'SBPA': station(name='Porto Alegre Aero-Porto', coordinate=(-30.0, -51.18333), altitude=3, country='Brazil'),
-    'SBPB': station(name='Parnaiba Aeroporto', coordinate=(-2.91667, -41.75), altitude=5, country='Brazil'),
-    'SBPC': station(name='Pocos De Caldas', coordinate=(-21.85, -46.56667), altitude=1260, country='Brazil'),
-    'SBPF': station(name='Passo Fundo', coordinate=(-28.25, -52.4), altitude=684, country='Brazil'),
-    'SBPG': station(name='Paranagua', coordinate=(-25.51667, -48.51667), altitude=5, country='Brazil'),
-    'SBPK': station(name='Pelotas', coordinate=(-31.86667, -52.35), altitude=13, country='Brazil'),
-    'SBPL': station(name='Petrolina', coordinate=(-9.35, -40.55), altitude=385, country='Brazil'),
-    'SBPN': station(name='Porto Nacional Aeroporto', coordinate=(-10.7, -48.4), altitude=261, country='Brazil'),
-    'SBPP': station(name='Ponta Pora Intl', coordinate=(-22.55, -55.7), altitude=657, country='Brazil'),
-    'SBPS': station(name='Porto Seguro', coordinate=(-16.43333, -39.06667), altitude=51, country='Brazil'),
-    'SBPV': station(name='Porto Velho Aeroporto', coordinate=(-8.76667, -63.91667), altitude=102, country='Brazil'),
-    'SBQV': station(name='Vitoria Da Conquista', coordinate=(-14.95, -40.88333), altitude=840, country='Brazil'),
-    'SBRB': station(name='Rio Branco', coordinate=(-10.0, -67.8), altitude=142, country='Brazil'),
-    'SBRF': station(name='Recife Aeroporto', coordinate=(-8.06667, -34.85), altitude=19, country='Brazil'),
-    'SBRJ': station(name='Rio De Janeiro Aeroporto', coordinate=(-22.9, -43.16667), altitude=3, country='Brazil'),
-    'SBRP': station(name='Leite Lopes / Ribeir', coordinate=(-21.13333, -47.78333), altitude=549, country='Brazil'),
-    'SBRS': station(name='Resende', coordinate=(-22.48333, -44.46667), altitude=440, country='Brazil'),
-    'SBSA': station(name='Sao Carlos', coordinate=(-22.01667, -47.88333), altitude=856, country='Brazil'),
-    'SBSC': station(name='Rio De Janeiro-Santa Cruz Ab', coordinate=(-22.93333, -43.71667), altitude=3, country='Brazil'),
-    'SBSJ': station(name='Sao Jose Dos Campo', coordinate=(-23.23333, -45.86667), altitude=646, country='Brazil'),
-    'SBSL': station(name='Sao Luiz Aeroporto', coordinate=(-2.6, -44.23333), altitude=53, country='Brazil'),
-    'SBSM': station(name='Santa Maria Aero-Porto', coordinate=(-29.71667, -53.7), altitude=85, country='Brazil'),
-    'SBSN': station(name='Santarem-Aeroporto', coordinate=(-2.43333, -54.71667), altitude=72, country='Brazil'),
-    'SBSP': station(name='Sao Paulo/Congonhas Aeroporto', coordinate=(-23.61667, -46.65), altitude=803, country='Brazil'),
-    'SBST': station(name='Santos Aeroporto', coordinate=(-23.93333, -46.3), altitude=3, country='Brazil'),
-    'SBSV': station(name='Salvador Aeroporto', coordinate=(-12.9, -38.33333), altitude=6, country='Brazil'),
-    'SBTE': station(name='Teresina Aeroporto', coordinate=(-5.05, -42.81667), altitude=69, country='Brazil'),
-    'SBTF': station(name='Tefe', coordinate=(-3.36667, -64.68333), altitude=47, country='Brazil'),
-    'SBTK': station(name='Tarauaca', coordinate=(-8.16667, -70.76667), altitude=190, country='Brazil'),
-    'SBTT': station(name='Tabatinga', coordinate=(-3.66667, -69.66667), altitude=85, country='Brazil'),
-    'SBTU': station(name='Tucurui', coordinate=(-3.71667, -49.71667), altitude=40, country='Brazil'),
-    'SBUA': station(name='Sao Gabriel Da Cachoeira', coordinate=(-0.13333, -67.08333), altitude=90, country='Brazil'),
-    'SBUF': station(name='Paulo Afonso', coordinate=(-9.4, -38.21667), altitude=253, country='Brazil'),
-    'SBUG': station(name='Uruguaiana Aeroporto', coordinate=(-29.78333, -57.03333), altitude=74, country='Brazil'),
-    'SBUL': station(name='Uberlandia', coordinate=(-18.88333, -48.23333), altitude=943, country='Brazil'),
-    'SBUR': station(name='Uberaba', coordinate=(-19.78333, -47.96667), altitude=807, country='Brazil'),
-    'SBVH': station(name='Vilhena Aeroporto', coordinate=(-12.7, -60.1), altitude=612, country='Brazil'),
-    'SBVT': station(name='Vitoria Aeroporto', coordinate=(-20.26667, -40.28333), altitude=4, country='Brazil'),
-    'SBXV': station(name='Xavantina', coordinate=(-14.7, -52.35), altitude=315, country='Brazil'),
-    'SBYA': station(name='Iauarete', coordinate=(0.61667, -69.2), altitude=120, country='Brazil'),
-    'SBYS': station(name='Pirassununga', coordinate=(-21.98333, -47.33333), altitude=597, country='Brazil'),
-    'SCAR': station(name='Arica', coordinate=(-18.33333, -70.33333), altitude=58, country='Chile'),
-    'SCBA': station(name='Balmaceda', coordinate=(-45.91667, -71.68333), altitude=520, country='Chile'),
-    'SCCC': station(name='Chile Chico', coordinate=(-46.55, -71.7), altitude=325, country='Chile'),
-    'SCCH': station(name='Chillan', coordinate=(-36.56667, -72.03333), altitude=124, country='Chile'),
-    'SCCI': station(name='Punta Arenas', coordinate=(-53.0, -70.85), altitude=37, country='Chile'),
-    'SCCY': station(name='Coyhaique', coordinate=(-45.58333, -72.11667), altitude=310, country='Chile'),
-    'SCDA': station(name='Iquique / Diego Arac', coordinate=(-20.53333, -70.18333), altitude=52, country='Chile'),
-    'SCEL': station(name='Pudahuel', coordinate=(-33.38333, -70.78333), altitude=475, country='Chile'),
-    'SCER': station(name='Quintero Santiago', coordinate=(-32.78333, -71.51667), altitude=8, country='Chile'),
-    'SCFA': station(name='Antofagasta', coordinate=(-23.43333, -70.43333), altitude=135, country='Chile'),
-    'SCHA': station(name='Copiapo', coordinate=(-27.3, -70.41667), altitude=291, country='Chile'),
-    'SCHR': station(name='Cochrane', coordinate=(-47.23333, -72.55), altitude=167, country='Chile'),
-    'SCIC': station(name='Curico', coordinate=(-34.96667, -71.23333), altitude=228, country='Chile'),
-    'SCIE': station(name='Concepcion', coordinate=(-36.76667, -73.05), altitude=12, country='Chile'),
-    'SCIP': station(name='Isla De Pascua', coordinate=(-27.15, -109.41667), altitude=51, country='Chile'),
-    'SCLL': station(name='Vallenar', coordinate=(-28.6, -70.76667), altitude=538, country='Chile'),
-    'SCRA': station(name='Chanaral', coordinate=(-26.31667, -70.61667), altitude=30, country='Chile'),
-    'SCSE': station(name='La Serena', coordinate=(-29.9, -71.2), altitude=142, country='Chile'),
-    'SCTC': station(name='Temuco', coordinate=(-38.75, -72.63333), altitude=114, country='Chile'),
-    'SCTE': station(name='Puerto Montt', coordinate=(-41.41667, -73.08333), altitude=85, country='Chile'),
-    'SCVD': station(name='Valdivia', coordinate=(-39.61667, -73.08333), altitude=19, country='Chile'),
-    'SEAM': station(name='Ambato / Chachoan', coordinate=(-1.2, -78.56667), altitude=2520, country='Ecuador'),
-    'SEBC': station(name='Bahia De Caraquez', coordinate=(-0.58333, -80.4), altitude=3, country='Ecuador'),
-    'SECU': station(name='Cuenca / Mariscal Lamar', coordinate=(-2.88333, -78.98333), altitude=2530, country='Ecuador'),
-    'SEES': station(name='Esmeraldas-Tachina', coordinate=(0.96667, -79.63333), altitude=7, country='Ecuador'),
-    'SEGU': station(name='Guayaquil / Simon Bolivar', coordinate=(-2.15, -79.88333), altitude=4, country='Ecuador'),
-    'SEIB': station(name='Ibarra / Atahualpa', coordinate=(0.35, -78.13333), altitude=2228, country='Ecuador'),
-    'SELO': station(name='Catamayo / Camilo Ponce Enriquez', coordinate=(-4.0, -79.36667), altitude=1239, country='Ecuador'),
-    'SELT': station(name='Latacunga', coordinate=(-0.91667, -78.61667), altitude=2785, country='Ecuador'),
-    'SEMA': station(name='Macara / J. M. Velasco I.', coordinate=(-4.36667, -79.93333), altitude=430, country='Ecuador'),
-    'SEMH': station(name='Machala / General M. Serrano', coordinate=(-3.25, -79.96667), altitude=4, country='Ecuador'),
-    'SEMT': station(name='Manta', coordinate=(-0.95, -80.68333), altitude=13, country='Ecuador'),
-    'SEPA': station(name='Pastaza / Rio Amazonas', coordinate=(-1.5, -78.05), altitude=1043, country='Ecuador'),
-    'SEQU': station(name='Quito / Mariscal Sucre', coordinate=(-0.15, -78.48333), altitude=2811, country='Ecuador'),
-    'SESA': station(name='Salinas / General Ulpiano Paez', coordinate=(-2.2, -80.98333), altitude=4, country='Ecuador'),
-    'SEST': station(name='San Cristobal Galapagos', coordinate=(-0.9, -89.6), altitude=6, country='Ecuador'),
-    'SETI': station(name='Tiputini', coordinate=(-0.78333, -75.51667), altitude=220, country='Ecuador'),
-    'SETU': station(name='Tulcan / El Rosal', coordinate=(0.81667, -77.7), altitude=2950, country='Ecuador'),
-    'SFAL': station(name='Stanley Airport', coordinate=(-51.68333, -57.76667), altitude=23, country='Falkland Islands, Islas Malvinas'),
-    'SGAS': station(name='Asuncion / Aeropuerto', coordinate=(-25.26667, -57.63333), altitude=101, country='Paraguay'),
-    'SGCO': station(name='Concepcion', coordinate=(-23.41667, -57.3), altitude=74, country='Paraguay'),
-    'SGEN': station(name='Encarnacion', coordinate=(-27.31667, -55.83333), altitude=91, country='Paraguay'),
-    'SGES': station(name='Aeropuerto Guarany', coordinate=(-25.45, -54.85), altitude=849, country='Paraguay'),
-    'SGME': station(name='Mariscal Estigarribia', coordinate=(-22.01667, -60.6), altitude=172, country='Paraguay'),
-    'SGNA': station(name='Nueva Asuncion', coordinate=(-20.71667, -61.91667), altitude=318, country='Paraguay'),
-    'SKAR': station(name='Armenia / El Eden', coordinate=(4.5, -75.71667), altitude=1204, country='Colombia'),
-    'SKAS': station(name='Puerto Asis', coordinate=(0.5, -76.5), altitude=254, country='Colombia'),
-    'SKBG': station(name='Bucaramanga / Palonegro', coordinate=(7.1, -73.2), altitude=1189, country='Colombia'),
-    'SKBO': station(name='Bogota / Eldorado', coordinate=(4.71667, -74.15), altitude=2547, country='Colombia'),
-    'SKBQ': station(name='Barranquilla / Ernestocortissoz', coordinate=(10.88333, -74.78333), altitude=14, country='Colombia'),
-    'SKBU': station(name='Buenaventura', coordinate=(3.85, -76.96667), altitude=14, country='Colombia'),
-    'SKCC': station(name='Cucuta / Camilo Daza', coordinate=(7.93333, -72.51667), altitude=250, country='Colombia'),
-    'SKCG': station(name='Cartagena / Rafael Nunez', coordinate=(10.45, -75.51667), altitude=1, country='Colombia'),
-    'SKCL': station(name='Cali / Alfonso Bonillaaragon', coordinate=(3.55, -76.38333), altitude=961, country='Colombia'),
-    'SKEJ': station(name='Barrancabermeja / Yariguies', coordinate=(7.01667, -73.8), altitude=126, country='Colombia'),
-    'SKIB': station(name='Ibague / Perales', coordinate=(4.43333, -75.15), altitude=928, country='Colombia'),
-    'SKIP': station(name='Ipiales / San Luis', coordinate=(0.81667, -77.63333), altitude=2961, country='Colombia'),
-    'SKLC': station(name='Apartado / Los Cedros', coordinate=(7.81667, -76.7), altitude=20, country='Colombia'),
-    'SKLT': station(name='Leticia / Vasquez Cobo', coordinate=(-4.16667, -69.95), altitude=84, country='Colombia'),
-    'SKMD': station(name='Medellin / Olaya Herrera', coordinate=(6.21667, -75.6), altitude=1490, country='Colombia'),
-    'SKMR': station(name='Monteria / Los Garzones', coordinate=(8.81667, -75.85), altitude=20, country='Colombia'),
-    'SKMU': station(name='Mitu', coordinate=(1.13333, -70.05), altitude=207, country='Colombia'),
-    'SKNV': station(name='Neiva / Benito Salas', coordinate=(2.96667, -75.3), altitude=439, country='Colombia'),
-    'SKPC': station(name='Puerto Carreno / A. Guauquea', coordinate=(6.16667, -67.5), altitude=55, country='Colombia'),
-    'SKPE': station(name='Pereira / Matecana', coordinate=(4.81667, -75.73333), altitude=1342, country='Colombia'),
-    'SKPP': station(name='Popayan / Guillermo', coordinate=(2.46667, -76.6), altitude=1730, country='Colombia'),
-    'SKPS': station(name='Pasto / Antonio Narin', coordinate=(1.41667, -77.26667), altitude=1826, country='Colombia'),
-    'SKPV': station(name='Providencia Isla / El Embrujo', coordinate=(13.36667, -81.35), altitude=6, country='Colombia'),
-    'SKRG': station(name='Rionegro / J. M. Cordova', coordinate=(6.13333, -75.43333), altitude=2140, country='Colombia'),
-    'SKRH': station(name='Riohacha / Almirante Padilla', coordinate=(11.53333, -72.93333), altitude=4, country='Colombia'),
-    'SKSJ': station(name='San Jose Del Guaviare', coordinate=(2.56667, -72.63333), altitude=155, country='Colombia'),
-    'SKSM': station(name='Santa Marta / Simon Bolivar', coordinate=(11.13333, -74.23333), altitude=4, country='Colombia'),
-    'SKSP': station(name='San Andres Isla / Sesquicentenario', coordinate=(12.58333, -81.71667), altitude=1, country='Colombia'),
-    'SKUC': station(name='Arauca / Santiago Perez', coordinate=(7.06667, -70.73333), altitude=128, country='Colombia'),
-    'SKUI': station(name='Quibdo / El Carano', coordinate=(5.71667, -76.61667), altitude=53, country='Colombia'),
-    'SKVP': station(name='Valledupar / Alfonso Lopez', coordinate=(10.43333, -73.25), altitude=138, country='Colombia'),
-    'SKVV': station(name='Villavicencio / Vanguardia', coordinate=(4.16667, -73.61667), altitude=423, country='Colombia'),
-    'SLAP': station(name='Apolo', coordinate=(-14.73333, -68.5), altitude=1415, country='Bolivia'),
-    'SLAS': station(name='Ascencion De Guarayos', coordinate=(-15.71667, -63.1), altitude=247, country='Bolivia'),
-    'SLCA': station(name='Camiri', coordinate=(-20.0, -63.53333), altitude=798, country='Bolivia'),
-    'SLCB': station(name='Cochabamba', coordinate=(-17.41667, -66.18333), altitude=2548, country='Bolivia'),
-    'SLCN': station(name='Charana', coordinate=(-17.58333, -69.6), altitude=4054, country='Bolivia'),
-    'SLCO': station(name='Cobija', coordinate=(-11.03333, -68.78333), altitude=235, country='Bolivia'),
-    'SLCP': station(name='Concepcion', coordinate=(-16.15, -62.01667), altitude=497, country='Bolivia'),
-    'SLET': station(name='Santa Cruz / El Trompillo', coordinate=(-17.8, -63.18333), altitude=418, country='Bolivia'),
-    'SLGY': station(name='Guayaramerin', coordinate=(-10.81667, -65.35), altitude=130, country='Bolivia'),
-    'SLJE': station(name='San Jose De Chiquitos', coordinate=(-17.8, -60.73333), altitude=284, country='Bolivia'),
-    'SLJO': station(name='San Joaquin', coordinate=(-13.06667, -64.81667), altitude=140, country='Bolivia'),
-    'SLJV': station(name='San Javier', coordinate=(-16.26667, -62.46667), altitude=534, country='Bolivia'),
-    'SLLP': station(name='La Paz / Alto', coordinate=(-16.51667, -68.18333), altitude=4058, country='Bolivia'),
-    'SLMG': station(name='Magdalena', coordinate=(-13.33333, -64.11667), altitude=140, country='Bolivia'),
-    'SLOR': station(name='Oruro', coordinate=(-17.96667, -67.06667), altitude=3072, country='Bolivia'),
-    'SLPO': station(name='Potosi', coordinate=(-19.55, -65.73333), altitude=3935, country='Bolivia'),
-    'SLPS': station(name='Puerto Suarez', coordinate=(-18.98333, -57.81667), altitude=134, country='Bolivia'),
-    'SLRB': station(name='Robore', coordinate=(-18.31667, -59.76667), altitude=276, country='Bolivia'),
-    'SLRI': station(name='Riberalta', coordinate=(-11.0, -66.11667), altitude=141, country='Bolivia'),
-    'SLRQ': station(name='Rurrenabaque', coordinate=(-14.46667, -67.56667), altitude=204, country='Bolivia'),
-    'SLRY': station(name='Reyes', coordinate=(-14.31667, -67.38333), altitude=140, country='Bolivia'),
-    'SLSA': station(name='Santa Ana', coordinate=(-13.76667, -65.43333), altitude=144, country='Bolivia'),
-    'SLSB': station(name='San Borja', coordinate=(-14.86667, -66.86667), altitude=194, country='Bolivia'),
-    'SLSI': station(name='San Ignacio De Velasco', coordinate=(-16.38333, -60.96667), altitude=413, country='Bolivia'),
-    'SLSM': station(name='San Ignacio De Moxos', coordinate=(-14.91667, -65.6), altitude=160, country='Bolivia'),
-    'SLSU': station(name='Sucre', coordinate=(-19.01667, -65.3), altitude=2904, country='Bolivia'),
-    'SLTJ': station(name='Tarija', coordinate=(-21.55, -64.7), altitude=1854, country='Bolivia'),
-    'SLTR': station(name='Trinidad', coordinate=(-14.81667, -64.91667), altitude=155, country='Bolivia'),
-    'SLVM': station(name='Villamontes', coordinate=(-21.25, -63.45), altitude=398, country='Bolivia'),
-    'SLVR': station(name='Viru-Viru', coordinate=(-17.63333, -63.13333), altitude=373, country='Bolivia'),
-    'SLYA': station(name='Yacuiba', coordinate=(-21.95, -63.65), altitude=645, country='Bolivia'),
-    'SMJP': station(name='Johan A. Pengel', coordinate=(5.45, -55.18333), altitude=16, country='Suriname'),
-    'SMZY': station(name='Zanderij', coordinate=(5.45, -55.2), altitude=15, country='Suriname'),
-    'SOCA': station(name='Cayenne / Rochambeau', coordinate=(4.83333, -52.36667), altitude=105, country='French Guiana'),
-    'SOOM': station(name='Saint-Laurent-Du-Maroni', coordinate=(5.5, -54.03333), altitude=4, country='French Guiana'),
-    'SPAY': station(name='Atalaya', coordinate=(-10.73333, -73.78333), altitude=450, country='Peru'),
-    'SPCL': station(name='Pucallpa', coordinate=(-8.41667, -74.6), altitude=148, country='Peru'),
-    'SPEO': station(name='Chimbote', coordinate=(-9.16667, -78.51667), altitude=20, country='Peru'),
-    'SPGM': station(name='Tingo Maria', coordinate=(-9.13333, -75.95), altitude=664, country='Peru'),
-    'SPHI': station(name='Chiclayo', coordinate=(-6.78333, -79.83333), altitude=29, country='Peru'),
-    'SPHO': station(name='Ayacucho', coordinate=(-13.13333, -74.21667), altitude=2740, country='Peru'),
-    'SPHY': station(name='Andahuayla', coordinate=(-13.71667, -73.35), altitude=3444, country='Peru'),
-    'SPHZ': station(name='Anta Huaraz', coordinate=(-9.35, -77.6), altitude=2750, country='Peru'),
-    'SPIM': station(name='Lima-Callao / Aerop. Internacional Jorgechavez', coordinate=(-12.0, -77.11667), altitude=12, country='Peru'),
-    'SPJA': station(name='Rioja', coordinate=(-6.05, -77.15), altitude=792, country='Peru'),
-    'SPJI': station(name='Juanjui', coordinate=(-7.21667, -76.71667), altitude=350, country='Peru'),
-    'SPJL': station(name='Juliaca', coordinate=(-15.48333, -70.15), altitude=3826, country='Peru'),
-    'SPJN': station(name='San Juan', coordinate=(-15.38333, -75.16667), altitude=60, country='Peru'),
-    'SPJR': station(name='Cajamarca', coordinate=(-7.13333, -78.46667), altitude=2620, country='Peru'),
-    'SPME': station(name='Tumbes', coordinate=(-3.55, -80.4), altitude=25, country='Peru'),
-    'SPMS': station(name='Yurimaguas', coordinate=(-5.9, -76.08333), altitude=179, country='Peru'),
-    'SPNC': station(name='Huanuco', coordinate=(-9.9, -75.75), altitude=1859, country='Peru'),
-    'SPPY': station(name='Chachapoyas', coordinate=(-6.21667, -77.83333), altitude=2540, country='Peru'),
-    'SPQT': station(name='Iquitos', coordinate=(-3.75, -73.25), altitude=125, country='Peru'),
-    'SPQU': station(name='Arequipa', coordinate=(-16.31667, -71.55), altitude=2538, country='Peru'),
-    'SPRU': station(name='Trujillo', coordinate=(-8.1, -79.03333), altitude=26, country='Peru'),
-    'SPSO': station(name='Pisco', coordinate=(-13.75, -76.28333), altitude=8, country='Peru'),
-    'SPST': station(name='Tarapoto', coordinate=(-6.45, -76.38333), altitude=281, country='Peru'),
-    'SPTN': station(name='Tacna', coordinate=(-18.06667, -70.3), altitude=468, country='Peru'),
-    'SPTU': station(name='Puerto Maldonado', coordinate=(-12.63333, -69.2), altitude=265, country='Peru'),
-    'SPUR': station(name='Piura', coordinate=(-5.18333, -80.6), altitude=49, country='Peru'),
-    'SPYL': station(name='Talara', coordinate=(-4.56667, -81.25), altitude=85, country='Peru'),
-    'SPZO': station(name='Cuzco', coordinate=(-13.55, -71.98333), altitude=3248, country='Peru'),
-    'SUAA': station(name='Melilla', coordinate=(-34.78333, -56.25), altitude=53, country='Uruguay'),
-    'SUAG': station(name='Artigas', coordinate=(-30.38333, -56.5), altitude=123, country='Uruguay'),
-    'SUCA': station(name='Colonia', coordinate=(-34.45, -57.83333), altitude=23, country='Uruguay'),
-    'SUDU': station(name='Durazno', coordinate=(-33.35, -56.5), altitude=93, country='Uruguay'),
-    'SULS': station(name='Capitan Corbeta', coordinate=(-34.86667, -55.1), altitude=30, country='Uruguay'),
-    'SUME': station(name='Mercedes', coordinate=(-33.25, -58.06667), altitude=22, country='Uruguay'),
-    'SUMO': station(name='Melo', coordinate=(-32.36667, -54.21667), altitude=100, country='Uruguay'),
-    'SUMU': station(name='Carrasco', coordinate=(-34.83333, -56.0), altitude=32, country='Uruguay'),
-    'SUPE': station(name='Maldonado / Punta Est', coordinate=(-34.91667, -54.91667), altitude=15, country='Uruguay'),
-    'SUPU': station(name='Paysandu', coordinate=(-32.33333, -58.03333), altitude=61, country='Uruguay'),
-    'SURV': station(name='Rivera', coordinate=(-30.88333, -55.53333), altitude=205, country='Uruguay'),
-    'SUSO': station(name='Salto', coordinate=(-31.38333, -57.95), altitude=34, country='Uruguay'),
-    'SUTB': station(name='Tacuarembo', coordinate=(-31.7, -55.98333), altitude=134, country='Uruguay'),
-    'SUTR': station(name='Treinta Y Tres', coordinate=(-33.21667, -54.38333), altitude=46, country='Uruguay'),
-    'SVAC': station(name='Acarigua', coordinate=(9.55, -69.23333), altitude=226, country='Venezuela'),
-    'SVBC': station(name='Barcelona', coordinate=(10.11667, -64.68333), altitude=7, country='Venezuela'),
-    'SVBI': station(name='Barinas', coordinate=(8.61667, -70.21667), altitude=203, country='Venezuela'),
-    'SVBM': station(name='Barquisimeto', coordinate=(10.06667, -69.31667), altitude=613, country='Venezuela'),
-    'SVBS': station(name='Maracay-B. A. Sucre', coordinate=(10.25, -67.65), altitude=436, country='Venezuela'),
-    'SVCB': station(name='Ciudad Bolivar', coordinate=(8.15, -63.55), altitude=43, country='Venezuela'),
-    'SVCL': station(name='Calabozo', coordinate=(8.93333, -67.41667), altitude=100, country='Venezuela'),
-    'SVCP': station(name='Carupano / Gen. Jose', coordinate=(10.66667, -63.26667), altitude=10, country='Venezuela'),
-    'SVCR': station(name='Coro', coordinate=(11.41667, -69.68333), altitude=16, country='Venezuela'),
-    'SVCS': station(name='Caracas / Oscar Macha', coordinate=(10.3, -66.81667), altitude=654, country='Venezuela'),
-    'SVCU': station(name='Cumana', coordinate=(10.45, -64.18333), altitude=2, country='Venezuela'),
-    'SVFM': station(name='Caracas / La Carlota', coordinate=(10.5, -66.88333), altitude=835, country='Venezuela'),
-    'SVGD': station(name='Guasdualito', coordinate=(7.23333, -70.8), altitude=130, country='Venezuela'),
-    'SVGI': station(name='Guiria', coordinate=(10.58333, -62.31667), altitude=13, country='Venezuela'),
-    'SVGU': station(name='Guanare', coordinate=(9.01667, -69.73333), altitude=163, country='Venezuela'),
-    'SVHG': station(name='Higuerote', coordinate=(10.46667, -66.1), altitude=4, country='Venezuela'),
-    'SVJC': station(name='Paraguana / Josefa', coordinate=(11.78333, -70.15), altitude=23, country='Venezuela'),
-    'SVJM': station(name='San Juan De Los Morros', coordinate=(9.91667, -67.33333), altitude=429, country='Venezuela'),
-    'SVLF': station(name='La Fria', coordinate=(8.25, -72.26667), altitude=98, country='Venezuela'),
-    'SVLO': station(name='La Orchila', coordinate=(11.8, -66.18333), altitude=3, country='Venezuela'),
-    'SVMC': station(name='Maracaibo-La Chinita', coordinate=(10.56667, -71.73333), altitude=66, country='Venezuela'),
-    'SVMD': station(name='Merida', coordinate=(8.6, -71.18333), altitude=1479, country='Venezuela'),
-    'SVMG': station(name='Margarita / Del Carib', coordinate=(10.91667, -63.98333), altitude=23, country='Venezuela'),
-    'SVMI': station(name='Caracas / Maiquetia Aerop. Intl. Simon Bolivar', coordinate=(10.6, -66.98333), altitude=43, country='Venezuela'),
-    'SVMN': station(name='Mene Grande', coordinate=(9.81667, -70.93333), altitude=27, country='Venezuela'),
-    'SVMP': station(name='Metropolitano Private', coordinate=(10.13333, -66.78333), altitude=175, country='Venezuela'),
-    'SVMT': station(name='Maturin', coordinate=(9.75, -63.18333), altitude=65, country='Venezuela'),
-    'SVPA': station(name='Puerto Ayacucho', coordinate=(5.6, -67.5), altitude=73, country='Venezuela'),
-    'SVPC': station(name='Pto. Cabello', coordinate=(10.5, -68.0), altitude=2, country='Venezuela'),
-    'SVPM': station(name='Paramillo Private', coordinate=(7.8, -72.2), altitude=1000, country='Venezuela'),
-    'SVPR': station(name='Guayana / Manuel Car', coordinate=(8.3, -62.73333), altitude=144, country='Venezuela'),
-    'SVSA': station(name='San Antonio Del Tachira', coordinate=(7.85, -72.45), altitude=377, country='Venezuela'),
-    'SVSE': station(name='Santa Elena De Uairen', coordinate=(4.6, -61.11667), altitude=907, country='Venezuela'),
-    'SVSO': station(name='Sto. Domingo', coordinate=(7.58333, -72.06667), altitude=327, country='Venezuela'),
-    'SVSP': station(name='San Felipe', coordinate=(10.28333, -68.75), altitude=232, country='Venezuela'),
-    'SVSR': station(name='San Fernando De Apure', coordinate=(7.9, -67.41667), altitude=47, country='Venezuela'),
-    'SVST': station(name='San Tome Private', coordinate=(8.95, -64.15), altitude=262, country='Venezuela'),
-    'SVSZ': station(name='Santa Barbara Zulia', coordinate=(8.98333, -71.95), altitude=10, country='Venezuela'),
-    'SVTM': station(name='Tumeremo', coordinate=(7.3, -61.45), altitude=180, country='Venezuela'),
-    'SVTR': station(name='Temblador', coordinate=(9.01667, -62.61667), altitude=30, country='Venezuela'),
-    'SVVA': station(name='Valencia', coordinate=(10.16667, -67.93333), altitude=430, country='Venezuela'),
-    'SVVG': station(name='El Vigia / Perez Alph', coordinate=(8.63333, -71.66667), altitude=100, country='Venezuela'),
-    'SVVL': station(name='Valera', coordinate=(9.35, -70.61667), altitude=582, country='Venezuela'),
-    'SVVP': station(name='Valle De La Pascua', coordinate=(9.21667, -66.01667), altitude=125, country='Venezuela'),
-    'SWBC': station(name='Barcelos', coordinate=(-0.98333, -62.58333), altitude=40, country='Brazil'),
-    'SYCJ': station(name='Georgetown/Cheddi Jagan International Airport', coordinate=(6.48333, -58.25), altitude=29, country='Guyana'),
-    'SYGT': station(name='Georgetown', coordinate=(6.8, -58.15), altitude=1, country='Guyana'),
-    'SYTM': station(name='Timehri Airport', coordinate=(6.5, -58.25), altitude=28, country='Guyana'),
-    'TAKA': station(name='Takao Radar Site', coordinate=(35.56667, 133.23333), altitude=15, country='Japan'),
-    'TAPA': station(name='Vc Bird International Airport Antigua', coordinate=(17.11667, -61.78333), altitude=8, country='Antigua and Barbuda'),
-    'TBPB': station(name='Grantley Adams', coordinate=(13.06667, -59.48333), altitude=50, country='Barbados'),
-    'TBPO': station(name='Bridgetown City', coordinate=(13.1, -59.61667), altitude=50, country='Barbados'),
-    'TDCF': station(name='Canefield Airport', coordinate=(15.53333, -61.4), altitude=5, country='Dominica'),
-    'TDPD': station(name='Melville Hall Airport', coordinate=(15.53333, -61.3), altitude=13, country='Dominica'),
-    'TDPR': station(name='Roseau', coordinate=(15.3, -61.4), altitude=72, country='Dominica'),
-    'TFFF': station(name='Le Lamentin', coordinate=(14.6, -61.0), altitude=5, country='Martinique'),
-    'TFFJ': station(name='Gustavia, Saint Barthelemy', coordinate=(17.9, -62.85), altitude=48, country='Guadeloupe'),
-    'TFFR': station(name='Le Raizet, Guadeloupe', coordinate=(16.26667, -61.51667), altitude=11, country='Guadeloupe'),
-    'TGPY': station(name='Point Salines Airport', coordinate=(12.0, -61.78333), altitude=6, country='Grenada'),
-    'TIST': station(name='Charlotte Amalie St. Thomas, Cyril E. King Airport', coordinate=(18.33333, -64.98333), altitude=7, country='Virgin Islands'),
-    'TISX': station(name='Christiansted, Henry E. Rohlsen Airport', coordinate=(17.7, -64.8), altitude=20, country='Virgin Islands'),
-    'TJBQ': station(name='Aquadilla, Rafael Hernandez Airport', coordinate=(18.5, -67.13333), altitude=72, country='United States'),
-    'TJMZ': station(name='Mayaguez, Eugenio Maria de Hostos Airport', coordinate=(18.26667, -67.15), altitude=9, country='United States'),
-    'TJNR': station(name='ROOSEVELT ROADS PUERTO RICO', coordinate=(18.25, -65.63333), altitude=12, country='United States'),
-    'TJPS': station(name='Ponce, Mercedita Airport', coordinate=(18.01667, -66.56667), altitude=8, country='United States'),
-    'TJSJ': station(name='San Juan, Luis Munoz Marin International Airport', coordinate=(18.45, -66.0), altitude=3, country='United States'),
-    'TKPK': station(name='Golden Rock', coordinate=(17.3, -62.68333), altitude=48, country='Saint Kitts and Nevis'),
-    'TKPN': station(name='Charlestown / Newcast', coordinate=(17.2, -62.58333), altitude=17, country='Antigua and Barbuda'),
-    'TLPC': station(name='Vigie', coordinate=(14.01667, -61.0), altitude=2, country='Saint Lucia'),
-    'TLPL': station(name='Hewanorra International Airport', coordinate=(13.75, -60.95), altitude=3, country='Saint Lucia'),
-    'TNCA': station(name='Queen Beatrix Airport', coordinate=(12.5, -70.01667), altitude=18, country='Aruba'),
-    'TNCB': station(name='Flamingo Airport, Bonaire', coordinate=(12.15, -68.28333), altitude=6, country='Netherlands Antilles'),
-    'TNCC': station(name='Hato Airport, Curacao', coordinate=(12.2, -68.96667), altitude=9, country='Netherlands Antilles'),
-    'TNCE': station(name='Roosevelt Airport Saint Eustatius', coordinate=(17.48333, -62.98333), altitude=38, country='Netherlands Antilles'),
-    'TNCM': station(name='Juliana Airport, Saint Maarten', coordinate=(18.05, -63.11667), altitude=4, country='Netherlands Antilles'),
-    'TQPF': station(name='Wallblake', coordinate=(18.20472, -63.055), altitude=31, country='Anguilla'),
-    'TRPM': station(name='Blackburne / Plymouth', coordinate=(16.75, -62.16667), altitude=12, country='Antigua and Barbuda'),
-    'TTCP': station(name='Crown Pt./ Scarborou', coordinate=(11.15, -60.85), altitude=8, country='Trinidad and Tobago'),
-    'TTPP': station(name='Piarco International Airport, Trinidad', coordinate=(10.61667, -61.35), altitude=12, country='Trinidad and Tobago'),
-    'TTPT': station(name='Crown Point Airport, Tobago', coordinate=(11.15, -60.83333), altitude=3, country='Trinidad and Tobago'),
-    'TUPJ': station(name='Beef Island, Tortola', coordinate=(18.45, -64.53333), altitude=4, country='British Virgin Islands'),
-    'TVSV': station(name='Arnos Vale', coordinate=(13.13333, -61.2), altitude=9, country='Saint Vincent and the Grenadines'),
-    'TXKF': station(name='Bermuda', coordinate=(32.36667, -64.68333), altitude=6, country='Bermuda'),
-    'UAAA': station(name='Almaty', coordinate=(43.23333, 76.93333), altitude=847, country='Kazakhstan'),
-    'UACC': station(name='Astana', coordinate=(51.2, 71.45), altitude=None, country='Kazakhstan'),
-    'UAFM': station(name='Bishkek/Manas Airport', coordinate=(42.85, 74.58333), altitude=None, country='Kyrgyzstan'),
-    'UAII': station(name='Shymkent', coordinate=(42.31667, 69.7), altitude=552, country='Kazakhstan'),
-    'UAKK': station(name='Karaganda', coordinate=(49.8, 73.15), altitude=553, country='Kazakhstan'),
-    'UAOO': station(name='Kzyl-Orda', coordinate=(44.85, 65.5), altitude=129, country='Kazakhstan'),
-    'UARR': station(name='Uralsk', coordinate=(51.25, 51.28333), altitude=36, country='Kazakhstan'),
-    'UATA': station(name='Aralskoe More', coordinate=(46.78333, 61.65), altitude=56, country='Kazakhstan'),
-    'UATE': station(name='Aktau', coordinate=(43.87, 51.1), altitude=None, country='Kazakhstan'),
-    'UATT': station(name='Aktjubinsk', coordinate=(50.28333, 57.15), altitude=227, country='Kazakhstan'),
-    'UAUU': station(name='Kostanay', coordinate=(53.20639, 63.55083), altitude=182, country='Kazakhstan'),
-    'UBBB': station(name='Baku / Bine Airport', coordinate=(40.45, 50.06667), altitude=-6, country='Azerbaijan'),
-    'UBBG': station(name='Gyanca Airport', coordinate=(40.73333, 46.4), altitude=330, country='Azerbaijan'),
-    'UEEE': station(name='Jakutsk', coordinate=(62.01667, 129.71667), altitude=103, country='Russia'),
-    'UELL': station(name="Cul'Man", coordinate=(56.83333, 124.86667), altitude=859, country='Russia'),
-    'UERP': station(name='Polyarny', coordinate=(66.40056, 112.03028), altitude=509, country='Russia'),
-    'UERR': station(name='Mirny', coordinate=(62.53, 114.03), altitude=347, country='Russia'),
-    'UEST': station(name='Tiksi', coordinate=(71.7, 128.9), altitude=7, country='Russia'),
-    'UGEE': station(name='Yerevan', coordinate=(40.13333, 44.46667), altitude=890, country='Armenia'),
-    'UGGG': station(name='Tbilisi', coordinate=(41.68333, 44.95), altitude=467, country='Georgia'),
-    'UGMM': station(name='Muhrani', coordinate=(41.93333, 44.58333), altitude=551, country='Georgia'),
-    'UHBP': station(name='Ekimchan', coordinate=(53.06667, 132.98333), altitude=543, country='Russia'),
-    'UHHH': station(name='Habarovsk', coordinate=(48.51667, 135.16667), altitude=72, country='Russia'),
-    'UHHO': station(name='Troickoe', coordinate=(49.45, 136.56667), altitude=29, country='Russia'),
-    'UHMA': station(name='Anadyr', coordinate=(64.78333, 177.56667), altitude=62, country='Russia'),
-    'UHMD': station(name='Buhta Providenja', coordinate=(64.41667, -173.23333), altitude=3, country='Russia'),
-    'UHMG': station(name='Chaybukha', coordinate=(61.95, 160.41667), altitude=None, country='Russia'),
-    'UHMM': station(name='Magadan', coordinate=(59.55, 150.78333), altitude=118, country='Russia'),
-    'UHPP': station(name='Petropavlovsk-Kamchatskij', coordinate=(53.08333, 158.58333), altitude=24, country='Russia'),
-    'UHSS': station(name='Yuzhno-Sakhalinsk', coordinate=(46.95, 142.71667), altitude=31, country='Russia'),
-    'UHWW': station(name='Vladivostok', coordinate=(43.11667, 131.93333), altitude=184, country='Russia'),
-    'UIAA': station(name='Chita', coordinate=(52.08333, 113.48333), altitude=685, country='Russia'),
-    'UIBB': station(name='Bratsk / Irkutsk', coordinate=(56.37083, 101.69861), altitude=490, country='Russia'),
-    'UIII': station(name='Irkutsk', coordinate=(52.26667, 104.31667), altitude=513, country='Russia'),
-    'UIIO': station(name="Ust'Ordynskij", coordinate=(52.81667, 104.76667), altitude=525, country='Russia'),
-    'UIKB': station(name='Bodajbo', coordinate=(57.85, 114.23333), altitude=278, country='Russia'),
-    'UIKK': station(name='Kirensk', coordinate=(57.76667, 108.06667), altitude=258, country='Russia'),
-    'UINN': station(name='Nizhneudinsk', coordinate=(54.88333, 99.03333), altitude=410, country='Russia'),
-    'UIUH': station(name='Horinsk', coordinate=(52.16667, 109.78333), altitude=666, country='Russia'),
-    'UIUU': station(name='Ulan-Ude', coordinate=(51.83333, 107.6), altitude=510, country='Russia'),
-    'UKBB': station(name='Boryspil', coordinate=(50.33333, 30.96667), altitude=121, country='Ukraine'),
-    'UKCC': station(name='Donetsk', coordinate=(48.08333, 37.75), altitude=None, country='Ukraine'),
-    'UKDD': station(name="Dnipropetrovs'k", coordinate=(48.53333, 34.66667), altitude=None, country='Ukraine'),
-    'UKDE': station(name='Zaporizhzhia / Mokraya', coordinate=(47.86722, 35.31639), altitude=114, country='Ukraine'),
-    'UKDR': station(name="Krivyy Rih / Dnipropetrovs'k", coordinate=(48.05, 33.22), altitude=None, country='Ukraine'),
-    'UKFF': station(name='Simferopol', coordinate=(44.68333, 34.13333), altitude=180, country='Ukraine'),
-    'UKHH': station(name='Kharkiv', coordinate=(49.96667, 36.13333), altitude=154, country='Ukraine'),
-    'UKII': station(name='Kisinev', coordinate=(47.01667, 28.98333), altitude=180, country='Moldova'),
-    'UKKE': station(name='Cherkasy', coordinate=(49.41611, 31.99639), altitude=114, country='Ukraine'),
-    'UKKK': station(name='Kyiv', coordinate=(50.4, 30.56667), altitude=166, country='Ukraine'),
-    'UKKM': station(name='Hostomel', coordinate=(50.60028, 30.19361), altitude=157, country='Ukraine'),
-    'UKLI': station(name='Ivano-Frankivsk', coordinate=(48.88417, 24.68611), altitude=280, country='Ukraine'),
-    'UKLL': station(name="L'Viv", coordinate=(49.81667, 23.95), altitude=319, country='Ukraine'),
-    'UKLN': station(name='Chernovsty', coordinate=(48.26, 25.98167), altitude=252, country='Ukraine'),
-    'UKLR': station(name='Rivne', coordinate=(50.58333, 26.13333), altitude=231, country='Ukraine'),
-    'UKLU': station(name='Uzhhorod', coordinate=(48.63472, 22.26472), altitude=117, country='Ukraine'),
-    'UKON': station(name='Mykolaiv', coordinate=(47.05806, 31.92083), altitude=56, country='Ukraine'),
-    'UKOO': station(name='Odesa', coordinate=(46.43333, 30.76667), altitude=42, country='Ukraine'),
-    'ULAA': station(name="Arhangel'Sk", coordinate=(64.5, 40.73333), altitude=13, country='Russia'),
-    'ULAK': station(name='Kotlas', coordinate=(61.23333, 46.71667), altitude=56, country='Russia'),
-    'ULLI': station(name='St. Peterburg', coordinate=(59.96667, 30.3), altitude=4, country='Russia'),
-    'ULMM': station(name='Murmansk', coordinate=(68.96667, 33.05), altitude=51, country='Russia'),
-    'ULOL': station(name='Velikie Luki', coordinate=(56.35, 30.61667), altitude=98, country='Russia'),
-    'ULWT': station(name="Tot'Ma", coordinate=(59.88333, 42.75), altitude=134, country='Russia'),
-    'ULWW': station(name='Vologda', coordinate=(59.31667, 39.91667), altitude=131, country='Russia'),
-    'UMBB': station(name='Brest', coordinate=(52.10833, 23.89667), altitude=143, country='Belarus'),
-    'UMGG': station(name="Gomel'", coordinate=(52.52667, 31.01833), altitude=144, country='Belarus'),
-    'UMII': station(name='Vitebsk', coordinate=(55.16667, 30.21667), altitude=176, country='Belarus'),
-    'UMKK': station(name='Kaliningrad/Khrabrovo Airport', coordinate=(54.72, 20.5), altitude=21, country='Russia'),
-    'UMMG': station(name='Grodno', coordinate=(53.60167, 24.055), altitude=135, country='Belarus'),
-    'UMMM': station(name='Loshitsa / Minsk International 1', coordinate=(53.865, 27.54167), altitude=228, country='Belarus'),
-    'UMMS': station(name='Minsk', coordinate=(53.93333, 27.63333), altitude=234, country='Belarus'),
-    'UMRR': station(name='Riga', coordinate=(56.96667, 24.05), altitude=7, country='Latvia'),
-    'UMRW': station(name='Ventspils', coordinate=(57.4, 21.53333), altitude=3, country='Latvia'),
-    'UNAA': station(name='Abakan', coordinate=(53.75, 91.4), altitude=245, country='Russia'),
-    'UNBB': station(name='Barnaul', coordinate=(53.43333, 83.51667), altitude=252, country='Russia'),
-    'UNEE': station(name='Kemerovo', coordinate=(55.33, 86.08), altitude=260, country='Russia'),
-    'UNII': station(name='Enisejsk', coordinate=(58.45, 92.15), altitude=78, country='Russia'),
-    'UNNN': station(name='Novosibirsk', coordinate=(55.08333, 82.9), altitude=177, country='Russia'),
-    'UNOO': station(name='Omsk', coordinate=(54.96667, 73.3), altitude=122, country='Russia'),
-    'UNWW': station(name='Novokuznetsk', coordinate=(53.73333, 87.18333), altitude=308, country='Russia'),
-    'URKA': station(name='Anapa / Vitiazevo', coordinate=(44.9, 37.31667), altitude=None, country='Russia'),
-    'URKK': station(name='Krasnodar', coordinate=(45.03333, 39.15), altitude=33, country='Russia'),
-    'URMM': station(name="Mineral'Nye Vody", coordinate=(44.23333, 43.06667), altitude=314, country='Russia'),
-    'URMN': station(name='Nalchik', coordinate=(43.51278, 43.63667), altitude=445, country='Russia'),
-    'URMT': station(name='Stavropol / Shpakovskoye', coordinate=(45.33333, 42.0), altitude=None, country='Russia'),
-    'URRR': station(name='Rostov-Na-Donu', coordinate=(47.26667, 39.81667), altitude=77, country='Russia'),
-    'URSS': station(name='Adler', coordinate=(43.43333, 39.9), altitude=16, country='Russia'),
-    'URWA': station(name='Astrakhan', coordinate=(46.28333, 48.00639), altitude=0, country='Russia'),
-    'URWI': station(name='Elista', coordinate=(46.36667, 44.33333), altitude=150, country='Russia'),
-    'URWW': station(name='Volgograd', coordinate=(48.78333, 44.36667), altitude=145, country='Russia'),
-    'USCC': station(name='Chelyabinsk-Balandino', coordinate=(55.16667, 61.4), altitude=None, country='Russia'),
-    'USHH': station(name='Hanty-Mansijsk', coordinate=(61.01667, 69.03333), altitude=40, country='Russia'),
-    'USNN': station(name='Nizhnevartovsk', coordinate=(60.93333, 76.48333), altitude=54, country='Russia'),
-    'USPP': station(name="Perm'/Bolshoe Savino", coordinate=(58.0, 56.25), altitude=170, country='Russia'),
-    'USRR': station(name='Surgut', coordinate=(61.25, 73.5), altitude=44, country='Russia'),
-    'USSS': station(name='Ekaterinburg', coordinate=(56.83333, 60.63333), altitude=237, country='Russia'),
-    'UTAA': station(name='Ashgabat', coordinate=(37.98333, 58.36667), altitude=None, country='Turkmenistan'),
-    'UTDD': station(name='Dushanbe', coordinate=(38.55, 68.78333), altitude=803, country='Tajikistan'),
-    'UTED': station(name='Dzizak', coordinate=(40.11667, 67.83333), altitude=345, country='Uzbekistan'),
-    'UTNN': station(name='Nukus / Karakalpakstan', coordinate=(42.48, 59.63), altitude=None, country='Uzbekistan'),
-    'UTNU': station(name='Urgench', coordinate=(41.58333, 60.645), altitude=98, country='Uzbekistan'),
-    'UTSM': station(name='Tamdy', coordinate=(41.73333, 64.61667), altitude=238, country='Uzbekistan'),
-    'UTSS': station(name='Samarkand', coordinate=(39.56667, 66.95), altitude=724, country='Uzbekistan'),
-    'UTST': station(name='Termez', coordinate=(37.23333, 67.26667), altitude=302, country='Uzbekistan'),
-    'UTTT': station(name='Tashkent', coordinate=(41.26667, 69.26667), altitude=489, country='Uzbekistan'),
-    'UUBP': station(name='Brjansk', coordinate=(53.25, 34.31667), altitude=217, country='Russia'),
-    'UUDD': station(name='Moscow / Domodedovo', coordinate=(55.4, 37.9), altitude=179, country='Russia'),
-    'UUEE': station(name="Moscow / Sheremet'Ye", coordinate=(55.98333, 37.5), altitude=190, country='Russia'),
-    'UUEM': station(name='Tver', coordinate=(56.9, 35.88333), altitude=137, country='Russia'),
-    'UUOO': station(name='Voronez', coordinate=(51.65, 39.25), altitude=154, country='Russia'),
-    'UUWW': station(name='Moscow / Vnukovo', coordinate=(55.65, 37.26667), altitude=203, country='Russia'),
-    'UUYT': station(name="Ust'- Kulom", coordinate=(61.68333, 53.68333), altitude=139, country='Russia'),
-    'UUYY': station(name='Syktyvkar', coordinate=(61.71667, 50.83333), altitude=119, country='Russia'),
-    'UWGG': station(name='Nizhny Novgorod/Strigino', coordinate=(56.33, 44.0), altitude=None, country='Russia'),
-    'UWKD': station(name="Kazan'", coordinate=(55.78333, 49.2), altitude=None, country='Russia'),
-    'UWLW': station(name='Ulyanovsk', coordinate=(54.35, 48.38333), altitude=None, country='Russia'),
-    'UWOO': station(name='Orenburg / Tsentralny', coordinate=(51.78, 55.12), altitude=109, country='Russia'),
-    'UWPP': station(name='Penza', coordinate=(53.11667, 45.01667), altitude=174, country='Russia'),
-    'UWSS': station(name='Saratov / Tsentralny', coordinate=(51.57, 46.07), altitude=166, country='Russia'),
-    'UWUU': station(name='Ufa', coordinate=(54.73, 55.93), altitude=None, country='Russia'),
-    'UWWW': station(name='Samara', coordinate=(53.2, 50.15), altitude=44, country='Russia'),
-    'VAAH': station(name='Ahmadabad', coordinate=(23.06667, 72.63333), altitude=55, country='India'),
-    'VAAK': station(name='Akola', coordinate=(20.7, 77.06667), altitude=305, country='India'),
-    'VAAU': station(name='Aurangabad Chikalthan Aerodrome', coordinate=(19.85, 75.4), altitude=582, country='India'),
-    'VABB': station(name='Bombay / Santacruz', coordinate=(19.11667, 72.85), altitude=8, country='India'),
-    'VABI': station(name='Bilaspur', coordinate=(31.25, 76.66667), altitude=589, country='India'),
-    'VABJ': station(name='Bhuj-Rudramata', coordinate=(23.25, 69.66667), altitude=78, country='India'),
-    'VABM': station(name='Belgaum / Sambra', coordinate=(15.85, 74.61667), altitude=758, country='India'),
-    'VABP': station(name='Bhopal / Bairagarh', coordinate=(23.28333, 77.35), altitude=523, country='India'),
-    'VABV': station(name='Bhaunagar', coordinate=(21.75, 72.2), altitude=5, country='India'),
-    'VAGO': station(name='Goa / Dabolim Airport', coordinate=(15.38333, 73.81667), altitude=42, country='India'),
-    'VAID': station(name='Indore', coordinate=(22.71667, 75.8), altitude=561, country='India'),
-    'VAJB': station(name='Jabalpur', coordinate=(23.2, 79.95), altitude=391, country='India'),
-    'VAKD': station(name='Khandwa', coordinate=(21.83333, 76.36667), altitude=317, country='India'),
-    'VAKP': station(name='Kolhapur', coordinate=(16.7, 74.23333), altitude=569, country='India'),
-    'VANP': station(name='Nagpur Sonegaon', coordinate=(21.1, 79.05), altitude=308, country='India'),
-    'VARK': station(name='Rajkot', coordinate=(22.3, 70.78333), altitude=134, country='India'),
-    'VASL': station(name='Sholapur', coordinate=(17.66667, 75.9), altitude=477, country='India'),
-    'VBBM': station(name='Bhamo', coordinate=(24.26667, 97.2), altitude=111, country='Myanmar'),
-    'VBBS': station(name='Pathein', coordinate=(16.76667, 94.76667), altitude=9, country='Myanmar'),
-    'VBCI': station(name='Coco Island', coordinate=(14.11667, 93.36667), altitude=2, country='Myanmar'),
-    'VBHL': station(name='Homalin', coordinate=(24.86667, 94.91667), altitude=130, country='Myanmar'),
-    'VBKG': station(name='Kengtung', coordinate=(21.3, 99.61667), altitude=827, country='Myanmar'),
-    'VBKP': station(name='Kyaukpyu', coordinate=(19.41667, 93.55), altitude=5, country='Myanmar'),
-    'VBLS': station(name='Lashio', coordinate=(22.93333, 97.75), altitude=747, country='Myanmar'),
-    'VBMK': station(name='Myitkyina', coordinate=(25.36667, 97.4), altitude=145, country='Myanmar'),
-    'VBML': station(name='Meiktila', coordinate=(20.83333, 95.83333), altitude=214, country='Myanmar'),
-    'VBMM': station(name='Moulmein', coordinate=(16.5, 97.61667), altitude=21, country='Myanmar'),
-    'VBPA': station(name='Hpa-An', coordinate=(16.75, 97.66667), altitude=9, country='Myanmar'),
-    'VBPR': station(name='Prome', coordinate=(18.8, 95.21667), altitude=58, country='Myanmar'),
-    'VBPT': station(name='Putao', coordinate=(27.33333, 97.41667), altitude=409, country='Myanmar'),
-    'VBRM': station(name='Mandalay', coordinate=(21.98333, 96.1), altitude=74, country='Myanmar'),
-    'VBRN': station(name='Mergui', coordinate=(12.43333, 98.6), altitude=36, country='Myanmar'),
-    'VBRR': station(name='Mingaladon', coordinate=(16.9, 96.18333), altitude=28, country='Myanmar'),
-    'VBSY': station(name='Sandoway', coordinate=(18.46667, 94.35), altitude=9, country='Myanmar'),
-    'VBTV': station(name='Dawei', coordinate=(14.1, 98.21667), altitude=16, country='Myanmar'),
-    'VCBI': station(name='Katunayake', coordinate=(7.16667, 79.88333), altitude=8, country='Sri Lanka'),
-    'VCCA': station(name='Anuradhapura', coordinate=(8.33333, 80.41667), altitude=89, country='Sri Lanka'),
-    'VCCB': station(name='Batticaloa', coordinate=(7.71667, 81.7), altitude=5, country='Sri Lanka'),
-    'VCCC': station(name='Ratmalana', coordinate=(6.81667, 79.88333), altitude=5, country='Sri Lanka'),
-    'VCCT': station(name='Trincomalee', coordinate=(8.58333, 81.25), altitude=3, country='Sri Lanka'),
-    'VDKC': station(name='Kompong-Cham', coordinate=(12.0, 105.45), altitude=16, country='Cambodia'),
-    'VDPP': station(name='Phnom-Penh / Pochentong', coordinate=(11.55, 104.85), altitude=10, country='Cambodia'),
-    'VDSR': station(name='Siemreap', coordinate=(13.36667, 103.85), altitude=15, country='Cambodia'),
-    'VEAT': station(name='Agartala', coordinate=(23.88333, 91.25), altitude=15, country='India'),
-    'VEBD': station(name='Siliguri', coordinate=(26.63333, 88.31667), altitude=126, country='India'),
-    'VEBS': station(name='Bhubaneswar', coordinate=(20.25, 85.83333), altitude=45, country='India'),
-    'VECC': station(name='Calcutta / Dum Dum', coordinate=(22.65, 88.45), altitude=4, country='India'),
-    'VECX': station(name='Car Nicobar', coordinate=(9.15, 92.81667), altitude=10, country='India'),
-    'VEGK': station(name='Gorakhpur', coordinate=(26.75, 83.36667), altitude=76, country='India'),
-    'VEGT': station(name='Gauhati', coordinate=(26.1, 91.58333), altitude=47, country='India'),
-    'VEGY': station(name='Gaya', coordinate=(24.75, 84.95), altitude=110, country='India'),
-    'VEIM': station(name='Imphal Tulihal', coordinate=(24.76667, 93.9), altitude=780, country='India'),
-    'VEJH': station(name='Jharsuguda', coordinate=(21.91667, 84.08333), altitude=228, country='India'),
-    'VEJS': station(name='Jamshedpur', coordinate=(22.81667, 86.18333), altitude=140, country='India'),
-    'VELR': station(name='North Lakhimpur', coordinate=(27.23333, 94.11667), altitude=101, country='India'),
-    'VEMN': station(name='Dibrugarh / Mohanbari', coordinate=(27.48333, 95.01667), altitude=110, country='India'),
-    'VEPB': station(name='Port Blair', coordinate=(11.66667, 92.71667), altitude=73, country='India'),
-    'VEPT': station(name='Patna', coordinate=(25.6, 85.1), altitude=51, country='India'),
-    'VERC': station(name='M. O. Ranchi', coordinate=(23.31667, 85.31667), altitude=652, country='India'),
-    'VGCB': station(name="Cox's Bazar", coordinate=(21.43333, 91.96667), altitude=2, country='Bangladesh'),
-    'VGEG': station(name='Chittagong Patenga', coordinate=(22.26667, 91.81667), altitude=4, country='Bangladesh'),
-    'VGIS': station(name='Ishurdi', coordinate=(24.13333, 89.05), altitude=13, country='Bangladesh'),
-    'VGJR': station(name='Jessore', coordinate=(23.18333, 89.16667), altitude=6, country='Bangladesh'),
-    'VGRJ': station(name='Rajshahi', coordinate=(24.36667, 88.7), altitude=17, country='Bangladesh'),
-    'VGSY': station(name='Sylhet', coordinate=(24.9, 91.88333), altitude=34, country='Bangladesh'),
-    'VGTJ': station(name='Dhaka', coordinate=(23.76667, 90.38333), altitude=8, country='Bangladesh'),
-    'VGZR': station(name='Kurmitola, Dia', coordinate=(23.85, 90.4), altitude=9, country='Bangladesh'),
-    'VHCH': station(name='Cheung Chau', coordinate=(22.2, 114.01667), altitude=79, country='Hong Kong'),
-    'VHHH': station(name='Hong Kong Inter-National Airport', coordinate=(22.33333, 114.18333), altitude=5, country='Hong Kong'),
-    'VIAG': station(name='Agra', coordinate=(27.15, 77.96667), altitude=168, country='India'),
-    'VIAL': station(name='Allahabad / Bamhrauli', coordinate=(25.45, 81.73333), altitude=97, country='India'),
-    'VIAR': station(name='Amritsar', coordinate=(31.63333, 74.86667), altitude=229, country='India'),
-    'VIBN': station(name='Varanasi / Babatpur', coordinate=(25.45, 82.86667), altitude=81, country='India'),
-    'VIBY': station(name='Bareilly', coordinate=(28.36667, 79.4), altitude=167, country='India'),
-    'VICX': station(name='Kanpur / Chakeri', coordinate=(26.4, 80.4), altitude=123, country='India'),
-    'VIDD': station(name='New Delhi / Safdarjung', coordinate=(28.58333, 77.2), altitude=211, country='India'),
-    'VIDP': station(name='New Delhi / Palam', coordinate=(28.56667, 77.11667), altitude=220, country='India'),
-    'VIGR': station(name='Gwalior', coordinate=(26.23333, 78.25), altitude=205, country='India'),
-    'VIHR': station(name='Hissar', coordinate=(29.16667, 75.73333), altitude=216, country='India'),
-    'VIJN': station(name='Jhansi', coordinate=(25.45, 78.58333), altitude=250, country='India'),
-    'VIJO': station(name='Jodhpur', coordinate=(26.3, 73.01667), altitude=217, country='India'),
-    'VIJP': station(name='Jaipur / Sanganer', coordinate=(26.81667, 75.8), altitude=385, country='India'),
-    'VIKO': station(name='Kota Aerodrome', coordinate=(25.15, 75.85), altitude=273, country='India'),
-    'VILK': station(name='Lucknow / Amausi', coordinate=(26.75, 80.88333), altitude=122, country='India'),
-    'VIST': station(name='Satna', coordinate=(24.56667, 80.83333), altitude=315, country='India'),
-    'VIUD': station(name='Udaipur Dabok', coordinate=(24.61667, 73.88333), altitude=509, country='India'),
-    'VLAP': station(name='Attopeu', coordinate=(14.8, 106.83333), altitude=105, country='Laos'),
-    'VLIP': station(name='Pakse', coordinate=(15.11667, 105.16667), altitude=102, country='Laos'),
-    'VLLB': station(name='Luang-Prabang', coordinate=(19.88333, 102.13333), altitude=305, country='Laos'),
-    'VLSB': station(name='Sayaboury', coordinate=(19.23333, 101.73333), altitude=326, country='Laos'),
-    'VLSK': station(name='Savannakhet', coordinate=(16.55, 104.65), altitude=155, country='Laos'),
-    'VLSV': station(name='Saravane', coordinate=(15.68333, 106.43333), altitude=168, country='Laos'),
-    'VLTK': station(name='Thakhek', coordinate=(17.38333, 104.65), altitude=52, country='Laos'),
-    'VLVT': station(name='Vientiane', coordinate=(17.95, 102.56667), altitude=171, country='Laos'),
-    'VMMC': station(name='Taipa', coordinate=(22.16667, 113.56667), altitude=114, country='Macau'),
-    'VNBW': station(name='Bhairawa Airport', coordinate=(27.51667, 83.45), altitude=109, country='Nepal'),
-    'VNJL': station(name='Jumla', coordinate=(29.28333, 82.16667), altitude=2300, country='Nepal'),
-    'VNKT': station(name='Kathmandu Airport', coordinate=(27.7, 85.36667), altitude=1337, country='Nepal'),
-    'VNPK': station(name='Pokhara Airport', coordinate=(28.21667, 84.0), altitude=827, country='Nepal'),
-    'VNSI': station(name='Simra Airport', coordinate=(27.16667, 84.98333), altitude=137, country='Nepal'),
-    'VNSK': station(name='Surkhet', coordinate=(28.6, 81.61667), altitude=720, country='Nepal'),
-    'VNTJ': station(name='Taplejung', coordinate=(27.35, 87.66667), altitude=1732, country='Nepal'),
-    'VNVT': station(name='Biratnagar Airport', coordinate=(26.48333, 87.26667), altitude=72, country='Nepal'),
-    'VOBG': station(name='Bangalore / Hindustan', coordinate=(12.95, 77.66667), altitude=888, country='India'),
-    'VOBI': station(name='Bellary', coordinate=(15.15, 76.85), altitude=448, country='India'),
-    'VOBZ': station(name='Vijayawada / Gannavaram', coordinate=(16.53333, 80.8), altitude=21, country='India'),
-    'VOCB': station(name='Coimbatore / Peelamedu', coordinate=(11.03333, 77.05), altitude=396, country='India'),
-    'VOCC': station(name='Cochin / Willingdon', coordinate=(9.95, 76.26667), altitude=1, country='India'),
-    'VOCP': station(name='Cuddapah', coordinate=(14.48333, 78.83333), altitude=129, country='India'),
-    'VOHY': station(name='Hyderabad Airport', coordinate=(17.45, 78.46667), altitude=530, country='India'),
-    'VOMD': station(name='Madurai', coordinate=(9.83333, 78.08333), altitude=139, country='India'),
-    'VOML': station(name='Mangalore / Bajpe', coordinate=(12.91667, 74.88333), altitude=102, country='India'),
-    'VOMM': station(name='Madras / Minambakkam', coordinate=(13.0, 80.18333), altitude=10, country='India'),
-    'VOTR': station(name='Tiruchchirapalli', coordinate=(10.76667, 78.71667), altitude=85, country='India'),
-    'VOTV': station(name='Thiruvananthapuram', coordinate=(8.46667, 76.95), altitude=4, country='India'),
-    'VOVR': station(name='Vellore', coordinate=(12.91667, 79.15), altitude=213, country='India'),
-    'VRGN': station(name='Gan', coordinate=(-0.68333, 73.15), altitude=2, country='Maldives'),
-    'VRMM': station(name='Male', coordinate=(4.2, 73.53333), altitude=2, country='Maldives'),
-    'VTBC': station(name='Chanthaburi', coordinate=(12.6, 102.11667), altitude=3, country='Thailand'),
-    'VTBD': station(name='Don Muang', coordinate=(13.91667, 100.6), altitude=4, country='Thailand'),
-    'VTBG': station(name='Kanchanaburi', coordinate=(14.01667, 99.53333), altitude=28, country='Thailand'),
-    'VTBI': station(name='Prachin Buri', coordinate=(14.05, 101.36667), altitude=5, country='Thailand'),
-    'VTBJ': station(name='Phetchaburi', coordinate=(13.15, 100.06667), altitude=2, country='Thailand'),
-    'VTBP': station(name='Prachuap Khirikhan', coordinate=(11.83333, 99.83333), altitude=4, country='Thailand'),
-    'VTBS': station(name='Chon Buri', coordinate=(13.36667, 100.98333), altitude=1, country='Thailand'),
-    'VTBU': station(name='Rayong', coordinate=(12.63333, 101.35), altitude=3, country='Thailand'),
-    'VTCC': station(name='Chiang Mai', coordinate=(18.78333, 98.98333), altitude=312, country='Thailand'),
-    'VTCH': station(name='Mae Hong Son', coordinate=(19.3, 97.83333), altitude=267, country='Thailand'),
-    'VTCL': station(name='Lampang', coordinate=(18.28333, 99.51667), altitude=241, country='Thailand'),
-    'VTCN': station(name='Nan', coordinate=(18.76667, 100.76667), altitude=200, country='Thailand'),
-    'VTCP': station(name='Phrae', coordinate=(18.16667, 100.16667), altitude=161, country='Thailand'),
-    'VTCR': station(name='Chiang Rai', coordinate=(19.91667, 99.83333), altitude=394, country='Thailand'),
-    'VTCS': station(name='Mae Sariang', coordinate=(18.16667, 97.93333), altitude=212, country='Thailand'),
-    'VTPH': station(name='Hua Hin', coordinate=(12.58333, 99.95), altitude=5, country='Thailand'),
-    'VTPM': station(name='Mae Sot', coordinate=(16.66667, 98.55), altitude=196, country='Thailand'),
-    'VTPN': station(name='Nakhon Sawan', coordinate=(15.8, 100.16667), altitude=34, country='Thailand'),
-    'VTPS': station(name='Phitsanulok', coordinate=(16.78333, 100.26667), altitude=44, country='Thailand'),
-    'VTPT': station(name='Tak', coordinate=(16.88333, 99.15), altitude=121, country='Thailand'),
-    'VTPU': station(name='Uttaradit', coordinate=(17.61667, 100.1), altitude=63, country='Thailand'),
-    'VTSA': station(name='Satun', coordinate=(6.65, 100.08333), altitude=4, country='Thailand'),
-    'VTSB': station(name='Surat Thani', coordinate=(9.11667, 99.35), altitude=10, country='Thailand'),
-    'VTSD': station(name='Chumphon', coordinate=(10.48333, 99.18333), altitude=3, country='Thailand'),
-    'VTSH': station(name='Songkhla', coordinate=(7.2, 100.6), altitude=4, country='Thailand'),
-    'VTSK': station(name='Pattani', coordinate=(6.78333, 101.15), altitude=5, country='Thailand'),
-    'VTSN': station(name='Nakhon Si Thammarat', coordinate=(8.46667, 99.96667), altitude=7, country='Thailand'),
-    'VTSP': station(name='Phuket Airport', coordinate=(8.11667, 98.31667), altitude=6, country='Thailand'),
-    'VTSR': station(name='Ranong', coordinate=(9.98333, 98.61667), altitude=7, country='Thailand'),
-    'VTSS': station(name='Hat Yai', coordinate=(6.91667, 100.43333), altitude=27, country='Thailand'),
-    'VTST': station(name='Trang', coordinate=(7.51667, 99.61667), altitude=14, country='Thailand'),
-    'VTUB': station(name='Mukdahan', coordinate=(16.53333, 104.71667), altitude=138, country='Thailand'),
-    'VTUC': station(name='Chaiyaphum', coordinate=(15.8, 102.03333), altitude=182, country='Thailand'),
-    'VTUD': station(name='Udon Thani', coordinate=(17.38333, 102.8), altitude=177, country='Thailand'),
-    'VTUK': station(name='Khon Kaen', coordinate=(16.43333, 102.83333), altitude=165, country='Thailand'),
-    'VTUL': station(name='Loei', coordinate=(17.45, 101.73333), altitude=253, country='Thailand'),
-    'VTUM': station(name='Nong Khai', coordinate=(17.86667, 102.71667), altitude=174, country='Thailand'),
-    'VTUN': station(name='Nakhon Ratchasima', coordinate=(14.96667, 102.08333), altitude=187, country='Thailand'),
-    'VTUP': station(name='Nakhon Phanom', coordinate=(17.41667, 104.78333), altitude=146, country='Thailand'),
-    'VTUR': station(name='Roi Et', coordinate=(16.05, 103.68333), altitude=140, country='Thailand'),
-    'VTUS': station(name='Sakon Nakhon', coordinate=(17.15, 104.13333), altitude=171, country='Thailand'),
-    'VTUU': station(name='Ubon Ratchathani', coordinate=(15.25, 104.86667), altitude=123, country='Thailand'),
-    'VVDN': station(name='Da Nang', coordinate=(16.03333, 108.18333), altitude=7, country='Vietnam'),
-    'VVGL': station(name='Hanoi / Gialam', coordinate=(21.03333, 105.85), altitude=12, country='Vietnam'),
-    'VVNB': station(name='Ha Noi', coordinate=(21.01667, 105.8), altitude=6, country='Vietnam'),
-    'VVNT': station(name='Nha Trang', coordinate=(12.25, 109.2), altitude=10, country='Vietnam'),
-    'VVPB': station(name='Hue', coordinate=(16.4, 107.68333), altitude=17, country='Vietnam'),
-    'VVPK': station(name='Pleiku City', coordinate=(13.98333, 108.0), altitude=801, country='Vietnam'),
-    'VVQN': station(name='Quy Nhon', coordinate=(13.76667, 109.21667), altitude=6, country='Vietnam'),
-    'VVTS': station(name='Ho Chi Minh', coordinate=(10.81667, 106.66667), altitude=19, country='Vietnam'),
-    'VVVH': station(name='Vinh', coordinate=(18.7, 105.66667), altitude=6, country='Vietnam'),
-    'VYSW': station(name='Sittwe', coordinate=(20.13333, 92.88333), altitude=4, country='Myanmar'),
-    'VYYY': station(name='Yangon', coordinate=(16.76667, 96.16667), altitude=14, country='Myanmar'),
-    'WAAA': station(name='Ujung Pandang / Hasanuddin', coordinate=(-5.06667, 119.55), altitude=14, country='Indonesia'),
-    'WAAB': station(name='Bau-Bau / Beto Ambiri', coordinate=(-5.46667, 122.61667), altitude=2, country='Indonesia'),
-    'WAAU': station(name='Kendari / Woltermon-Ginsidi', coordinate=(-4.1, 122.43333), altitude=50, country='Indonesia'),
-    'WABB': station(name='Biak / Mokmer', coordinate=(-1.18333, 136.11667), altitude=11, country='Indonesia'),
-    'WABI': station(name='Nabire', coordinate=(-3.33333, 135.5), altitude=3, country='Indonesia'),
-    'WABN': station(name='Kokonao / Timuka', coordinate=(-4.71667, 136.43333), altitude=3, country='Indonesia'),
-    'WABO': station(name='Serui / Yendosa', coordinate=(-1.86667, 136.23333), altitude=3, country='Indonesia'),
-    'WABT': station(name='Enarotali', coordinate=(-3.91667, 136.36667), altitude=1770, country='Indonesia'),
-    'WAJI': station(name='Sarmi', coordinate=(-1.83333, 138.71667), altitude=3, country='Indonesia'),
-    'WAJJ': station(name='Jayapura / Sentani', coordinate=(-2.56667, 140.48333), altitude=99, country='Indonesia'),
-    'WAJW': station(name='Wamena / Wamena', coordinate=(-4.06667, 138.95), altitude=1660, country='Indonesia'),
-    'WAKK': station(name='Merauke / Mopah', coordinate=(-8.46667, 140.38333), altitude=3, country='Indonesia'),
-    'WAKT': station(name='Tanah Merah / Tanah Merah', coordinate=(-6.1, 140.3), altitude=16, country='Indonesia'),
-    'WAMA': station(name='Galela / Gamarmalamu', coordinate=(1.81667, 127.83333), altitude=8, country='Indonesia'),
-    'WAMG': station(name='Gorontalo / Jalaluddin', coordinate=(0.51667, 123.06667), altitude=2, country='Indonesia'),
-    'WAMH': station(name='Tahuna', coordinate=(3.58333, 125.46667), altitude=38, country='Indonesia'),
-    'WAMI': station(name='Toli-Toli / Lalos', coordinate=(1.01667, 120.8), altitude=2, country='Indonesia'),
-    'WAML': station(name='Palu / Mutiara', coordinate=(-0.68333, 119.73333), altitude=6, country='Indonesia'),
-    'WAMM': station(name='Menado / Dr. Sam Ratulangi', coordinate=(1.53333, 124.91667), altitude=80, country='Indonesia'),
-    'WAMP': station(name='Poso / Kasiguncu', coordinate=(-1.38333, 120.73333), altitude=2, country='Indonesia'),
-    'WAMT': station(name='Ternate / Babullah', coordinate=(0.78333, 127.38333), altitude=23, country='Indonesia'),
-    'WAMW': station(name='Luwuk / Bubung', coordinate=(-0.9, 122.78333), altitude=2, country='Indonesia'),
-    'WAPA': station(name='Amahai', coordinate=(-3.35, 128.88333), altitude=10, country='Indonesia'),
-    'WAPH': station(name='Labuha / Taliabu', coordinate=(-1.61667, 124.55), altitude=3, country='Indonesia'),
-    'WAPI': station(name='Saumlaki', coordinate=(-7.98333, 131.3), altitude=24, country='Indonesia'),
-    'WAPN': station(name='Sanana', coordinate=(-2.08333, 126.0), altitude=2, country='Indonesia'),
-    'WAPP': station(name='Ambon / Pattimura', coordinate=(-3.7, 128.08333), altitude=12, country='Indonesia'),
-    'WAPR': station(name='Namlea', coordinate=(-3.25, 127.08333), altitude=20, country='Indonesia'),
-    'WASF': station(name='Fak-Fak / Torea', coordinate=(-2.88333, 132.25), altitude=130, country='Indonesia'),
-    'WASK': station(name='Kaimana / Utarom', coordinate=(-3.66667, 133.75), altitude=3, country='Indonesia'),
-    'WASR': station(name='Manokwari / Rendani', coordinate=(-0.88333, 134.05), altitude=3, country='Indonesia'),
-    'WASS': station(name='Sorong / Jefman', coordinate=(-0.93333, 131.11667), altitude=3, country='Indonesia'),
-    'WBGB': station(name='Bintulu', coordinate=(3.2, 113.03333), altitude=2, country='Malaysia'),
-    'WBGG': station(name='Kuching', coordinate=(1.48333, 110.33333), altitude=27, country='Malaysia'),
-    'WBGR': station(name='Miri', coordinate=(4.33333, 113.98333), altitude=17, country='Malaysia'),
-    'WBGS': station(name='Sibu', coordinate=(2.33333, 111.83333), altitude=8, country='Malaysia'),
-    'WBKK': station(name='Kota Kinabalu', coordinate=(5.93333, 116.05), altitude=3, country='Malaysia'),
-    'WBKL': station(name='Labuan', coordinate=(5.3, 115.25), altitude=30, country='Malaysia'),
-    'WBKS': station(name='Sandakan', coordinate=(5.9, 118.06667), altitude=12, country='Malaysia'),
-    'WBKT': station(name='Kudat', coordinate=(6.91667, 116.83333), altitude=3, country='Malaysia'),
-    'WBKW': station(name='Tawau', coordinate=(4.26667, 117.88333), altitude=18, country='Malaysia'),
-    'WBSB': station(name='Brunei Airport', coordinate=(4.93333, 114.93333), altitude=22, country='Brunei'),
-    'WIAA': station(name='Sabang / Cut Bau', coordinate=(5.86667, 95.31667), altitude=126, country='Indonesia'),
-    'WIAG': station(name='Menggala / Astra Ksetra', coordinate=(-4.45, 105.18333), altitude=19, country='Indonesia'),
-    'WIAM': station(name='Tasikmalaya / Cibeureum', coordinate=(-7.33333, 108.25), altitude=335, country='Indonesia'),
-    'WIAR': station(name='Madiun / Iswahyudi', coordinate=(-7.61667, 111.51667), altitude=110, country='Indonesia'),
-    'WIAS': station(name='Malang / Abdul Rahkmansaleh', coordinate=(-7.96667, 112.7), altitude=526, country='Indonesia'),
-    'WIBB': station(name='Pakanbaru / Simpangtiga', coordinate=(0.46667, 101.45), altitude=31, country='Indonesia'),
-    'WIIA': station(name='Curug / Budiarto', coordinate=(-6.23333, 106.65), altitude=46, country='Indonesia'),
-    'WIIB': station(name='Bandung / Husein', coordinate=(-6.9, 107.58333), altitude=740, country='Indonesia'),
-    'WIIH': station(name='Jakarta Halim Perdanakusuma', coordinate=(-6.25, 106.9), altitude=30, country='Indonesia'),
-    'WIII': station(name='Jakarta / Soekarno-Hatta', coordinate=(-6.11667, 106.65), altitude=8, country='Indonesia'),
-    'WIIJ': station(name='Jogyakarta / Adisucipto', coordinate=(-7.78333, 110.43333), altitude=107, country='Indonesia'),
-    'WIIK': station(name='Kalijati', coordinate=(-6.55, 107.66667), altitude=110, country='Indonesia'),
-    'WIIL': station(name='Cilacap', coordinate=(-7.73333, 109.01667), altitude=6, country='Indonesia'),
-    'WIIS': station(name='Semarang / Ahmadyani', coordinate=(-6.98333, 110.38333), altitude=3, country='Indonesia'),
-    'WIIT': station(name='Telukbetung / Beranti', coordinate=(-5.26667, 105.18333), altitude=96, country='Indonesia'),
-    'WIKB': station(name='Batan, Sumatra', coordinate=(1.11667, 104.11667), altitude=24, country='Indonesia'),
-    'WIKD': station(name='Tanjungpandan / Buluh Tumbang', coordinate=(-2.75, 107.75), altitude=44, country='Indonesia'),
-    'WIKK': station(name='Pangkalpinang / Pangkalpinang', coordinate=(-2.16667, 106.13333), altitude=33, country='Indonesia'),
-    'WIKN': station(name='Tanjungpinang / Kijang', coordinate=(0.91667, 104.53333), altitude=18, country='Indonesia'),
-    'WIKS': station(name='Singkep / Dabo', coordinate=(-0.48333, 104.58333), altitude=31, country='Indonesia'),
-    'WIMB': station(name='Gunung Sitoli / Binaka', coordinate=(1.5, 97.63333), altitude=6, country='Indonesia'),
-    'WIMG': station(name='Padang / Tabing', coordinate=(-0.88333, 100.35), altitude=3, country='Indonesia'),
-    'WIMM': station(name='Medan / Polonia', coordinate=(3.56667, 98.68333), altitude=25, country='Indonesia'),
-    'WIMS': station(name='Sibolga / Pinangsori', coordinate=(1.55, 98.88333), altitude=3, country='Indonesia'),
-    'WIOI': station(name='Singkawang Ii', coordinate=(1.08333, 109.66667), altitude=38, country='Indonesia'),
-    'WIOK': station(name='Ketapang / Rahadi Usmaman', coordinate=(-1.85, 109.96667), altitude=9, country='Indonesia'),
-    'WION': station(name='Ranai / Ranai', coordinate=(3.95, 108.38333), altitude=2, country='Indonesia'),
-    'WIOO': station(name='Pontianak / Supadio', coordinate=(-0.15, 109.4), altitude=3, country='Indonesia'),
-    'WIOS': station(name='Sintang', coordinate=(0.11667, 111.53333), altitude=30, country='Indonesia'),
-    'WIPA': station(name='Jambi / Sultan Taha', coordinate=(-1.63333, 103.65), altitude=25, country='Indonesia'),
-    'WIPH': station(name='Kerinci / Depati Parbo', coordinate=(-2.76667, 101.36667), altitude=782, country='Indonesia'),
-    'WIPL': station(name='Bengkulu / Padangkemiling', coordinate=(-3.88333, 102.33333), altitude=16, country='Indonesia'),
-    'WIPP': station(name='Palembang / Talangbetutu', coordinate=(-2.9, 104.7), altitude=10, country='Indonesia'),
-    'WIPR': station(name='Rengat / Japura', coordinate=(0.46667, 102.31667), altitude=46, country='Indonesia'),
-    'WITC': station(name='Meulaboh / Cut Nyak Dhien', coordinate=(4.25, 96.11667), altitude=90, country='Indonesia'),
-    'WITM': station(name='Lhokseumawe / Malikussaleh', coordinate=(5.23333, 97.2), altitude=87, country='Indonesia'),
-    'WITT': station(name='Banda Aceh / Blangbintang', coordinate=(5.51667, 95.41667), altitude=21, country='Indonesia'),
-    'WMBA': station(name='Sitiawan', coordinate=(4.21667, 100.7), altitude=7, country='Malaysia'),
-    'WMKC': station(name='Kota Bharu', coordinate=(6.16667, 102.28333), altitude=5, country='Malaysia'),
-    'WMKD': station(name='Kuantan', coordinate=(3.61667, 103.21667), altitude=18, country='Malaysia'),
-    'WMKJ': station(name='Johore Bharu / Senai', coordinate=(1.63333, 103.66667), altitude=37, country='Malaysia'),
-    'WMKK': station(name='Sepang/KL International Airport', coordinate=(2.73333, 101.7), altitude=21, country='Malaysia'),
-    'WMKL': station(name='Langkawi', coordinate=(6.33333, 99.73333), altitude=8, country='Malaysia'),
-    'WMKM': station(name='Malacca', coordinate=(2.26667, 102.25), altitude=11, country='Malaysia'),
-    'WMKP': station(name='Penang / Bayan Lepas', coordinate=(5.3, 100.26667), altitude=3, country='Malaysia'),
-    'WMSA': station(name='Subang/Sultan Abdul Aziz Shah Airport', coordinate=(3.11667, 101.53333), altitude=27, country='Malaysia'),
-    'WPDL': station(name='Dilli / Dilli Airport', coordinate=(-8.56667, 125.56667), altitude=6, country='East Timor'),
-    'WPEC': station(name='Baucau', coordinate=(-8.5, 126.4), altitude=522, country='East Timor'),
-    'WPOC': station(name='Oe-Cusse / Oe Cusse', coordinate=(-9.2, 124.36667), altitude=5, country='East Timor'),
-    'WRBB': station(name='Banjarmasin / Syamsuddin Noor', coordinate=(-3.43333, 114.75), altitude=20, country='Indonesia'),
-    'WRBI': station(name='Pangkalan Bun / Iskandar', coordinate=(-2.7, 110.7), altitude=25, country='Indonesia'),
-    'WRBK': station(name='Kotabaru', coordinate=(-3.4, 116.21667), altitude=18, country='Indonesia'),
-    'WRBM': station(name='Muaratewe / Beringin', coordinate=(-0.95, 114.9), altitude=60, country='Indonesia'),
-    'WRBP': station(name='Palangkaraya / Panarung', coordinate=(-1.0, 114.0), altitude=27, country='Indonesia'),
-    'WRKC': station(name='Maumere / Wai Oti', coordinate=(-8.63333, 122.25), altitude=3, country='Indonesia'),
-    'WRKK': station(name='Kupang / El Tari', coordinate=(-10.16667, 123.66667), altitude=108, country='Indonesia'),
-    'WRKL': station(name='Larantuka', coordinate=(-8.26667, 122.96667), altitude=9, country='Indonesia'),
-    'WRKM': station(name='Alor / Mali', coordinate=(-8.21667, 124.56667), altitude=12, country='Indonesia'),
-    'WRKR': station(name='Rote / Baa', coordinate=(-10.73333, 123.06667), altitude=1, country='Indonesia'),
-    'WRKS': station(name='Sabu / Tardamu', coordinate=(-10.5, 121.83333), altitude=26, country='Indonesia'),
-    'WRLB': station(name='Longbawan / Juvai Semaring', coordinate=(3.73333, 115.68333), altitude=550, country='Indonesia'),
-    'WRLG': station(name='Tanjung Selor', coordinate=(2.85, 117.33333), altitude=50, country='Indonesia'),
-    'WRLK': station(name='Tanjung Redep / Berau', coordinate=(2.11667, 117.45), altitude=26, country='Indonesia'),
-    'WRLL': station(name='Balikpapan / Sepinggan', coordinate=(-1.26667, 116.9), altitude=3, country='Indonesia'),
-    'WRLR': station(name='Tarakan / Juwata', coordinate=(3.33333, 117.56667), altitude=6, country='Indonesia'),
-    'WRLS': station(name='Samarinda / Temindung', coordinate=(-0.61667, 117.15), altitude=230, country='Indonesia'),
-    'WRRA': station(name='Ampenan / Selaparang', coordinate=(-8.53333, 116.06667), altitude=3, country='Indonesia'),
-    'WRRB': station(name='Bima', coordinate=(-8.55, 118.7), altitude=2, country='Indonesia'),
-    'WRRR': station(name='Denpasar / Ngurah-Rai', coordinate=(-8.75, 115.16667), altitude=1, country='Indonesia'),
-    'WRRS': station(name='Sumbawa Besar / Sumbawa Besar', coordinate=(-8.43333, 117.41667), altitude=3, country='Indonesia'),
-    'WRRW': station(name='Waingapu / Mau Hau', coordinate=(-9.66667, 120.33333), altitude=12, country='Indonesia'),
-    'WRSJ': station(name='Surabaya / Juanda', coordinate=(-7.36667, 112.76667), altitude=3, country='Indonesia'),
-    'WRSP': station(name='Surabaya / Perak', coordinate=(-7.21667, 112.71667), altitude=3, country='Indonesia'),
-    'WRSQ': station(name='Surakarta / Adisumarmo', coordinate=(-7.86667, 110.91667), altitude=104, country='Indonesia'),
-    'WRSS': station(name='Surabaya', coordinate=(-7.21667, 113.71667), altitude=3, country='Indonesia'),
-    'WSAP': station(name='Singapore / Paya Lebar', coordinate=(1.36667, 103.91667), altitude=18, country='Singapore'),
-    'WSSS': station(name='Singapore / Changi Airport', coordinate=(1.36667, 103.98333), altitude=5, country='Singapore'),
-    'YAYE': station(name='Ayers Rock', coordinate=(-25.18333, 130.96667), altitude=496, country='Australia'),
-    'YBAF': station(name='Archerfield Aerodrome', coordinate=(-27.56667, 153.0), altitude=23, country='Australia'),
-    'YBAM': station(name='Amberley Aerodrome', coordinate=(-27.63333, 152.71667), altitude=27, country='Australia'),
-    'YBAS': station(name='Alice Springs Aerodrome', coordinate=(-23.8, 133.88333), altitude=545, country='Australia'),
-    'YBBN': station(name='Brisbane Airport M. O', coordinate=(-27.38333, 153.1), altitude=4, country='Australia'),
-    'YBCG': station(name='Coolangatta Airport Aws', coordinate=(-28.16667, 153.5), altitude=6, country='Australia'),
-    'YBCS': station(name='Cairns Airport', coordinate=(-16.88333, 145.75), altitude=3, country='Australia'),
-    'YBCV': station(name='Charleville Airport', coordinate=(-26.4, 146.26667), altitude=306, country='Australia'),
-    'YBGL': station(name='Gladstone', coordinate=(-23.85, 151.25), altitude=75, country='Australia'),
-    'YBLR': station(name='Longreach Airport', coordinate=(-23.43333, 144.26667), altitude=192, country='Australia'),
-    'YBMA': station(name='Mount Isa Amo', coordinate=(-20.66667, 139.46667), altitude=342, country='Australia'),
-    'YBMK': station(name='Mackay Mo', coordinate=(-21.11667, 149.2), altitude=30, country='Australia'),
-    'YBOK': station(name='Oakey Aerodrome', coordinate=(-27.41667, 151.73333), altitude=407, country='Australia'),
-    'YBPN': station(name='Proserpine Airport', coordinate=(-20.48333, 148.53333), altitude=25, country='Australia'),
-    'YBRK': station(name='Rockhampton Airport', coordinate=(-23.38333, 150.46667), altitude=10, country='Australia'),
-    'YBRM': station(name='Broome Airport', coordinate=(-17.95, 122.21667), altitude=17, country='Australia'),
-    'YBTL': station(name='Townsville Amo', coordinate=(-19.25, 146.75), altitude=6, country='Australia'),
-    'YBWP': station(name='Weipa City', coordinate=(-12.63333, 141.88333), altitude=12, country='Australia'),
-    'YCEM': station(name='Coldstream', coordinate=(-37.71667, 145.4), altitude=83, country='Australia'),
-    'YDGV': station(name='Gove Airport', coordinate=(-12.26667, 136.81667), altitude=52, country='Australia'),
-    'YDTC': station(name='Tennant Creek Airport', coordinate=(-19.63333, 134.16667), altitude=375, country='Australia'),
-    'YDYL': station(name='Yulara Aws', coordinate=(-25.18333, 130.96667), altitude=493, country='Australia'),
-    'YMAV': station(name='Avalon, Avalon Airport', coordinate=(-38.03333, 144.48333), altitude=8, country='Australia'),
-    'YMAY': station(name='Albury Airport', coordinate=(-36.06667, 146.95), altitude=165, country='Australia'),
-    'YMDV': station(name='Devonport East', coordinate=(-41.16667, 146.36667), altitude=47, country='Australia'),
-    'YMEN': station(name='Essendon Airport', coordinate=(-37.71667, 144.9), altitude=78, country='Australia'),
-    'YMES': station(name='East Sale Aerodrome', coordinate=(-38.1, 147.13333), altitude=5, country='Australia'),
-    'YMHB': station(name='Hobart Airport', coordinate=(-42.83333, 147.48333), altitude=4, country='Australia'),
-    'YMLT': station(name='Launceston Airport', coordinate=(-41.53333, 147.2), altitude=171, country='Australia'),
-    'YMLV': station(name='Laverton Aerodrome', coordinate=(-37.85, 144.73333), altitude=18, country='Australia'),
-    'YMMB': station(name='Moorabbin Airport Aws', coordinate=(-37.96667, 145.1), altitude=13, country='Australia'),
-    'YMMG': station(name='Mount Gambier Aerodrome', coordinate=(-37.73333, 140.78333), altitude=65, country='Australia'),
-    'YMMI': station(name='Mildura Airport', coordinate=(-34.21667, 142.08333), altitude=50, country='Australia'),
-    'YMML': station(name='Melbourne Airport', coordinate=(-37.66667, 144.83333), altitude=132, country='Australia'),
-    'YMMQ': station(name='Macquarie Island', coordinate=(-54.48333, 158.95), altitude=6, country='Australia'),
-    'YMWY': station(name='Wynyard West', coordinate=(-40.98333, 145.71667), altitude=11, country='Australia'),
-    'YPAD': station(name='Adelaide Airport', coordinate=(-34.93333, 138.51667), altitude=6, country='Australia'),
-    'YPAL': station(name='Albany Airport', coordinate=(-34.93333, 117.8), altitude=71, country='Australia'),
-    'YPBH': station(name='Broken Hill Patton Street', coordinate=(-31.96667, 141.46667), altitude=315, country='Australia'),
-    'YPCC': station(name='Cocos Island Airport', coordinate=(-12.18333, 96.81667), altitude=3, country='Christmas Island'),
-    'YPCD': station(name='Ceduna Airport', coordinate=(-32.11667, 133.7), altitude=23, country='Australia'),
-    'YPDB': station(name='Derby', coordinate=(-17.3, 123.61667), altitude=8, country='Australia'),
-    'YPDN': station(name='Darwin Airport', coordinate=(-12.4, 130.86667), altitude=31, country='Australia'),
-    'YPEA': station(name='Bullsbrook Pearce Amo', coordinate=(-31.66667, 116.01667), altitude=45, country='Australia'),
-    'YPED': station(name='Edinburgh M. O.', coordinate=(-34.7, 138.61667), altitude=20, country='Australia'),
-    'YPFT': station(name='Forrest Airport', coordinate=(-30.83333, 128.1), altitude=160, country='Australia'),
-    'YPGN': station(name='Geraldton Airport', coordinate=(-28.78333, 114.7), altitude=37, country='Australia'),
-    'YPKG': station(name='Kalgoorlie Boulder Amo', coordinate=(-30.78333, 121.45), altitude=367, country='Australia'),
-    'YPKU': station(name='Kununurra Kununurra Aws', coordinate=(-15.76667, 128.7), altitude=44, country='Australia'),
-    'YPLC': station(name='Leigh Creek Airport', coordinate=(-30.58333, 138.41667), altitude=261, country='Australia'),
-    'YPLM': station(name='Learmonth Airport', coordinate=(-22.23333, 114.08333), altitude=5, country='Australia'),
-    'YPMR': station(name='Meekatharra Airport', coordinate=(-26.6, 118.53333), altitude=522, country='Australia'),
-    'YPPD': station(name='Port Hedland Pardoo', coordinate=(-20.1, 119.56667), altitude=9, country='Australia'),
-    'YPPF': station(name='Parafield Airport', coordinate=(-34.78333, 138.63333), altitude=17, country='Australia'),
-    'YPPH': station(name='Belmont Perth Airport', coordinate=(-31.93333, 115.95), altitude=20, country='Australia'),
-    'YPTN': station(name='Tindal / Katherine', coordinate=(-14.43333, 132.26667), altitude=108, country='Australia'),
-    'YPWR': station(name='Woomera Aerodrome', coordinate=(-31.13333, 136.81667), altitude=165, country='Australia'),
-    'YPXM': station(name='Christmas Island Aerodrome', coordinate=(-10.43333, 105.68333), altitude=279, country='Christmas Island'),
-    'YSBK': station(name='Bankstown Airport Aws', coordinate=(-33.91667, 150.98333), altitude=9, country='Australia'),
-    'YSCB': station(name='Canberra', coordinate=(-35.3, 149.18333), altitude=575, country='Australia'),
-    'YSCH': station(name='Coffs Harbour Mo', coordinate=(-30.31667, 153.11667), altitude=5, country='Australia'),
-    'YSCM': station(name='Cooma', coordinate=(-36.23333, 149.08333), altitude=778, country='Australia'),
-    'YSCN': station(name='Camden Airport', coordinate=(-34.03333, 150.68333), altitude=70, country='Australia'),
-    'YSDU': station(name='Dubbo', coordinate=(-32.2, 148.56667), altitude=275, country='Australia'),
-    'YSNF': station(name='Norfolk Island Airport', coordinate=(-29.03333, 167.93333), altitude=113, country='Australia'),
-    'YSNW': station(name='Nowra Ran Air Station', coordinate=(-34.95, 150.53333), altitude=122, country='Australia'),
-    'YSRI': station(name='Richmond Aus-Afb', coordinate=(-33.6, 150.78333), altitude=21, country='Australia'),
-    'YSSY': station(name='Sydney Airport', coordinate=(-33.95, 151.18333), altitude=6, country='Australia'),
-    'YSTW': station(name='Tamworth Airport', coordinate=(-31.08333, 150.83333), altitude=410, country='Australia'),
-    'YSWG': station(name='Wagga Airport', coordinate=(-35.15, 147.45), altitude=221, country='Australia'),
-    'YSWM': station(name='Williamtown Aerodrome', coordinate=(-32.78333, 151.81667), altitude=9, country='Australia'),
-    'ZBAA': station(name='Beijing', coordinate=(39.93333, 116.28333), altitude=55, country='China'),
-    'ZBHH': station(name='Hohhot', coordinate=(40.81667, 111.68333), altitude=1065, country='China'),
-    'ZBTJ': station(name='Tianjin / Zhangguizhu', coordinate=(39.18333, 117.35), altitude=3, country='China'),
-    'ZBYN': station(name='Taiyuan', coordinate=(37.78333, 112.55), altitude=779, country='China'),
-    'ZGCS': station(name='Changsha', coordinate=(28.2, 113.08333), altitude=46, country='China'),
-    'ZGGG': station(name='Guangzhou', coordinate=(23.16667, 113.33333), altitude=8, country='China'),
-    'ZGHA': station(name='Changsha', coordinate=(28.23333, 112.86667), altitude=None, country='China'),
-    'ZGHK': station(name='Haikou', coordinate=(20.03333, 110.35), altitude=15, country='China'),
-    'ZGKL': station(name='Guilin', coordinate=(25.33333, 110.3), altitude=166, country='China'),
-    'ZGNN': station(name='Nanning', coordinate=(22.81667, 108.35), altitude=73, country='China'),
-    'ZGOW': station(name='Shantou', coordinate=(23.4, 116.68333), altitude=3, country='China'),
-    'ZGSZ': station(name='Shenzhen', coordinate=(22.55, 114.1), altitude=18, country='China'),
-    'ZGZJ': station(name='Zhanjiang', coordinate=(21.21667, 110.4), altitude=28, country='China'),
-    'ZHCC': station(name='Zhengzhou', coordinate=(34.71667, 113.65), altitude=111, country='China'),
-    'ZHHH': station(name='Wuhan', coordinate=(30.61667, 114.13333), altitude=23, country='China'),
-    'ZJSY': station(name='Sanya/Fenghuang', coordinate=(18.3, 109.4), altitude=27, country='China'),
-    'ZKKC': station(name='Kimchaek', coordinate=(40.66667, 129.2), altitude=19, country='Korea, North'),
-    'ZKPY': station(name='Pyongyang', coordinate=(39.03333, 125.78333), altitude=36, country='Korea, North'),
-    'ZLIC': station(name='Yinchuan', coordinate=(38.48333, 106.21667), altitude=1112, country='China'),
-    'ZLJQ': station(name='Jiuquan', coordinate=(39.76667, 98.48333), altitude=1478, country='China'),
-    'ZLLL': station(name='Lanzhou / Zhongchuan', coordinate=(36.02, 103.75), altitude=None, country='China'),
-    'ZLSN': station(name="Xi'An", coordinate=(34.3, 108.93333), altitude=398, country='China'),
-    'ZLXN': station(name='Xining', coordinate=(36.61667, 101.76667), altitude=2262, country='China'),
-    'ZLXY': station(name='Xian/Xianyang', coordinate=(34.43333, 108.75), altitude=479, country='China'),
-    'ZLYA': station(name='Yan An', coordinate=(36.6, 109.5), altitude=959, country='China'),
-    'ZMUB': station(name='Ulan-Bator', coordinate=(47.85, 106.76667), altitude=None, country='Mongolia'),
-    'ZPPP': station(name='Kunming', coordinate=(25.01667, 102.68333), altitude=1892, country='China'),
-    'ZSAM': station(name='Xiamen', coordinate=(24.48333, 118.08333), altitude=139, country='China'),
-    'ZSCN': station(name='Nanchang', coordinate=(28.6, 115.91667), altitude=50, country='China'),
-    'ZSFZ': station(name='Fuzhou', coordinate=(26.08333, 119.28333), altitude=85, country='China'),
-    'ZSGZ': station(name='Ganzhou', coordinate=(25.85, 114.95), altitude=125, country='China'),
-    'ZSHC': station(name='Hangzhou', coordinate=(30.23333, 120.16667), altitude=43, country='China'),
-    'ZSNJ': station(name='Nanjing', coordinate=(32.0, 118.8), altitude=12, country='China'),
-    'ZSOF': station(name='Hefei', coordinate=(31.86667, 117.23333), altitude=36, country='China'),
-    'ZSPD': station(name='Shanghai / Pudong', coordinate=(31.11667, 121.76667), altitude=4, country='China'),
-    'ZSQD': station(name='Qingdao', coordinate=(36.06667, 120.33333), altitude=77, country='China'),
-    'ZSSS': station(name='Shanghai / Hongqiao', coordinate=(31.16667, 121.43333), altitude=7, country='China'),
-    'ZSTN': station(name='Jinan', coordinate=(36.68333, 116.98333), altitude=58, country='China'),
-    'ZUCK': station(name='Chongqing', coordinate=(29.51667, 106.48333), altitude=351, country='China'),
-    'ZUGY': station(name='Guiyang', coordinate=(26.58333, 106.71667), altitude=1074, country='China'),
-    'ZULS': station(name='Lhasa', coordinate=(29.66667, 91.13333), altitude=3650, country='China'),
-    'ZUUU': station(name='Chengdu', coordinate=(30.66667, 104.01667), altitude=508, country='China'),
-    'ZWHM': station(name='Hami', coordinate=(42.81667, 93.51667), altitude=739, country='China'),
-    'ZWSH': station(name='Kashi', coordinate=(39.46667, 75.98333), altitude=1291, country='China'),
-    'ZWTN': station(name='Hotan', coordinate=(37.13333, 79.93333), altitude=1375, country='China'),
-    'ZWWW': station(name='Urum-Qi / Diwopu', coordinate=(43.9, 87.46667), altitude=654, country='China'),
-    'ZWYN': station(name='Yining', coordinate=(43.95, 81.33333), altitude=663, country='China'),
-    'ZYCC': station(name='Changchun', coordinate=(43.9, 125.21667), altitude=238, country='China'),
-    'ZYHB': station(name='Harbin', coordinate=(46.02, 126.58), altitude=None, country='China'),
-    'ZYQQ': station(name='Qiqihar', coordinate=(47.38333, 123.91667), altitude=148, country='China'),
-    'ZYTL': station(name='Dalian', coordinate=(38.9, 121.63333), altitude=97, country='China'),
-    'ZYTX': station(name='Shenyang / Taokian', coordinate=(41.8, 123.4), altitude=35, country='China')
-}
+
+class Stations(Mapping[str, station]):
+    """
+    METAR stations by code, stored as columns.
+
+    A station object is only built when it is looked up.
+    """
+
+    def __init__(self, data):
+        self.codes = data['codes']
+        self.latitudes = data['latitudes']
+        self.longitudes = data['longitudes']
+        self.lats_rad = data['lats_rad']
+        self.lons_rad = data['lons_rad']
+        self.sin_lats = data['sin_lats']
+        self.cos_lats = data['cos_lats']
+        self.names = data['names']
+        self.altitudes = data['altitudes']
+        self.countries = data['countries']
+        self._index = {code: i for i, code in enumerate(self.codes.tolist())}
+
+    def __getitem__(self, code: str) -> station:
+        i = self._index[code]
+        altitude = float(self.altitudes[i])
+        return station(
+            name=str(self.names[i]),
+            coordinate=(float(self.latitudes[i]), float(self.longitudes[i])),
+            altitude=None if math.isnan(altitude) else int(altitude),
+            country=str(self.countries[i]) or None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+with np.load(files(__package__).joinpath('metar_data.npz')) as _data:
+    STATIONS = Stations(_data)